@@ -0,0 +1,157 @@
+"""
+Runs the benchmark suite and compares the results with the stored baseline.
+
+Every case is timed for the given number of seconds, best of several
+repeats, and reports operations and octets per second, the compression
+ratio of compressing cases and the memory allocated by one operation
+(peak traced by tracemalloc). Cases which got slower, compress worse or
+allocate more than the tolerance allows are marked as regressions.
+
+Usage: python -m benchmarks.run [-n SECONDS] [-r REPEAT] [-k PATTERN]
+                                [--save] [--check] [--tolerance PERCENT]
+
+Baselines depend on the machine: record one with --save before changing
+code and compare against it afterwards on the same machine.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from .suite import cases
+
+
+BASELINE = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'baseline.json')
+
+
+def measure(func, seconds):
+    """
+    Returns the number of calls of func per second.
+    """
+    batch = 1
+    count = 0
+    start = time.perf_counter()
+    deadline = start + seconds
+    while True:
+        for _ in range(batch):
+            func()
+        count += batch
+
+        now = time.perf_counter()
+        if now >= deadline:
+            return count / (now - start)
+
+        # Check the clock about every millisecond.
+        if now - start < 1e-3 * count / batch:
+            batch *= 2
+
+
+def allocated(func):
+    """
+    Returns the peak of memory allocated by one call of func in octets.
+    """
+    func()
+
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        func()
+        return tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(case, seconds, repeat):
+    case.func()
+
+    rate = max(measure(case.func, seconds) for _ in range(repeat))
+    result = {'ops': round(rate, 1), 'alloc': allocated(case.func)}
+    if case.size is not None:
+        result['bytes'] = round(rate * case.size)
+    if case.ratio is not None:
+        result['ratio'] = round(case.ratio, 4)
+
+    return result
+
+
+def regressions(result, baseline, tolerance):
+    """
+    Returns descriptions of the regressions of result against baseline.
+    """
+    found = []
+    if result['ops'] < baseline['ops'] * (1 - tolerance):
+        found.append('ops/s')
+    if 'ratio' in baseline and result.get('ratio', 0) > baseline['ratio'] * (1 + tolerance):
+        found.append('ratio')
+    # A few hundred octets of allocation noise are ignored.
+    if result['alloc'] > max(baseline['alloc'] * (1 + tolerance), baseline['alloc'] + 256):
+        found.append('alloc')
+
+    return found
+
+
+def format_row(name, result, baseline=None, found=()):
+    row = '{: <32} {:>12.0f} {:>10} {:>7} {:>9}'.format(
+        name,
+        result['ops'],
+        '{:.2f}'.format(result['bytes'] / 1e6) if 'bytes' in result else '-',
+        '{:.1%}'.format(result['ratio']) if 'ratio' in result else '-',
+        '{:.1f}'.format(result['alloc'] / 1024),
+    )
+
+    if baseline is not None:
+        row += ' {:>+7.1%}'.format(result['ops'] / baseline['ops'] - 1)
+    if found:
+        row += '  REGRESSION: ' + ', '.join(found)
+
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run the HPACK and framing benchmark suite.')
+    parser.add_argument('-n', '--seconds', type=float, default=0.5, help='time per measurement')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='measurements per case, the best counts')
+    parser.add_argument('-k', '--pattern', help='run only cases with the pattern in their names')
+    parser.add_argument('-b', '--baseline', default=BASELINE, help='baseline file')
+    parser.add_argument('--save', action='store_true', help='store the results as the baseline')
+    parser.add_argument('--check', action='store_true', help='exit with status 1 on regressions')
+    parser.add_argument('--tolerance', type=float, default=10.0,
+                        help='change in percent tolerated before reporting a regression')
+    args = parser.parse_args()
+
+    baselines = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, 'r') as f:
+            baselines = json.load(f)
+
+    print('{: <32} {:>12} {:>10} {:>7} {:>9}{}'.format(
+        'case', 'ops/s', 'MB/s', 'ratio', 'KiB/op', '  vs base' if baselines and not args.save else ''))
+
+    results = {}
+    failed = False
+    for case in cases():
+        if args.pattern and args.pattern not in case.name:
+            continue
+
+        result = results[case.name] = run_case(case, args.seconds, args.repeat)
+
+        baseline = None if args.save else baselines.get(case.name)
+        found = regressions(result, baseline, args.tolerance / 100) if baseline else ()
+        failed = failed or bool(found)
+
+        print(format_row(case.name, result, baseline, found))
+
+    if args.save:
+        baselines.update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write('\n')
+
+    if args.check and failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+"""
+Benchmark cases of the HPACK coder and the frame layer.
+
+Header corpora are local fixtures (fixtures/*.txt): header blocks of one
+connection in the order they are sent, one "name: value" per line, blocks
+separated by blank lines.
+"""
+import os
+
+from pyhttp2.hpack import (
+    uint_encode, uint_decode_from, bytestr_encode, huffman_encode, huffman_decode, Encoder, Decoder
+)
+from pyhttp2.frames import DataFrame, HeadersFrame, SettingsFrame, WindowUpdateFrame, FrameReader
+
+
+FIXTURES = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'fixtures')
+
+
+class Case(object):
+    """
+    Benchmark case.
+
+    :param name:
+        name of the case in reports and baselines.
+    :param func:
+        function running one operation.
+    :param size:
+        octets processed by one operation, for bytes/s.
+    :param ratio:
+        compression ratio (output / input) for compressing cases.
+    """
+    def __init__(self, name, func, size=None, ratio=None):
+        self.name = name
+        self.func = func
+        self.size = size
+        self.ratio = ratio
+
+
+def load_fixture(name):
+    """
+    Returns the header blocks of a fixture as lists of (name, value) bytes
+    tuples.
+    """
+    with open(os.path.join(FIXTURES, name), 'rb') as f:
+        text = f.read()
+
+    blocks = []
+    for chunk in text.split(b'\n\n'):
+        fields = []
+        for line in chunk.splitlines():
+            if not line or line.startswith(b'#'):
+                continue
+
+            # Pseudo-header names start with a colon.
+            sep = line.index(b':', 1)
+            fields.append((line[:sep], line[sep + 1:].strip()))
+
+        if fields:
+            blocks.append(fields)
+
+    return blocks
+
+
+def fixtures():
+    return sorted(name for name in os.listdir(FIXTURES) if name.endswith('.txt'))
+
+
+def plain_size(blocks):
+    """
+    Size of the blocks as HTTP/1.1 header lines ("name: value\\r\\n").
+    """
+    return sum(len(name) + len(value) + 4 for fields in blocks for name, value in fields)
+
+
+def integer_cases():
+    # Prefix sizes and values as they occur in header blocks: indices,
+    # string lengths and the occasional large table size update.
+    values = [(n, v) for n in (4, 5, 6, 7) for v in (1, 14, 62, 126, 300, 1337, 65535)]
+    encoded = b''.join(uint_encode(v, n) for n, v in values)
+
+    def encode():
+        for n, v in values:
+            uint_encode(v, n)
+
+    def decode():
+        offset = 0
+        for n, _ in values:
+            _, offset = uint_decode_from(encoded, offset, n)
+
+    yield Case('uint_encode', encode, size=len(encoded))
+    yield Case('uint_decode', decode, size=len(encoded))
+
+
+def string_cases():
+    values = [value for name in fixtures() for fields in load_fixture(name) for _, value in fields]
+    size = sum(map(len, values))
+    raw = b''.join(values)
+    encoded = huffman_encode(raw)
+
+    def encode_raw():
+        for value in values:
+            bytestr_encode(value, huffman=False)
+
+    def encode_huffman():
+        for value in values:
+            bytestr_encode(value, huffman=True)
+
+    yield Case('bytestr_encode/raw', encode_raw, size=size)
+    yield Case('bytestr_encode/huffman', encode_huffman, size=size,
+               ratio=sum(len(bytestr_encode(v, huffman=True)) for v in values) / size)
+    yield Case('huffman_encode', lambda: huffman_encode(raw), size=size, ratio=len(encoded) / size)
+    yield Case('huffman_decode', lambda: huffman_decode(encoded), size=len(encoded))
+
+
+def header_cases():
+    for name in fixtures():
+        blocks = load_fixture(name)
+        corpus = name[:-len('.txt')]
+
+        encoder = Encoder()
+        encoded = [encoder.encode_headers(fields) for fields in blocks]
+        size = plain_size(blocks)
+
+        # A fresh context per operation: the whole connection is replayed,
+        # so the dynamic table goes through the same states every time.
+        def encode(blocks=blocks):
+            encoder = Encoder()
+            for fields in blocks:
+                encoder.encode_headers(fields)
+
+        def decode(encoded=encoded):
+            decoder = Decoder()
+            for block in encoded:
+                decoder.decode(block)
+
+        def decode_lazy(encoded=encoded):
+            decoder = Decoder()
+            for block in encoded:
+                decoder.decode_lazy(block)
+
+        yield Case('encode_headers/' + corpus, encode, size=size,
+                   ratio=sum(map(len, encoded)) / size)
+        yield Case('decode_headers/' + corpus, decode, size=size)
+        yield Case('decode_lazy/' + corpus, decode_lazy, size=size)
+
+
+def frame_cases():
+    headers = load_fixture('browser_page_load.txt')[0]
+    header_block = Encoder().encode_headers(headers)
+
+    for label, payload in (('small', memoryview(bytes(64))), ('large', memoryview(bytes(16384)))):
+        frame = DataFrame(b'', stream_id=0)
+        size = len(payload) + 9
+
+        yield Case('data_frame/' + label, lambda payload=payload: DataFrame(payload, stream_id=1).to_buffers(),
+                   size=size)
+        yield Case('data_frame_reuse/' + label, lambda frame=frame, payload=payload: frame.reuse(1, payload).to_buffers(),
+                   size=size)
+
+        # 64 KiB worth of frames read from the wire and parsed.
+        count = max(1, 65536 // size)
+        wire = DataFrame(payload, stream_id=1).to_bytes() * count
+
+        def parse(wire=wire):
+            reader = FrameReader()
+            reader.feed(wire)
+            for frame in reader.frames():
+                frame.data
+
+        yield Case('parse_data/' + label, parse, size=len(wire))
+
+    # The block is encoded already, only the frame is built.
+    def headers_frame():
+        frame = HeadersFrame(None, stream_id=1, end_headers=True)
+        frame.header_block = header_block
+        frame.to_buffers()
+
+    yield Case('headers_frame', headers_frame, size=len(header_block) + 9)
+    yield Case('settings_frame', lambda: SettingsFrame(initial_window_size=65535, max_frame_size=16384).to_buffers(),
+               size=21)
+    yield Case('window_update_frame', lambda: WindowUpdateFrame(1000, stream_id=1).to_buffers(), size=13)
+
+    control = b''.join([
+        SettingsFrame(initial_window_size=65535, max_frame_size=16384).to_bytes(),
+        WindowUpdateFrame(1000, stream_id=0).to_bytes(),
+        HeadersFrame(headers, stream_id=1, end_headers=True).to_bytes(),
+    ]) * 100
+
+    def parse_control():
+        reader = FrameReader()
+        reader.feed(control)
+        for frame in reader.frames():
+            pass
+
+    yield Case('parse_mixed', parse_control, size=len(control))
+
+
+def cases():
+    yield from integer_cases()
+    yield from string_cases()
+    yield from header_cases()
+    yield from frame_cases()
@@ -1,33 +1,214 @@
+"""
+Generates pyhttp2/_tables.py, the HPACK tables [RFC7541, Appendices A and B],
+from static_table.txt and huffman_table.txt.
+
+Usage: python extract_tables.py [-o PATH]
+"""
 import os
+import re
 import argparse
 
 
-def extract_static_table():
-    path = os.path.join(
+HUFFMAN_EOS = 256
+
+HEADER = '''\
+# Generated by extract_tables.py from static_table.txt and huffman_table.txt,
+# do not edit. The tables are literals so that importing pyhttp2.hpack does
+# no table-building work: they are loaded from the cached bytecode.
+
+'''
+
+
+def _table_path(name):
+    return os.path.join(
         os.path.dirname(os.path.realpath(__file__)),
-        'static_table.txt'
+        name
     )
 
-    with open(path, 'r') as f:
-        print('(')
 
+def extract_static_table():
+    """
+    Returns the static table as a list of (name, value) pairs.
+    """
+    with open(_table_path('static_table.txt'), 'r') as f:
         lines = list(f)
-        for line in lines[3:len(lines)-1]:
-            sp = line.split('|')
-            name = sp[2].strip()
-            value = sp[3].strip()
-            print("    ('{0}', '{1}'),".format(name, value))
 
-        print(')\n')
+    table = []
+    for line in lines[3:len(lines)-1]:
+        sp = line.split('|')
+        table.append((sp[2].strip(), sp[3].strip()))
+
+    return table
+
+
+def extract_huffman_table():
+    """
+    Returns (code aligned to LSB, length in bits) of every symbol, EOS
+    included.
+    """
+    # Matches e.g. "'!' ( 33)  |11111110|00      3f8  [10]".
+    row = re.compile(r'\(\s*(\d+)\)\s+[|01]+\s+([0-9a-f]+)\s+\[\s*(\d+)\]')
+
+    table = []
+    with open(_table_path('huffman_table.txt'), 'r') as f:
+        for line in f:
+            m = row.search(line)
+            if m is None:
+                continue
+
+            sym, code, length = m.groups()
+            assert int(sym) == len(table)
+            table.append((int(code, 16), int(length)))
+
+    return table
+
+
+def build_static_index(static_table):
+    # Both str and bytes keys are kept so that lookups work for either
+    # representation without converting the key first.
+    names = {}
+    fields = {}
+    for idx, (name, value) in enumerate(static_table, 1):
+        for key in ((name, value), (name.encode('ascii'), value.encode('ascii'))):
+            names.setdefault(key[0], idx)
+            fields.setdefault(key, idx)
+
+    return names, fields
+
+
+def build_huffman_decoder(huffman_table):
+    """
+    Builds the Huffman decoding state machine.
+
+    States are the internal nodes of the code tree (the root is 0) plus a
+    dead state entered on decoding errors. The machine consumes one octet
+    per step: for state s and octet b the entry (s << 8) | b gives the next
+    state and the symbols (0, 1 or 2 octets) completed by that step.
+    """
+    # Code tree: non-negative children are internal nodes, negative ones are
+    # leaves holding ~symbol.
+    tree = [[None, None]]
+    for sym, (code, length) in enumerate(huffman_table):
+        node = 0
+        for shift in range(length - 1, 0, -1):
+            bit = (code >> shift) & 1
+            if tree[node][bit] is None:
+                tree.append([None, None])
+                tree[node][bit] = len(tree) - 1
+            node = tree[node][bit]
+        tree[node][code & 1] = ~sym
+
+    dead = len(tree)
+
+    # States reached from the root through at most 7 one bits: the input
+    # may end there since the remaining bits are valid EOS padding.
+    accept = []
+    node = 0
+    for _ in range(8):
+        accept.append(node)
+        node = tree[node][1]
+
+    # Nibble transitions first, octet transitions are composed from them.
+    nibble_next = []
+    nibble_emit = []
+    for state in range(dead):
+        for nibble in range(16):
+            node = state
+            emit = b''
+            for shift in (3, 2, 1, 0):
+                child = tree[node][(nibble >> shift) & 1]
+                if child >= 0:
+                    node = child
+                elif ~child == HUFFMAN_EOS:
+                    node = dead
+                    break
+                else:
+                    emit += bytes((~child,))
+                    node = 0
+
+            nibble_next.append(node)
+            nibble_emit.append(emit)
+
+    # Next states are stored premultiplied by 256 so that a step needs a
+    # single "or" to compute the following index.
+    next_states = [dead << 8] * ((dead + 1) << 8)
+    emits = [b''] * ((dead + 1) << 8)
+    for state in range(dead):
+        for b in range(256):
+            i = (state << 4) | (b >> 4)
+            mid = nibble_next[i]
+            if mid == dead:
+                continue
+
+            j = (mid << 4) | (b & 15)
+            next_states[(state << 8) | b] = nibble_next[j] << 8
+            emits[(state << 8) | b] = nibble_emit[i] + nibble_emit[j]
+
+    return next_states, emits, sorted(node << 8 for node in accept)
+
+
+def _literal(items, width=100):
+    """
+    Formats items as the body of a tuple literal, wrapped at width columns.
+    """
+    lines = []
+    line = '   '
+    for item in map(repr, items):
+        if len(line) + len(item) + 2 > width:
+            lines.append(line)
+            line = '   '
+        line += ' ' + item + ','
+
+    lines.append(line)
+    return '(\n' + '\n'.join(lines) + '\n)'
+
+
+def generate_module():
+    """
+    Returns the source of pyhttp2/_tables.py.
+    """
+    static_table = extract_static_table()
+    huffman_table = extract_huffman_table()
+    names, fields = build_static_index(static_table)
+    next_states, emits, accept = build_huffman_decoder(huffman_table)
+
+    static_bytes = [(name.encode('ascii'), value.encode('ascii')) for name, value in static_table]
+
+    parts = [
+        HEADER,
+        '# Static table [RFC7541, Appendix A].\n',
+        'STATIC_TABLE = {}\n\n'.format(_literal(static_table)),
+        'STATIC_TABLE_BYTES = {}\n\n'.format(_literal(static_bytes)),
+        '# Index of the first entry with the name, and of the (name, value) field,\n'
+        '# keyed by str and by bytes.\n',
+        'STATIC_NAMES = {{\n{}}}\n\n'.format(''.join(
+            '    {!r}: {},\n'.format(key, idx) for key, idx in names.items())),
+        'STATIC_FIELDS = {{\n{}}}\n\n'.format(''.join(
+            '    {!r}: {},\n'.format(key, idx) for key, idx in fields.items())),
+        '# Huffman code (aligned to LSB) and its length in bits for every symbol,\n'
+        '# EOS (256) included [RFC7541, Appendix B].\n',
+        "HUFFMAN_CODES = {}\n\n".format(_literal(code for code, _ in huffman_table)),
+        'HUFFMAN_LENGTHS = {!r}\n\n'.format(bytes(length for _, length in huffman_table)),
+        '# Huffman decoding state machine: next state (premultiplied by 256) and\n'
+        '# the completed symbols for the index (state | octet), and the states in\n'
+        '# which the input may end.\n',
+        "HUFFMAN_NEXT = {}\n\n".format(_literal(next_states)),
+        'HUFFMAN_EMIT = {}\n\n'.format(_literal(emits)),
+        'HUFFMAN_ACCEPT = frozenset({})\n'.format(_literal(accept)),
+    ]
+
+    return ''.join(parts)
 
 
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Extract data (as tuples) from *.txt tables of this repo.')
-    parser.add_argument('-s', '--static', action='store_true', help='print static tuple')
-    parser.add_argument('-H', '--huffman', action='store_true', help='print huffman tuple')
+    parser = argparse.ArgumentParser(description='Generate pyhttp2/_tables.py from *.txt tables of this repo.')
+    parser.add_argument('-o', '--output', default=_table_path(os.path.join('pyhttp2', '_tables.py')),
+                        help='path of the generated module, - for stdout')
 
     args = parser.parse_args()
-    if args.static:
-        extract_static_table()
-    if args.huffman:
-        pass
+    source = generate_module()
+    if args.output == '-':
+        print(source, end='')
+    else:
+        with open(args.output, 'w') as f:
+            f.write(source)
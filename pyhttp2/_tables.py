@@ -0,0 +1,10329 @@
+# Generated by extract_tables.py from static_table.txt and huffman_table.txt,
+# do not edit. The tables are literals so that importing pyhttp2.hpack does
+# no table-building work: they are loaded from the cached bytecode.
+
+# Static table [RFC7541, Appendix A].
+STATIC_TABLE = (
+    (':authority', ''), (':method', 'GET'), (':method', 'POST'), (':path', '/'),
+    (':path', '/index.html'), (':scheme', 'http'), (':scheme', 'https'), (':status', '200'),
+    (':status', '204'), (':status', '206'), (':status', '304'), (':status', '400'),
+    (':status', '404'), (':status', '500'), ('accept-charset', ''),
+    ('accept-encoding', 'gzip, deflate'), ('accept-language', ''), ('accept-ranges', ''),
+    ('accept', ''), ('access-control-allow-origin', ''), ('age', ''), ('allow', ''),
+    ('authorization', ''), ('cache-control', ''), ('content-disposition', ''),
+    ('content-encoding', ''), ('content-language', ''), ('content-length', ''),
+    ('content-location', ''), ('content-range', ''), ('content-type', ''), ('cookie', ''),
+    ('date', ''), ('etag', ''), ('expect', ''), ('expires', ''), ('from', ''), ('host', ''),
+    ('if-match', ''), ('if-modified-since', ''), ('if-none-match', ''), ('if-range', ''),
+    ('if-unmodified-since', ''), ('last-modified', ''), ('link', ''), ('location', ''),
+    ('max-forwards', ''), ('proxy-authenticate', ''), ('proxy-authorization', ''), ('range', ''),
+    ('referer', ''), ('refresh', ''), ('retry-after', ''), ('server', ''), ('set-cookie', ''),
+    ('strict-transport-security', ''), ('transfer-encoding', ''), ('user-agent', ''), ('vary', ''),
+    ('via', ''), ('www-authenticate', ''),
+)
+
+STATIC_TABLE_BYTES = (
+    (b':authority', b''), (b':method', b'GET'), (b':method', b'POST'), (b':path', b'/'),
+    (b':path', b'/index.html'), (b':scheme', b'http'), (b':scheme', b'https'), (b':status', b'200'),
+    (b':status', b'204'), (b':status', b'206'), (b':status', b'304'), (b':status', b'400'),
+    (b':status', b'404'), (b':status', b'500'), (b'accept-charset', b''),
+    (b'accept-encoding', b'gzip, deflate'), (b'accept-language', b''), (b'accept-ranges', b''),
+    (b'accept', b''), (b'access-control-allow-origin', b''), (b'age', b''), (b'allow', b''),
+    (b'authorization', b''), (b'cache-control', b''), (b'content-disposition', b''),
+    (b'content-encoding', b''), (b'content-language', b''), (b'content-length', b''),
+    (b'content-location', b''), (b'content-range', b''), (b'content-type', b''), (b'cookie', b''),
+    (b'date', b''), (b'etag', b''), (b'expect', b''), (b'expires', b''), (b'from', b''),
+    (b'host', b''), (b'if-match', b''), (b'if-modified-since', b''), (b'if-none-match', b''),
+    (b'if-range', b''), (b'if-unmodified-since', b''), (b'last-modified', b''), (b'link', b''),
+    (b'location', b''), (b'max-forwards', b''), (b'proxy-authenticate', b''),
+    (b'proxy-authorization', b''), (b'range', b''), (b'referer', b''), (b'refresh', b''),
+    (b'retry-after', b''), (b'server', b''), (b'set-cookie', b''),
+    (b'strict-transport-security', b''), (b'transfer-encoding', b''), (b'user-agent', b''),
+    (b'vary', b''), (b'via', b''), (b'www-authenticate', b''),
+)
+
+# Index of the first entry with the name, and of the (name, value) field,
+# keyed by str and by bytes.
+STATIC_NAMES = {
+    ':authority': 1,
+    b':authority': 1,
+    ':method': 2,
+    b':method': 2,
+    ':path': 4,
+    b':path': 4,
+    ':scheme': 6,
+    b':scheme': 6,
+    ':status': 8,
+    b':status': 8,
+    'accept-charset': 15,
+    b'accept-charset': 15,
+    'accept-encoding': 16,
+    b'accept-encoding': 16,
+    'accept-language': 17,
+    b'accept-language': 17,
+    'accept-ranges': 18,
+    b'accept-ranges': 18,
+    'accept': 19,
+    b'accept': 19,
+    'access-control-allow-origin': 20,
+    b'access-control-allow-origin': 20,
+    'age': 21,
+    b'age': 21,
+    'allow': 22,
+    b'allow': 22,
+    'authorization': 23,
+    b'authorization': 23,
+    'cache-control': 24,
+    b'cache-control': 24,
+    'content-disposition': 25,
+    b'content-disposition': 25,
+    'content-encoding': 26,
+    b'content-encoding': 26,
+    'content-language': 27,
+    b'content-language': 27,
+    'content-length': 28,
+    b'content-length': 28,
+    'content-location': 29,
+    b'content-location': 29,
+    'content-range': 30,
+    b'content-range': 30,
+    'content-type': 31,
+    b'content-type': 31,
+    'cookie': 32,
+    b'cookie': 32,
+    'date': 33,
+    b'date': 33,
+    'etag': 34,
+    b'etag': 34,
+    'expect': 35,
+    b'expect': 35,
+    'expires': 36,
+    b'expires': 36,
+    'from': 37,
+    b'from': 37,
+    'host': 38,
+    b'host': 38,
+    'if-match': 39,
+    b'if-match': 39,
+    'if-modified-since': 40,
+    b'if-modified-since': 40,
+    'if-none-match': 41,
+    b'if-none-match': 41,
+    'if-range': 42,
+    b'if-range': 42,
+    'if-unmodified-since': 43,
+    b'if-unmodified-since': 43,
+    'last-modified': 44,
+    b'last-modified': 44,
+    'link': 45,
+    b'link': 45,
+    'location': 46,
+    b'location': 46,
+    'max-forwards': 47,
+    b'max-forwards': 47,
+    'proxy-authenticate': 48,
+    b'proxy-authenticate': 48,
+    'proxy-authorization': 49,
+    b'proxy-authorization': 49,
+    'range': 50,
+    b'range': 50,
+    'referer': 51,
+    b'referer': 51,
+    'refresh': 52,
+    b'refresh': 52,
+    'retry-after': 53,
+    b'retry-after': 53,
+    'server': 54,
+    b'server': 54,
+    'set-cookie': 55,
+    b'set-cookie': 55,
+    'strict-transport-security': 56,
+    b'strict-transport-security': 56,
+    'transfer-encoding': 57,
+    b'transfer-encoding': 57,
+    'user-agent': 58,
+    b'user-agent': 58,
+    'vary': 59,
+    b'vary': 59,
+    'via': 60,
+    b'via': 60,
+    'www-authenticate': 61,
+    b'www-authenticate': 61,
+}
+
+STATIC_FIELDS = {
+    (':authority', ''): 1,
+    (b':authority', b''): 1,
+    (':method', 'GET'): 2,
+    (b':method', b'GET'): 2,
+    (':method', 'POST'): 3,
+    (b':method', b'POST'): 3,
+    (':path', '/'): 4,
+    (b':path', b'/'): 4,
+    (':path', '/index.html'): 5,
+    (b':path', b'/index.html'): 5,
+    (':scheme', 'http'): 6,
+    (b':scheme', b'http'): 6,
+    (':scheme', 'https'): 7,
+    (b':scheme', b'https'): 7,
+    (':status', '200'): 8,
+    (b':status', b'200'): 8,
+    (':status', '204'): 9,
+    (b':status', b'204'): 9,
+    (':status', '206'): 10,
+    (b':status', b'206'): 10,
+    (':status', '304'): 11,
+    (b':status', b'304'): 11,
+    (':status', '400'): 12,
+    (b':status', b'400'): 12,
+    (':status', '404'): 13,
+    (b':status', b'404'): 13,
+    (':status', '500'): 14,
+    (b':status', b'500'): 14,
+    ('accept-charset', ''): 15,
+    (b'accept-charset', b''): 15,
+    ('accept-encoding', 'gzip, deflate'): 16,
+    (b'accept-encoding', b'gzip, deflate'): 16,
+    ('accept-language', ''): 17,
+    (b'accept-language', b''): 17,
+    ('accept-ranges', ''): 18,
+    (b'accept-ranges', b''): 18,
+    ('accept', ''): 19,
+    (b'accept', b''): 19,
+    ('access-control-allow-origin', ''): 20,
+    (b'access-control-allow-origin', b''): 20,
+    ('age', ''): 21,
+    (b'age', b''): 21,
+    ('allow', ''): 22,
+    (b'allow', b''): 22,
+    ('authorization', ''): 23,
+    (b'authorization', b''): 23,
+    ('cache-control', ''): 24,
+    (b'cache-control', b''): 24,
+    ('content-disposition', ''): 25,
+    (b'content-disposition', b''): 25,
+    ('content-encoding', ''): 26,
+    (b'content-encoding', b''): 26,
+    ('content-language', ''): 27,
+    (b'content-language', b''): 27,
+    ('content-length', ''): 28,
+    (b'content-length', b''): 28,
+    ('content-location', ''): 29,
+    (b'content-location', b''): 29,
+    ('content-range', ''): 30,
+    (b'content-range', b''): 30,
+    ('content-type', ''): 31,
+    (b'content-type', b''): 31,
+    ('cookie', ''): 32,
+    (b'cookie', b''): 32,
+    ('date', ''): 33,
+    (b'date', b''): 33,
+    ('etag', ''): 34,
+    (b'etag', b''): 34,
+    ('expect', ''): 35,
+    (b'expect', b''): 35,
+    ('expires', ''): 36,
+    (b'expires', b''): 36,
+    ('from', ''): 37,
+    (b'from', b''): 37,
+    ('host', ''): 38,
+    (b'host', b''): 38,
+    ('if-match', ''): 39,
+    (b'if-match', b''): 39,
+    ('if-modified-since', ''): 40,
+    (b'if-modified-since', b''): 40,
+    ('if-none-match', ''): 41,
+    (b'if-none-match', b''): 41,
+    ('if-range', ''): 42,
+    (b'if-range', b''): 42,
+    ('if-unmodified-since', ''): 43,
+    (b'if-unmodified-since', b''): 43,
+    ('last-modified', ''): 44,
+    (b'last-modified', b''): 44,
+    ('link', ''): 45,
+    (b'link', b''): 45,
+    ('location', ''): 46,
+    (b'location', b''): 46,
+    ('max-forwards', ''): 47,
+    (b'max-forwards', b''): 47,
+    ('proxy-authenticate', ''): 48,
+    (b'proxy-authenticate', b''): 48,
+    ('proxy-authorization', ''): 49,
+    (b'proxy-authorization', b''): 49,
+    ('range', ''): 50,
+    (b'range', b''): 50,
+    ('referer', ''): 51,
+    (b'referer', b''): 51,
+    ('refresh', ''): 52,
+    (b'refresh', b''): 52,
+    ('retry-after', ''): 53,
+    (b'retry-after', b''): 53,
+    ('server', ''): 54,
+    (b'server', b''): 54,
+    ('set-cookie', ''): 55,
+    (b'set-cookie', b''): 55,
+    ('strict-transport-security', ''): 56,
+    (b'strict-transport-security', b''): 56,
+    ('transfer-encoding', ''): 57,
+    (b'transfer-encoding', b''): 57,
+    ('user-agent', ''): 58,
+    (b'user-agent', b''): 58,
+    ('vary', ''): 59,
+    (b'vary', b''): 59,
+    ('via', ''): 60,
+    (b'via', b''): 60,
+    ('www-authenticate', ''): 61,
+    (b'www-authenticate', b''): 61,
+}
+
+# Huffman code (aligned to LSB) and its length in bits for every symbol,
+# EOS (256) included [RFC7541, Appendix B].
+HUFFMAN_CODES = (
+    8184, 8388568, 268435426, 268435427, 268435428, 268435429, 268435430, 268435431, 268435432,
+    16777194, 1073741820, 268435433, 268435434, 1073741821, 268435435, 268435436, 268435437,
+    268435438, 268435439, 268435440, 268435441, 268435442, 1073741822, 268435443, 268435444,
+    268435445, 268435446, 268435447, 268435448, 268435449, 268435450, 268435451, 20, 1016, 1017,
+    4090, 8185, 21, 248, 2042, 1018, 1019, 249, 2043, 250, 22, 23, 24, 0, 1, 2, 25, 26, 27, 28, 29,
+    30, 31, 92, 251, 32764, 32, 4091, 1020, 8186, 33, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102,
+    103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 252, 115, 253, 8187, 524272, 8188,
+    16380, 34, 32765, 3, 35, 4, 36, 5, 37, 38, 39, 6, 116, 117, 40, 41, 42, 7, 43, 118, 44, 8, 9,
+    45, 119, 120, 121, 122, 123, 32766, 2044, 16381, 8189, 268435452, 1048550, 4194258, 1048551,
+    1048552, 4194259, 4194260, 4194261, 8388569, 4194262, 8388570, 8388571, 8388572, 8388573,
+    8388574, 16777195, 8388575, 16777196, 16777197, 4194263, 8388576, 16777198, 8388577, 8388578,
+    8388579, 8388580, 2097116, 4194264, 8388581, 4194265, 8388582, 8388583, 16777199, 4194266,
+    2097117, 1048553, 4194267, 4194268, 8388584, 8388585, 2097118, 8388586, 4194269, 4194270,
+    16777200, 2097119, 4194271, 8388587, 8388588, 2097120, 2097121, 4194272, 2097122, 8388589,
+    4194273, 8388590, 8388591, 1048554, 4194274, 4194275, 4194276, 8388592, 4194277, 4194278,
+    8388593, 67108832, 67108833, 1048555, 524273, 4194279, 8388594, 4194280, 33554412, 67108834,
+    67108835, 67108836, 134217694, 134217695, 67108837, 16777201, 33554413, 524274, 2097123,
+    67108838, 134217696, 134217697, 67108839, 134217698, 16777202, 2097124, 2097125, 67108840,
+    67108841, 268435453, 134217699, 134217700, 134217701, 1048556, 16777203, 1048557, 2097126,
+    4194281, 2097127, 2097128, 8388595, 4194282, 4194283, 33554414, 33554415, 16777204, 16777205,
+    67108842, 8388596, 67108843, 134217702, 67108844, 67108845, 134217703, 134217704, 134217705,
+    134217706, 134217707, 268435454, 134217708, 134217709, 134217710, 134217711, 134217712,
+    67108846, 1073741823,
+)
+
+HUFFMAN_LENGTHS = b'\r\x17\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x18\x1e\x1c\x1c\x1e\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1e\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x1c\x06\n\n\x0c\r\x06\x08\x0b\n\n\x08\x0b\x08\x06\x06\x06\x05\x05\x05\x06\x06\x06\x06\x06\x06\x06\x07\x08\x0f\x06\x0c\n\r\x06\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x07\x08\x07\x08\r\x13\r\x0e\x06\x0f\x05\x06\x05\x06\x05\x06\x06\x06\x05\x07\x07\x06\x06\x06\x05\x06\x07\x06\x05\x05\x06\x07\x07\x07\x07\x07\x0f\x0b\x0e\r\x1c\x14\x16\x14\x14\x16\x16\x16\x17\x16\x17\x17\x17\x17\x17\x18\x17\x18\x18\x16\x17\x18\x17\x17\x17\x17\x15\x16\x17\x16\x17\x17\x18\x16\x15\x14\x16\x16\x17\x17\x15\x17\x16\x16\x18\x15\x16\x17\x17\x15\x15\x16\x15\x17\x16\x17\x17\x14\x16\x16\x16\x17\x16\x16\x17\x1a\x1a\x14\x13\x16\x17\x16\x19\x1a\x1a\x1a\x1b\x1b\x1a\x18\x19\x13\x15\x1a\x1b\x1b\x1a\x1b\x18\x15\x15\x1a\x1a\x1c\x1b\x1b\x1b\x14\x18\x14\x15\x16\x15\x15\x17\x16\x16\x19\x19\x18\x18\x1a\x17\x1a\x1b\x1a\x1a\x1b\x1b\x1b\x1b\x1b\x1c\x1b\x1b\x1b\x1b\x1b\x1a\x1e'
+
+# Huffman decoding state machine: next state (premultiplied by 256) and
+# the completed symbols for the index (state | octet), and the states in
+# which the input may end.
+HUFFMAN_NEXT = (
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    18176, 2048, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 18432, 20224, 19712, 2304, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 0, 0, 0, 0, 0, 19968, 18688, 2560, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 18944, 2816,
+    3328, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024,
+    34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048,
+    34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304,
+    35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 0, 0, 3072, 26112, 32512, 3584, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 32768, 3840, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 25088, 4096, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 0, 0, 0, 4352, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256,
+    16896, 256, 16896, 256, 31744, 4608, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 32000, 39680, 38400, 4864, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 32256, 37888, 39936, 44800, 50176,
+    38656, 5120, 6400, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 0, 0, 0, 38144, 40192,
+    52224, 61696, 45056, 50432, 60160, 38912, 45568, 50944, 5376, 42752, 6656, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 45312, 48128, 50688, 51712, 60416, 61952, 39168, 40448, 45824,
+    46848, 51200, 52736, 55296, 5632, 43008, 47360, 10496, 6912, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648,
+    28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 39424, 40704, 40960, 46080, 46592, 47104, 48640, 51456, 52480, 52992, 53760, 55552, 62208,
+    5888, 41472, 43264, 44288, 47616, 49664, 53248, 10752, 48896, 7168, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 6144, 41216, 41728, 41984, 43520, 44032, 44544, 46336,
+    47872, 48384, 49920, 51968, 53504, 55040, 11008, 42240, 49152, 55808, 54016, 7424, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 11264, 42496, 43776, 49408,
+    59904, 62720, 56064, 54272, 57344, 58624, 7680, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 56320, 62464, 54528,
+    56832, 60672, 57600, 58880, 63744, 7936, 11520, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 54784,
+    56576, 57088, 58368, 60928, 62976, 63488, 57856, 59136, 61184, 64000, 64768, 8192, 9728, 14080,
+    11776, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 58112, 59392, 59648, 61440, 63232, 64256, 64512, 65024, 65280, 8448, 8960, 9984, 13312,
+    14336, 15360, 16128, 12032, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 8704, 9216, 9472, 10240, 13056, 13568,
+    13824, 14592, 14848, 15616, 15872, 16384, 16640, 37632, 12288, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 12544, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 12800, 15104, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 0, 0, 0, 65536, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 16896, 256, 16896, 256, 16896, 256, 65536, 65536, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304,
+    35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232,
+    35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648,
+    28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048,
+    34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304,
+    35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 65536, 65536, 65536, 65536, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408,
+    20992, 25344, 24064, 26624, 768, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648,
+    28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232,
+    35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784,
+    23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928,
+    29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304,
+    35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016,
+    33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624,
+    768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344,
+    24064, 26624, 768, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992,
+    25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280,
+    17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504,
+    22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904,
+    28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22016, 33280, 17408, 20992, 25344, 24064, 26624, 768, 22016, 33280, 17408, 20992, 25344, 24064,
+    26624, 768, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856,
+    33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816,
+    36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552,
+    25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720,
+    34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232,
+    35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296,
+    23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136, 27904, 28928, 29696,
+    30720, 34816, 36864, 1280, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648,
+    28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248,
+    23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608,
+    17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536,
+    34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272,
+    22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672,
+    30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320,
+    26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792,
+    35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040,
+    25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664,
+    21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560,
+    36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024, 22272, 22528,
+    33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880, 28672, 30464, 1024,
+    22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328, 24320, 26880,
+    28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600, 33792, 35328,
+    24320, 26880, 28672, 30464, 1024, 22272, 22528, 33536, 34560, 36608, 17664, 21248, 23040, 25600,
+    33792, 35328, 24320, 26880, 28672, 30464, 1024, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 17920, 20736,
+    21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352, 24576, 27136,
+    27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072,
+    36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184,
+    29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952,
+    30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584,
+    35840, 36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840,
+    36352, 24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    17920, 20736, 21504, 22784, 23296, 23552, 25856, 33024, 34048, 34304, 35584, 35840, 36352,
+    24576, 27136, 27904, 28928, 29696, 30720, 34816, 36864, 1280, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392,
+    27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376,
+    19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976,
+    31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480,
+    31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416,
+    29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832,
+    26368, 27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096,
+    37120, 37376, 19200, 1536, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368, 27392, 27648, 28160, 28416, 29184, 29440,
+    29952, 30208, 30976, 31232, 35072, 36096, 37120, 37376, 19200, 1536, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 24832, 26368,
+    27392, 27648, 28160, 28416, 29184, 29440, 29952, 30208, 30976, 31232, 35072, 36096, 37120,
+    37376, 19200, 1536, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488, 1792, 21760, 17152, 23808,
+    512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152,
+    23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256,
+    16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 19456, 20480, 31488,
+    1792, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760,
+    17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512,
+    21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 21760, 17152, 23808, 512, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896, 256, 16896,
+    256, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    0, 0, 19456, 20480, 31488, 1792, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+    65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536, 65536,
+)
+
+HUFFMAN_EMIT = (
+    b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1',
+    b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a',
+    b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e',
+    b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o',
+    b's', b's', b's', b's', b's', b's', b's', b's', b't', b't', b't', b't', b't', b't', b't', b't',
+    b' ', b' ', b' ', b' ', b'%', b'%', b'%', b'%', b'-', b'-', b'-', b'-', b'.', b'.', b'.', b'.',
+    b'/', b'/', b'/', b'/', b'3', b'3', b'3', b'3', b'4', b'4', b'4', b'4', b'5', b'5', b'5', b'5',
+    b'6', b'6', b'6', b'6', b'7', b'7', b'7', b'7', b'8', b'8', b'8', b'8', b'9', b'9', b'9', b'9',
+    b'=', b'=', b'=', b'=', b'A', b'A', b'A', b'A', b'_', b'_', b'_', b'_', b'b', b'b', b'b', b'b',
+    b'd', b'd', b'd', b'd', b'f', b'f', b'f', b'f', b'g', b'g', b'g', b'g', b'h', b'h', b'h', b'h',
+    b'l', b'l', b'l', b'l', b'm', b'm', b'm', b'm', b'n', b'n', b'n', b'n', b'p', b'p', b'p', b'p',
+    b'r', b'r', b'r', b'r', b'u', b'u', b'u', b'u', b':', b':', b'B', b'B', b'C', b'C', b'D', b'D',
+    b'E', b'E', b'F', b'F', b'G', b'G', b'H', b'H', b'I', b'I', b'J', b'J', b'K', b'K', b'L', b'L',
+    b'M', b'M', b'N', b'N', b'O', b'O', b'P', b'P', b'Q', b'Q', b'R', b'R', b'S', b'S', b'T', b'T',
+    b'U', b'U', b'V', b'V', b'W', b'W', b'Y', b'Y', b'j', b'j', b'k', b'k', b'q', b'q', b'v', b'v',
+    b'w', b'w', b'x', b'x', b'y', b'y', b'z', b'z', b'&', b'*', b',', b';', b'X', b'Z', b'', b'',
+    b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A',
+    b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b',
+    b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f',
+    b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h',
+    b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm',
+    b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p',
+    b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u',
+    b':', b':', b':', b':', b'B', b'B', b'B', b'B', b'C', b'C', b'C', b'C', b'D', b'D', b'D', b'D',
+    b'E', b'E', b'E', b'E', b'F', b'F', b'F', b'F', b'G', b'G', b'G', b'G', b'H', b'H', b'H', b'H',
+    b'I', b'I', b'I', b'I', b'J', b'J', b'J', b'J', b'K', b'K', b'K', b'K', b'L', b'L', b'L', b'L',
+    b'M', b'M', b'M', b'M', b'N', b'N', b'N', b'N', b'O', b'O', b'O', b'O', b'P', b'P', b'P', b'P',
+    b'Q', b'Q', b'Q', b'Q', b'R', b'R', b'R', b'R', b'S', b'S', b'S', b'S', b'T', b'T', b'T', b'T',
+    b'U', b'U', b'U', b'U', b'V', b'V', b'V', b'V', b'W', b'W', b'W', b'W', b'Y', b'Y', b'Y', b'Y',
+    b'j', b'j', b'j', b'j', b'k', b'k', b'k', b'k', b'q', b'q', b'q', b'q', b'v', b'v', b'v', b'v',
+    b'w', b'w', b'w', b'w', b'x', b'x', b'x', b'x', b'y', b'y', b'y', b'y', b'z', b'z', b'z', b'z',
+    b'&', b'&', b'*', b'*', b',', b',', b';', b';', b'X', b'X', b'Z', b'Z', b'', b'', b'', b'',
+    b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F',
+    b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H',
+    b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J',
+    b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L',
+    b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N',
+    b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P',
+    b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R',
+    b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T',
+    b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V',
+    b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y',
+    b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k',
+    b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v',
+    b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x',
+    b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z',
+    b'&', b'&', b'&', b'&', b'*', b'*', b'*', b'*', b',', b',', b',', b',', b';', b';', b';', b';',
+    b'X', b'X', b'X', b'X', b'Z', b'Z', b'Z', b'Z', b'!', b'"', b'(', b')', b'?', b'', b'', b'',
+    b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U',
+    b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V',
+    b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W',
+    b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y',
+    b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j',
+    b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k',
+    b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q',
+    b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v',
+    b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w',
+    b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x',
+    b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y',
+    b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z',
+    b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*',
+    b',', b',', b',', b',', b',', b',', b',', b',', b';', b';', b';', b';', b';', b';', b';', b';',
+    b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z',
+    b'!', b'!', b'"', b'"', b'(', b'(', b')', b')', b'?', b'?', b"'", b'+', b'|', b'', b'', b'',
+    b'w0', b'w1', b'w2', b'wa', b'wc', b'we', b'wi', b'wo', b'ws', b'wt', b'w', b'w', b'w', b'w',
+    b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w',
+    b'w', b'w', b'x0', b'x1', b'x2', b'xa', b'xc', b'xe', b'xi', b'xo', b'xs', b'xt', b'x', b'x',
+    b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x',
+    b'x', b'x', b'x', b'x', b'y0', b'y1', b'y2', b'ya', b'yc', b'ye', b'yi', b'yo', b'ys', b'yt',
+    b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y',
+    b'y', b'y', b'y', b'y', b'y', b'y', b'z0', b'z1', b'z2', b'za', b'zc', b'ze', b'zi', b'zo',
+    b'zs', b'zt', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z',
+    b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'&', b'&', b'&', b'&', b'&', b'&', b'&',
+    b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'*', b'*', b'*', b'*', b'*', b'*', b'*',
+    b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b',', b',', b',', b',', b',', b',', b',',
+    b',', b',', b',', b',', b',', b',', b',', b',', b',', b';', b';', b';', b';', b';', b';', b';',
+    b';', b';', b';', b';', b';', b';', b';', b';', b';', b'X', b'X', b'X', b'X', b'X', b'X', b'X',
+    b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z',
+    b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'!', b'!', b'!', b'!', b'"', b'"', b'"',
+    b'"', b'(', b'(', b'(', b'(', b')', b')', b')', b')', b'?', b'?', b'?', b'?', b"'", b"'", b'+',
+    b'+', b'|', b'|', b'#', b'>', b'', b'', b'', b'', b'&0', b'&1', b'&2', b'&a', b'&c', b'&e',
+    b'&i', b'&o', b'&s', b'&t', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&',
+    b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'*0', b'*1', b'*2', b'*a',
+    b'*c', b'*e', b'*i', b'*o', b'*s', b'*t', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*',
+    b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b',0', b',1',
+    b',2', b',a', b',c', b',e', b',i', b',o', b',s', b',t', b',', b',', b',', b',', b',', b',',
+    b',', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',',
+    b';0', b';1', b';2', b';a', b';c', b';e', b';i', b';o', b';s', b';t', b';', b';', b';', b';',
+    b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';',
+    b';', b';', b'X0', b'X1', b'X2', b'Xa', b'Xc', b'Xe', b'Xi', b'Xo', b'Xs', b'Xt', b'X', b'X',
+    b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X',
+    b'X', b'X', b'X', b'X', b'Z0', b'Z1', b'Z2', b'Za', b'Zc', b'Ze', b'Zi', b'Zo', b'Zs', b'Zt',
+    b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z',
+    b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'"', b'"',
+    b'"', b'"', b'"', b'"', b'"', b'"', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b')', b')',
+    b')', b')', b')', b')', b')', b')', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b"'", b"'",
+    b"'", b"'", b'+', b'+', b'+', b'+', b'|', b'|', b'|', b'|', b'#', b'#', b'>', b'>', b'\x00',
+    b'$', b'@', b'[', b']', b'~', b'', b'', b'X0', b'X0', b'X1', b'X1', b'X2', b'X2', b'Xa', b'Xa',
+    b'Xc', b'Xc', b'Xe', b'Xe', b'Xi', b'Xi', b'Xo', b'Xo', b'Xs', b'Xs', b'Xt', b'Xt', b'X ',
+    b'X%', b'X-', b'X.', b'X/', b'X3', b'X4', b'X5', b'X6', b'X7', b'X8', b'X9', b'X=', b'XA',
+    b'X_', b'Xb', b'Xd', b'Xf', b'Xg', b'Xh', b'Xl', b'Xm', b'Xn', b'Xp', b'Xr', b'Xu', b'X', b'X',
+    b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X', b'X',
+    b'Z0', b'Z0', b'Z1', b'Z1', b'Z2', b'Z2', b'Za', b'Za', b'Zc', b'Zc', b'Ze', b'Ze', b'Zi',
+    b'Zi', b'Zo', b'Zo', b'Zs', b'Zs', b'Zt', b'Zt', b'Z ', b'Z%', b'Z-', b'Z.', b'Z/', b'Z3',
+    b'Z4', b'Z5', b'Z6', b'Z7', b'Z8', b'Z9', b'Z=', b'ZA', b'Z_', b'Zb', b'Zd', b'Zf', b'Zg',
+    b'Zh', b'Zl', b'Zm', b'Zn', b'Zp', b'Zr', b'Zu', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z',
+    b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'Z', b'!', b'!', b'!', b'!', b'!', b'!',
+    b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'"', b'"', b'"', b'"', b'"', b'"',
+    b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'(', b'(', b'(', b'(', b'(', b'(',
+    b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b')', b')', b')', b')', b')', b')',
+    b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b'?', b'?', b'?', b'?', b'?', b'?',
+    b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b"'", b"'", b"'", b"'", b"'", b"'",
+    b"'", b"'", b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'|', b'|', b'|', b'|', b'|', b'|',
+    b'|', b'|', b'#', b'#', b'#', b'#', b'>', b'>', b'>', b'>', b'\x00', b'\x00', b'$', b'$', b'@',
+    b'@', b'[', b'[', b']', b']', b'~', b'~', b'^', b'}', b'', b'', b'!0', b'!1', b'!2', b'!a',
+    b'!c', b'!e', b'!i', b'!o', b'!s', b'!t', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!',
+    b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'"0', b'"1',
+    b'"2', b'"a', b'"c', b'"e', b'"i', b'"o', b'"s', b'"t', b'"', b'"', b'"', b'"', b'"', b'"',
+    b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"',
+    b'(0', b'(1', b'(2', b'(a', b'(c', b'(e', b'(i', b'(o', b'(s', b'(t', b'(', b'(', b'(', b'(',
+    b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(',
+    b'(', b'(', b')0', b')1', b')2', b')a', b')c', b')e', b')i', b')o', b')s', b')t', b')', b')',
+    b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b')',
+    b')', b')', b')', b')', b'?0', b'?1', b'?2', b'?a', b'?c', b'?e', b'?i', b'?o', b'?s', b'?t',
+    b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?',
+    b'?', b'?', b'?', b'?', b'?', b'?', b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'",
+    b"'", b"'", b"'", b"'", b"'", b"'", b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+',
+    b'+', b'+', b'+', b'+', b'+', b'+', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|',
+    b'|', b'|', b'|', b'|', b'|', b'|', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'>', b'>',
+    b'>', b'>', b'>', b'>', b'>', b'>', b'\x00', b'\x00', b'\x00', b'\x00', b'$', b'$', b'$', b'$',
+    b'@', b'@', b'@', b'@', b'[', b'[', b'[', b'[', b']', b']', b']', b']', b'~', b'~', b'~', b'~',
+    b'^', b'^', b'}', b'}', b'<', b'`', b'{', b'', b'?0', b'?0', b'?1', b'?1', b'?2', b'?2', b'?a',
+    b'?a', b'?c', b'?c', b'?e', b'?e', b'?i', b'?i', b'?o', b'?o', b'?s', b'?s', b'?t', b'?t',
+    b'? ', b'?%', b'?-', b'?.', b'?/', b'?3', b'?4', b'?5', b'?6', b'?7', b'?8', b'?9', b'?=',
+    b'?A', b'?_', b'?b', b'?d', b'?f', b'?g', b'?h', b'?l', b'?m', b'?n', b'?p', b'?r', b'?u', b'?',
+    b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?', b'?',
+    b'?', b"'0", b"'1", b"'2", b"'a", b"'c", b"'e", b"'i", b"'o", b"'s", b"'t", b"'", b"'", b"'",
+    b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'",
+    b"'", b"'", b"'", b'+0', b'+1', b'+2', b'+a', b'+c', b'+e', b'+i', b'+o', b'+s', b'+t', b'+',
+    b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+',
+    b'+', b'+', b'+', b'+', b'+', b'|0', b'|1', b'|2', b'|a', b'|c', b'|e', b'|i', b'|o', b'|s',
+    b'|t', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|',
+    b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#',
+    b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>',
+    b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00',
+    b'\x00', b'\x00', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'@', b'@', b'@', b'@', b'@',
+    b'@', b'@', b'@', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b']', b']', b']', b']', b']',
+    b']', b']', b']', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'^', b'^', b'^', b'^', b'}',
+    b'}', b'}', b'}', b'<', b'<', b'`', b'`', b'{', b'{', b'', b'', b'|0', b'|0', b'|1', b'|1',
+    b'|2', b'|2', b'|a', b'|a', b'|c', b'|c', b'|e', b'|e', b'|i', b'|i', b'|o', b'|o', b'|s',
+    b'|s', b'|t', b'|t', b'| ', b'|%', b'|-', b'|.', b'|/', b'|3', b'|4', b'|5', b'|6', b'|7',
+    b'|8', b'|9', b'|=', b'|A', b'|_', b'|b', b'|d', b'|f', b'|g', b'|h', b'|l', b'|m', b'|n',
+    b'|p', b'|r', b'|u', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|', b'|',
+    b'|', b'|', b'|', b'|', b'|', b'|', b'#0', b'#1', b'#2', b'#a', b'#c', b'#e', b'#i', b'#o',
+    b'#s', b'#t', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#',
+    b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'>0', b'>1', b'>2', b'>a', b'>c', b'>e',
+    b'>i', b'>o', b'>s', b'>t', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>',
+    b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'\x00', b'\x00', b'\x00',
+    b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00',
+    b'\x00', b'\x00', b'\x00', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$',
+    b'$', b'$', b'$', b'$', b'$', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@',
+    b'@', b'@', b'@', b'@', b'@', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[',
+    b'[', b'[', b'[', b'[', b'[', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']',
+    b']', b']', b']', b']', b']', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~',
+    b'~', b'~', b'~', b'~', b'~', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'}', b'}', b'}',
+    b'}', b'}', b'}', b'}', b'}', b'<', b'<', b'<', b'<', b'`', b'`', b'`', b'`', b'{', b'{', b'{',
+    b'{', b'', b'', b'', b'', b'\x000', b'\x001', b'\x002', b'\x00a', b'\x00c', b'\x00e', b'\x00i',
+    b'\x00o', b'\x00s', b'\x00t', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00',
+    b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00',
+    b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'$0', b'$1', b'$2', b'$a', b'$c', b'$e', b'$i',
+    b'$o', b'$s', b'$t', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$',
+    b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'@0', b'@1', b'@2', b'@a', b'@c',
+    b'@e', b'@i', b'@o', b'@s', b'@t', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@',
+    b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'[0', b'[1', b'[2',
+    b'[a', b'[c', b'[e', b'[i', b'[o', b'[s', b'[t', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[',
+    b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b']0',
+    b']1', b']2', b']a', b']c', b']e', b']i', b']o', b']s', b']t', b']', b']', b']', b']', b']',
+    b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']',
+    b']', b'~0', b'~1', b'~2', b'~a', b'~c', b'~e', b'~i', b'~o', b'~s', b'~t', b'~', b'~', b'~',
+    b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~',
+    b'~', b'~', b'~', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^',
+    b'^', b'^', b'^', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}',
+    b'}', b'}', b'}', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'`', b'`', b'`', b'`', b'`',
+    b'`', b'`', b'`', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'\x000', b'\x000', b'\x001', b'\x001', b'\x002', b'\x002', b'\x00a', b'\x00a',
+    b'\x00c', b'\x00c', b'\x00e', b'\x00e', b'\x00i', b'\x00i', b'\x00o', b'\x00o', b'\x00s',
+    b'\x00s', b'\x00t', b'\x00t', b'\x00 ', b'\x00%', b'\x00-', b'\x00.', b'\x00/', b'\x003',
+    b'\x004', b'\x005', b'\x006', b'\x007', b'\x008', b'\x009', b'\x00=', b'\x00A', b'\x00_',
+    b'\x00b', b'\x00d', b'\x00f', b'\x00g', b'\x00h', b'\x00l', b'\x00m', b'\x00n', b'\x00p',
+    b'\x00r', b'\x00u', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00',
+    b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'\x00', b'$0',
+    b'$0', b'$1', b'$1', b'$2', b'$2', b'$a', b'$a', b'$c', b'$c', b'$e', b'$e', b'$i', b'$i',
+    b'$o', b'$o', b'$s', b'$s', b'$t', b'$t', b'$ ', b'$%', b'$-', b'$.', b'$/', b'$3', b'$4',
+    b'$5', b'$6', b'$7', b'$8', b'$9', b'$=', b'$A', b'$_', b'$b', b'$d', b'$f', b'$g', b'$h',
+    b'$l', b'$m', b'$n', b'$p', b'$r', b'$u', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$',
+    b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'$', b'@0', b'@0', b'@1', b'@1', b'@2', b'@2',
+    b'@a', b'@a', b'@c', b'@c', b'@e', b'@e', b'@i', b'@i', b'@o', b'@o', b'@s', b'@s', b'@t',
+    b'@t', b'@ ', b'@%', b'@-', b'@.', b'@/', b'@3', b'@4', b'@5', b'@6', b'@7', b'@8', b'@9',
+    b'@=', b'@A', b'@_', b'@b', b'@d', b'@f', b'@g', b'@h', b'@l', b'@m', b'@n', b'@p', b'@r',
+    b'@u', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@', b'@',
+    b'@', b'@', b'@', b'[0', b'[0', b'[1', b'[1', b'[2', b'[2', b'[a', b'[a', b'[c', b'[c', b'[e',
+    b'[e', b'[i', b'[i', b'[o', b'[o', b'[s', b'[s', b'[t', b'[t', b'[ ', b'[%', b'[-', b'[.',
+    b'[/', b'[3', b'[4', b'[5', b'[6', b'[7', b'[8', b'[9', b'[=', b'[A', b'[_', b'[b', b'[d',
+    b'[f', b'[g', b'[h', b'[l', b'[m', b'[n', b'[p', b'[r', b'[u', b'[', b'[', b'[', b'[', b'[',
+    b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'[', b'\x000',
+    b'\x000', b'\x000', b'\x000', b'\x001', b'\x001', b'\x001', b'\x001', b'\x002', b'\x002',
+    b'\x002', b'\x002', b'\x00a', b'\x00a', b'\x00a', b'\x00a', b'\x00c', b'\x00c', b'\x00c',
+    b'\x00c', b'\x00e', b'\x00e', b'\x00e', b'\x00e', b'\x00i', b'\x00i', b'\x00i', b'\x00i',
+    b'\x00o', b'\x00o', b'\x00o', b'\x00o', b'\x00s', b'\x00s', b'\x00s', b'\x00s', b'\x00t',
+    b'\x00t', b'\x00t', b'\x00t', b'\x00 ', b'\x00 ', b'\x00%', b'\x00%', b'\x00-', b'\x00-',
+    b'\x00.', b'\x00.', b'\x00/', b'\x00/', b'\x003', b'\x003', b'\x004', b'\x004', b'\x005',
+    b'\x005', b'\x006', b'\x006', b'\x007', b'\x007', b'\x008', b'\x008', b'\x009', b'\x009',
+    b'\x00=', b'\x00=', b'\x00A', b'\x00A', b'\x00_', b'\x00_', b'\x00b', b'\x00b', b'\x00d',
+    b'\x00d', b'\x00f', b'\x00f', b'\x00g', b'\x00g', b'\x00h', b'\x00h', b'\x00l', b'\x00l',
+    b'\x00m', b'\x00m', b'\x00n', b'\x00n', b'\x00p', b'\x00p', b'\x00r', b'\x00r', b'\x00u',
+    b'\x00u', b'\x00:', b'\x00B', b'\x00C', b'\x00D', b'\x00E', b'\x00F', b'\x00G', b'\x00H',
+    b'\x00I', b'\x00J', b'\x00K', b'\x00L', b'\x00M', b'\x00N', b'\x00O', b'\x00P', b'\x00Q',
+    b'\x00R', b'\x00S', b'\x00T', b'\x00U', b'\x00V', b'\x00W', b'\x00Y', b'\x00j', b'\x00k',
+    b'\x00q', b'\x00v', b'\x00w', b'\x00x', b'\x00y', b'\x00z', b'\x00', b'\x00', b'\x00', b'\x00',
+    b'$0', b'$0', b'$0', b'$0', b'$1', b'$1', b'$1', b'$1', b'$2', b'$2', b'$2', b'$2', b'$a',
+    b'$a', b'$a', b'$a', b'$c', b'$c', b'$c', b'$c', b'$e', b'$e', b'$e', b'$e', b'$i', b'$i',
+    b'$i', b'$i', b'$o', b'$o', b'$o', b'$o', b'$s', b'$s', b'$s', b'$s', b'$t', b'$t', b'$t',
+    b'$t', b'$ ', b'$ ', b'$%', b'$%', b'$-', b'$-', b'$.', b'$.', b'$/', b'$/', b'$3', b'$3',
+    b'$4', b'$4', b'$5', b'$5', b'$6', b'$6', b'$7', b'$7', b'$8', b'$8', b'$9', b'$9', b'$=',
+    b'$=', b'$A', b'$A', b'$_', b'$_', b'$b', b'$b', b'$d', b'$d', b'$f', b'$f', b'$g', b'$g',
+    b'$h', b'$h', b'$l', b'$l', b'$m', b'$m', b'$n', b'$n', b'$p', b'$p', b'$r', b'$r', b'$u',
+    b'$u', b'$:', b'$B', b'$C', b'$D', b'$E', b'$F', b'$G', b'$H', b'$I', b'$J', b'$K', b'$L',
+    b'$M', b'$N', b'$O', b'$P', b'$Q', b'$R', b'$S', b'$T', b'$U', b'$V', b'$W', b'$Y', b'$j',
+    b'$k', b'$q', b'$v', b'$w', b'$x', b'$y', b'$z', b'$', b'$', b'$', b'$', b']0', b']0', b']1',
+    b']1', b']2', b']2', b']a', b']a', b']c', b']c', b']e', b']e', b']i', b']i', b']o', b']o',
+    b']s', b']s', b']t', b']t', b'] ', b']%', b']-', b'].', b']/', b']3', b']4', b']5', b']6',
+    b']7', b']8', b']9', b']=', b']A', b']_', b']b', b']d', b']f', b']g', b']h', b']l', b']m',
+    b']n', b']p', b']r', b']u', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']', b']',
+    b']', b']', b']', b']', b']', b']', b']', b'~0', b'~0', b'~1', b'~1', b'~2', b'~2', b'~a',
+    b'~a', b'~c', b'~c', b'~e', b'~e', b'~i', b'~i', b'~o', b'~o', b'~s', b'~s', b'~t', b'~t',
+    b'~ ', b'~%', b'~-', b'~.', b'~/', b'~3', b'~4', b'~5', b'~6', b'~7', b'~8', b'~9', b'~=',
+    b'~A', b'~_', b'~b', b'~d', b'~f', b'~g', b'~h', b'~l', b'~m', b'~n', b'~p', b'~r', b'~u', b'~',
+    b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~', b'~',
+    b'~', b'^0', b'^1', b'^2', b'^a', b'^c', b'^e', b'^i', b'^o', b'^s', b'^t', b'^', b'^', b'^',
+    b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^',
+    b'^', b'^', b'^', b'}0', b'}1', b'}2', b'}a', b'}c', b'}e', b'}i', b'}o', b'}s', b'}t', b'}',
+    b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}',
+    b'}', b'}', b'}', b'}', b'}', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<',
+    b'<', b'<', b'<', b'<', b'<', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`',
+    b'`', b'`', b'`', b'`', b'`', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{',
+    b'{', b'{', b'{', b'{', b'{', b'\\', b'\xc3', b'\xd0', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'^0', b'^0', b'^1', b'^1', b'^2', b'^2', b'^a', b'^a', b'^c', b'^c',
+    b'^e', b'^e', b'^i', b'^i', b'^o', b'^o', b'^s', b'^s', b'^t', b'^t', b'^ ', b'^%', b'^-',
+    b'^.', b'^/', b'^3', b'^4', b'^5', b'^6', b'^7', b'^8', b'^9', b'^=', b'^A', b'^_', b'^b',
+    b'^d', b'^f', b'^g', b'^h', b'^l', b'^m', b'^n', b'^p', b'^r', b'^u', b'^', b'^', b'^', b'^',
+    b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'^', b'}0',
+    b'}0', b'}1', b'}1', b'}2', b'}2', b'}a', b'}a', b'}c', b'}c', b'}e', b'}e', b'}i', b'}i',
+    b'}o', b'}o', b'}s', b'}s', b'}t', b'}t', b'} ', b'}%', b'}-', b'}.', b'}/', b'}3', b'}4',
+    b'}5', b'}6', b'}7', b'}8', b'}9', b'}=', b'}A', b'}_', b'}b', b'}d', b'}f', b'}g', b'}h',
+    b'}l', b'}m', b'}n', b'}p', b'}r', b'}u', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}',
+    b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'}', b'<0', b'<1', b'<2', b'<a', b'<c', b'<e',
+    b'<i', b'<o', b'<s', b'<t', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<',
+    b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'`0', b'`1', b'`2', b'`a',
+    b'`c', b'`e', b'`i', b'`o', b'`s', b'`t', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`',
+    b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'{0', b'{1',
+    b'{2', b'{a', b'{c', b'{e', b'{i', b'{o', b'{s', b'{t', b'{', b'{', b'{', b'{', b'{', b'{',
+    b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{',
+    b'\\', b'\\', b'\xc3', b'\xc3', b'\xd0', b'\xd0', b'\x80', b'\x82', b'\x83', b'\xa2', b'\xb8',
+    b'\xc2', b'\xe0', b'\xe2', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'<0', b'<0', b'<1', b'<1', b'<2', b'<2', b'<a', b'<a', b'<c', b'<c', b'<e',
+    b'<e', b'<i', b'<i', b'<o', b'<o', b'<s', b'<s', b'<t', b'<t', b'< ', b'<%', b'<-', b'<.',
+    b'</', b'<3', b'<4', b'<5', b'<6', b'<7', b'<8', b'<9', b'<=', b'<A', b'<_', b'<b', b'<d',
+    b'<f', b'<g', b'<h', b'<l', b'<m', b'<n', b'<p', b'<r', b'<u', b'<', b'<', b'<', b'<', b'<',
+    b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'<', b'`0', b'`0',
+    b'`1', b'`1', b'`2', b'`2', b'`a', b'`a', b'`c', b'`c', b'`e', b'`e', b'`i', b'`i', b'`o',
+    b'`o', b'`s', b'`s', b'`t', b'`t', b'` ', b'`%', b'`-', b'`.', b'`/', b'`3', b'`4', b'`5',
+    b'`6', b'`7', b'`8', b'`9', b'`=', b'`A', b'`_', b'`b', b'`d', b'`f', b'`g', b'`h', b'`l',
+    b'`m', b'`n', b'`p', b'`r', b'`u', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`',
+    b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'`', b'{0', b'{0', b'{1', b'{1', b'{2', b'{2', b'{a',
+    b'{a', b'{c', b'{c', b'{e', b'{e', b'{i', b'{i', b'{o', b'{o', b'{s', b'{s', b'{t', b'{t',
+    b'{ ', b'{%', b'{-', b'{.', b'{/', b'{3', b'{4', b'{5', b'{6', b'{7', b'{8', b'{9', b'{=',
+    b'{A', b'{_', b'{b', b'{d', b'{f', b'{g', b'{h', b'{l', b'{m', b'{n', b'{p', b'{r', b'{u', b'{',
+    b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{', b'{',
+    b'{', b'\\', b'\\', b'\\', b'\\', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\x80', b'\x80', b'\x82', b'\x82', b'\x83', b'\x83', b'\xa2', b'\xa2', b'\xb8',
+    b'\xb8', b'\xc2', b'\xc2', b'\xe0', b'\xe0', b'\xe2', b'\xe2', b'\x99', b'\xa1', b'\xa7',
+    b'\xac', b'\xb0', b'\xb1', b'\xb3', b'\xd1', b'\xd8', b'\xd9', b'\xe3', b'\xe5', b'\xe6', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'{0', b'{0', b'{0', b'{0', b'{1', b'{1', b'{1', b'{1', b'{2', b'{2', b'{2',
+    b'{2', b'{a', b'{a', b'{a', b'{a', b'{c', b'{c', b'{c', b'{c', b'{e', b'{e', b'{e', b'{e',
+    b'{i', b'{i', b'{i', b'{i', b'{o', b'{o', b'{o', b'{o', b'{s', b'{s', b'{s', b'{s', b'{t',
+    b'{t', b'{t', b'{t', b'{ ', b'{ ', b'{%', b'{%', b'{-', b'{-', b'{.', b'{.', b'{/', b'{/',
+    b'{3', b'{3', b'{4', b'{4', b'{5', b'{5', b'{6', b'{6', b'{7', b'{7', b'{8', b'{8', b'{9',
+    b'{9', b'{=', b'{=', b'{A', b'{A', b'{_', b'{_', b'{b', b'{b', b'{d', b'{d', b'{f', b'{f',
+    b'{g', b'{g', b'{h', b'{h', b'{l', b'{l', b'{m', b'{m', b'{n', b'{n', b'{p', b'{p', b'{r',
+    b'{r', b'{u', b'{u', b'{:', b'{B', b'{C', b'{D', b'{E', b'{F', b'{G', b'{H', b'{I', b'{J',
+    b'{K', b'{L', b'{M', b'{N', b'{O', b'{P', b'{Q', b'{R', b'{S', b'{T', b'{U', b'{V', b'{W',
+    b'{Y', b'{j', b'{k', b'{q', b'{v', b'{w', b'{x', b'{y', b'{z', b'{', b'{', b'{', b'{', b'\\',
+    b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\x80', b'\x80', b'\x80', b'\x80', b'\x82', b'\x82', b'\x82', b'\x82', b'\x83',
+    b'\x83', b'\x83', b'\x83', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xb8', b'\xb8', b'\xb8',
+    b'\xb8', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe2',
+    b'\xe2', b'\xe2', b'\xe2', b'\x99', b'\x99', b'\xa1', b'\xa1', b'\xa7', b'\xa7', b'\xac',
+    b'\xac', b'\xb0', b'\xb0', b'\xb1', b'\xb1', b'\xb3', b'\xb3', b'\xd1', b'\xd1', b'\xd8',
+    b'\xd8', b'\xd9', b'\xd9', b'\xe3', b'\xe3', b'\xe5', b'\xe5', b'\xe6', b'\xe6', b'\x81',
+    b'\x84', b'\x85', b'\x86', b'\x88', b'\x92', b'\x9a', b'\x9c', b'\xa0', b'\xa3', b'\xa4',
+    b'\xa9', b'\xaa', b'\xad', b'\xb2', b'\xb5', b'\xb9', b'\xba', b'\xbb', b'\xbd', b'\xbe',
+    b'\xc4', b'\xc6', b'\xe4', b'\xe8', b'\xe9', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\',
+    b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\x80',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x82', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\x83', b'\x83', b'\x83', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\xa2', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xc2',
+    b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xe0', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\xe2', b'\xe2', b'\xe2', b'\x99', b'\x99', b'\x99', b'\x99', b'\xa1', b'\xa1', b'\xa1',
+    b'\xa1', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xac', b'\xac', b'\xac', b'\xac', b'\xb0',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd9',
+    b'\xd9', b'\xd9', b'\xd9', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\x81', b'\x81', b'\x84', b'\x84', b'\x85',
+    b'\x85', b'\x86', b'\x86', b'\x88', b'\x88', b'\x92', b'\x92', b'\x9a', b'\x9a', b'\x9c',
+    b'\x9c', b'\xa0', b'\xa0', b'\xa3', b'\xa3', b'\xa4', b'\xa4', b'\xa9', b'\xa9', b'\xaa',
+    b'\xaa', b'\xad', b'\xad', b'\xb2', b'\xb2', b'\xb5', b'\xb5', b'\xb9', b'\xb9', b'\xba',
+    b'\xba', b'\xbb', b'\xbb', b'\xbd', b'\xbd', b'\xbe', b'\xbe', b'\xc4', b'\xc4', b'\xc6',
+    b'\xc6', b'\xe4', b'\xe4', b'\xe8', b'\xe8', b'\xe9', b'\xe9', b'\x01', b'\x87', b'\x89',
+    b'\x8a', b'\x8b', b'\x8c', b'\x8d', b'\x8f', b'\x93', b'\x95', b'\x96', b'\x97', b'\x98',
+    b'\x9b', b'\x9d', b'\x9e', b'\xa5', b'\xa6', b'\xa8', b'\xae', b'\xaf', b'\xb4', b'\xb6',
+    b'\xb7', b'\xbc', b'\xbf', b'\xc5', b'\xe7', b'\xef', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb1',
+    b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1',
+    b'\xd1', b'\xd1', b'\xd1', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd8', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xe3',
+    b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6',
+    b'\xe6', b'\xe6', b'\xe6', b'\x81', b'\x81', b'\x81', b'\x81', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x85', b'\x85', b'\x85', b'\x85', b'\x86', b'\x86', b'\x86', b'\x86', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x92', b'\x92', b'\x92', b'\x92', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa3',
+    b'\xa3', b'\xa3', b'\xa3', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xad', b'\xad', b'\xad', b'\xad', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb9', b'\xb9', b'\xb9',
+    b'\xb9', b'\xba', b'\xba', b'\xba', b'\xba', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbd',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe8',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\x01', b'\x01', b'\x87',
+    b'\x87', b'\x89', b'\x89', b'\x8a', b'\x8a', b'\x8b', b'\x8b', b'\x8c', b'\x8c', b'\x8d',
+    b'\x8d', b'\x8f', b'\x8f', b'\x93', b'\x93', b'\x95', b'\x95', b'\x96', b'\x96', b'\x97',
+    b'\x97', b'\x98', b'\x98', b'\x9b', b'\x9b', b'\x9d', b'\x9d', b'\x9e', b'\x9e', b'\xa5',
+    b'\xa5', b'\xa6', b'\xa6', b'\xa8', b'\xa8', b'\xae', b'\xae', b'\xaf', b'\xaf', b'\xb4',
+    b'\xb4', b'\xb6', b'\xb6', b'\xb7', b'\xb7', b'\xbc', b'\xbc', b'\xbf', b'\xbf', b'\xc5',
+    b'\xc5', b'\xe7', b'\xe7', b'\xef', b'\xef', b'\t', b'\x8e', b'\x90', b'\x91', b'\x94', b'\x9f',
+    b'\xab', b'\xce', b'\xd7', b'\xe1', b'\xec', b'\xed', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb5',
+    b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb9', b'\xb9', b'\xb9',
+    b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xba', b'\xba', b'\xba', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb',
+    b'\xbb', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbe',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xc6', b'\xc6', b'\xc6', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4',
+    b'\xe4', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe9',
+    b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\x01', b'\x01', b'\x01',
+    b'\x01', b'\x87', b'\x87', b'\x87', b'\x87', b'\x89', b'\x89', b'\x89', b'\x89', b'\x8a',
+    b'\x8a', b'\x8a', b'\x8a', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8c', b'\x8c', b'\x8c',
+    b'\x8c', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x95', b'\x95', b'\x95', b'\x95', b'\x96', b'\x96', b'\x96',
+    b'\x96', b'\x97', b'\x97', b'\x97', b'\x97', b'\x98', b'\x98', b'\x98', b'\x98', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9e', b'\x9e', b'\x9e',
+    b'\x9e', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa8',
+    b'\xa8', b'\xa8', b'\xa8', b'\xae', b'\xae', b'\xae', b'\xae', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb7',
+    b'\xb7', b'\xb7', b'\xb7', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xef',
+    b'\xef', b'\xef', b'\xef', b'\t', b'\t', b'\x8e', b'\x8e', b'\x90', b'\x90', b'\x91', b'\x91',
+    b'\x94', b'\x94', b'\x9f', b'\x9f', b'\xab', b'\xab', b'\xce', b'\xce', b'\xd7', b'\xd7',
+    b'\xe1', b'\xe1', b'\xec', b'\xec', b'\xed', b'\xed', b'\xc7', b'\xcf', b'\xea', b'\xeb', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'\xb2', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9',
+    b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xba', b'\xba', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb',
+    b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbd', b'\xbd',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xc6', b'\xc6', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4',
+    b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe8', b'\xe8',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9',
+    b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9',
+    b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x87', b'\x87',
+    b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x89', b'\x89', b'\x89', b'\x89',
+    b'\x89', b'\x89', b'\x89', b'\x89', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a',
+    b'\x8a', b'\x8a', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b',
+    b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8d', b'\x8d',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8f', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\xc60', b'\xc61', b'\xc62', b'\xc6a', b'\xc6c', b'\xc6e',
+    b'\xc6i', b'\xc6o', b'\xc6s', b'\xc6t', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xe40', b'\xe41', b'\xe42', b'\xe4a',
+    b'\xe4c', b'\xe4e', b'\xe4i', b'\xe4o', b'\xe4s', b'\xe4t', b'\xe4', b'\xe4', b'\xe4', b'\xe4',
+    b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4',
+    b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe80', b'\xe81',
+    b'\xe82', b'\xe8a', b'\xe8c', b'\xe8e', b'\xe8i', b'\xe8o', b'\xe8s', b'\xe8t', b'\xe8',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8',
+    b'\xe8', b'\xe90', b'\xe91', b'\xe92', b'\xe9a', b'\xe9c', b'\xe9e', b'\xe9i', b'\xe9o',
+    b'\xe9s', b'\xe9t', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9',
+    b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9',
+    b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01',
+    b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01',
+    b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87',
+    b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x89', b'\x89', b'\x89', b'\x89',
+    b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89',
+    b'\x89', b'\x89', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a',
+    b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8b', b'\x8b',
+    b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b',
+    b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c',
+    b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8f', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x8f', b'\x010', b'\x011', b'\x012', b'\x01a', b'\x01c', b'\x01e', b'\x01i',
+    b'\x01o', b'\x01s', b'\x01t', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01',
+    b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01',
+    b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x870', b'\x871', b'\x872', b'\x87a', b'\x87c',
+    b'\x87e', b'\x87i', b'\x87o', b'\x87s', b'\x87t', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87',
+    b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87',
+    b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x890', b'\x891', b'\x892',
+    b'\x89a', b'\x89c', b'\x89e', b'\x89i', b'\x89o', b'\x89s', b'\x89t', b'\x89', b'\x89', b'\x89',
+    b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89',
+    b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x8a0',
+    b'\x8a1', b'\x8a2', b'\x8aa', b'\x8ac', b'\x8ae', b'\x8ai', b'\x8ao', b'\x8as', b'\x8at',
+    b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a',
+    b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a',
+    b'\x8a', b'\x8a', b'\x8b0', b'\x8b1', b'\x8b2', b'\x8ba', b'\x8bc', b'\x8be', b'\x8bi',
+    b'\x8bo', b'\x8bs', b'\x8bt', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b',
+    b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b',
+    b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8c0', b'\x8c1', b'\x8c2', b'\x8ca', b'\x8cc',
+    b'\x8ce', b'\x8ci', b'\x8co', b'\x8cs', b'\x8ct', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c',
+    b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c',
+    b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8d0', b'\x8d1', b'\x8d2',
+    b'\x8da', b'\x8dc', b'\x8de', b'\x8di', b'\x8do', b'\x8ds', b'\x8dt', b'\x8d', b'\x8d', b'\x8d',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8f0',
+    b'\x8f1', b'\x8f2', b'\x8fa', b'\x8fc', b'\x8fe', b'\x8fi', b'\x8fo', b'\x8fs', b'\x8ft',
+    b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x8f', b'\x010', b'\x010', b'\x011', b'\x011', b'\x012', b'\x012', b'\x01a',
+    b'\x01a', b'\x01c', b'\x01c', b'\x01e', b'\x01e', b'\x01i', b'\x01i', b'\x01o', b'\x01o',
+    b'\x01s', b'\x01s', b'\x01t', b'\x01t', b'\x01 ', b'\x01%', b'\x01-', b'\x01.', b'\x01/',
+    b'\x013', b'\x014', b'\x015', b'\x016', b'\x017', b'\x018', b'\x019', b'\x01=', b'\x01A',
+    b'\x01_', b'\x01b', b'\x01d', b'\x01f', b'\x01g', b'\x01h', b'\x01l', b'\x01m', b'\x01n',
+    b'\x01p', b'\x01r', b'\x01u', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01',
+    b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01', b'\x01',
+    b'\x01', b'\x870', b'\x870', b'\x871', b'\x871', b'\x872', b'\x872', b'\x87a', b'\x87a',
+    b'\x87c', b'\x87c', b'\x87e', b'\x87e', b'\x87i', b'\x87i', b'\x87o', b'\x87o', b'\x87s',
+    b'\x87s', b'\x87t', b'\x87t', b'\x87 ', b'\x87%', b'\x87-', b'\x87.', b'\x87/', b'\x873',
+    b'\x874', b'\x875', b'\x876', b'\x877', b'\x878', b'\x879', b'\x87=', b'\x87A', b'\x87_',
+    b'\x87b', b'\x87d', b'\x87f', b'\x87g', b'\x87h', b'\x87l', b'\x87m', b'\x87n', b'\x87p',
+    b'\x87r', b'\x87u', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87',
+    b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87', b'\x87',
+    b'\x890', b'\x890', b'\x891', b'\x891', b'\x892', b'\x892', b'\x89a', b'\x89a', b'\x89c',
+    b'\x89c', b'\x89e', b'\x89e', b'\x89i', b'\x89i', b'\x89o', b'\x89o', b'\x89s', b'\x89s',
+    b'\x89t', b'\x89t', b'\x89 ', b'\x89%', b'\x89-', b'\x89.', b'\x89/', b'\x893', b'\x894',
+    b'\x895', b'\x896', b'\x897', b'\x898', b'\x899', b'\x89=', b'\x89A', b'\x89_', b'\x89b',
+    b'\x89d', b'\x89f', b'\x89g', b'\x89h', b'\x89l', b'\x89m', b'\x89n', b'\x89p', b'\x89r',
+    b'\x89u', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89',
+    b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x89', b'\x8a0',
+    b'\x8a0', b'\x8a1', b'\x8a1', b'\x8a2', b'\x8a2', b'\x8aa', b'\x8aa', b'\x8ac', b'\x8ac',
+    b'\x8ae', b'\x8ae', b'\x8ai', b'\x8ai', b'\x8ao', b'\x8ao', b'\x8as', b'\x8as', b'\x8at',
+    b'\x8at', b'\x8a ', b'\x8a%', b'\x8a-', b'\x8a.', b'\x8a/', b'\x8a3', b'\x8a4', b'\x8a5',
+    b'\x8a6', b'\x8a7', b'\x8a8', b'\x8a9', b'\x8a=', b'\x8aA', b'\x8a_', b'\x8ab', b'\x8ad',
+    b'\x8af', b'\x8ag', b'\x8ah', b'\x8al', b'\x8am', b'\x8an', b'\x8ap', b'\x8ar', b'\x8au',
+    b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a',
+    b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x8a', b'\x010', b'\x010',
+    b'\x010', b'\x010', b'\x011', b'\x011', b'\x011', b'\x011', b'\x012', b'\x012', b'\x012',
+    b'\x012', b'\x01a', b'\x01a', b'\x01a', b'\x01a', b'\x01c', b'\x01c', b'\x01c', b'\x01c',
+    b'\x01e', b'\x01e', b'\x01e', b'\x01e', b'\x01i', b'\x01i', b'\x01i', b'\x01i', b'\x01o',
+    b'\x01o', b'\x01o', b'\x01o', b'\x01s', b'\x01s', b'\x01s', b'\x01s', b'\x01t', b'\x01t',
+    b'\x01t', b'\x01t', b'\x01 ', b'\x01 ', b'\x01%', b'\x01%', b'\x01-', b'\x01-', b'\x01.',
+    b'\x01.', b'\x01/', b'\x01/', b'\x013', b'\x013', b'\x014', b'\x014', b'\x015', b'\x015',
+    b'\x016', b'\x016', b'\x017', b'\x017', b'\x018', b'\x018', b'\x019', b'\x019', b'\x01=',
+    b'\x01=', b'\x01A', b'\x01A', b'\x01_', b'\x01_', b'\x01b', b'\x01b', b'\x01d', b'\x01d',
+    b'\x01f', b'\x01f', b'\x01g', b'\x01g', b'\x01h', b'\x01h', b'\x01l', b'\x01l', b'\x01m',
+    b'\x01m', b'\x01n', b'\x01n', b'\x01p', b'\x01p', b'\x01r', b'\x01r', b'\x01u', b'\x01u',
+    b'\x01:', b'\x01B', b'\x01C', b'\x01D', b'\x01E', b'\x01F', b'\x01G', b'\x01H', b'\x01I',
+    b'\x01J', b'\x01K', b'\x01L', b'\x01M', b'\x01N', b'\x01O', b'\x01P', b'\x01Q', b'\x01R',
+    b'\x01S', b'\x01T', b'\x01U', b'\x01V', b'\x01W', b'\x01Y', b'\x01j', b'\x01k', b'\x01q',
+    b'\x01v', b'\x01w', b'\x01x', b'\x01y', b'\x01z', b'\x01', b'\x01', b'\x01', b'\x01', b'\x870',
+    b'\x870', b'\x870', b'\x870', b'\x871', b'\x871', b'\x871', b'\x871', b'\x872', b'\x872',
+    b'\x872', b'\x872', b'\x87a', b'\x87a', b'\x87a', b'\x87a', b'\x87c', b'\x87c', b'\x87c',
+    b'\x87c', b'\x87e', b'\x87e', b'\x87e', b'\x87e', b'\x87i', b'\x87i', b'\x87i', b'\x87i',
+    b'\x87o', b'\x87o', b'\x87o', b'\x87o', b'\x87s', b'\x87s', b'\x87s', b'\x87s', b'\x87t',
+    b'\x87t', b'\x87t', b'\x87t', b'\x87 ', b'\x87 ', b'\x87%', b'\x87%', b'\x87-', b'\x87-',
+    b'\x87.', b'\x87.', b'\x87/', b'\x87/', b'\x873', b'\x873', b'\x874', b'\x874', b'\x875',
+    b'\x875', b'\x876', b'\x876', b'\x877', b'\x877', b'\x878', b'\x878', b'\x879', b'\x879',
+    b'\x87=', b'\x87=', b'\x87A', b'\x87A', b'\x87_', b'\x87_', b'\x87b', b'\x87b', b'\x87d',
+    b'\x87d', b'\x87f', b'\x87f', b'\x87g', b'\x87g', b'\x87h', b'\x87h', b'\x87l', b'\x87l',
+    b'\x87m', b'\x87m', b'\x87n', b'\x87n', b'\x87p', b'\x87p', b'\x87r', b'\x87r', b'\x87u',
+    b'\x87u', b'\x87:', b'\x87B', b'\x87C', b'\x87D', b'\x87E', b'\x87F', b'\x87G', b'\x87H',
+    b'\x87I', b'\x87J', b'\x87K', b'\x87L', b'\x87M', b'\x87N', b'\x87O', b'\x87P', b'\x87Q',
+    b'\x87R', b'\x87S', b'\x87T', b'\x87U', b'\x87V', b'\x87W', b'\x87Y', b'\x87j', b'\x87k',
+    b'\x87q', b'\x87v', b'\x87w', b'\x87x', b'\x87y', b'\x87z', b'\x87', b'\x87', b'\x87', b'\x87',
+    b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x95', b'\x95',
+    b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x96', b'\x96', b'\x96', b'\x96',
+    b'\x96', b'\x96', b'\x96', b'\x96', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97',
+    b'\x97', b'\x97', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9e', b'\x9e', b'\x9e', b'\x9e',
+    b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa5', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xae', b'\xae',
+    b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xaf', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb4', b'\xb4', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbf', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5',
+    b'\xc5', b'\xc5', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\t', b'\t', b'\t',
+    b'\t', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x90', b'\x90', b'\x90', b'\x90', b'\x91', b'\x91',
+    b'\x91', b'\x91', b'\x94', b'\x94', b'\x94', b'\x94', b'\x9f', b'\x9f', b'\x9f', b'\x9f',
+    b'\xab', b'\xab', b'\xab', b'\xab', b'\xce', b'\xce', b'\xce', b'\xce', b'\xd7', b'\xd7',
+    b'\xd7', b'\xd7', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xec', b'\xec', b'\xec', b'\xec',
+    b'\xed', b'\xed', b'\xed', b'\xed', b'\xc7', b'\xc7', b'\xcf', b'\xcf', b'\xea', b'\xea',
+    b'\xeb', b'\xeb', b'\xc0', b'\xc1', b'\xc8', b'\xc9', b'\xca', b'\xcd', b'\xd2', b'\xd5',
+    b'\xda', b'\xdb', b'\xee', b'\xf0', b'\xf2', b'\xf3', b'\xff', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'\xbc', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xc5', b'\xc5',
+    b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5',
+    b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t',
+    b'\t', b'\t', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x90',
+    b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x91', b'\x91', b'\x91',
+    b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94',
+    b'\x94', b'\x94', b'\x94', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f',
+    b'\x9f', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xce',
+    b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xd7', b'\xd7', b'\xd7',
+    b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1',
+    b'\xe1', b'\xe1', b'\xe1', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec',
+    b'\xec', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xc0', b'\xc0', b'\xc1', b'\xc1', b'\xc8',
+    b'\xc8', b'\xc9', b'\xc9', b'\xca', b'\xca', b'\xcd', b'\xcd', b'\xd2', b'\xd2', b'\xd5',
+    b'\xd5', b'\xda', b'\xda', b'\xdb', b'\xdb', b'\xee', b'\xee', b'\xf0', b'\xf0', b'\xf2',
+    b'\xf2', b'\xf3', b'\xf3', b'\xff', b'\xff', b'\xcb', b'\xcc', b'\xd3', b'\xd4', b'\xd6',
+    b'\xdd', b'\xde', b'\xdf', b'\xf1', b'\xf4', b'\xf5', b'\xf6', b'\xf7', b'\xf8', b'\xfa',
+    b'\xfb', b'\xfc', b'\xfd', b'\xfe', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab',
+    b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xce', b'\xce', b'\xce',
+    b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce',
+    b'\xce', b'\xce', b'\xce', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7',
+    b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xe1',
+    b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1',
+    b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec',
+    b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec',
+    b'\xec', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed',
+    b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xc0',
+    b'\xc0', b'\xc0', b'\xc0', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc8', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xca', b'\xca', b'\xca', b'\xca', b'\xcd',
+    b'\xcd', b'\xcd', b'\xcd', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd5', b'\xd5', b'\xd5',
+    b'\xd5', b'\xda', b'\xda', b'\xda', b'\xda', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xee',
+    b'\xee', b'\xee', b'\xee', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xff', b'\xff', b'\xff', b'\xff', b'\xcb',
+    b'\xcb', b'\xcc', b'\xcc', b'\xd3', b'\xd3', b'\xd4', b'\xd4', b'\xd6', b'\xd6', b'\xdd',
+    b'\xdd', b'\xde', b'\xde', b'\xdf', b'\xdf', b'\xf1', b'\xf1', b'\xf4', b'\xf4', b'\xf5',
+    b'\xf5', b'\xf6', b'\xf6', b'\xf7', b'\xf7', b'\xf8', b'\xf8', b'\xfa', b'\xfa', b'\xfb',
+    b'\xfb', b'\xfc', b'\xfc', b'\xfd', b'\xfd', b'\xfe', b'\xfe', b'\x02', b'\x03', b'\x04',
+    b'\x05', b'\x06', b'\x07', b'\x08', b'\x0b', b'\x0c', b'\x0e', b'\x0f', b'\x10', b'\x11',
+    b'\x12', b'\x13', b'\x14', b'\x15', b'\x17', b'\x18', b'\x19', b'\x1a', b'\x1b', b'\x1c',
+    b'\x1d', b'\x1e', b'\x1f', b'\x7f', b'\xdc', b'\xf9', b'', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1',
+    b'\xc1', b'\xc1', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xca', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2',
+    b'\xd2', b'\xd2', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5',
+    b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xdb', b'\xdb',
+    b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xee', b'\xee', b'\xee', b'\xee',
+    b'\xee', b'\xee', b'\xee', b'\xee', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0',
+    b'\xf0', b'\xf0', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xff', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xcb', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd4', b'\xd4',
+    b'\xd4', b'\xd4', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf8', b'\xf8',
+    b'\xf8', b'\xf8', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\x02', b'\x02', b'\x03', b'\x03', b'\x04', b'\x04', b'\x05', b'\x05',
+    b'\x06', b'\x06', b'\x07', b'\x07', b'\x08', b'\x08', b'\x0b', b'\x0b', b'\x0c', b'\x0c',
+    b'\x0e', b'\x0e', b'\x0f', b'\x0f', b'\x10', b'\x10', b'\x11', b'\x11', b'\x12', b'\x12',
+    b'\x13', b'\x13', b'\x14', b'\x14', b'\x15', b'\x15', b'\x17', b'\x17', b'\x18', b'\x18',
+    b'\x19', b'\x19', b'\x1a', b'\x1a', b'\x1b', b'\x1b', b'\x1c', b'\x1c', b'\x1d', b'\x1d',
+    b'\x1e', b'\x1e', b'\x1f', b'\x1f', b'\x7f', b'\x7f', b'\xdc', b'\xdc', b'\xf9', b'\xf9', b'',
+    b'', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd4', b'\xd4',
+    b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd6', b'\xd6', b'\xd6', b'\xd6',
+    b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xdd', b'\xdd', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde',
+    b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf5', b'\xf5', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf8', b'\xf8',
+    b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xfa', b'\xfa', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfb', b'\xfb', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc',
+    b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\x02', b'\x02', b'\x02', b'\x02',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x04', b'\x04', b'\x04', b'\x04', b'\x05', b'\x05',
+    b'\x05', b'\x05', b'\x06', b'\x06', b'\x06', b'\x06', b'\x07', b'\x07', b'\x07', b'\x07',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0c', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0f', b'\x0f', b'\x0f', b'\x0f',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x11', b'\x11', b'\x11', b'\x11', b'\x12', b'\x12',
+    b'\x12', b'\x12', b'\x13', b'\x13', b'\x13', b'\x13', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x15', b'\x15', b'\x15', b'\x15', b'\x17', b'\x17', b'\x17', b'\x17', b'\x18', b'\x18',
+    b'\x18', b'\x18', b'\x19', b'\x19', b'\x19', b'\x19', b'\x1a', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1d', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1f', b'\x1f', b'\x1f', b'\x1f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xf9', b'\xf9',
+    b'\xf9', b'\xf9', b'\n', b'\r', b'\x16', b'', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe',
+    b'\xfe', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x04', b'\x04', b'\x04',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05',
+    b'\x05', b'\x05', b'\x05', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0c', b'\x0c', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x0e', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x10',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x11', b'\x11', b'\x11',
+    b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12',
+    b'\x12', b'\x12', b'\x12', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13',
+    b'\x13', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x15',
+    b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x17', b'\x17', b'\x17',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x18', b'\x18', b'\x18', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19',
+    b'\x19', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1b',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1c', b'\x1c', b'\x1c',
+    b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1d', b'\x1d', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e',
+    b'\x1e', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x7f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\xdc', b'\xdc', b'\xdc',
+    b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\xf9', b'\xf9', b'\n', b'\n', b'\r', b'\r', b'\x16', b'\x16', b'', b'', b'\xfe0',
+    b'\xfe1', b'\xfe2', b'\xfea', b'\xfec', b'\xfee', b'\xfei', b'\xfeo', b'\xfes', b'\xfet',
+    b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02',
+    b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x03', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04',
+    b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05',
+    b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x06', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x06', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07',
+    b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x08', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x0e', b'\x0e', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f',
+    b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x10', b'\x10',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11',
+    b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11',
+    b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12',
+    b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\xfe0', b'\xfe0', b'\xfe1', b'\xfe1',
+    b'\xfe2', b'\xfe2', b'\xfea', b'\xfea', b'\xfec', b'\xfec', b'\xfee', b'\xfee', b'\xfei',
+    b'\xfei', b'\xfeo', b'\xfeo', b'\xfes', b'\xfes', b'\xfet', b'\xfet', b'\xfe ', b'\xfe%',
+    b'\xfe-', b'\xfe.', b'\xfe/', b'\xfe3', b'\xfe4', b'\xfe5', b'\xfe6', b'\xfe7', b'\xfe8',
+    b'\xfe9', b'\xfe=', b'\xfeA', b'\xfe_', b'\xfeb', b'\xfed', b'\xfef', b'\xfeg', b'\xfeh',
+    b'\xfel', b'\xfem', b'\xfen', b'\xfep', b'\xfer', b'\xfeu', b'\xfe', b'\xfe', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\xfe',
+    b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\x020', b'\x021', b'\x022', b'\x02a', b'\x02c', b'\x02e',
+    b'\x02i', b'\x02o', b'\x02s', b'\x02t', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02',
+    b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02',
+    b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x030', b'\x031', b'\x032', b'\x03a',
+    b'\x03c', b'\x03e', b'\x03i', b'\x03o', b'\x03s', b'\x03t', b'\x03', b'\x03', b'\x03', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x040', b'\x041',
+    b'\x042', b'\x04a', b'\x04c', b'\x04e', b'\x04i', b'\x04o', b'\x04s', b'\x04t', b'\x04',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04',
+    b'\x04', b'\x050', b'\x051', b'\x052', b'\x05a', b'\x05c', b'\x05e', b'\x05i', b'\x05o',
+    b'\x05s', b'\x05t', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05',
+    b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05',
+    b'\x05', b'\x05', b'\x05', b'\x05', b'\x060', b'\x061', b'\x062', b'\x06a', b'\x06c', b'\x06e',
+    b'\x06i', b'\x06o', b'\x06s', b'\x06t', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x070', b'\x071', b'\x072', b'\x07a',
+    b'\x07c', b'\x07e', b'\x07i', b'\x07o', b'\x07s', b'\x07t', b'\x07', b'\x07', b'\x07', b'\x07',
+    b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07',
+    b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\xfe0', b'\xfe0',
+    b'\xfe0', b'\xfe0', b'\xfe1', b'\xfe1', b'\xfe1', b'\xfe1', b'\xfe2', b'\xfe2', b'\xfe2',
+    b'\xfe2', b'\xfea', b'\xfea', b'\xfea', b'\xfea', b'\xfec', b'\xfec', b'\xfec', b'\xfec',
+    b'\xfee', b'\xfee', b'\xfee', b'\xfee', b'\xfei', b'\xfei', b'\xfei', b'\xfei', b'\xfeo',
+    b'\xfeo', b'\xfeo', b'\xfeo', b'\xfes', b'\xfes', b'\xfes', b'\xfes', b'\xfet', b'\xfet',
+    b'\xfet', b'\xfet', b'\xfe ', b'\xfe ', b'\xfe%', b'\xfe%', b'\xfe-', b'\xfe-', b'\xfe.',
+    b'\xfe.', b'\xfe/', b'\xfe/', b'\xfe3', b'\xfe3', b'\xfe4', b'\xfe4', b'\xfe5', b'\xfe5',
+    b'\xfe6', b'\xfe6', b'\xfe7', b'\xfe7', b'\xfe8', b'\xfe8', b'\xfe9', b'\xfe9', b'\xfe=',
+    b'\xfe=', b'\xfeA', b'\xfeA', b'\xfe_', b'\xfe_', b'\xfeb', b'\xfeb', b'\xfed', b'\xfed',
+    b'\xfef', b'\xfef', b'\xfeg', b'\xfeg', b'\xfeh', b'\xfeh', b'\xfel', b'\xfel', b'\xfem',
+    b'\xfem', b'\xfen', b'\xfen', b'\xfep', b'\xfep', b'\xfer', b'\xfer', b'\xfeu', b'\xfeu',
+    b'\xfe:', b'\xfeB', b'\xfeC', b'\xfeD', b'\xfeE', b'\xfeF', b'\xfeG', b'\xfeH', b'\xfeI',
+    b'\xfeJ', b'\xfeK', b'\xfeL', b'\xfeM', b'\xfeN', b'\xfeO', b'\xfeP', b'\xfeQ', b'\xfeR',
+    b'\xfeS', b'\xfeT', b'\xfeU', b'\xfeV', b'\xfeW', b'\xfeY', b'\xfej', b'\xfek', b'\xfeq',
+    b'\xfev', b'\xfew', b'\xfex', b'\xfey', b'\xfez', b'\xfe', b'\xfe', b'\xfe', b'\xfe', b'\x020',
+    b'\x020', b'\x021', b'\x021', b'\x022', b'\x022', b'\x02a', b'\x02a', b'\x02c', b'\x02c',
+    b'\x02e', b'\x02e', b'\x02i', b'\x02i', b'\x02o', b'\x02o', b'\x02s', b'\x02s', b'\x02t',
+    b'\x02t', b'\x02 ', b'\x02%', b'\x02-', b'\x02.', b'\x02/', b'\x023', b'\x024', b'\x025',
+    b'\x026', b'\x027', b'\x028', b'\x029', b'\x02=', b'\x02A', b'\x02_', b'\x02b', b'\x02d',
+    b'\x02f', b'\x02g', b'\x02h', b'\x02l', b'\x02m', b'\x02n', b'\x02p', b'\x02r', b'\x02u',
+    b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02',
+    b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x02', b'\x030', b'\x030',
+    b'\x031', b'\x031', b'\x032', b'\x032', b'\x03a', b'\x03a', b'\x03c', b'\x03c', b'\x03e',
+    b'\x03e', b'\x03i', b'\x03i', b'\x03o', b'\x03o', b'\x03s', b'\x03s', b'\x03t', b'\x03t',
+    b'\x03 ', b'\x03%', b'\x03-', b'\x03.', b'\x03/', b'\x033', b'\x034', b'\x035', b'\x036',
+    b'\x037', b'\x038', b'\x039', b'\x03=', b'\x03A', b'\x03_', b'\x03b', b'\x03d', b'\x03f',
+    b'\x03g', b'\x03h', b'\x03l', b'\x03m', b'\x03n', b'\x03p', b'\x03r', b'\x03u', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03',
+    b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x03', b'\x020', b'\x020', b'\x020',
+    b'\x020', b'\x021', b'\x021', b'\x021', b'\x021', b'\x022', b'\x022', b'\x022', b'\x022',
+    b'\x02a', b'\x02a', b'\x02a', b'\x02a', b'\x02c', b'\x02c', b'\x02c', b'\x02c', b'\x02e',
+    b'\x02e', b'\x02e', b'\x02e', b'\x02i', b'\x02i', b'\x02i', b'\x02i', b'\x02o', b'\x02o',
+    b'\x02o', b'\x02o', b'\x02s', b'\x02s', b'\x02s', b'\x02s', b'\x02t', b'\x02t', b'\x02t',
+    b'\x02t', b'\x02 ', b'\x02 ', b'\x02%', b'\x02%', b'\x02-', b'\x02-', b'\x02.', b'\x02.',
+    b'\x02/', b'\x02/', b'\x023', b'\x023', b'\x024', b'\x024', b'\x025', b'\x025', b'\x026',
+    b'\x026', b'\x027', b'\x027', b'\x028', b'\x028', b'\x029', b'\x029', b'\x02=', b'\x02=',
+    b'\x02A', b'\x02A', b'\x02_', b'\x02_', b'\x02b', b'\x02b', b'\x02d', b'\x02d', b'\x02f',
+    b'\x02f', b'\x02g', b'\x02g', b'\x02h', b'\x02h', b'\x02l', b'\x02l', b'\x02m', b'\x02m',
+    b'\x02n', b'\x02n', b'\x02p', b'\x02p', b'\x02r', b'\x02r', b'\x02u', b'\x02u', b'\x02:',
+    b'\x02B', b'\x02C', b'\x02D', b'\x02E', b'\x02F', b'\x02G', b'\x02H', b'\x02I', b'\x02J',
+    b'\x02K', b'\x02L', b'\x02M', b'\x02N', b'\x02O', b'\x02P', b'\x02Q', b'\x02R', b'\x02S',
+    b'\x02T', b'\x02U', b'\x02V', b'\x02W', b'\x02Y', b'\x02j', b'\x02k', b'\x02q', b'\x02v',
+    b'\x02w', b'\x02x', b'\x02y', b'\x02z', b'\x02', b'\x02', b'\x02', b'\x02', b'\x030', b'\x030',
+    b'\x030', b'\x030', b'\x031', b'\x031', b'\x031', b'\x031', b'\x032', b'\x032', b'\x032',
+    b'\x032', b'\x03a', b'\x03a', b'\x03a', b'\x03a', b'\x03c', b'\x03c', b'\x03c', b'\x03c',
+    b'\x03e', b'\x03e', b'\x03e', b'\x03e', b'\x03i', b'\x03i', b'\x03i', b'\x03i', b'\x03o',
+    b'\x03o', b'\x03o', b'\x03o', b'\x03s', b'\x03s', b'\x03s', b'\x03s', b'\x03t', b'\x03t',
+    b'\x03t', b'\x03t', b'\x03 ', b'\x03 ', b'\x03%', b'\x03%', b'\x03-', b'\x03-', b'\x03.',
+    b'\x03.', b'\x03/', b'\x03/', b'\x033', b'\x033', b'\x034', b'\x034', b'\x035', b'\x035',
+    b'\x036', b'\x036', b'\x037', b'\x037', b'\x038', b'\x038', b'\x039', b'\x039', b'\x03=',
+    b'\x03=', b'\x03A', b'\x03A', b'\x03_', b'\x03_', b'\x03b', b'\x03b', b'\x03d', b'\x03d',
+    b'\x03f', b'\x03f', b'\x03g', b'\x03g', b'\x03h', b'\x03h', b'\x03l', b'\x03l', b'\x03m',
+    b'\x03m', b'\x03n', b'\x03n', b'\x03p', b'\x03p', b'\x03r', b'\x03r', b'\x03u', b'\x03u',
+    b'\x03:', b'\x03B', b'\x03C', b'\x03D', b'\x03E', b'\x03F', b'\x03G', b'\x03H', b'\x03I',
+    b'\x03J', b'\x03K', b'\x03L', b'\x03M', b'\x03N', b'\x03O', b'\x03P', b'\x03Q', b'\x03R',
+    b'\x03S', b'\x03T', b'\x03U', b'\x03V', b'\x03W', b'\x03Y', b'\x03j', b'\x03k', b'\x03q',
+    b'\x03v', b'\x03w', b'\x03x', b'\x03y', b'\x03z', b'\x03', b'\x03', b'\x03', b'\x03', b'\x040',
+    b'\x040', b'\x041', b'\x041', b'\x042', b'\x042', b'\x04a', b'\x04a', b'\x04c', b'\x04c',
+    b'\x04e', b'\x04e', b'\x04i', b'\x04i', b'\x04o', b'\x04o', b'\x04s', b'\x04s', b'\x04t',
+    b'\x04t', b'\x04 ', b'\x04%', b'\x04-', b'\x04.', b'\x04/', b'\x043', b'\x044', b'\x045',
+    b'\x046', b'\x047', b'\x048', b'\x049', b'\x04=', b'\x04A', b'\x04_', b'\x04b', b'\x04d',
+    b'\x04f', b'\x04g', b'\x04h', b'\x04l', b'\x04m', b'\x04n', b'\x04p', b'\x04r', b'\x04u',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x04', b'\x050', b'\x050',
+    b'\x051', b'\x051', b'\x052', b'\x052', b'\x05a', b'\x05a', b'\x05c', b'\x05c', b'\x05e',
+    b'\x05e', b'\x05i', b'\x05i', b'\x05o', b'\x05o', b'\x05s', b'\x05s', b'\x05t', b'\x05t',
+    b'\x05 ', b'\x05%', b'\x05-', b'\x05.', b'\x05/', b'\x053', b'\x054', b'\x055', b'\x056',
+    b'\x057', b'\x058', b'\x059', b'\x05=', b'\x05A', b'\x05_', b'\x05b', b'\x05d', b'\x05f',
+    b'\x05g', b'\x05h', b'\x05l', b'\x05m', b'\x05n', b'\x05p', b'\x05r', b'\x05u', b'\x05',
+    b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05',
+    b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x05', b'\x060', b'\x060', b'\x061',
+    b'\x061', b'\x062', b'\x062', b'\x06a', b'\x06a', b'\x06c', b'\x06c', b'\x06e', b'\x06e',
+    b'\x06i', b'\x06i', b'\x06o', b'\x06o', b'\x06s', b'\x06s', b'\x06t', b'\x06t', b'\x06 ',
+    b'\x06%', b'\x06-', b'\x06.', b'\x06/', b'\x063', b'\x064', b'\x065', b'\x066', b'\x067',
+    b'\x068', b'\x069', b'\x06=', b'\x06A', b'\x06_', b'\x06b', b'\x06d', b'\x06f', b'\x06g',
+    b'\x06h', b'\x06l', b'\x06m', b'\x06n', b'\x06p', b'\x06r', b'\x06u', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x06',
+    b'\x06', b'\x06', b'\x06', b'\x06', b'\x06', b'\x070', b'\x070', b'\x071', b'\x071', b'\x072',
+    b'\x072', b'\x07a', b'\x07a', b'\x07c', b'\x07c', b'\x07e', b'\x07e', b'\x07i', b'\x07i',
+    b'\x07o', b'\x07o', b'\x07s', b'\x07s', b'\x07t', b'\x07t', b'\x07 ', b'\x07%', b'\x07-',
+    b'\x07.', b'\x07/', b'\x073', b'\x074', b'\x075', b'\x076', b'\x077', b'\x078', b'\x079',
+    b'\x07=', b'\x07A', b'\x07_', b'\x07b', b'\x07d', b'\x07f', b'\x07g', b'\x07h', b'\x07l',
+    b'\x07m', b'\x07n', b'\x07p', b'\x07r', b'\x07u', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07',
+    b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07', b'\x07',
+    b'\x07', b'\x07', b'\x07', b'\x040', b'\x040', b'\x040', b'\x040', b'\x041', b'\x041', b'\x041',
+    b'\x041', b'\x042', b'\x042', b'\x042', b'\x042', b'\x04a', b'\x04a', b'\x04a', b'\x04a',
+    b'\x04c', b'\x04c', b'\x04c', b'\x04c', b'\x04e', b'\x04e', b'\x04e', b'\x04e', b'\x04i',
+    b'\x04i', b'\x04i', b'\x04i', b'\x04o', b'\x04o', b'\x04o', b'\x04o', b'\x04s', b'\x04s',
+    b'\x04s', b'\x04s', b'\x04t', b'\x04t', b'\x04t', b'\x04t', b'\x04 ', b'\x04 ', b'\x04%',
+    b'\x04%', b'\x04-', b'\x04-', b'\x04.', b'\x04.', b'\x04/', b'\x04/', b'\x043', b'\x043',
+    b'\x044', b'\x044', b'\x045', b'\x045', b'\x046', b'\x046', b'\x047', b'\x047', b'\x048',
+    b'\x048', b'\x049', b'\x049', b'\x04=', b'\x04=', b'\x04A', b'\x04A', b'\x04_', b'\x04_',
+    b'\x04b', b'\x04b', b'\x04d', b'\x04d', b'\x04f', b'\x04f', b'\x04g', b'\x04g', b'\x04h',
+    b'\x04h', b'\x04l', b'\x04l', b'\x04m', b'\x04m', b'\x04n', b'\x04n', b'\x04p', b'\x04p',
+    b'\x04r', b'\x04r', b'\x04u', b'\x04u', b'\x04:', b'\x04B', b'\x04C', b'\x04D', b'\x04E',
+    b'\x04F', b'\x04G', b'\x04H', b'\x04I', b'\x04J', b'\x04K', b'\x04L', b'\x04M', b'\x04N',
+    b'\x04O', b'\x04P', b'\x04Q', b'\x04R', b'\x04S', b'\x04T', b'\x04U', b'\x04V', b'\x04W',
+    b'\x04Y', b'\x04j', b'\x04k', b'\x04q', b'\x04v', b'\x04w', b'\x04x', b'\x04y', b'\x04z',
+    b'\x04', b'\x04', b'\x04', b'\x04', b'\x050', b'\x050', b'\x050', b'\x050', b'\x051', b'\x051',
+    b'\x051', b'\x051', b'\x052', b'\x052', b'\x052', b'\x052', b'\x05a', b'\x05a', b'\x05a',
+    b'\x05a', b'\x05c', b'\x05c', b'\x05c', b'\x05c', b'\x05e', b'\x05e', b'\x05e', b'\x05e',
+    b'\x05i', b'\x05i', b'\x05i', b'\x05i', b'\x05o', b'\x05o', b'\x05o', b'\x05o', b'\x05s',
+    b'\x05s', b'\x05s', b'\x05s', b'\x05t', b'\x05t', b'\x05t', b'\x05t', b'\x05 ', b'\x05 ',
+    b'\x05%', b'\x05%', b'\x05-', b'\x05-', b'\x05.', b'\x05.', b'\x05/', b'\x05/', b'\x053',
+    b'\x053', b'\x054', b'\x054', b'\x055', b'\x055', b'\x056', b'\x056', b'\x057', b'\x057',
+    b'\x058', b'\x058', b'\x059', b'\x059', b'\x05=', b'\x05=', b'\x05A', b'\x05A', b'\x05_',
+    b'\x05_', b'\x05b', b'\x05b', b'\x05d', b'\x05d', b'\x05f', b'\x05f', b'\x05g', b'\x05g',
+    b'\x05h', b'\x05h', b'\x05l', b'\x05l', b'\x05m', b'\x05m', b'\x05n', b'\x05n', b'\x05p',
+    b'\x05p', b'\x05r', b'\x05r', b'\x05u', b'\x05u', b'\x05:', b'\x05B', b'\x05C', b'\x05D',
+    b'\x05E', b'\x05F', b'\x05G', b'\x05H', b'\x05I', b'\x05J', b'\x05K', b'\x05L', b'\x05M',
+    b'\x05N', b'\x05O', b'\x05P', b'\x05Q', b'\x05R', b'\x05S', b'\x05T', b'\x05U', b'\x05V',
+    b'\x05W', b'\x05Y', b'\x05j', b'\x05k', b'\x05q', b'\x05v', b'\x05w', b'\x05x', b'\x05y',
+    b'\x05z', b'\x05', b'\x05', b'\x05', b'\x05', b'\x060', b'\x060', b'\x060', b'\x060', b'\x061',
+    b'\x061', b'\x061', b'\x061', b'\x062', b'\x062', b'\x062', b'\x062', b'\x06a', b'\x06a',
+    b'\x06a', b'\x06a', b'\x06c', b'\x06c', b'\x06c', b'\x06c', b'\x06e', b'\x06e', b'\x06e',
+    b'\x06e', b'\x06i', b'\x06i', b'\x06i', b'\x06i', b'\x06o', b'\x06o', b'\x06o', b'\x06o',
+    b'\x06s', b'\x06s', b'\x06s', b'\x06s', b'\x06t', b'\x06t', b'\x06t', b'\x06t', b'\x06 ',
+    b'\x06 ', b'\x06%', b'\x06%', b'\x06-', b'\x06-', b'\x06.', b'\x06.', b'\x06/', b'\x06/',
+    b'\x063', b'\x063', b'\x064', b'\x064', b'\x065', b'\x065', b'\x066', b'\x066', b'\x067',
+    b'\x067', b'\x068', b'\x068', b'\x069', b'\x069', b'\x06=', b'\x06=', b'\x06A', b'\x06A',
+    b'\x06_', b'\x06_', b'\x06b', b'\x06b', b'\x06d', b'\x06d', b'\x06f', b'\x06f', b'\x06g',
+    b'\x06g', b'\x06h', b'\x06h', b'\x06l', b'\x06l', b'\x06m', b'\x06m', b'\x06n', b'\x06n',
+    b'\x06p', b'\x06p', b'\x06r', b'\x06r', b'\x06u', b'\x06u', b'\x06:', b'\x06B', b'\x06C',
+    b'\x06D', b'\x06E', b'\x06F', b'\x06G', b'\x06H', b'\x06I', b'\x06J', b'\x06K', b'\x06L',
+    b'\x06M', b'\x06N', b'\x06O', b'\x06P', b'\x06Q', b'\x06R', b'\x06S', b'\x06T', b'\x06U',
+    b'\x06V', b'\x06W', b'\x06Y', b'\x06j', b'\x06k', b'\x06q', b'\x06v', b'\x06w', b'\x06x',
+    b'\x06y', b'\x06z', b'\x06', b'\x06', b'\x06', b'\x06', b'\x070', b'\x070', b'\x070', b'\x070',
+    b'\x071', b'\x071', b'\x071', b'\x071', b'\x072', b'\x072', b'\x072', b'\x072', b'\x07a',
+    b'\x07a', b'\x07a', b'\x07a', b'\x07c', b'\x07c', b'\x07c', b'\x07c', b'\x07e', b'\x07e',
+    b'\x07e', b'\x07e', b'\x07i', b'\x07i', b'\x07i', b'\x07i', b'\x07o', b'\x07o', b'\x07o',
+    b'\x07o', b'\x07s', b'\x07s', b'\x07s', b'\x07s', b'\x07t', b'\x07t', b'\x07t', b'\x07t',
+    b'\x07 ', b'\x07 ', b'\x07%', b'\x07%', b'\x07-', b'\x07-', b'\x07.', b'\x07.', b'\x07/',
+    b'\x07/', b'\x073', b'\x073', b'\x074', b'\x074', b'\x075', b'\x075', b'\x076', b'\x076',
+    b'\x077', b'\x077', b'\x078', b'\x078', b'\x079', b'\x079', b'\x07=', b'\x07=', b'\x07A',
+    b'\x07A', b'\x07_', b'\x07_', b'\x07b', b'\x07b', b'\x07d', b'\x07d', b'\x07f', b'\x07f',
+    b'\x07g', b'\x07g', b'\x07h', b'\x07h', b'\x07l', b'\x07l', b'\x07m', b'\x07m', b'\x07n',
+    b'\x07n', b'\x07p', b'\x07p', b'\x07r', b'\x07r', b'\x07u', b'\x07u', b'\x07:', b'\x07B',
+    b'\x07C', b'\x07D', b'\x07E', b'\x07F', b'\x07G', b'\x07H', b'\x07I', b'\x07J', b'\x07K',
+    b'\x07L', b'\x07M', b'\x07N', b'\x07O', b'\x07P', b'\x07Q', b'\x07R', b'\x07S', b'\x07T',
+    b'\x07U', b'\x07V', b'\x07W', b'\x07Y', b'\x07j', b'\x07k', b'\x07q', b'\x07v', b'\x07w',
+    b'\x07x', b'\x07y', b'\x07z', b'\x07', b'\x07', b'\x07', b'\x07', b'\x080', b'\x081', b'\x082',
+    b'\x08a', b'\x08c', b'\x08e', b'\x08i', b'\x08o', b'\x08s', b'\x08t', b'\x08', b'\x08', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x0b0',
+    b'\x0b1', b'\x0b2', b'\x0ba', b'\x0bc', b'\x0be', b'\x0bi', b'\x0bo', b'\x0bs', b'\x0bt',
+    b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0c0', b'\x0c1', b'\x0c2', b'\x0ca', b'\x0cc', b'\x0ce', b'\x0ci',
+    b'\x0co', b'\x0cs', b'\x0ct', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0e0', b'\x0e1', b'\x0e2', b'\x0ea', b'\x0ec',
+    b'\x0ee', b'\x0ei', b'\x0eo', b'\x0es', b'\x0et', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0f0', b'\x0f1', b'\x0f2',
+    b'\x0fa', b'\x0fc', b'\x0fe', b'\x0fi', b'\x0fo', b'\x0fs', b'\x0ft', b'\x0f', b'\x0f', b'\x0f',
+    b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f',
+    b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x100',
+    b'\x101', b'\x102', b'\x10a', b'\x10c', b'\x10e', b'\x10i', b'\x10o', b'\x10s', b'\x10t',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10',
+    b'\x10', b'\x10', b'\x110', b'\x111', b'\x112', b'\x11a', b'\x11c', b'\x11e', b'\x11i',
+    b'\x11o', b'\x11s', b'\x11t', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11',
+    b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11',
+    b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x120', b'\x121', b'\x122', b'\x12a', b'\x12c',
+    b'\x12e', b'\x12i', b'\x12o', b'\x12s', b'\x12t', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12',
+    b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12',
+    b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x080', b'\x080', b'\x081',
+    b'\x081', b'\x082', b'\x082', b'\x08a', b'\x08a', b'\x08c', b'\x08c', b'\x08e', b'\x08e',
+    b'\x08i', b'\x08i', b'\x08o', b'\x08o', b'\x08s', b'\x08s', b'\x08t', b'\x08t', b'\x08 ',
+    b'\x08%', b'\x08-', b'\x08.', b'\x08/', b'\x083', b'\x084', b'\x085', b'\x086', b'\x087',
+    b'\x088', b'\x089', b'\x08=', b'\x08A', b'\x08_', b'\x08b', b'\x08d', b'\x08f', b'\x08g',
+    b'\x08h', b'\x08l', b'\x08m', b'\x08n', b'\x08p', b'\x08r', b'\x08u', b'\x08', b'\x08', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x08',
+    b'\x08', b'\x08', b'\x08', b'\x08', b'\x08', b'\x0b0', b'\x0b0', b'\x0b1', b'\x0b1', b'\x0b2',
+    b'\x0b2', b'\x0ba', b'\x0ba', b'\x0bc', b'\x0bc', b'\x0be', b'\x0be', b'\x0bi', b'\x0bi',
+    b'\x0bo', b'\x0bo', b'\x0bs', b'\x0bs', b'\x0bt', b'\x0bt', b'\x0b ', b'\x0b%', b'\x0b-',
+    b'\x0b.', b'\x0b/', b'\x0b3', b'\x0b4', b'\x0b5', b'\x0b6', b'\x0b7', b'\x0b8', b'\x0b9',
+    b'\x0b=', b'\x0bA', b'\x0b_', b'\x0bb', b'\x0bd', b'\x0bf', b'\x0bg', b'\x0bh', b'\x0bl',
+    b'\x0bm', b'\x0bn', b'\x0bp', b'\x0br', b'\x0bu', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0b', b'\x0c0', b'\x0c0', b'\x0c1', b'\x0c1', b'\x0c2', b'\x0c2', b'\x0ca',
+    b'\x0ca', b'\x0cc', b'\x0cc', b'\x0ce', b'\x0ce', b'\x0ci', b'\x0ci', b'\x0co', b'\x0co',
+    b'\x0cs', b'\x0cs', b'\x0ct', b'\x0ct', b'\x0c ', b'\x0c%', b'\x0c-', b'\x0c.', b'\x0c/',
+    b'\x0c3', b'\x0c4', b'\x0c5', b'\x0c6', b'\x0c7', b'\x0c8', b'\x0c9', b'\x0c=', b'\x0cA',
+    b'\x0c_', b'\x0cb', b'\x0cd', b'\x0cf', b'\x0cg', b'\x0ch', b'\x0cl', b'\x0cm', b'\x0cn',
+    b'\x0cp', b'\x0cr', b'\x0cu', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0e0', b'\x0e0', b'\x0e1', b'\x0e1', b'\x0e2', b'\x0e2', b'\x0ea', b'\x0ea',
+    b'\x0ec', b'\x0ec', b'\x0ee', b'\x0ee', b'\x0ei', b'\x0ei', b'\x0eo', b'\x0eo', b'\x0es',
+    b'\x0es', b'\x0et', b'\x0et', b'\x0e ', b'\x0e%', b'\x0e-', b'\x0e.', b'\x0e/', b'\x0e3',
+    b'\x0e4', b'\x0e5', b'\x0e6', b'\x0e7', b'\x0e8', b'\x0e9', b'\x0e=', b'\x0eA', b'\x0e_',
+    b'\x0eb', b'\x0ed', b'\x0ef', b'\x0eg', b'\x0eh', b'\x0el', b'\x0em', b'\x0en', b'\x0ep',
+    b'\x0er', b'\x0eu', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e', b'\x0e',
+    b'\x080', b'\x080', b'\x080', b'\x080', b'\x081', b'\x081', b'\x081', b'\x081', b'\x082',
+    b'\x082', b'\x082', b'\x082', b'\x08a', b'\x08a', b'\x08a', b'\x08a', b'\x08c', b'\x08c',
+    b'\x08c', b'\x08c', b'\x08e', b'\x08e', b'\x08e', b'\x08e', b'\x08i', b'\x08i', b'\x08i',
+    b'\x08i', b'\x08o', b'\x08o', b'\x08o', b'\x08o', b'\x08s', b'\x08s', b'\x08s', b'\x08s',
+    b'\x08t', b'\x08t', b'\x08t', b'\x08t', b'\x08 ', b'\x08 ', b'\x08%', b'\x08%', b'\x08-',
+    b'\x08-', b'\x08.', b'\x08.', b'\x08/', b'\x08/', b'\x083', b'\x083', b'\x084', b'\x084',
+    b'\x085', b'\x085', b'\x086', b'\x086', b'\x087', b'\x087', b'\x088', b'\x088', b'\x089',
+    b'\x089', b'\x08=', b'\x08=', b'\x08A', b'\x08A', b'\x08_', b'\x08_', b'\x08b', b'\x08b',
+    b'\x08d', b'\x08d', b'\x08f', b'\x08f', b'\x08g', b'\x08g', b'\x08h', b'\x08h', b'\x08l',
+    b'\x08l', b'\x08m', b'\x08m', b'\x08n', b'\x08n', b'\x08p', b'\x08p', b'\x08r', b'\x08r',
+    b'\x08u', b'\x08u', b'\x08:', b'\x08B', b'\x08C', b'\x08D', b'\x08E', b'\x08F', b'\x08G',
+    b'\x08H', b'\x08I', b'\x08J', b'\x08K', b'\x08L', b'\x08M', b'\x08N', b'\x08O', b'\x08P',
+    b'\x08Q', b'\x08R', b'\x08S', b'\x08T', b'\x08U', b'\x08V', b'\x08W', b'\x08Y', b'\x08j',
+    b'\x08k', b'\x08q', b'\x08v', b'\x08w', b'\x08x', b'\x08y', b'\x08z', b'\x08', b'\x08', b'\x08',
+    b'\x08', b'\x0b0', b'\x0b0', b'\x0b0', b'\x0b0', b'\x0b1', b'\x0b1', b'\x0b1', b'\x0b1',
+    b'\x0b2', b'\x0b2', b'\x0b2', b'\x0b2', b'\x0ba', b'\x0ba', b'\x0ba', b'\x0ba', b'\x0bc',
+    b'\x0bc', b'\x0bc', b'\x0bc', b'\x0be', b'\x0be', b'\x0be', b'\x0be', b'\x0bi', b'\x0bi',
+    b'\x0bi', b'\x0bi', b'\x0bo', b'\x0bo', b'\x0bo', b'\x0bo', b'\x0bs', b'\x0bs', b'\x0bs',
+    b'\x0bs', b'\x0bt', b'\x0bt', b'\x0bt', b'\x0bt', b'\x0b ', b'\x0b ', b'\x0b%', b'\x0b%',
+    b'\x0b-', b'\x0b-', b'\x0b.', b'\x0b.', b'\x0b/', b'\x0b/', b'\x0b3', b'\x0b3', b'\x0b4',
+    b'\x0b4', b'\x0b5', b'\x0b5', b'\x0b6', b'\x0b6', b'\x0b7', b'\x0b7', b'\x0b8', b'\x0b8',
+    b'\x0b9', b'\x0b9', b'\x0b=', b'\x0b=', b'\x0bA', b'\x0bA', b'\x0b_', b'\x0b_', b'\x0bb',
+    b'\x0bb', b'\x0bd', b'\x0bd', b'\x0bf', b'\x0bf', b'\x0bg', b'\x0bg', b'\x0bh', b'\x0bh',
+    b'\x0bl', b'\x0bl', b'\x0bm', b'\x0bm', b'\x0bn', b'\x0bn', b'\x0bp', b'\x0bp', b'\x0br',
+    b'\x0br', b'\x0bu', b'\x0bu', b'\x0b:', b'\x0bB', b'\x0bC', b'\x0bD', b'\x0bE', b'\x0bF',
+    b'\x0bG', b'\x0bH', b'\x0bI', b'\x0bJ', b'\x0bK', b'\x0bL', b'\x0bM', b'\x0bN', b'\x0bO',
+    b'\x0bP', b'\x0bQ', b'\x0bR', b'\x0bS', b'\x0bT', b'\x0bU', b'\x0bV', b'\x0bW', b'\x0bY',
+    b'\x0bj', b'\x0bk', b'\x0bq', b'\x0bv', b'\x0bw', b'\x0bx', b'\x0by', b'\x0bz', b'\x0b',
+    b'\x0b', b'\x0b', b'\x0b', b'\xbc0', b'\xbc1', b'\xbc2', b'\xbca', b'\xbcc', b'\xbce', b'\xbci',
+    b'\xbco', b'\xbcs', b'\xbct', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbf0', b'\xbf1', b'\xbf2', b'\xbfa', b'\xbfc',
+    b'\xbfe', b'\xbfi', b'\xbfo', b'\xbfs', b'\xbft', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xc50', b'\xc51', b'\xc52',
+    b'\xc5a', b'\xc5c', b'\xc5e', b'\xc5i', b'\xc5o', b'\xc5s', b'\xc5t', b'\xc5', b'\xc5', b'\xc5',
+    b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5',
+    b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xe70',
+    b'\xe71', b'\xe72', b'\xe7a', b'\xe7c', b'\xe7e', b'\xe7i', b'\xe7o', b'\xe7s', b'\xe7t',
+    b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xe7', b'\xe7', b'\xef0', b'\xef1', b'\xef2', b'\xefa', b'\xefc', b'\xefe', b'\xefi',
+    b'\xefo', b'\xefs', b'\xeft', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t',
+    b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x8e', b'\x8e', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90',
+    b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x91',
+    b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91',
+    b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94',
+    b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94',
+    b'\x94', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f',
+    b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\xef0', b'\xef0', b'\xef1',
+    b'\xef1', b'\xef2', b'\xef2', b'\xefa', b'\xefa', b'\xefc', b'\xefc', b'\xefe', b'\xefe',
+    b'\xefi', b'\xefi', b'\xefo', b'\xefo', b'\xefs', b'\xefs', b'\xeft', b'\xeft', b'\xef ',
+    b'\xef%', b'\xef-', b'\xef.', b'\xef/', b'\xef3', b'\xef4', b'\xef5', b'\xef6', b'\xef7',
+    b'\xef8', b'\xef9', b'\xef=', b'\xefA', b'\xef_', b'\xefb', b'\xefd', b'\xeff', b'\xefg',
+    b'\xefh', b'\xefl', b'\xefm', b'\xefn', b'\xefp', b'\xefr', b'\xefu', b'\xef', b'\xef', b'\xef',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\xef',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\xef', b'\t0', b'\t1', b'\t2', b'\ta', b'\tc', b'\te',
+    b'\ti', b'\to', b'\ts', b'\tt', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t',
+    b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t',
+    b'\x8e0', b'\x8e1', b'\x8e2', b'\x8ea', b'\x8ec', b'\x8ee', b'\x8ei', b'\x8eo', b'\x8es',
+    b'\x8et', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x8e', b'\x8e', b'\x900', b'\x901', b'\x902', b'\x90a', b'\x90c', b'\x90e', b'\x90i',
+    b'\x90o', b'\x90s', b'\x90t', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90',
+    b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90',
+    b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x910', b'\x911', b'\x912', b'\x91a', b'\x91c',
+    b'\x91e', b'\x91i', b'\x91o', b'\x91s', b'\x91t', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91',
+    b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91',
+    b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x940', b'\x941', b'\x942',
+    b'\x94a', b'\x94c', b'\x94e', b'\x94i', b'\x94o', b'\x94s', b'\x94t', b'\x94', b'\x94', b'\x94',
+    b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94',
+    b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x9f0',
+    b'\x9f1', b'\x9f2', b'\x9fa', b'\x9fc', b'\x9fe', b'\x9fi', b'\x9fo', b'\x9fs', b'\x9ft',
+    b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f',
+    b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f',
+    b'\x9f', b'\x9f', b'\xef0', b'\xef0', b'\xef0', b'\xef0', b'\xef1', b'\xef1', b'\xef1',
+    b'\xef1', b'\xef2', b'\xef2', b'\xef2', b'\xef2', b'\xefa', b'\xefa', b'\xefa', b'\xefa',
+    b'\xefc', b'\xefc', b'\xefc', b'\xefc', b'\xefe', b'\xefe', b'\xefe', b'\xefe', b'\xefi',
+    b'\xefi', b'\xefi', b'\xefi', b'\xefo', b'\xefo', b'\xefo', b'\xefo', b'\xefs', b'\xefs',
+    b'\xefs', b'\xefs', b'\xeft', b'\xeft', b'\xeft', b'\xeft', b'\xef ', b'\xef ', b'\xef%',
+    b'\xef%', b'\xef-', b'\xef-', b'\xef.', b'\xef.', b'\xef/', b'\xef/', b'\xef3', b'\xef3',
+    b'\xef4', b'\xef4', b'\xef5', b'\xef5', b'\xef6', b'\xef6', b'\xef7', b'\xef7', b'\xef8',
+    b'\xef8', b'\xef9', b'\xef9', b'\xef=', b'\xef=', b'\xefA', b'\xefA', b'\xef_', b'\xef_',
+    b'\xefb', b'\xefb', b'\xefd', b'\xefd', b'\xeff', b'\xeff', b'\xefg', b'\xefg', b'\xefh',
+    b'\xefh', b'\xefl', b'\xefl', b'\xefm', b'\xefm', b'\xefn', b'\xefn', b'\xefp', b'\xefp',
+    b'\xefr', b'\xefr', b'\xefu', b'\xefu', b'\xef:', b'\xefB', b'\xefC', b'\xefD', b'\xefE',
+    b'\xefF', b'\xefG', b'\xefH', b'\xefI', b'\xefJ', b'\xefK', b'\xefL', b'\xefM', b'\xefN',
+    b'\xefO', b'\xefP', b'\xefQ', b'\xefR', b'\xefS', b'\xefT', b'\xefU', b'\xefV', b'\xefW',
+    b'\xefY', b'\xefj', b'\xefk', b'\xefq', b'\xefv', b'\xefw', b'\xefx', b'\xefy', b'\xefz',
+    b'\xef', b'\xef', b'\xef', b'\xef', b'\t0', b'\t0', b'\t1', b'\t1', b'\t2', b'\t2', b'\ta',
+    b'\ta', b'\tc', b'\tc', b'\te', b'\te', b'\ti', b'\ti', b'\to', b'\to', b'\ts', b'\ts', b'\tt',
+    b'\tt', b'\t ', b'\t%', b'\t-', b'\t.', b'\t/', b'\t3', b'\t4', b'\t5', b'\t6', b'\t7', b'\t8',
+    b'\t9', b'\t=', b'\tA', b'\t_', b'\tb', b'\td', b'\tf', b'\tg', b'\th', b'\tl', b'\tm', b'\tn',
+    b'\tp', b'\tr', b'\tu', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t',
+    b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\t', b'\x8e0', b'\x8e0', b'\x8e1', b'\x8e1',
+    b'\x8e2', b'\x8e2', b'\x8ea', b'\x8ea', b'\x8ec', b'\x8ec', b'\x8ee', b'\x8ee', b'\x8ei',
+    b'\x8ei', b'\x8eo', b'\x8eo', b'\x8es', b'\x8es', b'\x8et', b'\x8et', b'\x8e ', b'\x8e%',
+    b'\x8e-', b'\x8e.', b'\x8e/', b'\x8e3', b'\x8e4', b'\x8e5', b'\x8e6', b'\x8e7', b'\x8e8',
+    b'\x8e9', b'\x8e=', b'\x8eA', b'\x8e_', b'\x8eb', b'\x8ed', b'\x8ef', b'\x8eg', b'\x8eh',
+    b'\x8el', b'\x8em', b'\x8en', b'\x8ep', b'\x8er', b'\x8eu', b'\x8e', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x8e', b'\x8e', b'\x8e', b'\t0', b'\t0', b'\t0', b'\t0', b'\t1', b'\t1', b'\t1',
+    b'\t1', b'\t2', b'\t2', b'\t2', b'\t2', b'\ta', b'\ta', b'\ta', b'\ta', b'\tc', b'\tc', b'\tc',
+    b'\tc', b'\te', b'\te', b'\te', b'\te', b'\ti', b'\ti', b'\ti', b'\ti', b'\to', b'\to', b'\to',
+    b'\to', b'\ts', b'\ts', b'\ts', b'\ts', b'\tt', b'\tt', b'\tt', b'\tt', b'\t ', b'\t ', b'\t%',
+    b'\t%', b'\t-', b'\t-', b'\t.', b'\t.', b'\t/', b'\t/', b'\t3', b'\t3', b'\t4', b'\t4', b'\t5',
+    b'\t5', b'\t6', b'\t6', b'\t7', b'\t7', b'\t8', b'\t8', b'\t9', b'\t9', b'\t=', b'\t=', b'\tA',
+    b'\tA', b'\t_', b'\t_', b'\tb', b'\tb', b'\td', b'\td', b'\tf', b'\tf', b'\tg', b'\tg', b'\th',
+    b'\th', b'\tl', b'\tl', b'\tm', b'\tm', b'\tn', b'\tn', b'\tp', b'\tp', b'\tr', b'\tr', b'\tu',
+    b'\tu', b'\t:', b'\tB', b'\tC', b'\tD', b'\tE', b'\tF', b'\tG', b'\tH', b'\tI', b'\tJ', b'\tK',
+    b'\tL', b'\tM', b'\tN', b'\tO', b'\tP', b'\tQ', b'\tR', b'\tS', b'\tT', b'\tU', b'\tV', b'\tW',
+    b'\tY', b'\tj', b'\tk', b'\tq', b'\tv', b'\tw', b'\tx', b'\ty', b'\tz', b'\t', b'\t', b'\t',
+    b'\t', b'\x8e0', b'\x8e0', b'\x8e0', b'\x8e0', b'\x8e1', b'\x8e1', b'\x8e1', b'\x8e1', b'\x8e2',
+    b'\x8e2', b'\x8e2', b'\x8e2', b'\x8ea', b'\x8ea', b'\x8ea', b'\x8ea', b'\x8ec', b'\x8ec',
+    b'\x8ec', b'\x8ec', b'\x8ee', b'\x8ee', b'\x8ee', b'\x8ee', b'\x8ei', b'\x8ei', b'\x8ei',
+    b'\x8ei', b'\x8eo', b'\x8eo', b'\x8eo', b'\x8eo', b'\x8es', b'\x8es', b'\x8es', b'\x8es',
+    b'\x8et', b'\x8et', b'\x8et', b'\x8et', b'\x8e ', b'\x8e ', b'\x8e%', b'\x8e%', b'\x8e-',
+    b'\x8e-', b'\x8e.', b'\x8e.', b'\x8e/', b'\x8e/', b'\x8e3', b'\x8e3', b'\x8e4', b'\x8e4',
+    b'\x8e5', b'\x8e5', b'\x8e6', b'\x8e6', b'\x8e7', b'\x8e7', b'\x8e8', b'\x8e8', b'\x8e9',
+    b'\x8e9', b'\x8e=', b'\x8e=', b'\x8eA', b'\x8eA', b'\x8e_', b'\x8e_', b'\x8eb', b'\x8eb',
+    b'\x8ed', b'\x8ed', b'\x8ef', b'\x8ef', b'\x8eg', b'\x8eg', b'\x8eh', b'\x8eh', b'\x8el',
+    b'\x8el', b'\x8em', b'\x8em', b'\x8en', b'\x8en', b'\x8ep', b'\x8ep', b'\x8er', b'\x8er',
+    b'\x8eu', b'\x8eu', b'\x8e:', b'\x8eB', b'\x8eC', b'\x8eD', b'\x8eE', b'\x8eF', b'\x8eG',
+    b'\x8eH', b'\x8eI', b'\x8eJ', b'\x8eK', b'\x8eL', b'\x8eM', b'\x8eN', b'\x8eO', b'\x8eP',
+    b'\x8eQ', b'\x8eR', b'\x8eS', b'\x8eT', b'\x8eU', b'\x8eV', b'\x8eW', b'\x8eY', b'\x8ej',
+    b'\x8ek', b'\x8eq', b'\x8ev', b'\x8ew', b'\x8ex', b'\x8ey', b'\x8ez', b'\x8e', b'\x8e', b'\x8e',
+    b'\x8e', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13',
+    b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x14', b'\x14', b'\x14',
+    b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x14', b'\x14', b'\x14', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15',
+    b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x17',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x18', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19',
+    b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1a', b'\x1a', b'\x1a', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1c',
+    b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c',
+    b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e',
+    b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1f', b'\x1f', b'\x1f',
+    b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f',
+    b'\x1f', b'\x1f', b'\x1f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\xdc',
+    b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc',
+    b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\n', b'\n', b'\n', b'\n', b'\r', b'\r', b'\r', b'\r', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'', b'', b'', b'', b'\x1c0', b'\x1c1', b'\x1c2', b'\x1ca', b'\x1cc', b'\x1ce',
+    b'\x1ci', b'\x1co', b'\x1cs', b'\x1ct', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c',
+    b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c',
+    b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1d0', b'\x1d1', b'\x1d2', b'\x1da',
+    b'\x1dc', b'\x1de', b'\x1di', b'\x1do', b'\x1ds', b'\x1dt', b'\x1d', b'\x1d', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1e0', b'\x1e1',
+    b'\x1e2', b'\x1ea', b'\x1ec', b'\x1ee', b'\x1ei', b'\x1eo', b'\x1es', b'\x1et', b'\x1e',
+    b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e',
+    b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e',
+    b'\x1e', b'\x1f0', b'\x1f1', b'\x1f2', b'\x1fa', b'\x1fc', b'\x1fe', b'\x1fi', b'\x1fo',
+    b'\x1fs', b'\x1ft', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f',
+    b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f',
+    b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x7f0', b'\x7f1', b'\x7f2', b'\x7fa', b'\x7fc', b'\x7fe',
+    b'\x7fi', b'\x7fo', b'\x7fs', b'\x7ft', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\xdc0', b'\xdc1', b'\xdc2', b'\xdca',
+    b'\xdcc', b'\xdce', b'\xdci', b'\xdco', b'\xdcs', b'\xdct', b'\xdc', b'\xdc', b'\xdc', b'\xdc',
+    b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc',
+    b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xf90', b'\xf91',
+    b'\xf92', b'\xf9a', b'\xf9c', b'\xf9e', b'\xf9i', b'\xf9o', b'\xf9s', b'\xf9t', b'\xf9',
+    b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\r', b'\r', b'\r', b'\r',
+    b'\r', b'\r', b'\r', b'\r', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'', b'', b'', b'', b'', b'', b'', b'', b'\x7f0', b'\x7f0', b'\x7f1', b'\x7f1',
+    b'\x7f2', b'\x7f2', b'\x7fa', b'\x7fa', b'\x7fc', b'\x7fc', b'\x7fe', b'\x7fe', b'\x7fi',
+    b'\x7fi', b'\x7fo', b'\x7fo', b'\x7fs', b'\x7fs', b'\x7ft', b'\x7ft', b'\x7f ', b'\x7f%',
+    b'\x7f-', b'\x7f.', b'\x7f/', b'\x7f3', b'\x7f4', b'\x7f5', b'\x7f6', b'\x7f7', b'\x7f8',
+    b'\x7f9', b'\x7f=', b'\x7fA', b'\x7f_', b'\x7fb', b'\x7fd', b'\x7ff', b'\x7fg', b'\x7fh',
+    b'\x7fl', b'\x7fm', b'\x7fn', b'\x7fp', b'\x7fr', b'\x7fu', b'\x7f', b'\x7f', b'\x7f', b'\x7f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\x7f',
+    b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\xdc0', b'\xdc0', b'\xdc1', b'\xdc1', b'\xdc2', b'\xdc2',
+    b'\xdca', b'\xdca', b'\xdcc', b'\xdcc', b'\xdce', b'\xdce', b'\xdci', b'\xdci', b'\xdco',
+    b'\xdco', b'\xdcs', b'\xdcs', b'\xdct', b'\xdct', b'\xdc ', b'\xdc%', b'\xdc-', b'\xdc.',
+    b'\xdc/', b'\xdc3', b'\xdc4', b'\xdc5', b'\xdc6', b'\xdc7', b'\xdc8', b'\xdc9', b'\xdc=',
+    b'\xdcA', b'\xdc_', b'\xdcb', b'\xdcd', b'\xdcf', b'\xdcg', b'\xdch', b'\xdcl', b'\xdcm',
+    b'\xdcn', b'\xdcp', b'\xdcr', b'\xdcu', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc',
+    b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xdc',
+    b'\xdc', b'\xdc', b'\xf90', b'\xf90', b'\xf91', b'\xf91', b'\xf92', b'\xf92', b'\xf9a',
+    b'\xf9a', b'\xf9c', b'\xf9c', b'\xf9e', b'\xf9e', b'\xf9i', b'\xf9i', b'\xf9o', b'\xf9o',
+    b'\xf9s', b'\xf9s', b'\xf9t', b'\xf9t', b'\xf9 ', b'\xf9%', b'\xf9-', b'\xf9.', b'\xf9/',
+    b'\xf93', b'\xf94', b'\xf95', b'\xf96', b'\xf97', b'\xf98', b'\xf99', b'\xf9=', b'\xf9A',
+    b'\xf9_', b'\xf9b', b'\xf9d', b'\xf9f', b'\xf9g', b'\xf9h', b'\xf9l', b'\xf9m', b'\xf9n',
+    b'\xf9p', b'\xf9r', b'\xf9u', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n',
+    b'\n', b'\n', b'\n', b'\n', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r',
+    b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'\xf90', b'\xf90', b'\xf90', b'\xf90', b'\xf91', b'\xf91', b'\xf91', b'\xf91', b'\xf92',
+    b'\xf92', b'\xf92', b'\xf92', b'\xf9a', b'\xf9a', b'\xf9a', b'\xf9a', b'\xf9c', b'\xf9c',
+    b'\xf9c', b'\xf9c', b'\xf9e', b'\xf9e', b'\xf9e', b'\xf9e', b'\xf9i', b'\xf9i', b'\xf9i',
+    b'\xf9i', b'\xf9o', b'\xf9o', b'\xf9o', b'\xf9o', b'\xf9s', b'\xf9s', b'\xf9s', b'\xf9s',
+    b'\xf9t', b'\xf9t', b'\xf9t', b'\xf9t', b'\xf9 ', b'\xf9 ', b'\xf9%', b'\xf9%', b'\xf9-',
+    b'\xf9-', b'\xf9.', b'\xf9.', b'\xf9/', b'\xf9/', b'\xf93', b'\xf93', b'\xf94', b'\xf94',
+    b'\xf95', b'\xf95', b'\xf96', b'\xf96', b'\xf97', b'\xf97', b'\xf98', b'\xf98', b'\xf99',
+    b'\xf99', b'\xf9=', b'\xf9=', b'\xf9A', b'\xf9A', b'\xf9_', b'\xf9_', b'\xf9b', b'\xf9b',
+    b'\xf9d', b'\xf9d', b'\xf9f', b'\xf9f', b'\xf9g', b'\xf9g', b'\xf9h', b'\xf9h', b'\xf9l',
+    b'\xf9l', b'\xf9m', b'\xf9m', b'\xf9n', b'\xf9n', b'\xf9p', b'\xf9p', b'\xf9r', b'\xf9r',
+    b'\xf9u', b'\xf9u', b'\xf9:', b'\xf9B', b'\xf9C', b'\xf9D', b'\xf9E', b'\xf9F', b'\xf9G',
+    b'\xf9H', b'\xf9I', b'\xf9J', b'\xf9K', b'\xf9L', b'\xf9M', b'\xf9N', b'\xf9O', b'\xf9P',
+    b'\xf9Q', b'\xf9R', b'\xf9S', b'\xf9T', b'\xf9U', b'\xf9V', b'\xf9W', b'\xf9Y', b'\xf9j',
+    b'\xf9k', b'\xf9q', b'\xf9v', b'\xf9w', b'\xf9x', b'\xf9y', b'\xf9z', b'\xf9', b'\xf9', b'\xf9',
+    b'\xf9', b'\n0', b'\n1', b'\n2', b'\na', b'\nc', b'\ne', b'\ni', b'\no', b'\ns', b'\nt', b'\n',
+    b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n',
+    b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\r0', b'\r1', b'\r2', b'\ra', b'\rc',
+    b'\re', b'\ri', b'\ro', b'\rs', b'\rt', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r',
+    b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r',
+    b'\r', b'\x160', b'\x161', b'\x162', b'\x16a', b'\x16c', b'\x16e', b'\x16i', b'\x16o', b'\x16s',
+    b'\x16t', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'\x16', b'\x16', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'\n0', b'\n0', b'\n1', b'\n1', b'\n2', b'\n2', b'\na', b'\na', b'\nc', b'\nc', b'\ne', b'\ne',
+    b'\ni', b'\ni', b'\no', b'\no', b'\ns', b'\ns', b'\nt', b'\nt', b'\n ', b'\n%', b'\n-', b'\n.',
+    b'\n/', b'\n3', b'\n4', b'\n5', b'\n6', b'\n7', b'\n8', b'\n9', b'\n=', b'\nA', b'\n_', b'\nb',
+    b'\nd', b'\nf', b'\ng', b'\nh', b'\nl', b'\nm', b'\nn', b'\np', b'\nr', b'\nu', b'\n', b'\n',
+    b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n', b'\n',
+    b'\n', b'\n', b'\n', b'\r0', b'\r0', b'\r1', b'\r1', b'\r2', b'\r2', b'\ra', b'\ra', b'\rc',
+    b'\rc', b'\re', b'\re', b'\ri', b'\ri', b'\ro', b'\ro', b'\rs', b'\rs', b'\rt', b'\rt', b'\r ',
+    b'\r%', b'\r-', b'\r.', b'\r/', b'\r3', b'\r4', b'\r5', b'\r6', b'\r7', b'\r8', b'\r9', b'\r=',
+    b'\rA', b'\r_', b'\rb', b'\rd', b'\rf', b'\rg', b'\rh', b'\rl', b'\rm', b'\rn', b'\rp', b'\rr',
+    b'\ru', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\r',
+    b'\r', b'\r', b'\r', b'\r', b'\r', b'\r', b'\x160', b'\x160', b'\x161', b'\x161', b'\x162',
+    b'\x162', b'\x16a', b'\x16a', b'\x16c', b'\x16c', b'\x16e', b'\x16e', b'\x16i', b'\x16i',
+    b'\x16o', b'\x16o', b'\x16s', b'\x16s', b'\x16t', b'\x16t', b'\x16 ', b'\x16%', b'\x16-',
+    b'\x16.', b'\x16/', b'\x163', b'\x164', b'\x165', b'\x166', b'\x167', b'\x168', b'\x169',
+    b'\x16=', b'\x16A', b'\x16_', b'\x16b', b'\x16d', b'\x16f', b'\x16g', b'\x16h', b'\x16l',
+    b'\x16m', b'\x16n', b'\x16p', b'\x16r', b'\x16u', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16', b'\x16',
+    b'\x16', b'\x16', b'\x16', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'\n0', b'\n0', b'\n0', b'\n0',
+    b'\n1', b'\n1', b'\n1', b'\n1', b'\n2', b'\n2', b'\n2', b'\n2', b'\na', b'\na', b'\na', b'\na',
+    b'\nc', b'\nc', b'\nc', b'\nc', b'\ne', b'\ne', b'\ne', b'\ne', b'\ni', b'\ni', b'\ni', b'\ni',
+    b'\no', b'\no', b'\no', b'\no', b'\ns', b'\ns', b'\ns', b'\ns', b'\nt', b'\nt', b'\nt', b'\nt',
+    b'\n ', b'\n ', b'\n%', b'\n%', b'\n-', b'\n-', b'\n.', b'\n.', b'\n/', b'\n/', b'\n3', b'\n3',
+    b'\n4', b'\n4', b'\n5', b'\n5', b'\n6', b'\n6', b'\n7', b'\n7', b'\n8', b'\n8', b'\n9', b'\n9',
+    b'\n=', b'\n=', b'\nA', b'\nA', b'\n_', b'\n_', b'\nb', b'\nb', b'\nd', b'\nd', b'\nf', b'\nf',
+    b'\ng', b'\ng', b'\nh', b'\nh', b'\nl', b'\nl', b'\nm', b'\nm', b'\nn', b'\nn', b'\np', b'\np',
+    b'\nr', b'\nr', b'\nu', b'\nu', b'\n:', b'\nB', b'\nC', b'\nD', b'\nE', b'\nF', b'\nG', b'\nH',
+    b'\nI', b'\nJ', b'\nK', b'\nL', b'\nM', b'\nN', b'\nO', b'\nP', b'\nQ', b'\nR', b'\nS', b'\nT',
+    b'\nU', b'\nV', b'\nW', b'\nY', b'\nj', b'\nk', b'\nq', b'\nv', b'\nw', b'\nx', b'\ny', b'\nz',
+    b'\n', b'\n', b'\n', b'\n', b'\r0', b'\r0', b'\r0', b'\r0', b'\r1', b'\r1', b'\r1', b'\r1',
+    b'\r2', b'\r2', b'\r2', b'\r2', b'\ra', b'\ra', b'\ra', b'\ra', b'\rc', b'\rc', b'\rc', b'\rc',
+    b'\re', b'\re', b'\re', b'\re', b'\ri', b'\ri', b'\ri', b'\ri', b'\ro', b'\ro', b'\ro', b'\ro',
+    b'\rs', b'\rs', b'\rs', b'\rs', b'\rt', b'\rt', b'\rt', b'\rt', b'\r ', b'\r ', b'\r%', b'\r%',
+    b'\r-', b'\r-', b'\r.', b'\r.', b'\r/', b'\r/', b'\r3', b'\r3', b'\r4', b'\r4', b'\r5', b'\r5',
+    b'\r6', b'\r6', b'\r7', b'\r7', b'\r8', b'\r8', b'\r9', b'\r9', b'\r=', b'\r=', b'\rA', b'\rA',
+    b'\r_', b'\r_', b'\rb', b'\rb', b'\rd', b'\rd', b'\rf', b'\rf', b'\rg', b'\rg', b'\rh', b'\rh',
+    b'\rl', b'\rl', b'\rm', b'\rm', b'\rn', b'\rn', b'\rp', b'\rp', b'\rr', b'\rr', b'\ru', b'\ru',
+    b'\r:', b'\rB', b'\rC', b'\rD', b'\rE', b'\rF', b'\rG', b'\rH', b'\rI', b'\rJ', b'\rK', b'\rL',
+    b'\rM', b'\rN', b'\rO', b'\rP', b'\rQ', b'\rR', b'\rS', b'\rT', b'\rU', b'\rV', b'\rW', b'\rY',
+    b'\rj', b'\rk', b'\rq', b'\rv', b'\rw', b'\rx', b'\ry', b'\rz', b'\r', b'\r', b'\r', b'\r',
+    b'\x0c0', b'\x0c0', b'\x0c0', b'\x0c0', b'\x0c1', b'\x0c1', b'\x0c1', b'\x0c1', b'\x0c2',
+    b'\x0c2', b'\x0c2', b'\x0c2', b'\x0ca', b'\x0ca', b'\x0ca', b'\x0ca', b'\x0cc', b'\x0cc',
+    b'\x0cc', b'\x0cc', b'\x0ce', b'\x0ce', b'\x0ce', b'\x0ce', b'\x0ci', b'\x0ci', b'\x0ci',
+    b'\x0ci', b'\x0co', b'\x0co', b'\x0co', b'\x0co', b'\x0cs', b'\x0cs', b'\x0cs', b'\x0cs',
+    b'\x0ct', b'\x0ct', b'\x0ct', b'\x0ct', b'\x0c ', b'\x0c ', b'\x0c%', b'\x0c%', b'\x0c-',
+    b'\x0c-', b'\x0c.', b'\x0c.', b'\x0c/', b'\x0c/', b'\x0c3', b'\x0c3', b'\x0c4', b'\x0c4',
+    b'\x0c5', b'\x0c5', b'\x0c6', b'\x0c6', b'\x0c7', b'\x0c7', b'\x0c8', b'\x0c8', b'\x0c9',
+    b'\x0c9', b'\x0c=', b'\x0c=', b'\x0cA', b'\x0cA', b'\x0c_', b'\x0c_', b'\x0cb', b'\x0cb',
+    b'\x0cd', b'\x0cd', b'\x0cf', b'\x0cf', b'\x0cg', b'\x0cg', b'\x0ch', b'\x0ch', b'\x0cl',
+    b'\x0cl', b'\x0cm', b'\x0cm', b'\x0cn', b'\x0cn', b'\x0cp', b'\x0cp', b'\x0cr', b'\x0cr',
+    b'\x0cu', b'\x0cu', b'\x0c:', b'\x0cB', b'\x0cC', b'\x0cD', b'\x0cE', b'\x0cF', b'\x0cG',
+    b'\x0cH', b'\x0cI', b'\x0cJ', b'\x0cK', b'\x0cL', b'\x0cM', b'\x0cN', b'\x0cO', b'\x0cP',
+    b'\x0cQ', b'\x0cR', b'\x0cS', b'\x0cT', b'\x0cU', b'\x0cV', b'\x0cW', b'\x0cY', b'\x0cj',
+    b'\x0ck', b'\x0cq', b'\x0cv', b'\x0cw', b'\x0cx', b'\x0cy', b'\x0cz', b'\x0c', b'\x0c', b'\x0c',
+    b'\x0c', b'\x0e0', b'\x0e0', b'\x0e0', b'\x0e0', b'\x0e1', b'\x0e1', b'\x0e1', b'\x0e1',
+    b'\x0e2', b'\x0e2', b'\x0e2', b'\x0e2', b'\x0ea', b'\x0ea', b'\x0ea', b'\x0ea', b'\x0ec',
+    b'\x0ec', b'\x0ec', b'\x0ec', b'\x0ee', b'\x0ee', b'\x0ee', b'\x0ee', b'\x0ei', b'\x0ei',
+    b'\x0ei', b'\x0ei', b'\x0eo', b'\x0eo', b'\x0eo', b'\x0eo', b'\x0es', b'\x0es', b'\x0es',
+    b'\x0es', b'\x0et', b'\x0et', b'\x0et', b'\x0et', b'\x0e ', b'\x0e ', b'\x0e%', b'\x0e%',
+    b'\x0e-', b'\x0e-', b'\x0e.', b'\x0e.', b'\x0e/', b'\x0e/', b'\x0e3', b'\x0e3', b'\x0e4',
+    b'\x0e4', b'\x0e5', b'\x0e5', b'\x0e6', b'\x0e6', b'\x0e7', b'\x0e7', b'\x0e8', b'\x0e8',
+    b'\x0e9', b'\x0e9', b'\x0e=', b'\x0e=', b'\x0eA', b'\x0eA', b'\x0e_', b'\x0e_', b'\x0eb',
+    b'\x0eb', b'\x0ed', b'\x0ed', b'\x0ef', b'\x0ef', b'\x0eg', b'\x0eg', b'\x0eh', b'\x0eh',
+    b'\x0el', b'\x0el', b'\x0em', b'\x0em', b'\x0en', b'\x0en', b'\x0ep', b'\x0ep', b'\x0er',
+    b'\x0er', b'\x0eu', b'\x0eu', b'\x0e:', b'\x0eB', b'\x0eC', b'\x0eD', b'\x0eE', b'\x0eF',
+    b'\x0eG', b'\x0eH', b'\x0eI', b'\x0eJ', b'\x0eK', b'\x0eL', b'\x0eM', b'\x0eN', b'\x0eO',
+    b'\x0eP', b'\x0eQ', b'\x0eR', b'\x0eS', b'\x0eT', b'\x0eU', b'\x0eV', b'\x0eW', b'\x0eY',
+    b'\x0ej', b'\x0ek', b'\x0eq', b'\x0ev', b'\x0ew', b'\x0ex', b'\x0ey', b'\x0ez', b'\x0e',
+    b'\x0e', b'\x0e', b'\x0e', b'\x0f0', b'\x0f0', b'\x0f1', b'\x0f1', b'\x0f2', b'\x0f2', b'\x0fa',
+    b'\x0fa', b'\x0fc', b'\x0fc', b'\x0fe', b'\x0fe', b'\x0fi', b'\x0fi', b'\x0fo', b'\x0fo',
+    b'\x0fs', b'\x0fs', b'\x0ft', b'\x0ft', b'\x0f ', b'\x0f%', b'\x0f-', b'\x0f.', b'\x0f/',
+    b'\x0f3', b'\x0f4', b'\x0f5', b'\x0f6', b'\x0f7', b'\x0f8', b'\x0f9', b'\x0f=', b'\x0fA',
+    b'\x0f_', b'\x0fb', b'\x0fd', b'\x0ff', b'\x0fg', b'\x0fh', b'\x0fl', b'\x0fm', b'\x0fn',
+    b'\x0fp', b'\x0fr', b'\x0fu', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f',
+    b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x0f',
+    b'\x0f', b'\x100', b'\x100', b'\x101', b'\x101', b'\x102', b'\x102', b'\x10a', b'\x10a',
+    b'\x10c', b'\x10c', b'\x10e', b'\x10e', b'\x10i', b'\x10i', b'\x10o', b'\x10o', b'\x10s',
+    b'\x10s', b'\x10t', b'\x10t', b'\x10 ', b'\x10%', b'\x10-', b'\x10.', b'\x10/', b'\x103',
+    b'\x104', b'\x105', b'\x106', b'\x107', b'\x108', b'\x109', b'\x10=', b'\x10A', b'\x10_',
+    b'\x10b', b'\x10d', b'\x10f', b'\x10g', b'\x10h', b'\x10l', b'\x10m', b'\x10n', b'\x10p',
+    b'\x10r', b'\x10u', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10',
+    b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10', b'\x10',
+    b'\x110', b'\x110', b'\x111', b'\x111', b'\x112', b'\x112', b'\x11a', b'\x11a', b'\x11c',
+    b'\x11c', b'\x11e', b'\x11e', b'\x11i', b'\x11i', b'\x11o', b'\x11o', b'\x11s', b'\x11s',
+    b'\x11t', b'\x11t', b'\x11 ', b'\x11%', b'\x11-', b'\x11.', b'\x11/', b'\x113', b'\x114',
+    b'\x115', b'\x116', b'\x117', b'\x118', b'\x119', b'\x11=', b'\x11A', b'\x11_', b'\x11b',
+    b'\x11d', b'\x11f', b'\x11g', b'\x11h', b'\x11l', b'\x11m', b'\x11n', b'\x11p', b'\x11r',
+    b'\x11u', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11',
+    b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x11', b'\x120',
+    b'\x120', b'\x121', b'\x121', b'\x122', b'\x122', b'\x12a', b'\x12a', b'\x12c', b'\x12c',
+    b'\x12e', b'\x12e', b'\x12i', b'\x12i', b'\x12o', b'\x12o', b'\x12s', b'\x12s', b'\x12t',
+    b'\x12t', b'\x12 ', b'\x12%', b'\x12-', b'\x12.', b'\x12/', b'\x123', b'\x124', b'\x125',
+    b'\x126', b'\x127', b'\x128', b'\x129', b'\x12=', b'\x12A', b'\x12_', b'\x12b', b'\x12d',
+    b'\x12f', b'\x12g', b'\x12h', b'\x12l', b'\x12m', b'\x12n', b'\x12p', b'\x12r', b'\x12u',
+    b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12',
+    b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x12', b'\x0f0', b'\x0f0',
+    b'\x0f0', b'\x0f0', b'\x0f1', b'\x0f1', b'\x0f1', b'\x0f1', b'\x0f2', b'\x0f2', b'\x0f2',
+    b'\x0f2', b'\x0fa', b'\x0fa', b'\x0fa', b'\x0fa', b'\x0fc', b'\x0fc', b'\x0fc', b'\x0fc',
+    b'\x0fe', b'\x0fe', b'\x0fe', b'\x0fe', b'\x0fi', b'\x0fi', b'\x0fi', b'\x0fi', b'\x0fo',
+    b'\x0fo', b'\x0fo', b'\x0fo', b'\x0fs', b'\x0fs', b'\x0fs', b'\x0fs', b'\x0ft', b'\x0ft',
+    b'\x0ft', b'\x0ft', b'\x0f ', b'\x0f ', b'\x0f%', b'\x0f%', b'\x0f-', b'\x0f-', b'\x0f.',
+    b'\x0f.', b'\x0f/', b'\x0f/', b'\x0f3', b'\x0f3', b'\x0f4', b'\x0f4', b'\x0f5', b'\x0f5',
+    b'\x0f6', b'\x0f6', b'\x0f7', b'\x0f7', b'\x0f8', b'\x0f8', b'\x0f9', b'\x0f9', b'\x0f=',
+    b'\x0f=', b'\x0fA', b'\x0fA', b'\x0f_', b'\x0f_', b'\x0fb', b'\x0fb', b'\x0fd', b'\x0fd',
+    b'\x0ff', b'\x0ff', b'\x0fg', b'\x0fg', b'\x0fh', b'\x0fh', b'\x0fl', b'\x0fl', b'\x0fm',
+    b'\x0fm', b'\x0fn', b'\x0fn', b'\x0fp', b'\x0fp', b'\x0fr', b'\x0fr', b'\x0fu', b'\x0fu',
+    b'\x0f:', b'\x0fB', b'\x0fC', b'\x0fD', b'\x0fE', b'\x0fF', b'\x0fG', b'\x0fH', b'\x0fI',
+    b'\x0fJ', b'\x0fK', b'\x0fL', b'\x0fM', b'\x0fN', b'\x0fO', b'\x0fP', b'\x0fQ', b'\x0fR',
+    b'\x0fS', b'\x0fT', b'\x0fU', b'\x0fV', b'\x0fW', b'\x0fY', b'\x0fj', b'\x0fk', b'\x0fq',
+    b'\x0fv', b'\x0fw', b'\x0fx', b'\x0fy', b'\x0fz', b'\x0f', b'\x0f', b'\x0f', b'\x0f', b'\x100',
+    b'\x100', b'\x100', b'\x100', b'\x101', b'\x101', b'\x101', b'\x101', b'\x102', b'\x102',
+    b'\x102', b'\x102', b'\x10a', b'\x10a', b'\x10a', b'\x10a', b'\x10c', b'\x10c', b'\x10c',
+    b'\x10c', b'\x10e', b'\x10e', b'\x10e', b'\x10e', b'\x10i', b'\x10i', b'\x10i', b'\x10i',
+    b'\x10o', b'\x10o', b'\x10o', b'\x10o', b'\x10s', b'\x10s', b'\x10s', b'\x10s', b'\x10t',
+    b'\x10t', b'\x10t', b'\x10t', b'\x10 ', b'\x10 ', b'\x10%', b'\x10%', b'\x10-', b'\x10-',
+    b'\x10.', b'\x10.', b'\x10/', b'\x10/', b'\x103', b'\x103', b'\x104', b'\x104', b'\x105',
+    b'\x105', b'\x106', b'\x106', b'\x107', b'\x107', b'\x108', b'\x108', b'\x109', b'\x109',
+    b'\x10=', b'\x10=', b'\x10A', b'\x10A', b'\x10_', b'\x10_', b'\x10b', b'\x10b', b'\x10d',
+    b'\x10d', b'\x10f', b'\x10f', b'\x10g', b'\x10g', b'\x10h', b'\x10h', b'\x10l', b'\x10l',
+    b'\x10m', b'\x10m', b'\x10n', b'\x10n', b'\x10p', b'\x10p', b'\x10r', b'\x10r', b'\x10u',
+    b'\x10u', b'\x10:', b'\x10B', b'\x10C', b'\x10D', b'\x10E', b'\x10F', b'\x10G', b'\x10H',
+    b'\x10I', b'\x10J', b'\x10K', b'\x10L', b'\x10M', b'\x10N', b'\x10O', b'\x10P', b'\x10Q',
+    b'\x10R', b'\x10S', b'\x10T', b'\x10U', b'\x10V', b'\x10W', b'\x10Y', b'\x10j', b'\x10k',
+    b'\x10q', b'\x10v', b'\x10w', b'\x10x', b'\x10y', b'\x10z', b'\x10', b'\x10', b'\x10', b'\x10',
+    b'\x110', b'\x110', b'\x110', b'\x110', b'\x111', b'\x111', b'\x111', b'\x111', b'\x112',
+    b'\x112', b'\x112', b'\x112', b'\x11a', b'\x11a', b'\x11a', b'\x11a', b'\x11c', b'\x11c',
+    b'\x11c', b'\x11c', b'\x11e', b'\x11e', b'\x11e', b'\x11e', b'\x11i', b'\x11i', b'\x11i',
+    b'\x11i', b'\x11o', b'\x11o', b'\x11o', b'\x11o', b'\x11s', b'\x11s', b'\x11s', b'\x11s',
+    b'\x11t', b'\x11t', b'\x11t', b'\x11t', b'\x11 ', b'\x11 ', b'\x11%', b'\x11%', b'\x11-',
+    b'\x11-', b'\x11.', b'\x11.', b'\x11/', b'\x11/', b'\x113', b'\x113', b'\x114', b'\x114',
+    b'\x115', b'\x115', b'\x116', b'\x116', b'\x117', b'\x117', b'\x118', b'\x118', b'\x119',
+    b'\x119', b'\x11=', b'\x11=', b'\x11A', b'\x11A', b'\x11_', b'\x11_', b'\x11b', b'\x11b',
+    b'\x11d', b'\x11d', b'\x11f', b'\x11f', b'\x11g', b'\x11g', b'\x11h', b'\x11h', b'\x11l',
+    b'\x11l', b'\x11m', b'\x11m', b'\x11n', b'\x11n', b'\x11p', b'\x11p', b'\x11r', b'\x11r',
+    b'\x11u', b'\x11u', b'\x11:', b'\x11B', b'\x11C', b'\x11D', b'\x11E', b'\x11F', b'\x11G',
+    b'\x11H', b'\x11I', b'\x11J', b'\x11K', b'\x11L', b'\x11M', b'\x11N', b'\x11O', b'\x11P',
+    b'\x11Q', b'\x11R', b'\x11S', b'\x11T', b'\x11U', b'\x11V', b'\x11W', b'\x11Y', b'\x11j',
+    b'\x11k', b'\x11q', b'\x11v', b'\x11w', b'\x11x', b'\x11y', b'\x11z', b'\x11', b'\x11', b'\x11',
+    b'\x11', b'\x120', b'\x120', b'\x120', b'\x120', b'\x121', b'\x121', b'\x121', b'\x121',
+    b'\x122', b'\x122', b'\x122', b'\x122', b'\x12a', b'\x12a', b'\x12a', b'\x12a', b'\x12c',
+    b'\x12c', b'\x12c', b'\x12c', b'\x12e', b'\x12e', b'\x12e', b'\x12e', b'\x12i', b'\x12i',
+    b'\x12i', b'\x12i', b'\x12o', b'\x12o', b'\x12o', b'\x12o', b'\x12s', b'\x12s', b'\x12s',
+    b'\x12s', b'\x12t', b'\x12t', b'\x12t', b'\x12t', b'\x12 ', b'\x12 ', b'\x12%', b'\x12%',
+    b'\x12-', b'\x12-', b'\x12.', b'\x12.', b'\x12/', b'\x12/', b'\x123', b'\x123', b'\x124',
+    b'\x124', b'\x125', b'\x125', b'\x126', b'\x126', b'\x127', b'\x127', b'\x128', b'\x128',
+    b'\x129', b'\x129', b'\x12=', b'\x12=', b'\x12A', b'\x12A', b'\x12_', b'\x12_', b'\x12b',
+    b'\x12b', b'\x12d', b'\x12d', b'\x12f', b'\x12f', b'\x12g', b'\x12g', b'\x12h', b'\x12h',
+    b'\x12l', b'\x12l', b'\x12m', b'\x12m', b'\x12n', b'\x12n', b'\x12p', b'\x12p', b'\x12r',
+    b'\x12r', b'\x12u', b'\x12u', b'\x12:', b'\x12B', b'\x12C', b'\x12D', b'\x12E', b'\x12F',
+    b'\x12G', b'\x12H', b'\x12I', b'\x12J', b'\x12K', b'\x12L', b'\x12M', b'\x12N', b'\x12O',
+    b'\x12P', b'\x12Q', b'\x12R', b'\x12S', b'\x12T', b'\x12U', b'\x12V', b'\x12W', b'\x12Y',
+    b'\x12j', b'\x12k', b'\x12q', b'\x12v', b'\x12w', b'\x12x', b'\x12y', b'\x12z', b'\x12',
+    b'\x12', b'\x12', b'\x12', b'\x130', b'\x131', b'\x132', b'\x13a', b'\x13c', b'\x13e', b'\x13i',
+    b'\x13o', b'\x13s', b'\x13t', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13',
+    b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13',
+    b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x140', b'\x141', b'\x142', b'\x14a', b'\x14c',
+    b'\x14e', b'\x14i', b'\x14o', b'\x14s', b'\x14t', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x150', b'\x151', b'\x152',
+    b'\x15a', b'\x15c', b'\x15e', b'\x15i', b'\x15o', b'\x15s', b'\x15t', b'\x15', b'\x15', b'\x15',
+    b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15',
+    b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x170',
+    b'\x171', b'\x172', b'\x17a', b'\x17c', b'\x17e', b'\x17i', b'\x17o', b'\x17s', b'\x17t',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17',
+    b'\x17', b'\x17', b'\x180', b'\x181', b'\x182', b'\x18a', b'\x18c', b'\x18e', b'\x18i',
+    b'\x18o', b'\x18s', b'\x18t', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x190', b'\x191', b'\x192', b'\x19a', b'\x19c',
+    b'\x19e', b'\x19i', b'\x19o', b'\x19s', b'\x19t', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19',
+    b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19',
+    b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x1a0', b'\x1a1', b'\x1a2',
+    b'\x1aa', b'\x1ac', b'\x1ae', b'\x1ai', b'\x1ao', b'\x1as', b'\x1at', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1b0',
+    b'\x1b1', b'\x1b2', b'\x1ba', b'\x1bc', b'\x1be', b'\x1bi', b'\x1bo', b'\x1bs', b'\x1bt',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b',
+    b'\x1b', b'\x1b', b'\x130', b'\x130', b'\x131', b'\x131', b'\x132', b'\x132', b'\x13a',
+    b'\x13a', b'\x13c', b'\x13c', b'\x13e', b'\x13e', b'\x13i', b'\x13i', b'\x13o', b'\x13o',
+    b'\x13s', b'\x13s', b'\x13t', b'\x13t', b'\x13 ', b'\x13%', b'\x13-', b'\x13.', b'\x13/',
+    b'\x133', b'\x134', b'\x135', b'\x136', b'\x137', b'\x138', b'\x139', b'\x13=', b'\x13A',
+    b'\x13_', b'\x13b', b'\x13d', b'\x13f', b'\x13g', b'\x13h', b'\x13l', b'\x13m', b'\x13n',
+    b'\x13p', b'\x13r', b'\x13u', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13',
+    b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13', b'\x13',
+    b'\x13', b'\x140', b'\x140', b'\x141', b'\x141', b'\x142', b'\x142', b'\x14a', b'\x14a',
+    b'\x14c', b'\x14c', b'\x14e', b'\x14e', b'\x14i', b'\x14i', b'\x14o', b'\x14o', b'\x14s',
+    b'\x14s', b'\x14t', b'\x14t', b'\x14 ', b'\x14%', b'\x14-', b'\x14.', b'\x14/', b'\x143',
+    b'\x144', b'\x145', b'\x146', b'\x147', b'\x148', b'\x149', b'\x14=', b'\x14A', b'\x14_',
+    b'\x14b', b'\x14d', b'\x14f', b'\x14g', b'\x14h', b'\x14l', b'\x14m', b'\x14n', b'\x14p',
+    b'\x14r', b'\x14u', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x150', b'\x150', b'\x151', b'\x151', b'\x152', b'\x152', b'\x15a', b'\x15a', b'\x15c',
+    b'\x15c', b'\x15e', b'\x15e', b'\x15i', b'\x15i', b'\x15o', b'\x15o', b'\x15s', b'\x15s',
+    b'\x15t', b'\x15t', b'\x15 ', b'\x15%', b'\x15-', b'\x15.', b'\x15/', b'\x153', b'\x154',
+    b'\x155', b'\x156', b'\x157', b'\x158', b'\x159', b'\x15=', b'\x15A', b'\x15_', b'\x15b',
+    b'\x15d', b'\x15f', b'\x15g', b'\x15h', b'\x15l', b'\x15m', b'\x15n', b'\x15p', b'\x15r',
+    b'\x15u', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15',
+    b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x15', b'\x170',
+    b'\x170', b'\x171', b'\x171', b'\x172', b'\x172', b'\x17a', b'\x17a', b'\x17c', b'\x17c',
+    b'\x17e', b'\x17e', b'\x17i', b'\x17i', b'\x17o', b'\x17o', b'\x17s', b'\x17s', b'\x17t',
+    b'\x17t', b'\x17 ', b'\x17%', b'\x17-', b'\x17.', b'\x17/', b'\x173', b'\x174', b'\x175',
+    b'\x176', b'\x177', b'\x178', b'\x179', b'\x17=', b'\x17A', b'\x17_', b'\x17b', b'\x17d',
+    b'\x17f', b'\x17g', b'\x17h', b'\x17l', b'\x17m', b'\x17n', b'\x17p', b'\x17r', b'\x17u',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17',
+    b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x17', b'\x130', b'\x130',
+    b'\x130', b'\x130', b'\x131', b'\x131', b'\x131', b'\x131', b'\x132', b'\x132', b'\x132',
+    b'\x132', b'\x13a', b'\x13a', b'\x13a', b'\x13a', b'\x13c', b'\x13c', b'\x13c', b'\x13c',
+    b'\x13e', b'\x13e', b'\x13e', b'\x13e', b'\x13i', b'\x13i', b'\x13i', b'\x13i', b'\x13o',
+    b'\x13o', b'\x13o', b'\x13o', b'\x13s', b'\x13s', b'\x13s', b'\x13s', b'\x13t', b'\x13t',
+    b'\x13t', b'\x13t', b'\x13 ', b'\x13 ', b'\x13%', b'\x13%', b'\x13-', b'\x13-', b'\x13.',
+    b'\x13.', b'\x13/', b'\x13/', b'\x133', b'\x133', b'\x134', b'\x134', b'\x135', b'\x135',
+    b'\x136', b'\x136', b'\x137', b'\x137', b'\x138', b'\x138', b'\x139', b'\x139', b'\x13=',
+    b'\x13=', b'\x13A', b'\x13A', b'\x13_', b'\x13_', b'\x13b', b'\x13b', b'\x13d', b'\x13d',
+    b'\x13f', b'\x13f', b'\x13g', b'\x13g', b'\x13h', b'\x13h', b'\x13l', b'\x13l', b'\x13m',
+    b'\x13m', b'\x13n', b'\x13n', b'\x13p', b'\x13p', b'\x13r', b'\x13r', b'\x13u', b'\x13u',
+    b'\x13:', b'\x13B', b'\x13C', b'\x13D', b'\x13E', b'\x13F', b'\x13G', b'\x13H', b'\x13I',
+    b'\x13J', b'\x13K', b'\x13L', b'\x13M', b'\x13N', b'\x13O', b'\x13P', b'\x13Q', b'\x13R',
+    b'\x13S', b'\x13T', b'\x13U', b'\x13V', b'\x13W', b'\x13Y', b'\x13j', b'\x13k', b'\x13q',
+    b'\x13v', b'\x13w', b'\x13x', b'\x13y', b'\x13z', b'\x13', b'\x13', b'\x13', b'\x13', b'\x140',
+    b'\x140', b'\x140', b'\x140', b'\x141', b'\x141', b'\x141', b'\x141', b'\x142', b'\x142',
+    b'\x142', b'\x142', b'\x14a', b'\x14a', b'\x14a', b'\x14a', b'\x14c', b'\x14c', b'\x14c',
+    b'\x14c', b'\x14e', b'\x14e', b'\x14e', b'\x14e', b'\x14i', b'\x14i', b'\x14i', b'\x14i',
+    b'\x14o', b'\x14o', b'\x14o', b'\x14o', b'\x14s', b'\x14s', b'\x14s', b'\x14s', b'\x14t',
+    b'\x14t', b'\x14t', b'\x14t', b'\x14 ', b'\x14 ', b'\x14%', b'\x14%', b'\x14-', b'\x14-',
+    b'\x14.', b'\x14.', b'\x14/', b'\x14/', b'\x143', b'\x143', b'\x144', b'\x144', b'\x145',
+    b'\x145', b'\x146', b'\x146', b'\x147', b'\x147', b'\x148', b'\x148', b'\x149', b'\x149',
+    b'\x14=', b'\x14=', b'\x14A', b'\x14A', b'\x14_', b'\x14_', b'\x14b', b'\x14b', b'\x14d',
+    b'\x14d', b'\x14f', b'\x14f', b'\x14g', b'\x14g', b'\x14h', b'\x14h', b'\x14l', b'\x14l',
+    b'\x14m', b'\x14m', b'\x14n', b'\x14n', b'\x14p', b'\x14p', b'\x14r', b'\x14r', b'\x14u',
+    b'\x14u', b'\x14:', b'\x14B', b'\x14C', b'\x14D', b'\x14E', b'\x14F', b'\x14G', b'\x14H',
+    b'\x14I', b'\x14J', b'\x14K', b'\x14L', b'\x14M', b'\x14N', b'\x14O', b'\x14P', b'\x14Q',
+    b'\x14R', b'\x14S', b'\x14T', b'\x14U', b'\x14V', b'\x14W', b'\x14Y', b'\x14j', b'\x14k',
+    b'\x14q', b'\x14v', b'\x14w', b'\x14x', b'\x14y', b'\x14z', b'\x14', b'\x14', b'\x14', b'\x14',
+    b'\x150', b'\x150', b'\x150', b'\x150', b'\x151', b'\x151', b'\x151', b'\x151', b'\x152',
+    b'\x152', b'\x152', b'\x152', b'\x15a', b'\x15a', b'\x15a', b'\x15a', b'\x15c', b'\x15c',
+    b'\x15c', b'\x15c', b'\x15e', b'\x15e', b'\x15e', b'\x15e', b'\x15i', b'\x15i', b'\x15i',
+    b'\x15i', b'\x15o', b'\x15o', b'\x15o', b'\x15o', b'\x15s', b'\x15s', b'\x15s', b'\x15s',
+    b'\x15t', b'\x15t', b'\x15t', b'\x15t', b'\x15 ', b'\x15 ', b'\x15%', b'\x15%', b'\x15-',
+    b'\x15-', b'\x15.', b'\x15.', b'\x15/', b'\x15/', b'\x153', b'\x153', b'\x154', b'\x154',
+    b'\x155', b'\x155', b'\x156', b'\x156', b'\x157', b'\x157', b'\x158', b'\x158', b'\x159',
+    b'\x159', b'\x15=', b'\x15=', b'\x15A', b'\x15A', b'\x15_', b'\x15_', b'\x15b', b'\x15b',
+    b'\x15d', b'\x15d', b'\x15f', b'\x15f', b'\x15g', b'\x15g', b'\x15h', b'\x15h', b'\x15l',
+    b'\x15l', b'\x15m', b'\x15m', b'\x15n', b'\x15n', b'\x15p', b'\x15p', b'\x15r', b'\x15r',
+    b'\x15u', b'\x15u', b'\x15:', b'\x15B', b'\x15C', b'\x15D', b'\x15E', b'\x15F', b'\x15G',
+    b'\x15H', b'\x15I', b'\x15J', b'\x15K', b'\x15L', b'\x15M', b'\x15N', b'\x15O', b'\x15P',
+    b'\x15Q', b'\x15R', b'\x15S', b'\x15T', b'\x15U', b'\x15V', b'\x15W', b'\x15Y', b'\x15j',
+    b'\x15k', b'\x15q', b'\x15v', b'\x15w', b'\x15x', b'\x15y', b'\x15z', b'\x15', b'\x15', b'\x15',
+    b'\x15', b'\x170', b'\x170', b'\x170', b'\x170', b'\x171', b'\x171', b'\x171', b'\x171',
+    b'\x172', b'\x172', b'\x172', b'\x172', b'\x17a', b'\x17a', b'\x17a', b'\x17a', b'\x17c',
+    b'\x17c', b'\x17c', b'\x17c', b'\x17e', b'\x17e', b'\x17e', b'\x17e', b'\x17i', b'\x17i',
+    b'\x17i', b'\x17i', b'\x17o', b'\x17o', b'\x17o', b'\x17o', b'\x17s', b'\x17s', b'\x17s',
+    b'\x17s', b'\x17t', b'\x17t', b'\x17t', b'\x17t', b'\x17 ', b'\x17 ', b'\x17%', b'\x17%',
+    b'\x17-', b'\x17-', b'\x17.', b'\x17.', b'\x17/', b'\x17/', b'\x173', b'\x173', b'\x174',
+    b'\x174', b'\x175', b'\x175', b'\x176', b'\x176', b'\x177', b'\x177', b'\x178', b'\x178',
+    b'\x179', b'\x179', b'\x17=', b'\x17=', b'\x17A', b'\x17A', b'\x17_', b'\x17_', b'\x17b',
+    b'\x17b', b'\x17d', b'\x17d', b'\x17f', b'\x17f', b'\x17g', b'\x17g', b'\x17h', b'\x17h',
+    b'\x17l', b'\x17l', b'\x17m', b'\x17m', b'\x17n', b'\x17n', b'\x17p', b'\x17p', b'\x17r',
+    b'\x17r', b'\x17u', b'\x17u', b'\x17:', b'\x17B', b'\x17C', b'\x17D', b'\x17E', b'\x17F',
+    b'\x17G', b'\x17H', b'\x17I', b'\x17J', b'\x17K', b'\x17L', b'\x17M', b'\x17N', b'\x17O',
+    b'\x17P', b'\x17Q', b'\x17R', b'\x17S', b'\x17T', b'\x17U', b'\x17V', b'\x17W', b'\x17Y',
+    b'\x17j', b'\x17k', b'\x17q', b'\x17v', b'\x17w', b'\x17x', b'\x17y', b'\x17z', b'\x17',
+    b'\x17', b'\x17', b'\x17', b'\x160', b'\x160', b'\x160', b'\x160', b'\x161', b'\x161', b'\x161',
+    b'\x161', b'\x162', b'\x162', b'\x162', b'\x162', b'\x16a', b'\x16a', b'\x16a', b'\x16a',
+    b'\x16c', b'\x16c', b'\x16c', b'\x16c', b'\x16e', b'\x16e', b'\x16e', b'\x16e', b'\x16i',
+    b'\x16i', b'\x16i', b'\x16i', b'\x16o', b'\x16o', b'\x16o', b'\x16o', b'\x16s', b'\x16s',
+    b'\x16s', b'\x16s', b'\x16t', b'\x16t', b'\x16t', b'\x16t', b'\x16 ', b'\x16 ', b'\x16%',
+    b'\x16%', b'\x16-', b'\x16-', b'\x16.', b'\x16.', b'\x16/', b'\x16/', b'\x163', b'\x163',
+    b'\x164', b'\x164', b'\x165', b'\x165', b'\x166', b'\x166', b'\x167', b'\x167', b'\x168',
+    b'\x168', b'\x169', b'\x169', b'\x16=', b'\x16=', b'\x16A', b'\x16A', b'\x16_', b'\x16_',
+    b'\x16b', b'\x16b', b'\x16d', b'\x16d', b'\x16f', b'\x16f', b'\x16g', b'\x16g', b'\x16h',
+    b'\x16h', b'\x16l', b'\x16l', b'\x16m', b'\x16m', b'\x16n', b'\x16n', b'\x16p', b'\x16p',
+    b'\x16r', b'\x16r', b'\x16u', b'\x16u', b'\x16:', b'\x16B', b'\x16C', b'\x16D', b'\x16E',
+    b'\x16F', b'\x16G', b'\x16H', b'\x16I', b'\x16J', b'\x16K', b'\x16L', b'\x16M', b'\x16N',
+    b'\x16O', b'\x16P', b'\x16Q', b'\x16R', b'\x16S', b'\x16T', b'\x16U', b'\x16V', b'\x16W',
+    b'\x16Y', b'\x16j', b'\x16k', b'\x16q', b'\x16v', b'\x16w', b'\x16x', b'\x16y', b'\x16z',
+    b'\x16', b'\x16', b'\x16', b'\x16', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'\x180', b'\x180', b'\x181', b'\x181', b'\x182', b'\x182', b'\x18a', b'\x18a',
+    b'\x18c', b'\x18c', b'\x18e', b'\x18e', b'\x18i', b'\x18i', b'\x18o', b'\x18o', b'\x18s',
+    b'\x18s', b'\x18t', b'\x18t', b'\x18 ', b'\x18%', b'\x18-', b'\x18.', b'\x18/', b'\x183',
+    b'\x184', b'\x185', b'\x186', b'\x187', b'\x188', b'\x189', b'\x18=', b'\x18A', b'\x18_',
+    b'\x18b', b'\x18d', b'\x18f', b'\x18g', b'\x18h', b'\x18l', b'\x18m', b'\x18n', b'\x18p',
+    b'\x18r', b'\x18u', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18', b'\x18',
+    b'\x190', b'\x190', b'\x191', b'\x191', b'\x192', b'\x192', b'\x19a', b'\x19a', b'\x19c',
+    b'\x19c', b'\x19e', b'\x19e', b'\x19i', b'\x19i', b'\x19o', b'\x19o', b'\x19s', b'\x19s',
+    b'\x19t', b'\x19t', b'\x19 ', b'\x19%', b'\x19-', b'\x19.', b'\x19/', b'\x193', b'\x194',
+    b'\x195', b'\x196', b'\x197', b'\x198', b'\x199', b'\x19=', b'\x19A', b'\x19_', b'\x19b',
+    b'\x19d', b'\x19f', b'\x19g', b'\x19h', b'\x19l', b'\x19m', b'\x19n', b'\x19p', b'\x19r',
+    b'\x19u', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19',
+    b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x19', b'\x1a0',
+    b'\x1a0', b'\x1a1', b'\x1a1', b'\x1a2', b'\x1a2', b'\x1aa', b'\x1aa', b'\x1ac', b'\x1ac',
+    b'\x1ae', b'\x1ae', b'\x1ai', b'\x1ai', b'\x1ao', b'\x1ao', b'\x1as', b'\x1as', b'\x1at',
+    b'\x1at', b'\x1a ', b'\x1a%', b'\x1a-', b'\x1a.', b'\x1a/', b'\x1a3', b'\x1a4', b'\x1a5',
+    b'\x1a6', b'\x1a7', b'\x1a8', b'\x1a9', b'\x1a=', b'\x1aA', b'\x1a_', b'\x1ab', b'\x1ad',
+    b'\x1af', b'\x1ag', b'\x1ah', b'\x1al', b'\x1am', b'\x1an', b'\x1ap', b'\x1ar', b'\x1au',
+    b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1a', b'\x1b0', b'\x1b0',
+    b'\x1b1', b'\x1b1', b'\x1b2', b'\x1b2', b'\x1ba', b'\x1ba', b'\x1bc', b'\x1bc', b'\x1be',
+    b'\x1be', b'\x1bi', b'\x1bi', b'\x1bo', b'\x1bo', b'\x1bs', b'\x1bs', b'\x1bt', b'\x1bt',
+    b'\x1b ', b'\x1b%', b'\x1b-', b'\x1b.', b'\x1b/', b'\x1b3', b'\x1b4', b'\x1b5', b'\x1b6',
+    b'\x1b7', b'\x1b8', b'\x1b9', b'\x1b=', b'\x1bA', b'\x1b_', b'\x1bb', b'\x1bd', b'\x1bf',
+    b'\x1bg', b'\x1bh', b'\x1bl', b'\x1bm', b'\x1bn', b'\x1bp', b'\x1br', b'\x1bu', b'\x1b',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b',
+    b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x1b', b'\x180', b'\x180', b'\x180',
+    b'\x180', b'\x181', b'\x181', b'\x181', b'\x181', b'\x182', b'\x182', b'\x182', b'\x182',
+    b'\x18a', b'\x18a', b'\x18a', b'\x18a', b'\x18c', b'\x18c', b'\x18c', b'\x18c', b'\x18e',
+    b'\x18e', b'\x18e', b'\x18e', b'\x18i', b'\x18i', b'\x18i', b'\x18i', b'\x18o', b'\x18o',
+    b'\x18o', b'\x18o', b'\x18s', b'\x18s', b'\x18s', b'\x18s', b'\x18t', b'\x18t', b'\x18t',
+    b'\x18t', b'\x18 ', b'\x18 ', b'\x18%', b'\x18%', b'\x18-', b'\x18-', b'\x18.', b'\x18.',
+    b'\x18/', b'\x18/', b'\x183', b'\x183', b'\x184', b'\x184', b'\x185', b'\x185', b'\x186',
+    b'\x186', b'\x187', b'\x187', b'\x188', b'\x188', b'\x189', b'\x189', b'\x18=', b'\x18=',
+    b'\x18A', b'\x18A', b'\x18_', b'\x18_', b'\x18b', b'\x18b', b'\x18d', b'\x18d', b'\x18f',
+    b'\x18f', b'\x18g', b'\x18g', b'\x18h', b'\x18h', b'\x18l', b'\x18l', b'\x18m', b'\x18m',
+    b'\x18n', b'\x18n', b'\x18p', b'\x18p', b'\x18r', b'\x18r', b'\x18u', b'\x18u', b'\x18:',
+    b'\x18B', b'\x18C', b'\x18D', b'\x18E', b'\x18F', b'\x18G', b'\x18H', b'\x18I', b'\x18J',
+    b'\x18K', b'\x18L', b'\x18M', b'\x18N', b'\x18O', b'\x18P', b'\x18Q', b'\x18R', b'\x18S',
+    b'\x18T', b'\x18U', b'\x18V', b'\x18W', b'\x18Y', b'\x18j', b'\x18k', b'\x18q', b'\x18v',
+    b'\x18w', b'\x18x', b'\x18y', b'\x18z', b'\x18', b'\x18', b'\x18', b'\x18', b'\x190', b'\x190',
+    b'\x190', b'\x190', b'\x191', b'\x191', b'\x191', b'\x191', b'\x192', b'\x192', b'\x192',
+    b'\x192', b'\x19a', b'\x19a', b'\x19a', b'\x19a', b'\x19c', b'\x19c', b'\x19c', b'\x19c',
+    b'\x19e', b'\x19e', b'\x19e', b'\x19e', b'\x19i', b'\x19i', b'\x19i', b'\x19i', b'\x19o',
+    b'\x19o', b'\x19o', b'\x19o', b'\x19s', b'\x19s', b'\x19s', b'\x19s', b'\x19t', b'\x19t',
+    b'\x19t', b'\x19t', b'\x19 ', b'\x19 ', b'\x19%', b'\x19%', b'\x19-', b'\x19-', b'\x19.',
+    b'\x19.', b'\x19/', b'\x19/', b'\x193', b'\x193', b'\x194', b'\x194', b'\x195', b'\x195',
+    b'\x196', b'\x196', b'\x197', b'\x197', b'\x198', b'\x198', b'\x199', b'\x199', b'\x19=',
+    b'\x19=', b'\x19A', b'\x19A', b'\x19_', b'\x19_', b'\x19b', b'\x19b', b'\x19d', b'\x19d',
+    b'\x19f', b'\x19f', b'\x19g', b'\x19g', b'\x19h', b'\x19h', b'\x19l', b'\x19l', b'\x19m',
+    b'\x19m', b'\x19n', b'\x19n', b'\x19p', b'\x19p', b'\x19r', b'\x19r', b'\x19u', b'\x19u',
+    b'\x19:', b'\x19B', b'\x19C', b'\x19D', b'\x19E', b'\x19F', b'\x19G', b'\x19H', b'\x19I',
+    b'\x19J', b'\x19K', b'\x19L', b'\x19M', b'\x19N', b'\x19O', b'\x19P', b'\x19Q', b'\x19R',
+    b'\x19S', b'\x19T', b'\x19U', b'\x19V', b'\x19W', b'\x19Y', b'\x19j', b'\x19k', b'\x19q',
+    b'\x19v', b'\x19w', b'\x19x', b'\x19y', b'\x19z', b'\x19', b'\x19', b'\x19', b'\x19', b'\x1a0',
+    b'\x1a0', b'\x1a0', b'\x1a0', b'\x1a1', b'\x1a1', b'\x1a1', b'\x1a1', b'\x1a2', b'\x1a2',
+    b'\x1a2', b'\x1a2', b'\x1aa', b'\x1aa', b'\x1aa', b'\x1aa', b'\x1ac', b'\x1ac', b'\x1ac',
+    b'\x1ac', b'\x1ae', b'\x1ae', b'\x1ae', b'\x1ae', b'\x1ai', b'\x1ai', b'\x1ai', b'\x1ai',
+    b'\x1ao', b'\x1ao', b'\x1ao', b'\x1ao', b'\x1as', b'\x1as', b'\x1as', b'\x1as', b'\x1at',
+    b'\x1at', b'\x1at', b'\x1at', b'\x1a ', b'\x1a ', b'\x1a%', b'\x1a%', b'\x1a-', b'\x1a-',
+    b'\x1a.', b'\x1a.', b'\x1a/', b'\x1a/', b'\x1a3', b'\x1a3', b'\x1a4', b'\x1a4', b'\x1a5',
+    b'\x1a5', b'\x1a6', b'\x1a6', b'\x1a7', b'\x1a7', b'\x1a8', b'\x1a8', b'\x1a9', b'\x1a9',
+    b'\x1a=', b'\x1a=', b'\x1aA', b'\x1aA', b'\x1a_', b'\x1a_', b'\x1ab', b'\x1ab', b'\x1ad',
+    b'\x1ad', b'\x1af', b'\x1af', b'\x1ag', b'\x1ag', b'\x1ah', b'\x1ah', b'\x1al', b'\x1al',
+    b'\x1am', b'\x1am', b'\x1an', b'\x1an', b'\x1ap', b'\x1ap', b'\x1ar', b'\x1ar', b'\x1au',
+    b'\x1au', b'\x1a:', b'\x1aB', b'\x1aC', b'\x1aD', b'\x1aE', b'\x1aF', b'\x1aG', b'\x1aH',
+    b'\x1aI', b'\x1aJ', b'\x1aK', b'\x1aL', b'\x1aM', b'\x1aN', b'\x1aO', b'\x1aP', b'\x1aQ',
+    b'\x1aR', b'\x1aS', b'\x1aT', b'\x1aU', b'\x1aV', b'\x1aW', b'\x1aY', b'\x1aj', b'\x1ak',
+    b'\x1aq', b'\x1av', b'\x1aw', b'\x1ax', b'\x1ay', b'\x1az', b'\x1a', b'\x1a', b'\x1a', b'\x1a',
+    b'\x1b0', b'\x1b0', b'\x1b0', b'\x1b0', b'\x1b1', b'\x1b1', b'\x1b1', b'\x1b1', b'\x1b2',
+    b'\x1b2', b'\x1b2', b'\x1b2', b'\x1ba', b'\x1ba', b'\x1ba', b'\x1ba', b'\x1bc', b'\x1bc',
+    b'\x1bc', b'\x1bc', b'\x1be', b'\x1be', b'\x1be', b'\x1be', b'\x1bi', b'\x1bi', b'\x1bi',
+    b'\x1bi', b'\x1bo', b'\x1bo', b'\x1bo', b'\x1bo', b'\x1bs', b'\x1bs', b'\x1bs', b'\x1bs',
+    b'\x1bt', b'\x1bt', b'\x1bt', b'\x1bt', b'\x1b ', b'\x1b ', b'\x1b%', b'\x1b%', b'\x1b-',
+    b'\x1b-', b'\x1b.', b'\x1b.', b'\x1b/', b'\x1b/', b'\x1b3', b'\x1b3', b'\x1b4', b'\x1b4',
+    b'\x1b5', b'\x1b5', b'\x1b6', b'\x1b6', b'\x1b7', b'\x1b7', b'\x1b8', b'\x1b8', b'\x1b9',
+    b'\x1b9', b'\x1b=', b'\x1b=', b'\x1bA', b'\x1bA', b'\x1b_', b'\x1b_', b'\x1bb', b'\x1bb',
+    b'\x1bd', b'\x1bd', b'\x1bf', b'\x1bf', b'\x1bg', b'\x1bg', b'\x1bh', b'\x1bh', b'\x1bl',
+    b'\x1bl', b'\x1bm', b'\x1bm', b'\x1bn', b'\x1bn', b'\x1bp', b'\x1bp', b'\x1br', b'\x1br',
+    b'\x1bu', b'\x1bu', b'\x1b:', b'\x1bB', b'\x1bC', b'\x1bD', b'\x1bE', b'\x1bF', b'\x1bG',
+    b'\x1bH', b'\x1bI', b'\x1bJ', b'\x1bK', b'\x1bL', b'\x1bM', b'\x1bN', b'\x1bO', b'\x1bP',
+    b'\x1bQ', b'\x1bR', b'\x1bS', b'\x1bT', b'\x1bU', b'\x1bV', b'\x1bW', b'\x1bY', b'\x1bj',
+    b'\x1bk', b'\x1bq', b'\x1bv', b'\x1bw', b'\x1bx', b'\x1by', b'\x1bz', b'\x1b', b'\x1b', b'\x1b',
+    b'\x1b', b'\x1c0', b'\x1c0', b'\x1c1', b'\x1c1', b'\x1c2', b'\x1c2', b'\x1ca', b'\x1ca',
+    b'\x1cc', b'\x1cc', b'\x1ce', b'\x1ce', b'\x1ci', b'\x1ci', b'\x1co', b'\x1co', b'\x1cs',
+    b'\x1cs', b'\x1ct', b'\x1ct', b'\x1c ', b'\x1c%', b'\x1c-', b'\x1c.', b'\x1c/', b'\x1c3',
+    b'\x1c4', b'\x1c5', b'\x1c6', b'\x1c7', b'\x1c8', b'\x1c9', b'\x1c=', b'\x1cA', b'\x1c_',
+    b'\x1cb', b'\x1cd', b'\x1cf', b'\x1cg', b'\x1ch', b'\x1cl', b'\x1cm', b'\x1cn', b'\x1cp',
+    b'\x1cr', b'\x1cu', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c',
+    b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1c',
+    b'\x1d0', b'\x1d0', b'\x1d1', b'\x1d1', b'\x1d2', b'\x1d2', b'\x1da', b'\x1da', b'\x1dc',
+    b'\x1dc', b'\x1de', b'\x1de', b'\x1di', b'\x1di', b'\x1do', b'\x1do', b'\x1ds', b'\x1ds',
+    b'\x1dt', b'\x1dt', b'\x1d ', b'\x1d%', b'\x1d-', b'\x1d.', b'\x1d/', b'\x1d3', b'\x1d4',
+    b'\x1d5', b'\x1d6', b'\x1d7', b'\x1d8', b'\x1d9', b'\x1d=', b'\x1dA', b'\x1d_', b'\x1db',
+    b'\x1dd', b'\x1df', b'\x1dg', b'\x1dh', b'\x1dl', b'\x1dm', b'\x1dn', b'\x1dp', b'\x1dr',
+    b'\x1du', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d',
+    b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1e0',
+    b'\x1e0', b'\x1e1', b'\x1e1', b'\x1e2', b'\x1e2', b'\x1ea', b'\x1ea', b'\x1ec', b'\x1ec',
+    b'\x1ee', b'\x1ee', b'\x1ei', b'\x1ei', b'\x1eo', b'\x1eo', b'\x1es', b'\x1es', b'\x1et',
+    b'\x1et', b'\x1e ', b'\x1e%', b'\x1e-', b'\x1e.', b'\x1e/', b'\x1e3', b'\x1e4', b'\x1e5',
+    b'\x1e6', b'\x1e7', b'\x1e8', b'\x1e9', b'\x1e=', b'\x1eA', b'\x1e_', b'\x1eb', b'\x1ed',
+    b'\x1ef', b'\x1eg', b'\x1eh', b'\x1el', b'\x1em', b'\x1en', b'\x1ep', b'\x1er', b'\x1eu',
+    b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e',
+    b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1e', b'\x1f0', b'\x1f0',
+    b'\x1f1', b'\x1f1', b'\x1f2', b'\x1f2', b'\x1fa', b'\x1fa', b'\x1fc', b'\x1fc', b'\x1fe',
+    b'\x1fe', b'\x1fi', b'\x1fi', b'\x1fo', b'\x1fo', b'\x1fs', b'\x1fs', b'\x1ft', b'\x1ft',
+    b'\x1f ', b'\x1f%', b'\x1f-', b'\x1f.', b'\x1f/', b'\x1f3', b'\x1f4', b'\x1f5', b'\x1f6',
+    b'\x1f7', b'\x1f8', b'\x1f9', b'\x1f=', b'\x1fA', b'\x1f_', b'\x1fb', b'\x1fd', b'\x1ff',
+    b'\x1fg', b'\x1fh', b'\x1fl', b'\x1fm', b'\x1fn', b'\x1fp', b'\x1fr', b'\x1fu', b'\x1f',
+    b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f',
+    b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1f', b'\x1c0', b'\x1c0', b'\x1c0',
+    b'\x1c0', b'\x1c1', b'\x1c1', b'\x1c1', b'\x1c1', b'\x1c2', b'\x1c2', b'\x1c2', b'\x1c2',
+    b'\x1ca', b'\x1ca', b'\x1ca', b'\x1ca', b'\x1cc', b'\x1cc', b'\x1cc', b'\x1cc', b'\x1ce',
+    b'\x1ce', b'\x1ce', b'\x1ce', b'\x1ci', b'\x1ci', b'\x1ci', b'\x1ci', b'\x1co', b'\x1co',
+    b'\x1co', b'\x1co', b'\x1cs', b'\x1cs', b'\x1cs', b'\x1cs', b'\x1ct', b'\x1ct', b'\x1ct',
+    b'\x1ct', b'\x1c ', b'\x1c ', b'\x1c%', b'\x1c%', b'\x1c-', b'\x1c-', b'\x1c.', b'\x1c.',
+    b'\x1c/', b'\x1c/', b'\x1c3', b'\x1c3', b'\x1c4', b'\x1c4', b'\x1c5', b'\x1c5', b'\x1c6',
+    b'\x1c6', b'\x1c7', b'\x1c7', b'\x1c8', b'\x1c8', b'\x1c9', b'\x1c9', b'\x1c=', b'\x1c=',
+    b'\x1cA', b'\x1cA', b'\x1c_', b'\x1c_', b'\x1cb', b'\x1cb', b'\x1cd', b'\x1cd', b'\x1cf',
+    b'\x1cf', b'\x1cg', b'\x1cg', b'\x1ch', b'\x1ch', b'\x1cl', b'\x1cl', b'\x1cm', b'\x1cm',
+    b'\x1cn', b'\x1cn', b'\x1cp', b'\x1cp', b'\x1cr', b'\x1cr', b'\x1cu', b'\x1cu', b'\x1c:',
+    b'\x1cB', b'\x1cC', b'\x1cD', b'\x1cE', b'\x1cF', b'\x1cG', b'\x1cH', b'\x1cI', b'\x1cJ',
+    b'\x1cK', b'\x1cL', b'\x1cM', b'\x1cN', b'\x1cO', b'\x1cP', b'\x1cQ', b'\x1cR', b'\x1cS',
+    b'\x1cT', b'\x1cU', b'\x1cV', b'\x1cW', b'\x1cY', b'\x1cj', b'\x1ck', b'\x1cq', b'\x1cv',
+    b'\x1cw', b'\x1cx', b'\x1cy', b'\x1cz', b'\x1c', b'\x1c', b'\x1c', b'\x1c', b'\x1d0', b'\x1d0',
+    b'\x1d0', b'\x1d0', b'\x1d1', b'\x1d1', b'\x1d1', b'\x1d1', b'\x1d2', b'\x1d2', b'\x1d2',
+    b'\x1d2', b'\x1da', b'\x1da', b'\x1da', b'\x1da', b'\x1dc', b'\x1dc', b'\x1dc', b'\x1dc',
+    b'\x1de', b'\x1de', b'\x1de', b'\x1de', b'\x1di', b'\x1di', b'\x1di', b'\x1di', b'\x1do',
+    b'\x1do', b'\x1do', b'\x1do', b'\x1ds', b'\x1ds', b'\x1ds', b'\x1ds', b'\x1dt', b'\x1dt',
+    b'\x1dt', b'\x1dt', b'\x1d ', b'\x1d ', b'\x1d%', b'\x1d%', b'\x1d-', b'\x1d-', b'\x1d.',
+    b'\x1d.', b'\x1d/', b'\x1d/', b'\x1d3', b'\x1d3', b'\x1d4', b'\x1d4', b'\x1d5', b'\x1d5',
+    b'\x1d6', b'\x1d6', b'\x1d7', b'\x1d7', b'\x1d8', b'\x1d8', b'\x1d9', b'\x1d9', b'\x1d=',
+    b'\x1d=', b'\x1dA', b'\x1dA', b'\x1d_', b'\x1d_', b'\x1db', b'\x1db', b'\x1dd', b'\x1dd',
+    b'\x1df', b'\x1df', b'\x1dg', b'\x1dg', b'\x1dh', b'\x1dh', b'\x1dl', b'\x1dl', b'\x1dm',
+    b'\x1dm', b'\x1dn', b'\x1dn', b'\x1dp', b'\x1dp', b'\x1dr', b'\x1dr', b'\x1du', b'\x1du',
+    b'\x1d:', b'\x1dB', b'\x1dC', b'\x1dD', b'\x1dE', b'\x1dF', b'\x1dG', b'\x1dH', b'\x1dI',
+    b'\x1dJ', b'\x1dK', b'\x1dL', b'\x1dM', b'\x1dN', b'\x1dO', b'\x1dP', b'\x1dQ', b'\x1dR',
+    b'\x1dS', b'\x1dT', b'\x1dU', b'\x1dV', b'\x1dW', b'\x1dY', b'\x1dj', b'\x1dk', b'\x1dq',
+    b'\x1dv', b'\x1dw', b'\x1dx', b'\x1dy', b'\x1dz', b'\x1d', b'\x1d', b'\x1d', b'\x1d', b'\x1e0',
+    b'\x1e0', b'\x1e0', b'\x1e0', b'\x1e1', b'\x1e1', b'\x1e1', b'\x1e1', b'\x1e2', b'\x1e2',
+    b'\x1e2', b'\x1e2', b'\x1ea', b'\x1ea', b'\x1ea', b'\x1ea', b'\x1ec', b'\x1ec', b'\x1ec',
+    b'\x1ec', b'\x1ee', b'\x1ee', b'\x1ee', b'\x1ee', b'\x1ei', b'\x1ei', b'\x1ei', b'\x1ei',
+    b'\x1eo', b'\x1eo', b'\x1eo', b'\x1eo', b'\x1es', b'\x1es', b'\x1es', b'\x1es', b'\x1et',
+    b'\x1et', b'\x1et', b'\x1et', b'\x1e ', b'\x1e ', b'\x1e%', b'\x1e%', b'\x1e-', b'\x1e-',
+    b'\x1e.', b'\x1e.', b'\x1e/', b'\x1e/', b'\x1e3', b'\x1e3', b'\x1e4', b'\x1e4', b'\x1e5',
+    b'\x1e5', b'\x1e6', b'\x1e6', b'\x1e7', b'\x1e7', b'\x1e8', b'\x1e8', b'\x1e9', b'\x1e9',
+    b'\x1e=', b'\x1e=', b'\x1eA', b'\x1eA', b'\x1e_', b'\x1e_', b'\x1eb', b'\x1eb', b'\x1ed',
+    b'\x1ed', b'\x1ef', b'\x1ef', b'\x1eg', b'\x1eg', b'\x1eh', b'\x1eh', b'\x1el', b'\x1el',
+    b'\x1em', b'\x1em', b'\x1en', b'\x1en', b'\x1ep', b'\x1ep', b'\x1er', b'\x1er', b'\x1eu',
+    b'\x1eu', b'\x1e:', b'\x1eB', b'\x1eC', b'\x1eD', b'\x1eE', b'\x1eF', b'\x1eG', b'\x1eH',
+    b'\x1eI', b'\x1eJ', b'\x1eK', b'\x1eL', b'\x1eM', b'\x1eN', b'\x1eO', b'\x1eP', b'\x1eQ',
+    b'\x1eR', b'\x1eS', b'\x1eT', b'\x1eU', b'\x1eV', b'\x1eW', b'\x1eY', b'\x1ej', b'\x1ek',
+    b'\x1eq', b'\x1ev', b'\x1ew', b'\x1ex', b'\x1ey', b'\x1ez', b'\x1e', b'\x1e', b'\x1e', b'\x1e',
+    b'\x1f0', b'\x1f0', b'\x1f0', b'\x1f0', b'\x1f1', b'\x1f1', b'\x1f1', b'\x1f1', b'\x1f2',
+    b'\x1f2', b'\x1f2', b'\x1f2', b'\x1fa', b'\x1fa', b'\x1fa', b'\x1fa', b'\x1fc', b'\x1fc',
+    b'\x1fc', b'\x1fc', b'\x1fe', b'\x1fe', b'\x1fe', b'\x1fe', b'\x1fi', b'\x1fi', b'\x1fi',
+    b'\x1fi', b'\x1fo', b'\x1fo', b'\x1fo', b'\x1fo', b'\x1fs', b'\x1fs', b'\x1fs', b'\x1fs',
+    b'\x1ft', b'\x1ft', b'\x1ft', b'\x1ft', b'\x1f ', b'\x1f ', b'\x1f%', b'\x1f%', b'\x1f-',
+    b'\x1f-', b'\x1f.', b'\x1f.', b'\x1f/', b'\x1f/', b'\x1f3', b'\x1f3', b'\x1f4', b'\x1f4',
+    b'\x1f5', b'\x1f5', b'\x1f6', b'\x1f6', b'\x1f7', b'\x1f7', b'\x1f8', b'\x1f8', b'\x1f9',
+    b'\x1f9', b'\x1f=', b'\x1f=', b'\x1fA', b'\x1fA', b'\x1f_', b'\x1f_', b'\x1fb', b'\x1fb',
+    b'\x1fd', b'\x1fd', b'\x1ff', b'\x1ff', b'\x1fg', b'\x1fg', b'\x1fh', b'\x1fh', b'\x1fl',
+    b'\x1fl', b'\x1fm', b'\x1fm', b'\x1fn', b'\x1fn', b'\x1fp', b'\x1fp', b'\x1fr', b'\x1fr',
+    b'\x1fu', b'\x1fu', b'\x1f:', b'\x1fB', b'\x1fC', b'\x1fD', b'\x1fE', b'\x1fF', b'\x1fG',
+    b'\x1fH', b'\x1fI', b'\x1fJ', b'\x1fK', b'\x1fL', b'\x1fM', b'\x1fN', b'\x1fO', b'\x1fP',
+    b'\x1fQ', b'\x1fR', b'\x1fS', b'\x1fT', b'\x1fU', b'\x1fV', b'\x1fW', b'\x1fY', b'\x1fj',
+    b'\x1fk', b'\x1fq', b'\x1fv', b'\x1fw', b'\x1fx', b'\x1fy', b'\x1fz', b'\x1f', b'\x1f', b'\x1f',
+    b'\x1f', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0',
+    b'0', b'0', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1',
+    b'1', b'1', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2',
+    b'2', b'2', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a',
+    b'a', b'a', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c',
+    b'c', b'c', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e',
+    b'e', b'e', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i',
+    b'i', b'i', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o',
+    b'o', b'o', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's',
+    b's', b's', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't',
+    b't', b't', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b'%', b'%', b'%', b'%', b'%', b'%',
+    b'%', b'%', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'.', b'.', b'.', b'.', b'.', b'.',
+    b'.', b'.', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'3', b'3', b'3', b'3', b'3', b'3',
+    b'3', b'3', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'5', b'5', b'5', b'5', b'5', b'5',
+    b'5', b'5', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'7', b'7', b'7', b'7', b'7', b'7',
+    b'7', b'7', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'9', b'9', b'9', b'9', b'9', b'9',
+    b'9', b'9', b's0', b's1', b's2', b'sa', b'sc', b'se', b'si', b'so', b'ss', b'st', b's', b's',
+    b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's',
+    b's', b's', b's', b's', b't0', b't1', b't2', b'ta', b'tc', b'te', b'ti', b'to', b'ts', b'tt',
+    b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b't',
+    b't', b't', b't', b't', b't', b't', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ',
+    b' ', b' ', b' ', b' ', b' ', b' ', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%',
+    b'%', b'%', b'%', b'%', b'%', b'%', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-',
+    b'-', b'-', b'-', b'-', b'-', b'-', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.',
+    b'.', b'.', b'.', b'.', b'.', b'.', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/',
+    b'/', b'/', b'/', b'/', b'/', b'/', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3',
+    b'3', b'3', b'3', b'3', b'3', b'3', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4',
+    b'4', b'4', b'4', b'4', b'4', b'4', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5',
+    b'5', b'5', b'5', b'5', b'5', b'5', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6',
+    b'6', b'6', b'6', b'6', b'6', b'6', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7',
+    b'7', b'7', b'7', b'7', b'7', b'7', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8',
+    b'8', b'8', b'8', b'8', b'8', b'8', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9',
+    b'9', b'9', b'9', b'9', b'9', b'9', b's0', b's0', b's1', b's1', b's2', b's2', b'sa', b'sa',
+    b'sc', b'sc', b'se', b'se', b'si', b'si', b'so', b'so', b'ss', b'ss', b'st', b'st', b's ',
+    b's%', b's-', b's.', b's/', b's3', b's4', b's5', b's6', b's7', b's8', b's9', b's=', b'sA',
+    b's_', b'sb', b'sd', b'sf', b'sg', b'sh', b'sl', b'sm', b'sn', b'sp', b'sr', b'su', b's', b's',
+    b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's', b's',
+    b't0', b't0', b't1', b't1', b't2', b't2', b'ta', b'ta', b'tc', b'tc', b'te', b'te', b'ti',
+    b'ti', b'to', b'to', b'ts', b'ts', b'tt', b'tt', b't ', b't%', b't-', b't.', b't/', b't3',
+    b't4', b't5', b't6', b't7', b't8', b't9', b't=', b'tA', b't_', b'tb', b'td', b'tf', b'tg',
+    b'th', b'tl', b'tm', b'tn', b'tp', b'tr', b'tu', b't', b't', b't', b't', b't', b't', b't', b't',
+    b't', b't', b't', b't', b't', b't', b't', b't', b't', b't', b' 0', b' 1', b' 2', b' a', b' c',
+    b' e', b' i', b' o', b' s', b' t', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ',
+    b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b'%0', b'%1', b'%2',
+    b'%a', b'%c', b'%e', b'%i', b'%o', b'%s', b'%t', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%',
+    b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'-0',
+    b'-1', b'-2', b'-a', b'-c', b'-e', b'-i', b'-o', b'-s', b'-t', b'-', b'-', b'-', b'-', b'-',
+    b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-',
+    b'-', b'.0', b'.1', b'.2', b'.a', b'.c', b'.e', b'.i', b'.o', b'.s', b'.t', b'.', b'.', b'.',
+    b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.',
+    b'.', b'.', b'.', b' 0', b' 0', b' 1', b' 1', b' 2', b' 2', b' a', b' a', b' c', b' c', b' e',
+    b' e', b' i', b' i', b' o', b' o', b' s', b' s', b' t', b' t', b'  ', b' %', b' -', b' .',
+    b' /', b' 3', b' 4', b' 5', b' 6', b' 7', b' 8', b' 9', b' =', b' A', b' _', b' b', b' d',
+    b' f', b' g', b' h', b' l', b' m', b' n', b' p', b' r', b' u', b' ', b' ', b' ', b' ', b' ',
+    b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b' ', b'%0', b'%0',
+    b'%1', b'%1', b'%2', b'%2', b'%a', b'%a', b'%c', b'%c', b'%e', b'%e', b'%i', b'%i', b'%o',
+    b'%o', b'%s', b'%s', b'%t', b'%t', b'% ', b'%%', b'%-', b'%.', b'%/', b'%3', b'%4', b'%5',
+    b'%6', b'%7', b'%8', b'%9', b'%=', b'%A', b'%_', b'%b', b'%d', b'%f', b'%g', b'%h', b'%l',
+    b'%m', b'%n', b'%p', b'%r', b'%u', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%',
+    b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'%', b'-0', b'-0', b'-1', b'-1', b'-2', b'-2', b'-a',
+    b'-a', b'-c', b'-c', b'-e', b'-e', b'-i', b'-i', b'-o', b'-o', b'-s', b'-s', b'-t', b'-t',
+    b'- ', b'-%', b'--', b'-.', b'-/', b'-3', b'-4', b'-5', b'-6', b'-7', b'-8', b'-9', b'-=',
+    b'-A', b'-_', b'-b', b'-d', b'-f', b'-g', b'-h', b'-l', b'-m', b'-n', b'-p', b'-r', b'-u', b'-',
+    b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-', b'-',
+    b'-', b'.0', b'.0', b'.1', b'.1', b'.2', b'.2', b'.a', b'.a', b'.c', b'.c', b'.e', b'.e', b'.i',
+    b'.i', b'.o', b'.o', b'.s', b'.s', b'.t', b'.t', b'. ', b'.%', b'.-', b'..', b'./', b'.3',
+    b'.4', b'.5', b'.6', b'.7', b'.8', b'.9', b'.=', b'.A', b'._', b'.b', b'.d', b'.f', b'.g',
+    b'.h', b'.l', b'.m', b'.n', b'.p', b'.r', b'.u', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.',
+    b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b'.', b' 0', b' 0', b' 0', b' 0', b' 1',
+    b' 1', b' 1', b' 1', b' 2', b' 2', b' 2', b' 2', b' a', b' a', b' a', b' a', b' c', b' c',
+    b' c', b' c', b' e', b' e', b' e', b' e', b' i', b' i', b' i', b' i', b' o', b' o', b' o',
+    b' o', b' s', b' s', b' s', b' s', b' t', b' t', b' t', b' t', b'  ', b'  ', b' %', b' %',
+    b' -', b' -', b' .', b' .', b' /', b' /', b' 3', b' 3', b' 4', b' 4', b' 5', b' 5', b' 6',
+    b' 6', b' 7', b' 7', b' 8', b' 8', b' 9', b' 9', b' =', b' =', b' A', b' A', b' _', b' _',
+    b' b', b' b', b' d', b' d', b' f', b' f', b' g', b' g', b' h', b' h', b' l', b' l', b' m',
+    b' m', b' n', b' n', b' p', b' p', b' r', b' r', b' u', b' u', b' :', b' B', b' C', b' D',
+    b' E', b' F', b' G', b' H', b' I', b' J', b' K', b' L', b' M', b' N', b' O', b' P', b' Q',
+    b' R', b' S', b' T', b' U', b' V', b' W', b' Y', b' j', b' k', b' q', b' v', b' w', b' x',
+    b' y', b' z', b' ', b' ', b' ', b' ', b'%0', b'%0', b'%0', b'%0', b'%1', b'%1', b'%1', b'%1',
+    b'%2', b'%2', b'%2', b'%2', b'%a', b'%a', b'%a', b'%a', b'%c', b'%c', b'%c', b'%c', b'%e',
+    b'%e', b'%e', b'%e', b'%i', b'%i', b'%i', b'%i', b'%o', b'%o', b'%o', b'%o', b'%s', b'%s',
+    b'%s', b'%s', b'%t', b'%t', b'%t', b'%t', b'% ', b'% ', b'%%', b'%%', b'%-', b'%-', b'%.',
+    b'%.', b'%/', b'%/', b'%3', b'%3', b'%4', b'%4', b'%5', b'%5', b'%6', b'%6', b'%7', b'%7',
+    b'%8', b'%8', b'%9', b'%9', b'%=', b'%=', b'%A', b'%A', b'%_', b'%_', b'%b', b'%b', b'%d',
+    b'%d', b'%f', b'%f', b'%g', b'%g', b'%h', b'%h', b'%l', b'%l', b'%m', b'%m', b'%n', b'%n',
+    b'%p', b'%p', b'%r', b'%r', b'%u', b'%u', b'%:', b'%B', b'%C', b'%D', b'%E', b'%F', b'%G',
+    b'%H', b'%I', b'%J', b'%K', b'%L', b'%M', b'%N', b'%O', b'%P', b'%Q', b'%R', b'%S', b'%T',
+    b'%U', b'%V', b'%W', b'%Y', b'%j', b'%k', b'%q', b'%v', b'%w', b'%x', b'%y', b'%z', b'%', b'%',
+    b'%', b'%', b'!0', b'!0', b'!1', b'!1', b'!2', b'!2', b'!a', b'!a', b'!c', b'!c', b'!e', b'!e',
+    b'!i', b'!i', b'!o', b'!o', b'!s', b'!s', b'!t', b'!t', b'! ', b'!%', b'!-', b'!.', b'!/',
+    b'!3', b'!4', b'!5', b'!6', b'!7', b'!8', b'!9', b'!=', b'!A', b'!_', b'!b', b'!d', b'!f',
+    b'!g', b'!h', b'!l', b'!m', b'!n', b'!p', b'!r', b'!u', b'!', b'!', b'!', b'!', b'!', b'!',
+    b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'!', b'"0', b'"0', b'"1',
+    b'"1', b'"2', b'"2', b'"a', b'"a', b'"c', b'"c', b'"e', b'"e', b'"i', b'"i', b'"o', b'"o',
+    b'"s', b'"s', b'"t', b'"t', b'" ', b'"%', b'"-', b'".', b'"/', b'"3', b'"4', b'"5', b'"6',
+    b'"7', b'"8', b'"9', b'"=', b'"A', b'"_', b'"b', b'"d', b'"f', b'"g', b'"h', b'"l', b'"m',
+    b'"n', b'"p', b'"r', b'"u', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'"',
+    b'"', b'"', b'"', b'"', b'"', b'"', b'"', b'(0', b'(0', b'(1', b'(1', b'(2', b'(2', b'(a',
+    b'(a', b'(c', b'(c', b'(e', b'(e', b'(i', b'(i', b'(o', b'(o', b'(s', b'(s', b'(t', b'(t',
+    b'( ', b'(%', b'(-', b'(.', b'(/', b'(3', b'(4', b'(5', b'(6', b'(7', b'(8', b'(9', b'(=',
+    b'(A', b'(_', b'(b', b'(d', b'(f', b'(g', b'(h', b'(l', b'(m', b'(n', b'(p', b'(r', b'(u', b'(',
+    b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(', b'(',
+    b'(', b')0', b')0', b')1', b')1', b')2', b')2', b')a', b')a', b')c', b')c', b')e', b')e', b')i',
+    b')i', b')o', b')o', b')s', b')s', b')t', b')t', b') ', b')%', b')-', b').', b')/', b')3',
+    b')4', b')5', b')6', b')7', b')8', b')9', b')=', b')A', b')_', b')b', b')d', b')f', b')g',
+    b')h', b')l', b')m', b')n', b')p', b')r', b')u', b')', b')', b')', b')', b')', b')', b')', b')',
+    b')', b')', b')', b')', b')', b')', b')', b')', b')', b')', b'!0', b'!0', b'!0', b'!0', b'!1',
+    b'!1', b'!1', b'!1', b'!2', b'!2', b'!2', b'!2', b'!a', b'!a', b'!a', b'!a', b'!c', b'!c',
+    b'!c', b'!c', b'!e', b'!e', b'!e', b'!e', b'!i', b'!i', b'!i', b'!i', b'!o', b'!o', b'!o',
+    b'!o', b'!s', b'!s', b'!s', b'!s', b'!t', b'!t', b'!t', b'!t', b'! ', b'! ', b'!%', b'!%',
+    b'!-', b'!-', b'!.', b'!.', b'!/', b'!/', b'!3', b'!3', b'!4', b'!4', b'!5', b'!5', b'!6',
+    b'!6', b'!7', b'!7', b'!8', b'!8', b'!9', b'!9', b'!=', b'!=', b'!A', b'!A', b'!_', b'!_',
+    b'!b', b'!b', b'!d', b'!d', b'!f', b'!f', b'!g', b'!g', b'!h', b'!h', b'!l', b'!l', b'!m',
+    b'!m', b'!n', b'!n', b'!p', b'!p', b'!r', b'!r', b'!u', b'!u', b'!:', b'!B', b'!C', b'!D',
+    b'!E', b'!F', b'!G', b'!H', b'!I', b'!J', b'!K', b'!L', b'!M', b'!N', b'!O', b'!P', b'!Q',
+    b'!R', b'!S', b'!T', b'!U', b'!V', b'!W', b'!Y', b'!j', b'!k', b'!q', b'!v', b'!w', b'!x',
+    b'!y', b'!z', b'!', b'!', b'!', b'!', b'"0', b'"0', b'"0', b'"0', b'"1', b'"1', b'"1', b'"1',
+    b'"2', b'"2', b'"2', b'"2', b'"a', b'"a', b'"a', b'"a', b'"c', b'"c', b'"c', b'"c', b'"e',
+    b'"e', b'"e', b'"e', b'"i', b'"i', b'"i', b'"i', b'"o', b'"o', b'"o', b'"o', b'"s', b'"s',
+    b'"s', b'"s', b'"t', b'"t', b'"t', b'"t', b'" ', b'" ', b'"%', b'"%', b'"-', b'"-', b'".',
+    b'".', b'"/', b'"/', b'"3', b'"3', b'"4', b'"4', b'"5', b'"5', b'"6', b'"6', b'"7', b'"7',
+    b'"8', b'"8', b'"9', b'"9', b'"=', b'"=', b'"A', b'"A', b'"_', b'"_', b'"b', b'"b', b'"d',
+    b'"d', b'"f', b'"f', b'"g', b'"g', b'"h', b'"h', b'"l', b'"l', b'"m', b'"m', b'"n', b'"n',
+    b'"p', b'"p', b'"r', b'"r', b'"u', b'"u', b'":', b'"B', b'"C', b'"D', b'"E', b'"F', b'"G',
+    b'"H', b'"I', b'"J', b'"K', b'"L', b'"M', b'"N', b'"O', b'"P', b'"Q', b'"R', b'"S', b'"T',
+    b'"U', b'"V', b'"W', b'"Y', b'"j', b'"k', b'"q', b'"v', b'"w', b'"x', b'"y', b'"z', b'"', b'"',
+    b'"', b'"', b'|0', b'|0', b'|0', b'|0', b'|1', b'|1', b'|1', b'|1', b'|2', b'|2', b'|2', b'|2',
+    b'|a', b'|a', b'|a', b'|a', b'|c', b'|c', b'|c', b'|c', b'|e', b'|e', b'|e', b'|e', b'|i',
+    b'|i', b'|i', b'|i', b'|o', b'|o', b'|o', b'|o', b'|s', b'|s', b'|s', b'|s', b'|t', b'|t',
+    b'|t', b'|t', b'| ', b'| ', b'|%', b'|%', b'|-', b'|-', b'|.', b'|.', b'|/', b'|/', b'|3',
+    b'|3', b'|4', b'|4', b'|5', b'|5', b'|6', b'|6', b'|7', b'|7', b'|8', b'|8', b'|9', b'|9',
+    b'|=', b'|=', b'|A', b'|A', b'|_', b'|_', b'|b', b'|b', b'|d', b'|d', b'|f', b'|f', b'|g',
+    b'|g', b'|h', b'|h', b'|l', b'|l', b'|m', b'|m', b'|n', b'|n', b'|p', b'|p', b'|r', b'|r',
+    b'|u', b'|u', b'|:', b'|B', b'|C', b'|D', b'|E', b'|F', b'|G', b'|H', b'|I', b'|J', b'|K',
+    b'|L', b'|M', b'|N', b'|O', b'|P', b'|Q', b'|R', b'|S', b'|T', b'|U', b'|V', b'|W', b'|Y',
+    b'|j', b'|k', b'|q', b'|v', b'|w', b'|x', b'|y', b'|z', b'|', b'|', b'|', b'|', b'#0', b'#0',
+    b'#1', b'#1', b'#2', b'#2', b'#a', b'#a', b'#c', b'#c', b'#e', b'#e', b'#i', b'#i', b'#o',
+    b'#o', b'#s', b'#s', b'#t', b'#t', b'# ', b'#%', b'#-', b'#.', b'#/', b'#3', b'#4', b'#5',
+    b'#6', b'#7', b'#8', b'#9', b'#=', b'#A', b'#_', b'#b', b'#d', b'#f', b'#g', b'#h', b'#l',
+    b'#m', b'#n', b'#p', b'#r', b'#u', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#',
+    b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'#', b'>0', b'>0', b'>1', b'>1', b'>2', b'>2', b'>a',
+    b'>a', b'>c', b'>c', b'>e', b'>e', b'>i', b'>i', b'>o', b'>o', b'>s', b'>s', b'>t', b'>t',
+    b'> ', b'>%', b'>-', b'>.', b'>/', b'>3', b'>4', b'>5', b'>6', b'>7', b'>8', b'>9', b'>=',
+    b'>A', b'>_', b'>b', b'>d', b'>f', b'>g', b'>h', b'>l', b'>m', b'>n', b'>p', b'>r', b'>u', b'>',
+    b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>', b'>',
+    b'>', b'#0', b'#0', b'#0', b'#0', b'#1', b'#1', b'#1', b'#1', b'#2', b'#2', b'#2', b'#2', b'#a',
+    b'#a', b'#a', b'#a', b'#c', b'#c', b'#c', b'#c', b'#e', b'#e', b'#e', b'#e', b'#i', b'#i',
+    b'#i', b'#i', b'#o', b'#o', b'#o', b'#o', b'#s', b'#s', b'#s', b'#s', b'#t', b'#t', b'#t',
+    b'#t', b'# ', b'# ', b'#%', b'#%', b'#-', b'#-', b'#.', b'#.', b'#/', b'#/', b'#3', b'#3',
+    b'#4', b'#4', b'#5', b'#5', b'#6', b'#6', b'#7', b'#7', b'#8', b'#8', b'#9', b'#9', b'#=',
+    b'#=', b'#A', b'#A', b'#_', b'#_', b'#b', b'#b', b'#d', b'#d', b'#f', b'#f', b'#g', b'#g',
+    b'#h', b'#h', b'#l', b'#l', b'#m', b'#m', b'#n', b'#n', b'#p', b'#p', b'#r', b'#r', b'#u',
+    b'#u', b'#:', b'#B', b'#C', b'#D', b'#E', b'#F', b'#G', b'#H', b'#I', b'#J', b'#K', b'#L',
+    b'#M', b'#N', b'#O', b'#P', b'#Q', b'#R', b'#S', b'#T', b'#U', b'#V', b'#W', b'#Y', b'#j',
+    b'#k', b'#q', b'#v', b'#w', b'#x', b'#y', b'#z', b'#', b'#', b'#', b'#', b'>0', b'>0', b'>0',
+    b'>0', b'>1', b'>1', b'>1', b'>1', b'>2', b'>2', b'>2', b'>2', b'>a', b'>a', b'>a', b'>a',
+    b'>c', b'>c', b'>c', b'>c', b'>e', b'>e', b'>e', b'>e', b'>i', b'>i', b'>i', b'>i', b'>o',
+    b'>o', b'>o', b'>o', b'>s', b'>s', b'>s', b'>s', b'>t', b'>t', b'>t', b'>t', b'> ', b'> ',
+    b'>%', b'>%', b'>-', b'>-', b'>.', b'>.', b'>/', b'>/', b'>3', b'>3', b'>4', b'>4', b'>5',
+    b'>5', b'>6', b'>6', b'>7', b'>7', b'>8', b'>8', b'>9', b'>9', b'>=', b'>=', b'>A', b'>A',
+    b'>_', b'>_', b'>b', b'>b', b'>d', b'>d', b'>f', b'>f', b'>g', b'>g', b'>h', b'>h', b'>l',
+    b'>l', b'>m', b'>m', b'>n', b'>n', b'>p', b'>p', b'>r', b'>r', b'>u', b'>u', b'>:', b'>B',
+    b'>C', b'>D', b'>E', b'>F', b'>G', b'>H', b'>I', b'>J', b'>K', b'>L', b'>M', b'>N', b'>O',
+    b'>P', b'>Q', b'>R', b'>S', b'>T', b'>U', b'>V', b'>W', b'>Y', b'>j', b'>k', b'>q', b'>v',
+    b'>w', b'>x', b'>y', b'>z', b'>', b'>', b'>', b'>', b'&0', b'&0', b'&1', b'&1', b'&2', b'&2',
+    b'&a', b'&a', b'&c', b'&c', b'&e', b'&e', b'&i', b'&i', b'&o', b'&o', b'&s', b'&s', b'&t',
+    b'&t', b'& ', b'&%', b'&-', b'&.', b'&/', b'&3', b'&4', b'&5', b'&6', b'&7', b'&8', b'&9',
+    b'&=', b'&A', b'&_', b'&b', b'&d', b'&f', b'&g', b'&h', b'&l', b'&m', b'&n', b'&p', b'&r',
+    b'&u', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&', b'&',
+    b'&', b'&', b'&', b'*0', b'*0', b'*1', b'*1', b'*2', b'*2', b'*a', b'*a', b'*c', b'*c', b'*e',
+    b'*e', b'*i', b'*i', b'*o', b'*o', b'*s', b'*s', b'*t', b'*t', b'* ', b'*%', b'*-', b'*.',
+    b'*/', b'*3', b'*4', b'*5', b'*6', b'*7', b'*8', b'*9', b'*=', b'*A', b'*_', b'*b', b'*d',
+    b'*f', b'*g', b'*h', b'*l', b'*m', b'*n', b'*p', b'*r', b'*u', b'*', b'*', b'*', b'*', b'*',
+    b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b'*', b',0', b',0',
+    b',1', b',1', b',2', b',2', b',a', b',a', b',c', b',c', b',e', b',e', b',i', b',i', b',o',
+    b',o', b',s', b',s', b',t', b',t', b', ', b',%', b',-', b',.', b',/', b',3', b',4', b',5',
+    b',6', b',7', b',8', b',9', b',=', b',A', b',_', b',b', b',d', b',f', b',g', b',h', b',l',
+    b',m', b',n', b',p', b',r', b',u', b',', b',', b',', b',', b',', b',', b',', b',', b',', b',',
+    b',', b',', b',', b',', b',', b',', b',', b',', b';0', b';0', b';1', b';1', b';2', b';2', b';a',
+    b';a', b';c', b';c', b';e', b';e', b';i', b';i', b';o', b';o', b';s', b';s', b';t', b';t',
+    b'; ', b';%', b';-', b';.', b';/', b';3', b';4', b';5', b';6', b';7', b';8', b';9', b';=',
+    b';A', b';_', b';b', b';d', b';f', b';g', b';h', b';l', b';m', b';n', b';p', b';r', b';u', b';',
+    b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';', b';',
+    b';', b'&0', b'&0', b'&0', b'&0', b'&1', b'&1', b'&1', b'&1', b'&2', b'&2', b'&2', b'&2', b'&a',
+    b'&a', b'&a', b'&a', b'&c', b'&c', b'&c', b'&c', b'&e', b'&e', b'&e', b'&e', b'&i', b'&i',
+    b'&i', b'&i', b'&o', b'&o', b'&o', b'&o', b'&s', b'&s', b'&s', b'&s', b'&t', b'&t', b'&t',
+    b'&t', b'& ', b'& ', b'&%', b'&%', b'&-', b'&-', b'&.', b'&.', b'&/', b'&/', b'&3', b'&3',
+    b'&4', b'&4', b'&5', b'&5', b'&6', b'&6', b'&7', b'&7', b'&8', b'&8', b'&9', b'&9', b'&=',
+    b'&=', b'&A', b'&A', b'&_', b'&_', b'&b', b'&b', b'&d', b'&d', b'&f', b'&f', b'&g', b'&g',
+    b'&h', b'&h', b'&l', b'&l', b'&m', b'&m', b'&n', b'&n', b'&p', b'&p', b'&r', b'&r', b'&u',
+    b'&u', b'&:', b'&B', b'&C', b'&D', b'&E', b'&F', b'&G', b'&H', b'&I', b'&J', b'&K', b'&L',
+    b'&M', b'&N', b'&O', b'&P', b'&Q', b'&R', b'&S', b'&T', b'&U', b'&V', b'&W', b'&Y', b'&j',
+    b'&k', b'&q', b'&v', b'&w', b'&x', b'&y', b'&z', b'&', b'&', b'&', b'&', b'*0', b'*0', b'*0',
+    b'*0', b'*1', b'*1', b'*1', b'*1', b'*2', b'*2', b'*2', b'*2', b'*a', b'*a', b'*a', b'*a',
+    b'*c', b'*c', b'*c', b'*c', b'*e', b'*e', b'*e', b'*e', b'*i', b'*i', b'*i', b'*i', b'*o',
+    b'*o', b'*o', b'*o', b'*s', b'*s', b'*s', b'*s', b'*t', b'*t', b'*t', b'*t', b'* ', b'* ',
+    b'*%', b'*%', b'*-', b'*-', b'*.', b'*.', b'*/', b'*/', b'*3', b'*3', b'*4', b'*4', b'*5',
+    b'*5', b'*6', b'*6', b'*7', b'*7', b'*8', b'*8', b'*9', b'*9', b'*=', b'*=', b'*A', b'*A',
+    b'*_', b'*_', b'*b', b'*b', b'*d', b'*d', b'*f', b'*f', b'*g', b'*g', b'*h', b'*h', b'*l',
+    b'*l', b'*m', b'*m', b'*n', b'*n', b'*p', b'*p', b'*r', b'*r', b'*u', b'*u', b'*:', b'*B',
+    b'*C', b'*D', b'*E', b'*F', b'*G', b'*H', b'*I', b'*J', b'*K', b'*L', b'*M', b'*N', b'*O',
+    b'*P', b'*Q', b'*R', b'*S', b'*T', b'*U', b'*V', b'*W', b'*Y', b'*j', b'*k', b'*q', b'*v',
+    b'*w', b'*x', b'*y', b'*z', b'*', b'*', b'*', b'*', b'?0', b'?0', b'?0', b'?0', b'?1', b'?1',
+    b'?1', b'?1', b'?2', b'?2', b'?2', b'?2', b'?a', b'?a', b'?a', b'?a', b'?c', b'?c', b'?c',
+    b'?c', b'?e', b'?e', b'?e', b'?e', b'?i', b'?i', b'?i', b'?i', b'?o', b'?o', b'?o', b'?o',
+    b'?s', b'?s', b'?s', b'?s', b'?t', b'?t', b'?t', b'?t', b'? ', b'? ', b'?%', b'?%', b'?-',
+    b'?-', b'?.', b'?.', b'?/', b'?/', b'?3', b'?3', b'?4', b'?4', b'?5', b'?5', b'?6', b'?6',
+    b'?7', b'?7', b'?8', b'?8', b'?9', b'?9', b'?=', b'?=', b'?A', b'?A', b'?_', b'?_', b'?b',
+    b'?b', b'?d', b'?d', b'?f', b'?f', b'?g', b'?g', b'?h', b'?h', b'?l', b'?l', b'?m', b'?m',
+    b'?n', b'?n', b'?p', b'?p', b'?r', b'?r', b'?u', b'?u', b'?:', b'?B', b'?C', b'?D', b'?E',
+    b'?F', b'?G', b'?H', b'?I', b'?J', b'?K', b'?L', b'?M', b'?N', b'?O', b'?P', b'?Q', b'?R',
+    b'?S', b'?T', b'?U', b'?V', b'?W', b'?Y', b'?j', b'?k', b'?q', b'?v', b'?w', b'?x', b'?y',
+    b'?z', b'?', b'?', b'?', b'?', b"'0", b"'0", b"'1", b"'1", b"'2", b"'2", b"'a", b"'a", b"'c",
+    b"'c", b"'e", b"'e", b"'i", b"'i", b"'o", b"'o", b"'s", b"'s", b"'t", b"'t", b"' ", b"'%",
+    b"'-", b"'.", b"'/", b"'3", b"'4", b"'5", b"'6", b"'7", b"'8", b"'9", b"'=", b"'A", b"'_",
+    b"'b", b"'d", b"'f", b"'g", b"'h", b"'l", b"'m", b"'n", b"'p", b"'r", b"'u", b"'", b"'", b"'",
+    b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b"'", b'+0',
+    b'+0', b'+1', b'+1', b'+2', b'+2', b'+a', b'+a', b'+c', b'+c', b'+e', b'+e', b'+i', b'+i',
+    b'+o', b'+o', b'+s', b'+s', b'+t', b'+t', b'+ ', b'+%', b'+-', b'+.', b'+/', b'+3', b'+4',
+    b'+5', b'+6', b'+7', b'+8', b'+9', b'+=', b'+A', b'+_', b'+b', b'+d', b'+f', b'+g', b'+h',
+    b'+l', b'+m', b'+n', b'+p', b'+r', b'+u', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+',
+    b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b'+', b"'0", b"'0", b"'0", b"'0", b"'1", b"'1",
+    b"'1", b"'1", b"'2", b"'2", b"'2", b"'2", b"'a", b"'a", b"'a", b"'a", b"'c", b"'c", b"'c",
+    b"'c", b"'e", b"'e", b"'e", b"'e", b"'i", b"'i", b"'i", b"'i", b"'o", b"'o", b"'o", b"'o",
+    b"'s", b"'s", b"'s", b"'s", b"'t", b"'t", b"'t", b"'t", b"' ", b"' ", b"'%", b"'%", b"'-",
+    b"'-", b"'.", b"'.", b"'/", b"'/", b"'3", b"'3", b"'4", b"'4", b"'5", b"'5", b"'6", b"'6",
+    b"'7", b"'7", b"'8", b"'8", b"'9", b"'9", b"'=", b"'=", b"'A", b"'A", b"'_", b"'_", b"'b",
+    b"'b", b"'d", b"'d", b"'f", b"'f", b"'g", b"'g", b"'h", b"'h", b"'l", b"'l", b"'m", b"'m",
+    b"'n", b"'n", b"'p", b"'p", b"'r", b"'r", b"'u", b"'u", b"':", b"'B", b"'C", b"'D", b"'E",
+    b"'F", b"'G", b"'H", b"'I", b"'J", b"'K", b"'L", b"'M", b"'N", b"'O", b"'P", b"'Q", b"'R",
+    b"'S", b"'T", b"'U", b"'V", b"'W", b"'Y", b"'j", b"'k", b"'q", b"'v", b"'w", b"'x", b"'y",
+    b"'z", b"'", b"'", b"'", b"'", b'+0', b'+0', b'+0', b'+0', b'+1', b'+1', b'+1', b'+1', b'+2',
+    b'+2', b'+2', b'+2', b'+a', b'+a', b'+a', b'+a', b'+c', b'+c', b'+c', b'+c', b'+e', b'+e',
+    b'+e', b'+e', b'+i', b'+i', b'+i', b'+i', b'+o', b'+o', b'+o', b'+o', b'+s', b'+s', b'+s',
+    b'+s', b'+t', b'+t', b'+t', b'+t', b'+ ', b'+ ', b'+%', b'+%', b'+-', b'+-', b'+.', b'+.',
+    b'+/', b'+/', b'+3', b'+3', b'+4', b'+4', b'+5', b'+5', b'+6', b'+6', b'+7', b'+7', b'+8',
+    b'+8', b'+9', b'+9', b'+=', b'+=', b'+A', b'+A', b'+_', b'+_', b'+b', b'+b', b'+d', b'+d',
+    b'+f', b'+f', b'+g', b'+g', b'+h', b'+h', b'+l', b'+l', b'+m', b'+m', b'+n', b'+n', b'+p',
+    b'+p', b'+r', b'+r', b'+u', b'+u', b'+:', b'+B', b'+C', b'+D', b'+E', b'+F', b'+G', b'+H',
+    b'+I', b'+J', b'+K', b'+L', b'+M', b'+N', b'+O', b'+P', b'+Q', b'+R', b'+S', b'+T', b'+U',
+    b'+V', b'+W', b'+Y', b'+j', b'+k', b'+q', b'+v', b'+w', b'+x', b'+y', b'+z', b'+', b'+', b'+',
+    b'+', b'(0', b'(0', b'(0', b'(0', b'(1', b'(1', b'(1', b'(1', b'(2', b'(2', b'(2', b'(2', b'(a',
+    b'(a', b'(a', b'(a', b'(c', b'(c', b'(c', b'(c', b'(e', b'(e', b'(e', b'(e', b'(i', b'(i',
+    b'(i', b'(i', b'(o', b'(o', b'(o', b'(o', b'(s', b'(s', b'(s', b'(s', b'(t', b'(t', b'(t',
+    b'(t', b'( ', b'( ', b'(%', b'(%', b'(-', b'(-', b'(.', b'(.', b'(/', b'(/', b'(3', b'(3',
+    b'(4', b'(4', b'(5', b'(5', b'(6', b'(6', b'(7', b'(7', b'(8', b'(8', b'(9', b'(9', b'(=',
+    b'(=', b'(A', b'(A', b'(_', b'(_', b'(b', b'(b', b'(d', b'(d', b'(f', b'(f', b'(g', b'(g',
+    b'(h', b'(h', b'(l', b'(l', b'(m', b'(m', b'(n', b'(n', b'(p', b'(p', b'(r', b'(r', b'(u',
+    b'(u', b'(:', b'(B', b'(C', b'(D', b'(E', b'(F', b'(G', b'(H', b'(I', b'(J', b'(K', b'(L',
+    b'(M', b'(N', b'(O', b'(P', b'(Q', b'(R', b'(S', b'(T', b'(U', b'(V', b'(W', b'(Y', b'(j',
+    b'(k', b'(q', b'(v', b'(w', b'(x', b'(y', b'(z', b'(', b'(', b'(', b'(', b')0', b')0', b')0',
+    b')0', b')1', b')1', b')1', b')1', b')2', b')2', b')2', b')2', b')a', b')a', b')a', b')a',
+    b')c', b')c', b')c', b')c', b')e', b')e', b')e', b')e', b')i', b')i', b')i', b')i', b')o',
+    b')o', b')o', b')o', b')s', b')s', b')s', b')s', b')t', b')t', b')t', b')t', b') ', b') ',
+    b')%', b')%', b')-', b')-', b').', b').', b')/', b')/', b')3', b')3', b')4', b')4', b')5',
+    b')5', b')6', b')6', b')7', b')7', b')8', b')8', b')9', b')9', b')=', b')=', b')A', b')A',
+    b')_', b')_', b')b', b')b', b')d', b')d', b')f', b')f', b')g', b')g', b')h', b')h', b')l',
+    b')l', b')m', b')m', b')n', b')n', b')p', b')p', b')r', b')r', b')u', b')u', b'):', b')B',
+    b')C', b')D', b')E', b')F', b')G', b')H', b')I', b')J', b')K', b')L', b')M', b')N', b')O',
+    b')P', b')Q', b')R', b')S', b')T', b')U', b')V', b')W', b')Y', b')j', b')k', b')q', b')v',
+    b')w', b')x', b')y', b')z', b')', b')', b')', b')', b',0', b',0', b',0', b',0', b',1', b',1',
+    b',1', b',1', b',2', b',2', b',2', b',2', b',a', b',a', b',a', b',a', b',c', b',c', b',c',
+    b',c', b',e', b',e', b',e', b',e', b',i', b',i', b',i', b',i', b',o', b',o', b',o', b',o',
+    b',s', b',s', b',s', b',s', b',t', b',t', b',t', b',t', b', ', b', ', b',%', b',%', b',-',
+    b',-', b',.', b',.', b',/', b',/', b',3', b',3', b',4', b',4', b',5', b',5', b',6', b',6',
+    b',7', b',7', b',8', b',8', b',9', b',9', b',=', b',=', b',A', b',A', b',_', b',_', b',b',
+    b',b', b',d', b',d', b',f', b',f', b',g', b',g', b',h', b',h', b',l', b',l', b',m', b',m',
+    b',n', b',n', b',p', b',p', b',r', b',r', b',u', b',u', b',:', b',B', b',C', b',D', b',E',
+    b',F', b',G', b',H', b',I', b',J', b',K', b',L', b',M', b',N', b',O', b',P', b',Q', b',R',
+    b',S', b',T', b',U', b',V', b',W', b',Y', b',j', b',k', b',q', b',v', b',w', b',x', b',y',
+    b',z', b',', b',', b',', b',', b';0', b';0', b';0', b';0', b';1', b';1', b';1', b';1', b';2',
+    b';2', b';2', b';2', b';a', b';a', b';a', b';a', b';c', b';c', b';c', b';c', b';e', b';e',
+    b';e', b';e', b';i', b';i', b';i', b';i', b';o', b';o', b';o', b';o', b';s', b';s', b';s',
+    b';s', b';t', b';t', b';t', b';t', b'; ', b'; ', b';%', b';%', b';-', b';-', b';.', b';.',
+    b';/', b';/', b';3', b';3', b';4', b';4', b';5', b';5', b';6', b';6', b';7', b';7', b';8',
+    b';8', b';9', b';9', b';=', b';=', b';A', b';A', b';_', b';_', b';b', b';b', b';d', b';d',
+    b';f', b';f', b';g', b';g', b';h', b';h', b';l', b';l', b';m', b';m', b';n', b';n', b';p',
+    b';p', b';r', b';r', b';u', b';u', b';:', b';B', b';C', b';D', b';E', b';F', b';G', b';H',
+    b';I', b';J', b';K', b';L', b';M', b';N', b';O', b';P', b';Q', b';R', b';S', b';T', b';U',
+    b';V', b';W', b';Y', b';j', b';k', b';q', b';v', b';w', b';x', b';y', b';z', b';', b';', b';',
+    b';', b'-0', b'-0', b'-0', b'-0', b'-1', b'-1', b'-1', b'-1', b'-2', b'-2', b'-2', b'-2', b'-a',
+    b'-a', b'-a', b'-a', b'-c', b'-c', b'-c', b'-c', b'-e', b'-e', b'-e', b'-e', b'-i', b'-i',
+    b'-i', b'-i', b'-o', b'-o', b'-o', b'-o', b'-s', b'-s', b'-s', b'-s', b'-t', b'-t', b'-t',
+    b'-t', b'- ', b'- ', b'-%', b'-%', b'--', b'--', b'-.', b'-.', b'-/', b'-/', b'-3', b'-3',
+    b'-4', b'-4', b'-5', b'-5', b'-6', b'-6', b'-7', b'-7', b'-8', b'-8', b'-9', b'-9', b'-=',
+    b'-=', b'-A', b'-A', b'-_', b'-_', b'-b', b'-b', b'-d', b'-d', b'-f', b'-f', b'-g', b'-g',
+    b'-h', b'-h', b'-l', b'-l', b'-m', b'-m', b'-n', b'-n', b'-p', b'-p', b'-r', b'-r', b'-u',
+    b'-u', b'-:', b'-B', b'-C', b'-D', b'-E', b'-F', b'-G', b'-H', b'-I', b'-J', b'-K', b'-L',
+    b'-M', b'-N', b'-O', b'-P', b'-Q', b'-R', b'-S', b'-T', b'-U', b'-V', b'-W', b'-Y', b'-j',
+    b'-k', b'-q', b'-v', b'-w', b'-x', b'-y', b'-z', b'-', b'-', b'-', b'-', b'.0', b'.0', b'.0',
+    b'.0', b'.1', b'.1', b'.1', b'.1', b'.2', b'.2', b'.2', b'.2', b'.a', b'.a', b'.a', b'.a',
+    b'.c', b'.c', b'.c', b'.c', b'.e', b'.e', b'.e', b'.e', b'.i', b'.i', b'.i', b'.i', b'.o',
+    b'.o', b'.o', b'.o', b'.s', b'.s', b'.s', b'.s', b'.t', b'.t', b'.t', b'.t', b'. ', b'. ',
+    b'.%', b'.%', b'.-', b'.-', b'..', b'..', b'./', b'./', b'.3', b'.3', b'.4', b'.4', b'.5',
+    b'.5', b'.6', b'.6', b'.7', b'.7', b'.8', b'.8', b'.9', b'.9', b'.=', b'.=', b'.A', b'.A',
+    b'._', b'._', b'.b', b'.b', b'.d', b'.d', b'.f', b'.f', b'.g', b'.g', b'.h', b'.h', b'.l',
+    b'.l', b'.m', b'.m', b'.n', b'.n', b'.p', b'.p', b'.r', b'.r', b'.u', b'.u', b'.:', b'.B',
+    b'.C', b'.D', b'.E', b'.F', b'.G', b'.H', b'.I', b'.J', b'.K', b'.L', b'.M', b'.N', b'.O',
+    b'.P', b'.Q', b'.R', b'.S', b'.T', b'.U', b'.V', b'.W', b'.Y', b'.j', b'.k', b'.q', b'.v',
+    b'.w', b'.x', b'.y', b'.z', b'.', b'.', b'.', b'.', b'/0', b'/1', b'/2', b'/a', b'/c', b'/e',
+    b'/i', b'/o', b'/s', b'/t', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/',
+    b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'30', b'31', b'32', b'3a',
+    b'3c', b'3e', b'3i', b'3o', b'3s', b'3t', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3',
+    b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'40', b'41',
+    b'42', b'4a', b'4c', b'4e', b'4i', b'4o', b'4s', b'4t', b'4', b'4', b'4', b'4', b'4', b'4',
+    b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4',
+    b'50', b'51', b'52', b'5a', b'5c', b'5e', b'5i', b'5o', b'5s', b'5t', b'5', b'5', b'5', b'5',
+    b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5',
+    b'5', b'5', b'60', b'61', b'62', b'6a', b'6c', b'6e', b'6i', b'6o', b'6s', b'6t', b'6', b'6',
+    b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6',
+    b'6', b'6', b'6', b'6', b'70', b'71', b'72', b'7a', b'7c', b'7e', b'7i', b'7o', b'7s', b'7t',
+    b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7',
+    b'7', b'7', b'7', b'7', b'7', b'7', b'80', b'81', b'82', b'8a', b'8c', b'8e', b'8i', b'8o',
+    b'8s', b'8t', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8',
+    b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'90', b'91', b'92', b'9a', b'9c', b'9e',
+    b'9i', b'9o', b'9s', b'9t', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9',
+    b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'/0', b'/0', b'/1', b'/1',
+    b'/2', b'/2', b'/a', b'/a', b'/c', b'/c', b'/e', b'/e', b'/i', b'/i', b'/o', b'/o', b'/s',
+    b'/s', b'/t', b'/t', b'/ ', b'/%', b'/-', b'/.', b'//', b'/3', b'/4', b'/5', b'/6', b'/7',
+    b'/8', b'/9', b'/=', b'/A', b'/_', b'/b', b'/d', b'/f', b'/g', b'/h', b'/l', b'/m', b'/n',
+    b'/p', b'/r', b'/u', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/', b'/',
+    b'/', b'/', b'/', b'/', b'/', b'/', b'30', b'30', b'31', b'31', b'32', b'32', b'3a', b'3a',
+    b'3c', b'3c', b'3e', b'3e', b'3i', b'3i', b'3o', b'3o', b'3s', b'3s', b'3t', b'3t', b'3 ',
+    b'3%', b'3-', b'3.', b'3/', b'33', b'34', b'35', b'36', b'37', b'38', b'39', b'3=', b'3A',
+    b'3_', b'3b', b'3d', b'3f', b'3g', b'3h', b'3l', b'3m', b'3n', b'3p', b'3r', b'3u', b'3', b'3',
+    b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3', b'3',
+    b'40', b'40', b'41', b'41', b'42', b'42', b'4a', b'4a', b'4c', b'4c', b'4e', b'4e', b'4i',
+    b'4i', b'4o', b'4o', b'4s', b'4s', b'4t', b'4t', b'4 ', b'4%', b'4-', b'4.', b'4/', b'43',
+    b'44', b'45', b'46', b'47', b'48', b'49', b'4=', b'4A', b'4_', b'4b', b'4d', b'4f', b'4g',
+    b'4h', b'4l', b'4m', b'4n', b'4p', b'4r', b'4u', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4',
+    b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'4', b'50', b'50', b'51', b'51', b'52',
+    b'52', b'5a', b'5a', b'5c', b'5c', b'5e', b'5e', b'5i', b'5i', b'5o', b'5o', b'5s', b'5s',
+    b'5t', b'5t', b'5 ', b'5%', b'5-', b'5.', b'5/', b'53', b'54', b'55', b'56', b'57', b'58',
+    b'59', b'5=', b'5A', b'5_', b'5b', b'5d', b'5f', b'5g', b'5h', b'5l', b'5m', b'5n', b'5p',
+    b'5r', b'5u', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5', b'5',
+    b'5', b'5', b'5', b'5', b'5', b'/0', b'/0', b'/0', b'/0', b'/1', b'/1', b'/1', b'/1', b'/2',
+    b'/2', b'/2', b'/2', b'/a', b'/a', b'/a', b'/a', b'/c', b'/c', b'/c', b'/c', b'/e', b'/e',
+    b'/e', b'/e', b'/i', b'/i', b'/i', b'/i', b'/o', b'/o', b'/o', b'/o', b'/s', b'/s', b'/s',
+    b'/s', b'/t', b'/t', b'/t', b'/t', b'/ ', b'/ ', b'/%', b'/%', b'/-', b'/-', b'/.', b'/.',
+    b'//', b'//', b'/3', b'/3', b'/4', b'/4', b'/5', b'/5', b'/6', b'/6', b'/7', b'/7', b'/8',
+    b'/8', b'/9', b'/9', b'/=', b'/=', b'/A', b'/A', b'/_', b'/_', b'/b', b'/b', b'/d', b'/d',
+    b'/f', b'/f', b'/g', b'/g', b'/h', b'/h', b'/l', b'/l', b'/m', b'/m', b'/n', b'/n', b'/p',
+    b'/p', b'/r', b'/r', b'/u', b'/u', b'/:', b'/B', b'/C', b'/D', b'/E', b'/F', b'/G', b'/H',
+    b'/I', b'/J', b'/K', b'/L', b'/M', b'/N', b'/O', b'/P', b'/Q', b'/R', b'/S', b'/T', b'/U',
+    b'/V', b'/W', b'/Y', b'/j', b'/k', b'/q', b'/v', b'/w', b'/x', b'/y', b'/z', b'/', b'/', b'/',
+    b'/', b'30', b'30', b'30', b'30', b'31', b'31', b'31', b'31', b'32', b'32', b'32', b'32', b'3a',
+    b'3a', b'3a', b'3a', b'3c', b'3c', b'3c', b'3c', b'3e', b'3e', b'3e', b'3e', b'3i', b'3i',
+    b'3i', b'3i', b'3o', b'3o', b'3o', b'3o', b'3s', b'3s', b'3s', b'3s', b'3t', b'3t', b'3t',
+    b'3t', b'3 ', b'3 ', b'3%', b'3%', b'3-', b'3-', b'3.', b'3.', b'3/', b'3/', b'33', b'33',
+    b'34', b'34', b'35', b'35', b'36', b'36', b'37', b'37', b'38', b'38', b'39', b'39', b'3=',
+    b'3=', b'3A', b'3A', b'3_', b'3_', b'3b', b'3b', b'3d', b'3d', b'3f', b'3f', b'3g', b'3g',
+    b'3h', b'3h', b'3l', b'3l', b'3m', b'3m', b'3n', b'3n', b'3p', b'3p', b'3r', b'3r', b'3u',
+    b'3u', b'3:', b'3B', b'3C', b'3D', b'3E', b'3F', b'3G', b'3H', b'3I', b'3J', b'3K', b'3L',
+    b'3M', b'3N', b'3O', b'3P', b'3Q', b'3R', b'3S', b'3T', b'3U', b'3V', b'3W', b'3Y', b'3j',
+    b'3k', b'3q', b'3v', b'3w', b'3x', b'3y', b'3z', b'3', b'3', b'3', b'3', b'00', b'01', b'02',
+    b'0a', b'0c', b'0e', b'0i', b'0o', b'0s', b'0t', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0',
+    b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'10',
+    b'11', b'12', b'1a', b'1c', b'1e', b'1i', b'1o', b'1s', b'1t', b'1', b'1', b'1', b'1', b'1',
+    b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1',
+    b'1', b'20', b'21', b'22', b'2a', b'2c', b'2e', b'2i', b'2o', b'2s', b'2t', b'2', b'2', b'2',
+    b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2',
+    b'2', b'2', b'2', b'a0', b'a1', b'a2', b'aa', b'ac', b'ae', b'ai', b'ao', b'as', b'at', b'a',
+    b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a',
+    b'a', b'a', b'a', b'a', b'a', b'c0', b'c1', b'c2', b'ca', b'cc', b'ce', b'ci', b'co', b'cs',
+    b'ct', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c',
+    b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'e0', b'e1', b'e2', b'ea', b'ec', b'ee', b'ei',
+    b'eo', b'es', b'et', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e',
+    b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'i0', b'i1', b'i2', b'ia', b'ic',
+    b'ie', b'ii', b'io', b'is', b'it', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i',
+    b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'o0', b'o1', b'o2',
+    b'oa', b'oc', b'oe', b'oi', b'oo', b'os', b'ot', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o',
+    b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'00',
+    b'00', b'01', b'01', b'02', b'02', b'0a', b'0a', b'0c', b'0c', b'0e', b'0e', b'0i', b'0i',
+    b'0o', b'0o', b'0s', b'0s', b'0t', b'0t', b'0 ', b'0%', b'0-', b'0.', b'0/', b'03', b'04',
+    b'05', b'06', b'07', b'08', b'09', b'0=', b'0A', b'0_', b'0b', b'0d', b'0f', b'0g', b'0h',
+    b'0l', b'0m', b'0n', b'0p', b'0r', b'0u', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0',
+    b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'0', b'10', b'10', b'11', b'11', b'12', b'12',
+    b'1a', b'1a', b'1c', b'1c', b'1e', b'1e', b'1i', b'1i', b'1o', b'1o', b'1s', b'1s', b'1t',
+    b'1t', b'1 ', b'1%', b'1-', b'1.', b'1/', b'13', b'14', b'15', b'16', b'17', b'18', b'19',
+    b'1=', b'1A', b'1_', b'1b', b'1d', b'1f', b'1g', b'1h', b'1l', b'1m', b'1n', b'1p', b'1r',
+    b'1u', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1', b'1',
+    b'1', b'1', b'1', b'20', b'20', b'21', b'21', b'22', b'22', b'2a', b'2a', b'2c', b'2c', b'2e',
+    b'2e', b'2i', b'2i', b'2o', b'2o', b'2s', b'2s', b'2t', b'2t', b'2 ', b'2%', b'2-', b'2.',
+    b'2/', b'23', b'24', b'25', b'26', b'27', b'28', b'29', b'2=', b'2A', b'2_', b'2b', b'2d',
+    b'2f', b'2g', b'2h', b'2l', b'2m', b'2n', b'2p', b'2r', b'2u', b'2', b'2', b'2', b'2', b'2',
+    b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'2', b'a0', b'a0',
+    b'a1', b'a1', b'a2', b'a2', b'aa', b'aa', b'ac', b'ac', b'ae', b'ae', b'ai', b'ai', b'ao',
+    b'ao', b'as', b'as', b'at', b'at', b'a ', b'a%', b'a-', b'a.', b'a/', b'a3', b'a4', b'a5',
+    b'a6', b'a7', b'a8', b'a9', b'a=', b'aA', b'a_', b'ab', b'ad', b'af', b'ag', b'ah', b'al',
+    b'am', b'an', b'ap', b'ar', b'au', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a',
+    b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'a', b'00', b'00', b'00', b'00', b'01', b'01', b'01',
+    b'01', b'02', b'02', b'02', b'02', b'0a', b'0a', b'0a', b'0a', b'0c', b'0c', b'0c', b'0c',
+    b'0e', b'0e', b'0e', b'0e', b'0i', b'0i', b'0i', b'0i', b'0o', b'0o', b'0o', b'0o', b'0s',
+    b'0s', b'0s', b'0s', b'0t', b'0t', b'0t', b'0t', b'0 ', b'0 ', b'0%', b'0%', b'0-', b'0-',
+    b'0.', b'0.', b'0/', b'0/', b'03', b'03', b'04', b'04', b'05', b'05', b'06', b'06', b'07',
+    b'07', b'08', b'08', b'09', b'09', b'0=', b'0=', b'0A', b'0A', b'0_', b'0_', b'0b', b'0b',
+    b'0d', b'0d', b'0f', b'0f', b'0g', b'0g', b'0h', b'0h', b'0l', b'0l', b'0m', b'0m', b'0n',
+    b'0n', b'0p', b'0p', b'0r', b'0r', b'0u', b'0u', b'0:', b'0B', b'0C', b'0D', b'0E', b'0F',
+    b'0G', b'0H', b'0I', b'0J', b'0K', b'0L', b'0M', b'0N', b'0O', b'0P', b'0Q', b'0R', b'0S',
+    b'0T', b'0U', b'0V', b'0W', b'0Y', b'0j', b'0k', b'0q', b'0v', b'0w', b'0x', b'0y', b'0z', b'0',
+    b'0', b'0', b'0', b'10', b'10', b'10', b'10', b'11', b'11', b'11', b'11', b'12', b'12', b'12',
+    b'12', b'1a', b'1a', b'1a', b'1a', b'1c', b'1c', b'1c', b'1c', b'1e', b'1e', b'1e', b'1e',
+    b'1i', b'1i', b'1i', b'1i', b'1o', b'1o', b'1o', b'1o', b'1s', b'1s', b'1s', b'1s', b'1t',
+    b'1t', b'1t', b'1t', b'1 ', b'1 ', b'1%', b'1%', b'1-', b'1-', b'1.', b'1.', b'1/', b'1/',
+    b'13', b'13', b'14', b'14', b'15', b'15', b'16', b'16', b'17', b'17', b'18', b'18', b'19',
+    b'19', b'1=', b'1=', b'1A', b'1A', b'1_', b'1_', b'1b', b'1b', b'1d', b'1d', b'1f', b'1f',
+    b'1g', b'1g', b'1h', b'1h', b'1l', b'1l', b'1m', b'1m', b'1n', b'1n', b'1p', b'1p', b'1r',
+    b'1r', b'1u', b'1u', b'1:', b'1B', b'1C', b'1D', b'1E', b'1F', b'1G', b'1H', b'1I', b'1J',
+    b'1K', b'1L', b'1M', b'1N', b'1O', b'1P', b'1Q', b'1R', b'1S', b'1T', b'1U', b'1V', b'1W',
+    b'1Y', b'1j', b'1k', b'1q', b'1v', b'1w', b'1x', b'1y', b'1z', b'1', b'1', b'1', b'1', b'20',
+    b'20', b'20', b'20', b'21', b'21', b'21', b'21', b'22', b'22', b'22', b'22', b'2a', b'2a',
+    b'2a', b'2a', b'2c', b'2c', b'2c', b'2c', b'2e', b'2e', b'2e', b'2e', b'2i', b'2i', b'2i',
+    b'2i', b'2o', b'2o', b'2o', b'2o', b'2s', b'2s', b'2s', b'2s', b'2t', b'2t', b'2t', b'2t',
+    b'2 ', b'2 ', b'2%', b'2%', b'2-', b'2-', b'2.', b'2.', b'2/', b'2/', b'23', b'23', b'24',
+    b'24', b'25', b'25', b'26', b'26', b'27', b'27', b'28', b'28', b'29', b'29', b'2=', b'2=',
+    b'2A', b'2A', b'2_', b'2_', b'2b', b'2b', b'2d', b'2d', b'2f', b'2f', b'2g', b'2g', b'2h',
+    b'2h', b'2l', b'2l', b'2m', b'2m', b'2n', b'2n', b'2p', b'2p', b'2r', b'2r', b'2u', b'2u',
+    b'2:', b'2B', b'2C', b'2D', b'2E', b'2F', b'2G', b'2H', b'2I', b'2J', b'2K', b'2L', b'2M',
+    b'2N', b'2O', b'2P', b'2Q', b'2R', b'2S', b'2T', b'2U', b'2V', b'2W', b'2Y', b'2j', b'2k',
+    b'2q', b'2v', b'2w', b'2x', b'2y', b'2z', b'2', b'2', b'2', b'2', b'a0', b'a0', b'a0', b'a0',
+    b'a1', b'a1', b'a1', b'a1', b'a2', b'a2', b'a2', b'a2', b'aa', b'aa', b'aa', b'aa', b'ac',
+    b'ac', b'ac', b'ac', b'ae', b'ae', b'ae', b'ae', b'ai', b'ai', b'ai', b'ai', b'ao', b'ao',
+    b'ao', b'ao', b'as', b'as', b'as', b'as', b'at', b'at', b'at', b'at', b'a ', b'a ', b'a%',
+    b'a%', b'a-', b'a-', b'a.', b'a.', b'a/', b'a/', b'a3', b'a3', b'a4', b'a4', b'a5', b'a5',
+    b'a6', b'a6', b'a7', b'a7', b'a8', b'a8', b'a9', b'a9', b'a=', b'a=', b'aA', b'aA', b'a_',
+    b'a_', b'ab', b'ab', b'ad', b'ad', b'af', b'af', b'ag', b'ag', b'ah', b'ah', b'al', b'al',
+    b'am', b'am', b'an', b'an', b'ap', b'ap', b'ar', b'ar', b'au', b'au', b'a:', b'aB', b'aC',
+    b'aD', b'aE', b'aF', b'aG', b'aH', b'aI', b'aJ', b'aK', b'aL', b'aM', b'aN', b'aO', b'aP',
+    b'aQ', b'aR', b'aS', b'aT', b'aU', b'aV', b'aW', b'aY', b'aj', b'ak', b'aq', b'av', b'aw',
+    b'ax', b'ay', b'az', b'a', b'a', b'a', b'a', b'40', b'40', b'40', b'40', b'41', b'41', b'41',
+    b'41', b'42', b'42', b'42', b'42', b'4a', b'4a', b'4a', b'4a', b'4c', b'4c', b'4c', b'4c',
+    b'4e', b'4e', b'4e', b'4e', b'4i', b'4i', b'4i', b'4i', b'4o', b'4o', b'4o', b'4o', b'4s',
+    b'4s', b'4s', b'4s', b'4t', b'4t', b'4t', b'4t', b'4 ', b'4 ', b'4%', b'4%', b'4-', b'4-',
+    b'4.', b'4.', b'4/', b'4/', b'43', b'43', b'44', b'44', b'45', b'45', b'46', b'46', b'47',
+    b'47', b'48', b'48', b'49', b'49', b'4=', b'4=', b'4A', b'4A', b'4_', b'4_', b'4b', b'4b',
+    b'4d', b'4d', b'4f', b'4f', b'4g', b'4g', b'4h', b'4h', b'4l', b'4l', b'4m', b'4m', b'4n',
+    b'4n', b'4p', b'4p', b'4r', b'4r', b'4u', b'4u', b'4:', b'4B', b'4C', b'4D', b'4E', b'4F',
+    b'4G', b'4H', b'4I', b'4J', b'4K', b'4L', b'4M', b'4N', b'4O', b'4P', b'4Q', b'4R', b'4S',
+    b'4T', b'4U', b'4V', b'4W', b'4Y', b'4j', b'4k', b'4q', b'4v', b'4w', b'4x', b'4y', b'4z', b'4',
+    b'4', b'4', b'4', b'50', b'50', b'50', b'50', b'51', b'51', b'51', b'51', b'52', b'52', b'52',
+    b'52', b'5a', b'5a', b'5a', b'5a', b'5c', b'5c', b'5c', b'5c', b'5e', b'5e', b'5e', b'5e',
+    b'5i', b'5i', b'5i', b'5i', b'5o', b'5o', b'5o', b'5o', b'5s', b'5s', b'5s', b'5s', b'5t',
+    b'5t', b'5t', b'5t', b'5 ', b'5 ', b'5%', b'5%', b'5-', b'5-', b'5.', b'5.', b'5/', b'5/',
+    b'53', b'53', b'54', b'54', b'55', b'55', b'56', b'56', b'57', b'57', b'58', b'58', b'59',
+    b'59', b'5=', b'5=', b'5A', b'5A', b'5_', b'5_', b'5b', b'5b', b'5d', b'5d', b'5f', b'5f',
+    b'5g', b'5g', b'5h', b'5h', b'5l', b'5l', b'5m', b'5m', b'5n', b'5n', b'5p', b'5p', b'5r',
+    b'5r', b'5u', b'5u', b'5:', b'5B', b'5C', b'5D', b'5E', b'5F', b'5G', b'5H', b'5I', b'5J',
+    b'5K', b'5L', b'5M', b'5N', b'5O', b'5P', b'5Q', b'5R', b'5S', b'5T', b'5U', b'5V', b'5W',
+    b'5Y', b'5j', b'5k', b'5q', b'5v', b'5w', b'5x', b'5y', b'5z', b'5', b'5', b'5', b'5', b'60',
+    b'60', b'61', b'61', b'62', b'62', b'6a', b'6a', b'6c', b'6c', b'6e', b'6e', b'6i', b'6i',
+    b'6o', b'6o', b'6s', b'6s', b'6t', b'6t', b'6 ', b'6%', b'6-', b'6.', b'6/', b'63', b'64',
+    b'65', b'66', b'67', b'68', b'69', b'6=', b'6A', b'6_', b'6b', b'6d', b'6f', b'6g', b'6h',
+    b'6l', b'6m', b'6n', b'6p', b'6r', b'6u', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6',
+    b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'6', b'70', b'70', b'71', b'71', b'72', b'72',
+    b'7a', b'7a', b'7c', b'7c', b'7e', b'7e', b'7i', b'7i', b'7o', b'7o', b'7s', b'7s', b'7t',
+    b'7t', b'7 ', b'7%', b'7-', b'7.', b'7/', b'73', b'74', b'75', b'76', b'77', b'78', b'79',
+    b'7=', b'7A', b'7_', b'7b', b'7d', b'7f', b'7g', b'7h', b'7l', b'7m', b'7n', b'7p', b'7r',
+    b'7u', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7', b'7',
+    b'7', b'7', b'7', b'80', b'80', b'81', b'81', b'82', b'82', b'8a', b'8a', b'8c', b'8c', b'8e',
+    b'8e', b'8i', b'8i', b'8o', b'8o', b'8s', b'8s', b'8t', b'8t', b'8 ', b'8%', b'8-', b'8.',
+    b'8/', b'83', b'84', b'85', b'86', b'87', b'88', b'89', b'8=', b'8A', b'8_', b'8b', b'8d',
+    b'8f', b'8g', b'8h', b'8l', b'8m', b'8n', b'8p', b'8r', b'8u', b'8', b'8', b'8', b'8', b'8',
+    b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'8', b'90', b'90',
+    b'91', b'91', b'92', b'92', b'9a', b'9a', b'9c', b'9c', b'9e', b'9e', b'9i', b'9i', b'9o',
+    b'9o', b'9s', b'9s', b'9t', b'9t', b'9 ', b'9%', b'9-', b'9.', b'9/', b'93', b'94', b'95',
+    b'96', b'97', b'98', b'99', b'9=', b'9A', b'9_', b'9b', b'9d', b'9f', b'9g', b'9h', b'9l',
+    b'9m', b'9n', b'9p', b'9r', b'9u', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9',
+    b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'9', b'60', b'60', b'60', b'60', b'61', b'61', b'61',
+    b'61', b'62', b'62', b'62', b'62', b'6a', b'6a', b'6a', b'6a', b'6c', b'6c', b'6c', b'6c',
+    b'6e', b'6e', b'6e', b'6e', b'6i', b'6i', b'6i', b'6i', b'6o', b'6o', b'6o', b'6o', b'6s',
+    b'6s', b'6s', b'6s', b'6t', b'6t', b'6t', b'6t', b'6 ', b'6 ', b'6%', b'6%', b'6-', b'6-',
+    b'6.', b'6.', b'6/', b'6/', b'63', b'63', b'64', b'64', b'65', b'65', b'66', b'66', b'67',
+    b'67', b'68', b'68', b'69', b'69', b'6=', b'6=', b'6A', b'6A', b'6_', b'6_', b'6b', b'6b',
+    b'6d', b'6d', b'6f', b'6f', b'6g', b'6g', b'6h', b'6h', b'6l', b'6l', b'6m', b'6m', b'6n',
+    b'6n', b'6p', b'6p', b'6r', b'6r', b'6u', b'6u', b'6:', b'6B', b'6C', b'6D', b'6E', b'6F',
+    b'6G', b'6H', b'6I', b'6J', b'6K', b'6L', b'6M', b'6N', b'6O', b'6P', b'6Q', b'6R', b'6S',
+    b'6T', b'6U', b'6V', b'6W', b'6Y', b'6j', b'6k', b'6q', b'6v', b'6w', b'6x', b'6y', b'6z', b'6',
+    b'6', b'6', b'6', b'70', b'70', b'70', b'70', b'71', b'71', b'71', b'71', b'72', b'72', b'72',
+    b'72', b'7a', b'7a', b'7a', b'7a', b'7c', b'7c', b'7c', b'7c', b'7e', b'7e', b'7e', b'7e',
+    b'7i', b'7i', b'7i', b'7i', b'7o', b'7o', b'7o', b'7o', b'7s', b'7s', b'7s', b'7s', b'7t',
+    b'7t', b'7t', b'7t', b'7 ', b'7 ', b'7%', b'7%', b'7-', b'7-', b'7.', b'7.', b'7/', b'7/',
+    b'73', b'73', b'74', b'74', b'75', b'75', b'76', b'76', b'77', b'77', b'78', b'78', b'79',
+    b'79', b'7=', b'7=', b'7A', b'7A', b'7_', b'7_', b'7b', b'7b', b'7d', b'7d', b'7f', b'7f',
+    b'7g', b'7g', b'7h', b'7h', b'7l', b'7l', b'7m', b'7m', b'7n', b'7n', b'7p', b'7p', b'7r',
+    b'7r', b'7u', b'7u', b'7:', b'7B', b'7C', b'7D', b'7E', b'7F', b'7G', b'7H', b'7I', b'7J',
+    b'7K', b'7L', b'7M', b'7N', b'7O', b'7P', b'7Q', b'7R', b'7S', b'7T', b'7U', b'7V', b'7W',
+    b'7Y', b'7j', b'7k', b'7q', b'7v', b'7w', b'7x', b'7y', b'7z', b'7', b'7', b'7', b'7', b'80',
+    b'80', b'80', b'80', b'81', b'81', b'81', b'81', b'82', b'82', b'82', b'82', b'8a', b'8a',
+    b'8a', b'8a', b'8c', b'8c', b'8c', b'8c', b'8e', b'8e', b'8e', b'8e', b'8i', b'8i', b'8i',
+    b'8i', b'8o', b'8o', b'8o', b'8o', b'8s', b'8s', b'8s', b'8s', b'8t', b'8t', b'8t', b'8t',
+    b'8 ', b'8 ', b'8%', b'8%', b'8-', b'8-', b'8.', b'8.', b'8/', b'8/', b'83', b'83', b'84',
+    b'84', b'85', b'85', b'86', b'86', b'87', b'87', b'88', b'88', b'89', b'89', b'8=', b'8=',
+    b'8A', b'8A', b'8_', b'8_', b'8b', b'8b', b'8d', b'8d', b'8f', b'8f', b'8g', b'8g', b'8h',
+    b'8h', b'8l', b'8l', b'8m', b'8m', b'8n', b'8n', b'8p', b'8p', b'8r', b'8r', b'8u', b'8u',
+    b'8:', b'8B', b'8C', b'8D', b'8E', b'8F', b'8G', b'8H', b'8I', b'8J', b'8K', b'8L', b'8M',
+    b'8N', b'8O', b'8P', b'8Q', b'8R', b'8S', b'8T', b'8U', b'8V', b'8W', b'8Y', b'8j', b'8k',
+    b'8q', b'8v', b'8w', b'8x', b'8y', b'8z', b'8', b'8', b'8', b'8', b'90', b'90', b'90', b'90',
+    b'91', b'91', b'91', b'91', b'92', b'92', b'92', b'92', b'9a', b'9a', b'9a', b'9a', b'9c',
+    b'9c', b'9c', b'9c', b'9e', b'9e', b'9e', b'9e', b'9i', b'9i', b'9i', b'9i', b'9o', b'9o',
+    b'9o', b'9o', b'9s', b'9s', b'9s', b'9s', b'9t', b'9t', b'9t', b'9t', b'9 ', b'9 ', b'9%',
+    b'9%', b'9-', b'9-', b'9.', b'9.', b'9/', b'9/', b'93', b'93', b'94', b'94', b'95', b'95',
+    b'96', b'96', b'97', b'97', b'98', b'98', b'99', b'99', b'9=', b'9=', b'9A', b'9A', b'9_',
+    b'9_', b'9b', b'9b', b'9d', b'9d', b'9f', b'9f', b'9g', b'9g', b'9h', b'9h', b'9l', b'9l',
+    b'9m', b'9m', b'9n', b'9n', b'9p', b'9p', b'9r', b'9r', b'9u', b'9u', b'9:', b'9B', b'9C',
+    b'9D', b'9E', b'9F', b'9G', b'9H', b'9I', b'9J', b'9K', b'9L', b'9M', b'9N', b'9O', b'9P',
+    b'9Q', b'9R', b'9S', b'9T', b'9U', b'9V', b'9W', b'9Y', b'9j', b'9k', b'9q', b'9v', b'9w',
+    b'9x', b'9y', b'9z', b'9', b'9', b'9', b'9', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=',
+    b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A',
+    b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_',
+    b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b',
+    b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd',
+    b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f',
+    b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g',
+    b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h',
+    b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l',
+    b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm',
+    b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n',
+    b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p',
+    b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r',
+    b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u',
+    b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b':', b':', b':', b':', b':', b':', b':', b':',
+    b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C',
+    b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'l0', b'l1', b'l2', b'la', b'lc', b'le', b'li',
+    b'lo', b'ls', b'lt', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l',
+    b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'm0', b'm1', b'm2', b'ma', b'mc',
+    b'me', b'mi', b'mo', b'ms', b'mt', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm',
+    b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'n0', b'n1', b'n2',
+    b'na', b'nc', b'ne', b'ni', b'no', b'ns', b'nt', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n',
+    b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'p0',
+    b'p1', b'p2', b'pa', b'pc', b'pe', b'pi', b'po', b'ps', b'pt', b'p', b'p', b'p', b'p', b'p',
+    b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p',
+    b'p', b'r0', b'r1', b'r2', b'ra', b'rc', b're', b'ri', b'ro', b'rs', b'rt', b'r', b'r', b'r',
+    b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r',
+    b'r', b'r', b'r', b'u0', b'u1', b'u2', b'ua', b'uc', b'ue', b'ui', b'uo', b'us', b'ut', b'u',
+    b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u',
+    b'u', b'u', b'u', b'u', b'u', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':',
+    b':', b':', b':', b':', b':', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B',
+    b'B', b'B', b'B', b'B', b'B', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C',
+    b'C', b'C', b'C', b'C', b'C', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D',
+    b'D', b'D', b'D', b'D', b'D', b'r0', b'r0', b'r1', b'r1', b'r2', b'r2', b'ra', b'ra', b'rc',
+    b'rc', b're', b're', b'ri', b'ri', b'ro', b'ro', b'rs', b'rs', b'rt', b'rt', b'r ', b'r%',
+    b'r-', b'r.', b'r/', b'r3', b'r4', b'r5', b'r6', b'r7', b'r8', b'r9', b'r=', b'rA', b'r_',
+    b'rb', b'rd', b'rf', b'rg', b'rh', b'rl', b'rm', b'rn', b'rp', b'rr', b'ru', b'r', b'r', b'r',
+    b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'r', b'u0',
+    b'u0', b'u1', b'u1', b'u2', b'u2', b'ua', b'ua', b'uc', b'uc', b'ue', b'ue', b'ui', b'ui',
+    b'uo', b'uo', b'us', b'us', b'ut', b'ut', b'u ', b'u%', b'u-', b'u.', b'u/', b'u3', b'u4',
+    b'u5', b'u6', b'u7', b'u8', b'u9', b'u=', b'uA', b'u_', b'ub', b'ud', b'uf', b'ug', b'uh',
+    b'ul', b'um', b'un', b'up', b'ur', b'uu', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u',
+    b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b'u', b':0', b':1', b':2', b':a', b':c', b':e',
+    b':i', b':o', b':s', b':t', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':',
+    b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b'B0', b'B1', b'B2', b'Ba',
+    b'Bc', b'Be', b'Bi', b'Bo', b'Bs', b'Bt', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B',
+    b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'C0', b'C1',
+    b'C2', b'Ca', b'Cc', b'Ce', b'Ci', b'Co', b'Cs', b'Ct', b'C', b'C', b'C', b'C', b'C', b'C',
+    b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C',
+    b'D0', b'D1', b'D2', b'Da', b'Dc', b'De', b'Di', b'Do', b'Ds', b'Dt', b'D', b'D', b'D', b'D',
+    b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D',
+    b'D', b'D', b':0', b':0', b':1', b':1', b':2', b':2', b':a', b':a', b':c', b':c', b':e', b':e',
+    b':i', b':i', b':o', b':o', b':s', b':s', b':t', b':t', b': ', b':%', b':-', b':.', b':/',
+    b':3', b':4', b':5', b':6', b':7', b':8', b':9', b':=', b':A', b':_', b':b', b':d', b':f',
+    b':g', b':h', b':l', b':m', b':n', b':p', b':r', b':u', b':', b':', b':', b':', b':', b':',
+    b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b':', b'B0', b'B0', b'B1',
+    b'B1', b'B2', b'B2', b'Ba', b'Ba', b'Bc', b'Bc', b'Be', b'Be', b'Bi', b'Bi', b'Bo', b'Bo',
+    b'Bs', b'Bs', b'Bt', b'Bt', b'B ', b'B%', b'B-', b'B.', b'B/', b'B3', b'B4', b'B5', b'B6',
+    b'B7', b'B8', b'B9', b'B=', b'BA', b'B_', b'Bb', b'Bd', b'Bf', b'Bg', b'Bh', b'Bl', b'Bm',
+    b'Bn', b'Bp', b'Br', b'Bu', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'B',
+    b'B', b'B', b'B', b'B', b'B', b'B', b'B', b'C0', b'C0', b'C1', b'C1', b'C2', b'C2', b'Ca',
+    b'Ca', b'Cc', b'Cc', b'Ce', b'Ce', b'Ci', b'Ci', b'Co', b'Co', b'Cs', b'Cs', b'Ct', b'Ct',
+    b'C ', b'C%', b'C-', b'C.', b'C/', b'C3', b'C4', b'C5', b'C6', b'C7', b'C8', b'C9', b'C=',
+    b'CA', b'C_', b'Cb', b'Cd', b'Cf', b'Cg', b'Ch', b'Cl', b'Cm', b'Cn', b'Cp', b'Cr', b'Cu', b'C',
+    b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C', b'C',
+    b'C', b'D0', b'D0', b'D1', b'D1', b'D2', b'D2', b'Da', b'Da', b'Dc', b'Dc', b'De', b'De', b'Di',
+    b'Di', b'Do', b'Do', b'Ds', b'Ds', b'Dt', b'Dt', b'D ', b'D%', b'D-', b'D.', b'D/', b'D3',
+    b'D4', b'D5', b'D6', b'D7', b'D8', b'D9', b'D=', b'DA', b'D_', b'Db', b'Dd', b'Df', b'Dg',
+    b'Dh', b'Dl', b'Dm', b'Dn', b'Dp', b'Dr', b'Du', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D',
+    b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b'D', b':0', b':0', b':0', b':0', b':1',
+    b':1', b':1', b':1', b':2', b':2', b':2', b':2', b':a', b':a', b':a', b':a', b':c', b':c',
+    b':c', b':c', b':e', b':e', b':e', b':e', b':i', b':i', b':i', b':i', b':o', b':o', b':o',
+    b':o', b':s', b':s', b':s', b':s', b':t', b':t', b':t', b':t', b': ', b': ', b':%', b':%',
+    b':-', b':-', b':.', b':.', b':/', b':/', b':3', b':3', b':4', b':4', b':5', b':5', b':6',
+    b':6', b':7', b':7', b':8', b':8', b':9', b':9', b':=', b':=', b':A', b':A', b':_', b':_',
+    b':b', b':b', b':d', b':d', b':f', b':f', b':g', b':g', b':h', b':h', b':l', b':l', b':m',
+    b':m', b':n', b':n', b':p', b':p', b':r', b':r', b':u', b':u', b'::', b':B', b':C', b':D',
+    b':E', b':F', b':G', b':H', b':I', b':J', b':K', b':L', b':M', b':N', b':O', b':P', b':Q',
+    b':R', b':S', b':T', b':U', b':V', b':W', b':Y', b':j', b':k', b':q', b':v', b':w', b':x',
+    b':y', b':z', b':', b':', b':', b':', b'B0', b'B0', b'B0', b'B0', b'B1', b'B1', b'B1', b'B1',
+    b'B2', b'B2', b'B2', b'B2', b'Ba', b'Ba', b'Ba', b'Ba', b'Bc', b'Bc', b'Bc', b'Bc', b'Be',
+    b'Be', b'Be', b'Be', b'Bi', b'Bi', b'Bi', b'Bi', b'Bo', b'Bo', b'Bo', b'Bo', b'Bs', b'Bs',
+    b'Bs', b'Bs', b'Bt', b'Bt', b'Bt', b'Bt', b'B ', b'B ', b'B%', b'B%', b'B-', b'B-', b'B.',
+    b'B.', b'B/', b'B/', b'B3', b'B3', b'B4', b'B4', b'B5', b'B5', b'B6', b'B6', b'B7', b'B7',
+    b'B8', b'B8', b'B9', b'B9', b'B=', b'B=', b'BA', b'BA', b'B_', b'B_', b'Bb', b'Bb', b'Bd',
+    b'Bd', b'Bf', b'Bf', b'Bg', b'Bg', b'Bh', b'Bh', b'Bl', b'Bl', b'Bm', b'Bm', b'Bn', b'Bn',
+    b'Bp', b'Bp', b'Br', b'Br', b'Bu', b'Bu', b'B:', b'BB', b'BC', b'BD', b'BE', b'BF', b'BG',
+    b'BH', b'BI', b'BJ', b'BK', b'BL', b'BM', b'BN', b'BO', b'BP', b'BQ', b'BR', b'BS', b'BT',
+    b'BU', b'BV', b'BW', b'BY', b'Bj', b'Bk', b'Bq', b'Bv', b'Bw', b'Bx', b'By', b'Bz', b'B', b'B',
+    b'B', b'B', b'<0', b'<0', b'<0', b'<0', b'<1', b'<1', b'<1', b'<1', b'<2', b'<2', b'<2', b'<2',
+    b'<a', b'<a', b'<a', b'<a', b'<c', b'<c', b'<c', b'<c', b'<e', b'<e', b'<e', b'<e', b'<i',
+    b'<i', b'<i', b'<i', b'<o', b'<o', b'<o', b'<o', b'<s', b'<s', b'<s', b'<s', b'<t', b'<t',
+    b'<t', b'<t', b'< ', b'< ', b'<%', b'<%', b'<-', b'<-', b'<.', b'<.', b'</', b'</', b'<3',
+    b'<3', b'<4', b'<4', b'<5', b'<5', b'<6', b'<6', b'<7', b'<7', b'<8', b'<8', b'<9', b'<9',
+    b'<=', b'<=', b'<A', b'<A', b'<_', b'<_', b'<b', b'<b', b'<d', b'<d', b'<f', b'<f', b'<g',
+    b'<g', b'<h', b'<h', b'<l', b'<l', b'<m', b'<m', b'<n', b'<n', b'<p', b'<p', b'<r', b'<r',
+    b'<u', b'<u', b'<:', b'<B', b'<C', b'<D', b'<E', b'<F', b'<G', b'<H', b'<I', b'<J', b'<K',
+    b'<L', b'<M', b'<N', b'<O', b'<P', b'<Q', b'<R', b'<S', b'<T', b'<U', b'<V', b'<W', b'<Y',
+    b'<j', b'<k', b'<q', b'<v', b'<w', b'<x', b'<y', b'<z', b'<', b'<', b'<', b'<', b'`0', b'`0',
+    b'`0', b'`0', b'`1', b'`1', b'`1', b'`1', b'`2', b'`2', b'`2', b'`2', b'`a', b'`a', b'`a',
+    b'`a', b'`c', b'`c', b'`c', b'`c', b'`e', b'`e', b'`e', b'`e', b'`i', b'`i', b'`i', b'`i',
+    b'`o', b'`o', b'`o', b'`o', b'`s', b'`s', b'`s', b'`s', b'`t', b'`t', b'`t', b'`t', b'` ',
+    b'` ', b'`%', b'`%', b'`-', b'`-', b'`.', b'`.', b'`/', b'`/', b'`3', b'`3', b'`4', b'`4',
+    b'`5', b'`5', b'`6', b'`6', b'`7', b'`7', b'`8', b'`8', b'`9', b'`9', b'`=', b'`=', b'`A',
+    b'`A', b'`_', b'`_', b'`b', b'`b', b'`d', b'`d', b'`f', b'`f', b'`g', b'`g', b'`h', b'`h',
+    b'`l', b'`l', b'`m', b'`m', b'`n', b'`n', b'`p', b'`p', b'`r', b'`r', b'`u', b'`u', b'`:',
+    b'`B', b'`C', b'`D', b'`E', b'`F', b'`G', b'`H', b'`I', b'`J', b'`K', b'`L', b'`M', b'`N',
+    b'`O', b'`P', b'`Q', b'`R', b'`S', b'`T', b'`U', b'`V', b'`W', b'`Y', b'`j', b'`k', b'`q',
+    b'`v', b'`w', b'`x', b'`y', b'`z', b'`', b'`', b'`', b'`', b'=0', b'=1', b'=2', b'=a', b'=c',
+    b'=e', b'=i', b'=o', b'=s', b'=t', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=',
+    b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'A0', b'A1', b'A2',
+    b'Aa', b'Ac', b'Ae', b'Ai', b'Ao', b'As', b'At', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A',
+    b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'_0',
+    b'_1', b'_2', b'_a', b'_c', b'_e', b'_i', b'_o', b'_s', b'_t', b'_', b'_', b'_', b'_', b'_',
+    b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_',
+    b'_', b'b0', b'b1', b'b2', b'ba', b'bc', b'be', b'bi', b'bo', b'bs', b'bt', b'b', b'b', b'b',
+    b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b',
+    b'b', b'b', b'b', b'd0', b'd1', b'd2', b'da', b'dc', b'de', b'di', b'do', b'ds', b'dt', b'd',
+    b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd',
+    b'd', b'd', b'd', b'd', b'd', b'f0', b'f1', b'f2', b'fa', b'fc', b'fe', b'fi', b'fo', b'fs',
+    b'ft', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f',
+    b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'g0', b'g1', b'g2', b'ga', b'gc', b'ge', b'gi',
+    b'go', b'gs', b'gt', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g',
+    b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'h0', b'h1', b'h2', b'ha', b'hc',
+    b'he', b'hi', b'ho', b'hs', b'ht', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h',
+    b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'=0', b'=0', b'=1',
+    b'=1', b'=2', b'=2', b'=a', b'=a', b'=c', b'=c', b'=e', b'=e', b'=i', b'=i', b'=o', b'=o',
+    b'=s', b'=s', b'=t', b'=t', b'= ', b'=%', b'=-', b'=.', b'=/', b'=3', b'=4', b'=5', b'=6',
+    b'=7', b'=8', b'=9', b'==', b'=A', b'=_', b'=b', b'=d', b'=f', b'=g', b'=h', b'=l', b'=m',
+    b'=n', b'=p', b'=r', b'=u', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'=',
+    b'=', b'=', b'=', b'=', b'=', b'=', b'=', b'A0', b'A0', b'A1', b'A1', b'A2', b'A2', b'Aa',
+    b'Aa', b'Ac', b'Ac', b'Ae', b'Ae', b'Ai', b'Ai', b'Ao', b'Ao', b'As', b'As', b'At', b'At',
+    b'A ', b'A%', b'A-', b'A.', b'A/', b'A3', b'A4', b'A5', b'A6', b'A7', b'A8', b'A9', b'A=',
+    b'AA', b'A_', b'Ab', b'Ad', b'Af', b'Ag', b'Ah', b'Al', b'Am', b'An', b'Ap', b'Ar', b'Au', b'A',
+    b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A', b'A',
+    b'A', b'_0', b'_0', b'_1', b'_1', b'_2', b'_2', b'_a', b'_a', b'_c', b'_c', b'_e', b'_e', b'_i',
+    b'_i', b'_o', b'_o', b'_s', b'_s', b'_t', b'_t', b'_ ', b'_%', b'_-', b'_.', b'_/', b'_3',
+    b'_4', b'_5', b'_6', b'_7', b'_8', b'_9', b'_=', b'_A', b'__', b'_b', b'_d', b'_f', b'_g',
+    b'_h', b'_l', b'_m', b'_n', b'_p', b'_r', b'_u', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_',
+    b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'_', b'b0', b'b0', b'b1', b'b1', b'b2',
+    b'b2', b'ba', b'ba', b'bc', b'bc', b'be', b'be', b'bi', b'bi', b'bo', b'bo', b'bs', b'bs',
+    b'bt', b'bt', b'b ', b'b%', b'b-', b'b.', b'b/', b'b3', b'b4', b'b5', b'b6', b'b7', b'b8',
+    b'b9', b'b=', b'bA', b'b_', b'bb', b'bd', b'bf', b'bg', b'bh', b'bl', b'bm', b'bn', b'bp',
+    b'br', b'bu', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b', b'b',
+    b'b', b'b', b'b', b'b', b'b', b'=0', b'=0', b'=0', b'=0', b'=1', b'=1', b'=1', b'=1', b'=2',
+    b'=2', b'=2', b'=2', b'=a', b'=a', b'=a', b'=a', b'=c', b'=c', b'=c', b'=c', b'=e', b'=e',
+    b'=e', b'=e', b'=i', b'=i', b'=i', b'=i', b'=o', b'=o', b'=o', b'=o', b'=s', b'=s', b'=s',
+    b'=s', b'=t', b'=t', b'=t', b'=t', b'= ', b'= ', b'=%', b'=%', b'=-', b'=-', b'=.', b'=.',
+    b'=/', b'=/', b'=3', b'=3', b'=4', b'=4', b'=5', b'=5', b'=6', b'=6', b'=7', b'=7', b'=8',
+    b'=8', b'=9', b'=9', b'==', b'==', b'=A', b'=A', b'=_', b'=_', b'=b', b'=b', b'=d', b'=d',
+    b'=f', b'=f', b'=g', b'=g', b'=h', b'=h', b'=l', b'=l', b'=m', b'=m', b'=n', b'=n', b'=p',
+    b'=p', b'=r', b'=r', b'=u', b'=u', b'=:', b'=B', b'=C', b'=D', b'=E', b'=F', b'=G', b'=H',
+    b'=I', b'=J', b'=K', b'=L', b'=M', b'=N', b'=O', b'=P', b'=Q', b'=R', b'=S', b'=T', b'=U',
+    b'=V', b'=W', b'=Y', b'=j', b'=k', b'=q', b'=v', b'=w', b'=x', b'=y', b'=z', b'=', b'=', b'=',
+    b'=', b'A0', b'A0', b'A0', b'A0', b'A1', b'A1', b'A1', b'A1', b'A2', b'A2', b'A2', b'A2', b'Aa',
+    b'Aa', b'Aa', b'Aa', b'Ac', b'Ac', b'Ac', b'Ac', b'Ae', b'Ae', b'Ae', b'Ae', b'Ai', b'Ai',
+    b'Ai', b'Ai', b'Ao', b'Ao', b'Ao', b'Ao', b'As', b'As', b'As', b'As', b'At', b'At', b'At',
+    b'At', b'A ', b'A ', b'A%', b'A%', b'A-', b'A-', b'A.', b'A.', b'A/', b'A/', b'A3', b'A3',
+    b'A4', b'A4', b'A5', b'A5', b'A6', b'A6', b'A7', b'A7', b'A8', b'A8', b'A9', b'A9', b'A=',
+    b'A=', b'AA', b'AA', b'A_', b'A_', b'Ab', b'Ab', b'Ad', b'Ad', b'Af', b'Af', b'Ag', b'Ag',
+    b'Ah', b'Ah', b'Al', b'Al', b'Am', b'Am', b'An', b'An', b'Ap', b'Ap', b'Ar', b'Ar', b'Au',
+    b'Au', b'A:', b'AB', b'AC', b'AD', b'AE', b'AF', b'AG', b'AH', b'AI', b'AJ', b'AK', b'AL',
+    b'AM', b'AN', b'AO', b'AP', b'AQ', b'AR', b'AS', b'AT', b'AU', b'AV', b'AW', b'AY', b'Aj',
+    b'Ak', b'Aq', b'Av', b'Aw', b'Ax', b'Ay', b'Az', b'A', b'A', b'A', b'A', b'@0', b'@0', b'@0',
+    b'@0', b'@1', b'@1', b'@1', b'@1', b'@2', b'@2', b'@2', b'@2', b'@a', b'@a', b'@a', b'@a',
+    b'@c', b'@c', b'@c', b'@c', b'@e', b'@e', b'@e', b'@e', b'@i', b'@i', b'@i', b'@i', b'@o',
+    b'@o', b'@o', b'@o', b'@s', b'@s', b'@s', b'@s', b'@t', b'@t', b'@t', b'@t', b'@ ', b'@ ',
+    b'@%', b'@%', b'@-', b'@-', b'@.', b'@.', b'@/', b'@/', b'@3', b'@3', b'@4', b'@4', b'@5',
+    b'@5', b'@6', b'@6', b'@7', b'@7', b'@8', b'@8', b'@9', b'@9', b'@=', b'@=', b'@A', b'@A',
+    b'@_', b'@_', b'@b', b'@b', b'@d', b'@d', b'@f', b'@f', b'@g', b'@g', b'@h', b'@h', b'@l',
+    b'@l', b'@m', b'@m', b'@n', b'@n', b'@p', b'@p', b'@r', b'@r', b'@u', b'@u', b'@:', b'@B',
+    b'@C', b'@D', b'@E', b'@F', b'@G', b'@H', b'@I', b'@J', b'@K', b'@L', b'@M', b'@N', b'@O',
+    b'@P', b'@Q', b'@R', b'@S', b'@T', b'@U', b'@V', b'@W', b'@Y', b'@j', b'@k', b'@q', b'@v',
+    b'@w', b'@x', b'@y', b'@z', b'@', b'@', b'@', b'@', b'[0', b'[0', b'[0', b'[0', b'[1', b'[1',
+    b'[1', b'[1', b'[2', b'[2', b'[2', b'[2', b'[a', b'[a', b'[a', b'[a', b'[c', b'[c', b'[c',
+    b'[c', b'[e', b'[e', b'[e', b'[e', b'[i', b'[i', b'[i', b'[i', b'[o', b'[o', b'[o', b'[o',
+    b'[s', b'[s', b'[s', b'[s', b'[t', b'[t', b'[t', b'[t', b'[ ', b'[ ', b'[%', b'[%', b'[-',
+    b'[-', b'[.', b'[.', b'[/', b'[/', b'[3', b'[3', b'[4', b'[4', b'[5', b'[5', b'[6', b'[6',
+    b'[7', b'[7', b'[8', b'[8', b'[9', b'[9', b'[=', b'[=', b'[A', b'[A', b'[_', b'[_', b'[b',
+    b'[b', b'[d', b'[d', b'[f', b'[f', b'[g', b'[g', b'[h', b'[h', b'[l', b'[l', b'[m', b'[m',
+    b'[n', b'[n', b'[p', b'[p', b'[r', b'[r', b'[u', b'[u', b'[:', b'[B', b'[C', b'[D', b'[E',
+    b'[F', b'[G', b'[H', b'[I', b'[J', b'[K', b'[L', b'[M', b'[N', b'[O', b'[P', b'[Q', b'[R',
+    b'[S', b'[T', b'[U', b'[V', b'[W', b'[Y', b'[j', b'[k', b'[q', b'[v', b'[w', b'[x', b'[y',
+    b'[z', b'[', b'[', b'[', b'[', b'C0', b'C0', b'C0', b'C0', b'C1', b'C1', b'C1', b'C1', b'C2',
+    b'C2', b'C2', b'C2', b'Ca', b'Ca', b'Ca', b'Ca', b'Cc', b'Cc', b'Cc', b'Cc', b'Ce', b'Ce',
+    b'Ce', b'Ce', b'Ci', b'Ci', b'Ci', b'Ci', b'Co', b'Co', b'Co', b'Co', b'Cs', b'Cs', b'Cs',
+    b'Cs', b'Ct', b'Ct', b'Ct', b'Ct', b'C ', b'C ', b'C%', b'C%', b'C-', b'C-', b'C.', b'C.',
+    b'C/', b'C/', b'C3', b'C3', b'C4', b'C4', b'C5', b'C5', b'C6', b'C6', b'C7', b'C7', b'C8',
+    b'C8', b'C9', b'C9', b'C=', b'C=', b'CA', b'CA', b'C_', b'C_', b'Cb', b'Cb', b'Cd', b'Cd',
+    b'Cf', b'Cf', b'Cg', b'Cg', b'Ch', b'Ch', b'Cl', b'Cl', b'Cm', b'Cm', b'Cn', b'Cn', b'Cp',
+    b'Cp', b'Cr', b'Cr', b'Cu', b'Cu', b'C:', b'CB', b'CC', b'CD', b'CE', b'CF', b'CG', b'CH',
+    b'CI', b'CJ', b'CK', b'CL', b'CM', b'CN', b'CO', b'CP', b'CQ', b'CR', b'CS', b'CT', b'CU',
+    b'CV', b'CW', b'CY', b'Cj', b'Ck', b'Cq', b'Cv', b'Cw', b'Cx', b'Cy', b'Cz', b'C', b'C', b'C',
+    b'C', b'D0', b'D0', b'D0', b'D0', b'D1', b'D1', b'D1', b'D1', b'D2', b'D2', b'D2', b'D2', b'Da',
+    b'Da', b'Da', b'Da', b'Dc', b'Dc', b'Dc', b'Dc', b'De', b'De', b'De', b'De', b'Di', b'Di',
+    b'Di', b'Di', b'Do', b'Do', b'Do', b'Do', b'Ds', b'Ds', b'Ds', b'Ds', b'Dt', b'Dt', b'Dt',
+    b'Dt', b'D ', b'D ', b'D%', b'D%', b'D-', b'D-', b'D.', b'D.', b'D/', b'D/', b'D3', b'D3',
+    b'D4', b'D4', b'D5', b'D5', b'D6', b'D6', b'D7', b'D7', b'D8', b'D8', b'D9', b'D9', b'D=',
+    b'D=', b'DA', b'DA', b'D_', b'D_', b'Db', b'Db', b'Dd', b'Dd', b'Df', b'Df', b'Dg', b'Dg',
+    b'Dh', b'Dh', b'Dl', b'Dl', b'Dm', b'Dm', b'Dn', b'Dn', b'Dp', b'Dp', b'Dr', b'Dr', b'Du',
+    b'Du', b'D:', b'DB', b'DC', b'DD', b'DE', b'DF', b'DG', b'DH', b'DI', b'DJ', b'DK', b'DL',
+    b'DM', b'DN', b'DO', b'DP', b'DQ', b'DR', b'DS', b'DT', b'DU', b'DV', b'DW', b'DY', b'Dj',
+    b'Dk', b'Dq', b'Dv', b'Dw', b'Dx', b'Dy', b'Dz', b'D', b'D', b'D', b'D', b'E', b'E', b'E', b'E',
+    b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'F', b'F', b'F', b'F',
+    b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'G', b'G', b'G', b'G',
+    b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'H', b'H', b'H', b'H',
+    b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'I', b'I', b'I', b'I',
+    b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'J', b'J', b'J', b'J',
+    b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'K', b'K', b'K', b'K',
+    b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'L', b'L', b'L', b'L',
+    b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'M', b'M', b'M', b'M',
+    b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'N', b'N', b'N', b'N',
+    b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'O', b'O', b'O', b'O',
+    b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'P', b'P', b'P', b'P',
+    b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'Q', b'Q', b'Q', b'Q',
+    b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'R', b'R', b'R', b'R',
+    b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'S', b'S', b'S', b'S',
+    b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'T', b'T', b'T', b'T',
+    b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'E0', b'E1', b'E2',
+    b'Ea', b'Ec', b'Ee', b'Ei', b'Eo', b'Es', b'Et', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E',
+    b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'F0',
+    b'F1', b'F2', b'Fa', b'Fc', b'Fe', b'Fi', b'Fo', b'Fs', b'Ft', b'F', b'F', b'F', b'F', b'F',
+    b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F',
+    b'F', b'G0', b'G1', b'G2', b'Ga', b'Gc', b'Ge', b'Gi', b'Go', b'Gs', b'Gt', b'G', b'G', b'G',
+    b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G',
+    b'G', b'G', b'G', b'H0', b'H1', b'H2', b'Ha', b'Hc', b'He', b'Hi', b'Ho', b'Hs', b'Ht', b'H',
+    b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H',
+    b'H', b'H', b'H', b'H', b'H', b'I0', b'I1', b'I2', b'Ia', b'Ic', b'Ie', b'Ii', b'Io', b'Is',
+    b'It', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I',
+    b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'J0', b'J1', b'J2', b'Ja', b'Jc', b'Je', b'Ji',
+    b'Jo', b'Js', b'Jt', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J',
+    b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'K0', b'K1', b'K2', b'Ka', b'Kc',
+    b'Ke', b'Ki', b'Ko', b'Ks', b'Kt', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K',
+    b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'L0', b'L1', b'L2',
+    b'La', b'Lc', b'Le', b'Li', b'Lo', b'Ls', b'Lt', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L',
+    b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'E0',
+    b'E0', b'E1', b'E1', b'E2', b'E2', b'Ea', b'Ea', b'Ec', b'Ec', b'Ee', b'Ee', b'Ei', b'Ei',
+    b'Eo', b'Eo', b'Es', b'Es', b'Et', b'Et', b'E ', b'E%', b'E-', b'E.', b'E/', b'E3', b'E4',
+    b'E5', b'E6', b'E7', b'E8', b'E9', b'E=', b'EA', b'E_', b'Eb', b'Ed', b'Ef', b'Eg', b'Eh',
+    b'El', b'Em', b'En', b'Ep', b'Er', b'Eu', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E',
+    b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'E', b'F0', b'F0', b'F1', b'F1', b'F2', b'F2',
+    b'Fa', b'Fa', b'Fc', b'Fc', b'Fe', b'Fe', b'Fi', b'Fi', b'Fo', b'Fo', b'Fs', b'Fs', b'Ft',
+    b'Ft', b'F ', b'F%', b'F-', b'F.', b'F/', b'F3', b'F4', b'F5', b'F6', b'F7', b'F8', b'F9',
+    b'F=', b'FA', b'F_', b'Fb', b'Fd', b'Ff', b'Fg', b'Fh', b'Fl', b'Fm', b'Fn', b'Fp', b'Fr',
+    b'Fu', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F', b'F',
+    b'F', b'F', b'F', b'G0', b'G0', b'G1', b'G1', b'G2', b'G2', b'Ga', b'Ga', b'Gc', b'Gc', b'Ge',
+    b'Ge', b'Gi', b'Gi', b'Go', b'Go', b'Gs', b'Gs', b'Gt', b'Gt', b'G ', b'G%', b'G-', b'G.',
+    b'G/', b'G3', b'G4', b'G5', b'G6', b'G7', b'G8', b'G9', b'G=', b'GA', b'G_', b'Gb', b'Gd',
+    b'Gf', b'Gg', b'Gh', b'Gl', b'Gm', b'Gn', b'Gp', b'Gr', b'Gu', b'G', b'G', b'G', b'G', b'G',
+    b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'G', b'H0', b'H0',
+    b'H1', b'H1', b'H2', b'H2', b'Ha', b'Ha', b'Hc', b'Hc', b'He', b'He', b'Hi', b'Hi', b'Ho',
+    b'Ho', b'Hs', b'Hs', b'Ht', b'Ht', b'H ', b'H%', b'H-', b'H.', b'H/', b'H3', b'H4', b'H5',
+    b'H6', b'H7', b'H8', b'H9', b'H=', b'HA', b'H_', b'Hb', b'Hd', b'Hf', b'Hg', b'Hh', b'Hl',
+    b'Hm', b'Hn', b'Hp', b'Hr', b'Hu', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H',
+    b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'H', b'E0', b'E0', b'E0', b'E0', b'E1', b'E1', b'E1',
+    b'E1', b'E2', b'E2', b'E2', b'E2', b'Ea', b'Ea', b'Ea', b'Ea', b'Ec', b'Ec', b'Ec', b'Ec',
+    b'Ee', b'Ee', b'Ee', b'Ee', b'Ei', b'Ei', b'Ei', b'Ei', b'Eo', b'Eo', b'Eo', b'Eo', b'Es',
+    b'Es', b'Es', b'Es', b'Et', b'Et', b'Et', b'Et', b'E ', b'E ', b'E%', b'E%', b'E-', b'E-',
+    b'E.', b'E.', b'E/', b'E/', b'E3', b'E3', b'E4', b'E4', b'E5', b'E5', b'E6', b'E6', b'E7',
+    b'E7', b'E8', b'E8', b'E9', b'E9', b'E=', b'E=', b'EA', b'EA', b'E_', b'E_', b'Eb', b'Eb',
+    b'Ed', b'Ed', b'Ef', b'Ef', b'Eg', b'Eg', b'Eh', b'Eh', b'El', b'El', b'Em', b'Em', b'En',
+    b'En', b'Ep', b'Ep', b'Er', b'Er', b'Eu', b'Eu', b'E:', b'EB', b'EC', b'ED', b'EE', b'EF',
+    b'EG', b'EH', b'EI', b'EJ', b'EK', b'EL', b'EM', b'EN', b'EO', b'EP', b'EQ', b'ER', b'ES',
+    b'ET', b'EU', b'EV', b'EW', b'EY', b'Ej', b'Ek', b'Eq', b'Ev', b'Ew', b'Ex', b'Ey', b'Ez', b'E',
+    b'E', b'E', b'E', b'F0', b'F0', b'F0', b'F0', b'F1', b'F1', b'F1', b'F1', b'F2', b'F2', b'F2',
+    b'F2', b'Fa', b'Fa', b'Fa', b'Fa', b'Fc', b'Fc', b'Fc', b'Fc', b'Fe', b'Fe', b'Fe', b'Fe',
+    b'Fi', b'Fi', b'Fi', b'Fi', b'Fo', b'Fo', b'Fo', b'Fo', b'Fs', b'Fs', b'Fs', b'Fs', b'Ft',
+    b'Ft', b'Ft', b'Ft', b'F ', b'F ', b'F%', b'F%', b'F-', b'F-', b'F.', b'F.', b'F/', b'F/',
+    b'F3', b'F3', b'F4', b'F4', b'F5', b'F5', b'F6', b'F6', b'F7', b'F7', b'F8', b'F8', b'F9',
+    b'F9', b'F=', b'F=', b'FA', b'FA', b'F_', b'F_', b'Fb', b'Fb', b'Fd', b'Fd', b'Ff', b'Ff',
+    b'Fg', b'Fg', b'Fh', b'Fh', b'Fl', b'Fl', b'Fm', b'Fm', b'Fn', b'Fn', b'Fp', b'Fp', b'Fr',
+    b'Fr', b'Fu', b'Fu', b'F:', b'FB', b'FC', b'FD', b'FE', b'FF', b'FG', b'FH', b'FI', b'FJ',
+    b'FK', b'FL', b'FM', b'FN', b'FO', b'FP', b'FQ', b'FR', b'FS', b'FT', b'FU', b'FV', b'FW',
+    b'FY', b'Fj', b'Fk', b'Fq', b'Fv', b'Fw', b'Fx', b'Fy', b'Fz', b'F', b'F', b'F', b'F', b'G0',
+    b'G0', b'G0', b'G0', b'G1', b'G1', b'G1', b'G1', b'G2', b'G2', b'G2', b'G2', b'Ga', b'Ga',
+    b'Ga', b'Ga', b'Gc', b'Gc', b'Gc', b'Gc', b'Ge', b'Ge', b'Ge', b'Ge', b'Gi', b'Gi', b'Gi',
+    b'Gi', b'Go', b'Go', b'Go', b'Go', b'Gs', b'Gs', b'Gs', b'Gs', b'Gt', b'Gt', b'Gt', b'Gt',
+    b'G ', b'G ', b'G%', b'G%', b'G-', b'G-', b'G.', b'G.', b'G/', b'G/', b'G3', b'G3', b'G4',
+    b'G4', b'G5', b'G5', b'G6', b'G6', b'G7', b'G7', b'G8', b'G8', b'G9', b'G9', b'G=', b'G=',
+    b'GA', b'GA', b'G_', b'G_', b'Gb', b'Gb', b'Gd', b'Gd', b'Gf', b'Gf', b'Gg', b'Gg', b'Gh',
+    b'Gh', b'Gl', b'Gl', b'Gm', b'Gm', b'Gn', b'Gn', b'Gp', b'Gp', b'Gr', b'Gr', b'Gu', b'Gu',
+    b'G:', b'GB', b'GC', b'GD', b'GE', b'GF', b'GG', b'GH', b'GI', b'GJ', b'GK', b'GL', b'GM',
+    b'GN', b'GO', b'GP', b'GQ', b'GR', b'GS', b'GT', b'GU', b'GV', b'GW', b'GY', b'Gj', b'Gk',
+    b'Gq', b'Gv', b'Gw', b'Gx', b'Gy', b'Gz', b'G', b'G', b'G', b'G', b'H0', b'H0', b'H0', b'H0',
+    b'H1', b'H1', b'H1', b'H1', b'H2', b'H2', b'H2', b'H2', b'Ha', b'Ha', b'Ha', b'Ha', b'Hc',
+    b'Hc', b'Hc', b'Hc', b'He', b'He', b'He', b'He', b'Hi', b'Hi', b'Hi', b'Hi', b'Ho', b'Ho',
+    b'Ho', b'Ho', b'Hs', b'Hs', b'Hs', b'Hs', b'Ht', b'Ht', b'Ht', b'Ht', b'H ', b'H ', b'H%',
+    b'H%', b'H-', b'H-', b'H.', b'H.', b'H/', b'H/', b'H3', b'H3', b'H4', b'H4', b'H5', b'H5',
+    b'H6', b'H6', b'H7', b'H7', b'H8', b'H8', b'H9', b'H9', b'H=', b'H=', b'HA', b'HA', b'H_',
+    b'H_', b'Hb', b'Hb', b'Hd', b'Hd', b'Hf', b'Hf', b'Hg', b'Hg', b'Hh', b'Hh', b'Hl', b'Hl',
+    b'Hm', b'Hm', b'Hn', b'Hn', b'Hp', b'Hp', b'Hr', b'Hr', b'Hu', b'Hu', b'H:', b'HB', b'HC',
+    b'HD', b'HE', b'HF', b'HG', b'HH', b'HI', b'HJ', b'HK', b'HL', b'HM', b'HN', b'HO', b'HP',
+    b'HQ', b'HR', b'HS', b'HT', b'HU', b'HV', b'HW', b'HY', b'Hj', b'Hk', b'Hq', b'Hv', b'Hw',
+    b'Hx', b'Hy', b'Hz', b'H', b'H', b'H', b'H', b'I0', b'I0', b'I1', b'I1', b'I2', b'I2', b'Ia',
+    b'Ia', b'Ic', b'Ic', b'Ie', b'Ie', b'Ii', b'Ii', b'Io', b'Io', b'Is', b'Is', b'It', b'It',
+    b'I ', b'I%', b'I-', b'I.', b'I/', b'I3', b'I4', b'I5', b'I6', b'I7', b'I8', b'I9', b'I=',
+    b'IA', b'I_', b'Ib', b'Id', b'If', b'Ig', b'Ih', b'Il', b'Im', b'In', b'Ip', b'Ir', b'Iu', b'I',
+    b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I', b'I',
+    b'I', b'J0', b'J0', b'J1', b'J1', b'J2', b'J2', b'Ja', b'Ja', b'Jc', b'Jc', b'Je', b'Je', b'Ji',
+    b'Ji', b'Jo', b'Jo', b'Js', b'Js', b'Jt', b'Jt', b'J ', b'J%', b'J-', b'J.', b'J/', b'J3',
+    b'J4', b'J5', b'J6', b'J7', b'J8', b'J9', b'J=', b'JA', b'J_', b'Jb', b'Jd', b'Jf', b'Jg',
+    b'Jh', b'Jl', b'Jm', b'Jn', b'Jp', b'Jr', b'Ju', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J',
+    b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'J', b'K0', b'K0', b'K1', b'K1', b'K2',
+    b'K2', b'Ka', b'Ka', b'Kc', b'Kc', b'Ke', b'Ke', b'Ki', b'Ki', b'Ko', b'Ko', b'Ks', b'Ks',
+    b'Kt', b'Kt', b'K ', b'K%', b'K-', b'K.', b'K/', b'K3', b'K4', b'K5', b'K6', b'K7', b'K8',
+    b'K9', b'K=', b'KA', b'K_', b'Kb', b'Kd', b'Kf', b'Kg', b'Kh', b'Kl', b'Km', b'Kn', b'Kp',
+    b'Kr', b'Ku', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K', b'K',
+    b'K', b'K', b'K', b'K', b'K', b'L0', b'L0', b'L1', b'L1', b'L2', b'L2', b'La', b'La', b'Lc',
+    b'Lc', b'Le', b'Le', b'Li', b'Li', b'Lo', b'Lo', b'Ls', b'Ls', b'Lt', b'Lt', b'L ', b'L%',
+    b'L-', b'L.', b'L/', b'L3', b'L4', b'L5', b'L6', b'L7', b'L8', b'L9', b'L=', b'LA', b'L_',
+    b'Lb', b'Ld', b'Lf', b'Lg', b'Lh', b'Ll', b'Lm', b'Ln', b'Lp', b'Lr', b'Lu', b'L', b'L', b'L',
+    b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'L', b'I0',
+    b'I0', b'I0', b'I0', b'I1', b'I1', b'I1', b'I1', b'I2', b'I2', b'I2', b'I2', b'Ia', b'Ia',
+    b'Ia', b'Ia', b'Ic', b'Ic', b'Ic', b'Ic', b'Ie', b'Ie', b'Ie', b'Ie', b'Ii', b'Ii', b'Ii',
+    b'Ii', b'Io', b'Io', b'Io', b'Io', b'Is', b'Is', b'Is', b'Is', b'It', b'It', b'It', b'It',
+    b'I ', b'I ', b'I%', b'I%', b'I-', b'I-', b'I.', b'I.', b'I/', b'I/', b'I3', b'I3', b'I4',
+    b'I4', b'I5', b'I5', b'I6', b'I6', b'I7', b'I7', b'I8', b'I8', b'I9', b'I9', b'I=', b'I=',
+    b'IA', b'IA', b'I_', b'I_', b'Ib', b'Ib', b'Id', b'Id', b'If', b'If', b'Ig', b'Ig', b'Ih',
+    b'Ih', b'Il', b'Il', b'Im', b'Im', b'In', b'In', b'Ip', b'Ip', b'Ir', b'Ir', b'Iu', b'Iu',
+    b'I:', b'IB', b'IC', b'ID', b'IE', b'IF', b'IG', b'IH', b'II', b'IJ', b'IK', b'IL', b'IM',
+    b'IN', b'IO', b'IP', b'IQ', b'IR', b'IS', b'IT', b'IU', b'IV', b'IW', b'IY', b'Ij', b'Ik',
+    b'Iq', b'Iv', b'Iw', b'Ix', b'Iy', b'Iz', b'I', b'I', b'I', b'I', b'J0', b'J0', b'J0', b'J0',
+    b'J1', b'J1', b'J1', b'J1', b'J2', b'J2', b'J2', b'J2', b'Ja', b'Ja', b'Ja', b'Ja', b'Jc',
+    b'Jc', b'Jc', b'Jc', b'Je', b'Je', b'Je', b'Je', b'Ji', b'Ji', b'Ji', b'Ji', b'Jo', b'Jo',
+    b'Jo', b'Jo', b'Js', b'Js', b'Js', b'Js', b'Jt', b'Jt', b'Jt', b'Jt', b'J ', b'J ', b'J%',
+    b'J%', b'J-', b'J-', b'J.', b'J.', b'J/', b'J/', b'J3', b'J3', b'J4', b'J4', b'J5', b'J5',
+    b'J6', b'J6', b'J7', b'J7', b'J8', b'J8', b'J9', b'J9', b'J=', b'J=', b'JA', b'JA', b'J_',
+    b'J_', b'Jb', b'Jb', b'Jd', b'Jd', b'Jf', b'Jf', b'Jg', b'Jg', b'Jh', b'Jh', b'Jl', b'Jl',
+    b'Jm', b'Jm', b'Jn', b'Jn', b'Jp', b'Jp', b'Jr', b'Jr', b'Ju', b'Ju', b'J:', b'JB', b'JC',
+    b'JD', b'JE', b'JF', b'JG', b'JH', b'JI', b'JJ', b'JK', b'JL', b'JM', b'JN', b'JO', b'JP',
+    b'JQ', b'JR', b'JS', b'JT', b'JU', b'JV', b'JW', b'JY', b'Jj', b'Jk', b'Jq', b'Jv', b'Jw',
+    b'Jx', b'Jy', b'Jz', b'J', b'J', b'J', b'J', b'K0', b'K0', b'K0', b'K0', b'K1', b'K1', b'K1',
+    b'K1', b'K2', b'K2', b'K2', b'K2', b'Ka', b'Ka', b'Ka', b'Ka', b'Kc', b'Kc', b'Kc', b'Kc',
+    b'Ke', b'Ke', b'Ke', b'Ke', b'Ki', b'Ki', b'Ki', b'Ki', b'Ko', b'Ko', b'Ko', b'Ko', b'Ks',
+    b'Ks', b'Ks', b'Ks', b'Kt', b'Kt', b'Kt', b'Kt', b'K ', b'K ', b'K%', b'K%', b'K-', b'K-',
+    b'K.', b'K.', b'K/', b'K/', b'K3', b'K3', b'K4', b'K4', b'K5', b'K5', b'K6', b'K6', b'K7',
+    b'K7', b'K8', b'K8', b'K9', b'K9', b'K=', b'K=', b'KA', b'KA', b'K_', b'K_', b'Kb', b'Kb',
+    b'Kd', b'Kd', b'Kf', b'Kf', b'Kg', b'Kg', b'Kh', b'Kh', b'Kl', b'Kl', b'Km', b'Km', b'Kn',
+    b'Kn', b'Kp', b'Kp', b'Kr', b'Kr', b'Ku', b'Ku', b'K:', b'KB', b'KC', b'KD', b'KE', b'KF',
+    b'KG', b'KH', b'KI', b'KJ', b'KK', b'KL', b'KM', b'KN', b'KO', b'KP', b'KQ', b'KR', b'KS',
+    b'KT', b'KU', b'KV', b'KW', b'KY', b'Kj', b'Kk', b'Kq', b'Kv', b'Kw', b'Kx', b'Ky', b'Kz', b'K',
+    b'K', b'K', b'K', b'L0', b'L0', b'L0', b'L0', b'L1', b'L1', b'L1', b'L1', b'L2', b'L2', b'L2',
+    b'L2', b'La', b'La', b'La', b'La', b'Lc', b'Lc', b'Lc', b'Lc', b'Le', b'Le', b'Le', b'Le',
+    b'Li', b'Li', b'Li', b'Li', b'Lo', b'Lo', b'Lo', b'Lo', b'Ls', b'Ls', b'Ls', b'Ls', b'Lt',
+    b'Lt', b'Lt', b'Lt', b'L ', b'L ', b'L%', b'L%', b'L-', b'L-', b'L.', b'L.', b'L/', b'L/',
+    b'L3', b'L3', b'L4', b'L4', b'L5', b'L5', b'L6', b'L6', b'L7', b'L7', b'L8', b'L8', b'L9',
+    b'L9', b'L=', b'L=', b'LA', b'LA', b'L_', b'L_', b'Lb', b'Lb', b'Ld', b'Ld', b'Lf', b'Lf',
+    b'Lg', b'Lg', b'Lh', b'Lh', b'Ll', b'Ll', b'Lm', b'Lm', b'Ln', b'Ln', b'Lp', b'Lp', b'Lr',
+    b'Lr', b'Lu', b'Lu', b'L:', b'LB', b'LC', b'LD', b'LE', b'LF', b'LG', b'LH', b'LI', b'LJ',
+    b'LK', b'LL', b'LM', b'LN', b'LO', b'LP', b'LQ', b'LR', b'LS', b'LT', b'LU', b'LV', b'LW',
+    b'LY', b'Lj', b'Lk', b'Lq', b'Lv', b'Lw', b'Lx', b'Ly', b'Lz', b'L', b'L', b'L', b'L', b'M0',
+    b'M1', b'M2', b'Ma', b'Mc', b'Me', b'Mi', b'Mo', b'Ms', b'Mt', b'M', b'M', b'M', b'M', b'M',
+    b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M',
+    b'M', b'N0', b'N1', b'N2', b'Na', b'Nc', b'Ne', b'Ni', b'No', b'Ns', b'Nt', b'N', b'N', b'N',
+    b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N',
+    b'N', b'N', b'N', b'O0', b'O1', b'O2', b'Oa', b'Oc', b'Oe', b'Oi', b'Oo', b'Os', b'Ot', b'O',
+    b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O',
+    b'O', b'O', b'O', b'O', b'O', b'P0', b'P1', b'P2', b'Pa', b'Pc', b'Pe', b'Pi', b'Po', b'Ps',
+    b'Pt', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P',
+    b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'Q0', b'Q1', b'Q2', b'Qa', b'Qc', b'Qe', b'Qi',
+    b'Qo', b'Qs', b'Qt', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q',
+    b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'R0', b'R1', b'R2', b'Ra', b'Rc',
+    b'Re', b'Ri', b'Ro', b'Rs', b'Rt', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R',
+    b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'S0', b'S1', b'S2',
+    b'Sa', b'Sc', b'Se', b'Si', b'So', b'Ss', b'St', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S',
+    b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'T0',
+    b'T1', b'T2', b'Ta', b'Tc', b'Te', b'Ti', b'To', b'Ts', b'Tt', b'T', b'T', b'T', b'T', b'T',
+    b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T',
+    b'T', b'M0', b'M0', b'M1', b'M1', b'M2', b'M2', b'Ma', b'Ma', b'Mc', b'Mc', b'Me', b'Me', b'Mi',
+    b'Mi', b'Mo', b'Mo', b'Ms', b'Ms', b'Mt', b'Mt', b'M ', b'M%', b'M-', b'M.', b'M/', b'M3',
+    b'M4', b'M5', b'M6', b'M7', b'M8', b'M9', b'M=', b'MA', b'M_', b'Mb', b'Md', b'Mf', b'Mg',
+    b'Mh', b'Ml', b'Mm', b'Mn', b'Mp', b'Mr', b'Mu', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M',
+    b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'M', b'N0', b'N0', b'N1', b'N1', b'N2',
+    b'N2', b'Na', b'Na', b'Nc', b'Nc', b'Ne', b'Ne', b'Ni', b'Ni', b'No', b'No', b'Ns', b'Ns',
+    b'Nt', b'Nt', b'N ', b'N%', b'N-', b'N.', b'N/', b'N3', b'N4', b'N5', b'N6', b'N7', b'N8',
+    b'N9', b'N=', b'NA', b'N_', b'Nb', b'Nd', b'Nf', b'Ng', b'Nh', b'Nl', b'Nm', b'Nn', b'Np',
+    b'Nr', b'Nu', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N', b'N',
+    b'N', b'N', b'N', b'N', b'N', b'O0', b'O0', b'O1', b'O1', b'O2', b'O2', b'Oa', b'Oa', b'Oc',
+    b'Oc', b'Oe', b'Oe', b'Oi', b'Oi', b'Oo', b'Oo', b'Os', b'Os', b'Ot', b'Ot', b'O ', b'O%',
+    b'O-', b'O.', b'O/', b'O3', b'O4', b'O5', b'O6', b'O7', b'O8', b'O9', b'O=', b'OA', b'O_',
+    b'Ob', b'Od', b'Of', b'Og', b'Oh', b'Ol', b'Om', b'On', b'Op', b'Or', b'Ou', b'O', b'O', b'O',
+    b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'O', b'P0',
+    b'P0', b'P1', b'P1', b'P2', b'P2', b'Pa', b'Pa', b'Pc', b'Pc', b'Pe', b'Pe', b'Pi', b'Pi',
+    b'Po', b'Po', b'Ps', b'Ps', b'Pt', b'Pt', b'P ', b'P%', b'P-', b'P.', b'P/', b'P3', b'P4',
+    b'P5', b'P6', b'P7', b'P8', b'P9', b'P=', b'PA', b'P_', b'Pb', b'Pd', b'Pf', b'Pg', b'Ph',
+    b'Pl', b'Pm', b'Pn', b'Pp', b'Pr', b'Pu', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P',
+    b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'P', b'M0', b'M0', b'M0', b'M0', b'M1', b'M1',
+    b'M1', b'M1', b'M2', b'M2', b'M2', b'M2', b'Ma', b'Ma', b'Ma', b'Ma', b'Mc', b'Mc', b'Mc',
+    b'Mc', b'Me', b'Me', b'Me', b'Me', b'Mi', b'Mi', b'Mi', b'Mi', b'Mo', b'Mo', b'Mo', b'Mo',
+    b'Ms', b'Ms', b'Ms', b'Ms', b'Mt', b'Mt', b'Mt', b'Mt', b'M ', b'M ', b'M%', b'M%', b'M-',
+    b'M-', b'M.', b'M.', b'M/', b'M/', b'M3', b'M3', b'M4', b'M4', b'M5', b'M5', b'M6', b'M6',
+    b'M7', b'M7', b'M8', b'M8', b'M9', b'M9', b'M=', b'M=', b'MA', b'MA', b'M_', b'M_', b'Mb',
+    b'Mb', b'Md', b'Md', b'Mf', b'Mf', b'Mg', b'Mg', b'Mh', b'Mh', b'Ml', b'Ml', b'Mm', b'Mm',
+    b'Mn', b'Mn', b'Mp', b'Mp', b'Mr', b'Mr', b'Mu', b'Mu', b'M:', b'MB', b'MC', b'MD', b'ME',
+    b'MF', b'MG', b'MH', b'MI', b'MJ', b'MK', b'ML', b'MM', b'MN', b'MO', b'MP', b'MQ', b'MR',
+    b'MS', b'MT', b'MU', b'MV', b'MW', b'MY', b'Mj', b'Mk', b'Mq', b'Mv', b'Mw', b'Mx', b'My',
+    b'Mz', b'M', b'M', b'M', b'M', b'N0', b'N0', b'N0', b'N0', b'N1', b'N1', b'N1', b'N1', b'N2',
+    b'N2', b'N2', b'N2', b'Na', b'Na', b'Na', b'Na', b'Nc', b'Nc', b'Nc', b'Nc', b'Ne', b'Ne',
+    b'Ne', b'Ne', b'Ni', b'Ni', b'Ni', b'Ni', b'No', b'No', b'No', b'No', b'Ns', b'Ns', b'Ns',
+    b'Ns', b'Nt', b'Nt', b'Nt', b'Nt', b'N ', b'N ', b'N%', b'N%', b'N-', b'N-', b'N.', b'N.',
+    b'N/', b'N/', b'N3', b'N3', b'N4', b'N4', b'N5', b'N5', b'N6', b'N6', b'N7', b'N7', b'N8',
+    b'N8', b'N9', b'N9', b'N=', b'N=', b'NA', b'NA', b'N_', b'N_', b'Nb', b'Nb', b'Nd', b'Nd',
+    b'Nf', b'Nf', b'Ng', b'Ng', b'Nh', b'Nh', b'Nl', b'Nl', b'Nm', b'Nm', b'Nn', b'Nn', b'Np',
+    b'Np', b'Nr', b'Nr', b'Nu', b'Nu', b'N:', b'NB', b'NC', b'ND', b'NE', b'NF', b'NG', b'NH',
+    b'NI', b'NJ', b'NK', b'NL', b'NM', b'NN', b'NO', b'NP', b'NQ', b'NR', b'NS', b'NT', b'NU',
+    b'NV', b'NW', b'NY', b'Nj', b'Nk', b'Nq', b'Nv', b'Nw', b'Nx', b'Ny', b'Nz', b'N', b'N', b'N',
+    b'N', b'O0', b'O0', b'O0', b'O0', b'O1', b'O1', b'O1', b'O1', b'O2', b'O2', b'O2', b'O2', b'Oa',
+    b'Oa', b'Oa', b'Oa', b'Oc', b'Oc', b'Oc', b'Oc', b'Oe', b'Oe', b'Oe', b'Oe', b'Oi', b'Oi',
+    b'Oi', b'Oi', b'Oo', b'Oo', b'Oo', b'Oo', b'Os', b'Os', b'Os', b'Os', b'Ot', b'Ot', b'Ot',
+    b'Ot', b'O ', b'O ', b'O%', b'O%', b'O-', b'O-', b'O.', b'O.', b'O/', b'O/', b'O3', b'O3',
+    b'O4', b'O4', b'O5', b'O5', b'O6', b'O6', b'O7', b'O7', b'O8', b'O8', b'O9', b'O9', b'O=',
+    b'O=', b'OA', b'OA', b'O_', b'O_', b'Ob', b'Ob', b'Od', b'Od', b'Of', b'Of', b'Og', b'Og',
+    b'Oh', b'Oh', b'Ol', b'Ol', b'Om', b'Om', b'On', b'On', b'Op', b'Op', b'Or', b'Or', b'Ou',
+    b'Ou', b'O:', b'OB', b'OC', b'OD', b'OE', b'OF', b'OG', b'OH', b'OI', b'OJ', b'OK', b'OL',
+    b'OM', b'ON', b'OO', b'OP', b'OQ', b'OR', b'OS', b'OT', b'OU', b'OV', b'OW', b'OY', b'Oj',
+    b'Ok', b'Oq', b'Ov', b'Ow', b'Ox', b'Oy', b'Oz', b'O', b'O', b'O', b'O', b'P0', b'P0', b'P0',
+    b'P0', b'P1', b'P1', b'P1', b'P1', b'P2', b'P2', b'P2', b'P2', b'Pa', b'Pa', b'Pa', b'Pa',
+    b'Pc', b'Pc', b'Pc', b'Pc', b'Pe', b'Pe', b'Pe', b'Pe', b'Pi', b'Pi', b'Pi', b'Pi', b'Po',
+    b'Po', b'Po', b'Po', b'Ps', b'Ps', b'Ps', b'Ps', b'Pt', b'Pt', b'Pt', b'Pt', b'P ', b'P ',
+    b'P%', b'P%', b'P-', b'P-', b'P.', b'P.', b'P/', b'P/', b'P3', b'P3', b'P4', b'P4', b'P5',
+    b'P5', b'P6', b'P6', b'P7', b'P7', b'P8', b'P8', b'P9', b'P9', b'P=', b'P=', b'PA', b'PA',
+    b'P_', b'P_', b'Pb', b'Pb', b'Pd', b'Pd', b'Pf', b'Pf', b'Pg', b'Pg', b'Ph', b'Ph', b'Pl',
+    b'Pl', b'Pm', b'Pm', b'Pn', b'Pn', b'Pp', b'Pp', b'Pr', b'Pr', b'Pu', b'Pu', b'P:', b'PB',
+    b'PC', b'PD', b'PE', b'PF', b'PG', b'PH', b'PI', b'PJ', b'PK', b'PL', b'PM', b'PN', b'PO',
+    b'PP', b'PQ', b'PR', b'PS', b'PT', b'PU', b'PV', b'PW', b'PY', b'Pj', b'Pk', b'Pq', b'Pv',
+    b'Pw', b'Px', b'Py', b'Pz', b'P', b'P', b'P', b'P', b'Q0', b'Q0', b'Q1', b'Q1', b'Q2', b'Q2',
+    b'Qa', b'Qa', b'Qc', b'Qc', b'Qe', b'Qe', b'Qi', b'Qi', b'Qo', b'Qo', b'Qs', b'Qs', b'Qt',
+    b'Qt', b'Q ', b'Q%', b'Q-', b'Q.', b'Q/', b'Q3', b'Q4', b'Q5', b'Q6', b'Q7', b'Q8', b'Q9',
+    b'Q=', b'QA', b'Q_', b'Qb', b'Qd', b'Qf', b'Qg', b'Qh', b'Ql', b'Qm', b'Qn', b'Qp', b'Qr',
+    b'Qu', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q', b'Q',
+    b'Q', b'Q', b'Q', b'R0', b'R0', b'R1', b'R1', b'R2', b'R2', b'Ra', b'Ra', b'Rc', b'Rc', b'Re',
+    b'Re', b'Ri', b'Ri', b'Ro', b'Ro', b'Rs', b'Rs', b'Rt', b'Rt', b'R ', b'R%', b'R-', b'R.',
+    b'R/', b'R3', b'R4', b'R5', b'R6', b'R7', b'R8', b'R9', b'R=', b'RA', b'R_', b'Rb', b'Rd',
+    b'Rf', b'Rg', b'Rh', b'Rl', b'Rm', b'Rn', b'Rp', b'Rr', b'Ru', b'R', b'R', b'R', b'R', b'R',
+    b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'R', b'S0', b'S0',
+    b'S1', b'S1', b'S2', b'S2', b'Sa', b'Sa', b'Sc', b'Sc', b'Se', b'Se', b'Si', b'Si', b'So',
+    b'So', b'Ss', b'Ss', b'St', b'St', b'S ', b'S%', b'S-', b'S.', b'S/', b'S3', b'S4', b'S5',
+    b'S6', b'S7', b'S8', b'S9', b'S=', b'SA', b'S_', b'Sb', b'Sd', b'Sf', b'Sg', b'Sh', b'Sl',
+    b'Sm', b'Sn', b'Sp', b'Sr', b'Su', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S',
+    b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'S', b'T0', b'T0', b'T1', b'T1', b'T2', b'T2', b'Ta',
+    b'Ta', b'Tc', b'Tc', b'Te', b'Te', b'Ti', b'Ti', b'To', b'To', b'Ts', b'Ts', b'Tt', b'Tt',
+    b'T ', b'T%', b'T-', b'T.', b'T/', b'T3', b'T4', b'T5', b'T6', b'T7', b'T8', b'T9', b'T=',
+    b'TA', b'T_', b'Tb', b'Td', b'Tf', b'Tg', b'Th', b'Tl', b'Tm', b'Tn', b'Tp', b'Tr', b'Tu', b'T',
+    b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T', b'T',
+    b'T', b'Q0', b'Q0', b'Q0', b'Q0', b'Q1', b'Q1', b'Q1', b'Q1', b'Q2', b'Q2', b'Q2', b'Q2', b'Qa',
+    b'Qa', b'Qa', b'Qa', b'Qc', b'Qc', b'Qc', b'Qc', b'Qe', b'Qe', b'Qe', b'Qe', b'Qi', b'Qi',
+    b'Qi', b'Qi', b'Qo', b'Qo', b'Qo', b'Qo', b'Qs', b'Qs', b'Qs', b'Qs', b'Qt', b'Qt', b'Qt',
+    b'Qt', b'Q ', b'Q ', b'Q%', b'Q%', b'Q-', b'Q-', b'Q.', b'Q.', b'Q/', b'Q/', b'Q3', b'Q3',
+    b'Q4', b'Q4', b'Q5', b'Q5', b'Q6', b'Q6', b'Q7', b'Q7', b'Q8', b'Q8', b'Q9', b'Q9', b'Q=',
+    b'Q=', b'QA', b'QA', b'Q_', b'Q_', b'Qb', b'Qb', b'Qd', b'Qd', b'Qf', b'Qf', b'Qg', b'Qg',
+    b'Qh', b'Qh', b'Ql', b'Ql', b'Qm', b'Qm', b'Qn', b'Qn', b'Qp', b'Qp', b'Qr', b'Qr', b'Qu',
+    b'Qu', b'Q:', b'QB', b'QC', b'QD', b'QE', b'QF', b'QG', b'QH', b'QI', b'QJ', b'QK', b'QL',
+    b'QM', b'QN', b'QO', b'QP', b'QQ', b'QR', b'QS', b'QT', b'QU', b'QV', b'QW', b'QY', b'Qj',
+    b'Qk', b'Qq', b'Qv', b'Qw', b'Qx', b'Qy', b'Qz', b'Q', b'Q', b'Q', b'Q', b'R0', b'R0', b'R0',
+    b'R0', b'R1', b'R1', b'R1', b'R1', b'R2', b'R2', b'R2', b'R2', b'Ra', b'Ra', b'Ra', b'Ra',
+    b'Rc', b'Rc', b'Rc', b'Rc', b'Re', b'Re', b'Re', b'Re', b'Ri', b'Ri', b'Ri', b'Ri', b'Ro',
+    b'Ro', b'Ro', b'Ro', b'Rs', b'Rs', b'Rs', b'Rs', b'Rt', b'Rt', b'Rt', b'Rt', b'R ', b'R ',
+    b'R%', b'R%', b'R-', b'R-', b'R.', b'R.', b'R/', b'R/', b'R3', b'R3', b'R4', b'R4', b'R5',
+    b'R5', b'R6', b'R6', b'R7', b'R7', b'R8', b'R8', b'R9', b'R9', b'R=', b'R=', b'RA', b'RA',
+    b'R_', b'R_', b'Rb', b'Rb', b'Rd', b'Rd', b'Rf', b'Rf', b'Rg', b'Rg', b'Rh', b'Rh', b'Rl',
+    b'Rl', b'Rm', b'Rm', b'Rn', b'Rn', b'Rp', b'Rp', b'Rr', b'Rr', b'Ru', b'Ru', b'R:', b'RB',
+    b'RC', b'RD', b'RE', b'RF', b'RG', b'RH', b'RI', b'RJ', b'RK', b'RL', b'RM', b'RN', b'RO',
+    b'RP', b'RQ', b'RR', b'RS', b'RT', b'RU', b'RV', b'RW', b'RY', b'Rj', b'Rk', b'Rq', b'Rv',
+    b'Rw', b'Rx', b'Ry', b'Rz', b'R', b'R', b'R', b'R', b'S0', b'S0', b'S0', b'S0', b'S1', b'S1',
+    b'S1', b'S1', b'S2', b'S2', b'S2', b'S2', b'Sa', b'Sa', b'Sa', b'Sa', b'Sc', b'Sc', b'Sc',
+    b'Sc', b'Se', b'Se', b'Se', b'Se', b'Si', b'Si', b'Si', b'Si', b'So', b'So', b'So', b'So',
+    b'Ss', b'Ss', b'Ss', b'Ss', b'St', b'St', b'St', b'St', b'S ', b'S ', b'S%', b'S%', b'S-',
+    b'S-', b'S.', b'S.', b'S/', b'S/', b'S3', b'S3', b'S4', b'S4', b'S5', b'S5', b'S6', b'S6',
+    b'S7', b'S7', b'S8', b'S8', b'S9', b'S9', b'S=', b'S=', b'SA', b'SA', b'S_', b'S_', b'Sb',
+    b'Sb', b'Sd', b'Sd', b'Sf', b'Sf', b'Sg', b'Sg', b'Sh', b'Sh', b'Sl', b'Sl', b'Sm', b'Sm',
+    b'Sn', b'Sn', b'Sp', b'Sp', b'Sr', b'Sr', b'Su', b'Su', b'S:', b'SB', b'SC', b'SD', b'SE',
+    b'SF', b'SG', b'SH', b'SI', b'SJ', b'SK', b'SL', b'SM', b'SN', b'SO', b'SP', b'SQ', b'SR',
+    b'SS', b'ST', b'SU', b'SV', b'SW', b'SY', b'Sj', b'Sk', b'Sq', b'Sv', b'Sw', b'Sx', b'Sy',
+    b'Sz', b'S', b'S', b'S', b'S', b'T0', b'T0', b'T0', b'T0', b'T1', b'T1', b'T1', b'T1', b'T2',
+    b'T2', b'T2', b'T2', b'Ta', b'Ta', b'Ta', b'Ta', b'Tc', b'Tc', b'Tc', b'Tc', b'Te', b'Te',
+    b'Te', b'Te', b'Ti', b'Ti', b'Ti', b'Ti', b'To', b'To', b'To', b'To', b'Ts', b'Ts', b'Ts',
+    b'Ts', b'Tt', b'Tt', b'Tt', b'Tt', b'T ', b'T ', b'T%', b'T%', b'T-', b'T-', b'T.', b'T.',
+    b'T/', b'T/', b'T3', b'T3', b'T4', b'T4', b'T5', b'T5', b'T6', b'T6', b'T7', b'T7', b'T8',
+    b'T8', b'T9', b'T9', b'T=', b'T=', b'TA', b'TA', b'T_', b'T_', b'Tb', b'Tb', b'Td', b'Td',
+    b'Tf', b'Tf', b'Tg', b'Tg', b'Th', b'Th', b'Tl', b'Tl', b'Tm', b'Tm', b'Tn', b'Tn', b'Tp',
+    b'Tp', b'Tr', b'Tr', b'Tu', b'Tu', b'T:', b'TB', b'TC', b'TD', b'TE', b'TF', b'TG', b'TH',
+    b'TI', b'TJ', b'TK', b'TL', b'TM', b'TN', b'TO', b'TP', b'TQ', b'TR', b'TS', b'TT', b'TU',
+    b'TV', b'TW', b'TY', b'Tj', b'Tk', b'Tq', b'Tv', b'Tw', b'Tx', b'Ty', b'Tz', b'T', b'T', b'T',
+    b'T', b'U0', b'U1', b'U2', b'Ua', b'Uc', b'Ue', b'Ui', b'Uo', b'Us', b'Ut', b'U', b'U', b'U',
+    b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U',
+    b'U', b'U', b'U', b'V0', b'V1', b'V2', b'Va', b'Vc', b'Ve', b'Vi', b'Vo', b'Vs', b'Vt', b'V',
+    b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V',
+    b'V', b'V', b'V', b'V', b'V', b'W0', b'W1', b'W2', b'Wa', b'Wc', b'We', b'Wi', b'Wo', b'Ws',
+    b'Wt', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W',
+    b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'Y0', b'Y1', b'Y2', b'Ya', b'Yc', b'Ye', b'Yi',
+    b'Yo', b'Ys', b'Yt', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y',
+    b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'j0', b'j1', b'j2', b'ja', b'jc',
+    b'je', b'ji', b'jo', b'js', b'jt', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j',
+    b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'k0', b'k1', b'k2',
+    b'ka', b'kc', b'ke', b'ki', b'ko', b'ks', b'kt', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k',
+    b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'q0',
+    b'q1', b'q2', b'qa', b'qc', b'qe', b'qi', b'qo', b'qs', b'qt', b'q', b'q', b'q', b'q', b'q',
+    b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q',
+    b'q', b'v0', b'v1', b'v2', b'va', b'vc', b've', b'vi', b'vo', b'vs', b'vt', b'v', b'v', b'v',
+    b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v',
+    b'v', b'v', b'v', b'U0', b'U0', b'U1', b'U1', b'U2', b'U2', b'Ua', b'Ua', b'Uc', b'Uc', b'Ue',
+    b'Ue', b'Ui', b'Ui', b'Uo', b'Uo', b'Us', b'Us', b'Ut', b'Ut', b'U ', b'U%', b'U-', b'U.',
+    b'U/', b'U3', b'U4', b'U5', b'U6', b'U7', b'U8', b'U9', b'U=', b'UA', b'U_', b'Ub', b'Ud',
+    b'Uf', b'Ug', b'Uh', b'Ul', b'Um', b'Un', b'Up', b'Ur', b'Uu', b'U', b'U', b'U', b'U', b'U',
+    b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'U', b'V0', b'V0',
+    b'V1', b'V1', b'V2', b'V2', b'Va', b'Va', b'Vc', b'Vc', b'Ve', b'Ve', b'Vi', b'Vi', b'Vo',
+    b'Vo', b'Vs', b'Vs', b'Vt', b'Vt', b'V ', b'V%', b'V-', b'V.', b'V/', b'V3', b'V4', b'V5',
+    b'V6', b'V7', b'V8', b'V9', b'V=', b'VA', b'V_', b'Vb', b'Vd', b'Vf', b'Vg', b'Vh', b'Vl',
+    b'Vm', b'Vn', b'Vp', b'Vr', b'Vu', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V',
+    b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'V', b'W0', b'W0', b'W1', b'W1', b'W2', b'W2', b'Wa',
+    b'Wa', b'Wc', b'Wc', b'We', b'We', b'Wi', b'Wi', b'Wo', b'Wo', b'Ws', b'Ws', b'Wt', b'Wt',
+    b'W ', b'W%', b'W-', b'W.', b'W/', b'W3', b'W4', b'W5', b'W6', b'W7', b'W8', b'W9', b'W=',
+    b'WA', b'W_', b'Wb', b'Wd', b'Wf', b'Wg', b'Wh', b'Wl', b'Wm', b'Wn', b'Wp', b'Wr', b'Wu', b'W',
+    b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W', b'W',
+    b'W', b'Y0', b'Y0', b'Y1', b'Y1', b'Y2', b'Y2', b'Ya', b'Ya', b'Yc', b'Yc', b'Ye', b'Ye', b'Yi',
+    b'Yi', b'Yo', b'Yo', b'Ys', b'Ys', b'Yt', b'Yt', b'Y ', b'Y%', b'Y-', b'Y.', b'Y/', b'Y3',
+    b'Y4', b'Y5', b'Y6', b'Y7', b'Y8', b'Y9', b'Y=', b'YA', b'Y_', b'Yb', b'Yd', b'Yf', b'Yg',
+    b'Yh', b'Yl', b'Ym', b'Yn', b'Yp', b'Yr', b'Yu', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y',
+    b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'Y', b'U0', b'U0', b'U0', b'U0', b'U1',
+    b'U1', b'U1', b'U1', b'U2', b'U2', b'U2', b'U2', b'Ua', b'Ua', b'Ua', b'Ua', b'Uc', b'Uc',
+    b'Uc', b'Uc', b'Ue', b'Ue', b'Ue', b'Ue', b'Ui', b'Ui', b'Ui', b'Ui', b'Uo', b'Uo', b'Uo',
+    b'Uo', b'Us', b'Us', b'Us', b'Us', b'Ut', b'Ut', b'Ut', b'Ut', b'U ', b'U ', b'U%', b'U%',
+    b'U-', b'U-', b'U.', b'U.', b'U/', b'U/', b'U3', b'U3', b'U4', b'U4', b'U5', b'U5', b'U6',
+    b'U6', b'U7', b'U7', b'U8', b'U8', b'U9', b'U9', b'U=', b'U=', b'UA', b'UA', b'U_', b'U_',
+    b'Ub', b'Ub', b'Ud', b'Ud', b'Uf', b'Uf', b'Ug', b'Ug', b'Uh', b'Uh', b'Ul', b'Ul', b'Um',
+    b'Um', b'Un', b'Un', b'Up', b'Up', b'Ur', b'Ur', b'Uu', b'Uu', b'U:', b'UB', b'UC', b'UD',
+    b'UE', b'UF', b'UG', b'UH', b'UI', b'UJ', b'UK', b'UL', b'UM', b'UN', b'UO', b'UP', b'UQ',
+    b'UR', b'US', b'UT', b'UU', b'UV', b'UW', b'UY', b'Uj', b'Uk', b'Uq', b'Uv', b'Uw', b'Ux',
+    b'Uy', b'Uz', b'U', b'U', b'U', b'U', b'V0', b'V0', b'V0', b'V0', b'V1', b'V1', b'V1', b'V1',
+    b'V2', b'V2', b'V2', b'V2', b'Va', b'Va', b'Va', b'Va', b'Vc', b'Vc', b'Vc', b'Vc', b'Ve',
+    b'Ve', b'Ve', b'Ve', b'Vi', b'Vi', b'Vi', b'Vi', b'Vo', b'Vo', b'Vo', b'Vo', b'Vs', b'Vs',
+    b'Vs', b'Vs', b'Vt', b'Vt', b'Vt', b'Vt', b'V ', b'V ', b'V%', b'V%', b'V-', b'V-', b'V.',
+    b'V.', b'V/', b'V/', b'V3', b'V3', b'V4', b'V4', b'V5', b'V5', b'V6', b'V6', b'V7', b'V7',
+    b'V8', b'V8', b'V9', b'V9', b'V=', b'V=', b'VA', b'VA', b'V_', b'V_', b'Vb', b'Vb', b'Vd',
+    b'Vd', b'Vf', b'Vf', b'Vg', b'Vg', b'Vh', b'Vh', b'Vl', b'Vl', b'Vm', b'Vm', b'Vn', b'Vn',
+    b'Vp', b'Vp', b'Vr', b'Vr', b'Vu', b'Vu', b'V:', b'VB', b'VC', b'VD', b'VE', b'VF', b'VG',
+    b'VH', b'VI', b'VJ', b'VK', b'VL', b'VM', b'VN', b'VO', b'VP', b'VQ', b'VR', b'VS', b'VT',
+    b'VU', b'VV', b'VW', b'VY', b'Vj', b'Vk', b'Vq', b'Vv', b'Vw', b'Vx', b'Vy', b'Vz', b'V', b'V',
+    b'V', b'V', b'W0', b'W0', b'W0', b'W0', b'W1', b'W1', b'W1', b'W1', b'W2', b'W2', b'W2', b'W2',
+    b'Wa', b'Wa', b'Wa', b'Wa', b'Wc', b'Wc', b'Wc', b'Wc', b'We', b'We', b'We', b'We', b'Wi',
+    b'Wi', b'Wi', b'Wi', b'Wo', b'Wo', b'Wo', b'Wo', b'Ws', b'Ws', b'Ws', b'Ws', b'Wt', b'Wt',
+    b'Wt', b'Wt', b'W ', b'W ', b'W%', b'W%', b'W-', b'W-', b'W.', b'W.', b'W/', b'W/', b'W3',
+    b'W3', b'W4', b'W4', b'W5', b'W5', b'W6', b'W6', b'W7', b'W7', b'W8', b'W8', b'W9', b'W9',
+    b'W=', b'W=', b'WA', b'WA', b'W_', b'W_', b'Wb', b'Wb', b'Wd', b'Wd', b'Wf', b'Wf', b'Wg',
+    b'Wg', b'Wh', b'Wh', b'Wl', b'Wl', b'Wm', b'Wm', b'Wn', b'Wn', b'Wp', b'Wp', b'Wr', b'Wr',
+    b'Wu', b'Wu', b'W:', b'WB', b'WC', b'WD', b'WE', b'WF', b'WG', b'WH', b'WI', b'WJ', b'WK',
+    b'WL', b'WM', b'WN', b'WO', b'WP', b'WQ', b'WR', b'WS', b'WT', b'WU', b'WV', b'WW', b'WY',
+    b'Wj', b'Wk', b'Wq', b'Wv', b'Ww', b'Wx', b'Wy', b'Wz', b'W', b'W', b'W', b'W', b'Y0', b'Y0',
+    b'Y0', b'Y0', b'Y1', b'Y1', b'Y1', b'Y1', b'Y2', b'Y2', b'Y2', b'Y2', b'Ya', b'Ya', b'Ya',
+    b'Ya', b'Yc', b'Yc', b'Yc', b'Yc', b'Ye', b'Ye', b'Ye', b'Ye', b'Yi', b'Yi', b'Yi', b'Yi',
+    b'Yo', b'Yo', b'Yo', b'Yo', b'Ys', b'Ys', b'Ys', b'Ys', b'Yt', b'Yt', b'Yt', b'Yt', b'Y ',
+    b'Y ', b'Y%', b'Y%', b'Y-', b'Y-', b'Y.', b'Y.', b'Y/', b'Y/', b'Y3', b'Y3', b'Y4', b'Y4',
+    b'Y5', b'Y5', b'Y6', b'Y6', b'Y7', b'Y7', b'Y8', b'Y8', b'Y9', b'Y9', b'Y=', b'Y=', b'YA',
+    b'YA', b'Y_', b'Y_', b'Yb', b'Yb', b'Yd', b'Yd', b'Yf', b'Yf', b'Yg', b'Yg', b'Yh', b'Yh',
+    b'Yl', b'Yl', b'Ym', b'Ym', b'Yn', b'Yn', b'Yp', b'Yp', b'Yr', b'Yr', b'Yu', b'Yu', b'Y:',
+    b'YB', b'YC', b'YD', b'YE', b'YF', b'YG', b'YH', b'YI', b'YJ', b'YK', b'YL', b'YM', b'YN',
+    b'YO', b'YP', b'YQ', b'YR', b'YS', b'YT', b'YU', b'YV', b'YW', b'YY', b'Yj', b'Yk', b'Yq',
+    b'Yv', b'Yw', b'Yx', b'Yy', b'Yz', b'Y', b'Y', b'Y', b'Y', b'X0', b'X0', b'X0', b'X0', b'X1',
+    b'X1', b'X1', b'X1', b'X2', b'X2', b'X2', b'X2', b'Xa', b'Xa', b'Xa', b'Xa', b'Xc', b'Xc',
+    b'Xc', b'Xc', b'Xe', b'Xe', b'Xe', b'Xe', b'Xi', b'Xi', b'Xi', b'Xi', b'Xo', b'Xo', b'Xo',
+    b'Xo', b'Xs', b'Xs', b'Xs', b'Xs', b'Xt', b'Xt', b'Xt', b'Xt', b'X ', b'X ', b'X%', b'X%',
+    b'X-', b'X-', b'X.', b'X.', b'X/', b'X/', b'X3', b'X3', b'X4', b'X4', b'X5', b'X5', b'X6',
+    b'X6', b'X7', b'X7', b'X8', b'X8', b'X9', b'X9', b'X=', b'X=', b'XA', b'XA', b'X_', b'X_',
+    b'Xb', b'Xb', b'Xd', b'Xd', b'Xf', b'Xf', b'Xg', b'Xg', b'Xh', b'Xh', b'Xl', b'Xl', b'Xm',
+    b'Xm', b'Xn', b'Xn', b'Xp', b'Xp', b'Xr', b'Xr', b'Xu', b'Xu', b'X:', b'XB', b'XC', b'XD',
+    b'XE', b'XF', b'XG', b'XH', b'XI', b'XJ', b'XK', b'XL', b'XM', b'XN', b'XO', b'XP', b'XQ',
+    b'XR', b'XS', b'XT', b'XU', b'XV', b'XW', b'XY', b'Xj', b'Xk', b'Xq', b'Xv', b'Xw', b'Xx',
+    b'Xy', b'Xz', b'X', b'X', b'X', b'X', b'Z0', b'Z0', b'Z0', b'Z0', b'Z1', b'Z1', b'Z1', b'Z1',
+    b'Z2', b'Z2', b'Z2', b'Z2', b'Za', b'Za', b'Za', b'Za', b'Zc', b'Zc', b'Zc', b'Zc', b'Ze',
+    b'Ze', b'Ze', b'Ze', b'Zi', b'Zi', b'Zi', b'Zi', b'Zo', b'Zo', b'Zo', b'Zo', b'Zs', b'Zs',
+    b'Zs', b'Zs', b'Zt', b'Zt', b'Zt', b'Zt', b'Z ', b'Z ', b'Z%', b'Z%', b'Z-', b'Z-', b'Z.',
+    b'Z.', b'Z/', b'Z/', b'Z3', b'Z3', b'Z4', b'Z4', b'Z5', b'Z5', b'Z6', b'Z6', b'Z7', b'Z7',
+    b'Z8', b'Z8', b'Z9', b'Z9', b'Z=', b'Z=', b'ZA', b'ZA', b'Z_', b'Z_', b'Zb', b'Zb', b'Zd',
+    b'Zd', b'Zf', b'Zf', b'Zg', b'Zg', b'Zh', b'Zh', b'Zl', b'Zl', b'Zm', b'Zm', b'Zn', b'Zn',
+    b'Zp', b'Zp', b'Zr', b'Zr', b'Zu', b'Zu', b'Z:', b'ZB', b'ZC', b'ZD', b'ZE', b'ZF', b'ZG',
+    b'ZH', b'ZI', b'ZJ', b'ZK', b'ZL', b'ZM', b'ZN', b'ZO', b'ZP', b'ZQ', b'ZR', b'ZS', b'ZT',
+    b'ZU', b'ZV', b'ZW', b'ZY', b'Zj', b'Zk', b'Zq', b'Zv', b'Zw', b'Zx', b'Zy', b'Zz', b'Z', b'Z',
+    b'Z', b'Z', b'\\0', b'\\1', b'\\2', b'\\a', b'\\c', b'\\e', b'\\i', b'\\o', b'\\s', b'\\t',
+    b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\',
+    b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\xc30', b'\xc31', b'\xc32',
+    b'\xc3a', b'\xc3c', b'\xc3e', b'\xc3i', b'\xc3o', b'\xc3s', b'\xc3t', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xd00',
+    b'\xd01', b'\xd02', b'\xd0a', b'\xd0c', b'\xd0e', b'\xd0i', b'\xd0o', b'\xd0s', b'\xd0t',
+    b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\xd0', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x82', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xb8', b'\xb8', b'\xb8', b'\xb8',
+    b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8',
+    b'\xb8', b'\xb8', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2',
+    b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\xa1', b'\xa1',
+    b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa7', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\\0', b'\\0', b'\\1', b'\\1', b'\\2', b'\\2', b'\\a', b'\\a', b'\\c',
+    b'\\c', b'\\e', b'\\e', b'\\i', b'\\i', b'\\o', b'\\o', b'\\s', b'\\s', b'\\t', b'\\t', b'\\ ',
+    b'\\%', b'\\-', b'\\.', b'\\/', b'\\3', b'\\4', b'\\5', b'\\6', b'\\7', b'\\8', b'\\9', b'\\=',
+    b'\\A', b'\\_', b'\\b', b'\\d', b'\\f', b'\\g', b'\\h', b'\\l', b'\\m', b'\\n', b'\\p', b'\\r',
+    b'\\u', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\\',
+    b'\\', b'\\', b'\\', b'\\', b'\\', b'\\', b'\xc30', b'\xc30', b'\xc31', b'\xc31', b'\xc32',
+    b'\xc32', b'\xc3a', b'\xc3a', b'\xc3c', b'\xc3c', b'\xc3e', b'\xc3e', b'\xc3i', b'\xc3i',
+    b'\xc3o', b'\xc3o', b'\xc3s', b'\xc3s', b'\xc3t', b'\xc3t', b'\xc3 ', b'\xc3%', b'\xc3-',
+    b'\xc3.', b'\xc3/', b'\xc33', b'\xc34', b'\xc35', b'\xc36', b'\xc37', b'\xc38', b'\xc39',
+    b'\xc3=', b'\xc3A', b'\xc3_', b'\xc3b', b'\xc3d', b'\xc3f', b'\xc3g', b'\xc3h', b'\xc3l',
+    b'\xc3m', b'\xc3n', b'\xc3p', b'\xc3r', b'\xc3u', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3', b'\xc3',
+    b'\xc3', b'\xc3', b'\xc3', b'\xd00', b'\xd00', b'\xd01', b'\xd01', b'\xd02', b'\xd02', b'\xd0a',
+    b'\xd0a', b'\xd0c', b'\xd0c', b'\xd0e', b'\xd0e', b'\xd0i', b'\xd0i', b'\xd0o', b'\xd0o',
+    b'\xd0s', b'\xd0s', b'\xd0t', b'\xd0t', b'\xd0 ', b'\xd0%', b'\xd0-', b'\xd0.', b'\xd0/',
+    b'\xd03', b'\xd04', b'\xd05', b'\xd06', b'\xd07', b'\xd08', b'\xd09', b'\xd0=', b'\xd0A',
+    b'\xd0_', b'\xd0b', b'\xd0d', b'\xd0f', b'\xd0g', b'\xd0h', b'\xd0l', b'\xd0m', b'\xd0n',
+    b'\xd0p', b'\xd0r', b'\xd0u', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\xd0',
+    b'\xd0', b'\x800', b'\x801', b'\x802', b'\x80a', b'\x80c', b'\x80e', b'\x80i', b'\x80o',
+    b'\x80s', b'\x80t', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x820', b'\x821', b'\x822', b'\x82a', b'\x82c', b'\x82e',
+    b'\x82i', b'\x82o', b'\x82s', b'\x82t', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\\0', b'\\0', b'\\0', b'\\0', b'\\1',
+    b'\\1', b'\\1', b'\\1', b'\\2', b'\\2', b'\\2', b'\\2', b'\\a', b'\\a', b'\\a', b'\\a', b'\\c',
+    b'\\c', b'\\c', b'\\c', b'\\e', b'\\e', b'\\e', b'\\e', b'\\i', b'\\i', b'\\i', b'\\i', b'\\o',
+    b'\\o', b'\\o', b'\\o', b'\\s', b'\\s', b'\\s', b'\\s', b'\\t', b'\\t', b'\\t', b'\\t', b'\\ ',
+    b'\\ ', b'\\%', b'\\%', b'\\-', b'\\-', b'\\.', b'\\.', b'\\/', b'\\/', b'\\3', b'\\3', b'\\4',
+    b'\\4', b'\\5', b'\\5', b'\\6', b'\\6', b'\\7', b'\\7', b'\\8', b'\\8', b'\\9', b'\\9', b'\\=',
+    b'\\=', b'\\A', b'\\A', b'\\_', b'\\_', b'\\b', b'\\b', b'\\d', b'\\d', b'\\f', b'\\f', b'\\g',
+    b'\\g', b'\\h', b'\\h', b'\\l', b'\\l', b'\\m', b'\\m', b'\\n', b'\\n', b'\\p', b'\\p', b'\\r',
+    b'\\r', b'\\u', b'\\u', b'\\:', b'\\B', b'\\C', b'\\D', b'\\E', b'\\F', b'\\G', b'\\H', b'\\I',
+    b'\\J', b'\\K', b'\\L', b'\\M', b'\\N', b'\\O', b'\\P', b'\\Q', b'\\R', b'\\S', b'\\T', b'\\U',
+    b'\\V', b'\\W', b'\\Y', b'\\j', b'\\k', b'\\q', b'\\v', b'\\w', b'\\x', b'\\y', b'\\z', b'\\',
+    b'\\', b'\\', b'\\', b'\xc30', b'\xc30', b'\xc30', b'\xc30', b'\xc31', b'\xc31', b'\xc31',
+    b'\xc31', b'\xc32', b'\xc32', b'\xc32', b'\xc32', b'\xc3a', b'\xc3a', b'\xc3a', b'\xc3a',
+    b'\xc3c', b'\xc3c', b'\xc3c', b'\xc3c', b'\xc3e', b'\xc3e', b'\xc3e', b'\xc3e', b'\xc3i',
+    b'\xc3i', b'\xc3i', b'\xc3i', b'\xc3o', b'\xc3o', b'\xc3o', b'\xc3o', b'\xc3s', b'\xc3s',
+    b'\xc3s', b'\xc3s', b'\xc3t', b'\xc3t', b'\xc3t', b'\xc3t', b'\xc3 ', b'\xc3 ', b'\xc3%',
+    b'\xc3%', b'\xc3-', b'\xc3-', b'\xc3.', b'\xc3.', b'\xc3/', b'\xc3/', b'\xc33', b'\xc33',
+    b'\xc34', b'\xc34', b'\xc35', b'\xc35', b'\xc36', b'\xc36', b'\xc37', b'\xc37', b'\xc38',
+    b'\xc38', b'\xc39', b'\xc39', b'\xc3=', b'\xc3=', b'\xc3A', b'\xc3A', b'\xc3_', b'\xc3_',
+    b'\xc3b', b'\xc3b', b'\xc3d', b'\xc3d', b'\xc3f', b'\xc3f', b'\xc3g', b'\xc3g', b'\xc3h',
+    b'\xc3h', b'\xc3l', b'\xc3l', b'\xc3m', b'\xc3m', b'\xc3n', b'\xc3n', b'\xc3p', b'\xc3p',
+    b'\xc3r', b'\xc3r', b'\xc3u', b'\xc3u', b'\xc3:', b'\xc3B', b'\xc3C', b'\xc3D', b'\xc3E',
+    b'\xc3F', b'\xc3G', b'\xc3H', b'\xc3I', b'\xc3J', b'\xc3K', b'\xc3L', b'\xc3M', b'\xc3N',
+    b'\xc3O', b'\xc3P', b'\xc3Q', b'\xc3R', b'\xc3S', b'\xc3T', b'\xc3U', b'\xc3V', b'\xc3W',
+    b'\xc3Y', b'\xc3j', b'\xc3k', b'\xc3q', b'\xc3v', b'\xc3w', b'\xc3x', b'\xc3y', b'\xc3z',
+    b'\xc3', b'\xc3', b'\xc3', b'\xc3', b']0', b']0', b']0', b']0', b']1', b']1', b']1', b']1',
+    b']2', b']2', b']2', b']2', b']a', b']a', b']a', b']a', b']c', b']c', b']c', b']c', b']e',
+    b']e', b']e', b']e', b']i', b']i', b']i', b']i', b']o', b']o', b']o', b']o', b']s', b']s',
+    b']s', b']s', b']t', b']t', b']t', b']t', b'] ', b'] ', b']%', b']%', b']-', b']-', b'].',
+    b'].', b']/', b']/', b']3', b']3', b']4', b']4', b']5', b']5', b']6', b']6', b']7', b']7',
+    b']8', b']8', b']9', b']9', b']=', b']=', b']A', b']A', b']_', b']_', b']b', b']b', b']d',
+    b']d', b']f', b']f', b']g', b']g', b']h', b']h', b']l', b']l', b']m', b']m', b']n', b']n',
+    b']p', b']p', b']r', b']r', b']u', b']u', b']:', b']B', b']C', b']D', b']E', b']F', b']G',
+    b']H', b']I', b']J', b']K', b']L', b']M', b']N', b']O', b']P', b']Q', b']R', b']S', b']T',
+    b']U', b']V', b']W', b']Y', b']j', b']k', b']q', b']v', b']w', b']x', b']y', b']z', b']', b']',
+    b']', b']', b'~0', b'~0', b'~0', b'~0', b'~1', b'~1', b'~1', b'~1', b'~2', b'~2', b'~2', b'~2',
+    b'~a', b'~a', b'~a', b'~a', b'~c', b'~c', b'~c', b'~c', b'~e', b'~e', b'~e', b'~e', b'~i',
+    b'~i', b'~i', b'~i', b'~o', b'~o', b'~o', b'~o', b'~s', b'~s', b'~s', b'~s', b'~t', b'~t',
+    b'~t', b'~t', b'~ ', b'~ ', b'~%', b'~%', b'~-', b'~-', b'~.', b'~.', b'~/', b'~/', b'~3',
+    b'~3', b'~4', b'~4', b'~5', b'~5', b'~6', b'~6', b'~7', b'~7', b'~8', b'~8', b'~9', b'~9',
+    b'~=', b'~=', b'~A', b'~A', b'~_', b'~_', b'~b', b'~b', b'~d', b'~d', b'~f', b'~f', b'~g',
+    b'~g', b'~h', b'~h', b'~l', b'~l', b'~m', b'~m', b'~n', b'~n', b'~p', b'~p', b'~r', b'~r',
+    b'~u', b'~u', b'~:', b'~B', b'~C', b'~D', b'~E', b'~F', b'~G', b'~H', b'~I', b'~J', b'~K',
+    b'~L', b'~M', b'~N', b'~O', b'~P', b'~Q', b'~R', b'~S', b'~T', b'~U', b'~V', b'~W', b'~Y',
+    b'~j', b'~k', b'~q', b'~v', b'~w', b'~x', b'~y', b'~z', b'~', b'~', b'~', b'~', b'^0', b'^0',
+    b'^0', b'^0', b'^1', b'^1', b'^1', b'^1', b'^2', b'^2', b'^2', b'^2', b'^a', b'^a', b'^a',
+    b'^a', b'^c', b'^c', b'^c', b'^c', b'^e', b'^e', b'^e', b'^e', b'^i', b'^i', b'^i', b'^i',
+    b'^o', b'^o', b'^o', b'^o', b'^s', b'^s', b'^s', b'^s', b'^t', b'^t', b'^t', b'^t', b'^ ',
+    b'^ ', b'^%', b'^%', b'^-', b'^-', b'^.', b'^.', b'^/', b'^/', b'^3', b'^3', b'^4', b'^4',
+    b'^5', b'^5', b'^6', b'^6', b'^7', b'^7', b'^8', b'^8', b'^9', b'^9', b'^=', b'^=', b'^A',
+    b'^A', b'^_', b'^_', b'^b', b'^b', b'^d', b'^d', b'^f', b'^f', b'^g', b'^g', b'^h', b'^h',
+    b'^l', b'^l', b'^m', b'^m', b'^n', b'^n', b'^p', b'^p', b'^r', b'^r', b'^u', b'^u', b'^:',
+    b'^B', b'^C', b'^D', b'^E', b'^F', b'^G', b'^H', b'^I', b'^J', b'^K', b'^L', b'^M', b'^N',
+    b'^O', b'^P', b'^Q', b'^R', b'^S', b'^T', b'^U', b'^V', b'^W', b'^Y', b'^j', b'^k', b'^q',
+    b'^v', b'^w', b'^x', b'^y', b'^z', b'^', b'^', b'^', b'^', b'}0', b'}0', b'}0', b'}0', b'}1',
+    b'}1', b'}1', b'}1', b'}2', b'}2', b'}2', b'}2', b'}a', b'}a', b'}a', b'}a', b'}c', b'}c',
+    b'}c', b'}c', b'}e', b'}e', b'}e', b'}e', b'}i', b'}i', b'}i', b'}i', b'}o', b'}o', b'}o',
+    b'}o', b'}s', b'}s', b'}s', b'}s', b'}t', b'}t', b'}t', b'}t', b'} ', b'} ', b'}%', b'}%',
+    b'}-', b'}-', b'}.', b'}.', b'}/', b'}/', b'}3', b'}3', b'}4', b'}4', b'}5', b'}5', b'}6',
+    b'}6', b'}7', b'}7', b'}8', b'}8', b'}9', b'}9', b'}=', b'}=', b'}A', b'}A', b'}_', b'}_',
+    b'}b', b'}b', b'}d', b'}d', b'}f', b'}f', b'}g', b'}g', b'}h', b'}h', b'}l', b'}l', b'}m',
+    b'}m', b'}n', b'}n', b'}p', b'}p', b'}r', b'}r', b'}u', b'}u', b'}:', b'}B', b'}C', b'}D',
+    b'}E', b'}F', b'}G', b'}H', b'}I', b'}J', b'}K', b'}L', b'}M', b'}N', b'}O', b'}P', b'}Q',
+    b'}R', b'}S', b'}T', b'}U', b'}V', b'}W', b'}Y', b'}j', b'}k', b'}q', b'}v', b'}w', b'}x',
+    b'}y', b'}z', b'}', b'}', b'}', b'}', b'_0', b'_0', b'_0', b'_0', b'_1', b'_1', b'_1', b'_1',
+    b'_2', b'_2', b'_2', b'_2', b'_a', b'_a', b'_a', b'_a', b'_c', b'_c', b'_c', b'_c', b'_e',
+    b'_e', b'_e', b'_e', b'_i', b'_i', b'_i', b'_i', b'_o', b'_o', b'_o', b'_o', b'_s', b'_s',
+    b'_s', b'_s', b'_t', b'_t', b'_t', b'_t', b'_ ', b'_ ', b'_%', b'_%', b'_-', b'_-', b'_.',
+    b'_.', b'_/', b'_/', b'_3', b'_3', b'_4', b'_4', b'_5', b'_5', b'_6', b'_6', b'_7', b'_7',
+    b'_8', b'_8', b'_9', b'_9', b'_=', b'_=', b'_A', b'_A', b'__', b'__', b'_b', b'_b', b'_d',
+    b'_d', b'_f', b'_f', b'_g', b'_g', b'_h', b'_h', b'_l', b'_l', b'_m', b'_m', b'_n', b'_n',
+    b'_p', b'_p', b'_r', b'_r', b'_u', b'_u', b'_:', b'_B', b'_C', b'_D', b'_E', b'_F', b'_G',
+    b'_H', b'_I', b'_J', b'_K', b'_L', b'_M', b'_N', b'_O', b'_P', b'_Q', b'_R', b'_S', b'_T',
+    b'_U', b'_V', b'_W', b'_Y', b'_j', b'_k', b'_q', b'_v', b'_w', b'_x', b'_y', b'_z', b'_', b'_',
+    b'_', b'_', b'b0', b'b0', b'b0', b'b0', b'b1', b'b1', b'b1', b'b1', b'b2', b'b2', b'b2', b'b2',
+    b'ba', b'ba', b'ba', b'ba', b'bc', b'bc', b'bc', b'bc', b'be', b'be', b'be', b'be', b'bi',
+    b'bi', b'bi', b'bi', b'bo', b'bo', b'bo', b'bo', b'bs', b'bs', b'bs', b'bs', b'bt', b'bt',
+    b'bt', b'bt', b'b ', b'b ', b'b%', b'b%', b'b-', b'b-', b'b.', b'b.', b'b/', b'b/', b'b3',
+    b'b3', b'b4', b'b4', b'b5', b'b5', b'b6', b'b6', b'b7', b'b7', b'b8', b'b8', b'b9', b'b9',
+    b'b=', b'b=', b'bA', b'bA', b'b_', b'b_', b'bb', b'bb', b'bd', b'bd', b'bf', b'bf', b'bg',
+    b'bg', b'bh', b'bh', b'bl', b'bl', b'bm', b'bm', b'bn', b'bn', b'bp', b'bp', b'br', b'br',
+    b'bu', b'bu', b'b:', b'bB', b'bC', b'bD', b'bE', b'bF', b'bG', b'bH', b'bI', b'bJ', b'bK',
+    b'bL', b'bM', b'bN', b'bO', b'bP', b'bQ', b'bR', b'bS', b'bT', b'bU', b'bV', b'bW', b'bY',
+    b'bj', b'bk', b'bq', b'bv', b'bw', b'bx', b'by', b'bz', b'b', b'b', b'b', b'b', b'c0', b'c0',
+    b'c1', b'c1', b'c2', b'c2', b'ca', b'ca', b'cc', b'cc', b'ce', b'ce', b'ci', b'ci', b'co',
+    b'co', b'cs', b'cs', b'ct', b'ct', b'c ', b'c%', b'c-', b'c.', b'c/', b'c3', b'c4', b'c5',
+    b'c6', b'c7', b'c8', b'c9', b'c=', b'cA', b'c_', b'cb', b'cd', b'cf', b'cg', b'ch', b'cl',
+    b'cm', b'cn', b'cp', b'cr', b'cu', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c',
+    b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'c', b'e0', b'e0', b'e1', b'e1', b'e2', b'e2', b'ea',
+    b'ea', b'ec', b'ec', b'ee', b'ee', b'ei', b'ei', b'eo', b'eo', b'es', b'es', b'et', b'et',
+    b'e ', b'e%', b'e-', b'e.', b'e/', b'e3', b'e4', b'e5', b'e6', b'e7', b'e8', b'e9', b'e=',
+    b'eA', b'e_', b'eb', b'ed', b'ef', b'eg', b'eh', b'el', b'em', b'en', b'ep', b'er', b'eu', b'e',
+    b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e', b'e',
+    b'e', b'i0', b'i0', b'i1', b'i1', b'i2', b'i2', b'ia', b'ia', b'ic', b'ic', b'ie', b'ie', b'ii',
+    b'ii', b'io', b'io', b'is', b'is', b'it', b'it', b'i ', b'i%', b'i-', b'i.', b'i/', b'i3',
+    b'i4', b'i5', b'i6', b'i7', b'i8', b'i9', b'i=', b'iA', b'i_', b'ib', b'id', b'if', b'ig',
+    b'ih', b'il', b'im', b'in', b'ip', b'ir', b'iu', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i',
+    b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'i', b'o0', b'o0', b'o1', b'o1', b'o2',
+    b'o2', b'oa', b'oa', b'oc', b'oc', b'oe', b'oe', b'oi', b'oi', b'oo', b'oo', b'os', b'os',
+    b'ot', b'ot', b'o ', b'o%', b'o-', b'o.', b'o/', b'o3', b'o4', b'o5', b'o6', b'o7', b'o8',
+    b'o9', b'o=', b'oA', b'o_', b'ob', b'od', b'of', b'og', b'oh', b'ol', b'om', b'on', b'op',
+    b'or', b'ou', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o', b'o',
+    b'o', b'o', b'o', b'o', b'o', b'c0', b'c0', b'c0', b'c0', b'c1', b'c1', b'c1', b'c1', b'c2',
+    b'c2', b'c2', b'c2', b'ca', b'ca', b'ca', b'ca', b'cc', b'cc', b'cc', b'cc', b'ce', b'ce',
+    b'ce', b'ce', b'ci', b'ci', b'ci', b'ci', b'co', b'co', b'co', b'co', b'cs', b'cs', b'cs',
+    b'cs', b'ct', b'ct', b'ct', b'ct', b'c ', b'c ', b'c%', b'c%', b'c-', b'c-', b'c.', b'c.',
+    b'c/', b'c/', b'c3', b'c3', b'c4', b'c4', b'c5', b'c5', b'c6', b'c6', b'c7', b'c7', b'c8',
+    b'c8', b'c9', b'c9', b'c=', b'c=', b'cA', b'cA', b'c_', b'c_', b'cb', b'cb', b'cd', b'cd',
+    b'cf', b'cf', b'cg', b'cg', b'ch', b'ch', b'cl', b'cl', b'cm', b'cm', b'cn', b'cn', b'cp',
+    b'cp', b'cr', b'cr', b'cu', b'cu', b'c:', b'cB', b'cC', b'cD', b'cE', b'cF', b'cG', b'cH',
+    b'cI', b'cJ', b'cK', b'cL', b'cM', b'cN', b'cO', b'cP', b'cQ', b'cR', b'cS', b'cT', b'cU',
+    b'cV', b'cW', b'cY', b'cj', b'ck', b'cq', b'cv', b'cw', b'cx', b'cy', b'cz', b'c', b'c', b'c',
+    b'c', b'e0', b'e0', b'e0', b'e0', b'e1', b'e1', b'e1', b'e1', b'e2', b'e2', b'e2', b'e2', b'ea',
+    b'ea', b'ea', b'ea', b'ec', b'ec', b'ec', b'ec', b'ee', b'ee', b'ee', b'ee', b'ei', b'ei',
+    b'ei', b'ei', b'eo', b'eo', b'eo', b'eo', b'es', b'es', b'es', b'es', b'et', b'et', b'et',
+    b'et', b'e ', b'e ', b'e%', b'e%', b'e-', b'e-', b'e.', b'e.', b'e/', b'e/', b'e3', b'e3',
+    b'e4', b'e4', b'e5', b'e5', b'e6', b'e6', b'e7', b'e7', b'e8', b'e8', b'e9', b'e9', b'e=',
+    b'e=', b'eA', b'eA', b'e_', b'e_', b'eb', b'eb', b'ed', b'ed', b'ef', b'ef', b'eg', b'eg',
+    b'eh', b'eh', b'el', b'el', b'em', b'em', b'en', b'en', b'ep', b'ep', b'er', b'er', b'eu',
+    b'eu', b'e:', b'eB', b'eC', b'eD', b'eE', b'eF', b'eG', b'eH', b'eI', b'eJ', b'eK', b'eL',
+    b'eM', b'eN', b'eO', b'eP', b'eQ', b'eR', b'eS', b'eT', b'eU', b'eV', b'eW', b'eY', b'ej',
+    b'ek', b'eq', b'ev', b'ew', b'ex', b'ey', b'ez', b'e', b'e', b'e', b'e', b'd0', b'd0', b'd1',
+    b'd1', b'd2', b'd2', b'da', b'da', b'dc', b'dc', b'de', b'de', b'di', b'di', b'do', b'do',
+    b'ds', b'ds', b'dt', b'dt', b'd ', b'd%', b'd-', b'd.', b'd/', b'd3', b'd4', b'd5', b'd6',
+    b'd7', b'd8', b'd9', b'd=', b'dA', b'd_', b'db', b'dd', b'df', b'dg', b'dh', b'dl', b'dm',
+    b'dn', b'dp', b'dr', b'du', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'd',
+    b'd', b'd', b'd', b'd', b'd', b'd', b'd', b'f0', b'f0', b'f1', b'f1', b'f2', b'f2', b'fa',
+    b'fa', b'fc', b'fc', b'fe', b'fe', b'fi', b'fi', b'fo', b'fo', b'fs', b'fs', b'ft', b'ft',
+    b'f ', b'f%', b'f-', b'f.', b'f/', b'f3', b'f4', b'f5', b'f6', b'f7', b'f8', b'f9', b'f=',
+    b'fA', b'f_', b'fb', b'fd', b'ff', b'fg', b'fh', b'fl', b'fm', b'fn', b'fp', b'fr', b'fu', b'f',
+    b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f', b'f',
+    b'f', b'g0', b'g0', b'g1', b'g1', b'g2', b'g2', b'ga', b'ga', b'gc', b'gc', b'ge', b'ge', b'gi',
+    b'gi', b'go', b'go', b'gs', b'gs', b'gt', b'gt', b'g ', b'g%', b'g-', b'g.', b'g/', b'g3',
+    b'g4', b'g5', b'g6', b'g7', b'g8', b'g9', b'g=', b'gA', b'g_', b'gb', b'gd', b'gf', b'gg',
+    b'gh', b'gl', b'gm', b'gn', b'gp', b'gr', b'gu', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g',
+    b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'g', b'h0', b'h0', b'h1', b'h1', b'h2',
+    b'h2', b'ha', b'ha', b'hc', b'hc', b'he', b'he', b'hi', b'hi', b'ho', b'ho', b'hs', b'hs',
+    b'ht', b'ht', b'h ', b'h%', b'h-', b'h.', b'h/', b'h3', b'h4', b'h5', b'h6', b'h7', b'h8',
+    b'h9', b'h=', b'hA', b'h_', b'hb', b'hd', b'hf', b'hg', b'hh', b'hl', b'hm', b'hn', b'hp',
+    b'hr', b'hu', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h', b'h',
+    b'h', b'h', b'h', b'h', b'h', b'd0', b'd0', b'd0', b'd0', b'd1', b'd1', b'd1', b'd1', b'd2',
+    b'd2', b'd2', b'd2', b'da', b'da', b'da', b'da', b'dc', b'dc', b'dc', b'dc', b'de', b'de',
+    b'de', b'de', b'di', b'di', b'di', b'di', b'do', b'do', b'do', b'do', b'ds', b'ds', b'ds',
+    b'ds', b'dt', b'dt', b'dt', b'dt', b'd ', b'd ', b'd%', b'd%', b'd-', b'd-', b'd.', b'd.',
+    b'd/', b'd/', b'd3', b'd3', b'd4', b'd4', b'd5', b'd5', b'd6', b'd6', b'd7', b'd7', b'd8',
+    b'd8', b'd9', b'd9', b'd=', b'd=', b'dA', b'dA', b'd_', b'd_', b'db', b'db', b'dd', b'dd',
+    b'df', b'df', b'dg', b'dg', b'dh', b'dh', b'dl', b'dl', b'dm', b'dm', b'dn', b'dn', b'dp',
+    b'dp', b'dr', b'dr', b'du', b'du', b'd:', b'dB', b'dC', b'dD', b'dE', b'dF', b'dG', b'dH',
+    b'dI', b'dJ', b'dK', b'dL', b'dM', b'dN', b'dO', b'dP', b'dQ', b'dR', b'dS', b'dT', b'dU',
+    b'dV', b'dW', b'dY', b'dj', b'dk', b'dq', b'dv', b'dw', b'dx', b'dy', b'dz', b'd', b'd', b'd',
+    b'd', b'f0', b'f0', b'f0', b'f0', b'f1', b'f1', b'f1', b'f1', b'f2', b'f2', b'f2', b'f2', b'fa',
+    b'fa', b'fa', b'fa', b'fc', b'fc', b'fc', b'fc', b'fe', b'fe', b'fe', b'fe', b'fi', b'fi',
+    b'fi', b'fi', b'fo', b'fo', b'fo', b'fo', b'fs', b'fs', b'fs', b'fs', b'ft', b'ft', b'ft',
+    b'ft', b'f ', b'f ', b'f%', b'f%', b'f-', b'f-', b'f.', b'f.', b'f/', b'f/', b'f3', b'f3',
+    b'f4', b'f4', b'f5', b'f5', b'f6', b'f6', b'f7', b'f7', b'f8', b'f8', b'f9', b'f9', b'f=',
+    b'f=', b'fA', b'fA', b'f_', b'f_', b'fb', b'fb', b'fd', b'fd', b'ff', b'ff', b'fg', b'fg',
+    b'fh', b'fh', b'fl', b'fl', b'fm', b'fm', b'fn', b'fn', b'fp', b'fp', b'fr', b'fr', b'fu',
+    b'fu', b'f:', b'fB', b'fC', b'fD', b'fE', b'fF', b'fG', b'fH', b'fI', b'fJ', b'fK', b'fL',
+    b'fM', b'fN', b'fO', b'fP', b'fQ', b'fR', b'fS', b'fT', b'fU', b'fV', b'fW', b'fY', b'fj',
+    b'fk', b'fq', b'fv', b'fw', b'fx', b'fy', b'fz', b'f', b'f', b'f', b'f', b'g0', b'g0', b'g0',
+    b'g0', b'g1', b'g1', b'g1', b'g1', b'g2', b'g2', b'g2', b'g2', b'ga', b'ga', b'ga', b'ga',
+    b'gc', b'gc', b'gc', b'gc', b'ge', b'ge', b'ge', b'ge', b'gi', b'gi', b'gi', b'gi', b'go',
+    b'go', b'go', b'go', b'gs', b'gs', b'gs', b'gs', b'gt', b'gt', b'gt', b'gt', b'g ', b'g ',
+    b'g%', b'g%', b'g-', b'g-', b'g.', b'g.', b'g/', b'g/', b'g3', b'g3', b'g4', b'g4', b'g5',
+    b'g5', b'g6', b'g6', b'g7', b'g7', b'g8', b'g8', b'g9', b'g9', b'g=', b'g=', b'gA', b'gA',
+    b'g_', b'g_', b'gb', b'gb', b'gd', b'gd', b'gf', b'gf', b'gg', b'gg', b'gh', b'gh', b'gl',
+    b'gl', b'gm', b'gm', b'gn', b'gn', b'gp', b'gp', b'gr', b'gr', b'gu', b'gu', b'g:', b'gB',
+    b'gC', b'gD', b'gE', b'gF', b'gG', b'gH', b'gI', b'gJ', b'gK', b'gL', b'gM', b'gN', b'gO',
+    b'gP', b'gQ', b'gR', b'gS', b'gT', b'gU', b'gV', b'gW', b'gY', b'gj', b'gk', b'gq', b'gv',
+    b'gw', b'gx', b'gy', b'gz', b'g', b'g', b'g', b'g', b'h0', b'h0', b'h0', b'h0', b'h1', b'h1',
+    b'h1', b'h1', b'h2', b'h2', b'h2', b'h2', b'ha', b'ha', b'ha', b'ha', b'hc', b'hc', b'hc',
+    b'hc', b'he', b'he', b'he', b'he', b'hi', b'hi', b'hi', b'hi', b'ho', b'ho', b'ho', b'ho',
+    b'hs', b'hs', b'hs', b'hs', b'ht', b'ht', b'ht', b'ht', b'h ', b'h ', b'h%', b'h%', b'h-',
+    b'h-', b'h.', b'h.', b'h/', b'h/', b'h3', b'h3', b'h4', b'h4', b'h5', b'h5', b'h6', b'h6',
+    b'h7', b'h7', b'h8', b'h8', b'h9', b'h9', b'h=', b'h=', b'hA', b'hA', b'h_', b'h_', b'hb',
+    b'hb', b'hd', b'hd', b'hf', b'hf', b'hg', b'hg', b'hh', b'hh', b'hl', b'hl', b'hm', b'hm',
+    b'hn', b'hn', b'hp', b'hp', b'hr', b'hr', b'hu', b'hu', b'h:', b'hB', b'hC', b'hD', b'hE',
+    b'hF', b'hG', b'hH', b'hI', b'hJ', b'hK', b'hL', b'hM', b'hN', b'hO', b'hP', b'hQ', b'hR',
+    b'hS', b'hT', b'hU', b'hV', b'hW', b'hY', b'hj', b'hk', b'hq', b'hv', b'hw', b'hx', b'hy',
+    b'hz', b'h', b'h', b'h', b'h', b'i0', b'i0', b'i0', b'i0', b'i1', b'i1', b'i1', b'i1', b'i2',
+    b'i2', b'i2', b'i2', b'ia', b'ia', b'ia', b'ia', b'ic', b'ic', b'ic', b'ic', b'ie', b'ie',
+    b'ie', b'ie', b'ii', b'ii', b'ii', b'ii', b'io', b'io', b'io', b'io', b'is', b'is', b'is',
+    b'is', b'it', b'it', b'it', b'it', b'i ', b'i ', b'i%', b'i%', b'i-', b'i-', b'i.', b'i.',
+    b'i/', b'i/', b'i3', b'i3', b'i4', b'i4', b'i5', b'i5', b'i6', b'i6', b'i7', b'i7', b'i8',
+    b'i8', b'i9', b'i9', b'i=', b'i=', b'iA', b'iA', b'i_', b'i_', b'ib', b'ib', b'id', b'id',
+    b'if', b'if', b'ig', b'ig', b'ih', b'ih', b'il', b'il', b'im', b'im', b'in', b'in', b'ip',
+    b'ip', b'ir', b'ir', b'iu', b'iu', b'i:', b'iB', b'iC', b'iD', b'iE', b'iF', b'iG', b'iH',
+    b'iI', b'iJ', b'iK', b'iL', b'iM', b'iN', b'iO', b'iP', b'iQ', b'iR', b'iS', b'iT', b'iU',
+    b'iV', b'iW', b'iY', b'ij', b'ik', b'iq', b'iv', b'iw', b'ix', b'iy', b'iz', b'i', b'i', b'i',
+    b'i', b'o0', b'o0', b'o0', b'o0', b'o1', b'o1', b'o1', b'o1', b'o2', b'o2', b'o2', b'o2', b'oa',
+    b'oa', b'oa', b'oa', b'oc', b'oc', b'oc', b'oc', b'oe', b'oe', b'oe', b'oe', b'oi', b'oi',
+    b'oi', b'oi', b'oo', b'oo', b'oo', b'oo', b'os', b'os', b'os', b'os', b'ot', b'ot', b'ot',
+    b'ot', b'o ', b'o ', b'o%', b'o%', b'o-', b'o-', b'o.', b'o.', b'o/', b'o/', b'o3', b'o3',
+    b'o4', b'o4', b'o5', b'o5', b'o6', b'o6', b'o7', b'o7', b'o8', b'o8', b'o9', b'o9', b'o=',
+    b'o=', b'oA', b'oA', b'o_', b'o_', b'ob', b'ob', b'od', b'od', b'of', b'of', b'og', b'og',
+    b'oh', b'oh', b'ol', b'ol', b'om', b'om', b'on', b'on', b'op', b'op', b'or', b'or', b'ou',
+    b'ou', b'o:', b'oB', b'oC', b'oD', b'oE', b'oF', b'oG', b'oH', b'oI', b'oJ', b'oK', b'oL',
+    b'oM', b'oN', b'oO', b'oP', b'oQ', b'oR', b'oS', b'oT', b'oU', b'oV', b'oW', b'oY', b'oj',
+    b'ok', b'oq', b'ov', b'ow', b'ox', b'oy', b'oz', b'o', b'o', b'o', b'o', b'j0', b'j0', b'j1',
+    b'j1', b'j2', b'j2', b'ja', b'ja', b'jc', b'jc', b'je', b'je', b'ji', b'ji', b'jo', b'jo',
+    b'js', b'js', b'jt', b'jt', b'j ', b'j%', b'j-', b'j.', b'j/', b'j3', b'j4', b'j5', b'j6',
+    b'j7', b'j8', b'j9', b'j=', b'jA', b'j_', b'jb', b'jd', b'jf', b'jg', b'jh', b'jl', b'jm',
+    b'jn', b'jp', b'jr', b'ju', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'j',
+    b'j', b'j', b'j', b'j', b'j', b'j', b'j', b'k0', b'k0', b'k1', b'k1', b'k2', b'k2', b'ka',
+    b'ka', b'kc', b'kc', b'ke', b'ke', b'ki', b'ki', b'ko', b'ko', b'ks', b'ks', b'kt', b'kt',
+    b'k ', b'k%', b'k-', b'k.', b'k/', b'k3', b'k4', b'k5', b'k6', b'k7', b'k8', b'k9', b'k=',
+    b'kA', b'k_', b'kb', b'kd', b'kf', b'kg', b'kh', b'kl', b'km', b'kn', b'kp', b'kr', b'ku', b'k',
+    b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k', b'k',
+    b'k', b'q0', b'q0', b'q1', b'q1', b'q2', b'q2', b'qa', b'qa', b'qc', b'qc', b'qe', b'qe', b'qi',
+    b'qi', b'qo', b'qo', b'qs', b'qs', b'qt', b'qt', b'q ', b'q%', b'q-', b'q.', b'q/', b'q3',
+    b'q4', b'q5', b'q6', b'q7', b'q8', b'q9', b'q=', b'qA', b'q_', b'qb', b'qd', b'qf', b'qg',
+    b'qh', b'ql', b'qm', b'qn', b'qp', b'qr', b'qu', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q',
+    b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'q', b'v0', b'v0', b'v1', b'v1', b'v2',
+    b'v2', b'va', b'va', b'vc', b'vc', b've', b've', b'vi', b'vi', b'vo', b'vo', b'vs', b'vs',
+    b'vt', b'vt', b'v ', b'v%', b'v-', b'v.', b'v/', b'v3', b'v4', b'v5', b'v6', b'v7', b'v8',
+    b'v9', b'v=', b'vA', b'v_', b'vb', b'vd', b'vf', b'vg', b'vh', b'vl', b'vm', b'vn', b'vp',
+    b'vr', b'vu', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v', b'v',
+    b'v', b'v', b'v', b'v', b'v', b'j0', b'j0', b'j0', b'j0', b'j1', b'j1', b'j1', b'j1', b'j2',
+    b'j2', b'j2', b'j2', b'ja', b'ja', b'ja', b'ja', b'jc', b'jc', b'jc', b'jc', b'je', b'je',
+    b'je', b'je', b'ji', b'ji', b'ji', b'ji', b'jo', b'jo', b'jo', b'jo', b'js', b'js', b'js',
+    b'js', b'jt', b'jt', b'jt', b'jt', b'j ', b'j ', b'j%', b'j%', b'j-', b'j-', b'j.', b'j.',
+    b'j/', b'j/', b'j3', b'j3', b'j4', b'j4', b'j5', b'j5', b'j6', b'j6', b'j7', b'j7', b'j8',
+    b'j8', b'j9', b'j9', b'j=', b'j=', b'jA', b'jA', b'j_', b'j_', b'jb', b'jb', b'jd', b'jd',
+    b'jf', b'jf', b'jg', b'jg', b'jh', b'jh', b'jl', b'jl', b'jm', b'jm', b'jn', b'jn', b'jp',
+    b'jp', b'jr', b'jr', b'ju', b'ju', b'j:', b'jB', b'jC', b'jD', b'jE', b'jF', b'jG', b'jH',
+    b'jI', b'jJ', b'jK', b'jL', b'jM', b'jN', b'jO', b'jP', b'jQ', b'jR', b'jS', b'jT', b'jU',
+    b'jV', b'jW', b'jY', b'jj', b'jk', b'jq', b'jv', b'jw', b'jx', b'jy', b'jz', b'j', b'j', b'j',
+    b'j', b'k0', b'k0', b'k0', b'k0', b'k1', b'k1', b'k1', b'k1', b'k2', b'k2', b'k2', b'k2', b'ka',
+    b'ka', b'ka', b'ka', b'kc', b'kc', b'kc', b'kc', b'ke', b'ke', b'ke', b'ke', b'ki', b'ki',
+    b'ki', b'ki', b'ko', b'ko', b'ko', b'ko', b'ks', b'ks', b'ks', b'ks', b'kt', b'kt', b'kt',
+    b'kt', b'k ', b'k ', b'k%', b'k%', b'k-', b'k-', b'k.', b'k.', b'k/', b'k/', b'k3', b'k3',
+    b'k4', b'k4', b'k5', b'k5', b'k6', b'k6', b'k7', b'k7', b'k8', b'k8', b'k9', b'k9', b'k=',
+    b'k=', b'kA', b'kA', b'k_', b'k_', b'kb', b'kb', b'kd', b'kd', b'kf', b'kf', b'kg', b'kg',
+    b'kh', b'kh', b'kl', b'kl', b'km', b'km', b'kn', b'kn', b'kp', b'kp', b'kr', b'kr', b'ku',
+    b'ku', b'k:', b'kB', b'kC', b'kD', b'kE', b'kF', b'kG', b'kH', b'kI', b'kJ', b'kK', b'kL',
+    b'kM', b'kN', b'kO', b'kP', b'kQ', b'kR', b'kS', b'kT', b'kU', b'kV', b'kW', b'kY', b'kj',
+    b'kk', b'kq', b'kv', b'kw', b'kx', b'ky', b'kz', b'k', b'k', b'k', b'k', b'l0', b'l0', b'l1',
+    b'l1', b'l2', b'l2', b'la', b'la', b'lc', b'lc', b'le', b'le', b'li', b'li', b'lo', b'lo',
+    b'ls', b'ls', b'lt', b'lt', b'l ', b'l%', b'l-', b'l.', b'l/', b'l3', b'l4', b'l5', b'l6',
+    b'l7', b'l8', b'l9', b'l=', b'lA', b'l_', b'lb', b'ld', b'lf', b'lg', b'lh', b'll', b'lm',
+    b'ln', b'lp', b'lr', b'lu', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'l',
+    b'l', b'l', b'l', b'l', b'l', b'l', b'l', b'm0', b'm0', b'm1', b'm1', b'm2', b'm2', b'ma',
+    b'ma', b'mc', b'mc', b'me', b'me', b'mi', b'mi', b'mo', b'mo', b'ms', b'ms', b'mt', b'mt',
+    b'm ', b'm%', b'm-', b'm.', b'm/', b'm3', b'm4', b'm5', b'm6', b'm7', b'm8', b'm9', b'm=',
+    b'mA', b'm_', b'mb', b'md', b'mf', b'mg', b'mh', b'ml', b'mm', b'mn', b'mp', b'mr', b'mu', b'm',
+    b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm', b'm',
+    b'm', b'n0', b'n0', b'n1', b'n1', b'n2', b'n2', b'na', b'na', b'nc', b'nc', b'ne', b'ne', b'ni',
+    b'ni', b'no', b'no', b'ns', b'ns', b'nt', b'nt', b'n ', b'n%', b'n-', b'n.', b'n/', b'n3',
+    b'n4', b'n5', b'n6', b'n7', b'n8', b'n9', b'n=', b'nA', b'n_', b'nb', b'nd', b'nf', b'ng',
+    b'nh', b'nl', b'nm', b'nn', b'np', b'nr', b'nu', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n',
+    b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'n', b'p0', b'p0', b'p1', b'p1', b'p2',
+    b'p2', b'pa', b'pa', b'pc', b'pc', b'pe', b'pe', b'pi', b'pi', b'po', b'po', b'ps', b'ps',
+    b'pt', b'pt', b'p ', b'p%', b'p-', b'p.', b'p/', b'p3', b'p4', b'p5', b'p6', b'p7', b'p8',
+    b'p9', b'p=', b'pA', b'p_', b'pb', b'pd', b'pf', b'pg', b'ph', b'pl', b'pm', b'pn', b'pp',
+    b'pr', b'pu', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p', b'p',
+    b'p', b'p', b'p', b'p', b'p', b'l0', b'l0', b'l0', b'l0', b'l1', b'l1', b'l1', b'l1', b'l2',
+    b'l2', b'l2', b'l2', b'la', b'la', b'la', b'la', b'lc', b'lc', b'lc', b'lc', b'le', b'le',
+    b'le', b'le', b'li', b'li', b'li', b'li', b'lo', b'lo', b'lo', b'lo', b'ls', b'ls', b'ls',
+    b'ls', b'lt', b'lt', b'lt', b'lt', b'l ', b'l ', b'l%', b'l%', b'l-', b'l-', b'l.', b'l.',
+    b'l/', b'l/', b'l3', b'l3', b'l4', b'l4', b'l5', b'l5', b'l6', b'l6', b'l7', b'l7', b'l8',
+    b'l8', b'l9', b'l9', b'l=', b'l=', b'lA', b'lA', b'l_', b'l_', b'lb', b'lb', b'ld', b'ld',
+    b'lf', b'lf', b'lg', b'lg', b'lh', b'lh', b'll', b'll', b'lm', b'lm', b'ln', b'ln', b'lp',
+    b'lp', b'lr', b'lr', b'lu', b'lu', b'l:', b'lB', b'lC', b'lD', b'lE', b'lF', b'lG', b'lH',
+    b'lI', b'lJ', b'lK', b'lL', b'lM', b'lN', b'lO', b'lP', b'lQ', b'lR', b'lS', b'lT', b'lU',
+    b'lV', b'lW', b'lY', b'lj', b'lk', b'lq', b'lv', b'lw', b'lx', b'ly', b'lz', b'l', b'l', b'l',
+    b'l', b'm0', b'm0', b'm0', b'm0', b'm1', b'm1', b'm1', b'm1', b'm2', b'm2', b'm2', b'm2', b'ma',
+    b'ma', b'ma', b'ma', b'mc', b'mc', b'mc', b'mc', b'me', b'me', b'me', b'me', b'mi', b'mi',
+    b'mi', b'mi', b'mo', b'mo', b'mo', b'mo', b'ms', b'ms', b'ms', b'ms', b'mt', b'mt', b'mt',
+    b'mt', b'm ', b'm ', b'm%', b'm%', b'm-', b'm-', b'm.', b'm.', b'm/', b'm/', b'm3', b'm3',
+    b'm4', b'm4', b'm5', b'm5', b'm6', b'm6', b'm7', b'm7', b'm8', b'm8', b'm9', b'm9', b'm=',
+    b'm=', b'mA', b'mA', b'm_', b'm_', b'mb', b'mb', b'md', b'md', b'mf', b'mf', b'mg', b'mg',
+    b'mh', b'mh', b'ml', b'ml', b'mm', b'mm', b'mn', b'mn', b'mp', b'mp', b'mr', b'mr', b'mu',
+    b'mu', b'm:', b'mB', b'mC', b'mD', b'mE', b'mF', b'mG', b'mH', b'mI', b'mJ', b'mK', b'mL',
+    b'mM', b'mN', b'mO', b'mP', b'mQ', b'mR', b'mS', b'mT', b'mU', b'mV', b'mW', b'mY', b'mj',
+    b'mk', b'mq', b'mv', b'mw', b'mx', b'my', b'mz', b'm', b'm', b'm', b'm', b'n0', b'n0', b'n0',
+    b'n0', b'n1', b'n1', b'n1', b'n1', b'n2', b'n2', b'n2', b'n2', b'na', b'na', b'na', b'na',
+    b'nc', b'nc', b'nc', b'nc', b'ne', b'ne', b'ne', b'ne', b'ni', b'ni', b'ni', b'ni', b'no',
+    b'no', b'no', b'no', b'ns', b'ns', b'ns', b'ns', b'nt', b'nt', b'nt', b'nt', b'n ', b'n ',
+    b'n%', b'n%', b'n-', b'n-', b'n.', b'n.', b'n/', b'n/', b'n3', b'n3', b'n4', b'n4', b'n5',
+    b'n5', b'n6', b'n6', b'n7', b'n7', b'n8', b'n8', b'n9', b'n9', b'n=', b'n=', b'nA', b'nA',
+    b'n_', b'n_', b'nb', b'nb', b'nd', b'nd', b'nf', b'nf', b'ng', b'ng', b'nh', b'nh', b'nl',
+    b'nl', b'nm', b'nm', b'nn', b'nn', b'np', b'np', b'nr', b'nr', b'nu', b'nu', b'n:', b'nB',
+    b'nC', b'nD', b'nE', b'nF', b'nG', b'nH', b'nI', b'nJ', b'nK', b'nL', b'nM', b'nN', b'nO',
+    b'nP', b'nQ', b'nR', b'nS', b'nT', b'nU', b'nV', b'nW', b'nY', b'nj', b'nk', b'nq', b'nv',
+    b'nw', b'nx', b'ny', b'nz', b'n', b'n', b'n', b'n', b'p0', b'p0', b'p0', b'p0', b'p1', b'p1',
+    b'p1', b'p1', b'p2', b'p2', b'p2', b'p2', b'pa', b'pa', b'pa', b'pa', b'pc', b'pc', b'pc',
+    b'pc', b'pe', b'pe', b'pe', b'pe', b'pi', b'pi', b'pi', b'pi', b'po', b'po', b'po', b'po',
+    b'ps', b'ps', b'ps', b'ps', b'pt', b'pt', b'pt', b'pt', b'p ', b'p ', b'p%', b'p%', b'p-',
+    b'p-', b'p.', b'p.', b'p/', b'p/', b'p3', b'p3', b'p4', b'p4', b'p5', b'p5', b'p6', b'p6',
+    b'p7', b'p7', b'p8', b'p8', b'p9', b'p9', b'p=', b'p=', b'pA', b'pA', b'p_', b'p_', b'pb',
+    b'pb', b'pd', b'pd', b'pf', b'pf', b'pg', b'pg', b'ph', b'ph', b'pl', b'pl', b'pm', b'pm',
+    b'pn', b'pn', b'pp', b'pp', b'pr', b'pr', b'pu', b'pu', b'p:', b'pB', b'pC', b'pD', b'pE',
+    b'pF', b'pG', b'pH', b'pI', b'pJ', b'pK', b'pL', b'pM', b'pN', b'pO', b'pP', b'pQ', b'pR',
+    b'pS', b'pT', b'pU', b'pV', b'pW', b'pY', b'pj', b'pk', b'pq', b'pv', b'pw', b'px', b'py',
+    b'pz', b'p', b'p', b'p', b'p', b'q0', b'q0', b'q0', b'q0', b'q1', b'q1', b'q1', b'q1', b'q2',
+    b'q2', b'q2', b'q2', b'qa', b'qa', b'qa', b'qa', b'qc', b'qc', b'qc', b'qc', b'qe', b'qe',
+    b'qe', b'qe', b'qi', b'qi', b'qi', b'qi', b'qo', b'qo', b'qo', b'qo', b'qs', b'qs', b'qs',
+    b'qs', b'qt', b'qt', b'qt', b'qt', b'q ', b'q ', b'q%', b'q%', b'q-', b'q-', b'q.', b'q.',
+    b'q/', b'q/', b'q3', b'q3', b'q4', b'q4', b'q5', b'q5', b'q6', b'q6', b'q7', b'q7', b'q8',
+    b'q8', b'q9', b'q9', b'q=', b'q=', b'qA', b'qA', b'q_', b'q_', b'qb', b'qb', b'qd', b'qd',
+    b'qf', b'qf', b'qg', b'qg', b'qh', b'qh', b'ql', b'ql', b'qm', b'qm', b'qn', b'qn', b'qp',
+    b'qp', b'qr', b'qr', b'qu', b'qu', b'q:', b'qB', b'qC', b'qD', b'qE', b'qF', b'qG', b'qH',
+    b'qI', b'qJ', b'qK', b'qL', b'qM', b'qN', b'qO', b'qP', b'qQ', b'qR', b'qS', b'qT', b'qU',
+    b'qV', b'qW', b'qY', b'qj', b'qk', b'qq', b'qv', b'qw', b'qx', b'qy', b'qz', b'q', b'q', b'q',
+    b'q', b'v0', b'v0', b'v0', b'v0', b'v1', b'v1', b'v1', b'v1', b'v2', b'v2', b'v2', b'v2', b'va',
+    b'va', b'va', b'va', b'vc', b'vc', b'vc', b'vc', b've', b've', b've', b've', b'vi', b'vi',
+    b'vi', b'vi', b'vo', b'vo', b'vo', b'vo', b'vs', b'vs', b'vs', b'vs', b'vt', b'vt', b'vt',
+    b'vt', b'v ', b'v ', b'v%', b'v%', b'v-', b'v-', b'v.', b'v.', b'v/', b'v/', b'v3', b'v3',
+    b'v4', b'v4', b'v5', b'v5', b'v6', b'v6', b'v7', b'v7', b'v8', b'v8', b'v9', b'v9', b'v=',
+    b'v=', b'vA', b'vA', b'v_', b'v_', b'vb', b'vb', b'vd', b'vd', b'vf', b'vf', b'vg', b'vg',
+    b'vh', b'vh', b'vl', b'vl', b'vm', b'vm', b'vn', b'vn', b'vp', b'vp', b'vr', b'vr', b'vu',
+    b'vu', b'v:', b'vB', b'vC', b'vD', b'vE', b'vF', b'vG', b'vH', b'vI', b'vJ', b'vK', b'vL',
+    b'vM', b'vN', b'vO', b'vP', b'vQ', b'vR', b'vS', b'vT', b'vU', b'vV', b'vW', b'vY', b'vj',
+    b'vk', b'vq', b'vv', b'vw', b'vx', b'vy', b'vz', b'v', b'v', b'v', b'v', b'r0', b'r0', b'r0',
+    b'r0', b'r1', b'r1', b'r1', b'r1', b'r2', b'r2', b'r2', b'r2', b'ra', b'ra', b'ra', b'ra',
+    b'rc', b'rc', b'rc', b'rc', b're', b're', b're', b're', b'ri', b'ri', b'ri', b'ri', b'ro',
+    b'ro', b'ro', b'ro', b'rs', b'rs', b'rs', b'rs', b'rt', b'rt', b'rt', b'rt', b'r ', b'r ',
+    b'r%', b'r%', b'r-', b'r-', b'r.', b'r.', b'r/', b'r/', b'r3', b'r3', b'r4', b'r4', b'r5',
+    b'r5', b'r6', b'r6', b'r7', b'r7', b'r8', b'r8', b'r9', b'r9', b'r=', b'r=', b'rA', b'rA',
+    b'r_', b'r_', b'rb', b'rb', b'rd', b'rd', b'rf', b'rf', b'rg', b'rg', b'rh', b'rh', b'rl',
+    b'rl', b'rm', b'rm', b'rn', b'rn', b'rp', b'rp', b'rr', b'rr', b'ru', b'ru', b'r:', b'rB',
+    b'rC', b'rD', b'rE', b'rF', b'rG', b'rH', b'rI', b'rJ', b'rK', b'rL', b'rM', b'rN', b'rO',
+    b'rP', b'rQ', b'rR', b'rS', b'rT', b'rU', b'rV', b'rW', b'rY', b'rj', b'rk', b'rq', b'rv',
+    b'rw', b'rx', b'ry', b'rz', b'r', b'r', b'r', b'r', b'u0', b'u0', b'u0', b'u0', b'u1', b'u1',
+    b'u1', b'u1', b'u2', b'u2', b'u2', b'u2', b'ua', b'ua', b'ua', b'ua', b'uc', b'uc', b'uc',
+    b'uc', b'ue', b'ue', b'ue', b'ue', b'ui', b'ui', b'ui', b'ui', b'uo', b'uo', b'uo', b'uo',
+    b'us', b'us', b'us', b'us', b'ut', b'ut', b'ut', b'ut', b'u ', b'u ', b'u%', b'u%', b'u-',
+    b'u-', b'u.', b'u.', b'u/', b'u/', b'u3', b'u3', b'u4', b'u4', b'u5', b'u5', b'u6', b'u6',
+    b'u7', b'u7', b'u8', b'u8', b'u9', b'u9', b'u=', b'u=', b'uA', b'uA', b'u_', b'u_', b'ub',
+    b'ub', b'ud', b'ud', b'uf', b'uf', b'ug', b'ug', b'uh', b'uh', b'ul', b'ul', b'um', b'um',
+    b'un', b'un', b'up', b'up', b'ur', b'ur', b'uu', b'uu', b'u:', b'uB', b'uC', b'uD', b'uE',
+    b'uF', b'uG', b'uH', b'uI', b'uJ', b'uK', b'uL', b'uM', b'uN', b'uO', b'uP', b'uQ', b'uR',
+    b'uS', b'uT', b'uU', b'uV', b'uW', b'uY', b'uj', b'uk', b'uq', b'uv', b'uw', b'ux', b'uy',
+    b'uz', b'u', b'u', b'u', b'u', b's0', b's0', b's0', b's0', b's1', b's1', b's1', b's1', b's2',
+    b's2', b's2', b's2', b'sa', b'sa', b'sa', b'sa', b'sc', b'sc', b'sc', b'sc', b'se', b'se',
+    b'se', b'se', b'si', b'si', b'si', b'si', b'so', b'so', b'so', b'so', b'ss', b'ss', b'ss',
+    b'ss', b'st', b'st', b'st', b'st', b's ', b's ', b's%', b's%', b's-', b's-', b's.', b's.',
+    b's/', b's/', b's3', b's3', b's4', b's4', b's5', b's5', b's6', b's6', b's7', b's7', b's8',
+    b's8', b's9', b's9', b's=', b's=', b'sA', b'sA', b's_', b's_', b'sb', b'sb', b'sd', b'sd',
+    b'sf', b'sf', b'sg', b'sg', b'sh', b'sh', b'sl', b'sl', b'sm', b'sm', b'sn', b'sn', b'sp',
+    b'sp', b'sr', b'sr', b'su', b'su', b's:', b'sB', b'sC', b'sD', b'sE', b'sF', b'sG', b'sH',
+    b'sI', b'sJ', b'sK', b'sL', b'sM', b'sN', b'sO', b'sP', b'sQ', b'sR', b'sS', b'sT', b'sU',
+    b'sV', b'sW', b'sY', b'sj', b'sk', b'sq', b'sv', b'sw', b'sx', b'sy', b'sz', b's', b's', b's',
+    b's', b't0', b't0', b't0', b't0', b't1', b't1', b't1', b't1', b't2', b't2', b't2', b't2', b'ta',
+    b'ta', b'ta', b'ta', b'tc', b'tc', b'tc', b'tc', b'te', b'te', b'te', b'te', b'ti', b'ti',
+    b'ti', b'ti', b'to', b'to', b'to', b'to', b'ts', b'ts', b'ts', b'ts', b'tt', b'tt', b'tt',
+    b'tt', b't ', b't ', b't%', b't%', b't-', b't-', b't.', b't.', b't/', b't/', b't3', b't3',
+    b't4', b't4', b't5', b't5', b't6', b't6', b't7', b't7', b't8', b't8', b't9', b't9', b't=',
+    b't=', b'tA', b'tA', b't_', b't_', b'tb', b'tb', b'td', b'td', b'tf', b'tf', b'tg', b'tg',
+    b'th', b'th', b'tl', b'tl', b'tm', b'tm', b'tn', b'tn', b'tp', b'tp', b'tr', b'tr', b'tu',
+    b'tu', b't:', b'tB', b'tC', b'tD', b'tE', b'tF', b'tG', b'tH', b'tI', b'tJ', b'tK', b'tL',
+    b'tM', b'tN', b'tO', b'tP', b'tQ', b'tR', b'tS', b'tT', b'tU', b'tV', b'tW', b'tY', b'tj',
+    b'tk', b'tq', b'tv', b'tw', b'tx', b'ty', b'tz', b't', b't', b't', b't', b'w0', b'w0', b'w1',
+    b'w1', b'w2', b'w2', b'wa', b'wa', b'wc', b'wc', b'we', b'we', b'wi', b'wi', b'wo', b'wo',
+    b'ws', b'ws', b'wt', b'wt', b'w ', b'w%', b'w-', b'w.', b'w/', b'w3', b'w4', b'w5', b'w6',
+    b'w7', b'w8', b'w9', b'w=', b'wA', b'w_', b'wb', b'wd', b'wf', b'wg', b'wh', b'wl', b'wm',
+    b'wn', b'wp', b'wr', b'wu', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'w',
+    b'w', b'w', b'w', b'w', b'w', b'w', b'w', b'x0', b'x0', b'x1', b'x1', b'x2', b'x2', b'xa',
+    b'xa', b'xc', b'xc', b'xe', b'xe', b'xi', b'xi', b'xo', b'xo', b'xs', b'xs', b'xt', b'xt',
+    b'x ', b'x%', b'x-', b'x.', b'x/', b'x3', b'x4', b'x5', b'x6', b'x7', b'x8', b'x9', b'x=',
+    b'xA', b'x_', b'xb', b'xd', b'xf', b'xg', b'xh', b'xl', b'xm', b'xn', b'xp', b'xr', b'xu', b'x',
+    b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x', b'x',
+    b'x', b'y0', b'y0', b'y1', b'y1', b'y2', b'y2', b'ya', b'ya', b'yc', b'yc', b'ye', b'ye', b'yi',
+    b'yi', b'yo', b'yo', b'ys', b'ys', b'yt', b'yt', b'y ', b'y%', b'y-', b'y.', b'y/', b'y3',
+    b'y4', b'y5', b'y6', b'y7', b'y8', b'y9', b'y=', b'yA', b'y_', b'yb', b'yd', b'yf', b'yg',
+    b'yh', b'yl', b'ym', b'yn', b'yp', b'yr', b'yu', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y',
+    b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'y', b'z0', b'z0', b'z1', b'z1', b'z2',
+    b'z2', b'za', b'za', b'zc', b'zc', b'ze', b'ze', b'zi', b'zi', b'zo', b'zo', b'zs', b'zs',
+    b'zt', b'zt', b'z ', b'z%', b'z-', b'z.', b'z/', b'z3', b'z4', b'z5', b'z6', b'z7', b'z8',
+    b'z9', b'z=', b'zA', b'z_', b'zb', b'zd', b'zf', b'zg', b'zh', b'zl', b'zm', b'zn', b'zp',
+    b'zr', b'zu', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z', b'z',
+    b'z', b'z', b'z', b'z', b'z', b'w0', b'w0', b'w0', b'w0', b'w1', b'w1', b'w1', b'w1', b'w2',
+    b'w2', b'w2', b'w2', b'wa', b'wa', b'wa', b'wa', b'wc', b'wc', b'wc', b'wc', b'we', b'we',
+    b'we', b'we', b'wi', b'wi', b'wi', b'wi', b'wo', b'wo', b'wo', b'wo', b'ws', b'ws', b'ws',
+    b'ws', b'wt', b'wt', b'wt', b'wt', b'w ', b'w ', b'w%', b'w%', b'w-', b'w-', b'w.', b'w.',
+    b'w/', b'w/', b'w3', b'w3', b'w4', b'w4', b'w5', b'w5', b'w6', b'w6', b'w7', b'w7', b'w8',
+    b'w8', b'w9', b'w9', b'w=', b'w=', b'wA', b'wA', b'w_', b'w_', b'wb', b'wb', b'wd', b'wd',
+    b'wf', b'wf', b'wg', b'wg', b'wh', b'wh', b'wl', b'wl', b'wm', b'wm', b'wn', b'wn', b'wp',
+    b'wp', b'wr', b'wr', b'wu', b'wu', b'w:', b'wB', b'wC', b'wD', b'wE', b'wF', b'wG', b'wH',
+    b'wI', b'wJ', b'wK', b'wL', b'wM', b'wN', b'wO', b'wP', b'wQ', b'wR', b'wS', b'wT', b'wU',
+    b'wV', b'wW', b'wY', b'wj', b'wk', b'wq', b'wv', b'ww', b'wx', b'wy', b'wz', b'w', b'w', b'w',
+    b'w', b'x0', b'x0', b'x0', b'x0', b'x1', b'x1', b'x1', b'x1', b'x2', b'x2', b'x2', b'x2', b'xa',
+    b'xa', b'xa', b'xa', b'xc', b'xc', b'xc', b'xc', b'xe', b'xe', b'xe', b'xe', b'xi', b'xi',
+    b'xi', b'xi', b'xo', b'xo', b'xo', b'xo', b'xs', b'xs', b'xs', b'xs', b'xt', b'xt', b'xt',
+    b'xt', b'x ', b'x ', b'x%', b'x%', b'x-', b'x-', b'x.', b'x.', b'x/', b'x/', b'x3', b'x3',
+    b'x4', b'x4', b'x5', b'x5', b'x6', b'x6', b'x7', b'x7', b'x8', b'x8', b'x9', b'x9', b'x=',
+    b'x=', b'xA', b'xA', b'x_', b'x_', b'xb', b'xb', b'xd', b'xd', b'xf', b'xf', b'xg', b'xg',
+    b'xh', b'xh', b'xl', b'xl', b'xm', b'xm', b'xn', b'xn', b'xp', b'xp', b'xr', b'xr', b'xu',
+    b'xu', b'x:', b'xB', b'xC', b'xD', b'xE', b'xF', b'xG', b'xH', b'xI', b'xJ', b'xK', b'xL',
+    b'xM', b'xN', b'xO', b'xP', b'xQ', b'xR', b'xS', b'xT', b'xU', b'xV', b'xW', b'xY', b'xj',
+    b'xk', b'xq', b'xv', b'xw', b'xx', b'xy', b'xz', b'x', b'x', b'x', b'x', b'y0', b'y0', b'y0',
+    b'y0', b'y1', b'y1', b'y1', b'y1', b'y2', b'y2', b'y2', b'y2', b'ya', b'ya', b'ya', b'ya',
+    b'yc', b'yc', b'yc', b'yc', b'ye', b'ye', b'ye', b'ye', b'yi', b'yi', b'yi', b'yi', b'yo',
+    b'yo', b'yo', b'yo', b'ys', b'ys', b'ys', b'ys', b'yt', b'yt', b'yt', b'yt', b'y ', b'y ',
+    b'y%', b'y%', b'y-', b'y-', b'y.', b'y.', b'y/', b'y/', b'y3', b'y3', b'y4', b'y4', b'y5',
+    b'y5', b'y6', b'y6', b'y7', b'y7', b'y8', b'y8', b'y9', b'y9', b'y=', b'y=', b'yA', b'yA',
+    b'y_', b'y_', b'yb', b'yb', b'yd', b'yd', b'yf', b'yf', b'yg', b'yg', b'yh', b'yh', b'yl',
+    b'yl', b'ym', b'ym', b'yn', b'yn', b'yp', b'yp', b'yr', b'yr', b'yu', b'yu', b'y:', b'yB',
+    b'yC', b'yD', b'yE', b'yF', b'yG', b'yH', b'yI', b'yJ', b'yK', b'yL', b'yM', b'yN', b'yO',
+    b'yP', b'yQ', b'yR', b'yS', b'yT', b'yU', b'yV', b'yW', b'yY', b'yj', b'yk', b'yq', b'yv',
+    b'yw', b'yx', b'yy', b'yz', b'y', b'y', b'y', b'y', b'z0', b'z0', b'z0', b'z0', b'z1', b'z1',
+    b'z1', b'z1', b'z2', b'z2', b'z2', b'z2', b'za', b'za', b'za', b'za', b'zc', b'zc', b'zc',
+    b'zc', b'ze', b'ze', b'ze', b'ze', b'zi', b'zi', b'zi', b'zi', b'zo', b'zo', b'zo', b'zo',
+    b'zs', b'zs', b'zs', b'zs', b'zt', b'zt', b'zt', b'zt', b'z ', b'z ', b'z%', b'z%', b'z-',
+    b'z-', b'z.', b'z.', b'z/', b'z/', b'z3', b'z3', b'z4', b'z4', b'z5', b'z5', b'z6', b'z6',
+    b'z7', b'z7', b'z8', b'z8', b'z9', b'z9', b'z=', b'z=', b'zA', b'zA', b'z_', b'z_', b'zb',
+    b'zb', b'zd', b'zd', b'zf', b'zf', b'zg', b'zg', b'zh', b'zh', b'zl', b'zl', b'zm', b'zm',
+    b'zn', b'zn', b'zp', b'zp', b'zr', b'zr', b'zu', b'zu', b'z:', b'zB', b'zC', b'zD', b'zE',
+    b'zF', b'zG', b'zH', b'zI', b'zJ', b'zK', b'zL', b'zM', b'zN', b'zO', b'zP', b'zQ', b'zR',
+    b'zS', b'zT', b'zU', b'zV', b'zW', b'zY', b'zj', b'zk', b'zq', b'zv', b'zw', b'zx', b'zy',
+    b'zz', b'z', b'z', b'z', b'z', b'\x7f0', b'\x7f0', b'\x7f0', b'\x7f0', b'\x7f1', b'\x7f1',
+    b'\x7f1', b'\x7f1', b'\x7f2', b'\x7f2', b'\x7f2', b'\x7f2', b'\x7fa', b'\x7fa', b'\x7fa',
+    b'\x7fa', b'\x7fc', b'\x7fc', b'\x7fc', b'\x7fc', b'\x7fe', b'\x7fe', b'\x7fe', b'\x7fe',
+    b'\x7fi', b'\x7fi', b'\x7fi', b'\x7fi', b'\x7fo', b'\x7fo', b'\x7fo', b'\x7fo', b'\x7fs',
+    b'\x7fs', b'\x7fs', b'\x7fs', b'\x7ft', b'\x7ft', b'\x7ft', b'\x7ft', b'\x7f ', b'\x7f ',
+    b'\x7f%', b'\x7f%', b'\x7f-', b'\x7f-', b'\x7f.', b'\x7f.', b'\x7f/', b'\x7f/', b'\x7f3',
+    b'\x7f3', b'\x7f4', b'\x7f4', b'\x7f5', b'\x7f5', b'\x7f6', b'\x7f6', b'\x7f7', b'\x7f7',
+    b'\x7f8', b'\x7f8', b'\x7f9', b'\x7f9', b'\x7f=', b'\x7f=', b'\x7fA', b'\x7fA', b'\x7f_',
+    b'\x7f_', b'\x7fb', b'\x7fb', b'\x7fd', b'\x7fd', b'\x7ff', b'\x7ff', b'\x7fg', b'\x7fg',
+    b'\x7fh', b'\x7fh', b'\x7fl', b'\x7fl', b'\x7fm', b'\x7fm', b'\x7fn', b'\x7fn', b'\x7fp',
+    b'\x7fp', b'\x7fr', b'\x7fr', b'\x7fu', b'\x7fu', b'\x7f:', b'\x7fB', b'\x7fC', b'\x7fD',
+    b'\x7fE', b'\x7fF', b'\x7fG', b'\x7fH', b'\x7fI', b'\x7fJ', b'\x7fK', b'\x7fL', b'\x7fM',
+    b'\x7fN', b'\x7fO', b'\x7fP', b'\x7fQ', b'\x7fR', b'\x7fS', b'\x7fT', b'\x7fU', b'\x7fV',
+    b'\x7fW', b'\x7fY', b'\x7fj', b'\x7fk', b'\x7fq', b'\x7fv', b'\x7fw', b'\x7fx', b'\x7fy',
+    b'\x7fz', b'\x7f', b'\x7f', b'\x7f', b'\x7f', b'\xdc0', b'\xdc0', b'\xdc0', b'\xdc0', b'\xdc1',
+    b'\xdc1', b'\xdc1', b'\xdc1', b'\xdc2', b'\xdc2', b'\xdc2', b'\xdc2', b'\xdca', b'\xdca',
+    b'\xdca', b'\xdca', b'\xdcc', b'\xdcc', b'\xdcc', b'\xdcc', b'\xdce', b'\xdce', b'\xdce',
+    b'\xdce', b'\xdci', b'\xdci', b'\xdci', b'\xdci', b'\xdco', b'\xdco', b'\xdco', b'\xdco',
+    b'\xdcs', b'\xdcs', b'\xdcs', b'\xdcs', b'\xdct', b'\xdct', b'\xdct', b'\xdct', b'\xdc ',
+    b'\xdc ', b'\xdc%', b'\xdc%', b'\xdc-', b'\xdc-', b'\xdc.', b'\xdc.', b'\xdc/', b'\xdc/',
+    b'\xdc3', b'\xdc3', b'\xdc4', b'\xdc4', b'\xdc5', b'\xdc5', b'\xdc6', b'\xdc6', b'\xdc7',
+    b'\xdc7', b'\xdc8', b'\xdc8', b'\xdc9', b'\xdc9', b'\xdc=', b'\xdc=', b'\xdcA', b'\xdcA',
+    b'\xdc_', b'\xdc_', b'\xdcb', b'\xdcb', b'\xdcd', b'\xdcd', b'\xdcf', b'\xdcf', b'\xdcg',
+    b'\xdcg', b'\xdch', b'\xdch', b'\xdcl', b'\xdcl', b'\xdcm', b'\xdcm', b'\xdcn', b'\xdcn',
+    b'\xdcp', b'\xdcp', b'\xdcr', b'\xdcr', b'\xdcu', b'\xdcu', b'\xdc:', b'\xdcB', b'\xdcC',
+    b'\xdcD', b'\xdcE', b'\xdcF', b'\xdcG', b'\xdcH', b'\xdcI', b'\xdcJ', b'\xdcK', b'\xdcL',
+    b'\xdcM', b'\xdcN', b'\xdcO', b'\xdcP', b'\xdcQ', b'\xdcR', b'\xdcS', b'\xdcT', b'\xdcU',
+    b'\xdcV', b'\xdcW', b'\xdcY', b'\xdcj', b'\xdck', b'\xdcq', b'\xdcv', b'\xdcw', b'\xdcx',
+    b'\xdcy', b'\xdcz', b'\xdc', b'\xdc', b'\xdc', b'\xdc', b'\xd00', b'\xd00', b'\xd00', b'\xd00',
+    b'\xd01', b'\xd01', b'\xd01', b'\xd01', b'\xd02', b'\xd02', b'\xd02', b'\xd02', b'\xd0a',
+    b'\xd0a', b'\xd0a', b'\xd0a', b'\xd0c', b'\xd0c', b'\xd0c', b'\xd0c', b'\xd0e', b'\xd0e',
+    b'\xd0e', b'\xd0e', b'\xd0i', b'\xd0i', b'\xd0i', b'\xd0i', b'\xd0o', b'\xd0o', b'\xd0o',
+    b'\xd0o', b'\xd0s', b'\xd0s', b'\xd0s', b'\xd0s', b'\xd0t', b'\xd0t', b'\xd0t', b'\xd0t',
+    b'\xd0 ', b'\xd0 ', b'\xd0%', b'\xd0%', b'\xd0-', b'\xd0-', b'\xd0.', b'\xd0.', b'\xd0/',
+    b'\xd0/', b'\xd03', b'\xd03', b'\xd04', b'\xd04', b'\xd05', b'\xd05', b'\xd06', b'\xd06',
+    b'\xd07', b'\xd07', b'\xd08', b'\xd08', b'\xd09', b'\xd09', b'\xd0=', b'\xd0=', b'\xd0A',
+    b'\xd0A', b'\xd0_', b'\xd0_', b'\xd0b', b'\xd0b', b'\xd0d', b'\xd0d', b'\xd0f', b'\xd0f',
+    b'\xd0g', b'\xd0g', b'\xd0h', b'\xd0h', b'\xd0l', b'\xd0l', b'\xd0m', b'\xd0m', b'\xd0n',
+    b'\xd0n', b'\xd0p', b'\xd0p', b'\xd0r', b'\xd0r', b'\xd0u', b'\xd0u', b'\xd0:', b'\xd0B',
+    b'\xd0C', b'\xd0D', b'\xd0E', b'\xd0F', b'\xd0G', b'\xd0H', b'\xd0I', b'\xd0J', b'\xd0K',
+    b'\xd0L', b'\xd0M', b'\xd0N', b'\xd0O', b'\xd0P', b'\xd0Q', b'\xd0R', b'\xd0S', b'\xd0T',
+    b'\xd0U', b'\xd0V', b'\xd0W', b'\xd0Y', b'\xd0j', b'\xd0k', b'\xd0q', b'\xd0v', b'\xd0w',
+    b'\xd0x', b'\xd0y', b'\xd0z', b'\xd0', b'\xd0', b'\xd0', b'\xd0', b'\x800', b'\x800', b'\x801',
+    b'\x801', b'\x802', b'\x802', b'\x80a', b'\x80a', b'\x80c', b'\x80c', b'\x80e', b'\x80e',
+    b'\x80i', b'\x80i', b'\x80o', b'\x80o', b'\x80s', b'\x80s', b'\x80t', b'\x80t', b'\x80 ',
+    b'\x80%', b'\x80-', b'\x80.', b'\x80/', b'\x803', b'\x804', b'\x805', b'\x806', b'\x807',
+    b'\x808', b'\x809', b'\x80=', b'\x80A', b'\x80_', b'\x80b', b'\x80d', b'\x80f', b'\x80g',
+    b'\x80h', b'\x80l', b'\x80m', b'\x80n', b'\x80p', b'\x80r', b'\x80u', b'\x80', b'\x80', b'\x80',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x80',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x80', b'\x820', b'\x820', b'\x821', b'\x821', b'\x822',
+    b'\x822', b'\x82a', b'\x82a', b'\x82c', b'\x82c', b'\x82e', b'\x82e', b'\x82i', b'\x82i',
+    b'\x82o', b'\x82o', b'\x82s', b'\x82s', b'\x82t', b'\x82t', b'\x82 ', b'\x82%', b'\x82-',
+    b'\x82.', b'\x82/', b'\x823', b'\x824', b'\x825', b'\x826', b'\x827', b'\x828', b'\x829',
+    b'\x82=', b'\x82A', b'\x82_', b'\x82b', b'\x82d', b'\x82f', b'\x82g', b'\x82h', b'\x82l',
+    b'\x82m', b'\x82n', b'\x82p', b'\x82r', b'\x82u', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82', b'\x82',
+    b'\x82', b'\x82', b'\x82', b'\x800', b'\x800', b'\x800', b'\x800', b'\x801', b'\x801', b'\x801',
+    b'\x801', b'\x802', b'\x802', b'\x802', b'\x802', b'\x80a', b'\x80a', b'\x80a', b'\x80a',
+    b'\x80c', b'\x80c', b'\x80c', b'\x80c', b'\x80e', b'\x80e', b'\x80e', b'\x80e', b'\x80i',
+    b'\x80i', b'\x80i', b'\x80i', b'\x80o', b'\x80o', b'\x80o', b'\x80o', b'\x80s', b'\x80s',
+    b'\x80s', b'\x80s', b'\x80t', b'\x80t', b'\x80t', b'\x80t', b'\x80 ', b'\x80 ', b'\x80%',
+    b'\x80%', b'\x80-', b'\x80-', b'\x80.', b'\x80.', b'\x80/', b'\x80/', b'\x803', b'\x803',
+    b'\x804', b'\x804', b'\x805', b'\x805', b'\x806', b'\x806', b'\x807', b'\x807', b'\x808',
+    b'\x808', b'\x809', b'\x809', b'\x80=', b'\x80=', b'\x80A', b'\x80A', b'\x80_', b'\x80_',
+    b'\x80b', b'\x80b', b'\x80d', b'\x80d', b'\x80f', b'\x80f', b'\x80g', b'\x80g', b'\x80h',
+    b'\x80h', b'\x80l', b'\x80l', b'\x80m', b'\x80m', b'\x80n', b'\x80n', b'\x80p', b'\x80p',
+    b'\x80r', b'\x80r', b'\x80u', b'\x80u', b'\x80:', b'\x80B', b'\x80C', b'\x80D', b'\x80E',
+    b'\x80F', b'\x80G', b'\x80H', b'\x80I', b'\x80J', b'\x80K', b'\x80L', b'\x80M', b'\x80N',
+    b'\x80O', b'\x80P', b'\x80Q', b'\x80R', b'\x80S', b'\x80T', b'\x80U', b'\x80V', b'\x80W',
+    b'\x80Y', b'\x80j', b'\x80k', b'\x80q', b'\x80v', b'\x80w', b'\x80x', b'\x80y', b'\x80z',
+    b'\x80', b'\x80', b'\x80', b'\x80', b'\x820', b'\x820', b'\x820', b'\x820', b'\x821', b'\x821',
+    b'\x821', b'\x821', b'\x822', b'\x822', b'\x822', b'\x822', b'\x82a', b'\x82a', b'\x82a',
+    b'\x82a', b'\x82c', b'\x82c', b'\x82c', b'\x82c', b'\x82e', b'\x82e', b'\x82e', b'\x82e',
+    b'\x82i', b'\x82i', b'\x82i', b'\x82i', b'\x82o', b'\x82o', b'\x82o', b'\x82o', b'\x82s',
+    b'\x82s', b'\x82s', b'\x82s', b'\x82t', b'\x82t', b'\x82t', b'\x82t', b'\x82 ', b'\x82 ',
+    b'\x82%', b'\x82%', b'\x82-', b'\x82-', b'\x82.', b'\x82.', b'\x82/', b'\x82/', b'\x823',
+    b'\x823', b'\x824', b'\x824', b'\x825', b'\x825', b'\x826', b'\x826', b'\x827', b'\x827',
+    b'\x828', b'\x828', b'\x829', b'\x829', b'\x82=', b'\x82=', b'\x82A', b'\x82A', b'\x82_',
+    b'\x82_', b'\x82b', b'\x82b', b'\x82d', b'\x82d', b'\x82f', b'\x82f', b'\x82g', b'\x82g',
+    b'\x82h', b'\x82h', b'\x82l', b'\x82l', b'\x82m', b'\x82m', b'\x82n', b'\x82n', b'\x82p',
+    b'\x82p', b'\x82r', b'\x82r', b'\x82u', b'\x82u', b'\x82:', b'\x82B', b'\x82C', b'\x82D',
+    b'\x82E', b'\x82F', b'\x82G', b'\x82H', b'\x82I', b'\x82J', b'\x82K', b'\x82L', b'\x82M',
+    b'\x82N', b'\x82O', b'\x82P', b'\x82Q', b'\x82R', b'\x82S', b'\x82T', b'\x82U', b'\x82V',
+    b'\x82W', b'\x82Y', b'\x82j', b'\x82k', b'\x82q', b'\x82v', b'\x82w', b'\x82x', b'\x82y',
+    b'\x82z', b'\x82', b'\x82', b'\x82', b'\x82', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0',
+    b'\xb0', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1',
+    b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1',
+    b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd8',
+    b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3',
+    b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe5', b'\xe5', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6',
+    b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\x81',
+    b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85',
+    b'\x85', b'\x85', b'\x85', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86',
+    b'\x86', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x92',
+    b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9c', b'\x9c', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0',
+    b'\xa0', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa4',
+    b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xaa', b'\xaa', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad',
+    b'\xad', b'\xe60', b'\xe61', b'\xe62', b'\xe6a', b'\xe6c', b'\xe6e', b'\xe6i', b'\xe6o',
+    b'\xe6s', b'\xe6t', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6',
+    b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6',
+    b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81',
+    b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x85', b'\x85', b'\x85', b'\x85',
+    b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85',
+    b'\x85', b'\x85', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86',
+    b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x88', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x88', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92',
+    b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9c', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9c', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0',
+    b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa3', b'\xa3',
+    b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3',
+    b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xaa', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad',
+    b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xe60', b'\xe60',
+    b'\xe61', b'\xe61', b'\xe62', b'\xe62', b'\xe6a', b'\xe6a', b'\xe6c', b'\xe6c', b'\xe6e',
+    b'\xe6e', b'\xe6i', b'\xe6i', b'\xe6o', b'\xe6o', b'\xe6s', b'\xe6s', b'\xe6t', b'\xe6t',
+    b'\xe6 ', b'\xe6%', b'\xe6-', b'\xe6.', b'\xe6/', b'\xe63', b'\xe64', b'\xe65', b'\xe66',
+    b'\xe67', b'\xe68', b'\xe69', b'\xe6=', b'\xe6A', b'\xe6_', b'\xe6b', b'\xe6d', b'\xe6f',
+    b'\xe6g', b'\xe6h', b'\xe6l', b'\xe6m', b'\xe6n', b'\xe6p', b'\xe6r', b'\xe6u', b'\xe6',
+    b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6',
+    b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\x810', b'\x811', b'\x812',
+    b'\x81a', b'\x81c', b'\x81e', b'\x81i', b'\x81o', b'\x81s', b'\x81t', b'\x81', b'\x81', b'\x81',
+    b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81',
+    b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x840',
+    b'\x841', b'\x842', b'\x84a', b'\x84c', b'\x84e', b'\x84i', b'\x84o', b'\x84s', b'\x84t',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x84', b'\x850', b'\x851', b'\x852', b'\x85a', b'\x85c', b'\x85e', b'\x85i',
+    b'\x85o', b'\x85s', b'\x85t', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85',
+    b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85',
+    b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x860', b'\x861', b'\x862', b'\x86a', b'\x86c',
+    b'\x86e', b'\x86i', b'\x86o', b'\x86s', b'\x86t', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86',
+    b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86',
+    b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x880', b'\x881', b'\x882',
+    b'\x88a', b'\x88c', b'\x88e', b'\x88i', b'\x88o', b'\x88s', b'\x88t', b'\x88', b'\x88', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x920',
+    b'\x921', b'\x922', b'\x92a', b'\x92c', b'\x92e', b'\x92i', b'\x92o', b'\x92s', b'\x92t',
+    b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92',
+    b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92',
+    b'\x92', b'\x92', b'\xe60', b'\xe60', b'\xe60', b'\xe60', b'\xe61', b'\xe61', b'\xe61',
+    b'\xe61', b'\xe62', b'\xe62', b'\xe62', b'\xe62', b'\xe6a', b'\xe6a', b'\xe6a', b'\xe6a',
+    b'\xe6c', b'\xe6c', b'\xe6c', b'\xe6c', b'\xe6e', b'\xe6e', b'\xe6e', b'\xe6e', b'\xe6i',
+    b'\xe6i', b'\xe6i', b'\xe6i', b'\xe6o', b'\xe6o', b'\xe6o', b'\xe6o', b'\xe6s', b'\xe6s',
+    b'\xe6s', b'\xe6s', b'\xe6t', b'\xe6t', b'\xe6t', b'\xe6t', b'\xe6 ', b'\xe6 ', b'\xe6%',
+    b'\xe6%', b'\xe6-', b'\xe6-', b'\xe6.', b'\xe6.', b'\xe6/', b'\xe6/', b'\xe63', b'\xe63',
+    b'\xe64', b'\xe64', b'\xe65', b'\xe65', b'\xe66', b'\xe66', b'\xe67', b'\xe67', b'\xe68',
+    b'\xe68', b'\xe69', b'\xe69', b'\xe6=', b'\xe6=', b'\xe6A', b'\xe6A', b'\xe6_', b'\xe6_',
+    b'\xe6b', b'\xe6b', b'\xe6d', b'\xe6d', b'\xe6f', b'\xe6f', b'\xe6g', b'\xe6g', b'\xe6h',
+    b'\xe6h', b'\xe6l', b'\xe6l', b'\xe6m', b'\xe6m', b'\xe6n', b'\xe6n', b'\xe6p', b'\xe6p',
+    b'\xe6r', b'\xe6r', b'\xe6u', b'\xe6u', b'\xe6:', b'\xe6B', b'\xe6C', b'\xe6D', b'\xe6E',
+    b'\xe6F', b'\xe6G', b'\xe6H', b'\xe6I', b'\xe6J', b'\xe6K', b'\xe6L', b'\xe6M', b'\xe6N',
+    b'\xe6O', b'\xe6P', b'\xe6Q', b'\xe6R', b'\xe6S', b'\xe6T', b'\xe6U', b'\xe6V', b'\xe6W',
+    b'\xe6Y', b'\xe6j', b'\xe6k', b'\xe6q', b'\xe6v', b'\xe6w', b'\xe6x', b'\xe6y', b'\xe6z',
+    b'\xe6', b'\xe6', b'\xe6', b'\xe6', b'\x810', b'\x810', b'\x811', b'\x811', b'\x812', b'\x812',
+    b'\x81a', b'\x81a', b'\x81c', b'\x81c', b'\x81e', b'\x81e', b'\x81i', b'\x81i', b'\x81o',
+    b'\x81o', b'\x81s', b'\x81s', b'\x81t', b'\x81t', b'\x81 ', b'\x81%', b'\x81-', b'\x81.',
+    b'\x81/', b'\x813', b'\x814', b'\x815', b'\x816', b'\x817', b'\x818', b'\x819', b'\x81=',
+    b'\x81A', b'\x81_', b'\x81b', b'\x81d', b'\x81f', b'\x81g', b'\x81h', b'\x81l', b'\x81m',
+    b'\x81n', b'\x81p', b'\x81r', b'\x81u', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81',
+    b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81', b'\x81',
+    b'\x81', b'\x81', b'\x840', b'\x840', b'\x841', b'\x841', b'\x842', b'\x842', b'\x84a',
+    b'\x84a', b'\x84c', b'\x84c', b'\x84e', b'\x84e', b'\x84i', b'\x84i', b'\x84o', b'\x84o',
+    b'\x84s', b'\x84s', b'\x84t', b'\x84t', b'\x84 ', b'\x84%', b'\x84-', b'\x84.', b'\x84/',
+    b'\x843', b'\x844', b'\x845', b'\x846', b'\x847', b'\x848', b'\x849', b'\x84=', b'\x84A',
+    b'\x84_', b'\x84b', b'\x84d', b'\x84f', b'\x84g', b'\x84h', b'\x84l', b'\x84m', b'\x84n',
+    b'\x84p', b'\x84r', b'\x84u', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84', b'\x84',
+    b'\x84', b'\x810', b'\x810', b'\x810', b'\x810', b'\x811', b'\x811', b'\x811', b'\x811',
+    b'\x812', b'\x812', b'\x812', b'\x812', b'\x81a', b'\x81a', b'\x81a', b'\x81a', b'\x81c',
+    b'\x81c', b'\x81c', b'\x81c', b'\x81e', b'\x81e', b'\x81e', b'\x81e', b'\x81i', b'\x81i',
+    b'\x81i', b'\x81i', b'\x81o', b'\x81o', b'\x81o', b'\x81o', b'\x81s', b'\x81s', b'\x81s',
+    b'\x81s', b'\x81t', b'\x81t', b'\x81t', b'\x81t', b'\x81 ', b'\x81 ', b'\x81%', b'\x81%',
+    b'\x81-', b'\x81-', b'\x81.', b'\x81.', b'\x81/', b'\x81/', b'\x813', b'\x813', b'\x814',
+    b'\x814', b'\x815', b'\x815', b'\x816', b'\x816', b'\x817', b'\x817', b'\x818', b'\x818',
+    b'\x819', b'\x819', b'\x81=', b'\x81=', b'\x81A', b'\x81A', b'\x81_', b'\x81_', b'\x81b',
+    b'\x81b', b'\x81d', b'\x81d', b'\x81f', b'\x81f', b'\x81g', b'\x81g', b'\x81h', b'\x81h',
+    b'\x81l', b'\x81l', b'\x81m', b'\x81m', b'\x81n', b'\x81n', b'\x81p', b'\x81p', b'\x81r',
+    b'\x81r', b'\x81u', b'\x81u', b'\x81:', b'\x81B', b'\x81C', b'\x81D', b'\x81E', b'\x81F',
+    b'\x81G', b'\x81H', b'\x81I', b'\x81J', b'\x81K', b'\x81L', b'\x81M', b'\x81N', b'\x81O',
+    b'\x81P', b'\x81Q', b'\x81R', b'\x81S', b'\x81T', b'\x81U', b'\x81V', b'\x81W', b'\x81Y',
+    b'\x81j', b'\x81k', b'\x81q', b'\x81v', b'\x81w', b'\x81x', b'\x81y', b'\x81z', b'\x81',
+    b'\x81', b'\x81', b'\x81', b'\x840', b'\x840', b'\x840', b'\x840', b'\x841', b'\x841', b'\x841',
+    b'\x841', b'\x842', b'\x842', b'\x842', b'\x842', b'\x84a', b'\x84a', b'\x84a', b'\x84a',
+    b'\x84c', b'\x84c', b'\x84c', b'\x84c', b'\x84e', b'\x84e', b'\x84e', b'\x84e', b'\x84i',
+    b'\x84i', b'\x84i', b'\x84i', b'\x84o', b'\x84o', b'\x84o', b'\x84o', b'\x84s', b'\x84s',
+    b'\x84s', b'\x84s', b'\x84t', b'\x84t', b'\x84t', b'\x84t', b'\x84 ', b'\x84 ', b'\x84%',
+    b'\x84%', b'\x84-', b'\x84-', b'\x84.', b'\x84.', b'\x84/', b'\x84/', b'\x843', b'\x843',
+    b'\x844', b'\x844', b'\x845', b'\x845', b'\x846', b'\x846', b'\x847', b'\x847', b'\x848',
+    b'\x848', b'\x849', b'\x849', b'\x84=', b'\x84=', b'\x84A', b'\x84A', b'\x84_', b'\x84_',
+    b'\x84b', b'\x84b', b'\x84d', b'\x84d', b'\x84f', b'\x84f', b'\x84g', b'\x84g', b'\x84h',
+    b'\x84h', b'\x84l', b'\x84l', b'\x84m', b'\x84m', b'\x84n', b'\x84n', b'\x84p', b'\x84p',
+    b'\x84r', b'\x84r', b'\x84u', b'\x84u', b'\x84:', b'\x84B', b'\x84C', b'\x84D', b'\x84E',
+    b'\x84F', b'\x84G', b'\x84H', b'\x84I', b'\x84J', b'\x84K', b'\x84L', b'\x84M', b'\x84N',
+    b'\x84O', b'\x84P', b'\x84Q', b'\x84R', b'\x84S', b'\x84T', b'\x84U', b'\x84V', b'\x84W',
+    b'\x84Y', b'\x84j', b'\x84k', b'\x84q', b'\x84v', b'\x84w', b'\x84x', b'\x84y', b'\x84z',
+    b'\x84', b'\x84', b'\x84', b'\x84', b'\x830', b'\x831', b'\x832', b'\x83a', b'\x83c', b'\x83e',
+    b'\x83i', b'\x83o', b'\x83s', b'\x83t', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\xa20', b'\xa21', b'\xa22', b'\xa2a',
+    b'\xa2c', b'\xa2e', b'\xa2i', b'\xa2o', b'\xa2s', b'\xa2t', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xb80', b'\xb81',
+    b'\xb82', b'\xb8a', b'\xb8c', b'\xb8e', b'\xb8i', b'\xb8o', b'\xb8s', b'\xb8t', b'\xb8',
+    b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8',
+    b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8',
+    b'\xb8', b'\xc20', b'\xc21', b'\xc22', b'\xc2a', b'\xc2c', b'\xc2e', b'\xc2i', b'\xc2o',
+    b'\xc2s', b'\xc2t', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2',
+    b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2',
+    b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xe00', b'\xe01', b'\xe02', b'\xe0a', b'\xe0c', b'\xe0e',
+    b'\xe0i', b'\xe0o', b'\xe0s', b'\xe0t', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe20', b'\xe21', b'\xe22', b'\xe2a',
+    b'\xe2c', b'\xe2e', b'\xe2i', b'\xe2o', b'\xe2s', b'\xe2t', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\x99', b'\x99',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1',
+    b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xac', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\x830', b'\x830', b'\x831', b'\x831', b'\x832', b'\x832', b'\x83a',
+    b'\x83a', b'\x83c', b'\x83c', b'\x83e', b'\x83e', b'\x83i', b'\x83i', b'\x83o', b'\x83o',
+    b'\x83s', b'\x83s', b'\x83t', b'\x83t', b'\x83 ', b'\x83%', b'\x83-', b'\x83.', b'\x83/',
+    b'\x833', b'\x834', b'\x835', b'\x836', b'\x837', b'\x838', b'\x839', b'\x83=', b'\x83A',
+    b'\x83_', b'\x83b', b'\x83d', b'\x83f', b'\x83g', b'\x83h', b'\x83l', b'\x83m', b'\x83n',
+    b'\x83p', b'\x83r', b'\x83u', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83', b'\x83',
+    b'\x83', b'\xa20', b'\xa20', b'\xa21', b'\xa21', b'\xa22', b'\xa22', b'\xa2a', b'\xa2a',
+    b'\xa2c', b'\xa2c', b'\xa2e', b'\xa2e', b'\xa2i', b'\xa2i', b'\xa2o', b'\xa2o', b'\xa2s',
+    b'\xa2s', b'\xa2t', b'\xa2t', b'\xa2 ', b'\xa2%', b'\xa2-', b'\xa2.', b'\xa2/', b'\xa23',
+    b'\xa24', b'\xa25', b'\xa26', b'\xa27', b'\xa28', b'\xa29', b'\xa2=', b'\xa2A', b'\xa2_',
+    b'\xa2b', b'\xa2d', b'\xa2f', b'\xa2g', b'\xa2h', b'\xa2l', b'\xa2m', b'\xa2n', b'\xa2p',
+    b'\xa2r', b'\xa2u', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\xb80', b'\xb80', b'\xb81', b'\xb81', b'\xb82', b'\xb82', b'\xb8a', b'\xb8a', b'\xb8c',
+    b'\xb8c', b'\xb8e', b'\xb8e', b'\xb8i', b'\xb8i', b'\xb8o', b'\xb8o', b'\xb8s', b'\xb8s',
+    b'\xb8t', b'\xb8t', b'\xb8 ', b'\xb8%', b'\xb8-', b'\xb8.', b'\xb8/', b'\xb83', b'\xb84',
+    b'\xb85', b'\xb86', b'\xb87', b'\xb88', b'\xb89', b'\xb8=', b'\xb8A', b'\xb8_', b'\xb8b',
+    b'\xb8d', b'\xb8f', b'\xb8g', b'\xb8h', b'\xb8l', b'\xb8m', b'\xb8n', b'\xb8p', b'\xb8r',
+    b'\xb8u', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8',
+    b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xc20',
+    b'\xc20', b'\xc21', b'\xc21', b'\xc22', b'\xc22', b'\xc2a', b'\xc2a', b'\xc2c', b'\xc2c',
+    b'\xc2e', b'\xc2e', b'\xc2i', b'\xc2i', b'\xc2o', b'\xc2o', b'\xc2s', b'\xc2s', b'\xc2t',
+    b'\xc2t', b'\xc2 ', b'\xc2%', b'\xc2-', b'\xc2.', b'\xc2/', b'\xc23', b'\xc24', b'\xc25',
+    b'\xc26', b'\xc27', b'\xc28', b'\xc29', b'\xc2=', b'\xc2A', b'\xc2_', b'\xc2b', b'\xc2d',
+    b'\xc2f', b'\xc2g', b'\xc2h', b'\xc2l', b'\xc2m', b'\xc2n', b'\xc2p', b'\xc2r', b'\xc2u',
+    b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2',
+    b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\x830', b'\x830',
+    b'\x830', b'\x830', b'\x831', b'\x831', b'\x831', b'\x831', b'\x832', b'\x832', b'\x832',
+    b'\x832', b'\x83a', b'\x83a', b'\x83a', b'\x83a', b'\x83c', b'\x83c', b'\x83c', b'\x83c',
+    b'\x83e', b'\x83e', b'\x83e', b'\x83e', b'\x83i', b'\x83i', b'\x83i', b'\x83i', b'\x83o',
+    b'\x83o', b'\x83o', b'\x83o', b'\x83s', b'\x83s', b'\x83s', b'\x83s', b'\x83t', b'\x83t',
+    b'\x83t', b'\x83t', b'\x83 ', b'\x83 ', b'\x83%', b'\x83%', b'\x83-', b'\x83-', b'\x83.',
+    b'\x83.', b'\x83/', b'\x83/', b'\x833', b'\x833', b'\x834', b'\x834', b'\x835', b'\x835',
+    b'\x836', b'\x836', b'\x837', b'\x837', b'\x838', b'\x838', b'\x839', b'\x839', b'\x83=',
+    b'\x83=', b'\x83A', b'\x83A', b'\x83_', b'\x83_', b'\x83b', b'\x83b', b'\x83d', b'\x83d',
+    b'\x83f', b'\x83f', b'\x83g', b'\x83g', b'\x83h', b'\x83h', b'\x83l', b'\x83l', b'\x83m',
+    b'\x83m', b'\x83n', b'\x83n', b'\x83p', b'\x83p', b'\x83r', b'\x83r', b'\x83u', b'\x83u',
+    b'\x83:', b'\x83B', b'\x83C', b'\x83D', b'\x83E', b'\x83F', b'\x83G', b'\x83H', b'\x83I',
+    b'\x83J', b'\x83K', b'\x83L', b'\x83M', b'\x83N', b'\x83O', b'\x83P', b'\x83Q', b'\x83R',
+    b'\x83S', b'\x83T', b'\x83U', b'\x83V', b'\x83W', b'\x83Y', b'\x83j', b'\x83k', b'\x83q',
+    b'\x83v', b'\x83w', b'\x83x', b'\x83y', b'\x83z', b'\x83', b'\x83', b'\x83', b'\x83', b'\xa20',
+    b'\xa20', b'\xa20', b'\xa20', b'\xa21', b'\xa21', b'\xa21', b'\xa21', b'\xa22', b'\xa22',
+    b'\xa22', b'\xa22', b'\xa2a', b'\xa2a', b'\xa2a', b'\xa2a', b'\xa2c', b'\xa2c', b'\xa2c',
+    b'\xa2c', b'\xa2e', b'\xa2e', b'\xa2e', b'\xa2e', b'\xa2i', b'\xa2i', b'\xa2i', b'\xa2i',
+    b'\xa2o', b'\xa2o', b'\xa2o', b'\xa2o', b'\xa2s', b'\xa2s', b'\xa2s', b'\xa2s', b'\xa2t',
+    b'\xa2t', b'\xa2t', b'\xa2t', b'\xa2 ', b'\xa2 ', b'\xa2%', b'\xa2%', b'\xa2-', b'\xa2-',
+    b'\xa2.', b'\xa2.', b'\xa2/', b'\xa2/', b'\xa23', b'\xa23', b'\xa24', b'\xa24', b'\xa25',
+    b'\xa25', b'\xa26', b'\xa26', b'\xa27', b'\xa27', b'\xa28', b'\xa28', b'\xa29', b'\xa29',
+    b'\xa2=', b'\xa2=', b'\xa2A', b'\xa2A', b'\xa2_', b'\xa2_', b'\xa2b', b'\xa2b', b'\xa2d',
+    b'\xa2d', b'\xa2f', b'\xa2f', b'\xa2g', b'\xa2g', b'\xa2h', b'\xa2h', b'\xa2l', b'\xa2l',
+    b'\xa2m', b'\xa2m', b'\xa2n', b'\xa2n', b'\xa2p', b'\xa2p', b'\xa2r', b'\xa2r', b'\xa2u',
+    b'\xa2u', b'\xa2:', b'\xa2B', b'\xa2C', b'\xa2D', b'\xa2E', b'\xa2F', b'\xa2G', b'\xa2H',
+    b'\xa2I', b'\xa2J', b'\xa2K', b'\xa2L', b'\xa2M', b'\xa2N', b'\xa2O', b'\xa2P', b'\xa2Q',
+    b'\xa2R', b'\xa2S', b'\xa2T', b'\xa2U', b'\xa2V', b'\xa2W', b'\xa2Y', b'\xa2j', b'\xa2k',
+    b'\xa2q', b'\xa2v', b'\xa2w', b'\xa2x', b'\xa2y', b'\xa2z', b'\xa2', b'\xa2', b'\xa2', b'\xa2',
+    b'\x850', b'\x850', b'\x851', b'\x851', b'\x852', b'\x852', b'\x85a', b'\x85a', b'\x85c',
+    b'\x85c', b'\x85e', b'\x85e', b'\x85i', b'\x85i', b'\x85o', b'\x85o', b'\x85s', b'\x85s',
+    b'\x85t', b'\x85t', b'\x85 ', b'\x85%', b'\x85-', b'\x85.', b'\x85/', b'\x853', b'\x854',
+    b'\x855', b'\x856', b'\x857', b'\x858', b'\x859', b'\x85=', b'\x85A', b'\x85_', b'\x85b',
+    b'\x85d', b'\x85f', b'\x85g', b'\x85h', b'\x85l', b'\x85m', b'\x85n', b'\x85p', b'\x85r',
+    b'\x85u', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85',
+    b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x85', b'\x860',
+    b'\x860', b'\x861', b'\x861', b'\x862', b'\x862', b'\x86a', b'\x86a', b'\x86c', b'\x86c',
+    b'\x86e', b'\x86e', b'\x86i', b'\x86i', b'\x86o', b'\x86o', b'\x86s', b'\x86s', b'\x86t',
+    b'\x86t', b'\x86 ', b'\x86%', b'\x86-', b'\x86.', b'\x86/', b'\x863', b'\x864', b'\x865',
+    b'\x866', b'\x867', b'\x868', b'\x869', b'\x86=', b'\x86A', b'\x86_', b'\x86b', b'\x86d',
+    b'\x86f', b'\x86g', b'\x86h', b'\x86l', b'\x86m', b'\x86n', b'\x86p', b'\x86r', b'\x86u',
+    b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86',
+    b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x86', b'\x880', b'\x880',
+    b'\x881', b'\x881', b'\x882', b'\x882', b'\x88a', b'\x88a', b'\x88c', b'\x88c', b'\x88e',
+    b'\x88e', b'\x88i', b'\x88i', b'\x88o', b'\x88o', b'\x88s', b'\x88s', b'\x88t', b'\x88t',
+    b'\x88 ', b'\x88%', b'\x88-', b'\x88.', b'\x88/', b'\x883', b'\x884', b'\x885', b'\x886',
+    b'\x887', b'\x888', b'\x889', b'\x88=', b'\x88A', b'\x88_', b'\x88b', b'\x88d', b'\x88f',
+    b'\x88g', b'\x88h', b'\x88l', b'\x88m', b'\x88n', b'\x88p', b'\x88r', b'\x88u', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88',
+    b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x88', b'\x920', b'\x920', b'\x921',
+    b'\x921', b'\x922', b'\x922', b'\x92a', b'\x92a', b'\x92c', b'\x92c', b'\x92e', b'\x92e',
+    b'\x92i', b'\x92i', b'\x92o', b'\x92o', b'\x92s', b'\x92s', b'\x92t', b'\x92t', b'\x92 ',
+    b'\x92%', b'\x92-', b'\x92.', b'\x92/', b'\x923', b'\x924', b'\x925', b'\x926', b'\x927',
+    b'\x928', b'\x929', b'\x92=', b'\x92A', b'\x92_', b'\x92b', b'\x92d', b'\x92f', b'\x92g',
+    b'\x92h', b'\x92l', b'\x92m', b'\x92n', b'\x92p', b'\x92r', b'\x92u', b'\x92', b'\x92', b'\x92',
+    b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x92',
+    b'\x92', b'\x92', b'\x92', b'\x92', b'\x92', b'\x850', b'\x850', b'\x850', b'\x850', b'\x851',
+    b'\x851', b'\x851', b'\x851', b'\x852', b'\x852', b'\x852', b'\x852', b'\x85a', b'\x85a',
+    b'\x85a', b'\x85a', b'\x85c', b'\x85c', b'\x85c', b'\x85c', b'\x85e', b'\x85e', b'\x85e',
+    b'\x85e', b'\x85i', b'\x85i', b'\x85i', b'\x85i', b'\x85o', b'\x85o', b'\x85o', b'\x85o',
+    b'\x85s', b'\x85s', b'\x85s', b'\x85s', b'\x85t', b'\x85t', b'\x85t', b'\x85t', b'\x85 ',
+    b'\x85 ', b'\x85%', b'\x85%', b'\x85-', b'\x85-', b'\x85.', b'\x85.', b'\x85/', b'\x85/',
+    b'\x853', b'\x853', b'\x854', b'\x854', b'\x855', b'\x855', b'\x856', b'\x856', b'\x857',
+    b'\x857', b'\x858', b'\x858', b'\x859', b'\x859', b'\x85=', b'\x85=', b'\x85A', b'\x85A',
+    b'\x85_', b'\x85_', b'\x85b', b'\x85b', b'\x85d', b'\x85d', b'\x85f', b'\x85f', b'\x85g',
+    b'\x85g', b'\x85h', b'\x85h', b'\x85l', b'\x85l', b'\x85m', b'\x85m', b'\x85n', b'\x85n',
+    b'\x85p', b'\x85p', b'\x85r', b'\x85r', b'\x85u', b'\x85u', b'\x85:', b'\x85B', b'\x85C',
+    b'\x85D', b'\x85E', b'\x85F', b'\x85G', b'\x85H', b'\x85I', b'\x85J', b'\x85K', b'\x85L',
+    b'\x85M', b'\x85N', b'\x85O', b'\x85P', b'\x85Q', b'\x85R', b'\x85S', b'\x85T', b'\x85U',
+    b'\x85V', b'\x85W', b'\x85Y', b'\x85j', b'\x85k', b'\x85q', b'\x85v', b'\x85w', b'\x85x',
+    b'\x85y', b'\x85z', b'\x85', b'\x85', b'\x85', b'\x85', b'\x860', b'\x860', b'\x860', b'\x860',
+    b'\x861', b'\x861', b'\x861', b'\x861', b'\x862', b'\x862', b'\x862', b'\x862', b'\x86a',
+    b'\x86a', b'\x86a', b'\x86a', b'\x86c', b'\x86c', b'\x86c', b'\x86c', b'\x86e', b'\x86e',
+    b'\x86e', b'\x86e', b'\x86i', b'\x86i', b'\x86i', b'\x86i', b'\x86o', b'\x86o', b'\x86o',
+    b'\x86o', b'\x86s', b'\x86s', b'\x86s', b'\x86s', b'\x86t', b'\x86t', b'\x86t', b'\x86t',
+    b'\x86 ', b'\x86 ', b'\x86%', b'\x86%', b'\x86-', b'\x86-', b'\x86.', b'\x86.', b'\x86/',
+    b'\x86/', b'\x863', b'\x863', b'\x864', b'\x864', b'\x865', b'\x865', b'\x866', b'\x866',
+    b'\x867', b'\x867', b'\x868', b'\x868', b'\x869', b'\x869', b'\x86=', b'\x86=', b'\x86A',
+    b'\x86A', b'\x86_', b'\x86_', b'\x86b', b'\x86b', b'\x86d', b'\x86d', b'\x86f', b'\x86f',
+    b'\x86g', b'\x86g', b'\x86h', b'\x86h', b'\x86l', b'\x86l', b'\x86m', b'\x86m', b'\x86n',
+    b'\x86n', b'\x86p', b'\x86p', b'\x86r', b'\x86r', b'\x86u', b'\x86u', b'\x86:', b'\x86B',
+    b'\x86C', b'\x86D', b'\x86E', b'\x86F', b'\x86G', b'\x86H', b'\x86I', b'\x86J', b'\x86K',
+    b'\x86L', b'\x86M', b'\x86N', b'\x86O', b'\x86P', b'\x86Q', b'\x86R', b'\x86S', b'\x86T',
+    b'\x86U', b'\x86V', b'\x86W', b'\x86Y', b'\x86j', b'\x86k', b'\x86q', b'\x86v', b'\x86w',
+    b'\x86x', b'\x86y', b'\x86z', b'\x86', b'\x86', b'\x86', b'\x86', b'\x880', b'\x880', b'\x880',
+    b'\x880', b'\x881', b'\x881', b'\x881', b'\x881', b'\x882', b'\x882', b'\x882', b'\x882',
+    b'\x88a', b'\x88a', b'\x88a', b'\x88a', b'\x88c', b'\x88c', b'\x88c', b'\x88c', b'\x88e',
+    b'\x88e', b'\x88e', b'\x88e', b'\x88i', b'\x88i', b'\x88i', b'\x88i', b'\x88o', b'\x88o',
+    b'\x88o', b'\x88o', b'\x88s', b'\x88s', b'\x88s', b'\x88s', b'\x88t', b'\x88t', b'\x88t',
+    b'\x88t', b'\x88 ', b'\x88 ', b'\x88%', b'\x88%', b'\x88-', b'\x88-', b'\x88.', b'\x88.',
+    b'\x88/', b'\x88/', b'\x883', b'\x883', b'\x884', b'\x884', b'\x885', b'\x885', b'\x886',
+    b'\x886', b'\x887', b'\x887', b'\x888', b'\x888', b'\x889', b'\x889', b'\x88=', b'\x88=',
+    b'\x88A', b'\x88A', b'\x88_', b'\x88_', b'\x88b', b'\x88b', b'\x88d', b'\x88d', b'\x88f',
+    b'\x88f', b'\x88g', b'\x88g', b'\x88h', b'\x88h', b'\x88l', b'\x88l', b'\x88m', b'\x88m',
+    b'\x88n', b'\x88n', b'\x88p', b'\x88p', b'\x88r', b'\x88r', b'\x88u', b'\x88u', b'\x88:',
+    b'\x88B', b'\x88C', b'\x88D', b'\x88E', b'\x88F', b'\x88G', b'\x88H', b'\x88I', b'\x88J',
+    b'\x88K', b'\x88L', b'\x88M', b'\x88N', b'\x88O', b'\x88P', b'\x88Q', b'\x88R', b'\x88S',
+    b'\x88T', b'\x88U', b'\x88V', b'\x88W', b'\x88Y', b'\x88j', b'\x88k', b'\x88q', b'\x88v',
+    b'\x88w', b'\x88x', b'\x88y', b'\x88z', b'\x88', b'\x88', b'\x88', b'\x88', b'\x920', b'\x920',
+    b'\x920', b'\x920', b'\x921', b'\x921', b'\x921', b'\x921', b'\x922', b'\x922', b'\x922',
+    b'\x922', b'\x92a', b'\x92a', b'\x92a', b'\x92a', b'\x92c', b'\x92c', b'\x92c', b'\x92c',
+    b'\x92e', b'\x92e', b'\x92e', b'\x92e', b'\x92i', b'\x92i', b'\x92i', b'\x92i', b'\x92o',
+    b'\x92o', b'\x92o', b'\x92o', b'\x92s', b'\x92s', b'\x92s', b'\x92s', b'\x92t', b'\x92t',
+    b'\x92t', b'\x92t', b'\x92 ', b'\x92 ', b'\x92%', b'\x92%', b'\x92-', b'\x92-', b'\x92.',
+    b'\x92.', b'\x92/', b'\x92/', b'\x923', b'\x923', b'\x924', b'\x924', b'\x925', b'\x925',
+    b'\x926', b'\x926', b'\x927', b'\x927', b'\x928', b'\x928', b'\x929', b'\x929', b'\x92=',
+    b'\x92=', b'\x92A', b'\x92A', b'\x92_', b'\x92_', b'\x92b', b'\x92b', b'\x92d', b'\x92d',
+    b'\x92f', b'\x92f', b'\x92g', b'\x92g', b'\x92h', b'\x92h', b'\x92l', b'\x92l', b'\x92m',
+    b'\x92m', b'\x92n', b'\x92n', b'\x92p', b'\x92p', b'\x92r', b'\x92r', b'\x92u', b'\x92u',
+    b'\x92:', b'\x92B', b'\x92C', b'\x92D', b'\x92E', b'\x92F', b'\x92G', b'\x92H', b'\x92I',
+    b'\x92J', b'\x92K', b'\x92L', b'\x92M', b'\x92N', b'\x92O', b'\x92P', b'\x92Q', b'\x92R',
+    b'\x92S', b'\x92T', b'\x92U', b'\x92V', b'\x92W', b'\x92Y', b'\x92j', b'\x92k', b'\x92q',
+    b'\x92v', b'\x92w', b'\x92x', b'\x92y', b'\x92z', b'\x92', b'\x92', b'\x92', b'\x92', b'\x890',
+    b'\x890', b'\x890', b'\x890', b'\x891', b'\x891', b'\x891', b'\x891', b'\x892', b'\x892',
+    b'\x892', b'\x892', b'\x89a', b'\x89a', b'\x89a', b'\x89a', b'\x89c', b'\x89c', b'\x89c',
+    b'\x89c', b'\x89e', b'\x89e', b'\x89e', b'\x89e', b'\x89i', b'\x89i', b'\x89i', b'\x89i',
+    b'\x89o', b'\x89o', b'\x89o', b'\x89o', b'\x89s', b'\x89s', b'\x89s', b'\x89s', b'\x89t',
+    b'\x89t', b'\x89t', b'\x89t', b'\x89 ', b'\x89 ', b'\x89%', b'\x89%', b'\x89-', b'\x89-',
+    b'\x89.', b'\x89.', b'\x89/', b'\x89/', b'\x893', b'\x893', b'\x894', b'\x894', b'\x895',
+    b'\x895', b'\x896', b'\x896', b'\x897', b'\x897', b'\x898', b'\x898', b'\x899', b'\x899',
+    b'\x89=', b'\x89=', b'\x89A', b'\x89A', b'\x89_', b'\x89_', b'\x89b', b'\x89b', b'\x89d',
+    b'\x89d', b'\x89f', b'\x89f', b'\x89g', b'\x89g', b'\x89h', b'\x89h', b'\x89l', b'\x89l',
+    b'\x89m', b'\x89m', b'\x89n', b'\x89n', b'\x89p', b'\x89p', b'\x89r', b'\x89r', b'\x89u',
+    b'\x89u', b'\x89:', b'\x89B', b'\x89C', b'\x89D', b'\x89E', b'\x89F', b'\x89G', b'\x89H',
+    b'\x89I', b'\x89J', b'\x89K', b'\x89L', b'\x89M', b'\x89N', b'\x89O', b'\x89P', b'\x89Q',
+    b'\x89R', b'\x89S', b'\x89T', b'\x89U', b'\x89V', b'\x89W', b'\x89Y', b'\x89j', b'\x89k',
+    b'\x89q', b'\x89v', b'\x89w', b'\x89x', b'\x89y', b'\x89z', b'\x89', b'\x89', b'\x89', b'\x89',
+    b'\x8a0', b'\x8a0', b'\x8a0', b'\x8a0', b'\x8a1', b'\x8a1', b'\x8a1', b'\x8a1', b'\x8a2',
+    b'\x8a2', b'\x8a2', b'\x8a2', b'\x8aa', b'\x8aa', b'\x8aa', b'\x8aa', b'\x8ac', b'\x8ac',
+    b'\x8ac', b'\x8ac', b'\x8ae', b'\x8ae', b'\x8ae', b'\x8ae', b'\x8ai', b'\x8ai', b'\x8ai',
+    b'\x8ai', b'\x8ao', b'\x8ao', b'\x8ao', b'\x8ao', b'\x8as', b'\x8as', b'\x8as', b'\x8as',
+    b'\x8at', b'\x8at', b'\x8at', b'\x8at', b'\x8a ', b'\x8a ', b'\x8a%', b'\x8a%', b'\x8a-',
+    b'\x8a-', b'\x8a.', b'\x8a.', b'\x8a/', b'\x8a/', b'\x8a3', b'\x8a3', b'\x8a4', b'\x8a4',
+    b'\x8a5', b'\x8a5', b'\x8a6', b'\x8a6', b'\x8a7', b'\x8a7', b'\x8a8', b'\x8a8', b'\x8a9',
+    b'\x8a9', b'\x8a=', b'\x8a=', b'\x8aA', b'\x8aA', b'\x8a_', b'\x8a_', b'\x8ab', b'\x8ab',
+    b'\x8ad', b'\x8ad', b'\x8af', b'\x8af', b'\x8ag', b'\x8ag', b'\x8ah', b'\x8ah', b'\x8al',
+    b'\x8al', b'\x8am', b'\x8am', b'\x8an', b'\x8an', b'\x8ap', b'\x8ap', b'\x8ar', b'\x8ar',
+    b'\x8au', b'\x8au', b'\x8a:', b'\x8aB', b'\x8aC', b'\x8aD', b'\x8aE', b'\x8aF', b'\x8aG',
+    b'\x8aH', b'\x8aI', b'\x8aJ', b'\x8aK', b'\x8aL', b'\x8aM', b'\x8aN', b'\x8aO', b'\x8aP',
+    b'\x8aQ', b'\x8aR', b'\x8aS', b'\x8aT', b'\x8aU', b'\x8aV', b'\x8aW', b'\x8aY', b'\x8aj',
+    b'\x8ak', b'\x8aq', b'\x8av', b'\x8aw', b'\x8ax', b'\x8ay', b'\x8az', b'\x8a', b'\x8a', b'\x8a',
+    b'\x8a', b'\x8b0', b'\x8b0', b'\x8b1', b'\x8b1', b'\x8b2', b'\x8b2', b'\x8ba', b'\x8ba',
+    b'\x8bc', b'\x8bc', b'\x8be', b'\x8be', b'\x8bi', b'\x8bi', b'\x8bo', b'\x8bo', b'\x8bs',
+    b'\x8bs', b'\x8bt', b'\x8bt', b'\x8b ', b'\x8b%', b'\x8b-', b'\x8b.', b'\x8b/', b'\x8b3',
+    b'\x8b4', b'\x8b5', b'\x8b6', b'\x8b7', b'\x8b8', b'\x8b9', b'\x8b=', b'\x8bA', b'\x8b_',
+    b'\x8bb', b'\x8bd', b'\x8bf', b'\x8bg', b'\x8bh', b'\x8bl', b'\x8bm', b'\x8bn', b'\x8bp',
+    b'\x8br', b'\x8bu', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b',
+    b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8b',
+    b'\x8c0', b'\x8c0', b'\x8c1', b'\x8c1', b'\x8c2', b'\x8c2', b'\x8ca', b'\x8ca', b'\x8cc',
+    b'\x8cc', b'\x8ce', b'\x8ce', b'\x8ci', b'\x8ci', b'\x8co', b'\x8co', b'\x8cs', b'\x8cs',
+    b'\x8ct', b'\x8ct', b'\x8c ', b'\x8c%', b'\x8c-', b'\x8c.', b'\x8c/', b'\x8c3', b'\x8c4',
+    b'\x8c5', b'\x8c6', b'\x8c7', b'\x8c8', b'\x8c9', b'\x8c=', b'\x8cA', b'\x8c_', b'\x8cb',
+    b'\x8cd', b'\x8cf', b'\x8cg', b'\x8ch', b'\x8cl', b'\x8cm', b'\x8cn', b'\x8cp', b'\x8cr',
+    b'\x8cu', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c',
+    b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8d0',
+    b'\x8d0', b'\x8d1', b'\x8d1', b'\x8d2', b'\x8d2', b'\x8da', b'\x8da', b'\x8dc', b'\x8dc',
+    b'\x8de', b'\x8de', b'\x8di', b'\x8di', b'\x8do', b'\x8do', b'\x8ds', b'\x8ds', b'\x8dt',
+    b'\x8dt', b'\x8d ', b'\x8d%', b'\x8d-', b'\x8d.', b'\x8d/', b'\x8d3', b'\x8d4', b'\x8d5',
+    b'\x8d6', b'\x8d7', b'\x8d8', b'\x8d9', b'\x8d=', b'\x8dA', b'\x8d_', b'\x8db', b'\x8dd',
+    b'\x8df', b'\x8dg', b'\x8dh', b'\x8dl', b'\x8dm', b'\x8dn', b'\x8dp', b'\x8dr', b'\x8du',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d',
+    b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8d', b'\x8f0', b'\x8f0',
+    b'\x8f1', b'\x8f1', b'\x8f2', b'\x8f2', b'\x8fa', b'\x8fa', b'\x8fc', b'\x8fc', b'\x8fe',
+    b'\x8fe', b'\x8fi', b'\x8fi', b'\x8fo', b'\x8fo', b'\x8fs', b'\x8fs', b'\x8ft', b'\x8ft',
+    b'\x8f ', b'\x8f%', b'\x8f-', b'\x8f.', b'\x8f/', b'\x8f3', b'\x8f4', b'\x8f5', b'\x8f6',
+    b'\x8f7', b'\x8f8', b'\x8f9', b'\x8f=', b'\x8fA', b'\x8f_', b'\x8fb', b'\x8fd', b'\x8ff',
+    b'\x8fg', b'\x8fh', b'\x8fl', b'\x8fm', b'\x8fn', b'\x8fp', b'\x8fr', b'\x8fu', b'\x8f',
+    b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8f', b'\x8b0', b'\x8b0', b'\x8b0',
+    b'\x8b0', b'\x8b1', b'\x8b1', b'\x8b1', b'\x8b1', b'\x8b2', b'\x8b2', b'\x8b2', b'\x8b2',
+    b'\x8ba', b'\x8ba', b'\x8ba', b'\x8ba', b'\x8bc', b'\x8bc', b'\x8bc', b'\x8bc', b'\x8be',
+    b'\x8be', b'\x8be', b'\x8be', b'\x8bi', b'\x8bi', b'\x8bi', b'\x8bi', b'\x8bo', b'\x8bo',
+    b'\x8bo', b'\x8bo', b'\x8bs', b'\x8bs', b'\x8bs', b'\x8bs', b'\x8bt', b'\x8bt', b'\x8bt',
+    b'\x8bt', b'\x8b ', b'\x8b ', b'\x8b%', b'\x8b%', b'\x8b-', b'\x8b-', b'\x8b.', b'\x8b.',
+    b'\x8b/', b'\x8b/', b'\x8b3', b'\x8b3', b'\x8b4', b'\x8b4', b'\x8b5', b'\x8b5', b'\x8b6',
+    b'\x8b6', b'\x8b7', b'\x8b7', b'\x8b8', b'\x8b8', b'\x8b9', b'\x8b9', b'\x8b=', b'\x8b=',
+    b'\x8bA', b'\x8bA', b'\x8b_', b'\x8b_', b'\x8bb', b'\x8bb', b'\x8bd', b'\x8bd', b'\x8bf',
+    b'\x8bf', b'\x8bg', b'\x8bg', b'\x8bh', b'\x8bh', b'\x8bl', b'\x8bl', b'\x8bm', b'\x8bm',
+    b'\x8bn', b'\x8bn', b'\x8bp', b'\x8bp', b'\x8br', b'\x8br', b'\x8bu', b'\x8bu', b'\x8b:',
+    b'\x8bB', b'\x8bC', b'\x8bD', b'\x8bE', b'\x8bF', b'\x8bG', b'\x8bH', b'\x8bI', b'\x8bJ',
+    b'\x8bK', b'\x8bL', b'\x8bM', b'\x8bN', b'\x8bO', b'\x8bP', b'\x8bQ', b'\x8bR', b'\x8bS',
+    b'\x8bT', b'\x8bU', b'\x8bV', b'\x8bW', b'\x8bY', b'\x8bj', b'\x8bk', b'\x8bq', b'\x8bv',
+    b'\x8bw', b'\x8bx', b'\x8by', b'\x8bz', b'\x8b', b'\x8b', b'\x8b', b'\x8b', b'\x8c0', b'\x8c0',
+    b'\x8c0', b'\x8c0', b'\x8c1', b'\x8c1', b'\x8c1', b'\x8c1', b'\x8c2', b'\x8c2', b'\x8c2',
+    b'\x8c2', b'\x8ca', b'\x8ca', b'\x8ca', b'\x8ca', b'\x8cc', b'\x8cc', b'\x8cc', b'\x8cc',
+    b'\x8ce', b'\x8ce', b'\x8ce', b'\x8ce', b'\x8ci', b'\x8ci', b'\x8ci', b'\x8ci', b'\x8co',
+    b'\x8co', b'\x8co', b'\x8co', b'\x8cs', b'\x8cs', b'\x8cs', b'\x8cs', b'\x8ct', b'\x8ct',
+    b'\x8ct', b'\x8ct', b'\x8c ', b'\x8c ', b'\x8c%', b'\x8c%', b'\x8c-', b'\x8c-', b'\x8c.',
+    b'\x8c.', b'\x8c/', b'\x8c/', b'\x8c3', b'\x8c3', b'\x8c4', b'\x8c4', b'\x8c5', b'\x8c5',
+    b'\x8c6', b'\x8c6', b'\x8c7', b'\x8c7', b'\x8c8', b'\x8c8', b'\x8c9', b'\x8c9', b'\x8c=',
+    b'\x8c=', b'\x8cA', b'\x8cA', b'\x8c_', b'\x8c_', b'\x8cb', b'\x8cb', b'\x8cd', b'\x8cd',
+    b'\x8cf', b'\x8cf', b'\x8cg', b'\x8cg', b'\x8ch', b'\x8ch', b'\x8cl', b'\x8cl', b'\x8cm',
+    b'\x8cm', b'\x8cn', b'\x8cn', b'\x8cp', b'\x8cp', b'\x8cr', b'\x8cr', b'\x8cu', b'\x8cu',
+    b'\x8c:', b'\x8cB', b'\x8cC', b'\x8cD', b'\x8cE', b'\x8cF', b'\x8cG', b'\x8cH', b'\x8cI',
+    b'\x8cJ', b'\x8cK', b'\x8cL', b'\x8cM', b'\x8cN', b'\x8cO', b'\x8cP', b'\x8cQ', b'\x8cR',
+    b'\x8cS', b'\x8cT', b'\x8cU', b'\x8cV', b'\x8cW', b'\x8cY', b'\x8cj', b'\x8ck', b'\x8cq',
+    b'\x8cv', b'\x8cw', b'\x8cx', b'\x8cy', b'\x8cz', b'\x8c', b'\x8c', b'\x8c', b'\x8c', b'\x8d0',
+    b'\x8d0', b'\x8d0', b'\x8d0', b'\x8d1', b'\x8d1', b'\x8d1', b'\x8d1', b'\x8d2', b'\x8d2',
+    b'\x8d2', b'\x8d2', b'\x8da', b'\x8da', b'\x8da', b'\x8da', b'\x8dc', b'\x8dc', b'\x8dc',
+    b'\x8dc', b'\x8de', b'\x8de', b'\x8de', b'\x8de', b'\x8di', b'\x8di', b'\x8di', b'\x8di',
+    b'\x8do', b'\x8do', b'\x8do', b'\x8do', b'\x8ds', b'\x8ds', b'\x8ds', b'\x8ds', b'\x8dt',
+    b'\x8dt', b'\x8dt', b'\x8dt', b'\x8d ', b'\x8d ', b'\x8d%', b'\x8d%', b'\x8d-', b'\x8d-',
+    b'\x8d.', b'\x8d.', b'\x8d/', b'\x8d/', b'\x8d3', b'\x8d3', b'\x8d4', b'\x8d4', b'\x8d5',
+    b'\x8d5', b'\x8d6', b'\x8d6', b'\x8d7', b'\x8d7', b'\x8d8', b'\x8d8', b'\x8d9', b'\x8d9',
+    b'\x8d=', b'\x8d=', b'\x8dA', b'\x8dA', b'\x8d_', b'\x8d_', b'\x8db', b'\x8db', b'\x8dd',
+    b'\x8dd', b'\x8df', b'\x8df', b'\x8dg', b'\x8dg', b'\x8dh', b'\x8dh', b'\x8dl', b'\x8dl',
+    b'\x8dm', b'\x8dm', b'\x8dn', b'\x8dn', b'\x8dp', b'\x8dp', b'\x8dr', b'\x8dr', b'\x8du',
+    b'\x8du', b'\x8d:', b'\x8dB', b'\x8dC', b'\x8dD', b'\x8dE', b'\x8dF', b'\x8dG', b'\x8dH',
+    b'\x8dI', b'\x8dJ', b'\x8dK', b'\x8dL', b'\x8dM', b'\x8dN', b'\x8dO', b'\x8dP', b'\x8dQ',
+    b'\x8dR', b'\x8dS', b'\x8dT', b'\x8dU', b'\x8dV', b'\x8dW', b'\x8dY', b'\x8dj', b'\x8dk',
+    b'\x8dq', b'\x8dv', b'\x8dw', b'\x8dx', b'\x8dy', b'\x8dz', b'\x8d', b'\x8d', b'\x8d', b'\x8d',
+    b'\x8f0', b'\x8f0', b'\x8f0', b'\x8f0', b'\x8f1', b'\x8f1', b'\x8f1', b'\x8f1', b'\x8f2',
+    b'\x8f2', b'\x8f2', b'\x8f2', b'\x8fa', b'\x8fa', b'\x8fa', b'\x8fa', b'\x8fc', b'\x8fc',
+    b'\x8fc', b'\x8fc', b'\x8fe', b'\x8fe', b'\x8fe', b'\x8fe', b'\x8fi', b'\x8fi', b'\x8fi',
+    b'\x8fi', b'\x8fo', b'\x8fo', b'\x8fo', b'\x8fo', b'\x8fs', b'\x8fs', b'\x8fs', b'\x8fs',
+    b'\x8ft', b'\x8ft', b'\x8ft', b'\x8ft', b'\x8f ', b'\x8f ', b'\x8f%', b'\x8f%', b'\x8f-',
+    b'\x8f-', b'\x8f.', b'\x8f.', b'\x8f/', b'\x8f/', b'\x8f3', b'\x8f3', b'\x8f4', b'\x8f4',
+    b'\x8f5', b'\x8f5', b'\x8f6', b'\x8f6', b'\x8f7', b'\x8f7', b'\x8f8', b'\x8f8', b'\x8f9',
+    b'\x8f9', b'\x8f=', b'\x8f=', b'\x8fA', b'\x8fA', b'\x8f_', b'\x8f_', b'\x8fb', b'\x8fb',
+    b'\x8fd', b'\x8fd', b'\x8ff', b'\x8ff', b'\x8fg', b'\x8fg', b'\x8fh', b'\x8fh', b'\x8fl',
+    b'\x8fl', b'\x8fm', b'\x8fm', b'\x8fn', b'\x8fn', b'\x8fp', b'\x8fp', b'\x8fr', b'\x8fr',
+    b'\x8fu', b'\x8fu', b'\x8f:', b'\x8fB', b'\x8fC', b'\x8fD', b'\x8fE', b'\x8fF', b'\x8fG',
+    b'\x8fH', b'\x8fI', b'\x8fJ', b'\x8fK', b'\x8fL', b'\x8fM', b'\x8fN', b'\x8fO', b'\x8fP',
+    b'\x8fQ', b'\x8fR', b'\x8fS', b'\x8fT', b'\x8fU', b'\x8fV', b'\x8fW', b'\x8fY', b'\x8fj',
+    b'\x8fk', b'\x8fq', b'\x8fv', b'\x8fw', b'\x8fx', b'\x8fy', b'\x8fz', b'\x8f', b'\x8f', b'\x8f',
+    b'\x8f', b'\x900', b'\x900', b'\x901', b'\x901', b'\x902', b'\x902', b'\x90a', b'\x90a',
+    b'\x90c', b'\x90c', b'\x90e', b'\x90e', b'\x90i', b'\x90i', b'\x90o', b'\x90o', b'\x90s',
+    b'\x90s', b'\x90t', b'\x90t', b'\x90 ', b'\x90%', b'\x90-', b'\x90.', b'\x90/', b'\x903',
+    b'\x904', b'\x905', b'\x906', b'\x907', b'\x908', b'\x909', b'\x90=', b'\x90A', b'\x90_',
+    b'\x90b', b'\x90d', b'\x90f', b'\x90g', b'\x90h', b'\x90l', b'\x90m', b'\x90n', b'\x90p',
+    b'\x90r', b'\x90u', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90',
+    b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90', b'\x90',
+    b'\x910', b'\x910', b'\x911', b'\x911', b'\x912', b'\x912', b'\x91a', b'\x91a', b'\x91c',
+    b'\x91c', b'\x91e', b'\x91e', b'\x91i', b'\x91i', b'\x91o', b'\x91o', b'\x91s', b'\x91s',
+    b'\x91t', b'\x91t', b'\x91 ', b'\x91%', b'\x91-', b'\x91.', b'\x91/', b'\x913', b'\x914',
+    b'\x915', b'\x916', b'\x917', b'\x918', b'\x919', b'\x91=', b'\x91A', b'\x91_', b'\x91b',
+    b'\x91d', b'\x91f', b'\x91g', b'\x91h', b'\x91l', b'\x91m', b'\x91n', b'\x91p', b'\x91r',
+    b'\x91u', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91',
+    b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x91', b'\x940',
+    b'\x940', b'\x941', b'\x941', b'\x942', b'\x942', b'\x94a', b'\x94a', b'\x94c', b'\x94c',
+    b'\x94e', b'\x94e', b'\x94i', b'\x94i', b'\x94o', b'\x94o', b'\x94s', b'\x94s', b'\x94t',
+    b'\x94t', b'\x94 ', b'\x94%', b'\x94-', b'\x94.', b'\x94/', b'\x943', b'\x944', b'\x945',
+    b'\x946', b'\x947', b'\x948', b'\x949', b'\x94=', b'\x94A', b'\x94_', b'\x94b', b'\x94d',
+    b'\x94f', b'\x94g', b'\x94h', b'\x94l', b'\x94m', b'\x94n', b'\x94p', b'\x94r', b'\x94u',
+    b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94',
+    b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x94', b'\x9f0', b'\x9f0',
+    b'\x9f1', b'\x9f1', b'\x9f2', b'\x9f2', b'\x9fa', b'\x9fa', b'\x9fc', b'\x9fc', b'\x9fe',
+    b'\x9fe', b'\x9fi', b'\x9fi', b'\x9fo', b'\x9fo', b'\x9fs', b'\x9fs', b'\x9ft', b'\x9ft',
+    b'\x9f ', b'\x9f%', b'\x9f-', b'\x9f.', b'\x9f/', b'\x9f3', b'\x9f4', b'\x9f5', b'\x9f6',
+    b'\x9f7', b'\x9f8', b'\x9f9', b'\x9f=', b'\x9fA', b'\x9f_', b'\x9fb', b'\x9fd', b'\x9ff',
+    b'\x9fg', b'\x9fh', b'\x9fl', b'\x9fm', b'\x9fn', b'\x9fp', b'\x9fr', b'\x9fu', b'\x9f',
+    b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f',
+    b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x900', b'\x900', b'\x900',
+    b'\x900', b'\x901', b'\x901', b'\x901', b'\x901', b'\x902', b'\x902', b'\x902', b'\x902',
+    b'\x90a', b'\x90a', b'\x90a', b'\x90a', b'\x90c', b'\x90c', b'\x90c', b'\x90c', b'\x90e',
+    b'\x90e', b'\x90e', b'\x90e', b'\x90i', b'\x90i', b'\x90i', b'\x90i', b'\x90o', b'\x90o',
+    b'\x90o', b'\x90o', b'\x90s', b'\x90s', b'\x90s', b'\x90s', b'\x90t', b'\x90t', b'\x90t',
+    b'\x90t', b'\x90 ', b'\x90 ', b'\x90%', b'\x90%', b'\x90-', b'\x90-', b'\x90.', b'\x90.',
+    b'\x90/', b'\x90/', b'\x903', b'\x903', b'\x904', b'\x904', b'\x905', b'\x905', b'\x906',
+    b'\x906', b'\x907', b'\x907', b'\x908', b'\x908', b'\x909', b'\x909', b'\x90=', b'\x90=',
+    b'\x90A', b'\x90A', b'\x90_', b'\x90_', b'\x90b', b'\x90b', b'\x90d', b'\x90d', b'\x90f',
+    b'\x90f', b'\x90g', b'\x90g', b'\x90h', b'\x90h', b'\x90l', b'\x90l', b'\x90m', b'\x90m',
+    b'\x90n', b'\x90n', b'\x90p', b'\x90p', b'\x90r', b'\x90r', b'\x90u', b'\x90u', b'\x90:',
+    b'\x90B', b'\x90C', b'\x90D', b'\x90E', b'\x90F', b'\x90G', b'\x90H', b'\x90I', b'\x90J',
+    b'\x90K', b'\x90L', b'\x90M', b'\x90N', b'\x90O', b'\x90P', b'\x90Q', b'\x90R', b'\x90S',
+    b'\x90T', b'\x90U', b'\x90V', b'\x90W', b'\x90Y', b'\x90j', b'\x90k', b'\x90q', b'\x90v',
+    b'\x90w', b'\x90x', b'\x90y', b'\x90z', b'\x90', b'\x90', b'\x90', b'\x90', b'\x910', b'\x910',
+    b'\x910', b'\x910', b'\x911', b'\x911', b'\x911', b'\x911', b'\x912', b'\x912', b'\x912',
+    b'\x912', b'\x91a', b'\x91a', b'\x91a', b'\x91a', b'\x91c', b'\x91c', b'\x91c', b'\x91c',
+    b'\x91e', b'\x91e', b'\x91e', b'\x91e', b'\x91i', b'\x91i', b'\x91i', b'\x91i', b'\x91o',
+    b'\x91o', b'\x91o', b'\x91o', b'\x91s', b'\x91s', b'\x91s', b'\x91s', b'\x91t', b'\x91t',
+    b'\x91t', b'\x91t', b'\x91 ', b'\x91 ', b'\x91%', b'\x91%', b'\x91-', b'\x91-', b'\x91.',
+    b'\x91.', b'\x91/', b'\x91/', b'\x913', b'\x913', b'\x914', b'\x914', b'\x915', b'\x915',
+    b'\x916', b'\x916', b'\x917', b'\x917', b'\x918', b'\x918', b'\x919', b'\x919', b'\x91=',
+    b'\x91=', b'\x91A', b'\x91A', b'\x91_', b'\x91_', b'\x91b', b'\x91b', b'\x91d', b'\x91d',
+    b'\x91f', b'\x91f', b'\x91g', b'\x91g', b'\x91h', b'\x91h', b'\x91l', b'\x91l', b'\x91m',
+    b'\x91m', b'\x91n', b'\x91n', b'\x91p', b'\x91p', b'\x91r', b'\x91r', b'\x91u', b'\x91u',
+    b'\x91:', b'\x91B', b'\x91C', b'\x91D', b'\x91E', b'\x91F', b'\x91G', b'\x91H', b'\x91I',
+    b'\x91J', b'\x91K', b'\x91L', b'\x91M', b'\x91N', b'\x91O', b'\x91P', b'\x91Q', b'\x91R',
+    b'\x91S', b'\x91T', b'\x91U', b'\x91V', b'\x91W', b'\x91Y', b'\x91j', b'\x91k', b'\x91q',
+    b'\x91v', b'\x91w', b'\x91x', b'\x91y', b'\x91z', b'\x91', b'\x91', b'\x91', b'\x91', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96',
+    b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x97', b'\x97', b'\x97',
+    b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97',
+    b'\x97', b'\x97', b'\x97', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98',
+    b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e',
+    b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa5', b'\xa5', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa8',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae',
+    b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae',
+    b'\xae', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb4', b'\xb4', b'\xb4', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6',
+    b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb7',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\x930', b'\x931', b'\x932', b'\x93a', b'\x93c',
+    b'\x93e', b'\x93i', b'\x93o', b'\x93s', b'\x93t', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x950', b'\x951', b'\x952',
+    b'\x95a', b'\x95c', b'\x95e', b'\x95i', b'\x95o', b'\x95s', b'\x95t', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x960',
+    b'\x961', b'\x962', b'\x96a', b'\x96c', b'\x96e', b'\x96i', b'\x96o', b'\x96s', b'\x96t',
+    b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96',
+    b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96',
+    b'\x96', b'\x96', b'\x970', b'\x971', b'\x972', b'\x97a', b'\x97c', b'\x97e', b'\x97i',
+    b'\x97o', b'\x97s', b'\x97t', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97',
+    b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97',
+    b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x980', b'\x981', b'\x982', b'\x98a', b'\x98c',
+    b'\x98e', b'\x98i', b'\x98o', b'\x98s', b'\x98t', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98',
+    b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98',
+    b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x9b0', b'\x9b1', b'\x9b2',
+    b'\x9ba', b'\x9bc', b'\x9be', b'\x9bi', b'\x9bo', b'\x9bs', b'\x9bt', b'\x9b', b'\x9b', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9d0',
+    b'\x9d1', b'\x9d2', b'\x9da', b'\x9dc', b'\x9de', b'\x9di', b'\x9do', b'\x9ds', b'\x9dt',
+    b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9d', b'\x9e0', b'\x9e1', b'\x9e2', b'\x9ea', b'\x9ec', b'\x9ee', b'\x9ei',
+    b'\x9eo', b'\x9es', b'\x9et', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e',
+    b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e',
+    b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x930', b'\x930', b'\x931', b'\x931', b'\x932',
+    b'\x932', b'\x93a', b'\x93a', b'\x93c', b'\x93c', b'\x93e', b'\x93e', b'\x93i', b'\x93i',
+    b'\x93o', b'\x93o', b'\x93s', b'\x93s', b'\x93t', b'\x93t', b'\x93 ', b'\x93%', b'\x93-',
+    b'\x93.', b'\x93/', b'\x933', b'\x934', b'\x935', b'\x936', b'\x937', b'\x938', b'\x939',
+    b'\x93=', b'\x93A', b'\x93_', b'\x93b', b'\x93d', b'\x93f', b'\x93g', b'\x93h', b'\x93l',
+    b'\x93m', b'\x93n', b'\x93p', b'\x93r', b'\x93u', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93', b'\x93',
+    b'\x93', b'\x93', b'\x93', b'\x950', b'\x950', b'\x951', b'\x951', b'\x952', b'\x952', b'\x95a',
+    b'\x95a', b'\x95c', b'\x95c', b'\x95e', b'\x95e', b'\x95i', b'\x95i', b'\x95o', b'\x95o',
+    b'\x95s', b'\x95s', b'\x95t', b'\x95t', b'\x95 ', b'\x95%', b'\x95-', b'\x95.', b'\x95/',
+    b'\x953', b'\x954', b'\x955', b'\x956', b'\x957', b'\x958', b'\x959', b'\x95=', b'\x95A',
+    b'\x95_', b'\x95b', b'\x95d', b'\x95f', b'\x95g', b'\x95h', b'\x95l', b'\x95m', b'\x95n',
+    b'\x95p', b'\x95r', b'\x95u', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x960', b'\x960', b'\x961', b'\x961', b'\x962', b'\x962', b'\x96a', b'\x96a',
+    b'\x96c', b'\x96c', b'\x96e', b'\x96e', b'\x96i', b'\x96i', b'\x96o', b'\x96o', b'\x96s',
+    b'\x96s', b'\x96t', b'\x96t', b'\x96 ', b'\x96%', b'\x96-', b'\x96.', b'\x96/', b'\x963',
+    b'\x964', b'\x965', b'\x966', b'\x967', b'\x968', b'\x969', b'\x96=', b'\x96A', b'\x96_',
+    b'\x96b', b'\x96d', b'\x96f', b'\x96g', b'\x96h', b'\x96l', b'\x96m', b'\x96n', b'\x96p',
+    b'\x96r', b'\x96u', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96',
+    b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96', b'\x96',
+    b'\x970', b'\x970', b'\x971', b'\x971', b'\x972', b'\x972', b'\x97a', b'\x97a', b'\x97c',
+    b'\x97c', b'\x97e', b'\x97e', b'\x97i', b'\x97i', b'\x97o', b'\x97o', b'\x97s', b'\x97s',
+    b'\x97t', b'\x97t', b'\x97 ', b'\x97%', b'\x97-', b'\x97.', b'\x97/', b'\x973', b'\x974',
+    b'\x975', b'\x976', b'\x977', b'\x978', b'\x979', b'\x97=', b'\x97A', b'\x97_', b'\x97b',
+    b'\x97d', b'\x97f', b'\x97g', b'\x97h', b'\x97l', b'\x97m', b'\x97n', b'\x97p', b'\x97r',
+    b'\x97u', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97',
+    b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x97', b'\x930',
+    b'\x930', b'\x930', b'\x930', b'\x931', b'\x931', b'\x931', b'\x931', b'\x932', b'\x932',
+    b'\x932', b'\x932', b'\x93a', b'\x93a', b'\x93a', b'\x93a', b'\x93c', b'\x93c', b'\x93c',
+    b'\x93c', b'\x93e', b'\x93e', b'\x93e', b'\x93e', b'\x93i', b'\x93i', b'\x93i', b'\x93i',
+    b'\x93o', b'\x93o', b'\x93o', b'\x93o', b'\x93s', b'\x93s', b'\x93s', b'\x93s', b'\x93t',
+    b'\x93t', b'\x93t', b'\x93t', b'\x93 ', b'\x93 ', b'\x93%', b'\x93%', b'\x93-', b'\x93-',
+    b'\x93.', b'\x93.', b'\x93/', b'\x93/', b'\x933', b'\x933', b'\x934', b'\x934', b'\x935',
+    b'\x935', b'\x936', b'\x936', b'\x937', b'\x937', b'\x938', b'\x938', b'\x939', b'\x939',
+    b'\x93=', b'\x93=', b'\x93A', b'\x93A', b'\x93_', b'\x93_', b'\x93b', b'\x93b', b'\x93d',
+    b'\x93d', b'\x93f', b'\x93f', b'\x93g', b'\x93g', b'\x93h', b'\x93h', b'\x93l', b'\x93l',
+    b'\x93m', b'\x93m', b'\x93n', b'\x93n', b'\x93p', b'\x93p', b'\x93r', b'\x93r', b'\x93u',
+    b'\x93u', b'\x93:', b'\x93B', b'\x93C', b'\x93D', b'\x93E', b'\x93F', b'\x93G', b'\x93H',
+    b'\x93I', b'\x93J', b'\x93K', b'\x93L', b'\x93M', b'\x93N', b'\x93O', b'\x93P', b'\x93Q',
+    b'\x93R', b'\x93S', b'\x93T', b'\x93U', b'\x93V', b'\x93W', b'\x93Y', b'\x93j', b'\x93k',
+    b'\x93q', b'\x93v', b'\x93w', b'\x93x', b'\x93y', b'\x93z', b'\x93', b'\x93', b'\x93', b'\x93',
+    b'\x950', b'\x950', b'\x950', b'\x950', b'\x951', b'\x951', b'\x951', b'\x951', b'\x952',
+    b'\x952', b'\x952', b'\x952', b'\x95a', b'\x95a', b'\x95a', b'\x95a', b'\x95c', b'\x95c',
+    b'\x95c', b'\x95c', b'\x95e', b'\x95e', b'\x95e', b'\x95e', b'\x95i', b'\x95i', b'\x95i',
+    b'\x95i', b'\x95o', b'\x95o', b'\x95o', b'\x95o', b'\x95s', b'\x95s', b'\x95s', b'\x95s',
+    b'\x95t', b'\x95t', b'\x95t', b'\x95t', b'\x95 ', b'\x95 ', b'\x95%', b'\x95%', b'\x95-',
+    b'\x95-', b'\x95.', b'\x95.', b'\x95/', b'\x95/', b'\x953', b'\x953', b'\x954', b'\x954',
+    b'\x955', b'\x955', b'\x956', b'\x956', b'\x957', b'\x957', b'\x958', b'\x958', b'\x959',
+    b'\x959', b'\x95=', b'\x95=', b'\x95A', b'\x95A', b'\x95_', b'\x95_', b'\x95b', b'\x95b',
+    b'\x95d', b'\x95d', b'\x95f', b'\x95f', b'\x95g', b'\x95g', b'\x95h', b'\x95h', b'\x95l',
+    b'\x95l', b'\x95m', b'\x95m', b'\x95n', b'\x95n', b'\x95p', b'\x95p', b'\x95r', b'\x95r',
+    b'\x95u', b'\x95u', b'\x95:', b'\x95B', b'\x95C', b'\x95D', b'\x95E', b'\x95F', b'\x95G',
+    b'\x95H', b'\x95I', b'\x95J', b'\x95K', b'\x95L', b'\x95M', b'\x95N', b'\x95O', b'\x95P',
+    b'\x95Q', b'\x95R', b'\x95S', b'\x95T', b'\x95U', b'\x95V', b'\x95W', b'\x95Y', b'\x95j',
+    b'\x95k', b'\x95q', b'\x95v', b'\x95w', b'\x95x', b'\x95y', b'\x95z', b'\x95', b'\x95', b'\x95',
+    b'\x95', b'\x940', b'\x940', b'\x940', b'\x940', b'\x941', b'\x941', b'\x941', b'\x941',
+    b'\x942', b'\x942', b'\x942', b'\x942', b'\x94a', b'\x94a', b'\x94a', b'\x94a', b'\x94c',
+    b'\x94c', b'\x94c', b'\x94c', b'\x94e', b'\x94e', b'\x94e', b'\x94e', b'\x94i', b'\x94i',
+    b'\x94i', b'\x94i', b'\x94o', b'\x94o', b'\x94o', b'\x94o', b'\x94s', b'\x94s', b'\x94s',
+    b'\x94s', b'\x94t', b'\x94t', b'\x94t', b'\x94t', b'\x94 ', b'\x94 ', b'\x94%', b'\x94%',
+    b'\x94-', b'\x94-', b'\x94.', b'\x94.', b'\x94/', b'\x94/', b'\x943', b'\x943', b'\x944',
+    b'\x944', b'\x945', b'\x945', b'\x946', b'\x946', b'\x947', b'\x947', b'\x948', b'\x948',
+    b'\x949', b'\x949', b'\x94=', b'\x94=', b'\x94A', b'\x94A', b'\x94_', b'\x94_', b'\x94b',
+    b'\x94b', b'\x94d', b'\x94d', b'\x94f', b'\x94f', b'\x94g', b'\x94g', b'\x94h', b'\x94h',
+    b'\x94l', b'\x94l', b'\x94m', b'\x94m', b'\x94n', b'\x94n', b'\x94p', b'\x94p', b'\x94r',
+    b'\x94r', b'\x94u', b'\x94u', b'\x94:', b'\x94B', b'\x94C', b'\x94D', b'\x94E', b'\x94F',
+    b'\x94G', b'\x94H', b'\x94I', b'\x94J', b'\x94K', b'\x94L', b'\x94M', b'\x94N', b'\x94O',
+    b'\x94P', b'\x94Q', b'\x94R', b'\x94S', b'\x94T', b'\x94U', b'\x94V', b'\x94W', b'\x94Y',
+    b'\x94j', b'\x94k', b'\x94q', b'\x94v', b'\x94w', b'\x94x', b'\x94y', b'\x94z', b'\x94',
+    b'\x94', b'\x94', b'\x94', b'\x9f0', b'\x9f0', b'\x9f0', b'\x9f0', b'\x9f1', b'\x9f1', b'\x9f1',
+    b'\x9f1', b'\x9f2', b'\x9f2', b'\x9f2', b'\x9f2', b'\x9fa', b'\x9fa', b'\x9fa', b'\x9fa',
+    b'\x9fc', b'\x9fc', b'\x9fc', b'\x9fc', b'\x9fe', b'\x9fe', b'\x9fe', b'\x9fe', b'\x9fi',
+    b'\x9fi', b'\x9fi', b'\x9fi', b'\x9fo', b'\x9fo', b'\x9fo', b'\x9fo', b'\x9fs', b'\x9fs',
+    b'\x9fs', b'\x9fs', b'\x9ft', b'\x9ft', b'\x9ft', b'\x9ft', b'\x9f ', b'\x9f ', b'\x9f%',
+    b'\x9f%', b'\x9f-', b'\x9f-', b'\x9f.', b'\x9f.', b'\x9f/', b'\x9f/', b'\x9f3', b'\x9f3',
+    b'\x9f4', b'\x9f4', b'\x9f5', b'\x9f5', b'\x9f6', b'\x9f6', b'\x9f7', b'\x9f7', b'\x9f8',
+    b'\x9f8', b'\x9f9', b'\x9f9', b'\x9f=', b'\x9f=', b'\x9fA', b'\x9fA', b'\x9f_', b'\x9f_',
+    b'\x9fb', b'\x9fb', b'\x9fd', b'\x9fd', b'\x9ff', b'\x9ff', b'\x9fg', b'\x9fg', b'\x9fh',
+    b'\x9fh', b'\x9fl', b'\x9fl', b'\x9fm', b'\x9fm', b'\x9fn', b'\x9fn', b'\x9fp', b'\x9fp',
+    b'\x9fr', b'\x9fr', b'\x9fu', b'\x9fu', b'\x9f:', b'\x9fB', b'\x9fC', b'\x9fD', b'\x9fE',
+    b'\x9fF', b'\x9fG', b'\x9fH', b'\x9fI', b'\x9fJ', b'\x9fK', b'\x9fL', b'\x9fM', b'\x9fN',
+    b'\x9fO', b'\x9fP', b'\x9fQ', b'\x9fR', b'\x9fS', b'\x9fT', b'\x9fU', b'\x9fV', b'\x9fW',
+    b'\x9fY', b'\x9fj', b'\x9fk', b'\x9fq', b'\x9fv', b'\x9fw', b'\x9fx', b'\x9fy', b'\x9fz',
+    b'\x9f', b'\x9f', b'\x9f', b'\x9f', b'\x960', b'\x960', b'\x960', b'\x960', b'\x961', b'\x961',
+    b'\x961', b'\x961', b'\x962', b'\x962', b'\x962', b'\x962', b'\x96a', b'\x96a', b'\x96a',
+    b'\x96a', b'\x96c', b'\x96c', b'\x96c', b'\x96c', b'\x96e', b'\x96e', b'\x96e', b'\x96e',
+    b'\x96i', b'\x96i', b'\x96i', b'\x96i', b'\x96o', b'\x96o', b'\x96o', b'\x96o', b'\x96s',
+    b'\x96s', b'\x96s', b'\x96s', b'\x96t', b'\x96t', b'\x96t', b'\x96t', b'\x96 ', b'\x96 ',
+    b'\x96%', b'\x96%', b'\x96-', b'\x96-', b'\x96.', b'\x96.', b'\x96/', b'\x96/', b'\x963',
+    b'\x963', b'\x964', b'\x964', b'\x965', b'\x965', b'\x966', b'\x966', b'\x967', b'\x967',
+    b'\x968', b'\x968', b'\x969', b'\x969', b'\x96=', b'\x96=', b'\x96A', b'\x96A', b'\x96_',
+    b'\x96_', b'\x96b', b'\x96b', b'\x96d', b'\x96d', b'\x96f', b'\x96f', b'\x96g', b'\x96g',
+    b'\x96h', b'\x96h', b'\x96l', b'\x96l', b'\x96m', b'\x96m', b'\x96n', b'\x96n', b'\x96p',
+    b'\x96p', b'\x96r', b'\x96r', b'\x96u', b'\x96u', b'\x96:', b'\x96B', b'\x96C', b'\x96D',
+    b'\x96E', b'\x96F', b'\x96G', b'\x96H', b'\x96I', b'\x96J', b'\x96K', b'\x96L', b'\x96M',
+    b'\x96N', b'\x96O', b'\x96P', b'\x96Q', b'\x96R', b'\x96S', b'\x96T', b'\x96U', b'\x96V',
+    b'\x96W', b'\x96Y', b'\x96j', b'\x96k', b'\x96q', b'\x96v', b'\x96w', b'\x96x', b'\x96y',
+    b'\x96z', b'\x96', b'\x96', b'\x96', b'\x96', b'\x970', b'\x970', b'\x970', b'\x970', b'\x971',
+    b'\x971', b'\x971', b'\x971', b'\x972', b'\x972', b'\x972', b'\x972', b'\x97a', b'\x97a',
+    b'\x97a', b'\x97a', b'\x97c', b'\x97c', b'\x97c', b'\x97c', b'\x97e', b'\x97e', b'\x97e',
+    b'\x97e', b'\x97i', b'\x97i', b'\x97i', b'\x97i', b'\x97o', b'\x97o', b'\x97o', b'\x97o',
+    b'\x97s', b'\x97s', b'\x97s', b'\x97s', b'\x97t', b'\x97t', b'\x97t', b'\x97t', b'\x97 ',
+    b'\x97 ', b'\x97%', b'\x97%', b'\x97-', b'\x97-', b'\x97.', b'\x97.', b'\x97/', b'\x97/',
+    b'\x973', b'\x973', b'\x974', b'\x974', b'\x975', b'\x975', b'\x976', b'\x976', b'\x977',
+    b'\x977', b'\x978', b'\x978', b'\x979', b'\x979', b'\x97=', b'\x97=', b'\x97A', b'\x97A',
+    b'\x97_', b'\x97_', b'\x97b', b'\x97b', b'\x97d', b'\x97d', b'\x97f', b'\x97f', b'\x97g',
+    b'\x97g', b'\x97h', b'\x97h', b'\x97l', b'\x97l', b'\x97m', b'\x97m', b'\x97n', b'\x97n',
+    b'\x97p', b'\x97p', b'\x97r', b'\x97r', b'\x97u', b'\x97u', b'\x97:', b'\x97B', b'\x97C',
+    b'\x97D', b'\x97E', b'\x97F', b'\x97G', b'\x97H', b'\x97I', b'\x97J', b'\x97K', b'\x97L',
+    b'\x97M', b'\x97N', b'\x97O', b'\x97P', b'\x97Q', b'\x97R', b'\x97S', b'\x97T', b'\x97U',
+    b'\x97V', b'\x97W', b'\x97Y', b'\x97j', b'\x97k', b'\x97q', b'\x97v', b'\x97w', b'\x97x',
+    b'\x97y', b'\x97z', b'\x97', b'\x97', b'\x97', b'\x97', b'\x980', b'\x980', b'\x981', b'\x981',
+    b'\x982', b'\x982', b'\x98a', b'\x98a', b'\x98c', b'\x98c', b'\x98e', b'\x98e', b'\x98i',
+    b'\x98i', b'\x98o', b'\x98o', b'\x98s', b'\x98s', b'\x98t', b'\x98t', b'\x98 ', b'\x98%',
+    b'\x98-', b'\x98.', b'\x98/', b'\x983', b'\x984', b'\x985', b'\x986', b'\x987', b'\x988',
+    b'\x989', b'\x98=', b'\x98A', b'\x98_', b'\x98b', b'\x98d', b'\x98f', b'\x98g', b'\x98h',
+    b'\x98l', b'\x98m', b'\x98n', b'\x98p', b'\x98r', b'\x98u', b'\x98', b'\x98', b'\x98', b'\x98',
+    b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98', b'\x98',
+    b'\x98', b'\x98', b'\x98', b'\x98', b'\x9b0', b'\x9b0', b'\x9b1', b'\x9b1', b'\x9b2', b'\x9b2',
+    b'\x9ba', b'\x9ba', b'\x9bc', b'\x9bc', b'\x9be', b'\x9be', b'\x9bi', b'\x9bi', b'\x9bo',
+    b'\x9bo', b'\x9bs', b'\x9bs', b'\x9bt', b'\x9bt', b'\x9b ', b'\x9b%', b'\x9b-', b'\x9b.',
+    b'\x9b/', b'\x9b3', b'\x9b4', b'\x9b5', b'\x9b6', b'\x9b7', b'\x9b8', b'\x9b9', b'\x9b=',
+    b'\x9bA', b'\x9b_', b'\x9bb', b'\x9bd', b'\x9bf', b'\x9bg', b'\x9bh', b'\x9bl', b'\x9bm',
+    b'\x9bn', b'\x9bp', b'\x9br', b'\x9bu', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9d0', b'\x9d0', b'\x9d1', b'\x9d1', b'\x9d2', b'\x9d2', b'\x9da',
+    b'\x9da', b'\x9dc', b'\x9dc', b'\x9de', b'\x9de', b'\x9di', b'\x9di', b'\x9do', b'\x9do',
+    b'\x9ds', b'\x9ds', b'\x9dt', b'\x9dt', b'\x9d ', b'\x9d%', b'\x9d-', b'\x9d.', b'\x9d/',
+    b'\x9d3', b'\x9d4', b'\x9d5', b'\x9d6', b'\x9d7', b'\x9d8', b'\x9d9', b'\x9d=', b'\x9dA',
+    b'\x9d_', b'\x9db', b'\x9dd', b'\x9df', b'\x9dg', b'\x9dh', b'\x9dl', b'\x9dm', b'\x9dn',
+    b'\x9dp', b'\x9dr', b'\x9du', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d', b'\x9d',
+    b'\x9d', b'\x9e0', b'\x9e0', b'\x9e1', b'\x9e1', b'\x9e2', b'\x9e2', b'\x9ea', b'\x9ea',
+    b'\x9ec', b'\x9ec', b'\x9ee', b'\x9ee', b'\x9ei', b'\x9ei', b'\x9eo', b'\x9eo', b'\x9es',
+    b'\x9es', b'\x9et', b'\x9et', b'\x9e ', b'\x9e%', b'\x9e-', b'\x9e.', b'\x9e/', b'\x9e3',
+    b'\x9e4', b'\x9e5', b'\x9e6', b'\x9e7', b'\x9e8', b'\x9e9', b'\x9e=', b'\x9eA', b'\x9e_',
+    b'\x9eb', b'\x9ed', b'\x9ef', b'\x9eg', b'\x9eh', b'\x9el', b'\x9em', b'\x9en', b'\x9ep',
+    b'\x9er', b'\x9eu', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e',
+    b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\x9e',
+    b'\x980', b'\x980', b'\x980', b'\x980', b'\x981', b'\x981', b'\x981', b'\x981', b'\x982',
+    b'\x982', b'\x982', b'\x982', b'\x98a', b'\x98a', b'\x98a', b'\x98a', b'\x98c', b'\x98c',
+    b'\x98c', b'\x98c', b'\x98e', b'\x98e', b'\x98e', b'\x98e', b'\x98i', b'\x98i', b'\x98i',
+    b'\x98i', b'\x98o', b'\x98o', b'\x98o', b'\x98o', b'\x98s', b'\x98s', b'\x98s', b'\x98s',
+    b'\x98t', b'\x98t', b'\x98t', b'\x98t', b'\x98 ', b'\x98 ', b'\x98%', b'\x98%', b'\x98-',
+    b'\x98-', b'\x98.', b'\x98.', b'\x98/', b'\x98/', b'\x983', b'\x983', b'\x984', b'\x984',
+    b'\x985', b'\x985', b'\x986', b'\x986', b'\x987', b'\x987', b'\x988', b'\x988', b'\x989',
+    b'\x989', b'\x98=', b'\x98=', b'\x98A', b'\x98A', b'\x98_', b'\x98_', b'\x98b', b'\x98b',
+    b'\x98d', b'\x98d', b'\x98f', b'\x98f', b'\x98g', b'\x98g', b'\x98h', b'\x98h', b'\x98l',
+    b'\x98l', b'\x98m', b'\x98m', b'\x98n', b'\x98n', b'\x98p', b'\x98p', b'\x98r', b'\x98r',
+    b'\x98u', b'\x98u', b'\x98:', b'\x98B', b'\x98C', b'\x98D', b'\x98E', b'\x98F', b'\x98G',
+    b'\x98H', b'\x98I', b'\x98J', b'\x98K', b'\x98L', b'\x98M', b'\x98N', b'\x98O', b'\x98P',
+    b'\x98Q', b'\x98R', b'\x98S', b'\x98T', b'\x98U', b'\x98V', b'\x98W', b'\x98Y', b'\x98j',
+    b'\x98k', b'\x98q', b'\x98v', b'\x98w', b'\x98x', b'\x98y', b'\x98z', b'\x98', b'\x98', b'\x98',
+    b'\x98', b'\x9b0', b'\x9b0', b'\x9b0', b'\x9b0', b'\x9b1', b'\x9b1', b'\x9b1', b'\x9b1',
+    b'\x9b2', b'\x9b2', b'\x9b2', b'\x9b2', b'\x9ba', b'\x9ba', b'\x9ba', b'\x9ba', b'\x9bc',
+    b'\x9bc', b'\x9bc', b'\x9bc', b'\x9be', b'\x9be', b'\x9be', b'\x9be', b'\x9bi', b'\x9bi',
+    b'\x9bi', b'\x9bi', b'\x9bo', b'\x9bo', b'\x9bo', b'\x9bo', b'\x9bs', b'\x9bs', b'\x9bs',
+    b'\x9bs', b'\x9bt', b'\x9bt', b'\x9bt', b'\x9bt', b'\x9b ', b'\x9b ', b'\x9b%', b'\x9b%',
+    b'\x9b-', b'\x9b-', b'\x9b.', b'\x9b.', b'\x9b/', b'\x9b/', b'\x9b3', b'\x9b3', b'\x9b4',
+    b'\x9b4', b'\x9b5', b'\x9b5', b'\x9b6', b'\x9b6', b'\x9b7', b'\x9b7', b'\x9b8', b'\x9b8',
+    b'\x9b9', b'\x9b9', b'\x9b=', b'\x9b=', b'\x9bA', b'\x9bA', b'\x9b_', b'\x9b_', b'\x9bb',
+    b'\x9bb', b'\x9bd', b'\x9bd', b'\x9bf', b'\x9bf', b'\x9bg', b'\x9bg', b'\x9bh', b'\x9bh',
+    b'\x9bl', b'\x9bl', b'\x9bm', b'\x9bm', b'\x9bn', b'\x9bn', b'\x9bp', b'\x9bp', b'\x9br',
+    b'\x9br', b'\x9bu', b'\x9bu', b'\x9b:', b'\x9bB', b'\x9bC', b'\x9bD', b'\x9bE', b'\x9bF',
+    b'\x9bG', b'\x9bH', b'\x9bI', b'\x9bJ', b'\x9bK', b'\x9bL', b'\x9bM', b'\x9bN', b'\x9bO',
+    b'\x9bP', b'\x9bQ', b'\x9bR', b'\x9bS', b'\x9bT', b'\x9bU', b'\x9bV', b'\x9bW', b'\x9bY',
+    b'\x9bj', b'\x9bk', b'\x9bq', b'\x9bv', b'\x9bw', b'\x9bx', b'\x9by', b'\x9bz', b'\x9b',
+    b'\x9b', b'\x9b', b'\x9b', b'\xe00', b'\xe00', b'\xe01', b'\xe01', b'\xe02', b'\xe02', b'\xe0a',
+    b'\xe0a', b'\xe0c', b'\xe0c', b'\xe0e', b'\xe0e', b'\xe0i', b'\xe0i', b'\xe0o', b'\xe0o',
+    b'\xe0s', b'\xe0s', b'\xe0t', b'\xe0t', b'\xe0 ', b'\xe0%', b'\xe0-', b'\xe0.', b'\xe0/',
+    b'\xe03', b'\xe04', b'\xe05', b'\xe06', b'\xe07', b'\xe08', b'\xe09', b'\xe0=', b'\xe0A',
+    b'\xe0_', b'\xe0b', b'\xe0d', b'\xe0f', b'\xe0g', b'\xe0h', b'\xe0l', b'\xe0m', b'\xe0n',
+    b'\xe0p', b'\xe0r', b'\xe0u', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe0',
+    b'\xe0', b'\xe20', b'\xe20', b'\xe21', b'\xe21', b'\xe22', b'\xe22', b'\xe2a', b'\xe2a',
+    b'\xe2c', b'\xe2c', b'\xe2e', b'\xe2e', b'\xe2i', b'\xe2i', b'\xe2o', b'\xe2o', b'\xe2s',
+    b'\xe2s', b'\xe2t', b'\xe2t', b'\xe2 ', b'\xe2%', b'\xe2-', b'\xe2.', b'\xe2/', b'\xe23',
+    b'\xe24', b'\xe25', b'\xe26', b'\xe27', b'\xe28', b'\xe29', b'\xe2=', b'\xe2A', b'\xe2_',
+    b'\xe2b', b'\xe2d', b'\xe2f', b'\xe2g', b'\xe2h', b'\xe2l', b'\xe2m', b'\xe2n', b'\xe2p',
+    b'\xe2r', b'\xe2u', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe2',
+    b'\x990', b'\x991', b'\x992', b'\x99a', b'\x99c', b'\x99e', b'\x99i', b'\x99o', b'\x99s',
+    b'\x99t', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99',
+    b'\x99', b'\x99', b'\x99', b'\xa10', b'\xa11', b'\xa12', b'\xa1a', b'\xa1c', b'\xa1e', b'\xa1i',
+    b'\xa1o', b'\xa1s', b'\xa1t', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1',
+    b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1',
+    b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa70', b'\xa71', b'\xa72', b'\xa7a', b'\xa7c',
+    b'\xa7e', b'\xa7i', b'\xa7o', b'\xa7s', b'\xa7t', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xac0', b'\xac1', b'\xac2',
+    b'\xaca', b'\xacc', b'\xace', b'\xaci', b'\xaco', b'\xacs', b'\xact', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\x990',
+    b'\x990', b'\x991', b'\x991', b'\x992', b'\x992', b'\x99a', b'\x99a', b'\x99c', b'\x99c',
+    b'\x99e', b'\x99e', b'\x99i', b'\x99i', b'\x99o', b'\x99o', b'\x99s', b'\x99s', b'\x99t',
+    b'\x99t', b'\x99 ', b'\x99%', b'\x99-', b'\x99.', b'\x99/', b'\x993', b'\x994', b'\x995',
+    b'\x996', b'\x997', b'\x998', b'\x999', b'\x99=', b'\x99A', b'\x99_', b'\x99b', b'\x99d',
+    b'\x99f', b'\x99g', b'\x99h', b'\x99l', b'\x99m', b'\x99n', b'\x99p', b'\x99r', b'\x99u',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\x99', b'\xa10', b'\xa10',
+    b'\xa11', b'\xa11', b'\xa12', b'\xa12', b'\xa1a', b'\xa1a', b'\xa1c', b'\xa1c', b'\xa1e',
+    b'\xa1e', b'\xa1i', b'\xa1i', b'\xa1o', b'\xa1o', b'\xa1s', b'\xa1s', b'\xa1t', b'\xa1t',
+    b'\xa1 ', b'\xa1%', b'\xa1-', b'\xa1.', b'\xa1/', b'\xa13', b'\xa14', b'\xa15', b'\xa16',
+    b'\xa17', b'\xa18', b'\xa19', b'\xa1=', b'\xa1A', b'\xa1_', b'\xa1b', b'\xa1d', b'\xa1f',
+    b'\xa1g', b'\xa1h', b'\xa1l', b'\xa1m', b'\xa1n', b'\xa1p', b'\xa1r', b'\xa1u', b'\xa1',
+    b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1',
+    b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\xa70', b'\xa70', b'\xa71',
+    b'\xa71', b'\xa72', b'\xa72', b'\xa7a', b'\xa7a', b'\xa7c', b'\xa7c', b'\xa7e', b'\xa7e',
+    b'\xa7i', b'\xa7i', b'\xa7o', b'\xa7o', b'\xa7s', b'\xa7s', b'\xa7t', b'\xa7t', b'\xa7 ',
+    b'\xa7%', b'\xa7-', b'\xa7.', b'\xa7/', b'\xa73', b'\xa74', b'\xa75', b'\xa76', b'\xa77',
+    b'\xa78', b'\xa79', b'\xa7=', b'\xa7A', b'\xa7_', b'\xa7b', b'\xa7d', b'\xa7f', b'\xa7g',
+    b'\xa7h', b'\xa7l', b'\xa7m', b'\xa7n', b'\xa7p', b'\xa7r', b'\xa7u', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xa7', b'\xac0', b'\xac0', b'\xac1', b'\xac1', b'\xac2',
+    b'\xac2', b'\xaca', b'\xaca', b'\xacc', b'\xacc', b'\xace', b'\xace', b'\xaci', b'\xaci',
+    b'\xaco', b'\xaco', b'\xacs', b'\xacs', b'\xact', b'\xact', b'\xac ', b'\xac%', b'\xac-',
+    b'\xac.', b'\xac/', b'\xac3', b'\xac4', b'\xac5', b'\xac6', b'\xac7', b'\xac8', b'\xac9',
+    b'\xac=', b'\xacA', b'\xac_', b'\xacb', b'\xacd', b'\xacf', b'\xacg', b'\xach', b'\xacl',
+    b'\xacm', b'\xacn', b'\xacp', b'\xacr', b'\xacu', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac', b'\xac',
+    b'\xac', b'\xac', b'\xac', b'\x990', b'\x990', b'\x990', b'\x990', b'\x991', b'\x991', b'\x991',
+    b'\x991', b'\x992', b'\x992', b'\x992', b'\x992', b'\x99a', b'\x99a', b'\x99a', b'\x99a',
+    b'\x99c', b'\x99c', b'\x99c', b'\x99c', b'\x99e', b'\x99e', b'\x99e', b'\x99e', b'\x99i',
+    b'\x99i', b'\x99i', b'\x99i', b'\x99o', b'\x99o', b'\x99o', b'\x99o', b'\x99s', b'\x99s',
+    b'\x99s', b'\x99s', b'\x99t', b'\x99t', b'\x99t', b'\x99t', b'\x99 ', b'\x99 ', b'\x99%',
+    b'\x99%', b'\x99-', b'\x99-', b'\x99.', b'\x99.', b'\x99/', b'\x99/', b'\x993', b'\x993',
+    b'\x994', b'\x994', b'\x995', b'\x995', b'\x996', b'\x996', b'\x997', b'\x997', b'\x998',
+    b'\x998', b'\x999', b'\x999', b'\x99=', b'\x99=', b'\x99A', b'\x99A', b'\x99_', b'\x99_',
+    b'\x99b', b'\x99b', b'\x99d', b'\x99d', b'\x99f', b'\x99f', b'\x99g', b'\x99g', b'\x99h',
+    b'\x99h', b'\x99l', b'\x99l', b'\x99m', b'\x99m', b'\x99n', b'\x99n', b'\x99p', b'\x99p',
+    b'\x99r', b'\x99r', b'\x99u', b'\x99u', b'\x99:', b'\x99B', b'\x99C', b'\x99D', b'\x99E',
+    b'\x99F', b'\x99G', b'\x99H', b'\x99I', b'\x99J', b'\x99K', b'\x99L', b'\x99M', b'\x99N',
+    b'\x99O', b'\x99P', b'\x99Q', b'\x99R', b'\x99S', b'\x99T', b'\x99U', b'\x99V', b'\x99W',
+    b'\x99Y', b'\x99j', b'\x99k', b'\x99q', b'\x99v', b'\x99w', b'\x99x', b'\x99y', b'\x99z',
+    b'\x99', b'\x99', b'\x99', b'\x99', b'\xa10', b'\xa10', b'\xa10', b'\xa10', b'\xa11', b'\xa11',
+    b'\xa11', b'\xa11', b'\xa12', b'\xa12', b'\xa12', b'\xa12', b'\xa1a', b'\xa1a', b'\xa1a',
+    b'\xa1a', b'\xa1c', b'\xa1c', b'\xa1c', b'\xa1c', b'\xa1e', b'\xa1e', b'\xa1e', b'\xa1e',
+    b'\xa1i', b'\xa1i', b'\xa1i', b'\xa1i', b'\xa1o', b'\xa1o', b'\xa1o', b'\xa1o', b'\xa1s',
+    b'\xa1s', b'\xa1s', b'\xa1s', b'\xa1t', b'\xa1t', b'\xa1t', b'\xa1t', b'\xa1 ', b'\xa1 ',
+    b'\xa1%', b'\xa1%', b'\xa1-', b'\xa1-', b'\xa1.', b'\xa1.', b'\xa1/', b'\xa1/', b'\xa13',
+    b'\xa13', b'\xa14', b'\xa14', b'\xa15', b'\xa15', b'\xa16', b'\xa16', b'\xa17', b'\xa17',
+    b'\xa18', b'\xa18', b'\xa19', b'\xa19', b'\xa1=', b'\xa1=', b'\xa1A', b'\xa1A', b'\xa1_',
+    b'\xa1_', b'\xa1b', b'\xa1b', b'\xa1d', b'\xa1d', b'\xa1f', b'\xa1f', b'\xa1g', b'\xa1g',
+    b'\xa1h', b'\xa1h', b'\xa1l', b'\xa1l', b'\xa1m', b'\xa1m', b'\xa1n', b'\xa1n', b'\xa1p',
+    b'\xa1p', b'\xa1r', b'\xa1r', b'\xa1u', b'\xa1u', b'\xa1:', b'\xa1B', b'\xa1C', b'\xa1D',
+    b'\xa1E', b'\xa1F', b'\xa1G', b'\xa1H', b'\xa1I', b'\xa1J', b'\xa1K', b'\xa1L', b'\xa1M',
+    b'\xa1N', b'\xa1O', b'\xa1P', b'\xa1Q', b'\xa1R', b'\xa1S', b'\xa1T', b'\xa1U', b'\xa1V',
+    b'\xa1W', b'\xa1Y', b'\xa1j', b'\xa1k', b'\xa1q', b'\xa1v', b'\xa1w', b'\xa1x', b'\xa1y',
+    b'\xa1z', b'\xa1', b'\xa1', b'\xa1', b'\xa1', b'\x9a0', b'\x9a1', b'\x9a2', b'\x9aa', b'\x9ac',
+    b'\x9ae', b'\x9ai', b'\x9ao', b'\x9as', b'\x9at', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9c0', b'\x9c1', b'\x9c2',
+    b'\x9ca', b'\x9cc', b'\x9ce', b'\x9ci', b'\x9co', b'\x9cs', b'\x9ct', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\xa00',
+    b'\xa01', b'\xa02', b'\xa0a', b'\xa0c', b'\xa0e', b'\xa0i', b'\xa0o', b'\xa0s', b'\xa0t',
+    b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0',
+    b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0',
+    b'\xa0', b'\xa0', b'\xa30', b'\xa31', b'\xa32', b'\xa3a', b'\xa3c', b'\xa3e', b'\xa3i',
+    b'\xa3o', b'\xa3s', b'\xa3t', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3',
+    b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3',
+    b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa40', b'\xa41', b'\xa42', b'\xa4a', b'\xa4c',
+    b'\xa4e', b'\xa4i', b'\xa4o', b'\xa4s', b'\xa4t', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa90', b'\xa91', b'\xa92',
+    b'\xa9a', b'\xa9c', b'\xa9e', b'\xa9i', b'\xa9o', b'\xa9s', b'\xa9t', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xaa0',
+    b'\xaa1', b'\xaa2', b'\xaaa', b'\xaac', b'\xaae', b'\xaai', b'\xaao', b'\xaas', b'\xaat',
+    b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xaa', b'\xad0', b'\xad1', b'\xad2', b'\xada', b'\xadc', b'\xade', b'\xadi',
+    b'\xado', b'\xads', b'\xadt', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad',
+    b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad',
+    b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\x9a0', b'\x9a0', b'\x9a1', b'\x9a1', b'\x9a2',
+    b'\x9a2', b'\x9aa', b'\x9aa', b'\x9ac', b'\x9ac', b'\x9ae', b'\x9ae', b'\x9ai', b'\x9ai',
+    b'\x9ao', b'\x9ao', b'\x9as', b'\x9as', b'\x9at', b'\x9at', b'\x9a ', b'\x9a%', b'\x9a-',
+    b'\x9a.', b'\x9a/', b'\x9a3', b'\x9a4', b'\x9a5', b'\x9a6', b'\x9a7', b'\x9a8', b'\x9a9',
+    b'\x9a=', b'\x9aA', b'\x9a_', b'\x9ab', b'\x9ad', b'\x9af', b'\x9ag', b'\x9ah', b'\x9al',
+    b'\x9am', b'\x9an', b'\x9ap', b'\x9ar', b'\x9au', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9a', b'\x9a', b'\x9a', b'\x9c0', b'\x9c0', b'\x9c1', b'\x9c1', b'\x9c2', b'\x9c2', b'\x9ca',
+    b'\x9ca', b'\x9cc', b'\x9cc', b'\x9ce', b'\x9ce', b'\x9ci', b'\x9ci', b'\x9co', b'\x9co',
+    b'\x9cs', b'\x9cs', b'\x9ct', b'\x9ct', b'\x9c ', b'\x9c%', b'\x9c-', b'\x9c.', b'\x9c/',
+    b'\x9c3', b'\x9c4', b'\x9c5', b'\x9c6', b'\x9c7', b'\x9c8', b'\x9c9', b'\x9c=', b'\x9cA',
+    b'\x9c_', b'\x9cb', b'\x9cd', b'\x9cf', b'\x9cg', b'\x9ch', b'\x9cl', b'\x9cm', b'\x9cn',
+    b'\x9cp', b'\x9cr', b'\x9cu', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\xa00', b'\xa00', b'\xa01', b'\xa01', b'\xa02', b'\xa02', b'\xa0a', b'\xa0a',
+    b'\xa0c', b'\xa0c', b'\xa0e', b'\xa0e', b'\xa0i', b'\xa0i', b'\xa0o', b'\xa0o', b'\xa0s',
+    b'\xa0s', b'\xa0t', b'\xa0t', b'\xa0 ', b'\xa0%', b'\xa0-', b'\xa0.', b'\xa0/', b'\xa03',
+    b'\xa04', b'\xa05', b'\xa06', b'\xa07', b'\xa08', b'\xa09', b'\xa0=', b'\xa0A', b'\xa0_',
+    b'\xa0b', b'\xa0d', b'\xa0f', b'\xa0g', b'\xa0h', b'\xa0l', b'\xa0m', b'\xa0n', b'\xa0p',
+    b'\xa0r', b'\xa0u', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0',
+    b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa0',
+    b'\xa30', b'\xa30', b'\xa31', b'\xa31', b'\xa32', b'\xa32', b'\xa3a', b'\xa3a', b'\xa3c',
+    b'\xa3c', b'\xa3e', b'\xa3e', b'\xa3i', b'\xa3i', b'\xa3o', b'\xa3o', b'\xa3s', b'\xa3s',
+    b'\xa3t', b'\xa3t', b'\xa3 ', b'\xa3%', b'\xa3-', b'\xa3.', b'\xa3/', b'\xa33', b'\xa34',
+    b'\xa35', b'\xa36', b'\xa37', b'\xa38', b'\xa39', b'\xa3=', b'\xa3A', b'\xa3_', b'\xa3b',
+    b'\xa3d', b'\xa3f', b'\xa3g', b'\xa3h', b'\xa3l', b'\xa3m', b'\xa3n', b'\xa3p', b'\xa3r',
+    b'\xa3u', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3',
+    b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\x9a0',
+    b'\x9a0', b'\x9a0', b'\x9a0', b'\x9a1', b'\x9a1', b'\x9a1', b'\x9a1', b'\x9a2', b'\x9a2',
+    b'\x9a2', b'\x9a2', b'\x9aa', b'\x9aa', b'\x9aa', b'\x9aa', b'\x9ac', b'\x9ac', b'\x9ac',
+    b'\x9ac', b'\x9ae', b'\x9ae', b'\x9ae', b'\x9ae', b'\x9ai', b'\x9ai', b'\x9ai', b'\x9ai',
+    b'\x9ao', b'\x9ao', b'\x9ao', b'\x9ao', b'\x9as', b'\x9as', b'\x9as', b'\x9as', b'\x9at',
+    b'\x9at', b'\x9at', b'\x9at', b'\x9a ', b'\x9a ', b'\x9a%', b'\x9a%', b'\x9a-', b'\x9a-',
+    b'\x9a.', b'\x9a.', b'\x9a/', b'\x9a/', b'\x9a3', b'\x9a3', b'\x9a4', b'\x9a4', b'\x9a5',
+    b'\x9a5', b'\x9a6', b'\x9a6', b'\x9a7', b'\x9a7', b'\x9a8', b'\x9a8', b'\x9a9', b'\x9a9',
+    b'\x9a=', b'\x9a=', b'\x9aA', b'\x9aA', b'\x9a_', b'\x9a_', b'\x9ab', b'\x9ab', b'\x9ad',
+    b'\x9ad', b'\x9af', b'\x9af', b'\x9ag', b'\x9ag', b'\x9ah', b'\x9ah', b'\x9al', b'\x9al',
+    b'\x9am', b'\x9am', b'\x9an', b'\x9an', b'\x9ap', b'\x9ap', b'\x9ar', b'\x9ar', b'\x9au',
+    b'\x9au', b'\x9a:', b'\x9aB', b'\x9aC', b'\x9aD', b'\x9aE', b'\x9aF', b'\x9aG', b'\x9aH',
+    b'\x9aI', b'\x9aJ', b'\x9aK', b'\x9aL', b'\x9aM', b'\x9aN', b'\x9aO', b'\x9aP', b'\x9aQ',
+    b'\x9aR', b'\x9aS', b'\x9aT', b'\x9aU', b'\x9aV', b'\x9aW', b'\x9aY', b'\x9aj', b'\x9ak',
+    b'\x9aq', b'\x9av', b'\x9aw', b'\x9ax', b'\x9ay', b'\x9az', b'\x9a', b'\x9a', b'\x9a', b'\x9a',
+    b'\x9c0', b'\x9c0', b'\x9c0', b'\x9c0', b'\x9c1', b'\x9c1', b'\x9c1', b'\x9c1', b'\x9c2',
+    b'\x9c2', b'\x9c2', b'\x9c2', b'\x9ca', b'\x9ca', b'\x9ca', b'\x9ca', b'\x9cc', b'\x9cc',
+    b'\x9cc', b'\x9cc', b'\x9ce', b'\x9ce', b'\x9ce', b'\x9ce', b'\x9ci', b'\x9ci', b'\x9ci',
+    b'\x9ci', b'\x9co', b'\x9co', b'\x9co', b'\x9co', b'\x9cs', b'\x9cs', b'\x9cs', b'\x9cs',
+    b'\x9ct', b'\x9ct', b'\x9ct', b'\x9ct', b'\x9c ', b'\x9c ', b'\x9c%', b'\x9c%', b'\x9c-',
+    b'\x9c-', b'\x9c.', b'\x9c.', b'\x9c/', b'\x9c/', b'\x9c3', b'\x9c3', b'\x9c4', b'\x9c4',
+    b'\x9c5', b'\x9c5', b'\x9c6', b'\x9c6', b'\x9c7', b'\x9c7', b'\x9c8', b'\x9c8', b'\x9c9',
+    b'\x9c9', b'\x9c=', b'\x9c=', b'\x9cA', b'\x9cA', b'\x9c_', b'\x9c_', b'\x9cb', b'\x9cb',
+    b'\x9cd', b'\x9cd', b'\x9cf', b'\x9cf', b'\x9cg', b'\x9cg', b'\x9ch', b'\x9ch', b'\x9cl',
+    b'\x9cl', b'\x9cm', b'\x9cm', b'\x9cn', b'\x9cn', b'\x9cp', b'\x9cp', b'\x9cr', b'\x9cr',
+    b'\x9cu', b'\x9cu', b'\x9c:', b'\x9cB', b'\x9cC', b'\x9cD', b'\x9cE', b'\x9cF', b'\x9cG',
+    b'\x9cH', b'\x9cI', b'\x9cJ', b'\x9cK', b'\x9cL', b'\x9cM', b'\x9cN', b'\x9cO', b'\x9cP',
+    b'\x9cQ', b'\x9cR', b'\x9cS', b'\x9cT', b'\x9cU', b'\x9cV', b'\x9cW', b'\x9cY', b'\x9cj',
+    b'\x9ck', b'\x9cq', b'\x9cv', b'\x9cw', b'\x9cx', b'\x9cy', b'\x9cz', b'\x9c', b'\x9c', b'\x9c',
+    b'\x9c', b'\x9d0', b'\x9d0', b'\x9d0', b'\x9d0', b'\x9d1', b'\x9d1', b'\x9d1', b'\x9d1',
+    b'\x9d2', b'\x9d2', b'\x9d2', b'\x9d2', b'\x9da', b'\x9da', b'\x9da', b'\x9da', b'\x9dc',
+    b'\x9dc', b'\x9dc', b'\x9dc', b'\x9de', b'\x9de', b'\x9de', b'\x9de', b'\x9di', b'\x9di',
+    b'\x9di', b'\x9di', b'\x9do', b'\x9do', b'\x9do', b'\x9do', b'\x9ds', b'\x9ds', b'\x9ds',
+    b'\x9ds', b'\x9dt', b'\x9dt', b'\x9dt', b'\x9dt', b'\x9d ', b'\x9d ', b'\x9d%', b'\x9d%',
+    b'\x9d-', b'\x9d-', b'\x9d.', b'\x9d.', b'\x9d/', b'\x9d/', b'\x9d3', b'\x9d3', b'\x9d4',
+    b'\x9d4', b'\x9d5', b'\x9d5', b'\x9d6', b'\x9d6', b'\x9d7', b'\x9d7', b'\x9d8', b'\x9d8',
+    b'\x9d9', b'\x9d9', b'\x9d=', b'\x9d=', b'\x9dA', b'\x9dA', b'\x9d_', b'\x9d_', b'\x9db',
+    b'\x9db', b'\x9dd', b'\x9dd', b'\x9df', b'\x9df', b'\x9dg', b'\x9dg', b'\x9dh', b'\x9dh',
+    b'\x9dl', b'\x9dl', b'\x9dm', b'\x9dm', b'\x9dn', b'\x9dn', b'\x9dp', b'\x9dp', b'\x9dr',
+    b'\x9dr', b'\x9du', b'\x9du', b'\x9d:', b'\x9dB', b'\x9dC', b'\x9dD', b'\x9dE', b'\x9dF',
+    b'\x9dG', b'\x9dH', b'\x9dI', b'\x9dJ', b'\x9dK', b'\x9dL', b'\x9dM', b'\x9dN', b'\x9dO',
+    b'\x9dP', b'\x9dQ', b'\x9dR', b'\x9dS', b'\x9dT', b'\x9dU', b'\x9dV', b'\x9dW', b'\x9dY',
+    b'\x9dj', b'\x9dk', b'\x9dq', b'\x9dv', b'\x9dw', b'\x9dx', b'\x9dy', b'\x9dz', b'\x9d',
+    b'\x9d', b'\x9d', b'\x9d', b'\x9e0', b'\x9e0', b'\x9e0', b'\x9e0', b'\x9e1', b'\x9e1', b'\x9e1',
+    b'\x9e1', b'\x9e2', b'\x9e2', b'\x9e2', b'\x9e2', b'\x9ea', b'\x9ea', b'\x9ea', b'\x9ea',
+    b'\x9ec', b'\x9ec', b'\x9ec', b'\x9ec', b'\x9ee', b'\x9ee', b'\x9ee', b'\x9ee', b'\x9ei',
+    b'\x9ei', b'\x9ei', b'\x9ei', b'\x9eo', b'\x9eo', b'\x9eo', b'\x9eo', b'\x9es', b'\x9es',
+    b'\x9es', b'\x9es', b'\x9et', b'\x9et', b'\x9et', b'\x9et', b'\x9e ', b'\x9e ', b'\x9e%',
+    b'\x9e%', b'\x9e-', b'\x9e-', b'\x9e.', b'\x9e.', b'\x9e/', b'\x9e/', b'\x9e3', b'\x9e3',
+    b'\x9e4', b'\x9e4', b'\x9e5', b'\x9e5', b'\x9e6', b'\x9e6', b'\x9e7', b'\x9e7', b'\x9e8',
+    b'\x9e8', b'\x9e9', b'\x9e9', b'\x9e=', b'\x9e=', b'\x9eA', b'\x9eA', b'\x9e_', b'\x9e_',
+    b'\x9eb', b'\x9eb', b'\x9ed', b'\x9ed', b'\x9ef', b'\x9ef', b'\x9eg', b'\x9eg', b'\x9eh',
+    b'\x9eh', b'\x9el', b'\x9el', b'\x9em', b'\x9em', b'\x9en', b'\x9en', b'\x9ep', b'\x9ep',
+    b'\x9er', b'\x9er', b'\x9eu', b'\x9eu', b'\x9e:', b'\x9eB', b'\x9eC', b'\x9eD', b'\x9eE',
+    b'\x9eF', b'\x9eG', b'\x9eH', b'\x9eI', b'\x9eJ', b'\x9eK', b'\x9eL', b'\x9eM', b'\x9eN',
+    b'\x9eO', b'\x9eP', b'\x9eQ', b'\x9eR', b'\x9eS', b'\x9eT', b'\x9eU', b'\x9eV', b'\x9eW',
+    b'\x9eY', b'\x9ej', b'\x9ek', b'\x9eq', b'\x9ev', b'\x9ew', b'\x9ex', b'\x9ey', b'\x9ez',
+    b'\x9e', b'\x9e', b'\x9e', b'\x9e', b'\xa00', b'\xa00', b'\xa00', b'\xa00', b'\xa01', b'\xa01',
+    b'\xa01', b'\xa01', b'\xa02', b'\xa02', b'\xa02', b'\xa02', b'\xa0a', b'\xa0a', b'\xa0a',
+    b'\xa0a', b'\xa0c', b'\xa0c', b'\xa0c', b'\xa0c', b'\xa0e', b'\xa0e', b'\xa0e', b'\xa0e',
+    b'\xa0i', b'\xa0i', b'\xa0i', b'\xa0i', b'\xa0o', b'\xa0o', b'\xa0o', b'\xa0o', b'\xa0s',
+    b'\xa0s', b'\xa0s', b'\xa0s', b'\xa0t', b'\xa0t', b'\xa0t', b'\xa0t', b'\xa0 ', b'\xa0 ',
+    b'\xa0%', b'\xa0%', b'\xa0-', b'\xa0-', b'\xa0.', b'\xa0.', b'\xa0/', b'\xa0/', b'\xa03',
+    b'\xa03', b'\xa04', b'\xa04', b'\xa05', b'\xa05', b'\xa06', b'\xa06', b'\xa07', b'\xa07',
+    b'\xa08', b'\xa08', b'\xa09', b'\xa09', b'\xa0=', b'\xa0=', b'\xa0A', b'\xa0A', b'\xa0_',
+    b'\xa0_', b'\xa0b', b'\xa0b', b'\xa0d', b'\xa0d', b'\xa0f', b'\xa0f', b'\xa0g', b'\xa0g',
+    b'\xa0h', b'\xa0h', b'\xa0l', b'\xa0l', b'\xa0m', b'\xa0m', b'\xa0n', b'\xa0n', b'\xa0p',
+    b'\xa0p', b'\xa0r', b'\xa0r', b'\xa0u', b'\xa0u', b'\xa0:', b'\xa0B', b'\xa0C', b'\xa0D',
+    b'\xa0E', b'\xa0F', b'\xa0G', b'\xa0H', b'\xa0I', b'\xa0J', b'\xa0K', b'\xa0L', b'\xa0M',
+    b'\xa0N', b'\xa0O', b'\xa0P', b'\xa0Q', b'\xa0R', b'\xa0S', b'\xa0T', b'\xa0U', b'\xa0V',
+    b'\xa0W', b'\xa0Y', b'\xa0j', b'\xa0k', b'\xa0q', b'\xa0v', b'\xa0w', b'\xa0x', b'\xa0y',
+    b'\xa0z', b'\xa0', b'\xa0', b'\xa0', b'\xa0', b'\xa30', b'\xa30', b'\xa30', b'\xa30', b'\xa31',
+    b'\xa31', b'\xa31', b'\xa31', b'\xa32', b'\xa32', b'\xa32', b'\xa32', b'\xa3a', b'\xa3a',
+    b'\xa3a', b'\xa3a', b'\xa3c', b'\xa3c', b'\xa3c', b'\xa3c', b'\xa3e', b'\xa3e', b'\xa3e',
+    b'\xa3e', b'\xa3i', b'\xa3i', b'\xa3i', b'\xa3i', b'\xa3o', b'\xa3o', b'\xa3o', b'\xa3o',
+    b'\xa3s', b'\xa3s', b'\xa3s', b'\xa3s', b'\xa3t', b'\xa3t', b'\xa3t', b'\xa3t', b'\xa3 ',
+    b'\xa3 ', b'\xa3%', b'\xa3%', b'\xa3-', b'\xa3-', b'\xa3.', b'\xa3.', b'\xa3/', b'\xa3/',
+    b'\xa33', b'\xa33', b'\xa34', b'\xa34', b'\xa35', b'\xa35', b'\xa36', b'\xa36', b'\xa37',
+    b'\xa37', b'\xa38', b'\xa38', b'\xa39', b'\xa39', b'\xa3=', b'\xa3=', b'\xa3A', b'\xa3A',
+    b'\xa3_', b'\xa3_', b'\xa3b', b'\xa3b', b'\xa3d', b'\xa3d', b'\xa3f', b'\xa3f', b'\xa3g',
+    b'\xa3g', b'\xa3h', b'\xa3h', b'\xa3l', b'\xa3l', b'\xa3m', b'\xa3m', b'\xa3n', b'\xa3n',
+    b'\xa3p', b'\xa3p', b'\xa3r', b'\xa3r', b'\xa3u', b'\xa3u', b'\xa3:', b'\xa3B', b'\xa3C',
+    b'\xa3D', b'\xa3E', b'\xa3F', b'\xa3G', b'\xa3H', b'\xa3I', b'\xa3J', b'\xa3K', b'\xa3L',
+    b'\xa3M', b'\xa3N', b'\xa3O', b'\xa3P', b'\xa3Q', b'\xa3R', b'\xa3S', b'\xa3T', b'\xa3U',
+    b'\xa3V', b'\xa3W', b'\xa3Y', b'\xa3j', b'\xa3k', b'\xa3q', b'\xa3v', b'\xa3w', b'\xa3x',
+    b'\xa3y', b'\xa3z', b'\xa3', b'\xa3', b'\xa3', b'\xa3', b'\xa40', b'\xa40', b'\xa41', b'\xa41',
+    b'\xa42', b'\xa42', b'\xa4a', b'\xa4a', b'\xa4c', b'\xa4c', b'\xa4e', b'\xa4e', b'\xa4i',
+    b'\xa4i', b'\xa4o', b'\xa4o', b'\xa4s', b'\xa4s', b'\xa4t', b'\xa4t', b'\xa4 ', b'\xa4%',
+    b'\xa4-', b'\xa4.', b'\xa4/', b'\xa43', b'\xa44', b'\xa45', b'\xa46', b'\xa47', b'\xa48',
+    b'\xa49', b'\xa4=', b'\xa4A', b'\xa4_', b'\xa4b', b'\xa4d', b'\xa4f', b'\xa4g', b'\xa4h',
+    b'\xa4l', b'\xa4m', b'\xa4n', b'\xa4p', b'\xa4r', b'\xa4u', b'\xa4', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa4', b'\xa4', b'\xa4', b'\xa4', b'\xa90', b'\xa90', b'\xa91', b'\xa91', b'\xa92', b'\xa92',
+    b'\xa9a', b'\xa9a', b'\xa9c', b'\xa9c', b'\xa9e', b'\xa9e', b'\xa9i', b'\xa9i', b'\xa9o',
+    b'\xa9o', b'\xa9s', b'\xa9s', b'\xa9t', b'\xa9t', b'\xa9 ', b'\xa9%', b'\xa9-', b'\xa9.',
+    b'\xa9/', b'\xa93', b'\xa94', b'\xa95', b'\xa96', b'\xa97', b'\xa98', b'\xa99', b'\xa9=',
+    b'\xa9A', b'\xa9_', b'\xa9b', b'\xa9d', b'\xa9f', b'\xa9g', b'\xa9h', b'\xa9l', b'\xa9m',
+    b'\xa9n', b'\xa9p', b'\xa9r', b'\xa9u', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9', b'\xa9',
+    b'\xa9', b'\xa9', b'\xaa0', b'\xaa0', b'\xaa1', b'\xaa1', b'\xaa2', b'\xaa2', b'\xaaa',
+    b'\xaaa', b'\xaac', b'\xaac', b'\xaae', b'\xaae', b'\xaai', b'\xaai', b'\xaao', b'\xaao',
+    b'\xaas', b'\xaas', b'\xaat', b'\xaat', b'\xaa ', b'\xaa%', b'\xaa-', b'\xaa.', b'\xaa/',
+    b'\xaa3', b'\xaa4', b'\xaa5', b'\xaa6', b'\xaa7', b'\xaa8', b'\xaa9', b'\xaa=', b'\xaaA',
+    b'\xaa_', b'\xaab', b'\xaad', b'\xaaf', b'\xaag', b'\xaah', b'\xaal', b'\xaam', b'\xaan',
+    b'\xaap', b'\xaar', b'\xaau', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xaa',
+    b'\xaa', b'\xad0', b'\xad0', b'\xad1', b'\xad1', b'\xad2', b'\xad2', b'\xada', b'\xada',
+    b'\xadc', b'\xadc', b'\xade', b'\xade', b'\xadi', b'\xadi', b'\xado', b'\xado', b'\xads',
+    b'\xads', b'\xadt', b'\xadt', b'\xad ', b'\xad%', b'\xad-', b'\xad.', b'\xad/', b'\xad3',
+    b'\xad4', b'\xad5', b'\xad6', b'\xad7', b'\xad8', b'\xad9', b'\xad=', b'\xadA', b'\xad_',
+    b'\xadb', b'\xadd', b'\xadf', b'\xadg', b'\xadh', b'\xadl', b'\xadm', b'\xadn', b'\xadp',
+    b'\xadr', b'\xadu', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad',
+    b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad', b'\xad',
+    b'\xa40', b'\xa40', b'\xa40', b'\xa40', b'\xa41', b'\xa41', b'\xa41', b'\xa41', b'\xa42',
+    b'\xa42', b'\xa42', b'\xa42', b'\xa4a', b'\xa4a', b'\xa4a', b'\xa4a', b'\xa4c', b'\xa4c',
+    b'\xa4c', b'\xa4c', b'\xa4e', b'\xa4e', b'\xa4e', b'\xa4e', b'\xa4i', b'\xa4i', b'\xa4i',
+    b'\xa4i', b'\xa4o', b'\xa4o', b'\xa4o', b'\xa4o', b'\xa4s', b'\xa4s', b'\xa4s', b'\xa4s',
+    b'\xa4t', b'\xa4t', b'\xa4t', b'\xa4t', b'\xa4 ', b'\xa4 ', b'\xa4%', b'\xa4%', b'\xa4-',
+    b'\xa4-', b'\xa4.', b'\xa4.', b'\xa4/', b'\xa4/', b'\xa43', b'\xa43', b'\xa44', b'\xa44',
+    b'\xa45', b'\xa45', b'\xa46', b'\xa46', b'\xa47', b'\xa47', b'\xa48', b'\xa48', b'\xa49',
+    b'\xa49', b'\xa4=', b'\xa4=', b'\xa4A', b'\xa4A', b'\xa4_', b'\xa4_', b'\xa4b', b'\xa4b',
+    b'\xa4d', b'\xa4d', b'\xa4f', b'\xa4f', b'\xa4g', b'\xa4g', b'\xa4h', b'\xa4h', b'\xa4l',
+    b'\xa4l', b'\xa4m', b'\xa4m', b'\xa4n', b'\xa4n', b'\xa4p', b'\xa4p', b'\xa4r', b'\xa4r',
+    b'\xa4u', b'\xa4u', b'\xa4:', b'\xa4B', b'\xa4C', b'\xa4D', b'\xa4E', b'\xa4F', b'\xa4G',
+    b'\xa4H', b'\xa4I', b'\xa4J', b'\xa4K', b'\xa4L', b'\xa4M', b'\xa4N', b'\xa4O', b'\xa4P',
+    b'\xa4Q', b'\xa4R', b'\xa4S', b'\xa4T', b'\xa4U', b'\xa4V', b'\xa4W', b'\xa4Y', b'\xa4j',
+    b'\xa4k', b'\xa4q', b'\xa4v', b'\xa4w', b'\xa4x', b'\xa4y', b'\xa4z', b'\xa4', b'\xa4', b'\xa4',
+    b'\xa4', b'\xa90', b'\xa90', b'\xa90', b'\xa90', b'\xa91', b'\xa91', b'\xa91', b'\xa91',
+    b'\xa92', b'\xa92', b'\xa92', b'\xa92', b'\xa9a', b'\xa9a', b'\xa9a', b'\xa9a', b'\xa9c',
+    b'\xa9c', b'\xa9c', b'\xa9c', b'\xa9e', b'\xa9e', b'\xa9e', b'\xa9e', b'\xa9i', b'\xa9i',
+    b'\xa9i', b'\xa9i', b'\xa9o', b'\xa9o', b'\xa9o', b'\xa9o', b'\xa9s', b'\xa9s', b'\xa9s',
+    b'\xa9s', b'\xa9t', b'\xa9t', b'\xa9t', b'\xa9t', b'\xa9 ', b'\xa9 ', b'\xa9%', b'\xa9%',
+    b'\xa9-', b'\xa9-', b'\xa9.', b'\xa9.', b'\xa9/', b'\xa9/', b'\xa93', b'\xa93', b'\xa94',
+    b'\xa94', b'\xa95', b'\xa95', b'\xa96', b'\xa96', b'\xa97', b'\xa97', b'\xa98', b'\xa98',
+    b'\xa99', b'\xa99', b'\xa9=', b'\xa9=', b'\xa9A', b'\xa9A', b'\xa9_', b'\xa9_', b'\xa9b',
+    b'\xa9b', b'\xa9d', b'\xa9d', b'\xa9f', b'\xa9f', b'\xa9g', b'\xa9g', b'\xa9h', b'\xa9h',
+    b'\xa9l', b'\xa9l', b'\xa9m', b'\xa9m', b'\xa9n', b'\xa9n', b'\xa9p', b'\xa9p', b'\xa9r',
+    b'\xa9r', b'\xa9u', b'\xa9u', b'\xa9:', b'\xa9B', b'\xa9C', b'\xa9D', b'\xa9E', b'\xa9F',
+    b'\xa9G', b'\xa9H', b'\xa9I', b'\xa9J', b'\xa9K', b'\xa9L', b'\xa9M', b'\xa9N', b'\xa9O',
+    b'\xa9P', b'\xa9Q', b'\xa9R', b'\xa9S', b'\xa9T', b'\xa9U', b'\xa9V', b'\xa9W', b'\xa9Y',
+    b'\xa9j', b'\xa9k', b'\xa9q', b'\xa9v', b'\xa9w', b'\xa9x', b'\xa9y', b'\xa9z', b'\xa9',
+    b'\xa9', b'\xa9', b'\xa9', b'\xa50', b'\xa51', b'\xa52', b'\xa5a', b'\xa5c', b'\xa5e', b'\xa5i',
+    b'\xa5o', b'\xa5s', b'\xa5t', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa60', b'\xa61', b'\xa62', b'\xa6a', b'\xa6c',
+    b'\xa6e', b'\xa6i', b'\xa6o', b'\xa6s', b'\xa6t', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa80', b'\xa81', b'\xa82',
+    b'\xa8a', b'\xa8c', b'\xa8e', b'\xa8i', b'\xa8o', b'\xa8s', b'\xa8t', b'\xa8', b'\xa8', b'\xa8',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xae0',
+    b'\xae1', b'\xae2', b'\xaea', b'\xaec', b'\xaee', b'\xaei', b'\xaeo', b'\xaes', b'\xaet',
+    b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae',
+    b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae',
+    b'\xae', b'\xae', b'\xaf0', b'\xaf1', b'\xaf2', b'\xafa', b'\xafc', b'\xafe', b'\xafi',
+    b'\xafo', b'\xafs', b'\xaft', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xb40', b'\xb41', b'\xb42', b'\xb4a', b'\xb4c',
+    b'\xb4e', b'\xb4i', b'\xb4o', b'\xb4s', b'\xb4t', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb60', b'\xb61', b'\xb62',
+    b'\xb6a', b'\xb6c', b'\xb6e', b'\xb6i', b'\xb6o', b'\xb6s', b'\xb6t', b'\xb6', b'\xb6', b'\xb6',
+    b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6',
+    b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb70',
+    b'\xb71', b'\xb72', b'\xb7a', b'\xb7c', b'\xb7e', b'\xb7i', b'\xb7o', b'\xb7s', b'\xb7t',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7',
+    b'\xb7', b'\xb7', b'\xa50', b'\xa50', b'\xa51', b'\xa51', b'\xa52', b'\xa52', b'\xa5a',
+    b'\xa5a', b'\xa5c', b'\xa5c', b'\xa5e', b'\xa5e', b'\xa5i', b'\xa5i', b'\xa5o', b'\xa5o',
+    b'\xa5s', b'\xa5s', b'\xa5t', b'\xa5t', b'\xa5 ', b'\xa5%', b'\xa5-', b'\xa5.', b'\xa5/',
+    b'\xa53', b'\xa54', b'\xa55', b'\xa56', b'\xa57', b'\xa58', b'\xa59', b'\xa5=', b'\xa5A',
+    b'\xa5_', b'\xa5b', b'\xa5d', b'\xa5f', b'\xa5g', b'\xa5h', b'\xa5l', b'\xa5m', b'\xa5n',
+    b'\xa5p', b'\xa5r', b'\xa5u', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa5',
+    b'\xa5', b'\xa60', b'\xa60', b'\xa61', b'\xa61', b'\xa62', b'\xa62', b'\xa6a', b'\xa6a',
+    b'\xa6c', b'\xa6c', b'\xa6e', b'\xa6e', b'\xa6i', b'\xa6i', b'\xa6o', b'\xa6o', b'\xa6s',
+    b'\xa6s', b'\xa6t', b'\xa6t', b'\xa6 ', b'\xa6%', b'\xa6-', b'\xa6.', b'\xa6/', b'\xa63',
+    b'\xa64', b'\xa65', b'\xa66', b'\xa67', b'\xa68', b'\xa69', b'\xa6=', b'\xa6A', b'\xa6_',
+    b'\xa6b', b'\xa6d', b'\xa6f', b'\xa6g', b'\xa6h', b'\xa6l', b'\xa6m', b'\xa6n', b'\xa6p',
+    b'\xa6r', b'\xa6u', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa80', b'\xa80', b'\xa81', b'\xa81', b'\xa82', b'\xa82', b'\xa8a', b'\xa8a', b'\xa8c',
+    b'\xa8c', b'\xa8e', b'\xa8e', b'\xa8i', b'\xa8i', b'\xa8o', b'\xa8o', b'\xa8s', b'\xa8s',
+    b'\xa8t', b'\xa8t', b'\xa8 ', b'\xa8%', b'\xa8-', b'\xa8.', b'\xa8/', b'\xa83', b'\xa84',
+    b'\xa85', b'\xa86', b'\xa87', b'\xa88', b'\xa89', b'\xa8=', b'\xa8A', b'\xa8_', b'\xa8b',
+    b'\xa8d', b'\xa8f', b'\xa8g', b'\xa8h', b'\xa8l', b'\xa8m', b'\xa8n', b'\xa8p', b'\xa8r',
+    b'\xa8u', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xae0',
+    b'\xae0', b'\xae1', b'\xae1', b'\xae2', b'\xae2', b'\xaea', b'\xaea', b'\xaec', b'\xaec',
+    b'\xaee', b'\xaee', b'\xaei', b'\xaei', b'\xaeo', b'\xaeo', b'\xaes', b'\xaes', b'\xaet',
+    b'\xaet', b'\xae ', b'\xae%', b'\xae-', b'\xae.', b'\xae/', b'\xae3', b'\xae4', b'\xae5',
+    b'\xae6', b'\xae7', b'\xae8', b'\xae9', b'\xae=', b'\xaeA', b'\xae_', b'\xaeb', b'\xaed',
+    b'\xaef', b'\xaeg', b'\xaeh', b'\xael', b'\xaem', b'\xaen', b'\xaep', b'\xaer', b'\xaeu',
+    b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae',
+    b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xae', b'\xa50', b'\xa50',
+    b'\xa50', b'\xa50', b'\xa51', b'\xa51', b'\xa51', b'\xa51', b'\xa52', b'\xa52', b'\xa52',
+    b'\xa52', b'\xa5a', b'\xa5a', b'\xa5a', b'\xa5a', b'\xa5c', b'\xa5c', b'\xa5c', b'\xa5c',
+    b'\xa5e', b'\xa5e', b'\xa5e', b'\xa5e', b'\xa5i', b'\xa5i', b'\xa5i', b'\xa5i', b'\xa5o',
+    b'\xa5o', b'\xa5o', b'\xa5o', b'\xa5s', b'\xa5s', b'\xa5s', b'\xa5s', b'\xa5t', b'\xa5t',
+    b'\xa5t', b'\xa5t', b'\xa5 ', b'\xa5 ', b'\xa5%', b'\xa5%', b'\xa5-', b'\xa5-', b'\xa5.',
+    b'\xa5.', b'\xa5/', b'\xa5/', b'\xa53', b'\xa53', b'\xa54', b'\xa54', b'\xa55', b'\xa55',
+    b'\xa56', b'\xa56', b'\xa57', b'\xa57', b'\xa58', b'\xa58', b'\xa59', b'\xa59', b'\xa5=',
+    b'\xa5=', b'\xa5A', b'\xa5A', b'\xa5_', b'\xa5_', b'\xa5b', b'\xa5b', b'\xa5d', b'\xa5d',
+    b'\xa5f', b'\xa5f', b'\xa5g', b'\xa5g', b'\xa5h', b'\xa5h', b'\xa5l', b'\xa5l', b'\xa5m',
+    b'\xa5m', b'\xa5n', b'\xa5n', b'\xa5p', b'\xa5p', b'\xa5r', b'\xa5r', b'\xa5u', b'\xa5u',
+    b'\xa5:', b'\xa5B', b'\xa5C', b'\xa5D', b'\xa5E', b'\xa5F', b'\xa5G', b'\xa5H', b'\xa5I',
+    b'\xa5J', b'\xa5K', b'\xa5L', b'\xa5M', b'\xa5N', b'\xa5O', b'\xa5P', b'\xa5Q', b'\xa5R',
+    b'\xa5S', b'\xa5T', b'\xa5U', b'\xa5V', b'\xa5W', b'\xa5Y', b'\xa5j', b'\xa5k', b'\xa5q',
+    b'\xa5v', b'\xa5w', b'\xa5x', b'\xa5y', b'\xa5z', b'\xa5', b'\xa5', b'\xa5', b'\xa5', b'\xa60',
+    b'\xa60', b'\xa60', b'\xa60', b'\xa61', b'\xa61', b'\xa61', b'\xa61', b'\xa62', b'\xa62',
+    b'\xa62', b'\xa62', b'\xa6a', b'\xa6a', b'\xa6a', b'\xa6a', b'\xa6c', b'\xa6c', b'\xa6c',
+    b'\xa6c', b'\xa6e', b'\xa6e', b'\xa6e', b'\xa6e', b'\xa6i', b'\xa6i', b'\xa6i', b'\xa6i',
+    b'\xa6o', b'\xa6o', b'\xa6o', b'\xa6o', b'\xa6s', b'\xa6s', b'\xa6s', b'\xa6s', b'\xa6t',
+    b'\xa6t', b'\xa6t', b'\xa6t', b'\xa6 ', b'\xa6 ', b'\xa6%', b'\xa6%', b'\xa6-', b'\xa6-',
+    b'\xa6.', b'\xa6.', b'\xa6/', b'\xa6/', b'\xa63', b'\xa63', b'\xa64', b'\xa64', b'\xa65',
+    b'\xa65', b'\xa66', b'\xa66', b'\xa67', b'\xa67', b'\xa68', b'\xa68', b'\xa69', b'\xa69',
+    b'\xa6=', b'\xa6=', b'\xa6A', b'\xa6A', b'\xa6_', b'\xa6_', b'\xa6b', b'\xa6b', b'\xa6d',
+    b'\xa6d', b'\xa6f', b'\xa6f', b'\xa6g', b'\xa6g', b'\xa6h', b'\xa6h', b'\xa6l', b'\xa6l',
+    b'\xa6m', b'\xa6m', b'\xa6n', b'\xa6n', b'\xa6p', b'\xa6p', b'\xa6r', b'\xa6r', b'\xa6u',
+    b'\xa6u', b'\xa6:', b'\xa6B', b'\xa6C', b'\xa6D', b'\xa6E', b'\xa6F', b'\xa6G', b'\xa6H',
+    b'\xa6I', b'\xa6J', b'\xa6K', b'\xa6L', b'\xa6M', b'\xa6N', b'\xa6O', b'\xa6P', b'\xa6Q',
+    b'\xa6R', b'\xa6S', b'\xa6T', b'\xa6U', b'\xa6V', b'\xa6W', b'\xa6Y', b'\xa6j', b'\xa6k',
+    b'\xa6q', b'\xa6v', b'\xa6w', b'\xa6x', b'\xa6y', b'\xa6z', b'\xa6', b'\xa6', b'\xa6', b'\xa6',
+    b'\xa70', b'\xa70', b'\xa70', b'\xa70', b'\xa71', b'\xa71', b'\xa71', b'\xa71', b'\xa72',
+    b'\xa72', b'\xa72', b'\xa72', b'\xa7a', b'\xa7a', b'\xa7a', b'\xa7a', b'\xa7c', b'\xa7c',
+    b'\xa7c', b'\xa7c', b'\xa7e', b'\xa7e', b'\xa7e', b'\xa7e', b'\xa7i', b'\xa7i', b'\xa7i',
+    b'\xa7i', b'\xa7o', b'\xa7o', b'\xa7o', b'\xa7o', b'\xa7s', b'\xa7s', b'\xa7s', b'\xa7s',
+    b'\xa7t', b'\xa7t', b'\xa7t', b'\xa7t', b'\xa7 ', b'\xa7 ', b'\xa7%', b'\xa7%', b'\xa7-',
+    b'\xa7-', b'\xa7.', b'\xa7.', b'\xa7/', b'\xa7/', b'\xa73', b'\xa73', b'\xa74', b'\xa74',
+    b'\xa75', b'\xa75', b'\xa76', b'\xa76', b'\xa77', b'\xa77', b'\xa78', b'\xa78', b'\xa79',
+    b'\xa79', b'\xa7=', b'\xa7=', b'\xa7A', b'\xa7A', b'\xa7_', b'\xa7_', b'\xa7b', b'\xa7b',
+    b'\xa7d', b'\xa7d', b'\xa7f', b'\xa7f', b'\xa7g', b'\xa7g', b'\xa7h', b'\xa7h', b'\xa7l',
+    b'\xa7l', b'\xa7m', b'\xa7m', b'\xa7n', b'\xa7n', b'\xa7p', b'\xa7p', b'\xa7r', b'\xa7r',
+    b'\xa7u', b'\xa7u', b'\xa7:', b'\xa7B', b'\xa7C', b'\xa7D', b'\xa7E', b'\xa7F', b'\xa7G',
+    b'\xa7H', b'\xa7I', b'\xa7J', b'\xa7K', b'\xa7L', b'\xa7M', b'\xa7N', b'\xa7O', b'\xa7P',
+    b'\xa7Q', b'\xa7R', b'\xa7S', b'\xa7T', b'\xa7U', b'\xa7V', b'\xa7W', b'\xa7Y', b'\xa7j',
+    b'\xa7k', b'\xa7q', b'\xa7v', b'\xa7w', b'\xa7x', b'\xa7y', b'\xa7z', b'\xa7', b'\xa7', b'\xa7',
+    b'\xa7', b'\xac0', b'\xac0', b'\xac0', b'\xac0', b'\xac1', b'\xac1', b'\xac1', b'\xac1',
+    b'\xac2', b'\xac2', b'\xac2', b'\xac2', b'\xaca', b'\xaca', b'\xaca', b'\xaca', b'\xacc',
+    b'\xacc', b'\xacc', b'\xacc', b'\xace', b'\xace', b'\xace', b'\xace', b'\xaci', b'\xaci',
+    b'\xaci', b'\xaci', b'\xaco', b'\xaco', b'\xaco', b'\xaco', b'\xacs', b'\xacs', b'\xacs',
+    b'\xacs', b'\xact', b'\xact', b'\xact', b'\xact', b'\xac ', b'\xac ', b'\xac%', b'\xac%',
+    b'\xac-', b'\xac-', b'\xac.', b'\xac.', b'\xac/', b'\xac/', b'\xac3', b'\xac3', b'\xac4',
+    b'\xac4', b'\xac5', b'\xac5', b'\xac6', b'\xac6', b'\xac7', b'\xac7', b'\xac8', b'\xac8',
+    b'\xac9', b'\xac9', b'\xac=', b'\xac=', b'\xacA', b'\xacA', b'\xac_', b'\xac_', b'\xacb',
+    b'\xacb', b'\xacd', b'\xacd', b'\xacf', b'\xacf', b'\xacg', b'\xacg', b'\xach', b'\xach',
+    b'\xacl', b'\xacl', b'\xacm', b'\xacm', b'\xacn', b'\xacn', b'\xacp', b'\xacp', b'\xacr',
+    b'\xacr', b'\xacu', b'\xacu', b'\xac:', b'\xacB', b'\xacC', b'\xacD', b'\xacE', b'\xacF',
+    b'\xacG', b'\xacH', b'\xacI', b'\xacJ', b'\xacK', b'\xacL', b'\xacM', b'\xacN', b'\xacO',
+    b'\xacP', b'\xacQ', b'\xacR', b'\xacS', b'\xacT', b'\xacU', b'\xacV', b'\xacW', b'\xacY',
+    b'\xacj', b'\xack', b'\xacq', b'\xacv', b'\xacw', b'\xacx', b'\xacy', b'\xacz', b'\xac',
+    b'\xac', b'\xac', b'\xac', b'\xa80', b'\xa80', b'\xa80', b'\xa80', b'\xa81', b'\xa81', b'\xa81',
+    b'\xa81', b'\xa82', b'\xa82', b'\xa82', b'\xa82', b'\xa8a', b'\xa8a', b'\xa8a', b'\xa8a',
+    b'\xa8c', b'\xa8c', b'\xa8c', b'\xa8c', b'\xa8e', b'\xa8e', b'\xa8e', b'\xa8e', b'\xa8i',
+    b'\xa8i', b'\xa8i', b'\xa8i', b'\xa8o', b'\xa8o', b'\xa8o', b'\xa8o', b'\xa8s', b'\xa8s',
+    b'\xa8s', b'\xa8s', b'\xa8t', b'\xa8t', b'\xa8t', b'\xa8t', b'\xa8 ', b'\xa8 ', b'\xa8%',
+    b'\xa8%', b'\xa8-', b'\xa8-', b'\xa8.', b'\xa8.', b'\xa8/', b'\xa8/', b'\xa83', b'\xa83',
+    b'\xa84', b'\xa84', b'\xa85', b'\xa85', b'\xa86', b'\xa86', b'\xa87', b'\xa87', b'\xa88',
+    b'\xa88', b'\xa89', b'\xa89', b'\xa8=', b'\xa8=', b'\xa8A', b'\xa8A', b'\xa8_', b'\xa8_',
+    b'\xa8b', b'\xa8b', b'\xa8d', b'\xa8d', b'\xa8f', b'\xa8f', b'\xa8g', b'\xa8g', b'\xa8h',
+    b'\xa8h', b'\xa8l', b'\xa8l', b'\xa8m', b'\xa8m', b'\xa8n', b'\xa8n', b'\xa8p', b'\xa8p',
+    b'\xa8r', b'\xa8r', b'\xa8u', b'\xa8u', b'\xa8:', b'\xa8B', b'\xa8C', b'\xa8D', b'\xa8E',
+    b'\xa8F', b'\xa8G', b'\xa8H', b'\xa8I', b'\xa8J', b'\xa8K', b'\xa8L', b'\xa8M', b'\xa8N',
+    b'\xa8O', b'\xa8P', b'\xa8Q', b'\xa8R', b'\xa8S', b'\xa8T', b'\xa8U', b'\xa8V', b'\xa8W',
+    b'\xa8Y', b'\xa8j', b'\xa8k', b'\xa8q', b'\xa8v', b'\xa8w', b'\xa8x', b'\xa8y', b'\xa8z',
+    b'\xa8', b'\xa8', b'\xa8', b'\xa8', b'\xae0', b'\xae0', b'\xae0', b'\xae0', b'\xae1', b'\xae1',
+    b'\xae1', b'\xae1', b'\xae2', b'\xae2', b'\xae2', b'\xae2', b'\xaea', b'\xaea', b'\xaea',
+    b'\xaea', b'\xaec', b'\xaec', b'\xaec', b'\xaec', b'\xaee', b'\xaee', b'\xaee', b'\xaee',
+    b'\xaei', b'\xaei', b'\xaei', b'\xaei', b'\xaeo', b'\xaeo', b'\xaeo', b'\xaeo', b'\xaes',
+    b'\xaes', b'\xaes', b'\xaes', b'\xaet', b'\xaet', b'\xaet', b'\xaet', b'\xae ', b'\xae ',
+    b'\xae%', b'\xae%', b'\xae-', b'\xae-', b'\xae.', b'\xae.', b'\xae/', b'\xae/', b'\xae3',
+    b'\xae3', b'\xae4', b'\xae4', b'\xae5', b'\xae5', b'\xae6', b'\xae6', b'\xae7', b'\xae7',
+    b'\xae8', b'\xae8', b'\xae9', b'\xae9', b'\xae=', b'\xae=', b'\xaeA', b'\xaeA', b'\xae_',
+    b'\xae_', b'\xaeb', b'\xaeb', b'\xaed', b'\xaed', b'\xaef', b'\xaef', b'\xaeg', b'\xaeg',
+    b'\xaeh', b'\xaeh', b'\xael', b'\xael', b'\xaem', b'\xaem', b'\xaen', b'\xaen', b'\xaep',
+    b'\xaep', b'\xaer', b'\xaer', b'\xaeu', b'\xaeu', b'\xae:', b'\xaeB', b'\xaeC', b'\xaeD',
+    b'\xaeE', b'\xaeF', b'\xaeG', b'\xaeH', b'\xaeI', b'\xaeJ', b'\xaeK', b'\xaeL', b'\xaeM',
+    b'\xaeN', b'\xaeO', b'\xaeP', b'\xaeQ', b'\xaeR', b'\xaeS', b'\xaeT', b'\xaeU', b'\xaeV',
+    b'\xaeW', b'\xaeY', b'\xaej', b'\xaek', b'\xaeq', b'\xaev', b'\xaew', b'\xaex', b'\xaey',
+    b'\xaez', b'\xae', b'\xae', b'\xae', b'\xae', b'\xaa0', b'\xaa0', b'\xaa0', b'\xaa0', b'\xaa1',
+    b'\xaa1', b'\xaa1', b'\xaa1', b'\xaa2', b'\xaa2', b'\xaa2', b'\xaa2', b'\xaaa', b'\xaaa',
+    b'\xaaa', b'\xaaa', b'\xaac', b'\xaac', b'\xaac', b'\xaac', b'\xaae', b'\xaae', b'\xaae',
+    b'\xaae', b'\xaai', b'\xaai', b'\xaai', b'\xaai', b'\xaao', b'\xaao', b'\xaao', b'\xaao',
+    b'\xaas', b'\xaas', b'\xaas', b'\xaas', b'\xaat', b'\xaat', b'\xaat', b'\xaat', b'\xaa ',
+    b'\xaa ', b'\xaa%', b'\xaa%', b'\xaa-', b'\xaa-', b'\xaa.', b'\xaa.', b'\xaa/', b'\xaa/',
+    b'\xaa3', b'\xaa3', b'\xaa4', b'\xaa4', b'\xaa5', b'\xaa5', b'\xaa6', b'\xaa6', b'\xaa7',
+    b'\xaa7', b'\xaa8', b'\xaa8', b'\xaa9', b'\xaa9', b'\xaa=', b'\xaa=', b'\xaaA', b'\xaaA',
+    b'\xaa_', b'\xaa_', b'\xaab', b'\xaab', b'\xaad', b'\xaad', b'\xaaf', b'\xaaf', b'\xaag',
+    b'\xaag', b'\xaah', b'\xaah', b'\xaal', b'\xaal', b'\xaam', b'\xaam', b'\xaan', b'\xaan',
+    b'\xaap', b'\xaap', b'\xaar', b'\xaar', b'\xaau', b'\xaau', b'\xaa:', b'\xaaB', b'\xaaC',
+    b'\xaaD', b'\xaaE', b'\xaaF', b'\xaaG', b'\xaaH', b'\xaaI', b'\xaaJ', b'\xaaK', b'\xaaL',
+    b'\xaaM', b'\xaaN', b'\xaaO', b'\xaaP', b'\xaaQ', b'\xaaR', b'\xaaS', b'\xaaT', b'\xaaU',
+    b'\xaaV', b'\xaaW', b'\xaaY', b'\xaaj', b'\xaak', b'\xaaq', b'\xaav', b'\xaaw', b'\xaax',
+    b'\xaay', b'\xaaz', b'\xaa', b'\xaa', b'\xaa', b'\xaa', b'\xad0', b'\xad0', b'\xad0', b'\xad0',
+    b'\xad1', b'\xad1', b'\xad1', b'\xad1', b'\xad2', b'\xad2', b'\xad2', b'\xad2', b'\xada',
+    b'\xada', b'\xada', b'\xada', b'\xadc', b'\xadc', b'\xadc', b'\xadc', b'\xade', b'\xade',
+    b'\xade', b'\xade', b'\xadi', b'\xadi', b'\xadi', b'\xadi', b'\xado', b'\xado', b'\xado',
+    b'\xado', b'\xads', b'\xads', b'\xads', b'\xads', b'\xadt', b'\xadt', b'\xadt', b'\xadt',
+    b'\xad ', b'\xad ', b'\xad%', b'\xad%', b'\xad-', b'\xad-', b'\xad.', b'\xad.', b'\xad/',
+    b'\xad/', b'\xad3', b'\xad3', b'\xad4', b'\xad4', b'\xad5', b'\xad5', b'\xad6', b'\xad6',
+    b'\xad7', b'\xad7', b'\xad8', b'\xad8', b'\xad9', b'\xad9', b'\xad=', b'\xad=', b'\xadA',
+    b'\xadA', b'\xad_', b'\xad_', b'\xadb', b'\xadb', b'\xadd', b'\xadd', b'\xadf', b'\xadf',
+    b'\xadg', b'\xadg', b'\xadh', b'\xadh', b'\xadl', b'\xadl', b'\xadm', b'\xadm', b'\xadn',
+    b'\xadn', b'\xadp', b'\xadp', b'\xadr', b'\xadr', b'\xadu', b'\xadu', b'\xad:', b'\xadB',
+    b'\xadC', b'\xadD', b'\xadE', b'\xadF', b'\xadG', b'\xadH', b'\xadI', b'\xadJ', b'\xadK',
+    b'\xadL', b'\xadM', b'\xadN', b'\xadO', b'\xadP', b'\xadQ', b'\xadR', b'\xadS', b'\xadT',
+    b'\xadU', b'\xadV', b'\xadW', b'\xadY', b'\xadj', b'\xadk', b'\xadq', b'\xadv', b'\xadw',
+    b'\xadx', b'\xady', b'\xadz', b'\xad', b'\xad', b'\xad', b'\xad', b'\xab0', b'\xab1', b'\xab2',
+    b'\xaba', b'\xabc', b'\xabe', b'\xabi', b'\xabo', b'\xabs', b'\xabt', b'\xab', b'\xab', b'\xab',
+    b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab',
+    b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xce0',
+    b'\xce1', b'\xce2', b'\xcea', b'\xcec', b'\xcee', b'\xcei', b'\xceo', b'\xces', b'\xcet',
+    b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce',
+    b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce',
+    b'\xce', b'\xce', b'\xd70', b'\xd71', b'\xd72', b'\xd7a', b'\xd7c', b'\xd7e', b'\xd7i',
+    b'\xd7o', b'\xd7s', b'\xd7t', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7',
+    b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7',
+    b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xe10', b'\xe11', b'\xe12', b'\xe1a', b'\xe1c',
+    b'\xe1e', b'\xe1i', b'\xe1o', b'\xe1s', b'\xe1t', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1',
+    b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1',
+    b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xec0', b'\xec1', b'\xec2',
+    b'\xeca', b'\xecc', b'\xece', b'\xeci', b'\xeco', b'\xecs', b'\xect', b'\xec', b'\xec', b'\xec',
+    b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec',
+    b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xed0',
+    b'\xed1', b'\xed2', b'\xeda', b'\xedc', b'\xede', b'\xedi', b'\xedo', b'\xeds', b'\xedt',
+    b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed',
+    b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed',
+    b'\xed', b'\xed', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb',
+    b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xab0', b'\xab0', b'\xab1', b'\xab1',
+    b'\xab2', b'\xab2', b'\xaba', b'\xaba', b'\xabc', b'\xabc', b'\xabe', b'\xabe', b'\xabi',
+    b'\xabi', b'\xabo', b'\xabo', b'\xabs', b'\xabs', b'\xabt', b'\xabt', b'\xab ', b'\xab%',
+    b'\xab-', b'\xab.', b'\xab/', b'\xab3', b'\xab4', b'\xab5', b'\xab6', b'\xab7', b'\xab8',
+    b'\xab9', b'\xab=', b'\xabA', b'\xab_', b'\xabb', b'\xabd', b'\xabf', b'\xabg', b'\xabh',
+    b'\xabl', b'\xabm', b'\xabn', b'\xabp', b'\xabr', b'\xabu', b'\xab', b'\xab', b'\xab', b'\xab',
+    b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab', b'\xab',
+    b'\xab', b'\xab', b'\xab', b'\xab', b'\xce0', b'\xce0', b'\xce1', b'\xce1', b'\xce2', b'\xce2',
+    b'\xcea', b'\xcea', b'\xcec', b'\xcec', b'\xcee', b'\xcee', b'\xcei', b'\xcei', b'\xceo',
+    b'\xceo', b'\xces', b'\xces', b'\xcet', b'\xcet', b'\xce ', b'\xce%', b'\xce-', b'\xce.',
+    b'\xce/', b'\xce3', b'\xce4', b'\xce5', b'\xce6', b'\xce7', b'\xce8', b'\xce9', b'\xce=',
+    b'\xceA', b'\xce_', b'\xceb', b'\xced', b'\xcef', b'\xceg', b'\xceh', b'\xcel', b'\xcem',
+    b'\xcen', b'\xcep', b'\xcer', b'\xceu', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce',
+    b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce', b'\xce',
+    b'\xce', b'\xce', b'\xd70', b'\xd70', b'\xd71', b'\xd71', b'\xd72', b'\xd72', b'\xd7a',
+    b'\xd7a', b'\xd7c', b'\xd7c', b'\xd7e', b'\xd7e', b'\xd7i', b'\xd7i', b'\xd7o', b'\xd7o',
+    b'\xd7s', b'\xd7s', b'\xd7t', b'\xd7t', b'\xd7 ', b'\xd7%', b'\xd7-', b'\xd7.', b'\xd7/',
+    b'\xd73', b'\xd74', b'\xd75', b'\xd76', b'\xd77', b'\xd78', b'\xd79', b'\xd7=', b'\xd7A',
+    b'\xd7_', b'\xd7b', b'\xd7d', b'\xd7f', b'\xd7g', b'\xd7h', b'\xd7l', b'\xd7m', b'\xd7n',
+    b'\xd7p', b'\xd7r', b'\xd7u', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7',
+    b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xd7',
+    b'\xd7', b'\xe10', b'\xe10', b'\xe11', b'\xe11', b'\xe12', b'\xe12', b'\xe1a', b'\xe1a',
+    b'\xe1c', b'\xe1c', b'\xe1e', b'\xe1e', b'\xe1i', b'\xe1i', b'\xe1o', b'\xe1o', b'\xe1s',
+    b'\xe1s', b'\xe1t', b'\xe1t', b'\xe1 ', b'\xe1%', b'\xe1-', b'\xe1.', b'\xe1/', b'\xe13',
+    b'\xe14', b'\xe15', b'\xe16', b'\xe17', b'\xe18', b'\xe19', b'\xe1=', b'\xe1A', b'\xe1_',
+    b'\xe1b', b'\xe1d', b'\xe1f', b'\xe1g', b'\xe1h', b'\xe1l', b'\xe1m', b'\xe1n', b'\xe1p',
+    b'\xe1r', b'\xe1u', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1',
+    b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xe1',
+    b'\xab0', b'\xab0', b'\xab0', b'\xab0', b'\xab1', b'\xab1', b'\xab1', b'\xab1', b'\xab2',
+    b'\xab2', b'\xab2', b'\xab2', b'\xaba', b'\xaba', b'\xaba', b'\xaba', b'\xabc', b'\xabc',
+    b'\xabc', b'\xabc', b'\xabe', b'\xabe', b'\xabe', b'\xabe', b'\xabi', b'\xabi', b'\xabi',
+    b'\xabi', b'\xabo', b'\xabo', b'\xabo', b'\xabo', b'\xabs', b'\xabs', b'\xabs', b'\xabs',
+    b'\xabt', b'\xabt', b'\xabt', b'\xabt', b'\xab ', b'\xab ', b'\xab%', b'\xab%', b'\xab-',
+    b'\xab-', b'\xab.', b'\xab.', b'\xab/', b'\xab/', b'\xab3', b'\xab3', b'\xab4', b'\xab4',
+    b'\xab5', b'\xab5', b'\xab6', b'\xab6', b'\xab7', b'\xab7', b'\xab8', b'\xab8', b'\xab9',
+    b'\xab9', b'\xab=', b'\xab=', b'\xabA', b'\xabA', b'\xab_', b'\xab_', b'\xabb', b'\xabb',
+    b'\xabd', b'\xabd', b'\xabf', b'\xabf', b'\xabg', b'\xabg', b'\xabh', b'\xabh', b'\xabl',
+    b'\xabl', b'\xabm', b'\xabm', b'\xabn', b'\xabn', b'\xabp', b'\xabp', b'\xabr', b'\xabr',
+    b'\xabu', b'\xabu', b'\xab:', b'\xabB', b'\xabC', b'\xabD', b'\xabE', b'\xabF', b'\xabG',
+    b'\xabH', b'\xabI', b'\xabJ', b'\xabK', b'\xabL', b'\xabM', b'\xabN', b'\xabO', b'\xabP',
+    b'\xabQ', b'\xabR', b'\xabS', b'\xabT', b'\xabU', b'\xabV', b'\xabW', b'\xabY', b'\xabj',
+    b'\xabk', b'\xabq', b'\xabv', b'\xabw', b'\xabx', b'\xaby', b'\xabz', b'\xab', b'\xab', b'\xab',
+    b'\xab', b'\xce0', b'\xce0', b'\xce0', b'\xce0', b'\xce1', b'\xce1', b'\xce1', b'\xce1',
+    b'\xce2', b'\xce2', b'\xce2', b'\xce2', b'\xcea', b'\xcea', b'\xcea', b'\xcea', b'\xcec',
+    b'\xcec', b'\xcec', b'\xcec', b'\xcee', b'\xcee', b'\xcee', b'\xcee', b'\xcei', b'\xcei',
+    b'\xcei', b'\xcei', b'\xceo', b'\xceo', b'\xceo', b'\xceo', b'\xces', b'\xces', b'\xces',
+    b'\xces', b'\xcet', b'\xcet', b'\xcet', b'\xcet', b'\xce ', b'\xce ', b'\xce%', b'\xce%',
+    b'\xce-', b'\xce-', b'\xce.', b'\xce.', b'\xce/', b'\xce/', b'\xce3', b'\xce3', b'\xce4',
+    b'\xce4', b'\xce5', b'\xce5', b'\xce6', b'\xce6', b'\xce7', b'\xce7', b'\xce8', b'\xce8',
+    b'\xce9', b'\xce9', b'\xce=', b'\xce=', b'\xceA', b'\xceA', b'\xce_', b'\xce_', b'\xceb',
+    b'\xceb', b'\xced', b'\xced', b'\xcef', b'\xcef', b'\xceg', b'\xceg', b'\xceh', b'\xceh',
+    b'\xcel', b'\xcel', b'\xcem', b'\xcem', b'\xcen', b'\xcen', b'\xcep', b'\xcep', b'\xcer',
+    b'\xcer', b'\xceu', b'\xceu', b'\xce:', b'\xceB', b'\xceC', b'\xceD', b'\xceE', b'\xceF',
+    b'\xceG', b'\xceH', b'\xceI', b'\xceJ', b'\xceK', b'\xceL', b'\xceM', b'\xceN', b'\xceO',
+    b'\xceP', b'\xceQ', b'\xceR', b'\xceS', b'\xceT', b'\xceU', b'\xceV', b'\xceW', b'\xceY',
+    b'\xcej', b'\xcek', b'\xceq', b'\xcev', b'\xcew', b'\xcex', b'\xcey', b'\xcez', b'\xce',
+    b'\xce', b'\xce', b'\xce', b'\xaf0', b'\xaf0', b'\xaf1', b'\xaf1', b'\xaf2', b'\xaf2', b'\xafa',
+    b'\xafa', b'\xafc', b'\xafc', b'\xafe', b'\xafe', b'\xafi', b'\xafi', b'\xafo', b'\xafo',
+    b'\xafs', b'\xafs', b'\xaft', b'\xaft', b'\xaf ', b'\xaf%', b'\xaf-', b'\xaf.', b'\xaf/',
+    b'\xaf3', b'\xaf4', b'\xaf5', b'\xaf6', b'\xaf7', b'\xaf8', b'\xaf9', b'\xaf=', b'\xafA',
+    b'\xaf_', b'\xafb', b'\xafd', b'\xaff', b'\xafg', b'\xafh', b'\xafl', b'\xafm', b'\xafn',
+    b'\xafp', b'\xafr', b'\xafu', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xaf',
+    b'\xaf', b'\xb40', b'\xb40', b'\xb41', b'\xb41', b'\xb42', b'\xb42', b'\xb4a', b'\xb4a',
+    b'\xb4c', b'\xb4c', b'\xb4e', b'\xb4e', b'\xb4i', b'\xb4i', b'\xb4o', b'\xb4o', b'\xb4s',
+    b'\xb4s', b'\xb4t', b'\xb4t', b'\xb4 ', b'\xb4%', b'\xb4-', b'\xb4.', b'\xb4/', b'\xb43',
+    b'\xb44', b'\xb45', b'\xb46', b'\xb47', b'\xb48', b'\xb49', b'\xb4=', b'\xb4A', b'\xb4_',
+    b'\xb4b', b'\xb4d', b'\xb4f', b'\xb4g', b'\xb4h', b'\xb4l', b'\xb4m', b'\xb4n', b'\xb4p',
+    b'\xb4r', b'\xb4u', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb60', b'\xb60', b'\xb61', b'\xb61', b'\xb62', b'\xb62', b'\xb6a', b'\xb6a', b'\xb6c',
+    b'\xb6c', b'\xb6e', b'\xb6e', b'\xb6i', b'\xb6i', b'\xb6o', b'\xb6o', b'\xb6s', b'\xb6s',
+    b'\xb6t', b'\xb6t', b'\xb6 ', b'\xb6%', b'\xb6-', b'\xb6.', b'\xb6/', b'\xb63', b'\xb64',
+    b'\xb65', b'\xb66', b'\xb67', b'\xb68', b'\xb69', b'\xb6=', b'\xb6A', b'\xb6_', b'\xb6b',
+    b'\xb6d', b'\xb6f', b'\xb6g', b'\xb6h', b'\xb6l', b'\xb6m', b'\xb6n', b'\xb6p', b'\xb6r',
+    b'\xb6u', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6',
+    b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb70',
+    b'\xb70', b'\xb71', b'\xb71', b'\xb72', b'\xb72', b'\xb7a', b'\xb7a', b'\xb7c', b'\xb7c',
+    b'\xb7e', b'\xb7e', b'\xb7i', b'\xb7i', b'\xb7o', b'\xb7o', b'\xb7s', b'\xb7s', b'\xb7t',
+    b'\xb7t', b'\xb7 ', b'\xb7%', b'\xb7-', b'\xb7.', b'\xb7/', b'\xb73', b'\xb74', b'\xb75',
+    b'\xb76', b'\xb77', b'\xb78', b'\xb79', b'\xb7=', b'\xb7A', b'\xb7_', b'\xb7b', b'\xb7d',
+    b'\xb7f', b'\xb7g', b'\xb7h', b'\xb7l', b'\xb7m', b'\xb7n', b'\xb7p', b'\xb7r', b'\xb7u',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7',
+    b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xaf0', b'\xaf0',
+    b'\xaf0', b'\xaf0', b'\xaf1', b'\xaf1', b'\xaf1', b'\xaf1', b'\xaf2', b'\xaf2', b'\xaf2',
+    b'\xaf2', b'\xafa', b'\xafa', b'\xafa', b'\xafa', b'\xafc', b'\xafc', b'\xafc', b'\xafc',
+    b'\xafe', b'\xafe', b'\xafe', b'\xafe', b'\xafi', b'\xafi', b'\xafi', b'\xafi', b'\xafo',
+    b'\xafo', b'\xafo', b'\xafo', b'\xafs', b'\xafs', b'\xafs', b'\xafs', b'\xaft', b'\xaft',
+    b'\xaft', b'\xaft', b'\xaf ', b'\xaf ', b'\xaf%', b'\xaf%', b'\xaf-', b'\xaf-', b'\xaf.',
+    b'\xaf.', b'\xaf/', b'\xaf/', b'\xaf3', b'\xaf3', b'\xaf4', b'\xaf4', b'\xaf5', b'\xaf5',
+    b'\xaf6', b'\xaf6', b'\xaf7', b'\xaf7', b'\xaf8', b'\xaf8', b'\xaf9', b'\xaf9', b'\xaf=',
+    b'\xaf=', b'\xafA', b'\xafA', b'\xaf_', b'\xaf_', b'\xafb', b'\xafb', b'\xafd', b'\xafd',
+    b'\xaff', b'\xaff', b'\xafg', b'\xafg', b'\xafh', b'\xafh', b'\xafl', b'\xafl', b'\xafm',
+    b'\xafm', b'\xafn', b'\xafn', b'\xafp', b'\xafp', b'\xafr', b'\xafr', b'\xafu', b'\xafu',
+    b'\xaf:', b'\xafB', b'\xafC', b'\xafD', b'\xafE', b'\xafF', b'\xafG', b'\xafH', b'\xafI',
+    b'\xafJ', b'\xafK', b'\xafL', b'\xafM', b'\xafN', b'\xafO', b'\xafP', b'\xafQ', b'\xafR',
+    b'\xafS', b'\xafT', b'\xafU', b'\xafV', b'\xafW', b'\xafY', b'\xafj', b'\xafk', b'\xafq',
+    b'\xafv', b'\xafw', b'\xafx', b'\xafy', b'\xafz', b'\xaf', b'\xaf', b'\xaf', b'\xaf', b'\xb40',
+    b'\xb40', b'\xb40', b'\xb40', b'\xb41', b'\xb41', b'\xb41', b'\xb41', b'\xb42', b'\xb42',
+    b'\xb42', b'\xb42', b'\xb4a', b'\xb4a', b'\xb4a', b'\xb4a', b'\xb4c', b'\xb4c', b'\xb4c',
+    b'\xb4c', b'\xb4e', b'\xb4e', b'\xb4e', b'\xb4e', b'\xb4i', b'\xb4i', b'\xb4i', b'\xb4i',
+    b'\xb4o', b'\xb4o', b'\xb4o', b'\xb4o', b'\xb4s', b'\xb4s', b'\xb4s', b'\xb4s', b'\xb4t',
+    b'\xb4t', b'\xb4t', b'\xb4t', b'\xb4 ', b'\xb4 ', b'\xb4%', b'\xb4%', b'\xb4-', b'\xb4-',
+    b'\xb4.', b'\xb4.', b'\xb4/', b'\xb4/', b'\xb43', b'\xb43', b'\xb44', b'\xb44', b'\xb45',
+    b'\xb45', b'\xb46', b'\xb46', b'\xb47', b'\xb47', b'\xb48', b'\xb48', b'\xb49', b'\xb49',
+    b'\xb4=', b'\xb4=', b'\xb4A', b'\xb4A', b'\xb4_', b'\xb4_', b'\xb4b', b'\xb4b', b'\xb4d',
+    b'\xb4d', b'\xb4f', b'\xb4f', b'\xb4g', b'\xb4g', b'\xb4h', b'\xb4h', b'\xb4l', b'\xb4l',
+    b'\xb4m', b'\xb4m', b'\xb4n', b'\xb4n', b'\xb4p', b'\xb4p', b'\xb4r', b'\xb4r', b'\xb4u',
+    b'\xb4u', b'\xb4:', b'\xb4B', b'\xb4C', b'\xb4D', b'\xb4E', b'\xb4F', b'\xb4G', b'\xb4H',
+    b'\xb4I', b'\xb4J', b'\xb4K', b'\xb4L', b'\xb4M', b'\xb4N', b'\xb4O', b'\xb4P', b'\xb4Q',
+    b'\xb4R', b'\xb4S', b'\xb4T', b'\xb4U', b'\xb4V', b'\xb4W', b'\xb4Y', b'\xb4j', b'\xb4k',
+    b'\xb4q', b'\xb4v', b'\xb4w', b'\xb4x', b'\xb4y', b'\xb4z', b'\xb4', b'\xb4', b'\xb4', b'\xb4',
+    b'\xb00', b'\xb01', b'\xb02', b'\xb0a', b'\xb0c', b'\xb0e', b'\xb0i', b'\xb0o', b'\xb0s',
+    b'\xb0t', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb10', b'\xb11', b'\xb12', b'\xb1a', b'\xb1c', b'\xb1e', b'\xb1i',
+    b'\xb1o', b'\xb1s', b'\xb1t', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1',
+    b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1',
+    b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb30', b'\xb31', b'\xb32', b'\xb3a', b'\xb3c',
+    b'\xb3e', b'\xb3i', b'\xb3o', b'\xb3s', b'\xb3t', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xd10', b'\xd11', b'\xd12',
+    b'\xd1a', b'\xd1c', b'\xd1e', b'\xd1i', b'\xd1o', b'\xd1s', b'\xd1t', b'\xd1', b'\xd1', b'\xd1',
+    b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1',
+    b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd80',
+    b'\xd81', b'\xd82', b'\xd8a', b'\xd8c', b'\xd8e', b'\xd8i', b'\xd8o', b'\xd8s', b'\xd8t',
+    b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd8', b'\xd8', b'\xd90', b'\xd91', b'\xd92', b'\xd9a', b'\xd9c', b'\xd9e', b'\xd9i',
+    b'\xd9o', b'\xd9s', b'\xd9t', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xe30', b'\xe31', b'\xe32', b'\xe3a', b'\xe3c',
+    b'\xe3e', b'\xe3i', b'\xe3o', b'\xe3s', b'\xe3t', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3',
+    b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3',
+    b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe50', b'\xe51', b'\xe52',
+    b'\xe5a', b'\xe5c', b'\xe5e', b'\xe5i', b'\xe5o', b'\xe5s', b'\xe5t', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xb00',
+    b'\xb00', b'\xb01', b'\xb01', b'\xb02', b'\xb02', b'\xb0a', b'\xb0a', b'\xb0c', b'\xb0c',
+    b'\xb0e', b'\xb0e', b'\xb0i', b'\xb0i', b'\xb0o', b'\xb0o', b'\xb0s', b'\xb0s', b'\xb0t',
+    b'\xb0t', b'\xb0 ', b'\xb0%', b'\xb0-', b'\xb0.', b'\xb0/', b'\xb03', b'\xb04', b'\xb05',
+    b'\xb06', b'\xb07', b'\xb08', b'\xb09', b'\xb0=', b'\xb0A', b'\xb0_', b'\xb0b', b'\xb0d',
+    b'\xb0f', b'\xb0g', b'\xb0h', b'\xb0l', b'\xb0m', b'\xb0n', b'\xb0p', b'\xb0r', b'\xb0u',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb10', b'\xb10',
+    b'\xb11', b'\xb11', b'\xb12', b'\xb12', b'\xb1a', b'\xb1a', b'\xb1c', b'\xb1c', b'\xb1e',
+    b'\xb1e', b'\xb1i', b'\xb1i', b'\xb1o', b'\xb1o', b'\xb1s', b'\xb1s', b'\xb1t', b'\xb1t',
+    b'\xb1 ', b'\xb1%', b'\xb1-', b'\xb1.', b'\xb1/', b'\xb13', b'\xb14', b'\xb15', b'\xb16',
+    b'\xb17', b'\xb18', b'\xb19', b'\xb1=', b'\xb1A', b'\xb1_', b'\xb1b', b'\xb1d', b'\xb1f',
+    b'\xb1g', b'\xb1h', b'\xb1l', b'\xb1m', b'\xb1n', b'\xb1p', b'\xb1r', b'\xb1u', b'\xb1',
+    b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1',
+    b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb30', b'\xb30', b'\xb31',
+    b'\xb31', b'\xb32', b'\xb32', b'\xb3a', b'\xb3a', b'\xb3c', b'\xb3c', b'\xb3e', b'\xb3e',
+    b'\xb3i', b'\xb3i', b'\xb3o', b'\xb3o', b'\xb3s', b'\xb3s', b'\xb3t', b'\xb3t', b'\xb3 ',
+    b'\xb3%', b'\xb3-', b'\xb3.', b'\xb3/', b'\xb33', b'\xb34', b'\xb35', b'\xb36', b'\xb37',
+    b'\xb38', b'\xb39', b'\xb3=', b'\xb3A', b'\xb3_', b'\xb3b', b'\xb3d', b'\xb3f', b'\xb3g',
+    b'\xb3h', b'\xb3l', b'\xb3m', b'\xb3n', b'\xb3p', b'\xb3r', b'\xb3u', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xb3', b'\xd10', b'\xd10', b'\xd11', b'\xd11', b'\xd12',
+    b'\xd12', b'\xd1a', b'\xd1a', b'\xd1c', b'\xd1c', b'\xd1e', b'\xd1e', b'\xd1i', b'\xd1i',
+    b'\xd1o', b'\xd1o', b'\xd1s', b'\xd1s', b'\xd1t', b'\xd1t', b'\xd1 ', b'\xd1%', b'\xd1-',
+    b'\xd1.', b'\xd1/', b'\xd13', b'\xd14', b'\xd15', b'\xd16', b'\xd17', b'\xd18', b'\xd19',
+    b'\xd1=', b'\xd1A', b'\xd1_', b'\xd1b', b'\xd1d', b'\xd1f', b'\xd1g', b'\xd1h', b'\xd1l',
+    b'\xd1m', b'\xd1n', b'\xd1p', b'\xd1r', b'\xd1u', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1',
+    b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xd1',
+    b'\xd1', b'\xd1', b'\xd1', b'\xb00', b'\xb00', b'\xb00', b'\xb00', b'\xb01', b'\xb01', b'\xb01',
+    b'\xb01', b'\xb02', b'\xb02', b'\xb02', b'\xb02', b'\xb0a', b'\xb0a', b'\xb0a', b'\xb0a',
+    b'\xb0c', b'\xb0c', b'\xb0c', b'\xb0c', b'\xb0e', b'\xb0e', b'\xb0e', b'\xb0e', b'\xb0i',
+    b'\xb0i', b'\xb0i', b'\xb0i', b'\xb0o', b'\xb0o', b'\xb0o', b'\xb0o', b'\xb0s', b'\xb0s',
+    b'\xb0s', b'\xb0s', b'\xb0t', b'\xb0t', b'\xb0t', b'\xb0t', b'\xb0 ', b'\xb0 ', b'\xb0%',
+    b'\xb0%', b'\xb0-', b'\xb0-', b'\xb0.', b'\xb0.', b'\xb0/', b'\xb0/', b'\xb03', b'\xb03',
+    b'\xb04', b'\xb04', b'\xb05', b'\xb05', b'\xb06', b'\xb06', b'\xb07', b'\xb07', b'\xb08',
+    b'\xb08', b'\xb09', b'\xb09', b'\xb0=', b'\xb0=', b'\xb0A', b'\xb0A', b'\xb0_', b'\xb0_',
+    b'\xb0b', b'\xb0b', b'\xb0d', b'\xb0d', b'\xb0f', b'\xb0f', b'\xb0g', b'\xb0g', b'\xb0h',
+    b'\xb0h', b'\xb0l', b'\xb0l', b'\xb0m', b'\xb0m', b'\xb0n', b'\xb0n', b'\xb0p', b'\xb0p',
+    b'\xb0r', b'\xb0r', b'\xb0u', b'\xb0u', b'\xb0:', b'\xb0B', b'\xb0C', b'\xb0D', b'\xb0E',
+    b'\xb0F', b'\xb0G', b'\xb0H', b'\xb0I', b'\xb0J', b'\xb0K', b'\xb0L', b'\xb0M', b'\xb0N',
+    b'\xb0O', b'\xb0P', b'\xb0Q', b'\xb0R', b'\xb0S', b'\xb0T', b'\xb0U', b'\xb0V', b'\xb0W',
+    b'\xb0Y', b'\xb0j', b'\xb0k', b'\xb0q', b'\xb0v', b'\xb0w', b'\xb0x', b'\xb0y', b'\xb0z',
+    b'\xb0', b'\xb0', b'\xb0', b'\xb0', b'\xb10', b'\xb10', b'\xb10', b'\xb10', b'\xb11', b'\xb11',
+    b'\xb11', b'\xb11', b'\xb12', b'\xb12', b'\xb12', b'\xb12', b'\xb1a', b'\xb1a', b'\xb1a',
+    b'\xb1a', b'\xb1c', b'\xb1c', b'\xb1c', b'\xb1c', b'\xb1e', b'\xb1e', b'\xb1e', b'\xb1e',
+    b'\xb1i', b'\xb1i', b'\xb1i', b'\xb1i', b'\xb1o', b'\xb1o', b'\xb1o', b'\xb1o', b'\xb1s',
+    b'\xb1s', b'\xb1s', b'\xb1s', b'\xb1t', b'\xb1t', b'\xb1t', b'\xb1t', b'\xb1 ', b'\xb1 ',
+    b'\xb1%', b'\xb1%', b'\xb1-', b'\xb1-', b'\xb1.', b'\xb1.', b'\xb1/', b'\xb1/', b'\xb13',
+    b'\xb13', b'\xb14', b'\xb14', b'\xb15', b'\xb15', b'\xb16', b'\xb16', b'\xb17', b'\xb17',
+    b'\xb18', b'\xb18', b'\xb19', b'\xb19', b'\xb1=', b'\xb1=', b'\xb1A', b'\xb1A', b'\xb1_',
+    b'\xb1_', b'\xb1b', b'\xb1b', b'\xb1d', b'\xb1d', b'\xb1f', b'\xb1f', b'\xb1g', b'\xb1g',
+    b'\xb1h', b'\xb1h', b'\xb1l', b'\xb1l', b'\xb1m', b'\xb1m', b'\xb1n', b'\xb1n', b'\xb1p',
+    b'\xb1p', b'\xb1r', b'\xb1r', b'\xb1u', b'\xb1u', b'\xb1:', b'\xb1B', b'\xb1C', b'\xb1D',
+    b'\xb1E', b'\xb1F', b'\xb1G', b'\xb1H', b'\xb1I', b'\xb1J', b'\xb1K', b'\xb1L', b'\xb1M',
+    b'\xb1N', b'\xb1O', b'\xb1P', b'\xb1Q', b'\xb1R', b'\xb1S', b'\xb1T', b'\xb1U', b'\xb1V',
+    b'\xb1W', b'\xb1Y', b'\xb1j', b'\xb1k', b'\xb1q', b'\xb1v', b'\xb1w', b'\xb1x', b'\xb1y',
+    b'\xb1z', b'\xb1', b'\xb1', b'\xb1', b'\xb1', b'\xb20', b'\xb21', b'\xb22', b'\xb2a', b'\xb2c',
+    b'\xb2e', b'\xb2i', b'\xb2o', b'\xb2s', b'\xb2t', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb50', b'\xb51', b'\xb52',
+    b'\xb5a', b'\xb5c', b'\xb5e', b'\xb5i', b'\xb5o', b'\xb5s', b'\xb5t', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb90',
+    b'\xb91', b'\xb92', b'\xb9a', b'\xb9c', b'\xb9e', b'\xb9i', b'\xb9o', b'\xb9s', b'\xb9t',
+    b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9',
+    b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9',
+    b'\xb9', b'\xb9', b'\xba0', b'\xba1', b'\xba2', b'\xbaa', b'\xbac', b'\xbae', b'\xbai',
+    b'\xbao', b'\xbas', b'\xbat', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xbb0', b'\xbb1', b'\xbb2', b'\xbba', b'\xbbc',
+    b'\xbbe', b'\xbbi', b'\xbbo', b'\xbbs', b'\xbbt', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb',
+    b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb',
+    b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbd0', b'\xbd1', b'\xbd2',
+    b'\xbda', b'\xbdc', b'\xbde', b'\xbdi', b'\xbdo', b'\xbds', b'\xbdt', b'\xbd', b'\xbd', b'\xbd',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbe0',
+    b'\xbe1', b'\xbe2', b'\xbea', b'\xbec', b'\xbee', b'\xbei', b'\xbeo', b'\xbes', b'\xbet',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe',
+    b'\xbe', b'\xbe', b'\xc40', b'\xc41', b'\xc42', b'\xc4a', b'\xc4c', b'\xc4e', b'\xc4i',
+    b'\xc4o', b'\xc4s', b'\xc4t', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xb20', b'\xb20', b'\xb21', b'\xb21', b'\xb22',
+    b'\xb22', b'\xb2a', b'\xb2a', b'\xb2c', b'\xb2c', b'\xb2e', b'\xb2e', b'\xb2i', b'\xb2i',
+    b'\xb2o', b'\xb2o', b'\xb2s', b'\xb2s', b'\xb2t', b'\xb2t', b'\xb2 ', b'\xb2%', b'\xb2-',
+    b'\xb2.', b'\xb2/', b'\xb23', b'\xb24', b'\xb25', b'\xb26', b'\xb27', b'\xb28', b'\xb29',
+    b'\xb2=', b'\xb2A', b'\xb2_', b'\xb2b', b'\xb2d', b'\xb2f', b'\xb2g', b'\xb2h', b'\xb2l',
+    b'\xb2m', b'\xb2n', b'\xb2p', b'\xb2r', b'\xb2u', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2', b'\xb2',
+    b'\xb2', b'\xb2', b'\xb2', b'\xb50', b'\xb50', b'\xb51', b'\xb51', b'\xb52', b'\xb52', b'\xb5a',
+    b'\xb5a', b'\xb5c', b'\xb5c', b'\xb5e', b'\xb5e', b'\xb5i', b'\xb5i', b'\xb5o', b'\xb5o',
+    b'\xb5s', b'\xb5s', b'\xb5t', b'\xb5t', b'\xb5 ', b'\xb5%', b'\xb5-', b'\xb5.', b'\xb5/',
+    b'\xb53', b'\xb54', b'\xb55', b'\xb56', b'\xb57', b'\xb58', b'\xb59', b'\xb5=', b'\xb5A',
+    b'\xb5_', b'\xb5b', b'\xb5d', b'\xb5f', b'\xb5g', b'\xb5h', b'\xb5l', b'\xb5m', b'\xb5n',
+    b'\xb5p', b'\xb5r', b'\xb5u', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb5', b'\xb90', b'\xb90', b'\xb91', b'\xb91', b'\xb92', b'\xb92', b'\xb9a', b'\xb9a',
+    b'\xb9c', b'\xb9c', b'\xb9e', b'\xb9e', b'\xb9i', b'\xb9i', b'\xb9o', b'\xb9o', b'\xb9s',
+    b'\xb9s', b'\xb9t', b'\xb9t', b'\xb9 ', b'\xb9%', b'\xb9-', b'\xb9.', b'\xb9/', b'\xb93',
+    b'\xb94', b'\xb95', b'\xb96', b'\xb97', b'\xb98', b'\xb99', b'\xb9=', b'\xb9A', b'\xb9_',
+    b'\xb9b', b'\xb9d', b'\xb9f', b'\xb9g', b'\xb9h', b'\xb9l', b'\xb9m', b'\xb9n', b'\xb9p',
+    b'\xb9r', b'\xb9u', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9',
+    b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xb9',
+    b'\xba0', b'\xba0', b'\xba1', b'\xba1', b'\xba2', b'\xba2', b'\xbaa', b'\xbaa', b'\xbac',
+    b'\xbac', b'\xbae', b'\xbae', b'\xbai', b'\xbai', b'\xbao', b'\xbao', b'\xbas', b'\xbas',
+    b'\xbat', b'\xbat', b'\xba ', b'\xba%', b'\xba-', b'\xba.', b'\xba/', b'\xba3', b'\xba4',
+    b'\xba5', b'\xba6', b'\xba7', b'\xba8', b'\xba9', b'\xba=', b'\xbaA', b'\xba_', b'\xbab',
+    b'\xbad', b'\xbaf', b'\xbag', b'\xbah', b'\xbal', b'\xbam', b'\xban', b'\xbap', b'\xbar',
+    b'\xbau', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xba', b'\xb20',
+    b'\xb20', b'\xb20', b'\xb20', b'\xb21', b'\xb21', b'\xb21', b'\xb21', b'\xb22', b'\xb22',
+    b'\xb22', b'\xb22', b'\xb2a', b'\xb2a', b'\xb2a', b'\xb2a', b'\xb2c', b'\xb2c', b'\xb2c',
+    b'\xb2c', b'\xb2e', b'\xb2e', b'\xb2e', b'\xb2e', b'\xb2i', b'\xb2i', b'\xb2i', b'\xb2i',
+    b'\xb2o', b'\xb2o', b'\xb2o', b'\xb2o', b'\xb2s', b'\xb2s', b'\xb2s', b'\xb2s', b'\xb2t',
+    b'\xb2t', b'\xb2t', b'\xb2t', b'\xb2 ', b'\xb2 ', b'\xb2%', b'\xb2%', b'\xb2-', b'\xb2-',
+    b'\xb2.', b'\xb2.', b'\xb2/', b'\xb2/', b'\xb23', b'\xb23', b'\xb24', b'\xb24', b'\xb25',
+    b'\xb25', b'\xb26', b'\xb26', b'\xb27', b'\xb27', b'\xb28', b'\xb28', b'\xb29', b'\xb29',
+    b'\xb2=', b'\xb2=', b'\xb2A', b'\xb2A', b'\xb2_', b'\xb2_', b'\xb2b', b'\xb2b', b'\xb2d',
+    b'\xb2d', b'\xb2f', b'\xb2f', b'\xb2g', b'\xb2g', b'\xb2h', b'\xb2h', b'\xb2l', b'\xb2l',
+    b'\xb2m', b'\xb2m', b'\xb2n', b'\xb2n', b'\xb2p', b'\xb2p', b'\xb2r', b'\xb2r', b'\xb2u',
+    b'\xb2u', b'\xb2:', b'\xb2B', b'\xb2C', b'\xb2D', b'\xb2E', b'\xb2F', b'\xb2G', b'\xb2H',
+    b'\xb2I', b'\xb2J', b'\xb2K', b'\xb2L', b'\xb2M', b'\xb2N', b'\xb2O', b'\xb2P', b'\xb2Q',
+    b'\xb2R', b'\xb2S', b'\xb2T', b'\xb2U', b'\xb2V', b'\xb2W', b'\xb2Y', b'\xb2j', b'\xb2k',
+    b'\xb2q', b'\xb2v', b'\xb2w', b'\xb2x', b'\xb2y', b'\xb2z', b'\xb2', b'\xb2', b'\xb2', b'\xb2',
+    b'\xb50', b'\xb50', b'\xb50', b'\xb50', b'\xb51', b'\xb51', b'\xb51', b'\xb51', b'\xb52',
+    b'\xb52', b'\xb52', b'\xb52', b'\xb5a', b'\xb5a', b'\xb5a', b'\xb5a', b'\xb5c', b'\xb5c',
+    b'\xb5c', b'\xb5c', b'\xb5e', b'\xb5e', b'\xb5e', b'\xb5e', b'\xb5i', b'\xb5i', b'\xb5i',
+    b'\xb5i', b'\xb5o', b'\xb5o', b'\xb5o', b'\xb5o', b'\xb5s', b'\xb5s', b'\xb5s', b'\xb5s',
+    b'\xb5t', b'\xb5t', b'\xb5t', b'\xb5t', b'\xb5 ', b'\xb5 ', b'\xb5%', b'\xb5%', b'\xb5-',
+    b'\xb5-', b'\xb5.', b'\xb5.', b'\xb5/', b'\xb5/', b'\xb53', b'\xb53', b'\xb54', b'\xb54',
+    b'\xb55', b'\xb55', b'\xb56', b'\xb56', b'\xb57', b'\xb57', b'\xb58', b'\xb58', b'\xb59',
+    b'\xb59', b'\xb5=', b'\xb5=', b'\xb5A', b'\xb5A', b'\xb5_', b'\xb5_', b'\xb5b', b'\xb5b',
+    b'\xb5d', b'\xb5d', b'\xb5f', b'\xb5f', b'\xb5g', b'\xb5g', b'\xb5h', b'\xb5h', b'\xb5l',
+    b'\xb5l', b'\xb5m', b'\xb5m', b'\xb5n', b'\xb5n', b'\xb5p', b'\xb5p', b'\xb5r', b'\xb5r',
+    b'\xb5u', b'\xb5u', b'\xb5:', b'\xb5B', b'\xb5C', b'\xb5D', b'\xb5E', b'\xb5F', b'\xb5G',
+    b'\xb5H', b'\xb5I', b'\xb5J', b'\xb5K', b'\xb5L', b'\xb5M', b'\xb5N', b'\xb5O', b'\xb5P',
+    b'\xb5Q', b'\xb5R', b'\xb5S', b'\xb5T', b'\xb5U', b'\xb5V', b'\xb5W', b'\xb5Y', b'\xb5j',
+    b'\xb5k', b'\xb5q', b'\xb5v', b'\xb5w', b'\xb5x', b'\xb5y', b'\xb5z', b'\xb5', b'\xb5', b'\xb5',
+    b'\xb5', b'\xb30', b'\xb30', b'\xb30', b'\xb30', b'\xb31', b'\xb31', b'\xb31', b'\xb31',
+    b'\xb32', b'\xb32', b'\xb32', b'\xb32', b'\xb3a', b'\xb3a', b'\xb3a', b'\xb3a', b'\xb3c',
+    b'\xb3c', b'\xb3c', b'\xb3c', b'\xb3e', b'\xb3e', b'\xb3e', b'\xb3e', b'\xb3i', b'\xb3i',
+    b'\xb3i', b'\xb3i', b'\xb3o', b'\xb3o', b'\xb3o', b'\xb3o', b'\xb3s', b'\xb3s', b'\xb3s',
+    b'\xb3s', b'\xb3t', b'\xb3t', b'\xb3t', b'\xb3t', b'\xb3 ', b'\xb3 ', b'\xb3%', b'\xb3%',
+    b'\xb3-', b'\xb3-', b'\xb3.', b'\xb3.', b'\xb3/', b'\xb3/', b'\xb33', b'\xb33', b'\xb34',
+    b'\xb34', b'\xb35', b'\xb35', b'\xb36', b'\xb36', b'\xb37', b'\xb37', b'\xb38', b'\xb38',
+    b'\xb39', b'\xb39', b'\xb3=', b'\xb3=', b'\xb3A', b'\xb3A', b'\xb3_', b'\xb3_', b'\xb3b',
+    b'\xb3b', b'\xb3d', b'\xb3d', b'\xb3f', b'\xb3f', b'\xb3g', b'\xb3g', b'\xb3h', b'\xb3h',
+    b'\xb3l', b'\xb3l', b'\xb3m', b'\xb3m', b'\xb3n', b'\xb3n', b'\xb3p', b'\xb3p', b'\xb3r',
+    b'\xb3r', b'\xb3u', b'\xb3u', b'\xb3:', b'\xb3B', b'\xb3C', b'\xb3D', b'\xb3E', b'\xb3F',
+    b'\xb3G', b'\xb3H', b'\xb3I', b'\xb3J', b'\xb3K', b'\xb3L', b'\xb3M', b'\xb3N', b'\xb3O',
+    b'\xb3P', b'\xb3Q', b'\xb3R', b'\xb3S', b'\xb3T', b'\xb3U', b'\xb3V', b'\xb3W', b'\xb3Y',
+    b'\xb3j', b'\xb3k', b'\xb3q', b'\xb3v', b'\xb3w', b'\xb3x', b'\xb3y', b'\xb3z', b'\xb3',
+    b'\xb3', b'\xb3', b'\xb3', b'\xd10', b'\xd10', b'\xd10', b'\xd10', b'\xd11', b'\xd11', b'\xd11',
+    b'\xd11', b'\xd12', b'\xd12', b'\xd12', b'\xd12', b'\xd1a', b'\xd1a', b'\xd1a', b'\xd1a',
+    b'\xd1c', b'\xd1c', b'\xd1c', b'\xd1c', b'\xd1e', b'\xd1e', b'\xd1e', b'\xd1e', b'\xd1i',
+    b'\xd1i', b'\xd1i', b'\xd1i', b'\xd1o', b'\xd1o', b'\xd1o', b'\xd1o', b'\xd1s', b'\xd1s',
+    b'\xd1s', b'\xd1s', b'\xd1t', b'\xd1t', b'\xd1t', b'\xd1t', b'\xd1 ', b'\xd1 ', b'\xd1%',
+    b'\xd1%', b'\xd1-', b'\xd1-', b'\xd1.', b'\xd1.', b'\xd1/', b'\xd1/', b'\xd13', b'\xd13',
+    b'\xd14', b'\xd14', b'\xd15', b'\xd15', b'\xd16', b'\xd16', b'\xd17', b'\xd17', b'\xd18',
+    b'\xd18', b'\xd19', b'\xd19', b'\xd1=', b'\xd1=', b'\xd1A', b'\xd1A', b'\xd1_', b'\xd1_',
+    b'\xd1b', b'\xd1b', b'\xd1d', b'\xd1d', b'\xd1f', b'\xd1f', b'\xd1g', b'\xd1g', b'\xd1h',
+    b'\xd1h', b'\xd1l', b'\xd1l', b'\xd1m', b'\xd1m', b'\xd1n', b'\xd1n', b'\xd1p', b'\xd1p',
+    b'\xd1r', b'\xd1r', b'\xd1u', b'\xd1u', b'\xd1:', b'\xd1B', b'\xd1C', b'\xd1D', b'\xd1E',
+    b'\xd1F', b'\xd1G', b'\xd1H', b'\xd1I', b'\xd1J', b'\xd1K', b'\xd1L', b'\xd1M', b'\xd1N',
+    b'\xd1O', b'\xd1P', b'\xd1Q', b'\xd1R', b'\xd1S', b'\xd1T', b'\xd1U', b'\xd1V', b'\xd1W',
+    b'\xd1Y', b'\xd1j', b'\xd1k', b'\xd1q', b'\xd1v', b'\xd1w', b'\xd1x', b'\xd1y', b'\xd1z',
+    b'\xd1', b'\xd1', b'\xd1', b'\xd1', b'\xb60', b'\xb60', b'\xb60', b'\xb60', b'\xb61', b'\xb61',
+    b'\xb61', b'\xb61', b'\xb62', b'\xb62', b'\xb62', b'\xb62', b'\xb6a', b'\xb6a', b'\xb6a',
+    b'\xb6a', b'\xb6c', b'\xb6c', b'\xb6c', b'\xb6c', b'\xb6e', b'\xb6e', b'\xb6e', b'\xb6e',
+    b'\xb6i', b'\xb6i', b'\xb6i', b'\xb6i', b'\xb6o', b'\xb6o', b'\xb6o', b'\xb6o', b'\xb6s',
+    b'\xb6s', b'\xb6s', b'\xb6s', b'\xb6t', b'\xb6t', b'\xb6t', b'\xb6t', b'\xb6 ', b'\xb6 ',
+    b'\xb6%', b'\xb6%', b'\xb6-', b'\xb6-', b'\xb6.', b'\xb6.', b'\xb6/', b'\xb6/', b'\xb63',
+    b'\xb63', b'\xb64', b'\xb64', b'\xb65', b'\xb65', b'\xb66', b'\xb66', b'\xb67', b'\xb67',
+    b'\xb68', b'\xb68', b'\xb69', b'\xb69', b'\xb6=', b'\xb6=', b'\xb6A', b'\xb6A', b'\xb6_',
+    b'\xb6_', b'\xb6b', b'\xb6b', b'\xb6d', b'\xb6d', b'\xb6f', b'\xb6f', b'\xb6g', b'\xb6g',
+    b'\xb6h', b'\xb6h', b'\xb6l', b'\xb6l', b'\xb6m', b'\xb6m', b'\xb6n', b'\xb6n', b'\xb6p',
+    b'\xb6p', b'\xb6r', b'\xb6r', b'\xb6u', b'\xb6u', b'\xb6:', b'\xb6B', b'\xb6C', b'\xb6D',
+    b'\xb6E', b'\xb6F', b'\xb6G', b'\xb6H', b'\xb6I', b'\xb6J', b'\xb6K', b'\xb6L', b'\xb6M',
+    b'\xb6N', b'\xb6O', b'\xb6P', b'\xb6Q', b'\xb6R', b'\xb6S', b'\xb6T', b'\xb6U', b'\xb6V',
+    b'\xb6W', b'\xb6Y', b'\xb6j', b'\xb6k', b'\xb6q', b'\xb6v', b'\xb6w', b'\xb6x', b'\xb6y',
+    b'\xb6z', b'\xb6', b'\xb6', b'\xb6', b'\xb6', b'\xb70', b'\xb70', b'\xb70', b'\xb70', b'\xb71',
+    b'\xb71', b'\xb71', b'\xb71', b'\xb72', b'\xb72', b'\xb72', b'\xb72', b'\xb7a', b'\xb7a',
+    b'\xb7a', b'\xb7a', b'\xb7c', b'\xb7c', b'\xb7c', b'\xb7c', b'\xb7e', b'\xb7e', b'\xb7e',
+    b'\xb7e', b'\xb7i', b'\xb7i', b'\xb7i', b'\xb7i', b'\xb7o', b'\xb7o', b'\xb7o', b'\xb7o',
+    b'\xb7s', b'\xb7s', b'\xb7s', b'\xb7s', b'\xb7t', b'\xb7t', b'\xb7t', b'\xb7t', b'\xb7 ',
+    b'\xb7 ', b'\xb7%', b'\xb7%', b'\xb7-', b'\xb7-', b'\xb7.', b'\xb7.', b'\xb7/', b'\xb7/',
+    b'\xb73', b'\xb73', b'\xb74', b'\xb74', b'\xb75', b'\xb75', b'\xb76', b'\xb76', b'\xb77',
+    b'\xb77', b'\xb78', b'\xb78', b'\xb79', b'\xb79', b'\xb7=', b'\xb7=', b'\xb7A', b'\xb7A',
+    b'\xb7_', b'\xb7_', b'\xb7b', b'\xb7b', b'\xb7d', b'\xb7d', b'\xb7f', b'\xb7f', b'\xb7g',
+    b'\xb7g', b'\xb7h', b'\xb7h', b'\xb7l', b'\xb7l', b'\xb7m', b'\xb7m', b'\xb7n', b'\xb7n',
+    b'\xb7p', b'\xb7p', b'\xb7r', b'\xb7r', b'\xb7u', b'\xb7u', b'\xb7:', b'\xb7B', b'\xb7C',
+    b'\xb7D', b'\xb7E', b'\xb7F', b'\xb7G', b'\xb7H', b'\xb7I', b'\xb7J', b'\xb7K', b'\xb7L',
+    b'\xb7M', b'\xb7N', b'\xb7O', b'\xb7P', b'\xb7Q', b'\xb7R', b'\xb7S', b'\xb7T', b'\xb7U',
+    b'\xb7V', b'\xb7W', b'\xb7Y', b'\xb7j', b'\xb7k', b'\xb7q', b'\xb7v', b'\xb7w', b'\xb7x',
+    b'\xb7y', b'\xb7z', b'\xb7', b'\xb7', b'\xb7', b'\xb7', b'\xb80', b'\xb80', b'\xb80', b'\xb80',
+    b'\xb81', b'\xb81', b'\xb81', b'\xb81', b'\xb82', b'\xb82', b'\xb82', b'\xb82', b'\xb8a',
+    b'\xb8a', b'\xb8a', b'\xb8a', b'\xb8c', b'\xb8c', b'\xb8c', b'\xb8c', b'\xb8e', b'\xb8e',
+    b'\xb8e', b'\xb8e', b'\xb8i', b'\xb8i', b'\xb8i', b'\xb8i', b'\xb8o', b'\xb8o', b'\xb8o',
+    b'\xb8o', b'\xb8s', b'\xb8s', b'\xb8s', b'\xb8s', b'\xb8t', b'\xb8t', b'\xb8t', b'\xb8t',
+    b'\xb8 ', b'\xb8 ', b'\xb8%', b'\xb8%', b'\xb8-', b'\xb8-', b'\xb8.', b'\xb8.', b'\xb8/',
+    b'\xb8/', b'\xb83', b'\xb83', b'\xb84', b'\xb84', b'\xb85', b'\xb85', b'\xb86', b'\xb86',
+    b'\xb87', b'\xb87', b'\xb88', b'\xb88', b'\xb89', b'\xb89', b'\xb8=', b'\xb8=', b'\xb8A',
+    b'\xb8A', b'\xb8_', b'\xb8_', b'\xb8b', b'\xb8b', b'\xb8d', b'\xb8d', b'\xb8f', b'\xb8f',
+    b'\xb8g', b'\xb8g', b'\xb8h', b'\xb8h', b'\xb8l', b'\xb8l', b'\xb8m', b'\xb8m', b'\xb8n',
+    b'\xb8n', b'\xb8p', b'\xb8p', b'\xb8r', b'\xb8r', b'\xb8u', b'\xb8u', b'\xb8:', b'\xb8B',
+    b'\xb8C', b'\xb8D', b'\xb8E', b'\xb8F', b'\xb8G', b'\xb8H', b'\xb8I', b'\xb8J', b'\xb8K',
+    b'\xb8L', b'\xb8M', b'\xb8N', b'\xb8O', b'\xb8P', b'\xb8Q', b'\xb8R', b'\xb8S', b'\xb8T',
+    b'\xb8U', b'\xb8V', b'\xb8W', b'\xb8Y', b'\xb8j', b'\xb8k', b'\xb8q', b'\xb8v', b'\xb8w',
+    b'\xb8x', b'\xb8y', b'\xb8z', b'\xb8', b'\xb8', b'\xb8', b'\xb8', b'\xc20', b'\xc20', b'\xc20',
+    b'\xc20', b'\xc21', b'\xc21', b'\xc21', b'\xc21', b'\xc22', b'\xc22', b'\xc22', b'\xc22',
+    b'\xc2a', b'\xc2a', b'\xc2a', b'\xc2a', b'\xc2c', b'\xc2c', b'\xc2c', b'\xc2c', b'\xc2e',
+    b'\xc2e', b'\xc2e', b'\xc2e', b'\xc2i', b'\xc2i', b'\xc2i', b'\xc2i', b'\xc2o', b'\xc2o',
+    b'\xc2o', b'\xc2o', b'\xc2s', b'\xc2s', b'\xc2s', b'\xc2s', b'\xc2t', b'\xc2t', b'\xc2t',
+    b'\xc2t', b'\xc2 ', b'\xc2 ', b'\xc2%', b'\xc2%', b'\xc2-', b'\xc2-', b'\xc2.', b'\xc2.',
+    b'\xc2/', b'\xc2/', b'\xc23', b'\xc23', b'\xc24', b'\xc24', b'\xc25', b'\xc25', b'\xc26',
+    b'\xc26', b'\xc27', b'\xc27', b'\xc28', b'\xc28', b'\xc29', b'\xc29', b'\xc2=', b'\xc2=',
+    b'\xc2A', b'\xc2A', b'\xc2_', b'\xc2_', b'\xc2b', b'\xc2b', b'\xc2d', b'\xc2d', b'\xc2f',
+    b'\xc2f', b'\xc2g', b'\xc2g', b'\xc2h', b'\xc2h', b'\xc2l', b'\xc2l', b'\xc2m', b'\xc2m',
+    b'\xc2n', b'\xc2n', b'\xc2p', b'\xc2p', b'\xc2r', b'\xc2r', b'\xc2u', b'\xc2u', b'\xc2:',
+    b'\xc2B', b'\xc2C', b'\xc2D', b'\xc2E', b'\xc2F', b'\xc2G', b'\xc2H', b'\xc2I', b'\xc2J',
+    b'\xc2K', b'\xc2L', b'\xc2M', b'\xc2N', b'\xc2O', b'\xc2P', b'\xc2Q', b'\xc2R', b'\xc2S',
+    b'\xc2T', b'\xc2U', b'\xc2V', b'\xc2W', b'\xc2Y', b'\xc2j', b'\xc2k', b'\xc2q', b'\xc2v',
+    b'\xc2w', b'\xc2x', b'\xc2y', b'\xc2z', b'\xc2', b'\xc2', b'\xc2', b'\xc2', b'\xb90', b'\xb90',
+    b'\xb90', b'\xb90', b'\xb91', b'\xb91', b'\xb91', b'\xb91', b'\xb92', b'\xb92', b'\xb92',
+    b'\xb92', b'\xb9a', b'\xb9a', b'\xb9a', b'\xb9a', b'\xb9c', b'\xb9c', b'\xb9c', b'\xb9c',
+    b'\xb9e', b'\xb9e', b'\xb9e', b'\xb9e', b'\xb9i', b'\xb9i', b'\xb9i', b'\xb9i', b'\xb9o',
+    b'\xb9o', b'\xb9o', b'\xb9o', b'\xb9s', b'\xb9s', b'\xb9s', b'\xb9s', b'\xb9t', b'\xb9t',
+    b'\xb9t', b'\xb9t', b'\xb9 ', b'\xb9 ', b'\xb9%', b'\xb9%', b'\xb9-', b'\xb9-', b'\xb9.',
+    b'\xb9.', b'\xb9/', b'\xb9/', b'\xb93', b'\xb93', b'\xb94', b'\xb94', b'\xb95', b'\xb95',
+    b'\xb96', b'\xb96', b'\xb97', b'\xb97', b'\xb98', b'\xb98', b'\xb99', b'\xb99', b'\xb9=',
+    b'\xb9=', b'\xb9A', b'\xb9A', b'\xb9_', b'\xb9_', b'\xb9b', b'\xb9b', b'\xb9d', b'\xb9d',
+    b'\xb9f', b'\xb9f', b'\xb9g', b'\xb9g', b'\xb9h', b'\xb9h', b'\xb9l', b'\xb9l', b'\xb9m',
+    b'\xb9m', b'\xb9n', b'\xb9n', b'\xb9p', b'\xb9p', b'\xb9r', b'\xb9r', b'\xb9u', b'\xb9u',
+    b'\xb9:', b'\xb9B', b'\xb9C', b'\xb9D', b'\xb9E', b'\xb9F', b'\xb9G', b'\xb9H', b'\xb9I',
+    b'\xb9J', b'\xb9K', b'\xb9L', b'\xb9M', b'\xb9N', b'\xb9O', b'\xb9P', b'\xb9Q', b'\xb9R',
+    b'\xb9S', b'\xb9T', b'\xb9U', b'\xb9V', b'\xb9W', b'\xb9Y', b'\xb9j', b'\xb9k', b'\xb9q',
+    b'\xb9v', b'\xb9w', b'\xb9x', b'\xb9y', b'\xb9z', b'\xb9', b'\xb9', b'\xb9', b'\xb9', b'\xba0',
+    b'\xba0', b'\xba0', b'\xba0', b'\xba1', b'\xba1', b'\xba1', b'\xba1', b'\xba2', b'\xba2',
+    b'\xba2', b'\xba2', b'\xbaa', b'\xbaa', b'\xbaa', b'\xbaa', b'\xbac', b'\xbac', b'\xbac',
+    b'\xbac', b'\xbae', b'\xbae', b'\xbae', b'\xbae', b'\xbai', b'\xbai', b'\xbai', b'\xbai',
+    b'\xbao', b'\xbao', b'\xbao', b'\xbao', b'\xbas', b'\xbas', b'\xbas', b'\xbas', b'\xbat',
+    b'\xbat', b'\xbat', b'\xbat', b'\xba ', b'\xba ', b'\xba%', b'\xba%', b'\xba-', b'\xba-',
+    b'\xba.', b'\xba.', b'\xba/', b'\xba/', b'\xba3', b'\xba3', b'\xba4', b'\xba4', b'\xba5',
+    b'\xba5', b'\xba6', b'\xba6', b'\xba7', b'\xba7', b'\xba8', b'\xba8', b'\xba9', b'\xba9',
+    b'\xba=', b'\xba=', b'\xbaA', b'\xbaA', b'\xba_', b'\xba_', b'\xbab', b'\xbab', b'\xbad',
+    b'\xbad', b'\xbaf', b'\xbaf', b'\xbag', b'\xbag', b'\xbah', b'\xbah', b'\xbal', b'\xbal',
+    b'\xbam', b'\xbam', b'\xban', b'\xban', b'\xbap', b'\xbap', b'\xbar', b'\xbar', b'\xbau',
+    b'\xbau', b'\xba:', b'\xbaB', b'\xbaC', b'\xbaD', b'\xbaE', b'\xbaF', b'\xbaG', b'\xbaH',
+    b'\xbaI', b'\xbaJ', b'\xbaK', b'\xbaL', b'\xbaM', b'\xbaN', b'\xbaO', b'\xbaP', b'\xbaQ',
+    b'\xbaR', b'\xbaS', b'\xbaT', b'\xbaU', b'\xbaV', b'\xbaW', b'\xbaY', b'\xbaj', b'\xbak',
+    b'\xbaq', b'\xbav', b'\xbaw', b'\xbax', b'\xbay', b'\xbaz', b'\xba', b'\xba', b'\xba', b'\xba',
+    b'\xbb0', b'\xbb0', b'\xbb1', b'\xbb1', b'\xbb2', b'\xbb2', b'\xbba', b'\xbba', b'\xbbc',
+    b'\xbbc', b'\xbbe', b'\xbbe', b'\xbbi', b'\xbbi', b'\xbbo', b'\xbbo', b'\xbbs', b'\xbbs',
+    b'\xbbt', b'\xbbt', b'\xbb ', b'\xbb%', b'\xbb-', b'\xbb.', b'\xbb/', b'\xbb3', b'\xbb4',
+    b'\xbb5', b'\xbb6', b'\xbb7', b'\xbb8', b'\xbb9', b'\xbb=', b'\xbbA', b'\xbb_', b'\xbbb',
+    b'\xbbd', b'\xbbf', b'\xbbg', b'\xbbh', b'\xbbl', b'\xbbm', b'\xbbn', b'\xbbp', b'\xbbr',
+    b'\xbbu', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb',
+    b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbd0',
+    b'\xbd0', b'\xbd1', b'\xbd1', b'\xbd2', b'\xbd2', b'\xbda', b'\xbda', b'\xbdc', b'\xbdc',
+    b'\xbde', b'\xbde', b'\xbdi', b'\xbdi', b'\xbdo', b'\xbdo', b'\xbds', b'\xbds', b'\xbdt',
+    b'\xbdt', b'\xbd ', b'\xbd%', b'\xbd-', b'\xbd.', b'\xbd/', b'\xbd3', b'\xbd4', b'\xbd5',
+    b'\xbd6', b'\xbd7', b'\xbd8', b'\xbd9', b'\xbd=', b'\xbdA', b'\xbd_', b'\xbdb', b'\xbdd',
+    b'\xbdf', b'\xbdg', b'\xbdh', b'\xbdl', b'\xbdm', b'\xbdn', b'\xbdp', b'\xbdr', b'\xbdu',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd',
+    b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbe0', b'\xbe0',
+    b'\xbe1', b'\xbe1', b'\xbe2', b'\xbe2', b'\xbea', b'\xbea', b'\xbec', b'\xbec', b'\xbee',
+    b'\xbee', b'\xbei', b'\xbei', b'\xbeo', b'\xbeo', b'\xbes', b'\xbes', b'\xbet', b'\xbet',
+    b'\xbe ', b'\xbe%', b'\xbe-', b'\xbe.', b'\xbe/', b'\xbe3', b'\xbe4', b'\xbe5', b'\xbe6',
+    b'\xbe7', b'\xbe8', b'\xbe9', b'\xbe=', b'\xbeA', b'\xbe_', b'\xbeb', b'\xbed', b'\xbef',
+    b'\xbeg', b'\xbeh', b'\xbel', b'\xbem', b'\xben', b'\xbep', b'\xber', b'\xbeu', b'\xbe',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xc40', b'\xc40', b'\xc41',
+    b'\xc41', b'\xc42', b'\xc42', b'\xc4a', b'\xc4a', b'\xc4c', b'\xc4c', b'\xc4e', b'\xc4e',
+    b'\xc4i', b'\xc4i', b'\xc4o', b'\xc4o', b'\xc4s', b'\xc4s', b'\xc4t', b'\xc4t', b'\xc4 ',
+    b'\xc4%', b'\xc4-', b'\xc4.', b'\xc4/', b'\xc43', b'\xc44', b'\xc45', b'\xc46', b'\xc47',
+    b'\xc48', b'\xc49', b'\xc4=', b'\xc4A', b'\xc4_', b'\xc4b', b'\xc4d', b'\xc4f', b'\xc4g',
+    b'\xc4h', b'\xc4l', b'\xc4m', b'\xc4n', b'\xc4p', b'\xc4r', b'\xc4u', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4',
+    b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xbb0', b'\xbb0', b'\xbb0', b'\xbb0', b'\xbb1',
+    b'\xbb1', b'\xbb1', b'\xbb1', b'\xbb2', b'\xbb2', b'\xbb2', b'\xbb2', b'\xbba', b'\xbba',
+    b'\xbba', b'\xbba', b'\xbbc', b'\xbbc', b'\xbbc', b'\xbbc', b'\xbbe', b'\xbbe', b'\xbbe',
+    b'\xbbe', b'\xbbi', b'\xbbi', b'\xbbi', b'\xbbi', b'\xbbo', b'\xbbo', b'\xbbo', b'\xbbo',
+    b'\xbbs', b'\xbbs', b'\xbbs', b'\xbbs', b'\xbbt', b'\xbbt', b'\xbbt', b'\xbbt', b'\xbb ',
+    b'\xbb ', b'\xbb%', b'\xbb%', b'\xbb-', b'\xbb-', b'\xbb.', b'\xbb.', b'\xbb/', b'\xbb/',
+    b'\xbb3', b'\xbb3', b'\xbb4', b'\xbb4', b'\xbb5', b'\xbb5', b'\xbb6', b'\xbb6', b'\xbb7',
+    b'\xbb7', b'\xbb8', b'\xbb8', b'\xbb9', b'\xbb9', b'\xbb=', b'\xbb=', b'\xbbA', b'\xbbA',
+    b'\xbb_', b'\xbb_', b'\xbbb', b'\xbbb', b'\xbbd', b'\xbbd', b'\xbbf', b'\xbbf', b'\xbbg',
+    b'\xbbg', b'\xbbh', b'\xbbh', b'\xbbl', b'\xbbl', b'\xbbm', b'\xbbm', b'\xbbn', b'\xbbn',
+    b'\xbbp', b'\xbbp', b'\xbbr', b'\xbbr', b'\xbbu', b'\xbbu', b'\xbb:', b'\xbbB', b'\xbbC',
+    b'\xbbD', b'\xbbE', b'\xbbF', b'\xbbG', b'\xbbH', b'\xbbI', b'\xbbJ', b'\xbbK', b'\xbbL',
+    b'\xbbM', b'\xbbN', b'\xbbO', b'\xbbP', b'\xbbQ', b'\xbbR', b'\xbbS', b'\xbbT', b'\xbbU',
+    b'\xbbV', b'\xbbW', b'\xbbY', b'\xbbj', b'\xbbk', b'\xbbq', b'\xbbv', b'\xbbw', b'\xbbx',
+    b'\xbby', b'\xbbz', b'\xbb', b'\xbb', b'\xbb', b'\xbb', b'\xbd0', b'\xbd0', b'\xbd0', b'\xbd0',
+    b'\xbd1', b'\xbd1', b'\xbd1', b'\xbd1', b'\xbd2', b'\xbd2', b'\xbd2', b'\xbd2', b'\xbda',
+    b'\xbda', b'\xbda', b'\xbda', b'\xbdc', b'\xbdc', b'\xbdc', b'\xbdc', b'\xbde', b'\xbde',
+    b'\xbde', b'\xbde', b'\xbdi', b'\xbdi', b'\xbdi', b'\xbdi', b'\xbdo', b'\xbdo', b'\xbdo',
+    b'\xbdo', b'\xbds', b'\xbds', b'\xbds', b'\xbds', b'\xbdt', b'\xbdt', b'\xbdt', b'\xbdt',
+    b'\xbd ', b'\xbd ', b'\xbd%', b'\xbd%', b'\xbd-', b'\xbd-', b'\xbd.', b'\xbd.', b'\xbd/',
+    b'\xbd/', b'\xbd3', b'\xbd3', b'\xbd4', b'\xbd4', b'\xbd5', b'\xbd5', b'\xbd6', b'\xbd6',
+    b'\xbd7', b'\xbd7', b'\xbd8', b'\xbd8', b'\xbd9', b'\xbd9', b'\xbd=', b'\xbd=', b'\xbdA',
+    b'\xbdA', b'\xbd_', b'\xbd_', b'\xbdb', b'\xbdb', b'\xbdd', b'\xbdd', b'\xbdf', b'\xbdf',
+    b'\xbdg', b'\xbdg', b'\xbdh', b'\xbdh', b'\xbdl', b'\xbdl', b'\xbdm', b'\xbdm', b'\xbdn',
+    b'\xbdn', b'\xbdp', b'\xbdp', b'\xbdr', b'\xbdr', b'\xbdu', b'\xbdu', b'\xbd:', b'\xbdB',
+    b'\xbdC', b'\xbdD', b'\xbdE', b'\xbdF', b'\xbdG', b'\xbdH', b'\xbdI', b'\xbdJ', b'\xbdK',
+    b'\xbdL', b'\xbdM', b'\xbdN', b'\xbdO', b'\xbdP', b'\xbdQ', b'\xbdR', b'\xbdS', b'\xbdT',
+    b'\xbdU', b'\xbdV', b'\xbdW', b'\xbdY', b'\xbdj', b'\xbdk', b'\xbdq', b'\xbdv', b'\xbdw',
+    b'\xbdx', b'\xbdy', b'\xbdz', b'\xbd', b'\xbd', b'\xbd', b'\xbd', b'\xbc0', b'\xbc0', b'\xbc1',
+    b'\xbc1', b'\xbc2', b'\xbc2', b'\xbca', b'\xbca', b'\xbcc', b'\xbcc', b'\xbce', b'\xbce',
+    b'\xbci', b'\xbci', b'\xbco', b'\xbco', b'\xbcs', b'\xbcs', b'\xbct', b'\xbct', b'\xbc ',
+    b'\xbc%', b'\xbc-', b'\xbc.', b'\xbc/', b'\xbc3', b'\xbc4', b'\xbc5', b'\xbc6', b'\xbc7',
+    b'\xbc8', b'\xbc9', b'\xbc=', b'\xbcA', b'\xbc_', b'\xbcb', b'\xbcd', b'\xbcf', b'\xbcg',
+    b'\xbch', b'\xbcl', b'\xbcm', b'\xbcn', b'\xbcp', b'\xbcr', b'\xbcu', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbc', b'\xbf0', b'\xbf0', b'\xbf1', b'\xbf1', b'\xbf2',
+    b'\xbf2', b'\xbfa', b'\xbfa', b'\xbfc', b'\xbfc', b'\xbfe', b'\xbfe', b'\xbfi', b'\xbfi',
+    b'\xbfo', b'\xbfo', b'\xbfs', b'\xbfs', b'\xbft', b'\xbft', b'\xbf ', b'\xbf%', b'\xbf-',
+    b'\xbf.', b'\xbf/', b'\xbf3', b'\xbf4', b'\xbf5', b'\xbf6', b'\xbf7', b'\xbf8', b'\xbf9',
+    b'\xbf=', b'\xbfA', b'\xbf_', b'\xbfb', b'\xbfd', b'\xbff', b'\xbfg', b'\xbfh', b'\xbfl',
+    b'\xbfm', b'\xbfn', b'\xbfp', b'\xbfr', b'\xbfu', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xc50', b'\xc50', b'\xc51', b'\xc51', b'\xc52', b'\xc52', b'\xc5a',
+    b'\xc5a', b'\xc5c', b'\xc5c', b'\xc5e', b'\xc5e', b'\xc5i', b'\xc5i', b'\xc5o', b'\xc5o',
+    b'\xc5s', b'\xc5s', b'\xc5t', b'\xc5t', b'\xc5 ', b'\xc5%', b'\xc5-', b'\xc5.', b'\xc5/',
+    b'\xc53', b'\xc54', b'\xc55', b'\xc56', b'\xc57', b'\xc58', b'\xc59', b'\xc5=', b'\xc5A',
+    b'\xc5_', b'\xc5b', b'\xc5d', b'\xc5f', b'\xc5g', b'\xc5h', b'\xc5l', b'\xc5m', b'\xc5n',
+    b'\xc5p', b'\xc5r', b'\xc5u', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5',
+    b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5', b'\xc5',
+    b'\xc5', b'\xe70', b'\xe70', b'\xe71', b'\xe71', b'\xe72', b'\xe72', b'\xe7a', b'\xe7a',
+    b'\xe7c', b'\xe7c', b'\xe7e', b'\xe7e', b'\xe7i', b'\xe7i', b'\xe7o', b'\xe7o', b'\xe7s',
+    b'\xe7s', b'\xe7t', b'\xe7t', b'\xe7 ', b'\xe7%', b'\xe7-', b'\xe7.', b'\xe7/', b'\xe73',
+    b'\xe74', b'\xe75', b'\xe76', b'\xe77', b'\xe78', b'\xe79', b'\xe7=', b'\xe7A', b'\xe7_',
+    b'\xe7b', b'\xe7d', b'\xe7f', b'\xe7g', b'\xe7h', b'\xe7l', b'\xe7m', b'\xe7n', b'\xe7p',
+    b'\xe7r', b'\xe7u', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7', b'\xe7',
+    b'\xbc0', b'\xbc0', b'\xbc0', b'\xbc0', b'\xbc1', b'\xbc1', b'\xbc1', b'\xbc1', b'\xbc2',
+    b'\xbc2', b'\xbc2', b'\xbc2', b'\xbca', b'\xbca', b'\xbca', b'\xbca', b'\xbcc', b'\xbcc',
+    b'\xbcc', b'\xbcc', b'\xbce', b'\xbce', b'\xbce', b'\xbce', b'\xbci', b'\xbci', b'\xbci',
+    b'\xbci', b'\xbco', b'\xbco', b'\xbco', b'\xbco', b'\xbcs', b'\xbcs', b'\xbcs', b'\xbcs',
+    b'\xbct', b'\xbct', b'\xbct', b'\xbct', b'\xbc ', b'\xbc ', b'\xbc%', b'\xbc%', b'\xbc-',
+    b'\xbc-', b'\xbc.', b'\xbc.', b'\xbc/', b'\xbc/', b'\xbc3', b'\xbc3', b'\xbc4', b'\xbc4',
+    b'\xbc5', b'\xbc5', b'\xbc6', b'\xbc6', b'\xbc7', b'\xbc7', b'\xbc8', b'\xbc8', b'\xbc9',
+    b'\xbc9', b'\xbc=', b'\xbc=', b'\xbcA', b'\xbcA', b'\xbc_', b'\xbc_', b'\xbcb', b'\xbcb',
+    b'\xbcd', b'\xbcd', b'\xbcf', b'\xbcf', b'\xbcg', b'\xbcg', b'\xbch', b'\xbch', b'\xbcl',
+    b'\xbcl', b'\xbcm', b'\xbcm', b'\xbcn', b'\xbcn', b'\xbcp', b'\xbcp', b'\xbcr', b'\xbcr',
+    b'\xbcu', b'\xbcu', b'\xbc:', b'\xbcB', b'\xbcC', b'\xbcD', b'\xbcE', b'\xbcF', b'\xbcG',
+    b'\xbcH', b'\xbcI', b'\xbcJ', b'\xbcK', b'\xbcL', b'\xbcM', b'\xbcN', b'\xbcO', b'\xbcP',
+    b'\xbcQ', b'\xbcR', b'\xbcS', b'\xbcT', b'\xbcU', b'\xbcV', b'\xbcW', b'\xbcY', b'\xbcj',
+    b'\xbck', b'\xbcq', b'\xbcv', b'\xbcw', b'\xbcx', b'\xbcy', b'\xbcz', b'\xbc', b'\xbc', b'\xbc',
+    b'\xbc', b'\xbf0', b'\xbf0', b'\xbf0', b'\xbf0', b'\xbf1', b'\xbf1', b'\xbf1', b'\xbf1',
+    b'\xbf2', b'\xbf2', b'\xbf2', b'\xbf2', b'\xbfa', b'\xbfa', b'\xbfa', b'\xbfa', b'\xbfc',
+    b'\xbfc', b'\xbfc', b'\xbfc', b'\xbfe', b'\xbfe', b'\xbfe', b'\xbfe', b'\xbfi', b'\xbfi',
+    b'\xbfi', b'\xbfi', b'\xbfo', b'\xbfo', b'\xbfo', b'\xbfo', b'\xbfs', b'\xbfs', b'\xbfs',
+    b'\xbfs', b'\xbft', b'\xbft', b'\xbft', b'\xbft', b'\xbf ', b'\xbf ', b'\xbf%', b'\xbf%',
+    b'\xbf-', b'\xbf-', b'\xbf.', b'\xbf.', b'\xbf/', b'\xbf/', b'\xbf3', b'\xbf3', b'\xbf4',
+    b'\xbf4', b'\xbf5', b'\xbf5', b'\xbf6', b'\xbf6', b'\xbf7', b'\xbf7', b'\xbf8', b'\xbf8',
+    b'\xbf9', b'\xbf9', b'\xbf=', b'\xbf=', b'\xbfA', b'\xbfA', b'\xbf_', b'\xbf_', b'\xbfb',
+    b'\xbfb', b'\xbfd', b'\xbfd', b'\xbff', b'\xbff', b'\xbfg', b'\xbfg', b'\xbfh', b'\xbfh',
+    b'\xbfl', b'\xbfl', b'\xbfm', b'\xbfm', b'\xbfn', b'\xbfn', b'\xbfp', b'\xbfp', b'\xbfr',
+    b'\xbfr', b'\xbfu', b'\xbfu', b'\xbf:', b'\xbfB', b'\xbfC', b'\xbfD', b'\xbfE', b'\xbfF',
+    b'\xbfG', b'\xbfH', b'\xbfI', b'\xbfJ', b'\xbfK', b'\xbfL', b'\xbfM', b'\xbfN', b'\xbfO',
+    b'\xbfP', b'\xbfQ', b'\xbfR', b'\xbfS', b'\xbfT', b'\xbfU', b'\xbfV', b'\xbfW', b'\xbfY',
+    b'\xbfj', b'\xbfk', b'\xbfq', b'\xbfv', b'\xbfw', b'\xbfx', b'\xbfy', b'\xbfz', b'\xbf',
+    b'\xbf', b'\xbf', b'\xbf', b'\xbe0', b'\xbe0', b'\xbe0', b'\xbe0', b'\xbe1', b'\xbe1', b'\xbe1',
+    b'\xbe1', b'\xbe2', b'\xbe2', b'\xbe2', b'\xbe2', b'\xbea', b'\xbea', b'\xbea', b'\xbea',
+    b'\xbec', b'\xbec', b'\xbec', b'\xbec', b'\xbee', b'\xbee', b'\xbee', b'\xbee', b'\xbei',
+    b'\xbei', b'\xbei', b'\xbei', b'\xbeo', b'\xbeo', b'\xbeo', b'\xbeo', b'\xbes', b'\xbes',
+    b'\xbes', b'\xbes', b'\xbet', b'\xbet', b'\xbet', b'\xbet', b'\xbe ', b'\xbe ', b'\xbe%',
+    b'\xbe%', b'\xbe-', b'\xbe-', b'\xbe.', b'\xbe.', b'\xbe/', b'\xbe/', b'\xbe3', b'\xbe3',
+    b'\xbe4', b'\xbe4', b'\xbe5', b'\xbe5', b'\xbe6', b'\xbe6', b'\xbe7', b'\xbe7', b'\xbe8',
+    b'\xbe8', b'\xbe9', b'\xbe9', b'\xbe=', b'\xbe=', b'\xbeA', b'\xbeA', b'\xbe_', b'\xbe_',
+    b'\xbeb', b'\xbeb', b'\xbed', b'\xbed', b'\xbef', b'\xbef', b'\xbeg', b'\xbeg', b'\xbeh',
+    b'\xbeh', b'\xbel', b'\xbel', b'\xbem', b'\xbem', b'\xben', b'\xben', b'\xbep', b'\xbep',
+    b'\xber', b'\xber', b'\xbeu', b'\xbeu', b'\xbe:', b'\xbeB', b'\xbeC', b'\xbeD', b'\xbeE',
+    b'\xbeF', b'\xbeG', b'\xbeH', b'\xbeI', b'\xbeJ', b'\xbeK', b'\xbeL', b'\xbeM', b'\xbeN',
+    b'\xbeO', b'\xbeP', b'\xbeQ', b'\xbeR', b'\xbeS', b'\xbeT', b'\xbeU', b'\xbeV', b'\xbeW',
+    b'\xbeY', b'\xbej', b'\xbek', b'\xbeq', b'\xbev', b'\xbew', b'\xbex', b'\xbey', b'\xbez',
+    b'\xbe', b'\xbe', b'\xbe', b'\xbe', b'\xc40', b'\xc40', b'\xc40', b'\xc40', b'\xc41', b'\xc41',
+    b'\xc41', b'\xc41', b'\xc42', b'\xc42', b'\xc42', b'\xc42', b'\xc4a', b'\xc4a', b'\xc4a',
+    b'\xc4a', b'\xc4c', b'\xc4c', b'\xc4c', b'\xc4c', b'\xc4e', b'\xc4e', b'\xc4e', b'\xc4e',
+    b'\xc4i', b'\xc4i', b'\xc4i', b'\xc4i', b'\xc4o', b'\xc4o', b'\xc4o', b'\xc4o', b'\xc4s',
+    b'\xc4s', b'\xc4s', b'\xc4s', b'\xc4t', b'\xc4t', b'\xc4t', b'\xc4t', b'\xc4 ', b'\xc4 ',
+    b'\xc4%', b'\xc4%', b'\xc4-', b'\xc4-', b'\xc4.', b'\xc4.', b'\xc4/', b'\xc4/', b'\xc43',
+    b'\xc43', b'\xc44', b'\xc44', b'\xc45', b'\xc45', b'\xc46', b'\xc46', b'\xc47', b'\xc47',
+    b'\xc48', b'\xc48', b'\xc49', b'\xc49', b'\xc4=', b'\xc4=', b'\xc4A', b'\xc4A', b'\xc4_',
+    b'\xc4_', b'\xc4b', b'\xc4b', b'\xc4d', b'\xc4d', b'\xc4f', b'\xc4f', b'\xc4g', b'\xc4g',
+    b'\xc4h', b'\xc4h', b'\xc4l', b'\xc4l', b'\xc4m', b'\xc4m', b'\xc4n', b'\xc4n', b'\xc4p',
+    b'\xc4p', b'\xc4r', b'\xc4r', b'\xc4u', b'\xc4u', b'\xc4:', b'\xc4B', b'\xc4C', b'\xc4D',
+    b'\xc4E', b'\xc4F', b'\xc4G', b'\xc4H', b'\xc4I', b'\xc4J', b'\xc4K', b'\xc4L', b'\xc4M',
+    b'\xc4N', b'\xc4O', b'\xc4P', b'\xc4Q', b'\xc4R', b'\xc4S', b'\xc4T', b'\xc4U', b'\xc4V',
+    b'\xc4W', b'\xc4Y', b'\xc4j', b'\xc4k', b'\xc4q', b'\xc4v', b'\xc4w', b'\xc4x', b'\xc4y',
+    b'\xc4z', b'\xc4', b'\xc4', b'\xc4', b'\xc4', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc0', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1',
+    b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9',
+    b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2',
+    b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd5', b'\xd5', b'\xd5',
+    b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5',
+    b'\xd5', b'\xd5', b'\xd5', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda',
+    b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xdb',
+    b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb',
+    b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee',
+    b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee',
+    b'\xee', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0',
+    b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf2', b'\xf2', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xcc', b'\xc00', b'\xc01', b'\xc02', b'\xc0a', b'\xc0c', b'\xc0e', b'\xc0i', b'\xc0o',
+    b'\xc0s', b'\xc0t', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc10', b'\xc11', b'\xc12', b'\xc1a', b'\xc1c', b'\xc1e',
+    b'\xc1i', b'\xc1o', b'\xc1s', b'\xc1t', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1',
+    b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1',
+    b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc80', b'\xc81', b'\xc82', b'\xc8a',
+    b'\xc8c', b'\xc8e', b'\xc8i', b'\xc8o', b'\xc8s', b'\xc8t', b'\xc8', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc90', b'\xc91',
+    b'\xc92', b'\xc9a', b'\xc9c', b'\xc9e', b'\xc9i', b'\xc9o', b'\xc9s', b'\xc9t', b'\xc9',
+    b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9',
+    b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9',
+    b'\xc9', b'\xca0', b'\xca1', b'\xca2', b'\xcaa', b'\xcac', b'\xcae', b'\xcai', b'\xcao',
+    b'\xcas', b'\xcat', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xca', b'\xcd0', b'\xcd1', b'\xcd2', b'\xcda', b'\xcdc', b'\xcde',
+    b'\xcdi', b'\xcdo', b'\xcds', b'\xcdt', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xd20', b'\xd21', b'\xd22', b'\xd2a',
+    b'\xd2c', b'\xd2e', b'\xd2i', b'\xd2o', b'\xd2s', b'\xd2t', b'\xd2', b'\xd2', b'\xd2', b'\xd2',
+    b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2',
+    b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd50', b'\xd51',
+    b'\xd52', b'\xd5a', b'\xd5c', b'\xd5e', b'\xd5i', b'\xd5o', b'\xd5s', b'\xd5t', b'\xd5',
+    b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5',
+    b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5',
+    b'\xd5', b'\xc00', b'\xc00', b'\xc01', b'\xc01', b'\xc02', b'\xc02', b'\xc0a', b'\xc0a',
+    b'\xc0c', b'\xc0c', b'\xc0e', b'\xc0e', b'\xc0i', b'\xc0i', b'\xc0o', b'\xc0o', b'\xc0s',
+    b'\xc0s', b'\xc0t', b'\xc0t', b'\xc0 ', b'\xc0%', b'\xc0-', b'\xc0.', b'\xc0/', b'\xc03',
+    b'\xc04', b'\xc05', b'\xc06', b'\xc07', b'\xc08', b'\xc09', b'\xc0=', b'\xc0A', b'\xc0_',
+    b'\xc0b', b'\xc0d', b'\xc0f', b'\xc0g', b'\xc0h', b'\xc0l', b'\xc0m', b'\xc0n', b'\xc0p',
+    b'\xc0r', b'\xc0u', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc0',
+    b'\xc10', b'\xc10', b'\xc11', b'\xc11', b'\xc12', b'\xc12', b'\xc1a', b'\xc1a', b'\xc1c',
+    b'\xc1c', b'\xc1e', b'\xc1e', b'\xc1i', b'\xc1i', b'\xc1o', b'\xc1o', b'\xc1s', b'\xc1s',
+    b'\xc1t', b'\xc1t', b'\xc1 ', b'\xc1%', b'\xc1-', b'\xc1.', b'\xc1/', b'\xc13', b'\xc14',
+    b'\xc15', b'\xc16', b'\xc17', b'\xc18', b'\xc19', b'\xc1=', b'\xc1A', b'\xc1_', b'\xc1b',
+    b'\xc1d', b'\xc1f', b'\xc1g', b'\xc1h', b'\xc1l', b'\xc1m', b'\xc1n', b'\xc1p', b'\xc1r',
+    b'\xc1u', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1',
+    b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc80',
+    b'\xc80', b'\xc81', b'\xc81', b'\xc82', b'\xc82', b'\xc8a', b'\xc8a', b'\xc8c', b'\xc8c',
+    b'\xc8e', b'\xc8e', b'\xc8i', b'\xc8i', b'\xc8o', b'\xc8o', b'\xc8s', b'\xc8s', b'\xc8t',
+    b'\xc8t', b'\xc8 ', b'\xc8%', b'\xc8-', b'\xc8.', b'\xc8/', b'\xc83', b'\xc84', b'\xc85',
+    b'\xc86', b'\xc87', b'\xc88', b'\xc89', b'\xc8=', b'\xc8A', b'\xc8_', b'\xc8b', b'\xc8d',
+    b'\xc8f', b'\xc8g', b'\xc8h', b'\xc8l', b'\xc8m', b'\xc8n', b'\xc8p', b'\xc8r', b'\xc8u',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc90', b'\xc90',
+    b'\xc91', b'\xc91', b'\xc92', b'\xc92', b'\xc9a', b'\xc9a', b'\xc9c', b'\xc9c', b'\xc9e',
+    b'\xc9e', b'\xc9i', b'\xc9i', b'\xc9o', b'\xc9o', b'\xc9s', b'\xc9s', b'\xc9t', b'\xc9t',
+    b'\xc9 ', b'\xc9%', b'\xc9-', b'\xc9.', b'\xc9/', b'\xc93', b'\xc94', b'\xc95', b'\xc96',
+    b'\xc97', b'\xc98', b'\xc99', b'\xc9=', b'\xc9A', b'\xc9_', b'\xc9b', b'\xc9d', b'\xc9f',
+    b'\xc9g', b'\xc9h', b'\xc9l', b'\xc9m', b'\xc9n', b'\xc9p', b'\xc9r', b'\xc9u', b'\xc9',
+    b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9',
+    b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xc00', b'\xc00', b'\xc00',
+    b'\xc00', b'\xc01', b'\xc01', b'\xc01', b'\xc01', b'\xc02', b'\xc02', b'\xc02', b'\xc02',
+    b'\xc0a', b'\xc0a', b'\xc0a', b'\xc0a', b'\xc0c', b'\xc0c', b'\xc0c', b'\xc0c', b'\xc0e',
+    b'\xc0e', b'\xc0e', b'\xc0e', b'\xc0i', b'\xc0i', b'\xc0i', b'\xc0i', b'\xc0o', b'\xc0o',
+    b'\xc0o', b'\xc0o', b'\xc0s', b'\xc0s', b'\xc0s', b'\xc0s', b'\xc0t', b'\xc0t', b'\xc0t',
+    b'\xc0t', b'\xc0 ', b'\xc0 ', b'\xc0%', b'\xc0%', b'\xc0-', b'\xc0-', b'\xc0.', b'\xc0.',
+    b'\xc0/', b'\xc0/', b'\xc03', b'\xc03', b'\xc04', b'\xc04', b'\xc05', b'\xc05', b'\xc06',
+    b'\xc06', b'\xc07', b'\xc07', b'\xc08', b'\xc08', b'\xc09', b'\xc09', b'\xc0=', b'\xc0=',
+    b'\xc0A', b'\xc0A', b'\xc0_', b'\xc0_', b'\xc0b', b'\xc0b', b'\xc0d', b'\xc0d', b'\xc0f',
+    b'\xc0f', b'\xc0g', b'\xc0g', b'\xc0h', b'\xc0h', b'\xc0l', b'\xc0l', b'\xc0m', b'\xc0m',
+    b'\xc0n', b'\xc0n', b'\xc0p', b'\xc0p', b'\xc0r', b'\xc0r', b'\xc0u', b'\xc0u', b'\xc0:',
+    b'\xc0B', b'\xc0C', b'\xc0D', b'\xc0E', b'\xc0F', b'\xc0G', b'\xc0H', b'\xc0I', b'\xc0J',
+    b'\xc0K', b'\xc0L', b'\xc0M', b'\xc0N', b'\xc0O', b'\xc0P', b'\xc0Q', b'\xc0R', b'\xc0S',
+    b'\xc0T', b'\xc0U', b'\xc0V', b'\xc0W', b'\xc0Y', b'\xc0j', b'\xc0k', b'\xc0q', b'\xc0v',
+    b'\xc0w', b'\xc0x', b'\xc0y', b'\xc0z', b'\xc0', b'\xc0', b'\xc0', b'\xc0', b'\xc10', b'\xc10',
+    b'\xc10', b'\xc10', b'\xc11', b'\xc11', b'\xc11', b'\xc11', b'\xc12', b'\xc12', b'\xc12',
+    b'\xc12', b'\xc1a', b'\xc1a', b'\xc1a', b'\xc1a', b'\xc1c', b'\xc1c', b'\xc1c', b'\xc1c',
+    b'\xc1e', b'\xc1e', b'\xc1e', b'\xc1e', b'\xc1i', b'\xc1i', b'\xc1i', b'\xc1i', b'\xc1o',
+    b'\xc1o', b'\xc1o', b'\xc1o', b'\xc1s', b'\xc1s', b'\xc1s', b'\xc1s', b'\xc1t', b'\xc1t',
+    b'\xc1t', b'\xc1t', b'\xc1 ', b'\xc1 ', b'\xc1%', b'\xc1%', b'\xc1-', b'\xc1-', b'\xc1.',
+    b'\xc1.', b'\xc1/', b'\xc1/', b'\xc13', b'\xc13', b'\xc14', b'\xc14', b'\xc15', b'\xc15',
+    b'\xc16', b'\xc16', b'\xc17', b'\xc17', b'\xc18', b'\xc18', b'\xc19', b'\xc19', b'\xc1=',
+    b'\xc1=', b'\xc1A', b'\xc1A', b'\xc1_', b'\xc1_', b'\xc1b', b'\xc1b', b'\xc1d', b'\xc1d',
+    b'\xc1f', b'\xc1f', b'\xc1g', b'\xc1g', b'\xc1h', b'\xc1h', b'\xc1l', b'\xc1l', b'\xc1m',
+    b'\xc1m', b'\xc1n', b'\xc1n', b'\xc1p', b'\xc1p', b'\xc1r', b'\xc1r', b'\xc1u', b'\xc1u',
+    b'\xc1:', b'\xc1B', b'\xc1C', b'\xc1D', b'\xc1E', b'\xc1F', b'\xc1G', b'\xc1H', b'\xc1I',
+    b'\xc1J', b'\xc1K', b'\xc1L', b'\xc1M', b'\xc1N', b'\xc1O', b'\xc1P', b'\xc1Q', b'\xc1R',
+    b'\xc1S', b'\xc1T', b'\xc1U', b'\xc1V', b'\xc1W', b'\xc1Y', b'\xc1j', b'\xc1k', b'\xc1q',
+    b'\xc1v', b'\xc1w', b'\xc1x', b'\xc1y', b'\xc1z', b'\xc1', b'\xc1', b'\xc1', b'\xc1', b'\xc50',
+    b'\xc50', b'\xc50', b'\xc50', b'\xc51', b'\xc51', b'\xc51', b'\xc51', b'\xc52', b'\xc52',
+    b'\xc52', b'\xc52', b'\xc5a', b'\xc5a', b'\xc5a', b'\xc5a', b'\xc5c', b'\xc5c', b'\xc5c',
+    b'\xc5c', b'\xc5e', b'\xc5e', b'\xc5e', b'\xc5e', b'\xc5i', b'\xc5i', b'\xc5i', b'\xc5i',
+    b'\xc5o', b'\xc5o', b'\xc5o', b'\xc5o', b'\xc5s', b'\xc5s', b'\xc5s', b'\xc5s', b'\xc5t',
+    b'\xc5t', b'\xc5t', b'\xc5t', b'\xc5 ', b'\xc5 ', b'\xc5%', b'\xc5%', b'\xc5-', b'\xc5-',
+    b'\xc5.', b'\xc5.', b'\xc5/', b'\xc5/', b'\xc53', b'\xc53', b'\xc54', b'\xc54', b'\xc55',
+    b'\xc55', b'\xc56', b'\xc56', b'\xc57', b'\xc57', b'\xc58', b'\xc58', b'\xc59', b'\xc59',
+    b'\xc5=', b'\xc5=', b'\xc5A', b'\xc5A', b'\xc5_', b'\xc5_', b'\xc5b', b'\xc5b', b'\xc5d',
+    b'\xc5d', b'\xc5f', b'\xc5f', b'\xc5g', b'\xc5g', b'\xc5h', b'\xc5h', b'\xc5l', b'\xc5l',
+    b'\xc5m', b'\xc5m', b'\xc5n', b'\xc5n', b'\xc5p', b'\xc5p', b'\xc5r', b'\xc5r', b'\xc5u',
+    b'\xc5u', b'\xc5:', b'\xc5B', b'\xc5C', b'\xc5D', b'\xc5E', b'\xc5F', b'\xc5G', b'\xc5H',
+    b'\xc5I', b'\xc5J', b'\xc5K', b'\xc5L', b'\xc5M', b'\xc5N', b'\xc5O', b'\xc5P', b'\xc5Q',
+    b'\xc5R', b'\xc5S', b'\xc5T', b'\xc5U', b'\xc5V', b'\xc5W', b'\xc5Y', b'\xc5j', b'\xc5k',
+    b'\xc5q', b'\xc5v', b'\xc5w', b'\xc5x', b'\xc5y', b'\xc5z', b'\xc5', b'\xc5', b'\xc5', b'\xc5',
+    b'\xe70', b'\xe70', b'\xe70', b'\xe70', b'\xe71', b'\xe71', b'\xe71', b'\xe71', b'\xe72',
+    b'\xe72', b'\xe72', b'\xe72', b'\xe7a', b'\xe7a', b'\xe7a', b'\xe7a', b'\xe7c', b'\xe7c',
+    b'\xe7c', b'\xe7c', b'\xe7e', b'\xe7e', b'\xe7e', b'\xe7e', b'\xe7i', b'\xe7i', b'\xe7i',
+    b'\xe7i', b'\xe7o', b'\xe7o', b'\xe7o', b'\xe7o', b'\xe7s', b'\xe7s', b'\xe7s', b'\xe7s',
+    b'\xe7t', b'\xe7t', b'\xe7t', b'\xe7t', b'\xe7 ', b'\xe7 ', b'\xe7%', b'\xe7%', b'\xe7-',
+    b'\xe7-', b'\xe7.', b'\xe7.', b'\xe7/', b'\xe7/', b'\xe73', b'\xe73', b'\xe74', b'\xe74',
+    b'\xe75', b'\xe75', b'\xe76', b'\xe76', b'\xe77', b'\xe77', b'\xe78', b'\xe78', b'\xe79',
+    b'\xe79', b'\xe7=', b'\xe7=', b'\xe7A', b'\xe7A', b'\xe7_', b'\xe7_', b'\xe7b', b'\xe7b',
+    b'\xe7d', b'\xe7d', b'\xe7f', b'\xe7f', b'\xe7g', b'\xe7g', b'\xe7h', b'\xe7h', b'\xe7l',
+    b'\xe7l', b'\xe7m', b'\xe7m', b'\xe7n', b'\xe7n', b'\xe7p', b'\xe7p', b'\xe7r', b'\xe7r',
+    b'\xe7u', b'\xe7u', b'\xe7:', b'\xe7B', b'\xe7C', b'\xe7D', b'\xe7E', b'\xe7F', b'\xe7G',
+    b'\xe7H', b'\xe7I', b'\xe7J', b'\xe7K', b'\xe7L', b'\xe7M', b'\xe7N', b'\xe7O', b'\xe7P',
+    b'\xe7Q', b'\xe7R', b'\xe7S', b'\xe7T', b'\xe7U', b'\xe7V', b'\xe7W', b'\xe7Y', b'\xe7j',
+    b'\xe7k', b'\xe7q', b'\xe7v', b'\xe7w', b'\xe7x', b'\xe7y', b'\xe7z', b'\xe7', b'\xe7', b'\xe7',
+    b'\xe7', b'\xc60', b'\xc60', b'\xc61', b'\xc61', b'\xc62', b'\xc62', b'\xc6a', b'\xc6a',
+    b'\xc6c', b'\xc6c', b'\xc6e', b'\xc6e', b'\xc6i', b'\xc6i', b'\xc6o', b'\xc6o', b'\xc6s',
+    b'\xc6s', b'\xc6t', b'\xc6t', b'\xc6 ', b'\xc6%', b'\xc6-', b'\xc6.', b'\xc6/', b'\xc63',
+    b'\xc64', b'\xc65', b'\xc66', b'\xc67', b'\xc68', b'\xc69', b'\xc6=', b'\xc6A', b'\xc6_',
+    b'\xc6b', b'\xc6d', b'\xc6f', b'\xc6g', b'\xc6h', b'\xc6l', b'\xc6m', b'\xc6n', b'\xc6p',
+    b'\xc6r', b'\xc6u', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xc6',
+    b'\xe40', b'\xe40', b'\xe41', b'\xe41', b'\xe42', b'\xe42', b'\xe4a', b'\xe4a', b'\xe4c',
+    b'\xe4c', b'\xe4e', b'\xe4e', b'\xe4i', b'\xe4i', b'\xe4o', b'\xe4o', b'\xe4s', b'\xe4s',
+    b'\xe4t', b'\xe4t', b'\xe4 ', b'\xe4%', b'\xe4-', b'\xe4.', b'\xe4/', b'\xe43', b'\xe44',
+    b'\xe45', b'\xe46', b'\xe47', b'\xe48', b'\xe49', b'\xe4=', b'\xe4A', b'\xe4_', b'\xe4b',
+    b'\xe4d', b'\xe4f', b'\xe4g', b'\xe4h', b'\xe4l', b'\xe4m', b'\xe4n', b'\xe4p', b'\xe4r',
+    b'\xe4u', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4',
+    b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xe80',
+    b'\xe80', b'\xe81', b'\xe81', b'\xe82', b'\xe82', b'\xe8a', b'\xe8a', b'\xe8c', b'\xe8c',
+    b'\xe8e', b'\xe8e', b'\xe8i', b'\xe8i', b'\xe8o', b'\xe8o', b'\xe8s', b'\xe8s', b'\xe8t',
+    b'\xe8t', b'\xe8 ', b'\xe8%', b'\xe8-', b'\xe8.', b'\xe8/', b'\xe83', b'\xe84', b'\xe85',
+    b'\xe86', b'\xe87', b'\xe88', b'\xe89', b'\xe8=', b'\xe8A', b'\xe8_', b'\xe8b', b'\xe8d',
+    b'\xe8f', b'\xe8g', b'\xe8h', b'\xe8l', b'\xe8m', b'\xe8n', b'\xe8p', b'\xe8r', b'\xe8u',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8',
+    b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe8', b'\xe90', b'\xe90',
+    b'\xe91', b'\xe91', b'\xe92', b'\xe92', b'\xe9a', b'\xe9a', b'\xe9c', b'\xe9c', b'\xe9e',
+    b'\xe9e', b'\xe9i', b'\xe9i', b'\xe9o', b'\xe9o', b'\xe9s', b'\xe9s', b'\xe9t', b'\xe9t',
+    b'\xe9 ', b'\xe9%', b'\xe9-', b'\xe9.', b'\xe9/', b'\xe93', b'\xe94', b'\xe95', b'\xe96',
+    b'\xe97', b'\xe98', b'\xe99', b'\xe9=', b'\xe9A', b'\xe9_', b'\xe9b', b'\xe9d', b'\xe9f',
+    b'\xe9g', b'\xe9h', b'\xe9l', b'\xe9m', b'\xe9n', b'\xe9p', b'\xe9r', b'\xe9u', b'\xe9',
+    b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9',
+    b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xe9', b'\xc60', b'\xc60', b'\xc60',
+    b'\xc60', b'\xc61', b'\xc61', b'\xc61', b'\xc61', b'\xc62', b'\xc62', b'\xc62', b'\xc62',
+    b'\xc6a', b'\xc6a', b'\xc6a', b'\xc6a', b'\xc6c', b'\xc6c', b'\xc6c', b'\xc6c', b'\xc6e',
+    b'\xc6e', b'\xc6e', b'\xc6e', b'\xc6i', b'\xc6i', b'\xc6i', b'\xc6i', b'\xc6o', b'\xc6o',
+    b'\xc6o', b'\xc6o', b'\xc6s', b'\xc6s', b'\xc6s', b'\xc6s', b'\xc6t', b'\xc6t', b'\xc6t',
+    b'\xc6t', b'\xc6 ', b'\xc6 ', b'\xc6%', b'\xc6%', b'\xc6-', b'\xc6-', b'\xc6.', b'\xc6.',
+    b'\xc6/', b'\xc6/', b'\xc63', b'\xc63', b'\xc64', b'\xc64', b'\xc65', b'\xc65', b'\xc66',
+    b'\xc66', b'\xc67', b'\xc67', b'\xc68', b'\xc68', b'\xc69', b'\xc69', b'\xc6=', b'\xc6=',
+    b'\xc6A', b'\xc6A', b'\xc6_', b'\xc6_', b'\xc6b', b'\xc6b', b'\xc6d', b'\xc6d', b'\xc6f',
+    b'\xc6f', b'\xc6g', b'\xc6g', b'\xc6h', b'\xc6h', b'\xc6l', b'\xc6l', b'\xc6m', b'\xc6m',
+    b'\xc6n', b'\xc6n', b'\xc6p', b'\xc6p', b'\xc6r', b'\xc6r', b'\xc6u', b'\xc6u', b'\xc6:',
+    b'\xc6B', b'\xc6C', b'\xc6D', b'\xc6E', b'\xc6F', b'\xc6G', b'\xc6H', b'\xc6I', b'\xc6J',
+    b'\xc6K', b'\xc6L', b'\xc6M', b'\xc6N', b'\xc6O', b'\xc6P', b'\xc6Q', b'\xc6R', b'\xc6S',
+    b'\xc6T', b'\xc6U', b'\xc6V', b'\xc6W', b'\xc6Y', b'\xc6j', b'\xc6k', b'\xc6q', b'\xc6v',
+    b'\xc6w', b'\xc6x', b'\xc6y', b'\xc6z', b'\xc6', b'\xc6', b'\xc6', b'\xc6', b'\xe40', b'\xe40',
+    b'\xe40', b'\xe40', b'\xe41', b'\xe41', b'\xe41', b'\xe41', b'\xe42', b'\xe42', b'\xe42',
+    b'\xe42', b'\xe4a', b'\xe4a', b'\xe4a', b'\xe4a', b'\xe4c', b'\xe4c', b'\xe4c', b'\xe4c',
+    b'\xe4e', b'\xe4e', b'\xe4e', b'\xe4e', b'\xe4i', b'\xe4i', b'\xe4i', b'\xe4i', b'\xe4o',
+    b'\xe4o', b'\xe4o', b'\xe4o', b'\xe4s', b'\xe4s', b'\xe4s', b'\xe4s', b'\xe4t', b'\xe4t',
+    b'\xe4t', b'\xe4t', b'\xe4 ', b'\xe4 ', b'\xe4%', b'\xe4%', b'\xe4-', b'\xe4-', b'\xe4.',
+    b'\xe4.', b'\xe4/', b'\xe4/', b'\xe43', b'\xe43', b'\xe44', b'\xe44', b'\xe45', b'\xe45',
+    b'\xe46', b'\xe46', b'\xe47', b'\xe47', b'\xe48', b'\xe48', b'\xe49', b'\xe49', b'\xe4=',
+    b'\xe4=', b'\xe4A', b'\xe4A', b'\xe4_', b'\xe4_', b'\xe4b', b'\xe4b', b'\xe4d', b'\xe4d',
+    b'\xe4f', b'\xe4f', b'\xe4g', b'\xe4g', b'\xe4h', b'\xe4h', b'\xe4l', b'\xe4l', b'\xe4m',
+    b'\xe4m', b'\xe4n', b'\xe4n', b'\xe4p', b'\xe4p', b'\xe4r', b'\xe4r', b'\xe4u', b'\xe4u',
+    b'\xe4:', b'\xe4B', b'\xe4C', b'\xe4D', b'\xe4E', b'\xe4F', b'\xe4G', b'\xe4H', b'\xe4I',
+    b'\xe4J', b'\xe4K', b'\xe4L', b'\xe4M', b'\xe4N', b'\xe4O', b'\xe4P', b'\xe4Q', b'\xe4R',
+    b'\xe4S', b'\xe4T', b'\xe4U', b'\xe4V', b'\xe4W', b'\xe4Y', b'\xe4j', b'\xe4k', b'\xe4q',
+    b'\xe4v', b'\xe4w', b'\xe4x', b'\xe4y', b'\xe4z', b'\xe4', b'\xe4', b'\xe4', b'\xe4', b'\xec0',
+    b'\xec0', b'\xec1', b'\xec1', b'\xec2', b'\xec2', b'\xeca', b'\xeca', b'\xecc', b'\xecc',
+    b'\xece', b'\xece', b'\xeci', b'\xeci', b'\xeco', b'\xeco', b'\xecs', b'\xecs', b'\xect',
+    b'\xect', b'\xec ', b'\xec%', b'\xec-', b'\xec.', b'\xec/', b'\xec3', b'\xec4', b'\xec5',
+    b'\xec6', b'\xec7', b'\xec8', b'\xec9', b'\xec=', b'\xecA', b'\xec_', b'\xecb', b'\xecd',
+    b'\xecf', b'\xecg', b'\xech', b'\xecl', b'\xecm', b'\xecn', b'\xecp', b'\xecr', b'\xecu',
+    b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec',
+    b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xec', b'\xed0', b'\xed0',
+    b'\xed1', b'\xed1', b'\xed2', b'\xed2', b'\xeda', b'\xeda', b'\xedc', b'\xedc', b'\xede',
+    b'\xede', b'\xedi', b'\xedi', b'\xedo', b'\xedo', b'\xeds', b'\xeds', b'\xedt', b'\xedt',
+    b'\xed ', b'\xed%', b'\xed-', b'\xed.', b'\xed/', b'\xed3', b'\xed4', b'\xed5', b'\xed6',
+    b'\xed7', b'\xed8', b'\xed9', b'\xed=', b'\xedA', b'\xed_', b'\xedb', b'\xedd', b'\xedf',
+    b'\xedg', b'\xedh', b'\xedl', b'\xedm', b'\xedn', b'\xedp', b'\xedr', b'\xedu', b'\xed',
+    b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed',
+    b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xed', b'\xc70', b'\xc71', b'\xc72',
+    b'\xc7a', b'\xc7c', b'\xc7e', b'\xc7i', b'\xc7o', b'\xc7s', b'\xc7t', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xcf0',
+    b'\xcf1', b'\xcf2', b'\xcfa', b'\xcfc', b'\xcfe', b'\xcfi', b'\xcfo', b'\xcfs', b'\xcft',
+    b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xea0', b'\xea1', b'\xea2', b'\xeaa', b'\xeac', b'\xeae', b'\xeai',
+    b'\xeao', b'\xeas', b'\xeat', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xeb0', b'\xeb1', b'\xeb2', b'\xeba', b'\xebc',
+    b'\xebe', b'\xebi', b'\xebo', b'\xebs', b'\xebt', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb',
+    b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb',
+    b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xc70', b'\xc70', b'\xc71',
+    b'\xc71', b'\xc72', b'\xc72', b'\xc7a', b'\xc7a', b'\xc7c', b'\xc7c', b'\xc7e', b'\xc7e',
+    b'\xc7i', b'\xc7i', b'\xc7o', b'\xc7o', b'\xc7s', b'\xc7s', b'\xc7t', b'\xc7t', b'\xc7 ',
+    b'\xc7%', b'\xc7-', b'\xc7.', b'\xc7/', b'\xc73', b'\xc74', b'\xc75', b'\xc76', b'\xc77',
+    b'\xc78', b'\xc79', b'\xc7=', b'\xc7A', b'\xc7_', b'\xc7b', b'\xc7d', b'\xc7f', b'\xc7g',
+    b'\xc7h', b'\xc7l', b'\xc7m', b'\xc7n', b'\xc7p', b'\xc7r', b'\xc7u', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xc7', b'\xcf0', b'\xcf0', b'\xcf1', b'\xcf1', b'\xcf2',
+    b'\xcf2', b'\xcfa', b'\xcfa', b'\xcfc', b'\xcfc', b'\xcfe', b'\xcfe', b'\xcfi', b'\xcfi',
+    b'\xcfo', b'\xcfo', b'\xcfs', b'\xcfs', b'\xcft', b'\xcft', b'\xcf ', b'\xcf%', b'\xcf-',
+    b'\xcf.', b'\xcf/', b'\xcf3', b'\xcf4', b'\xcf5', b'\xcf6', b'\xcf7', b'\xcf8', b'\xcf9',
+    b'\xcf=', b'\xcfA', b'\xcf_', b'\xcfb', b'\xcfd', b'\xcff', b'\xcfg', b'\xcfh', b'\xcfl',
+    b'\xcfm', b'\xcfn', b'\xcfp', b'\xcfr', b'\xcfu', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xea0', b'\xea0', b'\xea1', b'\xea1', b'\xea2', b'\xea2', b'\xeaa',
+    b'\xeaa', b'\xeac', b'\xeac', b'\xeae', b'\xeae', b'\xeai', b'\xeai', b'\xeao', b'\xeao',
+    b'\xeas', b'\xeas', b'\xeat', b'\xeat', b'\xea ', b'\xea%', b'\xea-', b'\xea.', b'\xea/',
+    b'\xea3', b'\xea4', b'\xea5', b'\xea6', b'\xea7', b'\xea8', b'\xea9', b'\xea=', b'\xeaA',
+    b'\xea_', b'\xeab', b'\xead', b'\xeaf', b'\xeag', b'\xeah', b'\xeal', b'\xeam', b'\xean',
+    b'\xeap', b'\xear', b'\xeau', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea', b'\xea',
+    b'\xea', b'\xeb0', b'\xeb0', b'\xeb1', b'\xeb1', b'\xeb2', b'\xeb2', b'\xeba', b'\xeba',
+    b'\xebc', b'\xebc', b'\xebe', b'\xebe', b'\xebi', b'\xebi', b'\xebo', b'\xebo', b'\xebs',
+    b'\xebs', b'\xebt', b'\xebt', b'\xeb ', b'\xeb%', b'\xeb-', b'\xeb.', b'\xeb/', b'\xeb3',
+    b'\xeb4', b'\xeb5', b'\xeb6', b'\xeb7', b'\xeb8', b'\xeb9', b'\xeb=', b'\xebA', b'\xeb_',
+    b'\xebb', b'\xebd', b'\xebf', b'\xebg', b'\xebh', b'\xebl', b'\xebm', b'\xebn', b'\xebp',
+    b'\xebr', b'\xebu', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb',
+    b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xeb',
+    b'\xc70', b'\xc70', b'\xc70', b'\xc70', b'\xc71', b'\xc71', b'\xc71', b'\xc71', b'\xc72',
+    b'\xc72', b'\xc72', b'\xc72', b'\xc7a', b'\xc7a', b'\xc7a', b'\xc7a', b'\xc7c', b'\xc7c',
+    b'\xc7c', b'\xc7c', b'\xc7e', b'\xc7e', b'\xc7e', b'\xc7e', b'\xc7i', b'\xc7i', b'\xc7i',
+    b'\xc7i', b'\xc7o', b'\xc7o', b'\xc7o', b'\xc7o', b'\xc7s', b'\xc7s', b'\xc7s', b'\xc7s',
+    b'\xc7t', b'\xc7t', b'\xc7t', b'\xc7t', b'\xc7 ', b'\xc7 ', b'\xc7%', b'\xc7%', b'\xc7-',
+    b'\xc7-', b'\xc7.', b'\xc7.', b'\xc7/', b'\xc7/', b'\xc73', b'\xc73', b'\xc74', b'\xc74',
+    b'\xc75', b'\xc75', b'\xc76', b'\xc76', b'\xc77', b'\xc77', b'\xc78', b'\xc78', b'\xc79',
+    b'\xc79', b'\xc7=', b'\xc7=', b'\xc7A', b'\xc7A', b'\xc7_', b'\xc7_', b'\xc7b', b'\xc7b',
+    b'\xc7d', b'\xc7d', b'\xc7f', b'\xc7f', b'\xc7g', b'\xc7g', b'\xc7h', b'\xc7h', b'\xc7l',
+    b'\xc7l', b'\xc7m', b'\xc7m', b'\xc7n', b'\xc7n', b'\xc7p', b'\xc7p', b'\xc7r', b'\xc7r',
+    b'\xc7u', b'\xc7u', b'\xc7:', b'\xc7B', b'\xc7C', b'\xc7D', b'\xc7E', b'\xc7F', b'\xc7G',
+    b'\xc7H', b'\xc7I', b'\xc7J', b'\xc7K', b'\xc7L', b'\xc7M', b'\xc7N', b'\xc7O', b'\xc7P',
+    b'\xc7Q', b'\xc7R', b'\xc7S', b'\xc7T', b'\xc7U', b'\xc7V', b'\xc7W', b'\xc7Y', b'\xc7j',
+    b'\xc7k', b'\xc7q', b'\xc7v', b'\xc7w', b'\xc7x', b'\xc7y', b'\xc7z', b'\xc7', b'\xc7', b'\xc7',
+    b'\xc7', b'\xcf0', b'\xcf0', b'\xcf0', b'\xcf0', b'\xcf1', b'\xcf1', b'\xcf1', b'\xcf1',
+    b'\xcf2', b'\xcf2', b'\xcf2', b'\xcf2', b'\xcfa', b'\xcfa', b'\xcfa', b'\xcfa', b'\xcfc',
+    b'\xcfc', b'\xcfc', b'\xcfc', b'\xcfe', b'\xcfe', b'\xcfe', b'\xcfe', b'\xcfi', b'\xcfi',
+    b'\xcfi', b'\xcfi', b'\xcfo', b'\xcfo', b'\xcfo', b'\xcfo', b'\xcfs', b'\xcfs', b'\xcfs',
+    b'\xcfs', b'\xcft', b'\xcft', b'\xcft', b'\xcft', b'\xcf ', b'\xcf ', b'\xcf%', b'\xcf%',
+    b'\xcf-', b'\xcf-', b'\xcf.', b'\xcf.', b'\xcf/', b'\xcf/', b'\xcf3', b'\xcf3', b'\xcf4',
+    b'\xcf4', b'\xcf5', b'\xcf5', b'\xcf6', b'\xcf6', b'\xcf7', b'\xcf7', b'\xcf8', b'\xcf8',
+    b'\xcf9', b'\xcf9', b'\xcf=', b'\xcf=', b'\xcfA', b'\xcfA', b'\xcf_', b'\xcf_', b'\xcfb',
+    b'\xcfb', b'\xcfd', b'\xcfd', b'\xcff', b'\xcff', b'\xcfg', b'\xcfg', b'\xcfh', b'\xcfh',
+    b'\xcfl', b'\xcfl', b'\xcfm', b'\xcfm', b'\xcfn', b'\xcfn', b'\xcfp', b'\xcfp', b'\xcfr',
+    b'\xcfr', b'\xcfu', b'\xcfu', b'\xcf:', b'\xcfB', b'\xcfC', b'\xcfD', b'\xcfE', b'\xcfF',
+    b'\xcfG', b'\xcfH', b'\xcfI', b'\xcfJ', b'\xcfK', b'\xcfL', b'\xcfM', b'\xcfN', b'\xcfO',
+    b'\xcfP', b'\xcfQ', b'\xcfR', b'\xcfS', b'\xcfT', b'\xcfU', b'\xcfV', b'\xcfW', b'\xcfY',
+    b'\xcfj', b'\xcfk', b'\xcfq', b'\xcfv', b'\xcfw', b'\xcfx', b'\xcfy', b'\xcfz', b'\xcf',
+    b'\xcf', b'\xcf', b'\xcf', b'\xc80', b'\xc80', b'\xc80', b'\xc80', b'\xc81', b'\xc81', b'\xc81',
+    b'\xc81', b'\xc82', b'\xc82', b'\xc82', b'\xc82', b'\xc8a', b'\xc8a', b'\xc8a', b'\xc8a',
+    b'\xc8c', b'\xc8c', b'\xc8c', b'\xc8c', b'\xc8e', b'\xc8e', b'\xc8e', b'\xc8e', b'\xc8i',
+    b'\xc8i', b'\xc8i', b'\xc8i', b'\xc8o', b'\xc8o', b'\xc8o', b'\xc8o', b'\xc8s', b'\xc8s',
+    b'\xc8s', b'\xc8s', b'\xc8t', b'\xc8t', b'\xc8t', b'\xc8t', b'\xc8 ', b'\xc8 ', b'\xc8%',
+    b'\xc8%', b'\xc8-', b'\xc8-', b'\xc8.', b'\xc8.', b'\xc8/', b'\xc8/', b'\xc83', b'\xc83',
+    b'\xc84', b'\xc84', b'\xc85', b'\xc85', b'\xc86', b'\xc86', b'\xc87', b'\xc87', b'\xc88',
+    b'\xc88', b'\xc89', b'\xc89', b'\xc8=', b'\xc8=', b'\xc8A', b'\xc8A', b'\xc8_', b'\xc8_',
+    b'\xc8b', b'\xc8b', b'\xc8d', b'\xc8d', b'\xc8f', b'\xc8f', b'\xc8g', b'\xc8g', b'\xc8h',
+    b'\xc8h', b'\xc8l', b'\xc8l', b'\xc8m', b'\xc8m', b'\xc8n', b'\xc8n', b'\xc8p', b'\xc8p',
+    b'\xc8r', b'\xc8r', b'\xc8u', b'\xc8u', b'\xc8:', b'\xc8B', b'\xc8C', b'\xc8D', b'\xc8E',
+    b'\xc8F', b'\xc8G', b'\xc8H', b'\xc8I', b'\xc8J', b'\xc8K', b'\xc8L', b'\xc8M', b'\xc8N',
+    b'\xc8O', b'\xc8P', b'\xc8Q', b'\xc8R', b'\xc8S', b'\xc8T', b'\xc8U', b'\xc8V', b'\xc8W',
+    b'\xc8Y', b'\xc8j', b'\xc8k', b'\xc8q', b'\xc8v', b'\xc8w', b'\xc8x', b'\xc8y', b'\xc8z',
+    b'\xc8', b'\xc8', b'\xc8', b'\xc8', b'\xc90', b'\xc90', b'\xc90', b'\xc90', b'\xc91', b'\xc91',
+    b'\xc91', b'\xc91', b'\xc92', b'\xc92', b'\xc92', b'\xc92', b'\xc9a', b'\xc9a', b'\xc9a',
+    b'\xc9a', b'\xc9c', b'\xc9c', b'\xc9c', b'\xc9c', b'\xc9e', b'\xc9e', b'\xc9e', b'\xc9e',
+    b'\xc9i', b'\xc9i', b'\xc9i', b'\xc9i', b'\xc9o', b'\xc9o', b'\xc9o', b'\xc9o', b'\xc9s',
+    b'\xc9s', b'\xc9s', b'\xc9s', b'\xc9t', b'\xc9t', b'\xc9t', b'\xc9t', b'\xc9 ', b'\xc9 ',
+    b'\xc9%', b'\xc9%', b'\xc9-', b'\xc9-', b'\xc9.', b'\xc9.', b'\xc9/', b'\xc9/', b'\xc93',
+    b'\xc93', b'\xc94', b'\xc94', b'\xc95', b'\xc95', b'\xc96', b'\xc96', b'\xc97', b'\xc97',
+    b'\xc98', b'\xc98', b'\xc99', b'\xc99', b'\xc9=', b'\xc9=', b'\xc9A', b'\xc9A', b'\xc9_',
+    b'\xc9_', b'\xc9b', b'\xc9b', b'\xc9d', b'\xc9d', b'\xc9f', b'\xc9f', b'\xc9g', b'\xc9g',
+    b'\xc9h', b'\xc9h', b'\xc9l', b'\xc9l', b'\xc9m', b'\xc9m', b'\xc9n', b'\xc9n', b'\xc9p',
+    b'\xc9p', b'\xc9r', b'\xc9r', b'\xc9u', b'\xc9u', b'\xc9:', b'\xc9B', b'\xc9C', b'\xc9D',
+    b'\xc9E', b'\xc9F', b'\xc9G', b'\xc9H', b'\xc9I', b'\xc9J', b'\xc9K', b'\xc9L', b'\xc9M',
+    b'\xc9N', b'\xc9O', b'\xc9P', b'\xc9Q', b'\xc9R', b'\xc9S', b'\xc9T', b'\xc9U', b'\xc9V',
+    b'\xc9W', b'\xc9Y', b'\xc9j', b'\xc9k', b'\xc9q', b'\xc9v', b'\xc9w', b'\xc9x', b'\xc9y',
+    b'\xc9z', b'\xc9', b'\xc9', b'\xc9', b'\xc9', b'\xca0', b'\xca0', b'\xca1', b'\xca1', b'\xca2',
+    b'\xca2', b'\xcaa', b'\xcaa', b'\xcac', b'\xcac', b'\xcae', b'\xcae', b'\xcai', b'\xcai',
+    b'\xcao', b'\xcao', b'\xcas', b'\xcas', b'\xcat', b'\xcat', b'\xca ', b'\xca%', b'\xca-',
+    b'\xca.', b'\xca/', b'\xca3', b'\xca4', b'\xca5', b'\xca6', b'\xca7', b'\xca8', b'\xca9',
+    b'\xca=', b'\xcaA', b'\xca_', b'\xcab', b'\xcad', b'\xcaf', b'\xcag', b'\xcah', b'\xcal',
+    b'\xcam', b'\xcan', b'\xcap', b'\xcar', b'\xcau', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca', b'\xca',
+    b'\xca', b'\xca', b'\xca', b'\xcd0', b'\xcd0', b'\xcd1', b'\xcd1', b'\xcd2', b'\xcd2', b'\xcda',
+    b'\xcda', b'\xcdc', b'\xcdc', b'\xcde', b'\xcde', b'\xcdi', b'\xcdi', b'\xcdo', b'\xcdo',
+    b'\xcds', b'\xcds', b'\xcdt', b'\xcdt', b'\xcd ', b'\xcd%', b'\xcd-', b'\xcd.', b'\xcd/',
+    b'\xcd3', b'\xcd4', b'\xcd5', b'\xcd6', b'\xcd7', b'\xcd8', b'\xcd9', b'\xcd=', b'\xcdA',
+    b'\xcd_', b'\xcdb', b'\xcdd', b'\xcdf', b'\xcdg', b'\xcdh', b'\xcdl', b'\xcdm', b'\xcdn',
+    b'\xcdp', b'\xcdr', b'\xcdu', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xd20', b'\xd20', b'\xd21', b'\xd21', b'\xd22', b'\xd22', b'\xd2a', b'\xd2a',
+    b'\xd2c', b'\xd2c', b'\xd2e', b'\xd2e', b'\xd2i', b'\xd2i', b'\xd2o', b'\xd2o', b'\xd2s',
+    b'\xd2s', b'\xd2t', b'\xd2t', b'\xd2 ', b'\xd2%', b'\xd2-', b'\xd2.', b'\xd2/', b'\xd23',
+    b'\xd24', b'\xd25', b'\xd26', b'\xd27', b'\xd28', b'\xd29', b'\xd2=', b'\xd2A', b'\xd2_',
+    b'\xd2b', b'\xd2d', b'\xd2f', b'\xd2g', b'\xd2h', b'\xd2l', b'\xd2m', b'\xd2n', b'\xd2p',
+    b'\xd2r', b'\xd2u', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2',
+    b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd2',
+    b'\xd50', b'\xd50', b'\xd51', b'\xd51', b'\xd52', b'\xd52', b'\xd5a', b'\xd5a', b'\xd5c',
+    b'\xd5c', b'\xd5e', b'\xd5e', b'\xd5i', b'\xd5i', b'\xd5o', b'\xd5o', b'\xd5s', b'\xd5s',
+    b'\xd5t', b'\xd5t', b'\xd5 ', b'\xd5%', b'\xd5-', b'\xd5.', b'\xd5/', b'\xd53', b'\xd54',
+    b'\xd55', b'\xd56', b'\xd57', b'\xd58', b'\xd59', b'\xd5=', b'\xd5A', b'\xd5_', b'\xd5b',
+    b'\xd5d', b'\xd5f', b'\xd5g', b'\xd5h', b'\xd5l', b'\xd5m', b'\xd5n', b'\xd5p', b'\xd5r',
+    b'\xd5u', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5',
+    b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xca0',
+    b'\xca0', b'\xca0', b'\xca0', b'\xca1', b'\xca1', b'\xca1', b'\xca1', b'\xca2', b'\xca2',
+    b'\xca2', b'\xca2', b'\xcaa', b'\xcaa', b'\xcaa', b'\xcaa', b'\xcac', b'\xcac', b'\xcac',
+    b'\xcac', b'\xcae', b'\xcae', b'\xcae', b'\xcae', b'\xcai', b'\xcai', b'\xcai', b'\xcai',
+    b'\xcao', b'\xcao', b'\xcao', b'\xcao', b'\xcas', b'\xcas', b'\xcas', b'\xcas', b'\xcat',
+    b'\xcat', b'\xcat', b'\xcat', b'\xca ', b'\xca ', b'\xca%', b'\xca%', b'\xca-', b'\xca-',
+    b'\xca.', b'\xca.', b'\xca/', b'\xca/', b'\xca3', b'\xca3', b'\xca4', b'\xca4', b'\xca5',
+    b'\xca5', b'\xca6', b'\xca6', b'\xca7', b'\xca7', b'\xca8', b'\xca8', b'\xca9', b'\xca9',
+    b'\xca=', b'\xca=', b'\xcaA', b'\xcaA', b'\xca_', b'\xca_', b'\xcab', b'\xcab', b'\xcad',
+    b'\xcad', b'\xcaf', b'\xcaf', b'\xcag', b'\xcag', b'\xcah', b'\xcah', b'\xcal', b'\xcal',
+    b'\xcam', b'\xcam', b'\xcan', b'\xcan', b'\xcap', b'\xcap', b'\xcar', b'\xcar', b'\xcau',
+    b'\xcau', b'\xca:', b'\xcaB', b'\xcaC', b'\xcaD', b'\xcaE', b'\xcaF', b'\xcaG', b'\xcaH',
+    b'\xcaI', b'\xcaJ', b'\xcaK', b'\xcaL', b'\xcaM', b'\xcaN', b'\xcaO', b'\xcaP', b'\xcaQ',
+    b'\xcaR', b'\xcaS', b'\xcaT', b'\xcaU', b'\xcaV', b'\xcaW', b'\xcaY', b'\xcaj', b'\xcak',
+    b'\xcaq', b'\xcav', b'\xcaw', b'\xcax', b'\xcay', b'\xcaz', b'\xca', b'\xca', b'\xca', b'\xca',
+    b'\xcd0', b'\xcd0', b'\xcd0', b'\xcd0', b'\xcd1', b'\xcd1', b'\xcd1', b'\xcd1', b'\xcd2',
+    b'\xcd2', b'\xcd2', b'\xcd2', b'\xcda', b'\xcda', b'\xcda', b'\xcda', b'\xcdc', b'\xcdc',
+    b'\xcdc', b'\xcdc', b'\xcde', b'\xcde', b'\xcde', b'\xcde', b'\xcdi', b'\xcdi', b'\xcdi',
+    b'\xcdi', b'\xcdo', b'\xcdo', b'\xcdo', b'\xcdo', b'\xcds', b'\xcds', b'\xcds', b'\xcds',
+    b'\xcdt', b'\xcdt', b'\xcdt', b'\xcdt', b'\xcd ', b'\xcd ', b'\xcd%', b'\xcd%', b'\xcd-',
+    b'\xcd-', b'\xcd.', b'\xcd.', b'\xcd/', b'\xcd/', b'\xcd3', b'\xcd3', b'\xcd4', b'\xcd4',
+    b'\xcd5', b'\xcd5', b'\xcd6', b'\xcd6', b'\xcd7', b'\xcd7', b'\xcd8', b'\xcd8', b'\xcd9',
+    b'\xcd9', b'\xcd=', b'\xcd=', b'\xcdA', b'\xcdA', b'\xcd_', b'\xcd_', b'\xcdb', b'\xcdb',
+    b'\xcdd', b'\xcdd', b'\xcdf', b'\xcdf', b'\xcdg', b'\xcdg', b'\xcdh', b'\xcdh', b'\xcdl',
+    b'\xcdl', b'\xcdm', b'\xcdm', b'\xcdn', b'\xcdn', b'\xcdp', b'\xcdp', b'\xcdr', b'\xcdr',
+    b'\xcdu', b'\xcdu', b'\xcd:', b'\xcdB', b'\xcdC', b'\xcdD', b'\xcdE', b'\xcdF', b'\xcdG',
+    b'\xcdH', b'\xcdI', b'\xcdJ', b'\xcdK', b'\xcdL', b'\xcdM', b'\xcdN', b'\xcdO', b'\xcdP',
+    b'\xcdQ', b'\xcdR', b'\xcdS', b'\xcdT', b'\xcdU', b'\xcdV', b'\xcdW', b'\xcdY', b'\xcdj',
+    b'\xcdk', b'\xcdq', b'\xcdv', b'\xcdw', b'\xcdx', b'\xcdy', b'\xcdz', b'\xcd', b'\xcd', b'\xcd',
+    b'\xcd', b'\xda0', b'\xda1', b'\xda2', b'\xdaa', b'\xdac', b'\xdae', b'\xdai', b'\xdao',
+    b'\xdas', b'\xdat', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda',
+    b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda',
+    b'\xda', b'\xda', b'\xda', b'\xda', b'\xdb0', b'\xdb1', b'\xdb2', b'\xdba', b'\xdbc', b'\xdbe',
+    b'\xdbi', b'\xdbo', b'\xdbs', b'\xdbt', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb',
+    b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb',
+    b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xee0', b'\xee1', b'\xee2', b'\xeea',
+    b'\xeec', b'\xeee', b'\xeei', b'\xeeo', b'\xees', b'\xeet', b'\xee', b'\xee', b'\xee', b'\xee',
+    b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee',
+    b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xf00', b'\xf01',
+    b'\xf02', b'\xf0a', b'\xf0c', b'\xf0e', b'\xf0i', b'\xf0o', b'\xf0s', b'\xf0t', b'\xf0',
+    b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0',
+    b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0',
+    b'\xf0', b'\xf20', b'\xf21', b'\xf22', b'\xf2a', b'\xf2c', b'\xf2e', b'\xf2i', b'\xf2o',
+    b'\xf2s', b'\xf2t', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf30', b'\xf31', b'\xf32', b'\xf3a', b'\xf3c', b'\xf3e',
+    b'\xf3i', b'\xf3o', b'\xf3s', b'\xf3t', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xff0', b'\xff1', b'\xff2', b'\xffa',
+    b'\xffc', b'\xffe', b'\xffi', b'\xffo', b'\xffs', b'\xfft', b'\xff', b'\xff', b'\xff', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xf20', b'\xf20', b'\xf21', b'\xf21', b'\xf22', b'\xf22', b'\xf2a', b'\xf2a', b'\xf2c',
+    b'\xf2c', b'\xf2e', b'\xf2e', b'\xf2i', b'\xf2i', b'\xf2o', b'\xf2o', b'\xf2s', b'\xf2s',
+    b'\xf2t', b'\xf2t', b'\xf2 ', b'\xf2%', b'\xf2-', b'\xf2.', b'\xf2/', b'\xf23', b'\xf24',
+    b'\xf25', b'\xf26', b'\xf27', b'\xf28', b'\xf29', b'\xf2=', b'\xf2A', b'\xf2_', b'\xf2b',
+    b'\xf2d', b'\xf2f', b'\xf2g', b'\xf2h', b'\xf2l', b'\xf2m', b'\xf2n', b'\xf2p', b'\xf2r',
+    b'\xf2u', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf2', b'\xf30',
+    b'\xf30', b'\xf31', b'\xf31', b'\xf32', b'\xf32', b'\xf3a', b'\xf3a', b'\xf3c', b'\xf3c',
+    b'\xf3e', b'\xf3e', b'\xf3i', b'\xf3i', b'\xf3o', b'\xf3o', b'\xf3s', b'\xf3s', b'\xf3t',
+    b'\xf3t', b'\xf3 ', b'\xf3%', b'\xf3-', b'\xf3.', b'\xf3/', b'\xf33', b'\xf34', b'\xf35',
+    b'\xf36', b'\xf37', b'\xf38', b'\xf39', b'\xf3=', b'\xf3A', b'\xf3_', b'\xf3b', b'\xf3d',
+    b'\xf3f', b'\xf3g', b'\xf3h', b'\xf3l', b'\xf3m', b'\xf3n', b'\xf3p', b'\xf3r', b'\xf3u',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xf3', b'\xff0', b'\xff0',
+    b'\xff1', b'\xff1', b'\xff2', b'\xff2', b'\xffa', b'\xffa', b'\xffc', b'\xffc', b'\xffe',
+    b'\xffe', b'\xffi', b'\xffi', b'\xffo', b'\xffo', b'\xffs', b'\xffs', b'\xfft', b'\xfft',
+    b'\xff ', b'\xff%', b'\xff-', b'\xff.', b'\xff/', b'\xff3', b'\xff4', b'\xff5', b'\xff6',
+    b'\xff7', b'\xff8', b'\xff9', b'\xff=', b'\xffA', b'\xff_', b'\xffb', b'\xffd', b'\xfff',
+    b'\xffg', b'\xffh', b'\xffl', b'\xffm', b'\xffn', b'\xffp', b'\xffr', b'\xffu', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xff', b'\xcb0', b'\xcb1', b'\xcb2',
+    b'\xcba', b'\xcbc', b'\xcbe', b'\xcbi', b'\xcbo', b'\xcbs', b'\xcbt', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcc0',
+    b'\xcc1', b'\xcc2', b'\xcca', b'\xccc', b'\xcce', b'\xcci', b'\xcco', b'\xccs', b'\xcct',
+    b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xcc', b'\xcc', b'\xff0', b'\xff0', b'\xff0', b'\xff0', b'\xff1', b'\xff1', b'\xff1',
+    b'\xff1', b'\xff2', b'\xff2', b'\xff2', b'\xff2', b'\xffa', b'\xffa', b'\xffa', b'\xffa',
+    b'\xffc', b'\xffc', b'\xffc', b'\xffc', b'\xffe', b'\xffe', b'\xffe', b'\xffe', b'\xffi',
+    b'\xffi', b'\xffi', b'\xffi', b'\xffo', b'\xffo', b'\xffo', b'\xffo', b'\xffs', b'\xffs',
+    b'\xffs', b'\xffs', b'\xfft', b'\xfft', b'\xfft', b'\xfft', b'\xff ', b'\xff ', b'\xff%',
+    b'\xff%', b'\xff-', b'\xff-', b'\xff.', b'\xff.', b'\xff/', b'\xff/', b'\xff3', b'\xff3',
+    b'\xff4', b'\xff4', b'\xff5', b'\xff5', b'\xff6', b'\xff6', b'\xff7', b'\xff7', b'\xff8',
+    b'\xff8', b'\xff9', b'\xff9', b'\xff=', b'\xff=', b'\xffA', b'\xffA', b'\xff_', b'\xff_',
+    b'\xffb', b'\xffb', b'\xffd', b'\xffd', b'\xfff', b'\xfff', b'\xffg', b'\xffg', b'\xffh',
+    b'\xffh', b'\xffl', b'\xffl', b'\xffm', b'\xffm', b'\xffn', b'\xffn', b'\xffp', b'\xffp',
+    b'\xffr', b'\xffr', b'\xffu', b'\xffu', b'\xff:', b'\xffB', b'\xffC', b'\xffD', b'\xffE',
+    b'\xffF', b'\xffG', b'\xffH', b'\xffI', b'\xffJ', b'\xffK', b'\xffL', b'\xffM', b'\xffN',
+    b'\xffO', b'\xffP', b'\xffQ', b'\xffR', b'\xffS', b'\xffT', b'\xffU', b'\xffV', b'\xffW',
+    b'\xffY', b'\xffj', b'\xffk', b'\xffq', b'\xffv', b'\xffw', b'\xffx', b'\xffy', b'\xffz',
+    b'\xff', b'\xff', b'\xff', b'\xff', b'\xcb0', b'\xcb0', b'\xcb1', b'\xcb1', b'\xcb2', b'\xcb2',
+    b'\xcba', b'\xcba', b'\xcbc', b'\xcbc', b'\xcbe', b'\xcbe', b'\xcbi', b'\xcbi', b'\xcbo',
+    b'\xcbo', b'\xcbs', b'\xcbs', b'\xcbt', b'\xcbt', b'\xcb ', b'\xcb%', b'\xcb-', b'\xcb.',
+    b'\xcb/', b'\xcb3', b'\xcb4', b'\xcb5', b'\xcb6', b'\xcb7', b'\xcb8', b'\xcb9', b'\xcb=',
+    b'\xcbA', b'\xcb_', b'\xcbb', b'\xcbd', b'\xcbf', b'\xcbg', b'\xcbh', b'\xcbl', b'\xcbm',
+    b'\xcbn', b'\xcbp', b'\xcbr', b'\xcbu', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcc0', b'\xcc0', b'\xcc1', b'\xcc1', b'\xcc2', b'\xcc2', b'\xcca',
+    b'\xcca', b'\xccc', b'\xccc', b'\xcce', b'\xcce', b'\xcci', b'\xcci', b'\xcco', b'\xcco',
+    b'\xccs', b'\xccs', b'\xcct', b'\xcct', b'\xcc ', b'\xcc%', b'\xcc-', b'\xcc.', b'\xcc/',
+    b'\xcc3', b'\xcc4', b'\xcc5', b'\xcc6', b'\xcc7', b'\xcc8', b'\xcc9', b'\xcc=', b'\xccA',
+    b'\xcc_', b'\xccb', b'\xccd', b'\xccf', b'\xccg', b'\xcch', b'\xccl', b'\xccm', b'\xccn',
+    b'\xccp', b'\xccr', b'\xccu', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xcc',
+    b'\xcc', b'\xcb0', b'\xcb0', b'\xcb0', b'\xcb0', b'\xcb1', b'\xcb1', b'\xcb1', b'\xcb1',
+    b'\xcb2', b'\xcb2', b'\xcb2', b'\xcb2', b'\xcba', b'\xcba', b'\xcba', b'\xcba', b'\xcbc',
+    b'\xcbc', b'\xcbc', b'\xcbc', b'\xcbe', b'\xcbe', b'\xcbe', b'\xcbe', b'\xcbi', b'\xcbi',
+    b'\xcbi', b'\xcbi', b'\xcbo', b'\xcbo', b'\xcbo', b'\xcbo', b'\xcbs', b'\xcbs', b'\xcbs',
+    b'\xcbs', b'\xcbt', b'\xcbt', b'\xcbt', b'\xcbt', b'\xcb ', b'\xcb ', b'\xcb%', b'\xcb%',
+    b'\xcb-', b'\xcb-', b'\xcb.', b'\xcb.', b'\xcb/', b'\xcb/', b'\xcb3', b'\xcb3', b'\xcb4',
+    b'\xcb4', b'\xcb5', b'\xcb5', b'\xcb6', b'\xcb6', b'\xcb7', b'\xcb7', b'\xcb8', b'\xcb8',
+    b'\xcb9', b'\xcb9', b'\xcb=', b'\xcb=', b'\xcbA', b'\xcbA', b'\xcb_', b'\xcb_', b'\xcbb',
+    b'\xcbb', b'\xcbd', b'\xcbd', b'\xcbf', b'\xcbf', b'\xcbg', b'\xcbg', b'\xcbh', b'\xcbh',
+    b'\xcbl', b'\xcbl', b'\xcbm', b'\xcbm', b'\xcbn', b'\xcbn', b'\xcbp', b'\xcbp', b'\xcbr',
+    b'\xcbr', b'\xcbu', b'\xcbu', b'\xcb:', b'\xcbB', b'\xcbC', b'\xcbD', b'\xcbE', b'\xcbF',
+    b'\xcbG', b'\xcbH', b'\xcbI', b'\xcbJ', b'\xcbK', b'\xcbL', b'\xcbM', b'\xcbN', b'\xcbO',
+    b'\xcbP', b'\xcbQ', b'\xcbR', b'\xcbS', b'\xcbT', b'\xcbU', b'\xcbV', b'\xcbW', b'\xcbY',
+    b'\xcbj', b'\xcbk', b'\xcbq', b'\xcbv', b'\xcbw', b'\xcbx', b'\xcby', b'\xcbz', b'\xcb',
+    b'\xcb', b'\xcb', b'\xcb', b'\xcc0', b'\xcc0', b'\xcc0', b'\xcc0', b'\xcc1', b'\xcc1', b'\xcc1',
+    b'\xcc1', b'\xcc2', b'\xcc2', b'\xcc2', b'\xcc2', b'\xcca', b'\xcca', b'\xcca', b'\xcca',
+    b'\xccc', b'\xccc', b'\xccc', b'\xccc', b'\xcce', b'\xcce', b'\xcce', b'\xcce', b'\xcci',
+    b'\xcci', b'\xcci', b'\xcci', b'\xcco', b'\xcco', b'\xcco', b'\xcco', b'\xccs', b'\xccs',
+    b'\xccs', b'\xccs', b'\xcct', b'\xcct', b'\xcct', b'\xcct', b'\xcc ', b'\xcc ', b'\xcc%',
+    b'\xcc%', b'\xcc-', b'\xcc-', b'\xcc.', b'\xcc.', b'\xcc/', b'\xcc/', b'\xcc3', b'\xcc3',
+    b'\xcc4', b'\xcc4', b'\xcc5', b'\xcc5', b'\xcc6', b'\xcc6', b'\xcc7', b'\xcc7', b'\xcc8',
+    b'\xcc8', b'\xcc9', b'\xcc9', b'\xcc=', b'\xcc=', b'\xccA', b'\xccA', b'\xcc_', b'\xcc_',
+    b'\xccb', b'\xccb', b'\xccd', b'\xccd', b'\xccf', b'\xccf', b'\xccg', b'\xccg', b'\xcch',
+    b'\xcch', b'\xccl', b'\xccl', b'\xccm', b'\xccm', b'\xccn', b'\xccn', b'\xccp', b'\xccp',
+    b'\xccr', b'\xccr', b'\xccu', b'\xccu', b'\xcc:', b'\xccB', b'\xccC', b'\xccD', b'\xccE',
+    b'\xccF', b'\xccG', b'\xccH', b'\xccI', b'\xccJ', b'\xccK', b'\xccL', b'\xccM', b'\xccN',
+    b'\xccO', b'\xccP', b'\xccQ', b'\xccR', b'\xccS', b'\xccT', b'\xccU', b'\xccV', b'\xccW',
+    b'\xccY', b'\xccj', b'\xcck', b'\xccq', b'\xccv', b'\xccw', b'\xccx', b'\xccy', b'\xccz',
+    b'\xcc', b'\xcc', b'\xcc', b'\xcc', b'\xd20', b'\xd20', b'\xd20', b'\xd20', b'\xd21', b'\xd21',
+    b'\xd21', b'\xd21', b'\xd22', b'\xd22', b'\xd22', b'\xd22', b'\xd2a', b'\xd2a', b'\xd2a',
+    b'\xd2a', b'\xd2c', b'\xd2c', b'\xd2c', b'\xd2c', b'\xd2e', b'\xd2e', b'\xd2e', b'\xd2e',
+    b'\xd2i', b'\xd2i', b'\xd2i', b'\xd2i', b'\xd2o', b'\xd2o', b'\xd2o', b'\xd2o', b'\xd2s',
+    b'\xd2s', b'\xd2s', b'\xd2s', b'\xd2t', b'\xd2t', b'\xd2t', b'\xd2t', b'\xd2 ', b'\xd2 ',
+    b'\xd2%', b'\xd2%', b'\xd2-', b'\xd2-', b'\xd2.', b'\xd2.', b'\xd2/', b'\xd2/', b'\xd23',
+    b'\xd23', b'\xd24', b'\xd24', b'\xd25', b'\xd25', b'\xd26', b'\xd26', b'\xd27', b'\xd27',
+    b'\xd28', b'\xd28', b'\xd29', b'\xd29', b'\xd2=', b'\xd2=', b'\xd2A', b'\xd2A', b'\xd2_',
+    b'\xd2_', b'\xd2b', b'\xd2b', b'\xd2d', b'\xd2d', b'\xd2f', b'\xd2f', b'\xd2g', b'\xd2g',
+    b'\xd2h', b'\xd2h', b'\xd2l', b'\xd2l', b'\xd2m', b'\xd2m', b'\xd2n', b'\xd2n', b'\xd2p',
+    b'\xd2p', b'\xd2r', b'\xd2r', b'\xd2u', b'\xd2u', b'\xd2:', b'\xd2B', b'\xd2C', b'\xd2D',
+    b'\xd2E', b'\xd2F', b'\xd2G', b'\xd2H', b'\xd2I', b'\xd2J', b'\xd2K', b'\xd2L', b'\xd2M',
+    b'\xd2N', b'\xd2O', b'\xd2P', b'\xd2Q', b'\xd2R', b'\xd2S', b'\xd2T', b'\xd2U', b'\xd2V',
+    b'\xd2W', b'\xd2Y', b'\xd2j', b'\xd2k', b'\xd2q', b'\xd2v', b'\xd2w', b'\xd2x', b'\xd2y',
+    b'\xd2z', b'\xd2', b'\xd2', b'\xd2', b'\xd2', b'\xd50', b'\xd50', b'\xd50', b'\xd50', b'\xd51',
+    b'\xd51', b'\xd51', b'\xd51', b'\xd52', b'\xd52', b'\xd52', b'\xd52', b'\xd5a', b'\xd5a',
+    b'\xd5a', b'\xd5a', b'\xd5c', b'\xd5c', b'\xd5c', b'\xd5c', b'\xd5e', b'\xd5e', b'\xd5e',
+    b'\xd5e', b'\xd5i', b'\xd5i', b'\xd5i', b'\xd5i', b'\xd5o', b'\xd5o', b'\xd5o', b'\xd5o',
+    b'\xd5s', b'\xd5s', b'\xd5s', b'\xd5s', b'\xd5t', b'\xd5t', b'\xd5t', b'\xd5t', b'\xd5 ',
+    b'\xd5 ', b'\xd5%', b'\xd5%', b'\xd5-', b'\xd5-', b'\xd5.', b'\xd5.', b'\xd5/', b'\xd5/',
+    b'\xd53', b'\xd53', b'\xd54', b'\xd54', b'\xd55', b'\xd55', b'\xd56', b'\xd56', b'\xd57',
+    b'\xd57', b'\xd58', b'\xd58', b'\xd59', b'\xd59', b'\xd5=', b'\xd5=', b'\xd5A', b'\xd5A',
+    b'\xd5_', b'\xd5_', b'\xd5b', b'\xd5b', b'\xd5d', b'\xd5d', b'\xd5f', b'\xd5f', b'\xd5g',
+    b'\xd5g', b'\xd5h', b'\xd5h', b'\xd5l', b'\xd5l', b'\xd5m', b'\xd5m', b'\xd5n', b'\xd5n',
+    b'\xd5p', b'\xd5p', b'\xd5r', b'\xd5r', b'\xd5u', b'\xd5u', b'\xd5:', b'\xd5B', b'\xd5C',
+    b'\xd5D', b'\xd5E', b'\xd5F', b'\xd5G', b'\xd5H', b'\xd5I', b'\xd5J', b'\xd5K', b'\xd5L',
+    b'\xd5M', b'\xd5N', b'\xd5O', b'\xd5P', b'\xd5Q', b'\xd5R', b'\xd5S', b'\xd5T', b'\xd5U',
+    b'\xd5V', b'\xd5W', b'\xd5Y', b'\xd5j', b'\xd5k', b'\xd5q', b'\xd5v', b'\xd5w', b'\xd5x',
+    b'\xd5y', b'\xd5z', b'\xd5', b'\xd5', b'\xd5', b'\xd5', b'\xd3', b'\xd3', b'\xd3', b'\xd3',
+    b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3',
+    b'\xd3', b'\xd3', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4',
+    b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd6', b'\xd6',
+    b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6',
+    b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xdf', b'\xdf', b'\xdf', b'\xdf',
+    b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf',
+    b'\xdf', b'\xdf', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf7', b'\xf7', b'\xf7', b'\xf7',
+    b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7',
+    b'\xf7', b'\xf7', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8',
+    b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc',
+    b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfd', b'\xfd', b'\xfd', b'\xfd',
+    b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd',
+    b'\xfd', b'\xfd', b'\xd30', b'\xd31', b'\xd32', b'\xd3a', b'\xd3c', b'\xd3e', b'\xd3i',
+    b'\xd3o', b'\xd3s', b'\xd3t', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3',
+    b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3',
+    b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd40', b'\xd41', b'\xd42', b'\xd4a', b'\xd4c',
+    b'\xd4e', b'\xd4i', b'\xd4o', b'\xd4s', b'\xd4t', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4',
+    b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4',
+    b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd60', b'\xd61', b'\xd62',
+    b'\xd6a', b'\xd6c', b'\xd6e', b'\xd6i', b'\xd6o', b'\xd6s', b'\xd6t', b'\xd6', b'\xd6', b'\xd6',
+    b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6',
+    b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xdd0',
+    b'\xdd1', b'\xdd2', b'\xdda', b'\xddc', b'\xdde', b'\xddi', b'\xddo', b'\xdds', b'\xddt',
+    b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xdd', b'\xdd', b'\xde0', b'\xde1', b'\xde2', b'\xdea', b'\xdec', b'\xdee', b'\xdei',
+    b'\xdeo', b'\xdes', b'\xdet', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xdf0', b'\xdf1', b'\xdf2', b'\xdfa', b'\xdfc',
+    b'\xdfe', b'\xdfi', b'\xdfo', b'\xdfs', b'\xdft', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf',
+    b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf',
+    b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xf10', b'\xf11', b'\xf12',
+    b'\xf1a', b'\xf1c', b'\xf1e', b'\xf1i', b'\xf1o', b'\xf1s', b'\xf1t', b'\xf1', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf40',
+    b'\xf41', b'\xf42', b'\xf4a', b'\xf4c', b'\xf4e', b'\xf4i', b'\xf4o', b'\xf4s', b'\xf4t',
+    b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xd30', b'\xd30', b'\xd31', b'\xd31', b'\xd32', b'\xd32', b'\xd3a',
+    b'\xd3a', b'\xd3c', b'\xd3c', b'\xd3e', b'\xd3e', b'\xd3i', b'\xd3i', b'\xd3o', b'\xd3o',
+    b'\xd3s', b'\xd3s', b'\xd3t', b'\xd3t', b'\xd3 ', b'\xd3%', b'\xd3-', b'\xd3.', b'\xd3/',
+    b'\xd33', b'\xd34', b'\xd35', b'\xd36', b'\xd37', b'\xd38', b'\xd39', b'\xd3=', b'\xd3A',
+    b'\xd3_', b'\xd3b', b'\xd3d', b'\xd3f', b'\xd3g', b'\xd3h', b'\xd3l', b'\xd3m', b'\xd3n',
+    b'\xd3p', b'\xd3r', b'\xd3u', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3',
+    b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd3',
+    b'\xd3', b'\xd40', b'\xd40', b'\xd41', b'\xd41', b'\xd42', b'\xd42', b'\xd4a', b'\xd4a',
+    b'\xd4c', b'\xd4c', b'\xd4e', b'\xd4e', b'\xd4i', b'\xd4i', b'\xd4o', b'\xd4o', b'\xd4s',
+    b'\xd4s', b'\xd4t', b'\xd4t', b'\xd4 ', b'\xd4%', b'\xd4-', b'\xd4.', b'\xd4/', b'\xd43',
+    b'\xd44', b'\xd45', b'\xd46', b'\xd47', b'\xd48', b'\xd49', b'\xd4=', b'\xd4A', b'\xd4_',
+    b'\xd4b', b'\xd4d', b'\xd4f', b'\xd4g', b'\xd4h', b'\xd4l', b'\xd4m', b'\xd4n', b'\xd4p',
+    b'\xd4r', b'\xd4u', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4',
+    b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4', b'\xd4',
+    b'\xd60', b'\xd60', b'\xd61', b'\xd61', b'\xd62', b'\xd62', b'\xd6a', b'\xd6a', b'\xd6c',
+    b'\xd6c', b'\xd6e', b'\xd6e', b'\xd6i', b'\xd6i', b'\xd6o', b'\xd6o', b'\xd6s', b'\xd6s',
+    b'\xd6t', b'\xd6t', b'\xd6 ', b'\xd6%', b'\xd6-', b'\xd6.', b'\xd6/', b'\xd63', b'\xd64',
+    b'\xd65', b'\xd66', b'\xd67', b'\xd68', b'\xd69', b'\xd6=', b'\xd6A', b'\xd6_', b'\xd6b',
+    b'\xd6d', b'\xd6f', b'\xd6g', b'\xd6h', b'\xd6l', b'\xd6m', b'\xd6n', b'\xd6p', b'\xd6r',
+    b'\xd6u', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6',
+    b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xd6', b'\xdd0',
+    b'\xdd0', b'\xdd1', b'\xdd1', b'\xdd2', b'\xdd2', b'\xdda', b'\xdda', b'\xddc', b'\xddc',
+    b'\xdde', b'\xdde', b'\xddi', b'\xddi', b'\xddo', b'\xddo', b'\xdds', b'\xdds', b'\xddt',
+    b'\xddt', b'\xdd ', b'\xdd%', b'\xdd-', b'\xdd.', b'\xdd/', b'\xdd3', b'\xdd4', b'\xdd5',
+    b'\xdd6', b'\xdd7', b'\xdd8', b'\xdd9', b'\xdd=', b'\xddA', b'\xdd_', b'\xddb', b'\xddd',
+    b'\xddf', b'\xddg', b'\xddh', b'\xddl', b'\xddm', b'\xddn', b'\xddp', b'\xddr', b'\xddu',
+    b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd',
+    b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xdd', b'\xd30', b'\xd30',
+    b'\xd30', b'\xd30', b'\xd31', b'\xd31', b'\xd31', b'\xd31', b'\xd32', b'\xd32', b'\xd32',
+    b'\xd32', b'\xd3a', b'\xd3a', b'\xd3a', b'\xd3a', b'\xd3c', b'\xd3c', b'\xd3c', b'\xd3c',
+    b'\xd3e', b'\xd3e', b'\xd3e', b'\xd3e', b'\xd3i', b'\xd3i', b'\xd3i', b'\xd3i', b'\xd3o',
+    b'\xd3o', b'\xd3o', b'\xd3o', b'\xd3s', b'\xd3s', b'\xd3s', b'\xd3s', b'\xd3t', b'\xd3t',
+    b'\xd3t', b'\xd3t', b'\xd3 ', b'\xd3 ', b'\xd3%', b'\xd3%', b'\xd3-', b'\xd3-', b'\xd3.',
+    b'\xd3.', b'\xd3/', b'\xd3/', b'\xd33', b'\xd33', b'\xd34', b'\xd34', b'\xd35', b'\xd35',
+    b'\xd36', b'\xd36', b'\xd37', b'\xd37', b'\xd38', b'\xd38', b'\xd39', b'\xd39', b'\xd3=',
+    b'\xd3=', b'\xd3A', b'\xd3A', b'\xd3_', b'\xd3_', b'\xd3b', b'\xd3b', b'\xd3d', b'\xd3d',
+    b'\xd3f', b'\xd3f', b'\xd3g', b'\xd3g', b'\xd3h', b'\xd3h', b'\xd3l', b'\xd3l', b'\xd3m',
+    b'\xd3m', b'\xd3n', b'\xd3n', b'\xd3p', b'\xd3p', b'\xd3r', b'\xd3r', b'\xd3u', b'\xd3u',
+    b'\xd3:', b'\xd3B', b'\xd3C', b'\xd3D', b'\xd3E', b'\xd3F', b'\xd3G', b'\xd3H', b'\xd3I',
+    b'\xd3J', b'\xd3K', b'\xd3L', b'\xd3M', b'\xd3N', b'\xd3O', b'\xd3P', b'\xd3Q', b'\xd3R',
+    b'\xd3S', b'\xd3T', b'\xd3U', b'\xd3V', b'\xd3W', b'\xd3Y', b'\xd3j', b'\xd3k', b'\xd3q',
+    b'\xd3v', b'\xd3w', b'\xd3x', b'\xd3y', b'\xd3z', b'\xd3', b'\xd3', b'\xd3', b'\xd3', b'\xd40',
+    b'\xd40', b'\xd40', b'\xd40', b'\xd41', b'\xd41', b'\xd41', b'\xd41', b'\xd42', b'\xd42',
+    b'\xd42', b'\xd42', b'\xd4a', b'\xd4a', b'\xd4a', b'\xd4a', b'\xd4c', b'\xd4c', b'\xd4c',
+    b'\xd4c', b'\xd4e', b'\xd4e', b'\xd4e', b'\xd4e', b'\xd4i', b'\xd4i', b'\xd4i', b'\xd4i',
+    b'\xd4o', b'\xd4o', b'\xd4o', b'\xd4o', b'\xd4s', b'\xd4s', b'\xd4s', b'\xd4s', b'\xd4t',
+    b'\xd4t', b'\xd4t', b'\xd4t', b'\xd4 ', b'\xd4 ', b'\xd4%', b'\xd4%', b'\xd4-', b'\xd4-',
+    b'\xd4.', b'\xd4.', b'\xd4/', b'\xd4/', b'\xd43', b'\xd43', b'\xd44', b'\xd44', b'\xd45',
+    b'\xd45', b'\xd46', b'\xd46', b'\xd47', b'\xd47', b'\xd48', b'\xd48', b'\xd49', b'\xd49',
+    b'\xd4=', b'\xd4=', b'\xd4A', b'\xd4A', b'\xd4_', b'\xd4_', b'\xd4b', b'\xd4b', b'\xd4d',
+    b'\xd4d', b'\xd4f', b'\xd4f', b'\xd4g', b'\xd4g', b'\xd4h', b'\xd4h', b'\xd4l', b'\xd4l',
+    b'\xd4m', b'\xd4m', b'\xd4n', b'\xd4n', b'\xd4p', b'\xd4p', b'\xd4r', b'\xd4r', b'\xd4u',
+    b'\xd4u', b'\xd4:', b'\xd4B', b'\xd4C', b'\xd4D', b'\xd4E', b'\xd4F', b'\xd4G', b'\xd4H',
+    b'\xd4I', b'\xd4J', b'\xd4K', b'\xd4L', b'\xd4M', b'\xd4N', b'\xd4O', b'\xd4P', b'\xd4Q',
+    b'\xd4R', b'\xd4S', b'\xd4T', b'\xd4U', b'\xd4V', b'\xd4W', b'\xd4Y', b'\xd4j', b'\xd4k',
+    b'\xd4q', b'\xd4v', b'\xd4w', b'\xd4x', b'\xd4y', b'\xd4z', b'\xd4', b'\xd4', b'\xd4', b'\xd4',
+    b'\xd60', b'\xd60', b'\xd60', b'\xd60', b'\xd61', b'\xd61', b'\xd61', b'\xd61', b'\xd62',
+    b'\xd62', b'\xd62', b'\xd62', b'\xd6a', b'\xd6a', b'\xd6a', b'\xd6a', b'\xd6c', b'\xd6c',
+    b'\xd6c', b'\xd6c', b'\xd6e', b'\xd6e', b'\xd6e', b'\xd6e', b'\xd6i', b'\xd6i', b'\xd6i',
+    b'\xd6i', b'\xd6o', b'\xd6o', b'\xd6o', b'\xd6o', b'\xd6s', b'\xd6s', b'\xd6s', b'\xd6s',
+    b'\xd6t', b'\xd6t', b'\xd6t', b'\xd6t', b'\xd6 ', b'\xd6 ', b'\xd6%', b'\xd6%', b'\xd6-',
+    b'\xd6-', b'\xd6.', b'\xd6.', b'\xd6/', b'\xd6/', b'\xd63', b'\xd63', b'\xd64', b'\xd64',
+    b'\xd65', b'\xd65', b'\xd66', b'\xd66', b'\xd67', b'\xd67', b'\xd68', b'\xd68', b'\xd69',
+    b'\xd69', b'\xd6=', b'\xd6=', b'\xd6A', b'\xd6A', b'\xd6_', b'\xd6_', b'\xd6b', b'\xd6b',
+    b'\xd6d', b'\xd6d', b'\xd6f', b'\xd6f', b'\xd6g', b'\xd6g', b'\xd6h', b'\xd6h', b'\xd6l',
+    b'\xd6l', b'\xd6m', b'\xd6m', b'\xd6n', b'\xd6n', b'\xd6p', b'\xd6p', b'\xd6r', b'\xd6r',
+    b'\xd6u', b'\xd6u', b'\xd6:', b'\xd6B', b'\xd6C', b'\xd6D', b'\xd6E', b'\xd6F', b'\xd6G',
+    b'\xd6H', b'\xd6I', b'\xd6J', b'\xd6K', b'\xd6L', b'\xd6M', b'\xd6N', b'\xd6O', b'\xd6P',
+    b'\xd6Q', b'\xd6R', b'\xd6S', b'\xd6T', b'\xd6U', b'\xd6V', b'\xd6W', b'\xd6Y', b'\xd6j',
+    b'\xd6k', b'\xd6q', b'\xd6v', b'\xd6w', b'\xd6x', b'\xd6y', b'\xd6z', b'\xd6', b'\xd6', b'\xd6',
+    b'\xd6', b'\xdd0', b'\xdd0', b'\xdd0', b'\xdd0', b'\xdd1', b'\xdd1', b'\xdd1', b'\xdd1',
+    b'\xdd2', b'\xdd2', b'\xdd2', b'\xdd2', b'\xdda', b'\xdda', b'\xdda', b'\xdda', b'\xddc',
+    b'\xddc', b'\xddc', b'\xddc', b'\xdde', b'\xdde', b'\xdde', b'\xdde', b'\xddi', b'\xddi',
+    b'\xddi', b'\xddi', b'\xddo', b'\xddo', b'\xddo', b'\xddo', b'\xdds', b'\xdds', b'\xdds',
+    b'\xdds', b'\xddt', b'\xddt', b'\xddt', b'\xddt', b'\xdd ', b'\xdd ', b'\xdd%', b'\xdd%',
+    b'\xdd-', b'\xdd-', b'\xdd.', b'\xdd.', b'\xdd/', b'\xdd/', b'\xdd3', b'\xdd3', b'\xdd4',
+    b'\xdd4', b'\xdd5', b'\xdd5', b'\xdd6', b'\xdd6', b'\xdd7', b'\xdd7', b'\xdd8', b'\xdd8',
+    b'\xdd9', b'\xdd9', b'\xdd=', b'\xdd=', b'\xddA', b'\xddA', b'\xdd_', b'\xdd_', b'\xddb',
+    b'\xddb', b'\xddd', b'\xddd', b'\xddf', b'\xddf', b'\xddg', b'\xddg', b'\xddh', b'\xddh',
+    b'\xddl', b'\xddl', b'\xddm', b'\xddm', b'\xddn', b'\xddn', b'\xddp', b'\xddp', b'\xddr',
+    b'\xddr', b'\xddu', b'\xddu', b'\xdd:', b'\xddB', b'\xddC', b'\xddD', b'\xddE', b'\xddF',
+    b'\xddG', b'\xddH', b'\xddI', b'\xddJ', b'\xddK', b'\xddL', b'\xddM', b'\xddN', b'\xddO',
+    b'\xddP', b'\xddQ', b'\xddR', b'\xddS', b'\xddT', b'\xddU', b'\xddV', b'\xddW', b'\xddY',
+    b'\xddj', b'\xddk', b'\xddq', b'\xddv', b'\xddw', b'\xddx', b'\xddy', b'\xddz', b'\xdd',
+    b'\xdd', b'\xdd', b'\xdd', b'\xd70', b'\xd70', b'\xd70', b'\xd70', b'\xd71', b'\xd71', b'\xd71',
+    b'\xd71', b'\xd72', b'\xd72', b'\xd72', b'\xd72', b'\xd7a', b'\xd7a', b'\xd7a', b'\xd7a',
+    b'\xd7c', b'\xd7c', b'\xd7c', b'\xd7c', b'\xd7e', b'\xd7e', b'\xd7e', b'\xd7e', b'\xd7i',
+    b'\xd7i', b'\xd7i', b'\xd7i', b'\xd7o', b'\xd7o', b'\xd7o', b'\xd7o', b'\xd7s', b'\xd7s',
+    b'\xd7s', b'\xd7s', b'\xd7t', b'\xd7t', b'\xd7t', b'\xd7t', b'\xd7 ', b'\xd7 ', b'\xd7%',
+    b'\xd7%', b'\xd7-', b'\xd7-', b'\xd7.', b'\xd7.', b'\xd7/', b'\xd7/', b'\xd73', b'\xd73',
+    b'\xd74', b'\xd74', b'\xd75', b'\xd75', b'\xd76', b'\xd76', b'\xd77', b'\xd77', b'\xd78',
+    b'\xd78', b'\xd79', b'\xd79', b'\xd7=', b'\xd7=', b'\xd7A', b'\xd7A', b'\xd7_', b'\xd7_',
+    b'\xd7b', b'\xd7b', b'\xd7d', b'\xd7d', b'\xd7f', b'\xd7f', b'\xd7g', b'\xd7g', b'\xd7h',
+    b'\xd7h', b'\xd7l', b'\xd7l', b'\xd7m', b'\xd7m', b'\xd7n', b'\xd7n', b'\xd7p', b'\xd7p',
+    b'\xd7r', b'\xd7r', b'\xd7u', b'\xd7u', b'\xd7:', b'\xd7B', b'\xd7C', b'\xd7D', b'\xd7E',
+    b'\xd7F', b'\xd7G', b'\xd7H', b'\xd7I', b'\xd7J', b'\xd7K', b'\xd7L', b'\xd7M', b'\xd7N',
+    b'\xd7O', b'\xd7P', b'\xd7Q', b'\xd7R', b'\xd7S', b'\xd7T', b'\xd7U', b'\xd7V', b'\xd7W',
+    b'\xd7Y', b'\xd7j', b'\xd7k', b'\xd7q', b'\xd7v', b'\xd7w', b'\xd7x', b'\xd7y', b'\xd7z',
+    b'\xd7', b'\xd7', b'\xd7', b'\xd7', b'\xe10', b'\xe10', b'\xe10', b'\xe10', b'\xe11', b'\xe11',
+    b'\xe11', b'\xe11', b'\xe12', b'\xe12', b'\xe12', b'\xe12', b'\xe1a', b'\xe1a', b'\xe1a',
+    b'\xe1a', b'\xe1c', b'\xe1c', b'\xe1c', b'\xe1c', b'\xe1e', b'\xe1e', b'\xe1e', b'\xe1e',
+    b'\xe1i', b'\xe1i', b'\xe1i', b'\xe1i', b'\xe1o', b'\xe1o', b'\xe1o', b'\xe1o', b'\xe1s',
+    b'\xe1s', b'\xe1s', b'\xe1s', b'\xe1t', b'\xe1t', b'\xe1t', b'\xe1t', b'\xe1 ', b'\xe1 ',
+    b'\xe1%', b'\xe1%', b'\xe1-', b'\xe1-', b'\xe1.', b'\xe1.', b'\xe1/', b'\xe1/', b'\xe13',
+    b'\xe13', b'\xe14', b'\xe14', b'\xe15', b'\xe15', b'\xe16', b'\xe16', b'\xe17', b'\xe17',
+    b'\xe18', b'\xe18', b'\xe19', b'\xe19', b'\xe1=', b'\xe1=', b'\xe1A', b'\xe1A', b'\xe1_',
+    b'\xe1_', b'\xe1b', b'\xe1b', b'\xe1d', b'\xe1d', b'\xe1f', b'\xe1f', b'\xe1g', b'\xe1g',
+    b'\xe1h', b'\xe1h', b'\xe1l', b'\xe1l', b'\xe1m', b'\xe1m', b'\xe1n', b'\xe1n', b'\xe1p',
+    b'\xe1p', b'\xe1r', b'\xe1r', b'\xe1u', b'\xe1u', b'\xe1:', b'\xe1B', b'\xe1C', b'\xe1D',
+    b'\xe1E', b'\xe1F', b'\xe1G', b'\xe1H', b'\xe1I', b'\xe1J', b'\xe1K', b'\xe1L', b'\xe1M',
+    b'\xe1N', b'\xe1O', b'\xe1P', b'\xe1Q', b'\xe1R', b'\xe1S', b'\xe1T', b'\xe1U', b'\xe1V',
+    b'\xe1W', b'\xe1Y', b'\xe1j', b'\xe1k', b'\xe1q', b'\xe1v', b'\xe1w', b'\xe1x', b'\xe1y',
+    b'\xe1z', b'\xe1', b'\xe1', b'\xe1', b'\xe1', b'\xd80', b'\xd80', b'\xd81', b'\xd81', b'\xd82',
+    b'\xd82', b'\xd8a', b'\xd8a', b'\xd8c', b'\xd8c', b'\xd8e', b'\xd8e', b'\xd8i', b'\xd8i',
+    b'\xd8o', b'\xd8o', b'\xd8s', b'\xd8s', b'\xd8t', b'\xd8t', b'\xd8 ', b'\xd8%', b'\xd8-',
+    b'\xd8.', b'\xd8/', b'\xd83', b'\xd84', b'\xd85', b'\xd86', b'\xd87', b'\xd88', b'\xd89',
+    b'\xd8=', b'\xd8A', b'\xd8_', b'\xd8b', b'\xd8d', b'\xd8f', b'\xd8g', b'\xd8h', b'\xd8l',
+    b'\xd8m', b'\xd8n', b'\xd8p', b'\xd8r', b'\xd8u', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd8', b'\xd8', b'\xd8', b'\xd90', b'\xd90', b'\xd91', b'\xd91', b'\xd92', b'\xd92', b'\xd9a',
+    b'\xd9a', b'\xd9c', b'\xd9c', b'\xd9e', b'\xd9e', b'\xd9i', b'\xd9i', b'\xd9o', b'\xd9o',
+    b'\xd9s', b'\xd9s', b'\xd9t', b'\xd9t', b'\xd9 ', b'\xd9%', b'\xd9-', b'\xd9.', b'\xd9/',
+    b'\xd93', b'\xd94', b'\xd95', b'\xd96', b'\xd97', b'\xd98', b'\xd99', b'\xd9=', b'\xd9A',
+    b'\xd9_', b'\xd9b', b'\xd9d', b'\xd9f', b'\xd9g', b'\xd9h', b'\xd9l', b'\xd9m', b'\xd9n',
+    b'\xd9p', b'\xd9r', b'\xd9u', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xe30', b'\xe30', b'\xe31', b'\xe31', b'\xe32', b'\xe32', b'\xe3a', b'\xe3a',
+    b'\xe3c', b'\xe3c', b'\xe3e', b'\xe3e', b'\xe3i', b'\xe3i', b'\xe3o', b'\xe3o', b'\xe3s',
+    b'\xe3s', b'\xe3t', b'\xe3t', b'\xe3 ', b'\xe3%', b'\xe3-', b'\xe3.', b'\xe3/', b'\xe33',
+    b'\xe34', b'\xe35', b'\xe36', b'\xe37', b'\xe38', b'\xe39', b'\xe3=', b'\xe3A', b'\xe3_',
+    b'\xe3b', b'\xe3d', b'\xe3f', b'\xe3g', b'\xe3h', b'\xe3l', b'\xe3m', b'\xe3n', b'\xe3p',
+    b'\xe3r', b'\xe3u', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3',
+    b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe3',
+    b'\xe50', b'\xe50', b'\xe51', b'\xe51', b'\xe52', b'\xe52', b'\xe5a', b'\xe5a', b'\xe5c',
+    b'\xe5c', b'\xe5e', b'\xe5e', b'\xe5i', b'\xe5i', b'\xe5o', b'\xe5o', b'\xe5s', b'\xe5s',
+    b'\xe5t', b'\xe5t', b'\xe5 ', b'\xe5%', b'\xe5-', b'\xe5.', b'\xe5/', b'\xe53', b'\xe54',
+    b'\xe55', b'\xe56', b'\xe57', b'\xe58', b'\xe59', b'\xe5=', b'\xe5A', b'\xe5_', b'\xe5b',
+    b'\xe5d', b'\xe5f', b'\xe5g', b'\xe5h', b'\xe5l', b'\xe5m', b'\xe5n', b'\xe5p', b'\xe5r',
+    b'\xe5u', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5',
+    b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xd80',
+    b'\xd80', b'\xd80', b'\xd80', b'\xd81', b'\xd81', b'\xd81', b'\xd81', b'\xd82', b'\xd82',
+    b'\xd82', b'\xd82', b'\xd8a', b'\xd8a', b'\xd8a', b'\xd8a', b'\xd8c', b'\xd8c', b'\xd8c',
+    b'\xd8c', b'\xd8e', b'\xd8e', b'\xd8e', b'\xd8e', b'\xd8i', b'\xd8i', b'\xd8i', b'\xd8i',
+    b'\xd8o', b'\xd8o', b'\xd8o', b'\xd8o', b'\xd8s', b'\xd8s', b'\xd8s', b'\xd8s', b'\xd8t',
+    b'\xd8t', b'\xd8t', b'\xd8t', b'\xd8 ', b'\xd8 ', b'\xd8%', b'\xd8%', b'\xd8-', b'\xd8-',
+    b'\xd8.', b'\xd8.', b'\xd8/', b'\xd8/', b'\xd83', b'\xd83', b'\xd84', b'\xd84', b'\xd85',
+    b'\xd85', b'\xd86', b'\xd86', b'\xd87', b'\xd87', b'\xd88', b'\xd88', b'\xd89', b'\xd89',
+    b'\xd8=', b'\xd8=', b'\xd8A', b'\xd8A', b'\xd8_', b'\xd8_', b'\xd8b', b'\xd8b', b'\xd8d',
+    b'\xd8d', b'\xd8f', b'\xd8f', b'\xd8g', b'\xd8g', b'\xd8h', b'\xd8h', b'\xd8l', b'\xd8l',
+    b'\xd8m', b'\xd8m', b'\xd8n', b'\xd8n', b'\xd8p', b'\xd8p', b'\xd8r', b'\xd8r', b'\xd8u',
+    b'\xd8u', b'\xd8:', b'\xd8B', b'\xd8C', b'\xd8D', b'\xd8E', b'\xd8F', b'\xd8G', b'\xd8H',
+    b'\xd8I', b'\xd8J', b'\xd8K', b'\xd8L', b'\xd8M', b'\xd8N', b'\xd8O', b'\xd8P', b'\xd8Q',
+    b'\xd8R', b'\xd8S', b'\xd8T', b'\xd8U', b'\xd8V', b'\xd8W', b'\xd8Y', b'\xd8j', b'\xd8k',
+    b'\xd8q', b'\xd8v', b'\xd8w', b'\xd8x', b'\xd8y', b'\xd8z', b'\xd8', b'\xd8', b'\xd8', b'\xd8',
+    b'\xd90', b'\xd90', b'\xd90', b'\xd90', b'\xd91', b'\xd91', b'\xd91', b'\xd91', b'\xd92',
+    b'\xd92', b'\xd92', b'\xd92', b'\xd9a', b'\xd9a', b'\xd9a', b'\xd9a', b'\xd9c', b'\xd9c',
+    b'\xd9c', b'\xd9c', b'\xd9e', b'\xd9e', b'\xd9e', b'\xd9e', b'\xd9i', b'\xd9i', b'\xd9i',
+    b'\xd9i', b'\xd9o', b'\xd9o', b'\xd9o', b'\xd9o', b'\xd9s', b'\xd9s', b'\xd9s', b'\xd9s',
+    b'\xd9t', b'\xd9t', b'\xd9t', b'\xd9t', b'\xd9 ', b'\xd9 ', b'\xd9%', b'\xd9%', b'\xd9-',
+    b'\xd9-', b'\xd9.', b'\xd9.', b'\xd9/', b'\xd9/', b'\xd93', b'\xd93', b'\xd94', b'\xd94',
+    b'\xd95', b'\xd95', b'\xd96', b'\xd96', b'\xd97', b'\xd97', b'\xd98', b'\xd98', b'\xd99',
+    b'\xd99', b'\xd9=', b'\xd9=', b'\xd9A', b'\xd9A', b'\xd9_', b'\xd9_', b'\xd9b', b'\xd9b',
+    b'\xd9d', b'\xd9d', b'\xd9f', b'\xd9f', b'\xd9g', b'\xd9g', b'\xd9h', b'\xd9h', b'\xd9l',
+    b'\xd9l', b'\xd9m', b'\xd9m', b'\xd9n', b'\xd9n', b'\xd9p', b'\xd9p', b'\xd9r', b'\xd9r',
+    b'\xd9u', b'\xd9u', b'\xd9:', b'\xd9B', b'\xd9C', b'\xd9D', b'\xd9E', b'\xd9F', b'\xd9G',
+    b'\xd9H', b'\xd9I', b'\xd9J', b'\xd9K', b'\xd9L', b'\xd9M', b'\xd9N', b'\xd9O', b'\xd9P',
+    b'\xd9Q', b'\xd9R', b'\xd9S', b'\xd9T', b'\xd9U', b'\xd9V', b'\xd9W', b'\xd9Y', b'\xd9j',
+    b'\xd9k', b'\xd9q', b'\xd9v', b'\xd9w', b'\xd9x', b'\xd9y', b'\xd9z', b'\xd9', b'\xd9', b'\xd9',
+    b'\xd9', b'\xda0', b'\xda0', b'\xda1', b'\xda1', b'\xda2', b'\xda2', b'\xdaa', b'\xdaa',
+    b'\xdac', b'\xdac', b'\xdae', b'\xdae', b'\xdai', b'\xdai', b'\xdao', b'\xdao', b'\xdas',
+    b'\xdas', b'\xdat', b'\xdat', b'\xda ', b'\xda%', b'\xda-', b'\xda.', b'\xda/', b'\xda3',
+    b'\xda4', b'\xda5', b'\xda6', b'\xda7', b'\xda8', b'\xda9', b'\xda=', b'\xdaA', b'\xda_',
+    b'\xdab', b'\xdad', b'\xdaf', b'\xdag', b'\xdah', b'\xdal', b'\xdam', b'\xdan', b'\xdap',
+    b'\xdar', b'\xdau', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda',
+    b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda', b'\xda',
+    b'\xdb0', b'\xdb0', b'\xdb1', b'\xdb1', b'\xdb2', b'\xdb2', b'\xdba', b'\xdba', b'\xdbc',
+    b'\xdbc', b'\xdbe', b'\xdbe', b'\xdbi', b'\xdbi', b'\xdbo', b'\xdbo', b'\xdbs', b'\xdbs',
+    b'\xdbt', b'\xdbt', b'\xdb ', b'\xdb%', b'\xdb-', b'\xdb.', b'\xdb/', b'\xdb3', b'\xdb4',
+    b'\xdb5', b'\xdb6', b'\xdb7', b'\xdb8', b'\xdb9', b'\xdb=', b'\xdbA', b'\xdb_', b'\xdbb',
+    b'\xdbd', b'\xdbf', b'\xdbg', b'\xdbh', b'\xdbl', b'\xdbm', b'\xdbn', b'\xdbp', b'\xdbr',
+    b'\xdbu', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb',
+    b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xee0',
+    b'\xee0', b'\xee1', b'\xee1', b'\xee2', b'\xee2', b'\xeea', b'\xeea', b'\xeec', b'\xeec',
+    b'\xeee', b'\xeee', b'\xeei', b'\xeei', b'\xeeo', b'\xeeo', b'\xees', b'\xees', b'\xeet',
+    b'\xeet', b'\xee ', b'\xee%', b'\xee-', b'\xee.', b'\xee/', b'\xee3', b'\xee4', b'\xee5',
+    b'\xee6', b'\xee7', b'\xee8', b'\xee9', b'\xee=', b'\xeeA', b'\xee_', b'\xeeb', b'\xeed',
+    b'\xeef', b'\xeeg', b'\xeeh', b'\xeel', b'\xeem', b'\xeen', b'\xeep', b'\xeer', b'\xeeu',
+    b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee',
+    b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xee', b'\xf00', b'\xf00',
+    b'\xf01', b'\xf01', b'\xf02', b'\xf02', b'\xf0a', b'\xf0a', b'\xf0c', b'\xf0c', b'\xf0e',
+    b'\xf0e', b'\xf0i', b'\xf0i', b'\xf0o', b'\xf0o', b'\xf0s', b'\xf0s', b'\xf0t', b'\xf0t',
+    b'\xf0 ', b'\xf0%', b'\xf0-', b'\xf0.', b'\xf0/', b'\xf03', b'\xf04', b'\xf05', b'\xf06',
+    b'\xf07', b'\xf08', b'\xf09', b'\xf0=', b'\xf0A', b'\xf0_', b'\xf0b', b'\xf0d', b'\xf0f',
+    b'\xf0g', b'\xf0h', b'\xf0l', b'\xf0m', b'\xf0n', b'\xf0p', b'\xf0r', b'\xf0u', b'\xf0',
+    b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0',
+    b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xda0', b'\xda0', b'\xda0',
+    b'\xda0', b'\xda1', b'\xda1', b'\xda1', b'\xda1', b'\xda2', b'\xda2', b'\xda2', b'\xda2',
+    b'\xdaa', b'\xdaa', b'\xdaa', b'\xdaa', b'\xdac', b'\xdac', b'\xdac', b'\xdac', b'\xdae',
+    b'\xdae', b'\xdae', b'\xdae', b'\xdai', b'\xdai', b'\xdai', b'\xdai', b'\xdao', b'\xdao',
+    b'\xdao', b'\xdao', b'\xdas', b'\xdas', b'\xdas', b'\xdas', b'\xdat', b'\xdat', b'\xdat',
+    b'\xdat', b'\xda ', b'\xda ', b'\xda%', b'\xda%', b'\xda-', b'\xda-', b'\xda.', b'\xda.',
+    b'\xda/', b'\xda/', b'\xda3', b'\xda3', b'\xda4', b'\xda4', b'\xda5', b'\xda5', b'\xda6',
+    b'\xda6', b'\xda7', b'\xda7', b'\xda8', b'\xda8', b'\xda9', b'\xda9', b'\xda=', b'\xda=',
+    b'\xdaA', b'\xdaA', b'\xda_', b'\xda_', b'\xdab', b'\xdab', b'\xdad', b'\xdad', b'\xdaf',
+    b'\xdaf', b'\xdag', b'\xdag', b'\xdah', b'\xdah', b'\xdal', b'\xdal', b'\xdam', b'\xdam',
+    b'\xdan', b'\xdan', b'\xdap', b'\xdap', b'\xdar', b'\xdar', b'\xdau', b'\xdau', b'\xda:',
+    b'\xdaB', b'\xdaC', b'\xdaD', b'\xdaE', b'\xdaF', b'\xdaG', b'\xdaH', b'\xdaI', b'\xdaJ',
+    b'\xdaK', b'\xdaL', b'\xdaM', b'\xdaN', b'\xdaO', b'\xdaP', b'\xdaQ', b'\xdaR', b'\xdaS',
+    b'\xdaT', b'\xdaU', b'\xdaV', b'\xdaW', b'\xdaY', b'\xdaj', b'\xdak', b'\xdaq', b'\xdav',
+    b'\xdaw', b'\xdax', b'\xday', b'\xdaz', b'\xda', b'\xda', b'\xda', b'\xda', b'\xdb0', b'\xdb0',
+    b'\xdb0', b'\xdb0', b'\xdb1', b'\xdb1', b'\xdb1', b'\xdb1', b'\xdb2', b'\xdb2', b'\xdb2',
+    b'\xdb2', b'\xdba', b'\xdba', b'\xdba', b'\xdba', b'\xdbc', b'\xdbc', b'\xdbc', b'\xdbc',
+    b'\xdbe', b'\xdbe', b'\xdbe', b'\xdbe', b'\xdbi', b'\xdbi', b'\xdbi', b'\xdbi', b'\xdbo',
+    b'\xdbo', b'\xdbo', b'\xdbo', b'\xdbs', b'\xdbs', b'\xdbs', b'\xdbs', b'\xdbt', b'\xdbt',
+    b'\xdbt', b'\xdbt', b'\xdb ', b'\xdb ', b'\xdb%', b'\xdb%', b'\xdb-', b'\xdb-', b'\xdb.',
+    b'\xdb.', b'\xdb/', b'\xdb/', b'\xdb3', b'\xdb3', b'\xdb4', b'\xdb4', b'\xdb5', b'\xdb5',
+    b'\xdb6', b'\xdb6', b'\xdb7', b'\xdb7', b'\xdb8', b'\xdb8', b'\xdb9', b'\xdb9', b'\xdb=',
+    b'\xdb=', b'\xdbA', b'\xdbA', b'\xdb_', b'\xdb_', b'\xdbb', b'\xdbb', b'\xdbd', b'\xdbd',
+    b'\xdbf', b'\xdbf', b'\xdbg', b'\xdbg', b'\xdbh', b'\xdbh', b'\xdbl', b'\xdbl', b'\xdbm',
+    b'\xdbm', b'\xdbn', b'\xdbn', b'\xdbp', b'\xdbp', b'\xdbr', b'\xdbr', b'\xdbu', b'\xdbu',
+    b'\xdb:', b'\xdbB', b'\xdbC', b'\xdbD', b'\xdbE', b'\xdbF', b'\xdbG', b'\xdbH', b'\xdbI',
+    b'\xdbJ', b'\xdbK', b'\xdbL', b'\xdbM', b'\xdbN', b'\xdbO', b'\xdbP', b'\xdbQ', b'\xdbR',
+    b'\xdbS', b'\xdbT', b'\xdbU', b'\xdbV', b'\xdbW', b'\xdbY', b'\xdbj', b'\xdbk', b'\xdbq',
+    b'\xdbv', b'\xdbw', b'\xdbx', b'\xdby', b'\xdbz', b'\xdb', b'\xdb', b'\xdb', b'\xdb', b'\xde0',
+    b'\xde0', b'\xde1', b'\xde1', b'\xde2', b'\xde2', b'\xdea', b'\xdea', b'\xdec', b'\xdec',
+    b'\xdee', b'\xdee', b'\xdei', b'\xdei', b'\xdeo', b'\xdeo', b'\xdes', b'\xdes', b'\xdet',
+    b'\xdet', b'\xde ', b'\xde%', b'\xde-', b'\xde.', b'\xde/', b'\xde3', b'\xde4', b'\xde5',
+    b'\xde6', b'\xde7', b'\xde8', b'\xde9', b'\xde=', b'\xdeA', b'\xde_', b'\xdeb', b'\xded',
+    b'\xdef', b'\xdeg', b'\xdeh', b'\xdel', b'\xdem', b'\xden', b'\xdep', b'\xder', b'\xdeu',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xde', b'\xdf0', b'\xdf0',
+    b'\xdf1', b'\xdf1', b'\xdf2', b'\xdf2', b'\xdfa', b'\xdfa', b'\xdfc', b'\xdfc', b'\xdfe',
+    b'\xdfe', b'\xdfi', b'\xdfi', b'\xdfo', b'\xdfo', b'\xdfs', b'\xdfs', b'\xdft', b'\xdft',
+    b'\xdf ', b'\xdf%', b'\xdf-', b'\xdf.', b'\xdf/', b'\xdf3', b'\xdf4', b'\xdf5', b'\xdf6',
+    b'\xdf7', b'\xdf8', b'\xdf9', b'\xdf=', b'\xdfA', b'\xdf_', b'\xdfb', b'\xdfd', b'\xdff',
+    b'\xdfg', b'\xdfh', b'\xdfl', b'\xdfm', b'\xdfn', b'\xdfp', b'\xdfr', b'\xdfu', b'\xdf',
+    b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf',
+    b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xf10', b'\xf10', b'\xf11',
+    b'\xf11', b'\xf12', b'\xf12', b'\xf1a', b'\xf1a', b'\xf1c', b'\xf1c', b'\xf1e', b'\xf1e',
+    b'\xf1i', b'\xf1i', b'\xf1o', b'\xf1o', b'\xf1s', b'\xf1s', b'\xf1t', b'\xf1t', b'\xf1 ',
+    b'\xf1%', b'\xf1-', b'\xf1.', b'\xf1/', b'\xf13', b'\xf14', b'\xf15', b'\xf16', b'\xf17',
+    b'\xf18', b'\xf19', b'\xf1=', b'\xf1A', b'\xf1_', b'\xf1b', b'\xf1d', b'\xf1f', b'\xf1g',
+    b'\xf1h', b'\xf1l', b'\xf1m', b'\xf1n', b'\xf1p', b'\xf1r', b'\xf1u', b'\xf1', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1',
+    b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf40', b'\xf40', b'\xf41', b'\xf41', b'\xf42',
+    b'\xf42', b'\xf4a', b'\xf4a', b'\xf4c', b'\xf4c', b'\xf4e', b'\xf4e', b'\xf4i', b'\xf4i',
+    b'\xf4o', b'\xf4o', b'\xf4s', b'\xf4s', b'\xf4t', b'\xf4t', b'\xf4 ', b'\xf4%', b'\xf4-',
+    b'\xf4.', b'\xf4/', b'\xf43', b'\xf44', b'\xf45', b'\xf46', b'\xf47', b'\xf48', b'\xf49',
+    b'\xf4=', b'\xf4A', b'\xf4_', b'\xf4b', b'\xf4d', b'\xf4f', b'\xf4g', b'\xf4h', b'\xf4l',
+    b'\xf4m', b'\xf4n', b'\xf4p', b'\xf4r', b'\xf4u', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf4', b'\xf4', b'\xf4', b'\xde0', b'\xde0', b'\xde0', b'\xde0', b'\xde1', b'\xde1', b'\xde1',
+    b'\xde1', b'\xde2', b'\xde2', b'\xde2', b'\xde2', b'\xdea', b'\xdea', b'\xdea', b'\xdea',
+    b'\xdec', b'\xdec', b'\xdec', b'\xdec', b'\xdee', b'\xdee', b'\xdee', b'\xdee', b'\xdei',
+    b'\xdei', b'\xdei', b'\xdei', b'\xdeo', b'\xdeo', b'\xdeo', b'\xdeo', b'\xdes', b'\xdes',
+    b'\xdes', b'\xdes', b'\xdet', b'\xdet', b'\xdet', b'\xdet', b'\xde ', b'\xde ', b'\xde%',
+    b'\xde%', b'\xde-', b'\xde-', b'\xde.', b'\xde.', b'\xde/', b'\xde/', b'\xde3', b'\xde3',
+    b'\xde4', b'\xde4', b'\xde5', b'\xde5', b'\xde6', b'\xde6', b'\xde7', b'\xde7', b'\xde8',
+    b'\xde8', b'\xde9', b'\xde9', b'\xde=', b'\xde=', b'\xdeA', b'\xdeA', b'\xde_', b'\xde_',
+    b'\xdeb', b'\xdeb', b'\xded', b'\xded', b'\xdef', b'\xdef', b'\xdeg', b'\xdeg', b'\xdeh',
+    b'\xdeh', b'\xdel', b'\xdel', b'\xdem', b'\xdem', b'\xden', b'\xden', b'\xdep', b'\xdep',
+    b'\xder', b'\xder', b'\xdeu', b'\xdeu', b'\xde:', b'\xdeB', b'\xdeC', b'\xdeD', b'\xdeE',
+    b'\xdeF', b'\xdeG', b'\xdeH', b'\xdeI', b'\xdeJ', b'\xdeK', b'\xdeL', b'\xdeM', b'\xdeN',
+    b'\xdeO', b'\xdeP', b'\xdeQ', b'\xdeR', b'\xdeS', b'\xdeT', b'\xdeU', b'\xdeV', b'\xdeW',
+    b'\xdeY', b'\xdej', b'\xdek', b'\xdeq', b'\xdev', b'\xdew', b'\xdex', b'\xdey', b'\xdez',
+    b'\xde', b'\xde', b'\xde', b'\xde', b'\xdf0', b'\xdf0', b'\xdf0', b'\xdf0', b'\xdf1', b'\xdf1',
+    b'\xdf1', b'\xdf1', b'\xdf2', b'\xdf2', b'\xdf2', b'\xdf2', b'\xdfa', b'\xdfa', b'\xdfa',
+    b'\xdfa', b'\xdfc', b'\xdfc', b'\xdfc', b'\xdfc', b'\xdfe', b'\xdfe', b'\xdfe', b'\xdfe',
+    b'\xdfi', b'\xdfi', b'\xdfi', b'\xdfi', b'\xdfo', b'\xdfo', b'\xdfo', b'\xdfo', b'\xdfs',
+    b'\xdfs', b'\xdfs', b'\xdfs', b'\xdft', b'\xdft', b'\xdft', b'\xdft', b'\xdf ', b'\xdf ',
+    b'\xdf%', b'\xdf%', b'\xdf-', b'\xdf-', b'\xdf.', b'\xdf.', b'\xdf/', b'\xdf/', b'\xdf3',
+    b'\xdf3', b'\xdf4', b'\xdf4', b'\xdf5', b'\xdf5', b'\xdf6', b'\xdf6', b'\xdf7', b'\xdf7',
+    b'\xdf8', b'\xdf8', b'\xdf9', b'\xdf9', b'\xdf=', b'\xdf=', b'\xdfA', b'\xdfA', b'\xdf_',
+    b'\xdf_', b'\xdfb', b'\xdfb', b'\xdfd', b'\xdfd', b'\xdff', b'\xdff', b'\xdfg', b'\xdfg',
+    b'\xdfh', b'\xdfh', b'\xdfl', b'\xdfl', b'\xdfm', b'\xdfm', b'\xdfn', b'\xdfn', b'\xdfp',
+    b'\xdfp', b'\xdfr', b'\xdfr', b'\xdfu', b'\xdfu', b'\xdf:', b'\xdfB', b'\xdfC', b'\xdfD',
+    b'\xdfE', b'\xdfF', b'\xdfG', b'\xdfH', b'\xdfI', b'\xdfJ', b'\xdfK', b'\xdfL', b'\xdfM',
+    b'\xdfN', b'\xdfO', b'\xdfP', b'\xdfQ', b'\xdfR', b'\xdfS', b'\xdfT', b'\xdfU', b'\xdfV',
+    b'\xdfW', b'\xdfY', b'\xdfj', b'\xdfk', b'\xdfq', b'\xdfv', b'\xdfw', b'\xdfx', b'\xdfy',
+    b'\xdfz', b'\xdf', b'\xdf', b'\xdf', b'\xdf', b'\xe00', b'\xe00', b'\xe00', b'\xe00', b'\xe01',
+    b'\xe01', b'\xe01', b'\xe01', b'\xe02', b'\xe02', b'\xe02', b'\xe02', b'\xe0a', b'\xe0a',
+    b'\xe0a', b'\xe0a', b'\xe0c', b'\xe0c', b'\xe0c', b'\xe0c', b'\xe0e', b'\xe0e', b'\xe0e',
+    b'\xe0e', b'\xe0i', b'\xe0i', b'\xe0i', b'\xe0i', b'\xe0o', b'\xe0o', b'\xe0o', b'\xe0o',
+    b'\xe0s', b'\xe0s', b'\xe0s', b'\xe0s', b'\xe0t', b'\xe0t', b'\xe0t', b'\xe0t', b'\xe0 ',
+    b'\xe0 ', b'\xe0%', b'\xe0%', b'\xe0-', b'\xe0-', b'\xe0.', b'\xe0.', b'\xe0/', b'\xe0/',
+    b'\xe03', b'\xe03', b'\xe04', b'\xe04', b'\xe05', b'\xe05', b'\xe06', b'\xe06', b'\xe07',
+    b'\xe07', b'\xe08', b'\xe08', b'\xe09', b'\xe09', b'\xe0=', b'\xe0=', b'\xe0A', b'\xe0A',
+    b'\xe0_', b'\xe0_', b'\xe0b', b'\xe0b', b'\xe0d', b'\xe0d', b'\xe0f', b'\xe0f', b'\xe0g',
+    b'\xe0g', b'\xe0h', b'\xe0h', b'\xe0l', b'\xe0l', b'\xe0m', b'\xe0m', b'\xe0n', b'\xe0n',
+    b'\xe0p', b'\xe0p', b'\xe0r', b'\xe0r', b'\xe0u', b'\xe0u', b'\xe0:', b'\xe0B', b'\xe0C',
+    b'\xe0D', b'\xe0E', b'\xe0F', b'\xe0G', b'\xe0H', b'\xe0I', b'\xe0J', b'\xe0K', b'\xe0L',
+    b'\xe0M', b'\xe0N', b'\xe0O', b'\xe0P', b'\xe0Q', b'\xe0R', b'\xe0S', b'\xe0T', b'\xe0U',
+    b'\xe0V', b'\xe0W', b'\xe0Y', b'\xe0j', b'\xe0k', b'\xe0q', b'\xe0v', b'\xe0w', b'\xe0x',
+    b'\xe0y', b'\xe0z', b'\xe0', b'\xe0', b'\xe0', b'\xe0', b'\xe20', b'\xe20', b'\xe20', b'\xe20',
+    b'\xe21', b'\xe21', b'\xe21', b'\xe21', b'\xe22', b'\xe22', b'\xe22', b'\xe22', b'\xe2a',
+    b'\xe2a', b'\xe2a', b'\xe2a', b'\xe2c', b'\xe2c', b'\xe2c', b'\xe2c', b'\xe2e', b'\xe2e',
+    b'\xe2e', b'\xe2e', b'\xe2i', b'\xe2i', b'\xe2i', b'\xe2i', b'\xe2o', b'\xe2o', b'\xe2o',
+    b'\xe2o', b'\xe2s', b'\xe2s', b'\xe2s', b'\xe2s', b'\xe2t', b'\xe2t', b'\xe2t', b'\xe2t',
+    b'\xe2 ', b'\xe2 ', b'\xe2%', b'\xe2%', b'\xe2-', b'\xe2-', b'\xe2.', b'\xe2.', b'\xe2/',
+    b'\xe2/', b'\xe23', b'\xe23', b'\xe24', b'\xe24', b'\xe25', b'\xe25', b'\xe26', b'\xe26',
+    b'\xe27', b'\xe27', b'\xe28', b'\xe28', b'\xe29', b'\xe29', b'\xe2=', b'\xe2=', b'\xe2A',
+    b'\xe2A', b'\xe2_', b'\xe2_', b'\xe2b', b'\xe2b', b'\xe2d', b'\xe2d', b'\xe2f', b'\xe2f',
+    b'\xe2g', b'\xe2g', b'\xe2h', b'\xe2h', b'\xe2l', b'\xe2l', b'\xe2m', b'\xe2m', b'\xe2n',
+    b'\xe2n', b'\xe2p', b'\xe2p', b'\xe2r', b'\xe2r', b'\xe2u', b'\xe2u', b'\xe2:', b'\xe2B',
+    b'\xe2C', b'\xe2D', b'\xe2E', b'\xe2F', b'\xe2G', b'\xe2H', b'\xe2I', b'\xe2J', b'\xe2K',
+    b'\xe2L', b'\xe2M', b'\xe2N', b'\xe2O', b'\xe2P', b'\xe2Q', b'\xe2R', b'\xe2S', b'\xe2T',
+    b'\xe2U', b'\xe2V', b'\xe2W', b'\xe2Y', b'\xe2j', b'\xe2k', b'\xe2q', b'\xe2v', b'\xe2w',
+    b'\xe2x', b'\xe2y', b'\xe2z', b'\xe2', b'\xe2', b'\xe2', b'\xe2', b'\xe30', b'\xe30', b'\xe30',
+    b'\xe30', b'\xe31', b'\xe31', b'\xe31', b'\xe31', b'\xe32', b'\xe32', b'\xe32', b'\xe32',
+    b'\xe3a', b'\xe3a', b'\xe3a', b'\xe3a', b'\xe3c', b'\xe3c', b'\xe3c', b'\xe3c', b'\xe3e',
+    b'\xe3e', b'\xe3e', b'\xe3e', b'\xe3i', b'\xe3i', b'\xe3i', b'\xe3i', b'\xe3o', b'\xe3o',
+    b'\xe3o', b'\xe3o', b'\xe3s', b'\xe3s', b'\xe3s', b'\xe3s', b'\xe3t', b'\xe3t', b'\xe3t',
+    b'\xe3t', b'\xe3 ', b'\xe3 ', b'\xe3%', b'\xe3%', b'\xe3-', b'\xe3-', b'\xe3.', b'\xe3.',
+    b'\xe3/', b'\xe3/', b'\xe33', b'\xe33', b'\xe34', b'\xe34', b'\xe35', b'\xe35', b'\xe36',
+    b'\xe36', b'\xe37', b'\xe37', b'\xe38', b'\xe38', b'\xe39', b'\xe39', b'\xe3=', b'\xe3=',
+    b'\xe3A', b'\xe3A', b'\xe3_', b'\xe3_', b'\xe3b', b'\xe3b', b'\xe3d', b'\xe3d', b'\xe3f',
+    b'\xe3f', b'\xe3g', b'\xe3g', b'\xe3h', b'\xe3h', b'\xe3l', b'\xe3l', b'\xe3m', b'\xe3m',
+    b'\xe3n', b'\xe3n', b'\xe3p', b'\xe3p', b'\xe3r', b'\xe3r', b'\xe3u', b'\xe3u', b'\xe3:',
+    b'\xe3B', b'\xe3C', b'\xe3D', b'\xe3E', b'\xe3F', b'\xe3G', b'\xe3H', b'\xe3I', b'\xe3J',
+    b'\xe3K', b'\xe3L', b'\xe3M', b'\xe3N', b'\xe3O', b'\xe3P', b'\xe3Q', b'\xe3R', b'\xe3S',
+    b'\xe3T', b'\xe3U', b'\xe3V', b'\xe3W', b'\xe3Y', b'\xe3j', b'\xe3k', b'\xe3q', b'\xe3v',
+    b'\xe3w', b'\xe3x', b'\xe3y', b'\xe3z', b'\xe3', b'\xe3', b'\xe3', b'\xe3', b'\xe50', b'\xe50',
+    b'\xe50', b'\xe50', b'\xe51', b'\xe51', b'\xe51', b'\xe51', b'\xe52', b'\xe52', b'\xe52',
+    b'\xe52', b'\xe5a', b'\xe5a', b'\xe5a', b'\xe5a', b'\xe5c', b'\xe5c', b'\xe5c', b'\xe5c',
+    b'\xe5e', b'\xe5e', b'\xe5e', b'\xe5e', b'\xe5i', b'\xe5i', b'\xe5i', b'\xe5i', b'\xe5o',
+    b'\xe5o', b'\xe5o', b'\xe5o', b'\xe5s', b'\xe5s', b'\xe5s', b'\xe5s', b'\xe5t', b'\xe5t',
+    b'\xe5t', b'\xe5t', b'\xe5 ', b'\xe5 ', b'\xe5%', b'\xe5%', b'\xe5-', b'\xe5-', b'\xe5.',
+    b'\xe5.', b'\xe5/', b'\xe5/', b'\xe53', b'\xe53', b'\xe54', b'\xe54', b'\xe55', b'\xe55',
+    b'\xe56', b'\xe56', b'\xe57', b'\xe57', b'\xe58', b'\xe58', b'\xe59', b'\xe59', b'\xe5=',
+    b'\xe5=', b'\xe5A', b'\xe5A', b'\xe5_', b'\xe5_', b'\xe5b', b'\xe5b', b'\xe5d', b'\xe5d',
+    b'\xe5f', b'\xe5f', b'\xe5g', b'\xe5g', b'\xe5h', b'\xe5h', b'\xe5l', b'\xe5l', b'\xe5m',
+    b'\xe5m', b'\xe5n', b'\xe5n', b'\xe5p', b'\xe5p', b'\xe5r', b'\xe5r', b'\xe5u', b'\xe5u',
+    b'\xe5:', b'\xe5B', b'\xe5C', b'\xe5D', b'\xe5E', b'\xe5F', b'\xe5G', b'\xe5H', b'\xe5I',
+    b'\xe5J', b'\xe5K', b'\xe5L', b'\xe5M', b'\xe5N', b'\xe5O', b'\xe5P', b'\xe5Q', b'\xe5R',
+    b'\xe5S', b'\xe5T', b'\xe5U', b'\xe5V', b'\xe5W', b'\xe5Y', b'\xe5j', b'\xe5k', b'\xe5q',
+    b'\xe5v', b'\xe5w', b'\xe5x', b'\xe5y', b'\xe5z', b'\xe5', b'\xe5', b'\xe5', b'\xe5', b'\xe80',
+    b'\xe80', b'\xe80', b'\xe80', b'\xe81', b'\xe81', b'\xe81', b'\xe81', b'\xe82', b'\xe82',
+    b'\xe82', b'\xe82', b'\xe8a', b'\xe8a', b'\xe8a', b'\xe8a', b'\xe8c', b'\xe8c', b'\xe8c',
+    b'\xe8c', b'\xe8e', b'\xe8e', b'\xe8e', b'\xe8e', b'\xe8i', b'\xe8i', b'\xe8i', b'\xe8i',
+    b'\xe8o', b'\xe8o', b'\xe8o', b'\xe8o', b'\xe8s', b'\xe8s', b'\xe8s', b'\xe8s', b'\xe8t',
+    b'\xe8t', b'\xe8t', b'\xe8t', b'\xe8 ', b'\xe8 ', b'\xe8%', b'\xe8%', b'\xe8-', b'\xe8-',
+    b'\xe8.', b'\xe8.', b'\xe8/', b'\xe8/', b'\xe83', b'\xe83', b'\xe84', b'\xe84', b'\xe85',
+    b'\xe85', b'\xe86', b'\xe86', b'\xe87', b'\xe87', b'\xe88', b'\xe88', b'\xe89', b'\xe89',
+    b'\xe8=', b'\xe8=', b'\xe8A', b'\xe8A', b'\xe8_', b'\xe8_', b'\xe8b', b'\xe8b', b'\xe8d',
+    b'\xe8d', b'\xe8f', b'\xe8f', b'\xe8g', b'\xe8g', b'\xe8h', b'\xe8h', b'\xe8l', b'\xe8l',
+    b'\xe8m', b'\xe8m', b'\xe8n', b'\xe8n', b'\xe8p', b'\xe8p', b'\xe8r', b'\xe8r', b'\xe8u',
+    b'\xe8u', b'\xe8:', b'\xe8B', b'\xe8C', b'\xe8D', b'\xe8E', b'\xe8F', b'\xe8G', b'\xe8H',
+    b'\xe8I', b'\xe8J', b'\xe8K', b'\xe8L', b'\xe8M', b'\xe8N', b'\xe8O', b'\xe8P', b'\xe8Q',
+    b'\xe8R', b'\xe8S', b'\xe8T', b'\xe8U', b'\xe8V', b'\xe8W', b'\xe8Y', b'\xe8j', b'\xe8k',
+    b'\xe8q', b'\xe8v', b'\xe8w', b'\xe8x', b'\xe8y', b'\xe8z', b'\xe8', b'\xe8', b'\xe8', b'\xe8',
+    b'\xe90', b'\xe90', b'\xe90', b'\xe90', b'\xe91', b'\xe91', b'\xe91', b'\xe91', b'\xe92',
+    b'\xe92', b'\xe92', b'\xe92', b'\xe9a', b'\xe9a', b'\xe9a', b'\xe9a', b'\xe9c', b'\xe9c',
+    b'\xe9c', b'\xe9c', b'\xe9e', b'\xe9e', b'\xe9e', b'\xe9e', b'\xe9i', b'\xe9i', b'\xe9i',
+    b'\xe9i', b'\xe9o', b'\xe9o', b'\xe9o', b'\xe9o', b'\xe9s', b'\xe9s', b'\xe9s', b'\xe9s',
+    b'\xe9t', b'\xe9t', b'\xe9t', b'\xe9t', b'\xe9 ', b'\xe9 ', b'\xe9%', b'\xe9%', b'\xe9-',
+    b'\xe9-', b'\xe9.', b'\xe9.', b'\xe9/', b'\xe9/', b'\xe93', b'\xe93', b'\xe94', b'\xe94',
+    b'\xe95', b'\xe95', b'\xe96', b'\xe96', b'\xe97', b'\xe97', b'\xe98', b'\xe98', b'\xe99',
+    b'\xe99', b'\xe9=', b'\xe9=', b'\xe9A', b'\xe9A', b'\xe9_', b'\xe9_', b'\xe9b', b'\xe9b',
+    b'\xe9d', b'\xe9d', b'\xe9f', b'\xe9f', b'\xe9g', b'\xe9g', b'\xe9h', b'\xe9h', b'\xe9l',
+    b'\xe9l', b'\xe9m', b'\xe9m', b'\xe9n', b'\xe9n', b'\xe9p', b'\xe9p', b'\xe9r', b'\xe9r',
+    b'\xe9u', b'\xe9u', b'\xe9:', b'\xe9B', b'\xe9C', b'\xe9D', b'\xe9E', b'\xe9F', b'\xe9G',
+    b'\xe9H', b'\xe9I', b'\xe9J', b'\xe9K', b'\xe9L', b'\xe9M', b'\xe9N', b'\xe9O', b'\xe9P',
+    b'\xe9Q', b'\xe9R', b'\xe9S', b'\xe9T', b'\xe9U', b'\xe9V', b'\xe9W', b'\xe9Y', b'\xe9j',
+    b'\xe9k', b'\xe9q', b'\xe9v', b'\xe9w', b'\xe9x', b'\xe9y', b'\xe9z', b'\xe9', b'\xe9', b'\xe9',
+    b'\xe9', b'\xea0', b'\xea0', b'\xea0', b'\xea0', b'\xea1', b'\xea1', b'\xea1', b'\xea1',
+    b'\xea2', b'\xea2', b'\xea2', b'\xea2', b'\xeaa', b'\xeaa', b'\xeaa', b'\xeaa', b'\xeac',
+    b'\xeac', b'\xeac', b'\xeac', b'\xeae', b'\xeae', b'\xeae', b'\xeae', b'\xeai', b'\xeai',
+    b'\xeai', b'\xeai', b'\xeao', b'\xeao', b'\xeao', b'\xeao', b'\xeas', b'\xeas', b'\xeas',
+    b'\xeas', b'\xeat', b'\xeat', b'\xeat', b'\xeat', b'\xea ', b'\xea ', b'\xea%', b'\xea%',
+    b'\xea-', b'\xea-', b'\xea.', b'\xea.', b'\xea/', b'\xea/', b'\xea3', b'\xea3', b'\xea4',
+    b'\xea4', b'\xea5', b'\xea5', b'\xea6', b'\xea6', b'\xea7', b'\xea7', b'\xea8', b'\xea8',
+    b'\xea9', b'\xea9', b'\xea=', b'\xea=', b'\xeaA', b'\xeaA', b'\xea_', b'\xea_', b'\xeab',
+    b'\xeab', b'\xead', b'\xead', b'\xeaf', b'\xeaf', b'\xeag', b'\xeag', b'\xeah', b'\xeah',
+    b'\xeal', b'\xeal', b'\xeam', b'\xeam', b'\xean', b'\xean', b'\xeap', b'\xeap', b'\xear',
+    b'\xear', b'\xeau', b'\xeau', b'\xea:', b'\xeaB', b'\xeaC', b'\xeaD', b'\xeaE', b'\xeaF',
+    b'\xeaG', b'\xeaH', b'\xeaI', b'\xeaJ', b'\xeaK', b'\xeaL', b'\xeaM', b'\xeaN', b'\xeaO',
+    b'\xeaP', b'\xeaQ', b'\xeaR', b'\xeaS', b'\xeaT', b'\xeaU', b'\xeaV', b'\xeaW', b'\xeaY',
+    b'\xeaj', b'\xeak', b'\xeaq', b'\xeav', b'\xeaw', b'\xeax', b'\xeay', b'\xeaz', b'\xea',
+    b'\xea', b'\xea', b'\xea', b'\xeb0', b'\xeb0', b'\xeb0', b'\xeb0', b'\xeb1', b'\xeb1', b'\xeb1',
+    b'\xeb1', b'\xeb2', b'\xeb2', b'\xeb2', b'\xeb2', b'\xeba', b'\xeba', b'\xeba', b'\xeba',
+    b'\xebc', b'\xebc', b'\xebc', b'\xebc', b'\xebe', b'\xebe', b'\xebe', b'\xebe', b'\xebi',
+    b'\xebi', b'\xebi', b'\xebi', b'\xebo', b'\xebo', b'\xebo', b'\xebo', b'\xebs', b'\xebs',
+    b'\xebs', b'\xebs', b'\xebt', b'\xebt', b'\xebt', b'\xebt', b'\xeb ', b'\xeb ', b'\xeb%',
+    b'\xeb%', b'\xeb-', b'\xeb-', b'\xeb.', b'\xeb.', b'\xeb/', b'\xeb/', b'\xeb3', b'\xeb3',
+    b'\xeb4', b'\xeb4', b'\xeb5', b'\xeb5', b'\xeb6', b'\xeb6', b'\xeb7', b'\xeb7', b'\xeb8',
+    b'\xeb8', b'\xeb9', b'\xeb9', b'\xeb=', b'\xeb=', b'\xebA', b'\xebA', b'\xeb_', b'\xeb_',
+    b'\xebb', b'\xebb', b'\xebd', b'\xebd', b'\xebf', b'\xebf', b'\xebg', b'\xebg', b'\xebh',
+    b'\xebh', b'\xebl', b'\xebl', b'\xebm', b'\xebm', b'\xebn', b'\xebn', b'\xebp', b'\xebp',
+    b'\xebr', b'\xebr', b'\xebu', b'\xebu', b'\xeb:', b'\xebB', b'\xebC', b'\xebD', b'\xebE',
+    b'\xebF', b'\xebG', b'\xebH', b'\xebI', b'\xebJ', b'\xebK', b'\xebL', b'\xebM', b'\xebN',
+    b'\xebO', b'\xebP', b'\xebQ', b'\xebR', b'\xebS', b'\xebT', b'\xebU', b'\xebV', b'\xebW',
+    b'\xebY', b'\xebj', b'\xebk', b'\xebq', b'\xebv', b'\xebw', b'\xebx', b'\xeby', b'\xebz',
+    b'\xeb', b'\xeb', b'\xeb', b'\xeb', b'\xec0', b'\xec0', b'\xec0', b'\xec0', b'\xec1', b'\xec1',
+    b'\xec1', b'\xec1', b'\xec2', b'\xec2', b'\xec2', b'\xec2', b'\xeca', b'\xeca', b'\xeca',
+    b'\xeca', b'\xecc', b'\xecc', b'\xecc', b'\xecc', b'\xece', b'\xece', b'\xece', b'\xece',
+    b'\xeci', b'\xeci', b'\xeci', b'\xeci', b'\xeco', b'\xeco', b'\xeco', b'\xeco', b'\xecs',
+    b'\xecs', b'\xecs', b'\xecs', b'\xect', b'\xect', b'\xect', b'\xect', b'\xec ', b'\xec ',
+    b'\xec%', b'\xec%', b'\xec-', b'\xec-', b'\xec.', b'\xec.', b'\xec/', b'\xec/', b'\xec3',
+    b'\xec3', b'\xec4', b'\xec4', b'\xec5', b'\xec5', b'\xec6', b'\xec6', b'\xec7', b'\xec7',
+    b'\xec8', b'\xec8', b'\xec9', b'\xec9', b'\xec=', b'\xec=', b'\xecA', b'\xecA', b'\xec_',
+    b'\xec_', b'\xecb', b'\xecb', b'\xecd', b'\xecd', b'\xecf', b'\xecf', b'\xecg', b'\xecg',
+    b'\xech', b'\xech', b'\xecl', b'\xecl', b'\xecm', b'\xecm', b'\xecn', b'\xecn', b'\xecp',
+    b'\xecp', b'\xecr', b'\xecr', b'\xecu', b'\xecu', b'\xec:', b'\xecB', b'\xecC', b'\xecD',
+    b'\xecE', b'\xecF', b'\xecG', b'\xecH', b'\xecI', b'\xecJ', b'\xecK', b'\xecL', b'\xecM',
+    b'\xecN', b'\xecO', b'\xecP', b'\xecQ', b'\xecR', b'\xecS', b'\xecT', b'\xecU', b'\xecV',
+    b'\xecW', b'\xecY', b'\xecj', b'\xeck', b'\xecq', b'\xecv', b'\xecw', b'\xecx', b'\xecy',
+    b'\xecz', b'\xec', b'\xec', b'\xec', b'\xec', b'\xed0', b'\xed0', b'\xed0', b'\xed0', b'\xed1',
+    b'\xed1', b'\xed1', b'\xed1', b'\xed2', b'\xed2', b'\xed2', b'\xed2', b'\xeda', b'\xeda',
+    b'\xeda', b'\xeda', b'\xedc', b'\xedc', b'\xedc', b'\xedc', b'\xede', b'\xede', b'\xede',
+    b'\xede', b'\xedi', b'\xedi', b'\xedi', b'\xedi', b'\xedo', b'\xedo', b'\xedo', b'\xedo',
+    b'\xeds', b'\xeds', b'\xeds', b'\xeds', b'\xedt', b'\xedt', b'\xedt', b'\xedt', b'\xed ',
+    b'\xed ', b'\xed%', b'\xed%', b'\xed-', b'\xed-', b'\xed.', b'\xed.', b'\xed/', b'\xed/',
+    b'\xed3', b'\xed3', b'\xed4', b'\xed4', b'\xed5', b'\xed5', b'\xed6', b'\xed6', b'\xed7',
+    b'\xed7', b'\xed8', b'\xed8', b'\xed9', b'\xed9', b'\xed=', b'\xed=', b'\xedA', b'\xedA',
+    b'\xed_', b'\xed_', b'\xedb', b'\xedb', b'\xedd', b'\xedd', b'\xedf', b'\xedf', b'\xedg',
+    b'\xedg', b'\xedh', b'\xedh', b'\xedl', b'\xedl', b'\xedm', b'\xedm', b'\xedn', b'\xedn',
+    b'\xedp', b'\xedp', b'\xedr', b'\xedr', b'\xedu', b'\xedu', b'\xed:', b'\xedB', b'\xedC',
+    b'\xedD', b'\xedE', b'\xedF', b'\xedG', b'\xedH', b'\xedI', b'\xedJ', b'\xedK', b'\xedL',
+    b'\xedM', b'\xedN', b'\xedO', b'\xedP', b'\xedQ', b'\xedR', b'\xedS', b'\xedT', b'\xedU',
+    b'\xedV', b'\xedW', b'\xedY', b'\xedj', b'\xedk', b'\xedq', b'\xedv', b'\xedw', b'\xedx',
+    b'\xedy', b'\xedz', b'\xed', b'\xed', b'\xed', b'\xed', b'\xee0', b'\xee0', b'\xee0', b'\xee0',
+    b'\xee1', b'\xee1', b'\xee1', b'\xee1', b'\xee2', b'\xee2', b'\xee2', b'\xee2', b'\xeea',
+    b'\xeea', b'\xeea', b'\xeea', b'\xeec', b'\xeec', b'\xeec', b'\xeec', b'\xeee', b'\xeee',
+    b'\xeee', b'\xeee', b'\xeei', b'\xeei', b'\xeei', b'\xeei', b'\xeeo', b'\xeeo', b'\xeeo',
+    b'\xeeo', b'\xees', b'\xees', b'\xees', b'\xees', b'\xeet', b'\xeet', b'\xeet', b'\xeet',
+    b'\xee ', b'\xee ', b'\xee%', b'\xee%', b'\xee-', b'\xee-', b'\xee.', b'\xee.', b'\xee/',
+    b'\xee/', b'\xee3', b'\xee3', b'\xee4', b'\xee4', b'\xee5', b'\xee5', b'\xee6', b'\xee6',
+    b'\xee7', b'\xee7', b'\xee8', b'\xee8', b'\xee9', b'\xee9', b'\xee=', b'\xee=', b'\xeeA',
+    b'\xeeA', b'\xee_', b'\xee_', b'\xeeb', b'\xeeb', b'\xeed', b'\xeed', b'\xeef', b'\xeef',
+    b'\xeeg', b'\xeeg', b'\xeeh', b'\xeeh', b'\xeel', b'\xeel', b'\xeem', b'\xeem', b'\xeen',
+    b'\xeen', b'\xeep', b'\xeep', b'\xeer', b'\xeer', b'\xeeu', b'\xeeu', b'\xee:', b'\xeeB',
+    b'\xeeC', b'\xeeD', b'\xeeE', b'\xeeF', b'\xeeG', b'\xeeH', b'\xeeI', b'\xeeJ', b'\xeeK',
+    b'\xeeL', b'\xeeM', b'\xeeN', b'\xeeO', b'\xeeP', b'\xeeQ', b'\xeeR', b'\xeeS', b'\xeeT',
+    b'\xeeU', b'\xeeV', b'\xeeW', b'\xeeY', b'\xeej', b'\xeek', b'\xeeq', b'\xeev', b'\xeew',
+    b'\xeex', b'\xeey', b'\xeez', b'\xee', b'\xee', b'\xee', b'\xee', b'\xf00', b'\xf00', b'\xf00',
+    b'\xf00', b'\xf01', b'\xf01', b'\xf01', b'\xf01', b'\xf02', b'\xf02', b'\xf02', b'\xf02',
+    b'\xf0a', b'\xf0a', b'\xf0a', b'\xf0a', b'\xf0c', b'\xf0c', b'\xf0c', b'\xf0c', b'\xf0e',
+    b'\xf0e', b'\xf0e', b'\xf0e', b'\xf0i', b'\xf0i', b'\xf0i', b'\xf0i', b'\xf0o', b'\xf0o',
+    b'\xf0o', b'\xf0o', b'\xf0s', b'\xf0s', b'\xf0s', b'\xf0s', b'\xf0t', b'\xf0t', b'\xf0t',
+    b'\xf0t', b'\xf0 ', b'\xf0 ', b'\xf0%', b'\xf0%', b'\xf0-', b'\xf0-', b'\xf0.', b'\xf0.',
+    b'\xf0/', b'\xf0/', b'\xf03', b'\xf03', b'\xf04', b'\xf04', b'\xf05', b'\xf05', b'\xf06',
+    b'\xf06', b'\xf07', b'\xf07', b'\xf08', b'\xf08', b'\xf09', b'\xf09', b'\xf0=', b'\xf0=',
+    b'\xf0A', b'\xf0A', b'\xf0_', b'\xf0_', b'\xf0b', b'\xf0b', b'\xf0d', b'\xf0d', b'\xf0f',
+    b'\xf0f', b'\xf0g', b'\xf0g', b'\xf0h', b'\xf0h', b'\xf0l', b'\xf0l', b'\xf0m', b'\xf0m',
+    b'\xf0n', b'\xf0n', b'\xf0p', b'\xf0p', b'\xf0r', b'\xf0r', b'\xf0u', b'\xf0u', b'\xf0:',
+    b'\xf0B', b'\xf0C', b'\xf0D', b'\xf0E', b'\xf0F', b'\xf0G', b'\xf0H', b'\xf0I', b'\xf0J',
+    b'\xf0K', b'\xf0L', b'\xf0M', b'\xf0N', b'\xf0O', b'\xf0P', b'\xf0Q', b'\xf0R', b'\xf0S',
+    b'\xf0T', b'\xf0U', b'\xf0V', b'\xf0W', b'\xf0Y', b'\xf0j', b'\xf0k', b'\xf0q', b'\xf0v',
+    b'\xf0w', b'\xf0x', b'\xf0y', b'\xf0z', b'\xf0', b'\xf0', b'\xf0', b'\xf0', b'\xf10', b'\xf10',
+    b'\xf10', b'\xf10', b'\xf11', b'\xf11', b'\xf11', b'\xf11', b'\xf12', b'\xf12', b'\xf12',
+    b'\xf12', b'\xf1a', b'\xf1a', b'\xf1a', b'\xf1a', b'\xf1c', b'\xf1c', b'\xf1c', b'\xf1c',
+    b'\xf1e', b'\xf1e', b'\xf1e', b'\xf1e', b'\xf1i', b'\xf1i', b'\xf1i', b'\xf1i', b'\xf1o',
+    b'\xf1o', b'\xf1o', b'\xf1o', b'\xf1s', b'\xf1s', b'\xf1s', b'\xf1s', b'\xf1t', b'\xf1t',
+    b'\xf1t', b'\xf1t', b'\xf1 ', b'\xf1 ', b'\xf1%', b'\xf1%', b'\xf1-', b'\xf1-', b'\xf1.',
+    b'\xf1.', b'\xf1/', b'\xf1/', b'\xf13', b'\xf13', b'\xf14', b'\xf14', b'\xf15', b'\xf15',
+    b'\xf16', b'\xf16', b'\xf17', b'\xf17', b'\xf18', b'\xf18', b'\xf19', b'\xf19', b'\xf1=',
+    b'\xf1=', b'\xf1A', b'\xf1A', b'\xf1_', b'\xf1_', b'\xf1b', b'\xf1b', b'\xf1d', b'\xf1d',
+    b'\xf1f', b'\xf1f', b'\xf1g', b'\xf1g', b'\xf1h', b'\xf1h', b'\xf1l', b'\xf1l', b'\xf1m',
+    b'\xf1m', b'\xf1n', b'\xf1n', b'\xf1p', b'\xf1p', b'\xf1r', b'\xf1r', b'\xf1u', b'\xf1u',
+    b'\xf1:', b'\xf1B', b'\xf1C', b'\xf1D', b'\xf1E', b'\xf1F', b'\xf1G', b'\xf1H', b'\xf1I',
+    b'\xf1J', b'\xf1K', b'\xf1L', b'\xf1M', b'\xf1N', b'\xf1O', b'\xf1P', b'\xf1Q', b'\xf1R',
+    b'\xf1S', b'\xf1T', b'\xf1U', b'\xf1V', b'\xf1W', b'\xf1Y', b'\xf1j', b'\xf1k', b'\xf1q',
+    b'\xf1v', b'\xf1w', b'\xf1x', b'\xf1y', b'\xf1z', b'\xf1', b'\xf1', b'\xf1', b'\xf1', b'\xf40',
+    b'\xf40', b'\xf40', b'\xf40', b'\xf41', b'\xf41', b'\xf41', b'\xf41', b'\xf42', b'\xf42',
+    b'\xf42', b'\xf42', b'\xf4a', b'\xf4a', b'\xf4a', b'\xf4a', b'\xf4c', b'\xf4c', b'\xf4c',
+    b'\xf4c', b'\xf4e', b'\xf4e', b'\xf4e', b'\xf4e', b'\xf4i', b'\xf4i', b'\xf4i', b'\xf4i',
+    b'\xf4o', b'\xf4o', b'\xf4o', b'\xf4o', b'\xf4s', b'\xf4s', b'\xf4s', b'\xf4s', b'\xf4t',
+    b'\xf4t', b'\xf4t', b'\xf4t', b'\xf4 ', b'\xf4 ', b'\xf4%', b'\xf4%', b'\xf4-', b'\xf4-',
+    b'\xf4.', b'\xf4.', b'\xf4/', b'\xf4/', b'\xf43', b'\xf43', b'\xf44', b'\xf44', b'\xf45',
+    b'\xf45', b'\xf46', b'\xf46', b'\xf47', b'\xf47', b'\xf48', b'\xf48', b'\xf49', b'\xf49',
+    b'\xf4=', b'\xf4=', b'\xf4A', b'\xf4A', b'\xf4_', b'\xf4_', b'\xf4b', b'\xf4b', b'\xf4d',
+    b'\xf4d', b'\xf4f', b'\xf4f', b'\xf4g', b'\xf4g', b'\xf4h', b'\xf4h', b'\xf4l', b'\xf4l',
+    b'\xf4m', b'\xf4m', b'\xf4n', b'\xf4n', b'\xf4p', b'\xf4p', b'\xf4r', b'\xf4r', b'\xf4u',
+    b'\xf4u', b'\xf4:', b'\xf4B', b'\xf4C', b'\xf4D', b'\xf4E', b'\xf4F', b'\xf4G', b'\xf4H',
+    b'\xf4I', b'\xf4J', b'\xf4K', b'\xf4L', b'\xf4M', b'\xf4N', b'\xf4O', b'\xf4P', b'\xf4Q',
+    b'\xf4R', b'\xf4S', b'\xf4T', b'\xf4U', b'\xf4V', b'\xf4W', b'\xf4Y', b'\xf4j', b'\xf4k',
+    b'\xf4q', b'\xf4v', b'\xf4w', b'\xf4x', b'\xf4y', b'\xf4z', b'\xf4', b'\xf4', b'\xf4', b'\xf4',
+    b'\xf20', b'\xf20', b'\xf20', b'\xf20', b'\xf21', b'\xf21', b'\xf21', b'\xf21', b'\xf22',
+    b'\xf22', b'\xf22', b'\xf22', b'\xf2a', b'\xf2a', b'\xf2a', b'\xf2a', b'\xf2c', b'\xf2c',
+    b'\xf2c', b'\xf2c', b'\xf2e', b'\xf2e', b'\xf2e', b'\xf2e', b'\xf2i', b'\xf2i', b'\xf2i',
+    b'\xf2i', b'\xf2o', b'\xf2o', b'\xf2o', b'\xf2o', b'\xf2s', b'\xf2s', b'\xf2s', b'\xf2s',
+    b'\xf2t', b'\xf2t', b'\xf2t', b'\xf2t', b'\xf2 ', b'\xf2 ', b'\xf2%', b'\xf2%', b'\xf2-',
+    b'\xf2-', b'\xf2.', b'\xf2.', b'\xf2/', b'\xf2/', b'\xf23', b'\xf23', b'\xf24', b'\xf24',
+    b'\xf25', b'\xf25', b'\xf26', b'\xf26', b'\xf27', b'\xf27', b'\xf28', b'\xf28', b'\xf29',
+    b'\xf29', b'\xf2=', b'\xf2=', b'\xf2A', b'\xf2A', b'\xf2_', b'\xf2_', b'\xf2b', b'\xf2b',
+    b'\xf2d', b'\xf2d', b'\xf2f', b'\xf2f', b'\xf2g', b'\xf2g', b'\xf2h', b'\xf2h', b'\xf2l',
+    b'\xf2l', b'\xf2m', b'\xf2m', b'\xf2n', b'\xf2n', b'\xf2p', b'\xf2p', b'\xf2r', b'\xf2r',
+    b'\xf2u', b'\xf2u', b'\xf2:', b'\xf2B', b'\xf2C', b'\xf2D', b'\xf2E', b'\xf2F', b'\xf2G',
+    b'\xf2H', b'\xf2I', b'\xf2J', b'\xf2K', b'\xf2L', b'\xf2M', b'\xf2N', b'\xf2O', b'\xf2P',
+    b'\xf2Q', b'\xf2R', b'\xf2S', b'\xf2T', b'\xf2U', b'\xf2V', b'\xf2W', b'\xf2Y', b'\xf2j',
+    b'\xf2k', b'\xf2q', b'\xf2v', b'\xf2w', b'\xf2x', b'\xf2y', b'\xf2z', b'\xf2', b'\xf2', b'\xf2',
+    b'\xf2', b'\xf30', b'\xf30', b'\xf30', b'\xf30', b'\xf31', b'\xf31', b'\xf31', b'\xf31',
+    b'\xf32', b'\xf32', b'\xf32', b'\xf32', b'\xf3a', b'\xf3a', b'\xf3a', b'\xf3a', b'\xf3c',
+    b'\xf3c', b'\xf3c', b'\xf3c', b'\xf3e', b'\xf3e', b'\xf3e', b'\xf3e', b'\xf3i', b'\xf3i',
+    b'\xf3i', b'\xf3i', b'\xf3o', b'\xf3o', b'\xf3o', b'\xf3o', b'\xf3s', b'\xf3s', b'\xf3s',
+    b'\xf3s', b'\xf3t', b'\xf3t', b'\xf3t', b'\xf3t', b'\xf3 ', b'\xf3 ', b'\xf3%', b'\xf3%',
+    b'\xf3-', b'\xf3-', b'\xf3.', b'\xf3.', b'\xf3/', b'\xf3/', b'\xf33', b'\xf33', b'\xf34',
+    b'\xf34', b'\xf35', b'\xf35', b'\xf36', b'\xf36', b'\xf37', b'\xf37', b'\xf38', b'\xf38',
+    b'\xf39', b'\xf39', b'\xf3=', b'\xf3=', b'\xf3A', b'\xf3A', b'\xf3_', b'\xf3_', b'\xf3b',
+    b'\xf3b', b'\xf3d', b'\xf3d', b'\xf3f', b'\xf3f', b'\xf3g', b'\xf3g', b'\xf3h', b'\xf3h',
+    b'\xf3l', b'\xf3l', b'\xf3m', b'\xf3m', b'\xf3n', b'\xf3n', b'\xf3p', b'\xf3p', b'\xf3r',
+    b'\xf3r', b'\xf3u', b'\xf3u', b'\xf3:', b'\xf3B', b'\xf3C', b'\xf3D', b'\xf3E', b'\xf3F',
+    b'\xf3G', b'\xf3H', b'\xf3I', b'\xf3J', b'\xf3K', b'\xf3L', b'\xf3M', b'\xf3N', b'\xf3O',
+    b'\xf3P', b'\xf3Q', b'\xf3R', b'\xf3S', b'\xf3T', b'\xf3U', b'\xf3V', b'\xf3W', b'\xf3Y',
+    b'\xf3j', b'\xf3k', b'\xf3q', b'\xf3v', b'\xf3w', b'\xf3x', b'\xf3y', b'\xf3z', b'\xf3',
+    b'\xf3', b'\xf3', b'\xf3', b'\xf50', b'\xf51', b'\xf52', b'\xf5a', b'\xf5c', b'\xf5e', b'\xf5i',
+    b'\xf5o', b'\xf5s', b'\xf5t', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf60', b'\xf61', b'\xf62', b'\xf6a', b'\xf6c',
+    b'\xf6e', b'\xf6i', b'\xf6o', b'\xf6s', b'\xf6t', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf70', b'\xf71', b'\xf72',
+    b'\xf7a', b'\xf7c', b'\xf7e', b'\xf7i', b'\xf7o', b'\xf7s', b'\xf7t', b'\xf7', b'\xf7', b'\xf7',
+    b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7',
+    b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf80',
+    b'\xf81', b'\xf82', b'\xf8a', b'\xf8c', b'\xf8e', b'\xf8i', b'\xf8o', b'\xf8s', b'\xf8t',
+    b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8',
+    b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8',
+    b'\xf8', b'\xf8', b'\xfa0', b'\xfa1', b'\xfa2', b'\xfaa', b'\xfac', b'\xfae', b'\xfai',
+    b'\xfao', b'\xfas', b'\xfat', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfb0', b'\xfb1', b'\xfb2', b'\xfba', b'\xfbc',
+    b'\xfbe', b'\xfbi', b'\xfbo', b'\xfbs', b'\xfbt', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfc0', b'\xfc1', b'\xfc2',
+    b'\xfca', b'\xfcc', b'\xfce', b'\xfci', b'\xfco', b'\xfcs', b'\xfct', b'\xfc', b'\xfc', b'\xfc',
+    b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc',
+    b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfd0',
+    b'\xfd1', b'\xfd2', b'\xfda', b'\xfdc', b'\xfde', b'\xfdi', b'\xfdo', b'\xfds', b'\xfdt',
+    b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd',
+    b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd',
+    b'\xfd', b'\xfd', b'\xf50', b'\xf50', b'\xf51', b'\xf51', b'\xf52', b'\xf52', b'\xf5a',
+    b'\xf5a', b'\xf5c', b'\xf5c', b'\xf5e', b'\xf5e', b'\xf5i', b'\xf5i', b'\xf5o', b'\xf5o',
+    b'\xf5s', b'\xf5s', b'\xf5t', b'\xf5t', b'\xf5 ', b'\xf5%', b'\xf5-', b'\xf5.', b'\xf5/',
+    b'\xf53', b'\xf54', b'\xf55', b'\xf56', b'\xf57', b'\xf58', b'\xf59', b'\xf5=', b'\xf5A',
+    b'\xf5_', b'\xf5b', b'\xf5d', b'\xf5f', b'\xf5g', b'\xf5h', b'\xf5l', b'\xf5m', b'\xf5n',
+    b'\xf5p', b'\xf5r', b'\xf5u', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf5',
+    b'\xf5', b'\xf60', b'\xf60', b'\xf61', b'\xf61', b'\xf62', b'\xf62', b'\xf6a', b'\xf6a',
+    b'\xf6c', b'\xf6c', b'\xf6e', b'\xf6e', b'\xf6i', b'\xf6i', b'\xf6o', b'\xf6o', b'\xf6s',
+    b'\xf6s', b'\xf6t', b'\xf6t', b'\xf6 ', b'\xf6%', b'\xf6-', b'\xf6.', b'\xf6/', b'\xf63',
+    b'\xf64', b'\xf65', b'\xf66', b'\xf67', b'\xf68', b'\xf69', b'\xf6=', b'\xf6A', b'\xf6_',
+    b'\xf6b', b'\xf6d', b'\xf6f', b'\xf6g', b'\xf6h', b'\xf6l', b'\xf6m', b'\xf6n', b'\xf6p',
+    b'\xf6r', b'\xf6u', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf70', b'\xf70', b'\xf71', b'\xf71', b'\xf72', b'\xf72', b'\xf7a', b'\xf7a', b'\xf7c',
+    b'\xf7c', b'\xf7e', b'\xf7e', b'\xf7i', b'\xf7i', b'\xf7o', b'\xf7o', b'\xf7s', b'\xf7s',
+    b'\xf7t', b'\xf7t', b'\xf7 ', b'\xf7%', b'\xf7-', b'\xf7.', b'\xf7/', b'\xf73', b'\xf74',
+    b'\xf75', b'\xf76', b'\xf77', b'\xf78', b'\xf79', b'\xf7=', b'\xf7A', b'\xf7_', b'\xf7b',
+    b'\xf7d', b'\xf7f', b'\xf7g', b'\xf7h', b'\xf7l', b'\xf7m', b'\xf7n', b'\xf7p', b'\xf7r',
+    b'\xf7u', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7',
+    b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf7', b'\xf80',
+    b'\xf80', b'\xf81', b'\xf81', b'\xf82', b'\xf82', b'\xf8a', b'\xf8a', b'\xf8c', b'\xf8c',
+    b'\xf8e', b'\xf8e', b'\xf8i', b'\xf8i', b'\xf8o', b'\xf8o', b'\xf8s', b'\xf8s', b'\xf8t',
+    b'\xf8t', b'\xf8 ', b'\xf8%', b'\xf8-', b'\xf8.', b'\xf8/', b'\xf83', b'\xf84', b'\xf85',
+    b'\xf86', b'\xf87', b'\xf88', b'\xf89', b'\xf8=', b'\xf8A', b'\xf8_', b'\xf8b', b'\xf8d',
+    b'\xf8f', b'\xf8g', b'\xf8h', b'\xf8l', b'\xf8m', b'\xf8n', b'\xf8p', b'\xf8r', b'\xf8u',
+    b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8',
+    b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf8', b'\xf50', b'\xf50',
+    b'\xf50', b'\xf50', b'\xf51', b'\xf51', b'\xf51', b'\xf51', b'\xf52', b'\xf52', b'\xf52',
+    b'\xf52', b'\xf5a', b'\xf5a', b'\xf5a', b'\xf5a', b'\xf5c', b'\xf5c', b'\xf5c', b'\xf5c',
+    b'\xf5e', b'\xf5e', b'\xf5e', b'\xf5e', b'\xf5i', b'\xf5i', b'\xf5i', b'\xf5i', b'\xf5o',
+    b'\xf5o', b'\xf5o', b'\xf5o', b'\xf5s', b'\xf5s', b'\xf5s', b'\xf5s', b'\xf5t', b'\xf5t',
+    b'\xf5t', b'\xf5t', b'\xf5 ', b'\xf5 ', b'\xf5%', b'\xf5%', b'\xf5-', b'\xf5-', b'\xf5.',
+    b'\xf5.', b'\xf5/', b'\xf5/', b'\xf53', b'\xf53', b'\xf54', b'\xf54', b'\xf55', b'\xf55',
+    b'\xf56', b'\xf56', b'\xf57', b'\xf57', b'\xf58', b'\xf58', b'\xf59', b'\xf59', b'\xf5=',
+    b'\xf5=', b'\xf5A', b'\xf5A', b'\xf5_', b'\xf5_', b'\xf5b', b'\xf5b', b'\xf5d', b'\xf5d',
+    b'\xf5f', b'\xf5f', b'\xf5g', b'\xf5g', b'\xf5h', b'\xf5h', b'\xf5l', b'\xf5l', b'\xf5m',
+    b'\xf5m', b'\xf5n', b'\xf5n', b'\xf5p', b'\xf5p', b'\xf5r', b'\xf5r', b'\xf5u', b'\xf5u',
+    b'\xf5:', b'\xf5B', b'\xf5C', b'\xf5D', b'\xf5E', b'\xf5F', b'\xf5G', b'\xf5H', b'\xf5I',
+    b'\xf5J', b'\xf5K', b'\xf5L', b'\xf5M', b'\xf5N', b'\xf5O', b'\xf5P', b'\xf5Q', b'\xf5R',
+    b'\xf5S', b'\xf5T', b'\xf5U', b'\xf5V', b'\xf5W', b'\xf5Y', b'\xf5j', b'\xf5k', b'\xf5q',
+    b'\xf5v', b'\xf5w', b'\xf5x', b'\xf5y', b'\xf5z', b'\xf5', b'\xf5', b'\xf5', b'\xf5', b'\xf60',
+    b'\xf60', b'\xf60', b'\xf60', b'\xf61', b'\xf61', b'\xf61', b'\xf61', b'\xf62', b'\xf62',
+    b'\xf62', b'\xf62', b'\xf6a', b'\xf6a', b'\xf6a', b'\xf6a', b'\xf6c', b'\xf6c', b'\xf6c',
+    b'\xf6c', b'\xf6e', b'\xf6e', b'\xf6e', b'\xf6e', b'\xf6i', b'\xf6i', b'\xf6i', b'\xf6i',
+    b'\xf6o', b'\xf6o', b'\xf6o', b'\xf6o', b'\xf6s', b'\xf6s', b'\xf6s', b'\xf6s', b'\xf6t',
+    b'\xf6t', b'\xf6t', b'\xf6t', b'\xf6 ', b'\xf6 ', b'\xf6%', b'\xf6%', b'\xf6-', b'\xf6-',
+    b'\xf6.', b'\xf6.', b'\xf6/', b'\xf6/', b'\xf63', b'\xf63', b'\xf64', b'\xf64', b'\xf65',
+    b'\xf65', b'\xf66', b'\xf66', b'\xf67', b'\xf67', b'\xf68', b'\xf68', b'\xf69', b'\xf69',
+    b'\xf6=', b'\xf6=', b'\xf6A', b'\xf6A', b'\xf6_', b'\xf6_', b'\xf6b', b'\xf6b', b'\xf6d',
+    b'\xf6d', b'\xf6f', b'\xf6f', b'\xf6g', b'\xf6g', b'\xf6h', b'\xf6h', b'\xf6l', b'\xf6l',
+    b'\xf6m', b'\xf6m', b'\xf6n', b'\xf6n', b'\xf6p', b'\xf6p', b'\xf6r', b'\xf6r', b'\xf6u',
+    b'\xf6u', b'\xf6:', b'\xf6B', b'\xf6C', b'\xf6D', b'\xf6E', b'\xf6F', b'\xf6G', b'\xf6H',
+    b'\xf6I', b'\xf6J', b'\xf6K', b'\xf6L', b'\xf6M', b'\xf6N', b'\xf6O', b'\xf6P', b'\xf6Q',
+    b'\xf6R', b'\xf6S', b'\xf6T', b'\xf6U', b'\xf6V', b'\xf6W', b'\xf6Y', b'\xf6j', b'\xf6k',
+    b'\xf6q', b'\xf6v', b'\xf6w', b'\xf6x', b'\xf6y', b'\xf6z', b'\xf6', b'\xf6', b'\xf6', b'\xf6',
+    b'\xf70', b'\xf70', b'\xf70', b'\xf70', b'\xf71', b'\xf71', b'\xf71', b'\xf71', b'\xf72',
+    b'\xf72', b'\xf72', b'\xf72', b'\xf7a', b'\xf7a', b'\xf7a', b'\xf7a', b'\xf7c', b'\xf7c',
+    b'\xf7c', b'\xf7c', b'\xf7e', b'\xf7e', b'\xf7e', b'\xf7e', b'\xf7i', b'\xf7i', b'\xf7i',
+    b'\xf7i', b'\xf7o', b'\xf7o', b'\xf7o', b'\xf7o', b'\xf7s', b'\xf7s', b'\xf7s', b'\xf7s',
+    b'\xf7t', b'\xf7t', b'\xf7t', b'\xf7t', b'\xf7 ', b'\xf7 ', b'\xf7%', b'\xf7%', b'\xf7-',
+    b'\xf7-', b'\xf7.', b'\xf7.', b'\xf7/', b'\xf7/', b'\xf73', b'\xf73', b'\xf74', b'\xf74',
+    b'\xf75', b'\xf75', b'\xf76', b'\xf76', b'\xf77', b'\xf77', b'\xf78', b'\xf78', b'\xf79',
+    b'\xf79', b'\xf7=', b'\xf7=', b'\xf7A', b'\xf7A', b'\xf7_', b'\xf7_', b'\xf7b', b'\xf7b',
+    b'\xf7d', b'\xf7d', b'\xf7f', b'\xf7f', b'\xf7g', b'\xf7g', b'\xf7h', b'\xf7h', b'\xf7l',
+    b'\xf7l', b'\xf7m', b'\xf7m', b'\xf7n', b'\xf7n', b'\xf7p', b'\xf7p', b'\xf7r', b'\xf7r',
+    b'\xf7u', b'\xf7u', b'\xf7:', b'\xf7B', b'\xf7C', b'\xf7D', b'\xf7E', b'\xf7F', b'\xf7G',
+    b'\xf7H', b'\xf7I', b'\xf7J', b'\xf7K', b'\xf7L', b'\xf7M', b'\xf7N', b'\xf7O', b'\xf7P',
+    b'\xf7Q', b'\xf7R', b'\xf7S', b'\xf7T', b'\xf7U', b'\xf7V', b'\xf7W', b'\xf7Y', b'\xf7j',
+    b'\xf7k', b'\xf7q', b'\xf7v', b'\xf7w', b'\xf7x', b'\xf7y', b'\xf7z', b'\xf7', b'\xf7', b'\xf7',
+    b'\xf7', b'\xf80', b'\xf80', b'\xf80', b'\xf80', b'\xf81', b'\xf81', b'\xf81', b'\xf81',
+    b'\xf82', b'\xf82', b'\xf82', b'\xf82', b'\xf8a', b'\xf8a', b'\xf8a', b'\xf8a', b'\xf8c',
+    b'\xf8c', b'\xf8c', b'\xf8c', b'\xf8e', b'\xf8e', b'\xf8e', b'\xf8e', b'\xf8i', b'\xf8i',
+    b'\xf8i', b'\xf8i', b'\xf8o', b'\xf8o', b'\xf8o', b'\xf8o', b'\xf8s', b'\xf8s', b'\xf8s',
+    b'\xf8s', b'\xf8t', b'\xf8t', b'\xf8t', b'\xf8t', b'\xf8 ', b'\xf8 ', b'\xf8%', b'\xf8%',
+    b'\xf8-', b'\xf8-', b'\xf8.', b'\xf8.', b'\xf8/', b'\xf8/', b'\xf83', b'\xf83', b'\xf84',
+    b'\xf84', b'\xf85', b'\xf85', b'\xf86', b'\xf86', b'\xf87', b'\xf87', b'\xf88', b'\xf88',
+    b'\xf89', b'\xf89', b'\xf8=', b'\xf8=', b'\xf8A', b'\xf8A', b'\xf8_', b'\xf8_', b'\xf8b',
+    b'\xf8b', b'\xf8d', b'\xf8d', b'\xf8f', b'\xf8f', b'\xf8g', b'\xf8g', b'\xf8h', b'\xf8h',
+    b'\xf8l', b'\xf8l', b'\xf8m', b'\xf8m', b'\xf8n', b'\xf8n', b'\xf8p', b'\xf8p', b'\xf8r',
+    b'\xf8r', b'\xf8u', b'\xf8u', b'\xf8:', b'\xf8B', b'\xf8C', b'\xf8D', b'\xf8E', b'\xf8F',
+    b'\xf8G', b'\xf8H', b'\xf8I', b'\xf8J', b'\xf8K', b'\xf8L', b'\xf8M', b'\xf8N', b'\xf8O',
+    b'\xf8P', b'\xf8Q', b'\xf8R', b'\xf8S', b'\xf8T', b'\xf8U', b'\xf8V', b'\xf8W', b'\xf8Y',
+    b'\xf8j', b'\xf8k', b'\xf8q', b'\xf8v', b'\xf8w', b'\xf8x', b'\xf8y', b'\xf8z', b'\xf8',
+    b'\xf8', b'\xf8', b'\xf8', b'\xfa0', b'\xfa0', b'\xfa1', b'\xfa1', b'\xfa2', b'\xfa2', b'\xfaa',
+    b'\xfaa', b'\xfac', b'\xfac', b'\xfae', b'\xfae', b'\xfai', b'\xfai', b'\xfao', b'\xfao',
+    b'\xfas', b'\xfas', b'\xfat', b'\xfat', b'\xfa ', b'\xfa%', b'\xfa-', b'\xfa.', b'\xfa/',
+    b'\xfa3', b'\xfa4', b'\xfa5', b'\xfa6', b'\xfa7', b'\xfa8', b'\xfa9', b'\xfa=', b'\xfaA',
+    b'\xfa_', b'\xfab', b'\xfad', b'\xfaf', b'\xfag', b'\xfah', b'\xfal', b'\xfam', b'\xfan',
+    b'\xfap', b'\xfar', b'\xfau', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfa',
+    b'\xfa', b'\xfb0', b'\xfb0', b'\xfb1', b'\xfb1', b'\xfb2', b'\xfb2', b'\xfba', b'\xfba',
+    b'\xfbc', b'\xfbc', b'\xfbe', b'\xfbe', b'\xfbi', b'\xfbi', b'\xfbo', b'\xfbo', b'\xfbs',
+    b'\xfbs', b'\xfbt', b'\xfbt', b'\xfb ', b'\xfb%', b'\xfb-', b'\xfb.', b'\xfb/', b'\xfb3',
+    b'\xfb4', b'\xfb5', b'\xfb6', b'\xfb7', b'\xfb8', b'\xfb9', b'\xfb=', b'\xfbA', b'\xfb_',
+    b'\xfbb', b'\xfbd', b'\xfbf', b'\xfbg', b'\xfbh', b'\xfbl', b'\xfbm', b'\xfbn', b'\xfbp',
+    b'\xfbr', b'\xfbu', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfc0', b'\xfc0', b'\xfc1', b'\xfc1', b'\xfc2', b'\xfc2', b'\xfca', b'\xfca', b'\xfcc',
+    b'\xfcc', b'\xfce', b'\xfce', b'\xfci', b'\xfci', b'\xfco', b'\xfco', b'\xfcs', b'\xfcs',
+    b'\xfct', b'\xfct', b'\xfc ', b'\xfc%', b'\xfc-', b'\xfc.', b'\xfc/', b'\xfc3', b'\xfc4',
+    b'\xfc5', b'\xfc6', b'\xfc7', b'\xfc8', b'\xfc9', b'\xfc=', b'\xfcA', b'\xfc_', b'\xfcb',
+    b'\xfcd', b'\xfcf', b'\xfcg', b'\xfch', b'\xfcl', b'\xfcm', b'\xfcn', b'\xfcp', b'\xfcr',
+    b'\xfcu', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc',
+    b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfc', b'\xfd0',
+    b'\xfd0', b'\xfd1', b'\xfd1', b'\xfd2', b'\xfd2', b'\xfda', b'\xfda', b'\xfdc', b'\xfdc',
+    b'\xfde', b'\xfde', b'\xfdi', b'\xfdi', b'\xfdo', b'\xfdo', b'\xfds', b'\xfds', b'\xfdt',
+    b'\xfdt', b'\xfd ', b'\xfd%', b'\xfd-', b'\xfd.', b'\xfd/', b'\xfd3', b'\xfd4', b'\xfd5',
+    b'\xfd6', b'\xfd7', b'\xfd8', b'\xfd9', b'\xfd=', b'\xfdA', b'\xfd_', b'\xfdb', b'\xfdd',
+    b'\xfdf', b'\xfdg', b'\xfdh', b'\xfdl', b'\xfdm', b'\xfdn', b'\xfdp', b'\xfdr', b'\xfdu',
+    b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd',
+    b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfd', b'\xfa0', b'\xfa0',
+    b'\xfa0', b'\xfa0', b'\xfa1', b'\xfa1', b'\xfa1', b'\xfa1', b'\xfa2', b'\xfa2', b'\xfa2',
+    b'\xfa2', b'\xfaa', b'\xfaa', b'\xfaa', b'\xfaa', b'\xfac', b'\xfac', b'\xfac', b'\xfac',
+    b'\xfae', b'\xfae', b'\xfae', b'\xfae', b'\xfai', b'\xfai', b'\xfai', b'\xfai', b'\xfao',
+    b'\xfao', b'\xfao', b'\xfao', b'\xfas', b'\xfas', b'\xfas', b'\xfas', b'\xfat', b'\xfat',
+    b'\xfat', b'\xfat', b'\xfa ', b'\xfa ', b'\xfa%', b'\xfa%', b'\xfa-', b'\xfa-', b'\xfa.',
+    b'\xfa.', b'\xfa/', b'\xfa/', b'\xfa3', b'\xfa3', b'\xfa4', b'\xfa4', b'\xfa5', b'\xfa5',
+    b'\xfa6', b'\xfa6', b'\xfa7', b'\xfa7', b'\xfa8', b'\xfa8', b'\xfa9', b'\xfa9', b'\xfa=',
+    b'\xfa=', b'\xfaA', b'\xfaA', b'\xfa_', b'\xfa_', b'\xfab', b'\xfab', b'\xfad', b'\xfad',
+    b'\xfaf', b'\xfaf', b'\xfag', b'\xfag', b'\xfah', b'\xfah', b'\xfal', b'\xfal', b'\xfam',
+    b'\xfam', b'\xfan', b'\xfan', b'\xfap', b'\xfap', b'\xfar', b'\xfar', b'\xfau', b'\xfau',
+    b'\xfa:', b'\xfaB', b'\xfaC', b'\xfaD', b'\xfaE', b'\xfaF', b'\xfaG', b'\xfaH', b'\xfaI',
+    b'\xfaJ', b'\xfaK', b'\xfaL', b'\xfaM', b'\xfaN', b'\xfaO', b'\xfaP', b'\xfaQ', b'\xfaR',
+    b'\xfaS', b'\xfaT', b'\xfaU', b'\xfaV', b'\xfaW', b'\xfaY', b'\xfaj', b'\xfak', b'\xfaq',
+    b'\xfav', b'\xfaw', b'\xfax', b'\xfay', b'\xfaz', b'\xfa', b'\xfa', b'\xfa', b'\xfa', b'\xfb0',
+    b'\xfb0', b'\xfb0', b'\xfb0', b'\xfb1', b'\xfb1', b'\xfb1', b'\xfb1', b'\xfb2', b'\xfb2',
+    b'\xfb2', b'\xfb2', b'\xfba', b'\xfba', b'\xfba', b'\xfba', b'\xfbc', b'\xfbc', b'\xfbc',
+    b'\xfbc', b'\xfbe', b'\xfbe', b'\xfbe', b'\xfbe', b'\xfbi', b'\xfbi', b'\xfbi', b'\xfbi',
+    b'\xfbo', b'\xfbo', b'\xfbo', b'\xfbo', b'\xfbs', b'\xfbs', b'\xfbs', b'\xfbs', b'\xfbt',
+    b'\xfbt', b'\xfbt', b'\xfbt', b'\xfb ', b'\xfb ', b'\xfb%', b'\xfb%', b'\xfb-', b'\xfb-',
+    b'\xfb.', b'\xfb.', b'\xfb/', b'\xfb/', b'\xfb3', b'\xfb3', b'\xfb4', b'\xfb4', b'\xfb5',
+    b'\xfb5', b'\xfb6', b'\xfb6', b'\xfb7', b'\xfb7', b'\xfb8', b'\xfb8', b'\xfb9', b'\xfb9',
+    b'\xfb=', b'\xfb=', b'\xfbA', b'\xfbA', b'\xfb_', b'\xfb_', b'\xfbb', b'\xfbb', b'\xfbd',
+    b'\xfbd', b'\xfbf', b'\xfbf', b'\xfbg', b'\xfbg', b'\xfbh', b'\xfbh', b'\xfbl', b'\xfbl',
+    b'\xfbm', b'\xfbm', b'\xfbn', b'\xfbn', b'\xfbp', b'\xfbp', b'\xfbr', b'\xfbr', b'\xfbu',
+    b'\xfbu', b'\xfb:', b'\xfbB', b'\xfbC', b'\xfbD', b'\xfbE', b'\xfbF', b'\xfbG', b'\xfbH',
+    b'\xfbI', b'\xfbJ', b'\xfbK', b'\xfbL', b'\xfbM', b'\xfbN', b'\xfbO', b'\xfbP', b'\xfbQ',
+    b'\xfbR', b'\xfbS', b'\xfbT', b'\xfbU', b'\xfbV', b'\xfbW', b'\xfbY', b'\xfbj', b'\xfbk',
+    b'\xfbq', b'\xfbv', b'\xfbw', b'\xfbx', b'\xfby', b'\xfbz', b'\xfb', b'\xfb', b'\xfb', b'\xfb',
+    b'\xfc0', b'\xfc0', b'\xfc0', b'\xfc0', b'\xfc1', b'\xfc1', b'\xfc1', b'\xfc1', b'\xfc2',
+    b'\xfc2', b'\xfc2', b'\xfc2', b'\xfca', b'\xfca', b'\xfca', b'\xfca', b'\xfcc', b'\xfcc',
+    b'\xfcc', b'\xfcc', b'\xfce', b'\xfce', b'\xfce', b'\xfce', b'\xfci', b'\xfci', b'\xfci',
+    b'\xfci', b'\xfco', b'\xfco', b'\xfco', b'\xfco', b'\xfcs', b'\xfcs', b'\xfcs', b'\xfcs',
+    b'\xfct', b'\xfct', b'\xfct', b'\xfct', b'\xfc ', b'\xfc ', b'\xfc%', b'\xfc%', b'\xfc-',
+    b'\xfc-', b'\xfc.', b'\xfc.', b'\xfc/', b'\xfc/', b'\xfc3', b'\xfc3', b'\xfc4', b'\xfc4',
+    b'\xfc5', b'\xfc5', b'\xfc6', b'\xfc6', b'\xfc7', b'\xfc7', b'\xfc8', b'\xfc8', b'\xfc9',
+    b'\xfc9', b'\xfc=', b'\xfc=', b'\xfcA', b'\xfcA', b'\xfc_', b'\xfc_', b'\xfcb', b'\xfcb',
+    b'\xfcd', b'\xfcd', b'\xfcf', b'\xfcf', b'\xfcg', b'\xfcg', b'\xfch', b'\xfch', b'\xfcl',
+    b'\xfcl', b'\xfcm', b'\xfcm', b'\xfcn', b'\xfcn', b'\xfcp', b'\xfcp', b'\xfcr', b'\xfcr',
+    b'\xfcu', b'\xfcu', b'\xfc:', b'\xfcB', b'\xfcC', b'\xfcD', b'\xfcE', b'\xfcF', b'\xfcG',
+    b'\xfcH', b'\xfcI', b'\xfcJ', b'\xfcK', b'\xfcL', b'\xfcM', b'\xfcN', b'\xfcO', b'\xfcP',
+    b'\xfcQ', b'\xfcR', b'\xfcS', b'\xfcT', b'\xfcU', b'\xfcV', b'\xfcW', b'\xfcY', b'\xfcj',
+    b'\xfck', b'\xfcq', b'\xfcv', b'\xfcw', b'\xfcx', b'\xfcy', b'\xfcz', b'\xfc', b'\xfc', b'\xfc',
+    b'\xfc', b'\xfd0', b'\xfd0', b'\xfd0', b'\xfd0', b'\xfd1', b'\xfd1', b'\xfd1', b'\xfd1',
+    b'\xfd2', b'\xfd2', b'\xfd2', b'\xfd2', b'\xfda', b'\xfda', b'\xfda', b'\xfda', b'\xfdc',
+    b'\xfdc', b'\xfdc', b'\xfdc', b'\xfde', b'\xfde', b'\xfde', b'\xfde', b'\xfdi', b'\xfdi',
+    b'\xfdi', b'\xfdi', b'\xfdo', b'\xfdo', b'\xfdo', b'\xfdo', b'\xfds', b'\xfds', b'\xfds',
+    b'\xfds', b'\xfdt', b'\xfdt', b'\xfdt', b'\xfdt', b'\xfd ', b'\xfd ', b'\xfd%', b'\xfd%',
+    b'\xfd-', b'\xfd-', b'\xfd.', b'\xfd.', b'\xfd/', b'\xfd/', b'\xfd3', b'\xfd3', b'\xfd4',
+    b'\xfd4', b'\xfd5', b'\xfd5', b'\xfd6', b'\xfd6', b'\xfd7', b'\xfd7', b'\xfd8', b'\xfd8',
+    b'\xfd9', b'\xfd9', b'\xfd=', b'\xfd=', b'\xfdA', b'\xfdA', b'\xfd_', b'\xfd_', b'\xfdb',
+    b'\xfdb', b'\xfdd', b'\xfdd', b'\xfdf', b'\xfdf', b'\xfdg', b'\xfdg', b'\xfdh', b'\xfdh',
+    b'\xfdl', b'\xfdl', b'\xfdm', b'\xfdm', b'\xfdn', b'\xfdn', b'\xfdp', b'\xfdp', b'\xfdr',
+    b'\xfdr', b'\xfdu', b'\xfdu', b'\xfd:', b'\xfdB', b'\xfdC', b'\xfdD', b'\xfdE', b'\xfdF',
+    b'\xfdG', b'\xfdH', b'\xfdI', b'\xfdJ', b'\xfdK', b'\xfdL', b'\xfdM', b'\xfdN', b'\xfdO',
+    b'\xfdP', b'\xfdQ', b'\xfdR', b'\xfdS', b'\xfdT', b'\xfdU', b'\xfdV', b'\xfdW', b'\xfdY',
+    b'\xfdj', b'\xfdk', b'\xfdq', b'\xfdv', b'\xfdw', b'\xfdx', b'\xfdy', b'\xfdz', b'\xfd',
+    b'\xfd', b'\xfd', b'\xfd', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+    b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'', b'',
+)
+
+HUFFMAN_ACCEPT = frozenset((
+    0, 256, 512, 768, 1024, 1280, 1536, 1792,
+))
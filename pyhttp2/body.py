@@ -0,0 +1,171 @@
+import asyncio
+import mmap
+import os
+import stat
+
+
+class Body(object):
+    """
+    Request or response body sent in chunks: the stream reads at most one
+    frame worth of data at a time, when it is able to send it, so the memory
+    used per stream doesn't depend on the size of the body.
+    """
+    # Size in octets if known.
+    length = None
+
+    async def read(self, size):
+        """
+        Returns up to size octets (a bytes-like object), empty at the end.
+        """
+        raise NotImplementedError()
+
+    def at_eof(self):
+        """
+        True if nothing is left to read.
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+
+class BufferBody(Body):
+    """
+    Body over a bytes-like object, chunks are memoryview slices of it.
+    """
+    def __init__(self, data):
+        self._view = memoryview(data).cast('B')
+        self._offset = 0
+        self.length = len(self._view)
+
+    async def read(self, size):
+        return self.read_nowait(size)
+
+    def read_nowait(self, size):
+        chunk = self._view[self._offset:self._offset + size]
+        self._offset += len(chunk)
+        return chunk
+
+    def at_eof(self):
+        return self._offset >= self.length
+
+
+class MmapBody(BufferBody):
+    """
+    Body over a memory map, the file pages are sent as memoryview slices of
+    the map without being read into intermediate buffers.
+
+    :param source:
+        mmap.mmap or a file object of a regular file, which is mapped
+        read-only (the map is closed with the body).
+    """
+    def __init__(self, source):
+        self._owned = not isinstance(source, mmap.mmap)
+        if self._owned:
+            source = mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._map = source
+        super().__init__(source)
+
+    def close(self):
+        self._view.release()
+        if self._owned:
+            try:
+                self._map.close()
+            except BufferError:
+                # Slices are still referenced (e.g. by the transport), the
+                # map is closed when they are gone.
+                pass
+
+
+class FileBody(Body):
+    """
+    Body read from a file object which can't be mapped (pipes, sockets,
+    in-memory files). Reads run in the default executor.
+    """
+    def __init__(self, file):
+        self.file = file
+        self._eof = False
+
+    async def read(self, size):
+        loop = asyncio.get_running_loop()
+        chunk = await loop.run_in_executor(None, self.file.read, size)
+        if not chunk:
+            self._eof = True
+
+        return chunk
+
+    def at_eof(self):
+        return self._eof
+
+
+class IteratorBody(Body):
+    """
+    Body produced by an (async) iterator of bytes-like chunks. Chunks
+    larger than requested are split into memoryview slices.
+
+    Frames reference their payload until the transport has written it,
+    while the next chunk is pulled as soon as the previous one is queued.
+    Chunks other than bytes are therefore copied: the iterator may refill
+    the same buffer.
+    """
+    def __init__(self, iterable):
+        if hasattr(iterable, '__aiter__'):
+            self._iterator = iterable.__aiter__()
+            self._async = True
+        else:
+            self._iterator = iter(iterable)
+            self._async = False
+
+        self._chunk = None
+        self._eof = False
+
+    async def read(self, size):
+        while self._chunk is None or self._chunk.at_eof():
+            try:
+                if self._async:
+                    chunk = await self._iterator.__anext__()
+                else:
+                    chunk = next(self._iterator)
+            except (StopIteration, StopAsyncIteration):
+                self._eof = True
+                return b''
+
+            if not isinstance(chunk, bytes):
+                chunk = bytes(chunk)
+            self._chunk = BufferBody(chunk)
+
+        return self._chunk.read_nowait(size)
+
+    def at_eof(self):
+        return self._eof
+
+
+def make_body(source):
+    """
+    Returns a Body for a bytes-like object, mmap, file object or (async)
+    iterable. Files of regular files are memory mapped.
+    """
+    if isinstance(source, Body):
+        return source
+
+    if isinstance(source, mmap.mmap):
+        return MmapBody(source)
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return BufferBody(source)
+
+    if hasattr(source, 'read'):
+        try:
+            fileno = source.fileno()
+        except (AttributeError, OSError, ValueError):
+            return FileBody(source)
+
+        # Empty files and special files can't be mapped.
+        st = os.fstat(fileno)
+        if st.st_size and stat.S_ISREG(st.st_mode) and not source.tell():
+            return MmapBody(source)
+
+        return FileBody(source)
+
+    return IteratorBody(source)
@@ -0,0 +1,1177 @@
+import asyncio
+import collections
+import ssl as _ssl
+
+from .frames import (
+    FrameReader, DataFrame, HeadersFrame, PriorityFrame, SettingsFrame, RstStreamFrame, PingFrame,
+    GoAwayFrame, WindowUpdateFrame, FRAME_HEADER_LENGTH, DEFAULT_MAX_FRAME_SIZE, MAX_FRAME_SIZE_LIMIT
+)
+from .hpack import CompressionContext, HeaderList, DEFAULT_TABLE_SIZE
+from .flow import FlowControl, MAX_WINDOW_SIZE
+from .priority import PriorityTree, DEFAULT_WEIGHT
+from .writer import FrameWriter
+from .body import make_body
+from .request import Response
+from .errors import (
+    HTTP2Error, ProtocolError, FrameSizeError, FlowControlError, StreamResetError,
+    ConnectionClosedError, CompressionError, HeaderListTooLargeError, NO_ERROR, PROTOCOL_ERROR, STREAM_CLOSED, CANCEL, REFUSED_STREAM
+)
+
+# Client connection preface [RFC7540, section 3.5].
+CONNECTION_PREFACE = b'PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n'
+
+DEFAULT_WINDOW_SIZE = 65535
+
+MAX_STREAM_ID = 2**31 - 1
+
+# Limit of the encoded size of a header block (HEADERS and its CONTINUATION
+# frames) while SETTINGS_MAX_HEADER_LIST_SIZE is unlimited.
+DEFAULT_MAX_HEADER_BLOCK_SIZE = 2**20
+
+# With SETTINGS_MAX_HEADER_LIST_SIZE the limit is a multiple of it: a Huffman
+# code is at most 30 bits long, so a block encoding a list within the limit
+# is never larger.
+_HEADER_BLOCK_SIZE_FACTOR = 4
+
+# Opaque data of the PINGs measuring round trips for window autotuning.
+_BDP_PING = b'\x00pyh2bdp'
+
+# Initial values of the settings [RFC7540, section 6.5.2], None means
+# unlimited.
+DEFAULT_SETTINGS = {
+    SettingsFrame.SETTINGS_HEADER_TABLE_SIZE: DEFAULT_TABLE_SIZE,
+    SettingsFrame.SETTINGS_ENABLE_PUSH: 1,
+    SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS: None,
+    SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE: DEFAULT_WINDOW_SIZE,
+    SettingsFrame.SETTINGS_MAX_FRAME_SIZE: DEFAULT_MAX_FRAME_SIZE,
+    SettingsFrame.SETTINGS_MAX_HEADER_LIST_SIZE: None,
+}
+
+
+def _to_bytes(s):
+    return s.encode('ascii') if isinstance(s, str) else s
+
+
+def _wake(waiters):
+    for waiter in waiters:
+        if not waiter.done():
+            waiter.set_result(None)
+
+    waiters.clear()
+
+
+class Stream(object):
+    """
+    Stream of a connection [RFC7540, section 5].
+
+    Received DATA payloads are queued as memoryview slices of the frame
+    reader buffer and are credited back to the flow-control windows when
+    read. Data to send is queued until the connection scheduler picks the
+    stream.
+    """
+    def __init__(self, connection, stream_id):
+        self.connection = connection
+        self.stream_id = stream_id
+
+        self.send_window = connection.remote_settings[SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE]
+        self.recv_window = connection.flow_control.window(
+            connection.local_settings[SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE])
+
+        self.opened_at = connection.loop.time()
+
+        self.headers = None
+        self.trailers = None
+        self.local_closed = False
+        self.remote_closed = False
+        self.error = None
+
+        self._headers_waiter = connection.loop.create_future()
+        self._data = collections.deque()
+        self._data_waiter = None
+
+        # (memoryview, end_stream) chunks waiting to be sent.
+        self._outbound = collections.deque()
+        self._drained = None
+
+    @property
+    def closed(self):
+        return self.error is not None or (self.local_closed and self.remote_closed)
+
+    async def wait_headers(self):
+        """
+        Waits for the (final) header block of the stream.
+        """
+        return await asyncio.shield(self._headers_waiter)
+
+    async def read_chunk(self):
+        """
+        Returns the next chunk of the body or None at its end.
+        """
+        while not self._data:
+            if self.error is not None:
+                raise self.error
+            if self.remote_closed:
+                return None
+
+            self._data_waiter = self.connection.loop.create_future()
+            await self._data_waiter
+
+        chunk = self._data.popleft()
+        self.connection._data_consumed(self, len(chunk))
+
+        return chunk
+
+    def cancel(self):
+        """
+        Resets the stream with CANCEL unless it is already closed.
+        """
+        if not self.closed:
+            self.connection.reset_stream(self, CANCEL)
+
+    def _receive_headers(self, headers, end_stream):
+        if self.headers is None:
+            self.headers = headers
+            if not self._headers_waiter.done():
+                self._headers_waiter.set_result(headers)
+        else:
+            self.trailers = headers
+
+        if end_stream:
+            self._receive_end()
+
+    def _receive_data(self, data, end_stream):
+        if data:
+            self._data.append(data)
+
+        if end_stream:
+            self._receive_end()
+        else:
+            self._wake_reader()
+
+    def _receive_end(self):
+        self.remote_closed = True
+        self._wake_reader()
+
+    def _fail(self, error):
+        if self.error is not None:
+            return
+
+        self.error = error
+        if not self._headers_waiter.done():
+            self._headers_waiter.set_exception(error)
+            # The exception is retrieved by the reader if there is one.
+            self._headers_waiter.exception()
+
+        self._data.clear()
+        self._wake_reader()
+
+        self._outbound.clear()
+        self._wake_writer(error)
+
+    def _wake_writer(self, error=None):
+        waiter = self._drained
+        if waiter is not None and not waiter.done():
+            if error is None:
+                waiter.set_result(None)
+            else:
+                waiter.set_exception(error)
+                waiter.exception()
+
+        self._drained = None
+
+    def _wake_reader(self):
+        waiter = self._data_waiter
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+        self._data_waiter = None
+
+    def __repr__(self):
+        return '<Stream {}>'.format(self.stream_id)
+
+
+class Connection(asyncio.BufferedProtocol):
+    """
+    HTTP/2 connection over an asyncio transport.
+
+    Frames are parsed in place by FrameReader (the protocol hands its buffer
+    to the transport), the HPACK CompressionContext is shared by all the
+    streams multiplexed on the connection. DATA of the streams is sent in
+    the order decided by the PriorityTree, as long as the transport accepts
+    writes. Frames are coalesced by a FrameWriter into one write per event
+    loop iteration, connection control frames go first.
+
+    Received DATA is credited back in batches and, with autotuning, the
+    receive windows grow to the bandwidth-delay product measured with PING
+    round trips (see flow.FlowControl).
+
+    Local settings take effect in two steps: limits are relaxed as soon as
+    the SETTINGS frame is sent and tightened once the peer acknowledged it,
+    since until then the peer may still use the previous values
+    [RFC7540, section 6.5.3].
+
+    :param local_settings:
+        dict of settings (identifier: value) to advertise to the peer.
+    :param flow_control:
+        flow.FlowControl, by default batched updates with autotuning.
+    :param stats:
+        stats.ConnectionStats to count frames, stalls, stream durations and
+        HPACK statistics into, None disables counting.
+    """
+    # Parity of the locally initiated stream ids.
+    first_stream_id = 1
+
+    def __init__(self, local_settings=None, loop=None, flow_control=None, stats=None):
+        self.loop = loop or asyncio.get_event_loop()
+
+        self.local_settings = dict(DEFAULT_SETTINGS)
+        self.local_settings.update(local_settings or {})
+        self.remote_settings = dict(DEFAULT_SETTINGS)
+
+        # Protocol defaults apply until the preface settings are sent.
+        self.reader = FrameReader(max_frame_size=DEFAULT_MAX_FRAME_SIZE)
+        self.hpack = CompressionContext(decoder_table_size=DEFAULT_TABLE_SIZE)
+        self.encoder = self.hpack.encoder
+        self.decoder = self.hpack.decoder
+
+        self.stats = stats
+        if stats is not None:
+            self.encoder.stats = stats.encoder
+            self.decoder.stats = stats.decoder
+
+        self.streams = {}
+        self.send_window = DEFAULT_WINDOW_SIZE
+
+        self.flow_control = flow_control or FlowControl()
+        self.recv_window = self.flow_control.window(DEFAULT_WINDOW_SIZE)
+        # Receive window of the streams, grows with autotuning.
+        self.stream_window_size = self.local_settings[SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE]
+        self.max_header_block_size = DEFAULT_MAX_HEADER_BLOCK_SIZE
+        self._bdp = self.flow_control.estimator(
+            max(DEFAULT_WINDOW_SIZE, self.stream_window_size), clock=self.loop.time)
+
+        self.transport = None
+        self.writer = None
+        self.goaway_received = None
+        self.goaway_sent = False
+
+        # Called with the connection when its last stream closes.
+        self.on_idle = None
+
+        self._next_stream_id = self.first_stream_id
+        self._last_remote_stream_id = 0
+        self._active_streams = 0
+        self._remote_streams = 0
+        self._header_block = None
+        self._header_block_size = 0
+        self._settings_received = False
+
+        # Local settings sent and not acknowledged yet, oldest first, and
+        # the initial window size the open streams' windows are based on.
+        self._pending_settings = collections.deque()
+        self._stream_window_base = DEFAULT_WINDOW_SIZE
+
+        self.priority = PriorityTree()
+        self._write_paused = False
+        self._flushing = False
+        # DATA frame reused by the scheduler, the writer serializes frames
+        # as soon as they are written.
+        self._data_frame = DataFrame(b'', stream_id=0)
+
+        self._ready = self.loop.create_future()
+        self._closed = self.loop.create_future()
+        self._stream_waiters = []
+
+        self._frame_handlers = {
+            0x0: self._on_data,
+            0x1: self._on_headers,
+            0x2: self._on_priority,
+            0x3: self._on_rst_stream,
+            0x4: self._on_settings,
+            0x5: self._on_push_promise,
+            0x6: self._on_ping,
+            0x7: self._on_goaway,
+            0x8: self._on_window_update,
+            0x9: self._on_continuation,
+        }
+
+    @property
+    def closed(self):
+        return self._closed.done()
+
+    @property
+    def max_concurrent_streams(self):
+        value = self.remote_settings[SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS]
+        return MAX_STREAM_ID if value is None else value
+
+    @property
+    def active_streams(self):
+        """
+        Number of open locally initiated streams.
+        """
+        return self._active_streams
+
+    @property
+    def available_streams(self):
+        """
+        Number of streams which can be opened right now.
+        """
+        if self.closed or self.goaway_received is not None or self.goaway_sent:
+            return 0
+
+        left = (MAX_STREAM_ID - self._next_stream_id) // 2 + 1
+        return max(0, min(left, self.max_concurrent_streams - self.active_streams))
+
+    async def wait_ready(self):
+        """
+        Waits for the first SETTINGS frame of the peer.
+        """
+        await asyncio.shield(self._ready)
+
+    async def wait_closed(self):
+        await asyncio.shield(self._closed)
+
+    def close(self, error_code=NO_ERROR):
+        """
+        Sends GOAWAY and closes the transport. Unfinished streams fail with
+        ConnectionClosedError.
+        """
+        if self.transport is None or self.transport.is_closing():
+            return
+
+        self._send_goaway(error_code)
+        self._close_transport()
+
+    def reset_stream(self, stream, error_code):
+        self.send_frame(RstStreamFrame(error_code, stream_id=stream.stream_id))
+        stream._fail(StreamResetError(error_code))
+        self._close_stream(stream)
+
+    def reprioritize(self, stream, depends_on=0, weight=DEFAULT_WEIGHT, exclusive=False):
+        """
+        Changes the priority of a stream and signals it with PRIORITY.
+        """
+        self.priority.reprioritize(stream.stream_id, depends_on, weight, exclusive)
+        self.send_frame(PriorityFrame(depends_on, weight, exclusive, stream_id=stream.stream_id))
+
+    def send_frame(self, frame, control=False):
+        """
+        Queues a frame for writing. Control frames overtake the queued
+        frames, only connection-level frames may be sent as such.
+        """
+        if self.transport is not None and not self.transport.is_closing():
+            size = self.writer.write(frame, control=control)
+            if self.stats is not None:
+                self.stats.frame_sent(frame.frame_type, size)
+
+    def flush(self):
+        """
+        Writes the queued frames without waiting for the end of the event
+        loop iteration.
+        """
+        if self.writer is not None:
+            self.writer.flush()
+
+    def snapshot(self):
+        """
+        Returns the state and, with stats, the counters of the connection as
+        a dict of plain values, e.g. to export them as metrics.
+        """
+        result = {
+            'streams': len(self.streams),
+            'send_window': self.send_window,
+            'recv_window': self.recv_window.available,
+            'stream_window_size': self.stream_window_size,
+            'buffered': self.writer.buffered if self.writer is not None else 0,
+            'encoder': self.encoder.snapshot(),
+            'decoder': self.decoder.snapshot(),
+        }
+
+        if self.stats is not None:
+            result.update(self.stats.snapshot())
+
+        return result
+
+    # Protocol interface.
+
+    def connection_made(self, transport):
+        self.transport = transport
+        self.writer = FrameWriter(transport, self.loop)
+        self._send_preface()
+
+    def get_buffer(self, sizehint):
+        return self.reader.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        self.reader.buffer_updated(nbytes)
+        self._receive_frames()
+
+    def _receive_frames(self):
+        stats = self.stats
+        try:
+            for frame in self.reader.frames():
+                if stats is not None:
+                    stats.frame_received(frame.frame_type, FRAME_HEADER_LENGTH + len(frame.payload))
+
+                if not self._settings_received and frame.frame_type != 0x4:
+                    raise ProtocolError('Connection preface must start with SETTINGS')
+
+                if self._header_block is not None and frame.frame_type != 0x9:
+                    raise ProtocolError('Header block is interrupted by another frame')
+
+                handler = self._frame_handlers.get(frame.frame_type)
+                if handler is not None:
+                    handler(frame)
+        except HTTP2Error as e:
+            self._send_goaway(e.error_code, str(e).encode('utf-8', 'replace'))
+            self._close_transport()
+
+    def eof_received(self):
+        return False
+
+    def pause_writing(self):
+        self._write_paused = True
+
+    def resume_writing(self):
+        self._write_paused = False
+        self._flush_data()
+
+    def connection_lost(self, exc):
+        if self.writer is not None:
+            self.writer.close()
+
+        error = ConnectionClosedError(
+            message='Connection lost' if exc is None else 'Connection lost: {}'.format(exc),
+            retryable=False
+        )
+        for stream in list(self.streams.values()):
+            stream._fail(error)
+        self.streams.clear()
+        self._active_streams = 0
+        self._remote_streams = 0
+
+        if not self._ready.done():
+            self._ready.set_exception(error)
+            self._ready.exception()
+        if not self._closed.done():
+            self._closed.set_result(None)
+
+        _wake(self._stream_waiters)
+
+    # Sending.
+
+    def update_settings(self, settings):
+        """
+        Sends changed local settings, a dict of identifier: value.
+        """
+        changes = {}
+        for identifier, value in settings.items():
+            if identifier == SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE and value > MAX_WINDOW_SIZE:
+                raise ValueError('Invalid SETTINGS_INITIAL_WINDOW_SIZE value')
+            if (identifier == SettingsFrame.SETTINGS_MAX_FRAME_SIZE and
+                    not DEFAULT_MAX_FRAME_SIZE <= value <= MAX_FRAME_SIZE_LIMIT):
+                raise ValueError('Invalid SETTINGS_MAX_FRAME_SIZE value')
+
+            if value is not None and self.local_settings.get(identifier) != value:
+                changes[identifier] = value
+
+        if changes:
+            self._send_settings(changes)
+
+    def _send_preface(self):
+        self._send_settings({
+            identifier: value for identifier, value in self.local_settings.items()
+            if value != DEFAULT_SETTINGS[identifier]
+        })
+
+        # The connection window isn't covered by SETTINGS_INITIAL_WINDOW_SIZE
+        # [RFC7540, section 6.9.2], it is opened as wide as a stream window.
+        if self.stream_window_size > self.recv_window.size:
+            self._send_window_update(0, self.recv_window.resize(self.stream_window_size))
+
+    def _send_settings(self, changes):
+        self.local_settings.update(changes)
+        self._pending_settings.append(changes)
+        self.send_frame(SettingsFrame(settings=changes), control=True)
+        self._apply_local_settings(changes, acked=False)
+
+    def _apply_local_settings(self, settings, acked):
+        """
+        Applies local settings to the limits of what the peer sends: only
+        relaxed before the ACK, exactly after it.
+        """
+        for identifier, value in settings.items():
+            if value is None:
+                continue
+
+            if identifier == SettingsFrame.SETTINGS_HEADER_TABLE_SIZE:
+                if acked or value > self.decoder.max_table_size:
+                    self.decoder.max_table_size = value
+            elif identifier == SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE:
+                delta = value - self._stream_window_base
+                if acked or delta > 0:
+                    self._stream_window_base = value
+                    for stream in self.streams.values():
+                        stream.recv_window.adjust(delta)
+                self.stream_window_size = max(self.stream_window_size, value)
+            elif identifier == SettingsFrame.SETTINGS_MAX_FRAME_SIZE:
+                if acked or value > self.reader.max_frame_size:
+                    self.reader.max_frame_size = value
+            elif identifier == SettingsFrame.SETTINGS_MAX_HEADER_LIST_SIZE:
+                # The setting is advisory [RFC7540, section 6.5.2] and
+                # exceeding it only fails the stream, so it applies right
+                # away. No single string may be longer than the whole list.
+                self.decoder.max_header_list_size = value
+                self.decoder.max_string_length = value
+                self.max_header_block_size = value * _HEADER_BLOCK_SIZE_FACTOR
+
+    def _send_goaway(self, error_code, debug_data=b''):
+        if self.goaway_sent:
+            return
+
+        self.goaway_sent = True
+        self.send_frame(GoAwayFrame(self._last_remote_stream_id, error_code, debug_data), control=True)
+
+    def _close_transport(self):
+        self.flush()
+        self.transport.close()
+
+    def _send_headers(self, stream, headers, end_stream=False, priority=None):
+        """
+        :param priority:
+            (exclusive, depends_on, weight) tuple sent with the headers.
+        """
+        exclusive, depends_on, weight = priority or (None, None, None)
+
+        # The block is encoded when the frame is written, so header blocks
+        # reach the shared encoder in wire order.
+        self.send_frame(HeadersFrame(
+            headers, encoder=self.encoder, end_stream=end_stream, end_headers=True,
+            stream_dep=depends_on, weight=weight, exclusive=exclusive,
+            max_frame_size=self.remote_settings[SettingsFrame.SETTINGS_MAX_FRAME_SIZE],
+            stream_id=stream.stream_id
+        ))
+
+        # Autotuned windows are larger than the advertised initial size.
+        if not stream.remote_closed and stream.recv_window.size < self.stream_window_size:
+            self._send_window_update(
+                stream.stream_id, stream.recv_window.resize(self.stream_window_size))
+
+        if end_stream:
+            stream.local_closed = True
+            self._maybe_close_stream(stream)
+
+    async def _send_data(self, stream, data, end_stream=False):
+        """
+        Queues data on the stream and waits until its frames are handed to
+        the frame writer, which still references data until it is flushed.
+        """
+        if stream.error is not None:
+            raise stream.error
+        if self.closed:
+            raise ConnectionClosedError()
+
+        stream._outbound.append((memoryview(data), end_stream))
+        waiter = stream._drained
+        if waiter is None:
+            waiter = stream._drained = self.loop.create_future()
+
+        self._data_ready(stream)
+        await waiter
+
+    async def _send_message(self, stream, block, body=None, priority=None):
+        """
+        Sends a header block and the body of a request or response.
+
+        :param body:
+            bytes-like object, file object, mmap, (async) iterable of bytes,
+            body.Body or None. Everything but bytes-like objects is read one
+            frame at a time as the stream is able to send it.
+        """
+        if isinstance(body, (bytes, bytearray, memoryview)) or body is None:
+            self._send_headers(stream, block, end_stream=not body, priority=priority)
+            if body:
+                await self._send_data(stream, body, end_stream=True)
+        else:
+            self._send_headers(stream, block, priority=priority)
+            await self._send_body(stream, make_body(body))
+
+    async def _send_body(self, stream, body, end_stream=True):
+        """
+        Sends a body.Body: a chunk is read when the previous one has been
+        written, sized to the frame size and the current send windows.
+        """
+        try:
+            while True:
+                max_frame_size = self.remote_settings[SettingsFrame.SETTINGS_MAX_FRAME_SIZE]
+                size = min(self.send_window, stream.send_window, max_frame_size)
+                chunk = await body.read(size if size > 0 else max_frame_size)
+
+                last = not chunk or body.at_eof()
+                if chunk or (last and end_stream):
+                    await self._send_data(stream, chunk, end_stream=end_stream and last)
+                if last:
+                    break
+        finally:
+            body.close()
+
+    def _data_ready(self, stream):
+        """
+        Makes the stream eligible for scheduling if it has data which fits
+        its send window.
+        """
+        if not stream._outbound or stream.stream_id not in self.priority:
+            return
+
+        if stream.send_window > 0 or not stream._outbound[0][0]:
+            self.priority.activate(stream.stream_id)
+            self._flush_data()
+
+    def _flush_data(self):
+        """
+        Writes DATA frames of the streams in priority order until all are
+        sent or blocked, or the transport asks to pause.
+        """
+        if self._flushing:
+            return
+
+        self._flushing = True
+        try:
+            max_frame_size = self.remote_settings[SettingsFrame.SETTINGS_MAX_FRAME_SIZE]
+            while not self._write_paused and not self.closed:
+                stream_id = self.priority.next()
+                if stream_id is None:
+                    break
+
+                stream = self.streams[stream_id]
+                view, end_stream = stream._outbound[0]
+
+                n = min(len(view), max_frame_size, self.send_window, stream.send_window)
+                if n <= 0 and view:
+                    # Connection window exhausted: nobody can send until a
+                    # WINDOW_UPDATE arrives, the streams stay scheduled.
+                    if self.send_window <= 0:
+                        if self.stats is not None:
+                            self.stats.connection_stalls += 1
+                        break
+
+                    if self.stats is not None:
+                        self.stats.stream_stalls += 1
+                    self.priority.deactivate(stream_id)
+                    continue
+
+                if n < len(view):
+                    stream._outbound[0] = (view[n:], end_stream)
+                else:
+                    stream._outbound.popleft()
+
+                last = end_stream and not stream._outbound
+                self.send_window -= n
+                stream.send_window -= n
+                self.send_frame(self._data_frame.reuse(stream_id, view[:n], end_stream=last))
+                self.priority.sent(stream_id, n)
+
+                if not stream._outbound:
+                    self.priority.deactivate(stream_id)
+                    stream._wake_writer()
+
+                    if last:
+                        stream.local_closed = True
+                        self._maybe_close_stream(stream)
+        finally:
+            self._flushing = False
+
+    # Streams.
+
+    async def _open_stream(self, depends_on=0, weight=DEFAULT_WEIGHT, exclusive=False):
+        while not self.available_streams:
+            if self.closed or self.goaway_received is not None or self.goaway_sent:
+                raise ConnectionClosedError(message='Connection does not accept new streams',
+                                            retryable=True)
+            if self._next_stream_id > MAX_STREAM_ID:
+                raise ConnectionClosedError(message='Stream ids are exhausted', retryable=True)
+
+            waiter = self.loop.create_future()
+            self._stream_waiters.append(waiter)
+            await waiter
+
+        stream = Stream(self, self._next_stream_id)
+        self._next_stream_id += 2
+        self._active_streams += 1
+        self.streams[stream.stream_id] = stream
+        self.priority.insert(stream.stream_id, depends_on, weight, exclusive)
+
+        if self.stats is not None:
+            self.stats.streams_opened += 1
+
+        return stream
+
+    def _accept_stream(self, stream_id, headers, end_stream, priority):
+        """
+        Called with the header block opening a stream initiated by the peer.
+        """
+        raise ProtocolError('HEADERS frame on an idle stream')
+
+    def _maybe_close_stream(self, stream):
+        if stream.closed:
+            self._close_stream(stream)
+
+    def _close_stream(self, stream):
+        if self.streams.pop(stream.stream_id, None) is not None:
+            if stream.stream_id % 2 == self.first_stream_id % 2:
+                self._active_streams -= 1
+            else:
+                self._remote_streams -= 1
+
+            self.priority.remove(stream.stream_id)
+            _wake(self._stream_waiters)
+
+            if self.stats is not None:
+                self.stats.streams_closed += 1
+                self.stats.stream_durations.observe(self.loop.time() - stream.opened_at)
+
+            if not self.streams:
+                # Drained after GOAWAY.
+                if self.goaway_received is not None:
+                    self.close()
+                elif self.on_idle is not None:
+                    self.on_idle(self)
+
+    def _is_idle(self, stream_id):
+        if stream_id % 2 == self.first_stream_id % 2:
+            return stream_id >= self._next_stream_id
+
+        return stream_id > self._last_remote_stream_id
+
+    def _data_consumed(self, stream, size):
+        """
+        Credits size received octets back to the peer once they were read,
+        WINDOW_UPDATEs are sent when enough credit accumulated.
+        """
+        if not size:
+            return
+
+        self._send_window_update(0, self.recv_window.consume(size))
+
+        if stream is not None and not stream.remote_closed:
+            self._send_window_update(stream.stream_id, stream.recv_window.consume(size))
+
+    def _send_window_update(self, stream_id, increment):
+        if increment:
+            self.send_frame(WindowUpdateFrame(increment, stream_id=stream_id), control=stream_id == 0)
+
+    def _autotune(self, size):
+        """
+        Grows the connection and stream receive windows to size.
+        """
+        if size > self.recv_window.size:
+            self._send_window_update(0, self.recv_window.resize(size))
+
+        if size > self.stream_window_size:
+            self.stream_window_size = size
+            for stream in self.streams.values():
+                if not stream.remote_closed:
+                    self._send_window_update(stream.stream_id, stream.recv_window.resize(size))
+
+    # Frame handlers.
+
+    def _on_data(self, frame):
+        if frame.stream_id == 0:
+            raise ProtocolError('DATA frame on stream 0')
+
+        size = len(frame.payload)
+        self.recv_window.receive(size)
+
+        if size and self._bdp is not None and self._bdp.received(size):
+            self.send_frame(PingFrame(_BDP_PING), control=True)
+
+        stream = self.streams.get(frame.stream_id)
+        if stream is None or stream.remote_closed:
+            # Still credit the connection window for frames of streams that
+            # are gone (e.g. reset by us while the frames were in flight).
+            self._data_consumed(None, size)
+            if stream is not None:
+                self.reset_stream(stream, STREAM_CLOSED)
+            elif self._is_idle(frame.stream_id):
+                raise ProtocolError('DATA frame on an idle stream')
+            return
+
+        try:
+            stream.recv_window.receive(size)
+        except FlowControlError:
+            self._data_consumed(None, size)
+            self.reset_stream(stream, FlowControlError.error_code)
+            return
+
+        data = frame.data
+        if stream.headers is None:
+            self._data_consumed(None, size)
+            self.reset_stream(stream, PROTOCOL_ERROR)
+            return
+
+        # Padding is consumed right away, data when it is read.
+        if size > len(data):
+            self._data_consumed(stream, size - len(data))
+
+        stream._receive_data(data, frame.end_stream)
+        self._maybe_close_stream(stream)
+
+    def _on_headers(self, frame):
+        if frame.stream_id == 0:
+            raise ProtocolError('HEADERS frame on stream 0')
+
+        # A block which fits into one frame is decoded into a lazy header
+        # list, see _receive_header_fragment.
+        self._header_block = (frame.stream_id, frame.end_stream, frame.priority, None)
+        self._header_block_size = 0
+        self._receive_header_fragment(frame.header_block, frame.end_headers)
+
+    def _on_continuation(self, frame):
+        if self._header_block is None or frame.stream_id != self._header_block[0]:
+            raise ProtocolError('Unexpected CONTINUATION frame')
+
+        self._receive_header_fragment(frame.header_block, frame.end_headers)
+
+    def _receive_header_fragment(self, fragment, end_headers):
+        stream_id, end_stream, priority, headers = self._header_block
+
+        # Fields over the limits are dropped as they are decoded, but the
+        # block itself may not grow without bound either [RFC7540, section
+        # 10.5]. It can't be processed any further, the HPACK context is lost.
+        self._header_block_size += len(fragment)
+        if self._header_block_size > self.max_header_block_size:
+            raise CompressionError('Header block exceeds {} octets'.format(self.max_header_block_size))
+
+        try:
+            if headers is None and end_headers:
+                # The fragment is copied, values are referenced until the
+                # stream is gone and mustn't pin the receive buffer.
+                headers = self.decoder.decode_lazy(bytes(fragment))
+            else:
+                if headers is None:
+                    headers = []
+                    self._header_block = (stream_id, end_stream, priority, headers)
+                headers.extend(self.decoder.feed(fragment, end=end_headers))
+                if end_headers:
+                    headers = HeaderList(headers)
+        except HeaderListTooLargeError as e:
+            self._header_block = None
+            self._on_header_list_too_large(stream_id, end_stream, priority, e)
+            return
+
+        if end_headers:
+            self._header_block = None
+            self._on_header_block(stream_id, headers, end_stream, priority)
+
+    def _on_header_block(self, stream_id, headers, end_stream, priority=None):
+        stream = self.streams.get(stream_id)
+        if stream is None:
+            # The block has been decoded anyway to keep the HPACK context
+            # in sync.
+            if self._is_idle(stream_id):
+                if stream_id % 2 == self.first_stream_id % 2:
+                    raise ProtocolError('HEADERS frame on an idle stream')
+                self._accept_stream(stream_id, headers, end_stream, priority)
+            return
+
+        if stream.remote_closed:
+            self.reset_stream(stream, STREAM_CLOSED)
+            return
+
+        # Informational (1xx) responses are skipped [RFC7540, section 8.1].
+        if stream.headers is None and not end_stream:
+            status = headers.get(b':status')
+            if status is not None and status.startswith(b'1'):
+                return
+
+        stream._receive_headers(headers, end_stream)
+        self._maybe_close_stream(stream)
+
+    def _on_header_list_too_large(self, stream_id, end_stream, priority, error):
+        """
+        Called instead of _on_header_block when the block exceeds the
+        decoder limits: the stream fails with the error.
+        """
+        stream = self.streams.get(stream_id)
+        if stream is None:
+            if self._is_idle(stream_id) and stream_id % 2 == self.first_stream_id % 2:
+                raise ProtocolError('HEADERS frame on an idle stream')
+            return
+
+        self.send_frame(RstStreamFrame(error.error_code, stream_id=stream_id))
+        stream._fail(error)
+        self._close_stream(stream)
+
+    def _on_priority(self, frame):
+        if frame.stream_id == 0:
+            raise ProtocolError('PRIORITY frame on stream 0')
+
+        exclusive, depends_on, weight = frame.priority
+        if depends_on == frame.stream_id:
+            stream = self.streams.get(frame.stream_id)
+            if stream is not None:
+                self.reset_stream(stream, PROTOCOL_ERROR)
+            return
+
+        # Priorities of streams which are not open are not kept.
+        if frame.stream_id in self.priority:
+            self.priority.reprioritize(frame.stream_id, depends_on, weight, exclusive)
+            self._flush_data()
+
+    def _on_rst_stream(self, frame):
+        if frame.stream_id == 0:
+            raise ProtocolError('RST_STREAM frame on stream 0')
+
+        stream = self.streams.get(frame.stream_id)
+        if stream is None:
+            return
+
+        error_code = frame.error_code
+        if error_code == REFUSED_STREAM:
+            error = ConnectionClosedError(error_code, 'Stream refused', retryable=True)
+        else:
+            error = StreamResetError(error_code)
+
+        stream._fail(error)
+        self._close_stream(stream)
+
+    def _on_settings(self, frame):
+        if frame.stream_id != 0:
+            raise ProtocolError('SETTINGS frame on a stream')
+
+        if frame.ack:
+            if len(frame.payload):
+                raise FrameSizeError('SETTINGS ACK with a payload')
+            if not self._pending_settings:
+                raise ProtocolError('Unexpected SETTINGS ACK')
+
+            # Values of settings sent later and still unacknowledged remain
+            # acceptable.
+            settings = dict(self._pending_settings.popleft())
+            for identifier in settings:
+                for pending in self._pending_settings:
+                    if identifier in pending:
+                        settings[identifier] = max(settings[identifier], pending[identifier])
+
+            self._apply_local_settings(settings, acked=True)
+            return
+
+        for identifier, value in frame.settings:
+            self._apply_remote_setting(identifier, value)
+
+        # The ACK is queued behind the frames already buffered: they were
+        # encoded and sized under the previous settings [RFC7540, section
+        # 6.5.3].
+        self.send_frame(SettingsFrame(ack=True))
+
+        self._settings_received = True
+        if not self._ready.done():
+            self._ready.set_result(None)
+
+        _wake(self._stream_waiters)
+        for stream in list(self.streams.values()):
+            self._data_ready(stream)
+
+    def _apply_remote_setting(self, identifier, value):
+        if identifier == SettingsFrame.SETTINGS_HEADER_TABLE_SIZE:
+            # The peer sets the upper bound, the encoder doesn't go beyond
+            # the default size.
+            size = min(value, DEFAULT_TABLE_SIZE)
+            if size != self.encoder.index_table.max_size:
+                self.encoder.update_table_size(size)
+        elif identifier == SettingsFrame.SETTINGS_ENABLE_PUSH:
+            if value not in (0, 1):
+                raise ProtocolError('Invalid SETTINGS_ENABLE_PUSH value')
+        elif identifier == SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE:
+            if value > MAX_WINDOW_SIZE:
+                raise FlowControlError('Invalid SETTINGS_INITIAL_WINDOW_SIZE value')
+
+            # A window raised by WINDOW_UPDATE may overflow, which is a
+            # connection error [RFC7540, section 6.9.2].
+            delta = value - self.remote_settings[identifier]
+            for stream in self.streams.values():
+                stream.send_window += delta
+                if stream.send_window > MAX_WINDOW_SIZE:
+                    raise FlowControlError('Stream flow-control window overflow')
+        elif identifier == SettingsFrame.SETTINGS_MAX_FRAME_SIZE:
+            if not DEFAULT_MAX_FRAME_SIZE <= value <= MAX_FRAME_SIZE_LIMIT:
+                raise ProtocolError('Invalid SETTINGS_MAX_FRAME_SIZE value')
+        elif identifier not in self.remote_settings:
+            # Unknown settings are ignored [RFC7540, section 6.5.2].
+            return
+
+        self.remote_settings[identifier] = value
+
+    def _on_push_promise(self, frame):
+        raise ProtocolError('PUSH_PROMISE received while push is disabled')
+
+    def _on_ping(self, frame):
+        if frame.stream_id != 0:
+            raise ProtocolError('PING frame on a stream')
+
+        if not frame.ack:
+            self.send_frame(PingFrame(frame.opaque_data, ack=True), control=True)
+        elif self._bdp is not None and frame.opaque_data == _BDP_PING:
+            size = self._bdp.ping_acked()
+            if size is not None:
+                self._autotune(size)
+
+    def _on_goaway(self, frame):
+        if frame.stream_id != 0:
+            raise ProtocolError('GOAWAY frame on a stream')
+
+        last_stream_id = frame.last_stream_id
+        self.goaway_received = last_stream_id
+
+        error = ConnectionClosedError(frame.error_code, 'Stream was not processed by the peer',
+                                      retryable=True)
+        for stream in list(self.streams.values()):
+            if stream.stream_id > last_stream_id and stream.stream_id % 2 == self.first_stream_id % 2:
+                stream._fail(error)
+                self._close_stream(stream)
+
+        _wake(self._stream_waiters)
+
+        if not self.streams:
+            self.close()
+
+    def _on_window_update(self, frame):
+        increment = frame.increment
+        if frame.stream_id == 0:
+            if increment == 0:
+                raise ProtocolError('WINDOW_UPDATE with zero increment')
+
+            self.send_window += increment
+            if self.send_window > MAX_WINDOW_SIZE:
+                raise FlowControlError('Connection flow-control window overflow')
+        else:
+            stream = self.streams.get(frame.stream_id)
+            if stream is None:
+                return
+
+            if increment == 0:
+                self.reset_stream(stream, PROTOCOL_ERROR)
+                return
+
+            stream.send_window += increment
+            if stream.send_window > MAX_WINDOW_SIZE:
+                self.reset_stream(stream, FlowControlError.error_code)
+                return
+
+            self._data_ready(stream)
+            return
+
+        self._flush_data()
+
+
+class ClientConnection(Connection):
+    """
+    Client side of a connection. request() may be called concurrently, every
+    call runs on its own stream.
+
+    :param authority:
+        value of the :authority pseudo-header.
+    :param scheme:
+        value of the :scheme pseudo-header.
+    """
+    first_stream_id = 1
+
+    def __init__(self, authority, scheme='https', local_settings=None, loop=None, flow_control=None,
+                 stats=None):
+        settings = {SettingsFrame.SETTINGS_ENABLE_PUSH: 0}
+        settings.update(local_settings or {})
+        super().__init__(local_settings=settings, loop=loop, flow_control=flow_control, stats=stats)
+
+        self.authority = _to_bytes(authority)
+        self.scheme = _to_bytes(scheme)
+
+    async def request(self, method, path, headers=(), body=None, depends_on=None, weight=None,
+                      exclusive=False):
+        """
+        Sends a request and returns its Response once the response headers
+        are received.
+
+        :param headers:
+            sequence of (name, value) tuples, names must be lowercase.
+        :param body:
+            bytes-like object, file object, mmap, (async) iterable of bytes,
+            body.Body or None. Everything but bytes-like objects is read one
+            frame at a time as the stream is able to send it.
+        :param depends_on:
+            id of the stream the request depends on, see PriorityTree.
+        :param weight:
+            weight of the request stream (1-256).
+        """
+        priority = None
+        if depends_on is not None or weight is not None:
+            priority = (exclusive, depends_on or 0, weight or DEFAULT_WEIGHT)
+
+        stream = await self._open_stream(depends_on or 0, weight or DEFAULT_WEIGHT, exclusive)
+
+        try:
+            block = [
+                (b':method', _to_bytes(method)),
+                (b':scheme', self.scheme),
+                (b':authority', self.authority),
+                (b':path', _to_bytes(path)),
+            ]
+            block.extend((_to_bytes(n), _to_bytes(v)) for n, v in headers)
+
+            await self._send_message(stream, block, body, priority)
+
+            headers = await stream.wait_headers()
+        except asyncio.CancelledError:
+            stream.cancel()
+            raise
+
+        try:
+            return Response(stream, headers)
+        except ProtocolError:
+            # Malformed response, a stream error [RFC7540, section 8.1.2.6].
+            if not stream.closed:
+                self.reset_stream(stream, PROTOCOL_ERROR)
+            raise
+
+    def connection_made(self, transport):
+        transport.write(CONNECTION_PREFACE)
+        super().connection_made(transport)
+
+
+async def connect(host, port=None, ssl=None, local_settings=None, flow_control=None, stats=None,
+                  **kwargs):
+    """
+    Opens a client connection and waits for the SETTINGS of the server.
+
+    :param ssl:
+        True or an SSLContext for https, h2 is negotiated with ALPN. Without
+        it the connection uses HTTP/2 over cleartext with prior knowledge.
+    :param flow_control:
+        flow.FlowControl of the connection.
+    :param stats:
+        stats.ConnectionStats of the connection.
+    """
+    loop = asyncio.get_running_loop()
+
+    if ssl is True:
+        ssl = _ssl.create_default_context()
+        ssl.set_alpn_protocols(['h2'])
+
+    if port is None:
+        port = 443 if ssl else 80
+
+    authority = host if port == (443 if ssl else 80) else '{}:{}'.format(host, port)
+    scheme = 'https' if ssl else 'http'
+
+    _, connection = await loop.create_connection(
+        lambda: ClientConnection(authority, scheme, local_settings=local_settings, loop=loop,
+                                 flow_control=flow_control, stats=stats),
+        host, port, ssl=ssl, **kwargs
+    )
+
+    try:
+        await connection.wait_ready()
+    except BaseException:
+        connection.transport.close()
+        raise
+
+    return connection
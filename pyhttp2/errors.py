@@ -0,0 +1,73 @@
+# Error codes [RFC7540, section 7].
+NO_ERROR = 0x0
+PROTOCOL_ERROR = 0x1
+INTERNAL_ERROR = 0x2
+FLOW_CONTROL_ERROR = 0x3
+SETTINGS_TIMEOUT = 0x4
+STREAM_CLOSED = 0x5
+FRAME_SIZE_ERROR = 0x6
+REFUSED_STREAM = 0x7
+CANCEL = 0x8
+COMPRESSION_ERROR = 0x9
+CONNECT_ERROR = 0xa
+ENHANCE_YOUR_CALM = 0xb
+INADEQUATE_SECURITY = 0xc
+HTTP_1_1_REQUIRED = 0xd
+
+
+class HTTP2Error(Exception):
+    """
+    Base class of the library errors. error_code is the code to send to the
+    peer (in RST_STREAM or GOAWAY) when the error is caused by it.
+    """
+    error_code = INTERNAL_ERROR
+
+
+class ProtocolError(HTTP2Error):
+    error_code = PROTOCOL_ERROR
+
+
+class FrameSizeError(ProtocolError):
+    error_code = FRAME_SIZE_ERROR
+
+
+class FlowControlError(ProtocolError):
+    error_code = FLOW_CONTROL_ERROR
+
+
+class StreamResetError(HTTP2Error):
+    """
+    Stream was reset with RST_STREAM by either side.
+    """
+    def __init__(self, error_code, message=None):
+        super().__init__(message or 'Stream reset with error code {:#x}'.format(error_code))
+        self.error_code = error_code
+
+
+class ConnectionClosedError(HTTP2Error):
+    """
+    Connection was closed before the stream completed. retryable is True when
+    the peer is known not to have processed the stream [RFC7540, section 8.1.4].
+    """
+    def __init__(self, error_code=NO_ERROR, message=None, retryable=False):
+        super().__init__(message or 'Connection closed with error code {:#x}'.format(error_code))
+        self.error_code = error_code
+        self.retryable = retryable
+
+
+class CompressionError(HTTP2Error):
+    """
+    Header block can't be decoded [RFC7540, section 4.3].
+    """
+    error_code = COMPRESSION_ERROR
+
+
+class HeaderListTooLargeError(HTTP2Error):
+    """
+    Header block decodes to more than the decoder limits allow
+    (SETTINGS_MAX_HEADER_LIST_SIZE or the maximum string length). The block
+    has been processed to keep the HPACK context in sync, so only the stream
+    fails: a server answers 431, a client cancels the stream
+    [RFC7540, section 10.5.1].
+    """
+    error_code = CANCEL
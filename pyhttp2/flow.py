@@ -0,0 +1,204 @@
+import time
+
+from .errors import FlowControlError
+
+
+MAX_WINDOW_SIZE = 2**31 - 1
+
+# Upper bound of autotuned receive windows.
+DEFAULT_MAX_WINDOW = 16 * 1024 * 1024
+
+
+class ReceiveWindow(object):
+    """
+    Receive side of a connection or stream flow-control window
+    [RFC7540, section 6.9].
+
+    Octets are taken from the window when DATA is received and credited
+    back when the application consumed them. Credit is not returned per
+    frame: it accumulates until update_ratio of the window has been
+    consumed and is then sent in one WINDOW_UPDATE.
+
+    :param size:
+        window size advertised to the peer.
+    :param update_ratio:
+        fraction of the window consumed before a WINDOW_UPDATE is sent,
+        in (0, 1]. Lower values update more often and keep the window
+        fuller, higher ones send fewer frames.
+    """
+    def __init__(self, size, update_ratio=0.5):
+        if not 0 < update_ratio <= 1:
+            raise ValueError('update_ratio must be in (0, 1]')
+
+        self.size = size
+        self.available = size
+        self.update_ratio = update_ratio
+
+        # Consumed octets not credited to the peer yet, negative after the
+        # window shrank.
+        self._pending = 0
+
+    @property
+    def pending(self):
+        return self._pending
+
+    def receive(self, size):
+        """
+        Takes size octets of received DATA from the window.
+        """
+        self.available -= size
+        if self.available < 0:
+            raise FlowControlError('Flow-control window exceeded')
+
+    def consume(self, size):
+        """
+        Marks size octets as consumed. Returns the increment of the
+        WINDOW_UPDATE to send, 0 if the credit is held back for now.
+        """
+        self._pending += size
+        if self._pending < self.size * self.update_ratio:
+            return 0
+
+        return self._credit()
+
+    def resize(self, size):
+        """
+        Changes the window size. A larger window is advertised right away,
+        the returned increment has to be sent; a smaller one takes effect
+        by holding back credit.
+        """
+        size = min(size, MAX_WINDOW_SIZE)
+        self._pending += size - self.size
+        self.size = size
+
+        if self._pending <= 0:
+            return 0
+
+        return self._credit()
+
+    def adjust(self, delta):
+        """
+        Applies a change of SETTINGS_INITIAL_WINDOW_SIZE: the window moves by
+        delta without a WINDOW_UPDATE and may become negative
+        [RFC7540, section 6.9.2].
+        """
+        self.size += delta
+        self.available += delta
+
+    def _credit(self):
+        increment = self._pending
+        self._pending = 0
+        self.available += increment
+
+        return increment
+
+    def __repr__(self):
+        return '<ReceiveWindow {}/{}>'.format(self.available, self.size)
+
+
+class BdpEstimator(object):
+    """
+    Estimates the bandwidth-delay product of a connection from PING round
+    trips.
+
+    A PING is sent with DATA received while no sample is running and the
+    octets received until its ACK are a sample of one round trip. When a
+    sample fills most of the window at the highest bandwidth seen so far,
+    the window limits the transfer and is grown to twice the sample.
+
+    :param window:
+        current receive window size.
+    :param max_window:
+        upper bound of the window, sampling stops once it is reached.
+    :param clock:
+        function returning the current time in seconds.
+    """
+    # Share of the window a sample has to reach to grow the window.
+    threshold = 2 / 3
+
+    def __init__(self, window, max_window=DEFAULT_MAX_WINDOW, clock=time.monotonic):
+        self.window = window
+        self.max_window = max_window
+        self.rtt = None
+        self.bandwidth = 0.0
+
+        self._clock = clock
+        self._sample = 0
+        self._ping_sent = None
+
+    @property
+    def sampling(self):
+        return self._ping_sent is not None
+
+    def received(self, size):
+        """
+        Accounts size octets of received DATA. Returns True when a PING has
+        to be sent to start a sample.
+        """
+        if self._ping_sent is not None:
+            self._sample += size
+            return False
+
+        if self.window >= self.max_window:
+            return False
+
+        self._ping_sent = self._clock()
+        self._sample = size
+        return True
+
+    def ping_acked(self):
+        """
+        Ends the running sample. Returns the new window size or None if the
+        window stays.
+        """
+        if self._ping_sent is None:
+            return None
+
+        rtt = max(self._clock() - self._ping_sent, 1e-6)
+        sample = self._sample
+        self._ping_sent = None
+        self._sample = 0
+
+        # Smoothed as in TCP [RFC6298, section 2].
+        self.rtt = rtt if self.rtt is None else 0.875 * self.rtt + 0.125 * rtt
+
+        bandwidth = sample / self.rtt
+        if bandwidth < self.bandwidth:
+            return None
+        self.bandwidth = bandwidth
+
+        if sample < self.window * self.threshold:
+            return None
+
+        self.window = min(2 * sample, self.max_window)
+        return self.window
+
+
+class FlowControl(object):
+    """
+    Receive flow-control policy of a connection.
+
+    :param update_ratio:
+        fraction of a window consumed before its credit is returned, see
+        ReceiveWindow.
+    :param autotune:
+        grow the connection and stream windows to the BDP estimate.
+    :param max_window:
+        upper bound of autotuned windows.
+    """
+    def __init__(self, update_ratio=0.5, autotune=True, max_window=DEFAULT_MAX_WINDOW):
+        self.update_ratio = update_ratio
+        self.autotune = autotune
+        self.max_window = max_window
+
+    def window(self, size):
+        return ReceiveWindow(size, self.update_ratio)
+
+    def estimator(self, window, clock=time.monotonic):
+        """
+        Returns a BdpEstimator or None if autotuning is off.
+        """
+        if not self.autotune:
+            return None
+
+        return BdpEstimator(window, max_window=self.max_window, clock=clock)
@@ -1,56 +1,112 @@
-from .utils import int_to_bytes, int_to_byte, concat_bytes
+import struct
+
 from .hpack import Encoder
+from .errors import ProtocolError, FrameSizeError
+
+# Frame header length [RFC7540, section 4.1].
+FRAME_HEADER_LENGTH = 9
+
+# Initial value of SETTINGS_MAX_FRAME_SIZE and its upper limit
+# [RFC7540, section 6.5.2].
+DEFAULT_MAX_FRAME_SIZE = 16384
+MAX_FRAME_SIZE_LIMIT = 2**24 - 1
+
+FLAG_END_STREAM = 0x1
+FLAG_ACK = 0x1
+FLAG_END_HEADERS = 0x4
+FLAG_PADDED = 0x8
+FLAG_PRIORITY = 0x20
+
+# Smallest free space offered by FrameReader.get_buffer.
+_MIN_READ_SIZE = 4096
+
+# Length (split into 16 + 8 bits), type, flags and stream id.
+_frame_header = struct.Struct('>HBBBL')
+
+_uint32 = struct.Struct('>L')
+_setting = struct.Struct('>HL')
+_priority = struct.Struct('>LB')
+_goaway = struct.Struct('>LL')
+
+_pad_length = [bytes([n]) for n in range(256)]
+
+# Padding is sliced from here instead of being allocated for every frame.
+_zero_padding = memoryview(bytes(255))
 
 
 class Frame(object):
-    frame_type = None
+    """
+    Frame to send. stream_id, flags and frame_type are ints, the header is
+    packed with one struct call when the frame is serialized.
+    """
+    __slots__ = ('stream_id', 'flags', 'payload')
 
-    def __init__(self, stream_id, flags=None, payload=None, frame_type=None):
-        if isinstance(stream_id, int):
-            stream_id = int_to_bytes(stream_id, 4)
-        elif not isinstance(stream_id, (bytes, bytearray)):
-            raise ValueError()
+    frame_type = None
 
-        self.stream_id = bytearray(stream_id)
-        self.stream_id[0] = self.stream_id[0] & 127
+    def __init__(self, stream_id, flags=0, payload=None):
+        if not isinstance(stream_id, int):
+            stream_id = int.from_bytes(stream_id, 'big')
 
+        # The reserved bit is unset [RFC7540, section 4.1].
+        self.stream_id = stream_id & 0x7fffffff
         self.flags = flags
         self.payload = payload
-        if frame_type:
-            self.frame_type = frame_type
 
     def to_bytes(self):
-        if not self.frame_type:
-            raise Exception()
-
-        payload = self.make_payload()
-        payload_len = len(payload)
-
-        return concat_bytes(
-            int_to_bytes(payload_len, 3),
-            self.frame_type,
-            self.flags if self.flags is not None else b'\x00',
-            self.stream_id,
-            payload
-        )
+        return b''.join(self.to_buffers())
+
+    def to_buffers(self):
+        """
+        Returns the frame as a list of buffers: the 9-octet header followed by
+        the payload pieces. Data passed to the frame is included as is, so the
+        list may be given to socket.sendmsg() or transport.writelines()
+        without copying the payload.
+        """
+        payload = self._payload_buffers()
+        length = sum(map(len, payload))
+
+        payload.insert(0, _frame_header.pack(
+            length >> 8, length & 0xff, self.frame_type, self.flags, self.stream_id))
+
+        return payload
+
+    def _payload_buffers(self):
+        return [self._make_payload()]
 
     def _make_payload(self):
         if self.payload is None:
-            raise Exception()
+            raise ValueError('Frame has no payload')
 
         return bytes(self.payload)
 
+    @staticmethod
+    def _flags(*flags):
+        result = 0
+        for flag in flags:
+            if flag is not None:
+                result |= flag
+
+        return result
+
     @classmethod
-    def _flags_byte(cls, *ints):
-        flags = 0
-        for i in ints:
-            flags |= i
+    def _padded(cls, padding, *buffers):
+        if not padding:
+            return [b for b in buffers if b is not None]
+
+        return [_pad_length[padding]] + [b for b in buffers if b is not None] + [_zero_padding[:padding]]
+
+    def __repr__(self):
+        return '<{} stream_id={} flags={:#x}>'.format(type(self).__name__, self.stream_id, self.flags)
 
-        return int_to_byte(flags)
-        
 
 class DataFrame(Frame):
-    frame_type = b'\x00'
+    """
+    DATA frame. On hot paths one instance may be reused for many frames
+    with reuse(): the frame keeps no state after to_buffers().
+    """
+    __slots__ = ('data', 'padding')
+
+    frame_type = 0x0
 
     def __init__(self, data, end_stream=False, padding=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -58,101 +114,663 @@ class DataFrame(Frame):
         self.data = data
         self.padding = padding
 
-        self.flags = self._flags_byte(
-            0x1 if end_stream else None,
-            0x8 if padding else None
+        self.flags = self._flags(
+            FLAG_END_STREAM if end_stream else None,
+            FLAG_PADDED if padding else None
         )
 
-    def _make_payload(self):
-        return concat_bytes(
-            int_to_byte(self.padding) if self.padding else None,
-            self.data,
-            b'\x00' * self.padding if self.padding else None
-        )
+    def reuse(self, stream_id, data, end_stream=False):
+        """
+        Turns the frame into an unpadded DATA frame of data, returns self.
+        """
+        self.stream_id = stream_id
+        self.data = data
+        self.padding = None
+        self.flags = FLAG_END_STREAM if end_stream else 0
+
+        return self
+
+    def to_buffers(self):
+        data = self.data
+        if self.padding:
+            return super().to_buffers()
+
+        length = len(data)
+        return [
+            _frame_header.pack(length >> 8, length & 0xff, 0x0, self.flags, self.stream_id),
+            data
+        ]
+
+    def _payload_buffers(self):
+        return self._padded(self.padding, self.data)
 
         
 class HeadersFrame(Frame):
-    frame_type = b'\x01'
+    """
+    HEADERS frame. A header block which doesn't fit max_frame_size is split
+    into the HEADERS frame and CONTINUATION frames when serialized
+    [RFC7540, section 6.10].
+    """
+    __slots__ = (
+        'headers', 'encoder', 'header_block', 'end_stream', 'end_headers', 'padding',
+        'stream_dep', 'weight', 'exclusive', 'max_frame_size'
+    )
+
+    frame_type = 0x1
 
     def __init__(self, headers, encoder=None, end_stream=False, end_headers=False, 
                  padding=None, stream_dep=None, weight=None, exclusive=None,
-                 *args, **kwargs):
+                 max_frame_size=DEFAULT_MAX_FRAME_SIZE, *args, **kwargs):
 
         super().__init__(*args, **kwargs)
 
         self.headers = headers
+        self.header_block = None
+        self.end_stream = end_stream
+        self.end_headers = end_headers
         self.padding = padding
         self.stream_dep = stream_dep
         self.weight = weight
         self.exclusive = exclusive
+        self.max_frame_size = max_frame_size
 
-        if encoder is None:
-            self.encoder = Encoder()
+        self.encoder = encoder if encoder is not None else Encoder()
 
-        self.flags = self._flags_byte(
-            0x1 if end_stream else None,
-            0x4 if end_headers else None,
-            0x8 if padding else None,
-            0x20 if stream_dep else None
+        self.flags = self._flags(
+            FLAG_END_STREAM if end_stream else None,
+            FLAG_END_HEADERS if end_headers else None,
+            FLAG_PADDED if padding else None,
+            FLAG_PRIORITY if self.has_priority else None
         )
 
-    def _make_payload(self):
-        return concat_bytes(
-            int_to_byte(self.padding) if self.padding else None,
-            self._make_dep() if self.stream_dep else None
-            self.encoder.encode_headers(self.headers),
-            b'\x00' * self.padding if self.padding else None
+    @property
+    def has_priority(self):
+        return self.stream_dep is not None or self.weight is not None
+
+    def to_buffers(self):
+        block = self.encode_header_block()
+
+        # Room for the block in the first frame next to the Pad Length,
+        # padding and fields preceding the block.
+        room = self.max_frame_size - self._fields_length()
+        if self.padding:
+            room -= 1 + self.padding
+
+        if len(block) <= room:
+            return super().to_buffers()
+
+        view = memoryview(block)
+        first = self._first_fragment(view[:room])
+
+        buffers = first.to_buffers()
+        for offset in range(room, len(block), self.max_frame_size):
+            fragment = view[offset:offset + self.max_frame_size]
+            last = offset + self.max_frame_size >= len(block)
+            buffers.extend(ContinuationFrame(
+                fragment, end_headers=self.end_headers and last, stream_id=self.stream_id
+            ).to_buffers())
+
+        return buffers
+
+    def _fields_length(self):
+        return 5 if self.has_priority else 0
+
+    def _first_fragment(self, fragment):
+        """
+        Returns the frame carrying the first fragment of a split block.
+        """
+        first = HeadersFrame(
+            None, encoder=self.encoder, end_stream=self.end_stream, end_headers=False,
+            padding=self.padding, stream_dep=self.stream_dep, weight=self.weight,
+            exclusive=self.exclusive, max_frame_size=self.max_frame_size, stream_id=self.stream_id
+        )
+        first.header_block = fragment
+
+        return first
+
+    def _payload_buffers(self):
+        return self._padded(
+            self.padding,
+            _pack_priority(self.stream_dep, self.weight, self.exclusive) if self.has_priority else None,
+            self.encode_header_block()
+        )
+
+    def encode_header_block(self):
+        """
+        Encodes headers once: the encoder is stateful, so serializing the frame
+        again must not encode them another time.
+        """
+        if self.header_block is None:
+            self.header_block = self.encoder.encode_headers(self.headers)
+
+        return self.header_block
+
+
+class PushPromiseFrame(HeadersFrame):
+    """
+    PUSH_PROMISE frame [RFC7540, section 6.6], sent on the stream of the
+    request the promised stream is associated with. Like HEADERS, the block
+    is encoded when the frame is serialized and split into CONTINUATION
+    frames if needed.
+    """
+    __slots__ = ('promised_stream_id',)
+
+    frame_type = 0x5
+
+    def __init__(self, headers, promised_stream_id, encoder=None, end_headers=False, padding=None,
+                 max_frame_size=DEFAULT_MAX_FRAME_SIZE, *args, **kwargs):
+        super().__init__(headers, encoder=encoder, end_headers=end_headers, padding=padding,
+                         max_frame_size=max_frame_size, *args, **kwargs)
+
+        self.promised_stream_id = promised_stream_id
+
+    def _fields_length(self):
+        return 4
+
+    def _first_fragment(self, fragment):
+        first = PushPromiseFrame(
+            None, self.promised_stream_id, encoder=self.encoder, padding=self.padding,
+            max_frame_size=self.max_frame_size, stream_id=self.stream_id
         )
+        first.header_block = fragment
+
+        return first
 
-    def _make_dep(self):
-        dep = int_to_bytes(self.stream_dep, 4)
-        if self.exclusive:
-            dep[0] |= 128
-        else:
-            dep[0] &= 127
+    def _payload_buffers(self):
+        return self._padded(
+            self.padding, _uint32.pack(self.promised_stream_id & 0x7fffffff), self.encode_header_block())
+
+
+class PriorityFrame(Frame):
+    __slots__ = ('stream_dep', 'weight', 'exclusive')
+
+    frame_type = 0x2
+
+    def __init__(self, stream_dep=0, weight=16, exclusive=False, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
-        weight = int_to_byte(self.weight)
+        self.stream_dep = stream_dep
+        self.weight = weight
+        self.exclusive = exclusive
 
-        return dep, weight
+    def _make_payload(self):
+        return _pack_priority(self.stream_dep, self.weight, self.exclusive)
 
 
 class SettingsFrame(Frame):
-    frame_type = b'\x04'
+    """
+    SETTINGS frame [RFC7540, section 6.5]. Settings given as keywords are
+    merged into settings, a dict of identifier: value (None values are
+    left out), and are sent in identifier order.
+    """
+    __slots__ = ('settings', 'ack')
+
+    frame_type = 0x4
 
     SETTINGS_HEADER_TABLE_SIZE = 1
     SETTINGS_ENABLE_PUSH = 2
+    SETTINGS_MAX_CONCURRENT_STREAMS = 3
+    SETTINGS_INITIAL_WINDOW_SIZE = 4
+    SETTINGS_MAX_FRAME_SIZE = 5
+    SETTINGS_MAX_HEADER_LIST_SIZE = 6
 
-    def __init__(self, ack=None, header_table_size=None, enable_push=None, 
-                 *args, **kwargs):
+    def __init__(self, ack=None, header_table_size=None, enable_push=None,
+                 max_concurrent_streams=None, initial_window_size=None, max_frame_size=None,
+                 max_header_list_size=None, settings=None, *args, **kwargs):
 
         super().__init__(stream_id=0, *args, **kwargs)
 
-        self.header_table_size = header_table_size
-        self.enable_push = enable_push
+        self.settings = dict(settings or {})
+        for identifier, value in (
+            (self.SETTINGS_HEADER_TABLE_SIZE, header_table_size),
+            (self.SETTINGS_ENABLE_PUSH, None if enable_push is None else int(bool(enable_push))),
+            (self.SETTINGS_MAX_CONCURRENT_STREAMS, max_concurrent_streams),
+            (self.SETTINGS_INITIAL_WINDOW_SIZE, initial_window_size),
+            (self.SETTINGS_MAX_FRAME_SIZE, max_frame_size),
+            (self.SETTINGS_MAX_HEADER_LIST_SIZE, max_header_list_size),
+        ):
+            if value is not None:
+                self.settings[identifier] = value
+
         self.ack = ack
 
-        self.flags = self._flags_byte(0x1 if ack else None)
+        if ack and self.settings:
+            raise ValueError('SETTINGS ACK carries no settings')
+
+        self.flags = FLAG_ACK if ack else 0
+
+    @property
+    def header_table_size(self):
+        return self.settings.get(self.SETTINGS_HEADER_TABLE_SIZE)
+
+    @property
+    def enable_push(self):
+        return self.settings.get(self.SETTINGS_ENABLE_PUSH)
 
     def _make_payload(self):
-        if self.ack is not None and self.ack == True:
-            return b''
+        return b''.join([
+            _setting.pack(identifier, value)
+            for identifier, value in sorted(self.settings.items()) if value is not None
+        ])
 
-        settings = []
 
-        if self.header_table_size is not None:
-            settings.append(
-                self._make_setting(self.SETTINGS_HEADER_TABLE_SIZE, self.header_table_size)
-            )
+class ContinuationFrame(Frame):
+    __slots__ = ('header_block', 'end_headers')
 
-        if self.enable_push is not None:
-            settings.append(
-                self._make_setting(self.SETTINGS_ENABLE_PUSH, 1 if self.enable_push else 0)
-            )
-        
-        return concat_bytes(*settings)
+    frame_type = 0x9
 
-    def _make_setting(self, _id, val):
-        return concat_bytes(
-            int_to_bytes(_id, 2),
-            int_to_bytes(val, 4)
-        )
+    def __init__(self, header_block, end_headers=False, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.header_block = header_block
+        self.end_headers = end_headers
+
+        self.flags = FLAG_END_HEADERS if end_headers else 0
+
+    def _payload_buffers(self):
+        return [self.header_block]
+
+
+class RstStreamFrame(Frame):
+    __slots__ = ('error_code',)
+
+    frame_type = 0x3
+
+    def __init__(self, error_code, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.error_code = error_code
+
+    def _make_payload(self):
+        return _uint32.pack(self.error_code)
+
+
+class PingFrame(Frame):
+    __slots__ = ('opaque_data', 'ack')
+
+    frame_type = 0x6
+
+    def __init__(self, opaque_data=b'\x00' * 8, ack=False, *args, **kwargs):
+        super().__init__(stream_id=0, *args, **kwargs)
+
+        if len(opaque_data) != 8:
+            raise ValueError('PING opaque data must be 8 octets long')
+
+        self.opaque_data = opaque_data
+        self.ack = ack
+
+        self.flags = FLAG_ACK if ack else 0
+
+    def _make_payload(self):
+        return bytes(self.opaque_data)
+
+
+class GoAwayFrame(Frame):
+    __slots__ = ('last_stream_id', 'error_code', 'debug_data')
+
+    frame_type = 0x7
+
+    def __init__(self, last_stream_id, error_code=0, debug_data=b'', *args, **kwargs):
+        super().__init__(stream_id=0, *args, **kwargs)
+
+        self.last_stream_id = last_stream_id
+        self.error_code = error_code
+        self.debug_data = debug_data
+
+    def _make_payload(self):
+        return _goaway.pack(self.last_stream_id & 0x7fffffff, self.error_code) + bytes(self.debug_data)
+
+
+class WindowUpdateFrame(Frame):
+    __slots__ = ('increment',)
+
+    frame_type = 0x8
+
+    def __init__(self, increment, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        if not 0 < increment < 2**31:
+            raise ValueError('Window size increment must be in range 1..2^31-1')
+
+        self.increment = increment
+
+    def _make_payload(self):
+        return _uint32.pack(self.increment)
+
+
+def _pack_priority(stream_dep, weight, exclusive):
+    stream_dep = (stream_dep or 0) & 0x7fffffff
+    if exclusive:
+        stream_dep |= 0x80000000
+
+    # Weight is 1-256 and is sent minus one [RFC7540, section 6.2].
+    return _priority.pack(stream_dep, (weight or 16) - 1)
+
+
+class FrameView(object):
+    """
+    Frame received from the peer. payload is a memoryview which references
+    the reader buffer, frame specific fields are parsed from it on access.
+    """
+    __slots__ = ('frame_type', 'flags', 'stream_id', 'payload')
+
+    def __init__(self, frame_type, flags, stream_id, payload):
+        self.frame_type = frame_type
+        self.flags = flags
+        self.stream_id = stream_id
+        self.payload = payload
+
+    def __len__(self):
+        return len(self.payload)
+
+    def __repr__(self):
+        return '<{} stream_id={} flags={:#x} length={}>'.format(
+            type(self).__name__, self.stream_id, self.flags, len(self.payload))
+
+    def _unpadded(self):
+        payload = self.payload
+        if not self.flags & FLAG_PADDED:
+            return payload
+
+        if not payload:
+            raise FrameSizeError('Padded frame without Pad Length field')
+
+        pad_length = payload[0]
+        if pad_length >= len(payload):
+            raise ProtocolError('Padding is longer than the payload')
+
+        return payload[1:len(payload) - pad_length]
+
+
+class DataFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def end_stream(self):
+        return bool(self.flags & FLAG_END_STREAM)
+
+    @property
+    def data(self):
+        return self._unpadded()
+
+
+class HeadersFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def end_stream(self):
+        return bool(self.flags & FLAG_END_STREAM)
+
+    @property
+    def end_headers(self):
+        return bool(self.flags & FLAG_END_HEADERS)
+
+    @property
+    def priority(self):
+        """
+        (exclusive, stream_dep, weight) tuple or None if the frame has no
+        priority fields.
+        """
+        if not self.flags & FLAG_PRIORITY:
+            return None
+
+        payload = self._unpadded()
+        if len(payload) < 5:
+            raise FrameSizeError('HEADERS frame is too short for priority fields')
+
+        return _unpack_priority(payload)
+
+    @property
+    def header_block(self):
+        payload = self._unpadded()
+        if self.flags & FLAG_PRIORITY:
+            return payload[5:]
+
+        return payload
+
+
+class PriorityFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def priority(self):
+        if len(self.payload) != 5:
+            raise FrameSizeError('PRIORITY frame length must be 5')
+
+        return _unpack_priority(self.payload)
+
+
+class RstStreamFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def error_code(self):
+        if len(self.payload) != 4:
+            raise FrameSizeError('RST_STREAM frame length must be 4')
+
+        return struct.unpack('>L', self.payload)[0]
+
+
+class SettingsFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def ack(self):
+        return bool(self.flags & FLAG_ACK)
+
+    @property
+    def settings(self):
+        """
+        List of (identifier, value) tuples in the order of the payload.
+        """
+        if len(self.payload) % 6:
+            raise FrameSizeError('SETTINGS frame length must be a multiple of 6')
+
+        return list(struct.iter_unpack('>HL', self.payload))
+
+
+class PushPromiseFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def end_headers(self):
+        return bool(self.flags & FLAG_END_HEADERS)
+
+    @property
+    def promised_stream_id(self):
+        payload = self._unpadded()
+        if len(payload) < 4:
+            raise FrameSizeError('PUSH_PROMISE frame is too short')
+
+        return struct.unpack_from('>L', payload)[0] & 0x7fffffff
+
+    @property
+    def header_block(self):
+        return self._unpadded()[4:]
+
+
+class PingFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def ack(self):
+        return bool(self.flags & FLAG_ACK)
+
+    @property
+    def opaque_data(self):
+        if len(self.payload) != 8:
+            raise FrameSizeError('PING frame length must be 8')
+
+        return bytes(self.payload)
+
+
+class GoAwayFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def last_stream_id(self):
+        self._check_length()
+        return struct.unpack_from('>L', self.payload)[0] & 0x7fffffff
+
+    @property
+    def error_code(self):
+        self._check_length()
+        return struct.unpack_from('>L', self.payload, 4)[0]
+
+    @property
+    def debug_data(self):
+        return self.payload[8:]
+
+    def _check_length(self):
+        if len(self.payload) < 8:
+            raise FrameSizeError('GOAWAY frame is too short')
+
+
+class WindowUpdateFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def increment(self):
+        if len(self.payload) != 4:
+            raise FrameSizeError('WINDOW_UPDATE frame length must be 4')
+
+        return struct.unpack('>L', self.payload)[0] & 0x7fffffff
+
+
+class ContinuationFrameView(FrameView):
+    __slots__ = ()
+
+    @property
+    def end_headers(self):
+        return bool(self.flags & FLAG_END_HEADERS)
+
+    @property
+    def header_block(self):
+        return self.payload
+
+
+def _unpack_priority(payload):
+    dep, weight = struct.unpack_from('>LB', payload)
+    return bool(dep & 0x80000000), dep & 0x7fffffff, weight + 1
+
+
+# View classes by frame type, unknown types are read as plain FrameView.
+frame_views = {
+    0x0: DataFrameView,
+    0x1: HeadersFrameView,
+    0x2: PriorityFrameView,
+    0x3: RstStreamFrameView,
+    0x4: SettingsFrameView,
+    0x5: PushPromiseFrameView,
+    0x6: PingFrameView,
+    0x7: GoAwayFrameView,
+    0x8: WindowUpdateFrameView,
+    0x9: ContinuationFrameView,
+}
+
+
+class FrameReader(object):
+    """
+    Incremental frame parser.
+
+    Received bytes are stored in a buffer which is never compacted or
+    resized: when it fills up a new one is allocated and only the bytes of
+    an incomplete frame are moved there. So payloads of parsed frames are
+    returned as memoryview slices without copying and stay valid while the
+    reader goes on. The reader may be plugged into asyncio.BufferedProtocol
+    through get_buffer()/buffer_updated() or be given bytes with feed().
+
+    :param max_frame_size:
+        SETTINGS_MAX_FRAME_SIZE advertised to the peer.
+    :param buffer_size:
+        size of a newly allocated buffer.
+    """
+    def __init__(self, max_frame_size=DEFAULT_MAX_FRAME_SIZE, buffer_size=65536):
+        self.max_frame_size = max_frame_size
+        self.buffer_size = buffer_size
+
+        self._buf = bytearray(buffer_size)
+        self._start = 0
+        self._end = 0
+
+    def get_buffer(self, sizehint=-1):
+        """
+        Returns a writable memoryview for the next received bytes.
+        """
+        self._reserve(max(sizehint, _MIN_READ_SIZE))
+        return memoryview(self._buf)[self._end:]
+
+    def buffer_updated(self, nbytes):
+        """
+        Marks nbytes written into the buffer returned by get_buffer as received.
+        """
+        self._end += nbytes
+
+    def feed(self, data):
+        n = len(data)
+        self._reserve(n)
+        self._buf[self._end:self._end + n] = data
+        self._end += n
+
+    def pending(self):
+        """
+        Returns a memoryview of the received bytes which are not parsed yet,
+        e.g. to read a connection preface before the frames.
+        """
+        return memoryview(self._buf)[self._start:self._end]
+
+    def skip(self, n):
+        """
+        Drops the next n received bytes.
+        """
+        self._start = min(self._start + n, self._end)
+
+    def next_frame(self):
+        """
+        Returns the next complete frame or None if more bytes are needed.
+        Raises FrameSizeError if the frame exceeds SETTINGS_MAX_FRAME_SIZE.
+        """
+        start = self._start
+        if self._end - start < FRAME_HEADER_LENGTH:
+            return None
+
+        length_hi, length_lo, frame_type, flags, stream_id = _frame_header.unpack_from(self._buf, start)
+        length = (length_hi << 8) | length_lo
+        if length > self.max_frame_size:
+            raise FrameSizeError('Frame length {} exceeds the maximum of {}'.format(
+                length, self.max_frame_size))
+
+        end = start + FRAME_HEADER_LENGTH + length
+        if end > self._end:
+            # Make sure the rest of the frame fits into the buffer.
+            self._reserve(end - self._end)
+            return None
+
+        self._start = end
+        payload = memoryview(self._buf)[end - length:end]
+
+        return frame_views.get(frame_type, FrameView)(
+            frame_type, flags, stream_id & 0x7fffffff, payload)
+
+    def frames(self):
+        """
+        Yields complete frames available in the buffer.
+        """
+        while True:
+            frame = self.next_frame()
+            if frame is None:
+                return
+
+            yield frame
+
+    def _reserve(self, n):
+        if len(self._buf) - self._end >= n:
+            return
+
+        pending = self._end - self._start
+        buf = bytearray(max(self.buffer_size, pending + n))
+        buf[:pending] = memoryview(self._buf)[self._start:self._end]
+
+        self._buf = buf
+        self._start = 0
+        self._end = pending
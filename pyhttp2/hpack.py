@@ -2,6 +2,21 @@ import struct
 import string
 
 from .utils import chunkify, rchunkify, int_to_byte, byte_to_int
+from .errors import CompressionError, HeaderListTooLargeError
+from .stats import table_snapshot
+# Static and Huffman tables [RFC7541, Appendices A and B], generated by
+# extract_tables.py.
+from ._tables import (
+    STATIC_TABLE as _static_table,
+    STATIC_TABLE_BYTES as _static_table_bytes,
+    STATIC_NAMES as _static_names,
+    STATIC_FIELDS as _static_fields,
+    HUFFMAN_CODES as _huffman_codes,
+    HUFFMAN_LENGTHS as _huffman_lengths,
+    HUFFMAN_NEXT as _huffman_next,
+    HUFFMAN_EMIT as _huffman_emit,
+    HUFFMAN_ACCEPT as _huffman_accept,
+)
 
 # chr(x) - int to single char
 # bin(x) - int to bin repr
@@ -10,69 +25,13 @@ from .utils import chunkify, rchunkify, int_to_byte, byte_to_int
 # ba.append(num) (num <= 255)
 # ba.extend(b'\x01\x02\x03')
 
-_static_table = (
-    (':authority', ''),
-    (':method', 'GET'),
-    (':method', 'POST'),
-    (':path', '/'),
-    (':path', '/index.html'),
-    (':scheme', 'http'),
-    (':scheme', 'https'),
-    (':status', '200'),
-    (':status', '204'),
-    (':status', '206'),
-    (':status', '304'),
-    (':status', '400'),
-    (':status', '404'),
-    (':status', '500'),
-    ('accept-charset', ''),
-    ('accept-encoding', 'gzip, deflate'),
-    ('accept-language', ''),
-    ('accept-ranges', ''),
-    ('accept', ''),
-    ('access-control-allow-origin', ''),
-    ('age', ''),
-    ('allow', ''),
-    ('authorization', ''),
-    ('cache-control', ''),
-    ('content-disposition', ''),
-    ('content-encoding', ''),
-    ('content-language', ''),
-    ('content-length', ''),
-    ('content-location', ''),
-    ('content-range', ''),
-    ('content-type', ''),
-    ('cookie', ''),
-    ('date', ''),
-    ('etag', ''),
-    ('expect', ''),
-    ('expires', ''),
-    ('from', ''),
-    ('host', ''),
-    ('if-match', ''),
-    ('if-modified-since', ''),
-    ('if-none-match', ''),
-    ('if-range', ''),
-    ('if-unmodified-since', ''),
-    ('last-modified', ''),
-    ('link', ''),
-    ('location', ''),
-    ('max-forwards', ''),
-    ('proxy-authenticate', ''),
-    ('proxy-authorization', ''),
-    ('range', ''),
-    ('referer', ''),
-    ('refresh', ''),
-    ('retry-after', ''),
-    ('server', ''),
-    ('set-cookie', ''),
-    ('strict-transport-security', ''),
-    ('transfer-encoding', ''),
-    ('user-agent', ''),
-    ('vary', ''),
-    ('via', ''),
-    ('www-authenticate', ''),
-)
+HUFFMAN_EOS = 256
+
+# Default value of SETTINGS_HEADER_TABLE_SIZE [RFC7540, section 6.5.2].
+DEFAULT_TABLE_SIZE = 4096
+
+# Per-entry overhead of the dynamic table [RFC7541, section 4.1].
+ENTRY_OVERHEAD = 32
 
 
 def uint_encode(val, n=8):
@@ -109,45 +68,158 @@ def uint_decode(array, n=8):
     Decodes unsigned integer accoriding to [RFC7541, section 5.1]. 
 
     :param array:
-        pass
+        bytes-like object starting with the encoded integer.
     :param n:
-        pass
+        prefix size in bits.
     """
-    ind = 0
-    i = array[ind] & 2**n - 1
-    if i < 2**n - 1:
-        return i
+    return uint_decode_from(array, 0, n)[0]
+
+
+def uint_decode_from(array, offset=0, n=8):
+    """
+    Decodes unsigned integer starting at offset. Returns the value and the
+    offset just past it. Raises IndexError if array ends before the integer.
+    """
+    mask = (1 << n) - 1
+    i = array[offset] & mask
+    offset += 1
+    if i < mask:
+        return i, offset
 
     m = 0
     while True:
-        ind += 1
-        b = array[ind]
-        i += (b & 127) * 2**m
+        b = array[offset]
+        offset += 1
+        i += (b & 127) << m
         m += 7
-        
-        if b & 128 != 128:
-            break
 
-    return i
+        if not b & 128:
+            return i, offset
+
+
+def bytestr_decode_from(array, offset=0):
+    """
+    Decodes string literal [RFC7541, section 5.2] starting at offset. Returns
+    the octets and the offset just past the literal. Raises IndexError if
+    array ends before the literal.
+    """
+    huffman = array[offset] & 128
+    length, offset = uint_decode_from(array, offset, n=7)
+
+    end = offset + length
+    if end > len(array):
+        raise IndexError('String literal is truncated')
+
+    if huffman:
+        return huffman_decode(array[offset:end]), end
+
+    return bytes(array[offset:end]), end
+
+
+def header_size(name, value):
+    """
+    Size of a header field as defined in [RFC7541, section 4.1].
+    """
+    return len(name) + len(value) + ENTRY_OVERHEAD
+
+
+def huffman_encode(bytestr):
+    """
+    Encodes octets with the static Huffman code [RFC7541, section 5.2].
+
+    Codes are packed through an integer accumulator which is flushed
+    32 bits at a time; the last octet is padded with the EOS prefix.
+    """
+    codes = _huffman_codes
+    lengths = _huffman_lengths
+
+    result = bytearray()
+    acc = 0
+    bits = 0
+    for b in bytestr:
+        n = lengths[b]
+        acc = (acc << n) | codes[b]
+        bits += n
+
+        if bits >= 32:
+            bits -= 32
+            result += (acc >> bits).to_bytes(4, 'big')
+            acc &= (1 << bits) - 1
+
+    if bits:
+        pad = -bits % 8
+        acc = (acc << pad) | ((1 << pad) - 1)
+        result += acc.to_bytes((bits + pad) // 8, 'big')
+
+    return result
+
+
+def huffman_encoded_length(bytestr):
+    """
+    Returns the length of Huffman encoded bytestr in octets without encoding it.
+    """
+    return (sum(map(_huffman_lengths.__getitem__, bytestr)) + 7) // 8
+
+
+def huffman_decode(bytestr):
+    """
+    Decodes Huffman encoded octets [RFC7541, section 5.2].
+
+    Raises CompressionError if the string contains EOS or its padding is
+    longer than 7 bits or is not a prefix of EOS.
+    """
+    next_states = _huffman_next
+    emits = _huffman_emit
+
+    state = 0
+    result = bytearray()
+    for b in bytestr:
+        i = state | b
+        result += emits[i]
+        state = next_states[i]
+
+    if state not in _huffman_accept:
+        raise CompressionError('Invalid Huffman encoded string')
+
+    return bytes(result)
+
+
+def huffman_validate(bytestr):
+    """
+    Raises CompressionError if huffman_decode() would, without building the
+    decoded octets.
+    """
+    next_states = _huffman_next
+
+    state = 0
+    for b in bytestr:
+        state = next_states[state | b]
+
+    if state not in _huffman_accept:
+        raise CompressionError('Invalid Huffman encoded string')
 
 
 def bytestr_encode(bytestr, huffman=False, encoding='ascii'):
     """
-    Decodes byte string literal accoriding to [RFC7541, section 5.2]. 
+    Encodes byte string literal accoriding to [RFC7541, section 5.2].
 
     :param bytestr:
-        pass
+        str, bytes or bytearray to encode.
     :param huffman:
-        pass
+        True to use Huffman encoding, False to emit the octets as is and
+        None to use Huffman encoding only if it is shorter.
     """
     if isinstance(bytestr, str):
         bytestr = bytestr.encode(encoding)
 
-    if not isinstance(bytestr, (bytes, bytearray)):
+    if not isinstance(bytestr, (bytes, bytearray, memoryview)):
         raise ValueError('bytestr must by an instance of bytes or bytearray')
 
+    if huffman is None:
+        huffman = huffman_encoded_length(bytestr) < len(bytestr)
+
     if huffman:
-        raise NotImplementedError()
+        bytestr = huffman_encode(bytestr)
 
     result = uint_encode(len(bytestr), n=7)
     if huffman:
@@ -159,75 +231,523 @@ def bytestr_encode(bytestr, huffman=False, encoding='ascii'):
 
 
 class IndexTable(object):
+    """
+    Header index address space according to [RFC7541, section 2.3].
+
+    The dynamic part is kept in a ring buffer addressed by insertion
+    number: the k-th inserted entry lives in slot k % capacity. Name and
+    field lookups go through dicts which map to the insertion number of the
+    most recent matching entry, so an index is derived with a subtraction
+    and no list is ever rebuilt.
+
+    :param max_size:
+        maximum size of the dynamic table in octets (see
+        SETTINGS_HEADER_TABLE_SIZE).
+    """
     STATIC_LENGTH = len(_static_table)
 
-    def __init__(self):
-        self._dyn_table = []
+    def __init__(self, max_size=DEFAULT_TABLE_SIZE):
+        self._max_size = max_size
+        self._size = 0
+        self._ring = [None] * self._capacity(max_size)
+
+        # Insertion numbers of the next entry to add and of the oldest
+        # entry still present in the table.
+        self._inserted = 0
+        self._evicted = 0
+
+        self._names = {}
+        self._fields = {}
+
+    @property
+    def size(self):
+        return self._size
+
+    @property
+    def max_size(self):
+        return self._max_size
 
     def find(self, name, value=None):
         return self._find_name(name) if value is None else self._find_field(name, value)
 
     def _find_name(self, name):
-        static_names = [i[0] for i in _static_table]
-        dynaimc_names = [i[0] for i in self._dyn_table]
+        idx = _static_names.get(name)
+        if idx is not None:
+            return idx
 
-        try:
-            return (static_names + dynaimc_names).index(name) + 1
-        except ValueError:
+        k = self._names.get(name)
+        if k is None:
             return None
 
+        return self.STATIC_LENGTH + self._inserted - k
+
     def _find_field(self, name, value):
-        try:
-            return (list(_static_table) + self._dyn_table).index((name, value)) + 1
-        except ValueError:
+        idx = _static_fields.get((name, value))
+        if idx is not None:
+            return idx
+
+        k = self._fields.get((name, value))
+        if k is None:
             return None
 
+        return self.STATIC_LENGTH + self._inserted - k
+
     def add(self, name, field):
-        self._dyn_table.insert(0, (name, field))
+        """
+        Inserts an entry, evicting the oldest ones if needed [RFC7541, section 4.4].
+
+        Returns False if the entry is larger than the table and therefore
+        was not added (the table is emptied in that case).
+        """
+        entry_size = header_size(name, field)
+        if entry_size > self._max_size:
+            self._evict(0)
+            return False
+
+        self._evict(self._max_size - entry_size)
+
+        ring = self._ring
+        k = self._inserted
+        if k - self._evicted >= len(ring):
+            self._rebuild_ring(len(ring) * 2)
+            ring = self._ring
+
+        ring[k % len(ring)] = (name, field)
+        self._names[name] = k
+        self._fields[(name, field)] = k
+        self._inserted = k + 1
+        self._size += entry_size
+
+        return True
+
+    def clear(self):
+        """
+        Evicts all the entries, as adding one larger than the table does.
+        """
+        self._evict(0)
+
+    def resize(self, max_size):
+        """
+        Applies a new maximum table size [RFC7541, section 4.3].
+        """
+        if max_size < 0:
+            raise ValueError('Table size must be equal or greater than zero!')
+
+        self._max_size = max_size
+        self._evict(max_size)
+
+        capacity = self._capacity(max_size)
+        if capacity != len(self._ring):
+            self._rebuild_ring(capacity)
+
+    @property
+    def insertions(self):
+        """
+        Number of entries inserted so far, i.e. insertion number of the next one.
+        """
+        return self._inserted
+
+    @property
+    def evictions(self):
+        """
+        Number of entries evicted so far.
+        """
+        return self._evicted
+
+    def index_of(self, insertion):
+        """
+        Returns current index of the entry with the given insertion number or
+        None if the entry has been evicted.
+        """
+        if not self._evicted <= insertion < self._inserted:
+            return None
+
+        return self.STATIC_LENGTH + self._inserted - insertion
 
     def get(self, index):
-        index -= 1
+        if index < 1:
+            raise IndexError('Index {} is out of table range'.format(index))
+
+        if index <= self.STATIC_LENGTH:
+            return _static_table[index - 1]
+
+        k = self._inserted - (index - self.STATIC_LENGTH)
+        if k < self._evicted:
+            raise IndexError('Index {} is out of table range'.format(index))
+
+        return self._ring[k % len(self._ring)]
 
-        if index < self.STATIC_LENGTH:
-            return _static_table[index]
+    def _evict(self, limit):
+        ring = self._ring
+        names = self._names
+        fields = self._fields
 
-        return self._dyn_table[index - self.STATIC_LENGTH]
+        while self._size > limit:
+            k = self._evicted
+            slot = k % len(ring)
+            name, value = ring[slot]
+            ring[slot] = None
+
+            # Only drop the lookup entries if they still point to the
+            # evicted entry and not to a newer duplicate.
+            if names.get(name) == k:
+                del names[name]
+            if fields.get((name, value)) == k:
+                del fields[(name, value)]
+
+            self._size -= header_size(name, value)
+            self._evicted = k + 1
+
+    def _rebuild_ring(self, capacity):
+        ring = [None] * capacity
+        old = self._ring
+        for k in range(self._evicted, self._inserted):
+            ring[k % capacity] = old[k % len(old)]
+
+        self._ring = ring
+
+    @staticmethod
+    def _capacity(max_size):
+        return max(1, max_size // ENTRY_OVERHEAD)
 
     def __getitem__(self, index):
         return self.get(index)
 
     def __len__(self):
-        return self.STATIC_LENGTH + len(self._dyn_table)
-        
+        return self.STATIC_LENGTH + self._inserted - self._evicted
+
+
+# Literal header field representations [RFC7541, section 6.2].
+INCREMENTAL_INDEXING = 0
+WITHOUT_INDEXING = 1
+NEVER_INDEXED = 2
+
+
+class IndexingPolicy(object):
+    """
+    Decides how the Encoder represents a field which is not found in the
+    index table. The base policy indexes every field.
+
+    If crumble_cookies is set, cookie headers are split into one field per
+    cookie [RFC7540, section 8.1.2.5].
+    """
+    crumble_cookies = False
+
+    def decide(self, name, value, index_table):
+        """
+        Returns INCREMENTAL_INDEXING, WITHOUT_INDEXING or NEVER_INDEXED.
+        """
+        return INCREMENTAL_INDEXING
+
+    def observe(self, name, value):
+        """
+        Records a field found in the index table.
+        """
+
+
+class AdaptiveIndexingPolicy(IndexingPolicy):
+    """
+    Indexes only the fields which are likely to be sent again.
+
+    * sensitive fields (credentials, cookies) are sent as never indexed
+      literals [RFC7541, section 7.1.3];
+    * high-churn fields (dates, lengths, :path with a query) are not indexed;
+    * fields which would take more than max_entry_share of the table are not
+      indexed, they would flush it;
+    * for the remaining ones the reuse rate of the values of every name is
+      estimated from the last few values seen, regardless of whether they
+      were indexed. A field is indexed while that rate is at least
+      min_reuse, so the table is left to the entries that save the most.
+    """
+    crumble_cookies = True
+
+    sensitive = frozenset((
+        b'authorization', b'proxy-authorization', b'cookie', b'set-cookie',
+    ))
+
+    high_churn = frozenset((
+        b'date', b'content-length', b'content-range', b'age', b'expires', b'etag',
+        b'last-modified', b'if-modified-since', b'if-none-match', b'x-request-id',
+    ))
+
+    # Per-name history length and the number of names tracked.
+    history_size = 4
+    max_names = 256
+
+    def __init__(self, min_reuse=0.5, max_entry_share=0.5, sensitive=None, high_churn=None):
+        self.min_reuse = min_reuse
+        self.max_entry_share = max_entry_share
+        if sensitive is not None:
+            self.sensitive = frozenset(sensitive)
+        if high_churn is not None:
+            self.high_churn = frozenset(high_churn)
+
+        # name -> [seen, reused, recent values]
+        self._names = {}
+
+    def reuse_rate(self, name):
+        """
+        Estimated probability that the next value of name was seen recently.
+        """
+        stats = self._names.get(name)
+        if stats is None:
+            return 0.5
+
+        return (stats[1] + 1) / (stats[0] + 2)
+
+    def decide(self, name, value, index_table):
+        if name in self.sensitive:
+            return NEVER_INDEXED
+
+        if name in self.high_churn or (name == b':path' and b'?' in value):
+            return WITHOUT_INDEXING
+
+        rate = self.reuse_rate(name)
+        self._observe(name, value)
+
+        if header_size(name, value) > index_table.max_size * self.max_entry_share:
+            return WITHOUT_INDEXING
+
+        return INCREMENTAL_INDEXING if rate >= self.min_reuse else WITHOUT_INDEXING
+
+    def observe(self, name, value):
+        """
+        Records a field found in the index table.
+        """
+        if name in self._names:
+            self._observe(name, value)
+
+    def _observe(self, name, value):
+        stats = self._names.get(name)
+        if stats is None:
+            if len(self._names) >= self.max_names:
+                self._names.clear()
+
+            stats = self._names[name] = [0, 0, []]
+
+        recent = stats[2]
+        stats[0] += 1
+        if value in recent:
+            stats[1] += 1
+            recent.remove(value)
+        elif len(recent) >= self.history_size:
+            del recent[0]
+
+        recent.append(value)
+
 
 class Encoder(object):
-    def __init__(self):
-        self.index_table = IndexTable()
+    """
+    HPACK header block encoder.
+
+    :param max_table_size:
+        initial dynamic table size.
+    :param huffman:
+        Huffman encoding mode for string literals, see bytestr_encode. By
+        default a literal is Huffman encoded only when that makes it shorter.
+    :param policy:
+        IndexingPolicy for fields not found in the table, by default an
+        AdaptiveIndexingPolicy.
+    :param stats:
+        stats.HpackStats to count into, None disables counting.
+    """
+    def __init__(self, max_table_size=DEFAULT_TABLE_SIZE, huffman=None, policy=None, stats=None):
+        self.index_table = IndexTable(max_table_size)
+        self.huffman = huffman
+        self.policy = policy if policy is not None else AdaptiveIndexingPolicy()
+        self.stats = stats
+
+        # Octets of names and values given to the encoder and octets of the
+        # header blocks produced.
+        self.raw_bytes = 0
+        self.encoded_bytes = 0
+
+        # Smallest and last table sizes set since the previous header
+        # block; both have to be signalled [RFC7541, section 4.2].
+        self._min_table_size = None
+        self._new_table_size = None
+
+    def update_table_size(self, max_size):
+        """
+        Changes the dynamic table size, e.g. after the peer acknowledged a new
+        SETTINGS_HEADER_TABLE_SIZE. The update is emitted at the beginning of
+        the next header block.
+        """
+        self.index_table.resize(max_size)
+
+        if self._min_table_size is None or max_size < self._min_table_size:
+            self._min_table_size = max_size
+        self._new_table_size = max_size
+
+    @property
+    def compression_ratio(self):
+        """
+        Encoded to raw size ratio of everything encoded so far.
+        """
+        if not self.raw_bytes:
+            return 1.0
+
+        return self.encoded_bytes / self.raw_bytes
+
+    def snapshot(self):
+        """
+        Returns the counters and the dynamic table occupancy as a dict.
+        """
+        if self.stats is None:
+            return {'table': table_snapshot(self.index_table)}
+
+        return self.stats.snapshot(self.index_table)
 
     def encode_headers(self, headers):
+        """
+        Encodes a header block. headers is either a "name: value" per line
+        text or a sequence of (name, value) tuples.
+        """
         if isinstance(headers, str):
             headers = headers.encode('ascii')
 
-        result = bytearray()
-        headers = headers.split(b'\n')
-        for header in headers:
-            h = header.rsplit(b':', 1)
-            h[1] = h[1].strip()
-            result.extend(self.encode_header(h[0], h[1]))
+        if isinstance(headers, bytes):
+            headers = self._parse_headers(headers)
 
-        return bytes(result)
+        return self.encode_fields(headers)
+
+    def encode_fields(self, fields):
+        """
+        Encodes a header block from a sequence of (name, value) bytes tuples,
+        names are expected to be lowercase already.
+        """
+        return bytes(self._encode_block(bytearray(), fields))
+
+    def encode_batch(self, header_lists, buffer=None):
+        """
+        Encodes header blocks for several header lists, in order, into one
+        buffer and returns a list of memoryviews of the blocks.
+
+        :param header_lists:
+            iterable of sequences of (name, value) bytes tuples.
+        :param buffer:
+            bytearray the blocks are appended to, a new one by default. A
+            buffer reused between batches must not be resized while views of
+            the previous batch are alive.
+        """
+        if buffer is None:
+            buffer = bytearray()
+
+        bounds = []
+        for fields in header_lists:
+            start = len(buffer)
+            self._encode_block(buffer, fields)
+            bounds.append((start, len(buffer)))
+
+        view = memoryview(buffer)
+        return [view[start:end] for start, end in bounds]
+
+    def _encode_block(self, out, fields):
+        start = len(out)
+        out += self._encode_table_size_updates()
+
+        raw = 0
+        for name, value in fields:
+            raw += len(name) + len(value)
+            out += self.encode_header(name, value)
+
+        self.raw_bytes += raw
+        self.encoded_bytes += len(out) - start
+
+        if self.stats is not None:
+            self.stats.block(raw, len(out) - start)
+
+        return out
+
+    @staticmethod
+    def _parse_headers(text):
+        """
+        Splits "name: value" lines into tuples. The name ends at the first
+        colon after its first character, so pseudo-header names and values
+        containing colons are kept intact.
+        """
+        fields = []
+        for line in text.split(b'\n'):
+            line = line.strip()
+            if not line:
+                continue
+
+            sep = line.find(b':', 1)
+            if sep < 0:
+                raise ValueError('Invalid header line: {!r}'.format(line))
+
+            fields.append((line[:sep].rstrip(), line[sep + 1:].strip()))
+
+        return fields
+
+    def compile_template(self, headers):
+        """
+        Compiles a header list into a HeaderTemplate bound to this encoder.
+        Fields with None value are slots filled on every encode().
+        """
+        return HeaderTemplate(self, headers)
 
     def encode_header(self, name, value):
+        if name == b'cookie' and self.policy.crumble_cookies and b'; ' in value:
+            return b''.join(
+                self.encode_header(name, crumb) for crumb in value.split(b'; ') if crumb)
+
+        stats = self.stats
+        if stats is not None:
+            stats.fields += 1
+
         ind = self.index_table.find(name, value)
         if ind is not None:
+            if stats is not None:
+                if ind <= IndexTable.STATIC_LENGTH:
+                    stats.static_hits += 1
+                else:
+                    stats.dynamic_hits += 1
+
+            self.policy.observe(name, value)
             return self._encode_indexed_field(ind)
 
+        if stats is not None:
+            stats.literals += 1
+
+        representation = self.policy.decide(name, value, self.index_table)
+        indexed = representation == INCREMENTAL_INDEXING
+
         ind = self.index_table.find(name)
-        return self._encode_literal_field(
+        result = self._encode_literal_field(
             name=ind if ind is not None else name, 
-            value=value
+            value=value,
+            indexed=indexed,
+            never_indexed=representation == NEVER_INDEXED
         )
-            
+
+        # The peer inserts the field into its table, so does the encoder to
+        # stay in sync [RFC7541, section 6.2.1].
+        if indexed:
+            self.index_table.add(name, value)
+
+        return result
+
+    def _encode_table_size_updates(self):
+        result = bytearray()
+        if self._new_table_size is None:
+            return result
+
+        if self._min_table_size < self._new_table_size:
+            result.extend(self._encode_table_size_update(self._min_table_size))
+        result.extend(self._encode_table_size_update(self._new_table_size))
+
+        self._min_table_size = None
+        self._new_table_size = None
+
+        return result
+
+    def _encode_table_size_update(self, max_size):
+        result = uint_encode(max_size, n=5)
+        result[0] = 32 | result[0]
+
+        return result
+
     def _encode_indexed_field(self, idx):
         result = uint_encode(idx, n=7)
         result[0] = 128 | result[0]
@@ -255,23 +775,871 @@ class Encoder(object):
 
         result = header
 
+        encoded_name = None
         if isinstance(name, bytes):
-            l = uint_encode(len(name), n=7)
-            # l[0] = 128 | l[0]
-            l.extend(name)
-            result.extend(l)
+            encoded_name = bytestr_encode(name, huffman=self.huffman)
+            result.extend(encoded_name)
+
+        encoded_value = bytestr_encode(value, huffman=self.huffman)
+        result.extend(encoded_value)
 
-        l = uint_encode(len(value), n=7)
-        # l[0] = 128 | l[0]
-        l.extend(value)
-        result.extend(l)
+        stats = self.stats
+        if stats is not None:
+            if encoded_name is not None:
+                stats.string(encoded_name[0] & 128, len(encoded_name))
+            stats.string(encoded_value[0] & 128, len(encoded_value))
 
         return bytes(result)
 
 
+class HeaderTemplate(object):
+    """
+    Header list compiled once for repeated header blocks of the same shape.
+
+    Fields which don't depend on the dynamic table (static table references
+    and literals which are not indexed) are pre-encoded and joined into
+    constant segments. Indexed fields keep the insertion number of their
+    table entry, so while the entry is in the table they are emitted as an
+    index computed from it, otherwise as the pre-encoded literal with
+    incremental indexing which inserts them again. Slots are sent without
+    indexing (never indexed for sensitive names) and don't change the table,
+    so only their values are encoded per block.
+
+    :param encoder:
+        Encoder the template is used with; the blocks have to be sent in the
+        order they are encoded, like any other block of the encoder.
+    :param headers:
+        sequence of (name, value) tuples, None values are slots.
+    """
+    _CONSTANT = 0
+    _INDEXED = 1
+    _SLOT = 2
+
+    def __init__(self, encoder, headers):
+        self.encoder = encoder
+        self.slots = []
+
+        self._segments = []
+        self._raw_bytes = 0
+
+        # Fields of the block and how many of the pre-encoded ones are static
+        # table references and literals, counted by every encode().
+        self._fields = 0
+        self._static_hits = 0
+        self._literals = 0
+
+        # Nothing is sent while compiling, so the encoder doesn't count.
+        stats, encoder.stats = encoder.stats, None
+        try:
+            self._compile(headers)
+        finally:
+            encoder.stats = stats
+
+    def _compile(self, headers):
+        constant = bytearray()
+        for name, value in headers:
+            self._fields += 1
+            if value is None:
+                self._flush(constant)
+                self._segments.append((self._SLOT, self._slot_prefix(name)))
+                self.slots.append(name)
+                continue
+
+            self._raw_bytes += len(name) + len(value)
+            if name == b'cookie' and self.encoder.policy.crumble_cookies and b'; ' in value:
+                crumbs = [crumb for crumb in value.split(b'; ') if crumb]
+                self._fields += len(crumbs) - 1
+            else:
+                crumbs = [value]
+
+            for value in crumbs:
+                field = self._compile_field(name, value)
+                if isinstance(field, bytes):
+                    constant.extend(field)
+                else:
+                    self._flush(constant)
+                    self._segments.append((self._INDEXED, field))
+
+        self._flush(constant)
+
+    def encode(self, *values):
+        """
+        Encodes a header block with values filling the slots in order.
+        """
+        if len(values) != len(self.slots):
+            raise ValueError('Template has {} slots, {} values given'.format(
+                len(self.slots), len(values)))
+
+        encoder = self.encoder
+        table = encoder.index_table
+        huffman = encoder.huffman
+        stats = encoder.stats
+
+        result = encoder._encode_table_size_updates()
+        raw = self._raw_bytes
+        i = 0
+        for kind, data in self._segments:
+            if kind == self._CONSTANT:
+                result += data
+            elif kind == self._SLOT:
+                value = values[i]
+                i += 1
+                raw += len(self.slots[i - 1]) + len(value)
+                result += data
+                encoded = bytestr_encode(value, huffman=huffman)
+                result += encoded
+                if stats is not None:
+                    stats.string(encoded[0] & 128, len(encoded))
+            else:
+                result += self._encode_indexed(table, data)
+
+        encoder.raw_bytes += raw
+        encoder.encoded_bytes += len(result)
+
+        if stats is not None:
+            stats.fields += self._fields
+            stats.static_hits += self._static_hits
+            stats.literals += self._literals + len(self.slots)
+            stats.block(raw, len(result))
+
+        return bytes(result)
+
+    def _compile_field(self, name, value):
+        """
+        Returns pre-encoded bytes for fields which don't depend on the dynamic
+        table or a [name, value, literal, insertion] list for indexed ones.
+        """
+        encoder = self.encoder
+
+        idx = _static_fields.get((name, value))
+        if idx is not None:
+            self._static_hits += 1
+            return bytes(encoder._encode_indexed_field(idx))
+
+        representation = encoder.policy.decide(name, value, encoder.index_table)
+        indexed = representation == INCREMENTAL_INDEXING
+
+        literal = encoder._encode_literal_field(
+            name=_static_names.get(name, name),
+            value=value,
+            indexed=indexed,
+            never_indexed=representation == NEVER_INDEXED
+        )
+
+        if not indexed:
+            self._literals += 1
+            return literal
+
+        return [name, value, literal, None]
+
+    def _slot_prefix(self, name):
+        never_indexed = name in getattr(self.encoder.policy, 'sensitive', ())
+
+        idx = _static_names.get(name)
+        if idx is not None:
+            prefix = uint_encode(idx, n=4)
+        else:
+            prefix = bytearray(b'\x00')
+            prefix.extend(bytestr_encode(name, huffman=self.encoder.huffman))
+
+        if never_indexed:
+            prefix[0] |= 16
+
+        return bytes(prefix)
+
+    def _encode_indexed(self, table, field):
+        name, value, literal, insertion = field
+
+        idx = None if insertion is None else table.index_of(insertion)
+        if idx is None:
+            idx = table.find(name, value)
+            if idx is not None and idx > IndexTable.STATIC_LENGTH:
+                field[3] = table.insertions - (idx - IndexTable.STATIC_LENGTH)
+
+        stats = self.encoder.stats
+        if idx is not None:
+            if stats is not None:
+                stats.dynamic_hits += 1
+            return self.encoder._encode_indexed_field(idx)
+
+        if stats is not None:
+            stats.literals += 1
+
+        if table.add(name, value):
+            field[3] = table.insertions - 1
+
+        return literal
+
+    def _flush(self, constant):
+        if constant:
+            self._segments.append((self._CONSTANT, bytes(constant)))
+            constant.clear()
+
+
+class HeaderList(object):
+    """
+    Decoded header list, a sequence of (name, value) bytes tuples.
+
+    Lists returned by Decoder.decode_lazy() keep the values of literal
+    fields as offsets of their string literals in the header block: a
+    value is decoded (Huffman included) when it is first accessed and then
+    cached. Names are decoded right away; lookups go through an index of
+    the lowercase names built on the first lookup, so get() is O(1) for
+    str and bytes names in any case.
+
+    :param fields:
+        (name, value) bytes tuples of an already decoded list.
+    """
+    __slots__ = ('_block', '_names', '_values', '_start', '_index')
+
+    def __init__(self, fields=()):
+        self._block = None
+        self._names = []
+        self._values = []
+        for name, value in fields:
+            self._names.append(name)
+            self._values.append(value)
+
+        # Fields before _start are hidden (see regular()).
+        self._start = 0
+        self._index = None
+
+    @classmethod
+    def _lazy(cls, block, names, values):
+        """
+        :param values:
+            bytes, or offsets in block of string literals not decoded yet.
+        """
+        headers = cls.__new__(cls)
+        headers._block = block
+        headers._names = names
+        headers._values = values
+        headers._start = 0
+        headers._index = None
+
+        return headers
+
+    def get(self, name, default=None):
+        """
+        Returns the value of the first field named name.
+        """
+        i = self._find(name)
+        return default if i is None else self._value(i)
+
+    def get_all(self, name):
+        """
+        Returns the values of all fields named name, in order.
+        """
+        name = self._key(name)
+        return [
+            self._value(i) for i in range(self._start, len(self._names))
+            if self._names[i].lower() == name
+        ]
+
+    def get_str(self, name, default=None):
+        """
+        Returns the value of the first field named name as str (ISO-8859-1).
+        """
+        value = self.get(name)
+        return default if value is None else value.decode('latin-1')
+
+    def regular(self):
+        """
+        Returns the list without the pseudo-header fields, which precede the
+        regular ones [RFC7540, section 8.1.2.1]. Decoded values are shared
+        with this list.
+        """
+        start = self._start
+        names = self._names
+        while start < len(names) and names[start][:1] == b':':
+            start += 1
+
+        headers = self._lazy(self._block, names, self._values)
+        headers._start = start
+
+        return headers
+
+    def _find(self, name):
+        if self._index is None:
+            index = {}
+            names = self._names
+            for i in range(len(names) - 1, self._start - 1, -1):
+                index[names[i].lower()] = i
+
+            self._index = index
+
+        return self._index.get(self._key(name))
+
+    @staticmethod
+    def _key(name):
+        if isinstance(name, str):
+            name = name.encode('latin-1')
+
+        return name.lower()
+
+    def _value(self, i):
+        value = self._values[i]
+        if type(value) is int:
+            value = bytestr_decode_from(self._block, value)[0]
+            self._values[i] = value
+
+        return value
+
+    def __contains__(self, name):
+        return self._find(name) is not None
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError('Header index out of range')
+
+        i += self._start
+        return self._names[i], self._value(i)
+
+    def __len__(self):
+        return len(self._names) - self._start
+
+    def __iter__(self):
+        for i in range(self._start, len(self._names)):
+            yield self._names[i], self._value(i)
+
+    def __eq__(self, other):
+        if isinstance(other, (HeaderList, list, tuple)):
+            return list(self) == list(other)
+
+        return NotImplemented
+
+    def __repr__(self):
+        return '<HeaderList {!r}>'.format(self._names[self._start:])
+
+
+class _Chain(object):
+    """
+    Octets of a sequence of bytes-like chunks, indexed as if joined.
+    """
+    __slots__ = ('chunks', 'length')
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.length = sum(map(len, chunks))
+
+    def __getitem__(self, i):
+        for chunk in self.chunks:
+            if i < len(chunk):
+                return chunk[i]
+            i -= len(chunk)
+
+        raise IndexError('Chain index out of range')
+
+    def __len__(self):
+        return self.length
+
+
 class Decoder(object):
-    def __init__(self):
-        self.index_table = IndexTable()
+    """
+    HPACK header block decoder.
+
+    A header block may be passed at once to decode() or in fragments (HEADERS
+    and CONTINUATION payloads) to feed(). Fields are decoded in place with a
+    running offset; only the bytes of a field split between fragments are
+    carried over. They are kept as a list of chunks until the field is
+    complete and then joined with just the octets of the fragment which
+    complete it, so a long field is copied once however many fragments it
+    spans.
+
+    A small block may reference table entries over and over and decode to a
+    huge header list. The list size is therefore counted as fields complete
+    and once it exceeds max_header_list_size the fields are no longer
+    returned: the rest of the block is still processed to keep the dynamic
+    table in sync, and HeaderListTooLargeError is raised at its end. Strings
+    longer than max_string_length are treated the same way, and skipped
+    without decoding unless they could enter the dynamic table. The declared
+    length is checked first, so a skipped string is dropped as its fragments
+    arrive instead of being buffered.
+
+    :param max_table_size:
+        SETTINGS_HEADER_TABLE_SIZE advertised to the peer, the upper bound
+        of dynamic table size updates.
+    :param stats:
+        stats.HpackStats to count into, None disables counting.
+    :param max_header_list_size:
+        limit of the header list size [RFC7540, section 6.5.2], None for
+        no limit.
+    :param max_string_length:
+        limit of the decoded length of a name or value, None for no limit.
+    """
+    def __init__(self, max_table_size=DEFAULT_TABLE_SIZE, stats=None, max_header_list_size=None,
+                 max_string_length=None):
+        self.index_table = IndexTable(max_table_size)
+        self.max_table_size = max_table_size
+        self.stats = stats
+        self.max_header_list_size = max_header_list_size
+        self.max_string_length = max_string_length
+
+        # Chunks of the field split between fragments, their total size and
+        # the offset the field ends at once known.
+        self._tail = []
+        self._tail_size = 0
+        self._tail_end = None
+        self._block_started = False
+
+        # Size of the header list decoded so far and whether the block
+        # exceeded a limit.
+        self._list_size = 0
+        self._too_large = False
+
+        # Octets of a skipped string still to be dropped and the number of
+        # strings of the same field to skip after it.
+        self._skip = 0
+        self._skip_strings = 0
+
+        # Plain and encoded octets of the block being decoded, kept only
+        # with stats.
+        self._block_plain = 0
+        self._block_encoded = 0
+
+    def snapshot(self):
+        """
+        Returns the counters and the dynamic table occupancy as a dict.
+        """
+        if self.stats is None:
+            return {'table': table_snapshot(self.index_table)}
+
+        return self.stats.snapshot(self.index_table)
+
+    @property
+    def max_table_size(self):
+        return self._max_table_size
+
+    @max_table_size.setter
+    def max_table_size(self, max_size):
+        self._max_table_size = max_size
+
+        # A table above the new limit must be shrunk by a size update at the
+        # start of the next block [RFC7541, section 4.2].
+        self._update_required = self.index_table.max_size > max_size
+
+    def decode(self, header_block):
+        """
+        Decodes a complete header block into a list of (name, value) tuples.
+        """
+        return self.feed(header_block, end=True)
+
+    def decode_lazy(self, header_block):
+        """
+        Decodes a complete header block into a HeaderList. The dynamic table
+        is updated right away, values of literals which don't enter it stay
+        in header_block until accessed. Huffman encoded ones are validated
+        without being decoded, unless they could decode to more than
+        max_string_length (at most 8/5 of the encoded length). Lazy values
+        count towards max_header_list_size and the plain_bytes statistic with
+        their encoded length.
+        """
+        if self._tail:
+            raise CompressionError('Header block is interrupted')
+
+        buf = memoryview(header_block)
+        length = len(buf)
+        if self._update_required and length and buf[0] & 224 != 32:
+            raise CompressionError('Table size update required')
+
+        stats = self.stats
+        limit = self.max_header_list_size
+        max_string_length = self.max_string_length
+        list_size = 0
+        plain = 0
+
+        names = []
+        values = []
+        pos = 0
+        try:
+            while pos < length:
+                b = buf[pos]
+                if b & 128 or b & 224 != 0:
+                    # Indexed fields, literals with incremental indexing and
+                    # table size updates, the table needs the octets.
+                    field, pos = self._decode_field(buf, pos)
+                    if field is None:
+                        continue
+                    name, value = field
+                    size = len(value)
+                else:
+                    # Literal without indexing or never indexed: the value is
+                    # kept as the offset of its string literal.
+                    idx, pos = uint_decode_from(buf, pos, n=4)
+                    name_start = pos
+                    if not idx:
+                        name, pos = self._decode_string(buf, pos, False)
+
+                    value_start = value = pos
+                    huffman = buf[pos] & 128
+                    size, start = uint_decode_from(buf, pos, n=7)
+                    pos = start + size
+                    if pos > length:
+                        raise IndexError('String literal is truncated')
+
+                    if idx:
+                        name = self._get(idx)[0]
+                    if huffman:
+                        # Malformed strings are a connection error, found
+                        # before the block is accepted.
+                        if max_string_length is not None and size * 8 // 5 > max_string_length:
+                            value = huffman_decode(buf[start:pos])
+                            size = len(value)
+                        else:
+                            huffman_validate(buf[start:pos])
+                    if max_string_length is not None and size > max_string_length:
+                        self._too_large = True
+
+                    self._block_started = True
+                    if stats is not None:
+                        stats.fields += 1
+                        stats.literals += 1
+                        if not idx:
+                            stats.string(buf[name_start] & 128, value_start - name_start)
+                        stats.string(huffman, pos - value_start)
+
+                    if name is None:
+                        continue
+
+                plain += len(name) + size
+                if limit is not None:
+                    list_size += len(name) + size + ENTRY_OVERHEAD
+                    if list_size > limit:
+                        self._too_large = True
+
+                if not self._too_large:
+                    names.append(name)
+                    values.append(value)
+        except IndexError:
+            raise CompressionError('Header block is truncated')
+        finally:
+            too_large = self._too_large
+            truncated = self._skip or self._skip_strings
+            self._block_started = False
+            self._too_large = False
+            self._skip = 0
+            self._skip_strings = 0
+
+        if truncated:
+            raise CompressionError('Header block is truncated')
+
+        if stats is not None:
+            stats.block(plain, length)
+
+        if too_large:
+            raise HeaderListTooLargeError('Header list exceeds the decoder limits')
+
+        return HeaderList._lazy(buf, names, values)
+
+    def feed(self, fragment, end=False):
+        """
+        Decodes a header block fragment. Returns the fields completed by the
+        fragment; end must be True for the last fragment of the block.
+        """
+        buf = memoryview(fragment)
+        length = len(buf)
+
+        first = self._tail[0] if self._tail else buf
+        if self._update_required and not self._block_started and first and first[0] & 224 != 32:
+            raise CompressionError('Table size update required')
+
+        headers = []
+        pos = 0
+        if self._tail:
+            pos = self._tail_needed(buf)
+            if pos is None:
+                self._tail.append(bytes(buf))
+                self._tail_size += length
+                pos = length
+            else:
+                head = memoryview(b''.join(self._tail) + bytes(buf[:pos]))
+                self._tail = []
+                self._tail_size = 0
+                self._tail_end = None
+                self._decode_fields(head, 0, headers)
+
+        if not self._tail:
+            pos = self._decode_fields(buf, pos, headers)
+
+        too_large = self._too_large
+        if end:
+            truncated = self._tail or pos < length or self._skip or self._skip_strings
+            self._tail = []
+            self._tail_size = 0
+            self._tail_end = None
+            self._block_started = False
+            self._list_size = 0
+            self._too_large = False
+            self._skip = 0
+            self._skip_strings = 0
+            if truncated:
+                raise CompressionError('Header block is truncated')
+        elif pos < length:
+            self._tail = [bytes(buf[pos:])]
+            self._tail_size = length - pos
+
+        if self.stats is not None:
+            self._count_block(fragment, headers, end)
+
+        if end and too_large:
+            raise HeaderListTooLargeError('Header list exceeds the decoder limits')
+
+        return headers
+
+    def _decode_fields(self, buf, pos, headers):
+        """
+        Decodes the fields of buf from pos on into headers, returns the
+        offset of the first incomplete field.
+        """
+        length = len(buf)
+        limit = self.max_header_list_size
+        while pos < length:
+            if self._skip:
+                n = min(self._skip, length - pos)
+                self._skip -= n
+                pos += n
+                continue
+
+            try:
+                if self._skip_strings:
+                    self._skip, pos = uint_decode_from(buf, pos, n=7)
+                    self._skip_strings -= 1
+                    continue
+
+                field, pos = self._decode_field(buf, pos)
+            except IndexError:
+                break
+
+            if field is None:
+                continue
+
+            if limit is not None:
+                self._list_size += len(field[0]) + len(field[1]) + ENTRY_OVERHEAD
+                if self._list_size > limit:
+                    self._too_large = True
+
+            if not self._too_large:
+                headers.append(field)
+
+        return pos
+
+    def _tail_needed(self, buf):
+        """
+        Returns the number of octets of buf which complete the field in the
+        tail, None if buf doesn't.
+        """
+        end = self._tail_end
+        if end is None:
+            try:
+                end = self._field_end(_Chain(self._tail + [buf]))
+            except IndexError:
+                return None
+            self._tail_end = end
+
+        needed = end - self._tail_size
+        return needed if needed <= len(buf) else None
+
+    def _field_end(self, array):
+        """
+        Returns the offset in array the field starting it ends at, or the
+        offset a skipped string starts at: the rest needn't be buffered.
+        Raises IndexError if the length prefixes aren't complete.
+        """
+        if self._skip_strings:
+            return uint_decode_from(array, 0, n=7)[1]
+
+        b = array[0]
+        if b & 128:
+            return uint_decode_from(array, 0, n=7)[1]
+        if b & 224 == 32:
+            return uint_decode_from(array, 0, n=5)[1]
+
+        indexing = b & 192 == 64
+        idx, pos = uint_decode_from(array, 0, n=6 if indexing else 4)
+        for _ in range(1 if idx else 2):
+            huffman = array[pos] & 128
+            length, pos = uint_decode_from(array, pos, n=7)
+            if self._skips(length, huffman, indexing):
+                return pos
+            pos += length
+
+        return pos
+
+    def _count_block(self, fragment, headers, end):
+        self._block_encoded += len(fragment)
+        self._block_plain += sum(len(name) + len(value) for name, value in headers)
+
+        if end:
+            self.stats.block(self._block_plain, self._block_encoded)
+            self._block_plain = 0
+            self._block_encoded = 0
+
+    def _decode_field(self, buf, pos):
+        b = buf[pos]
+
+        if b & 128:
+            # Indexed header field [RFC7541, section 6.1].
+            idx, pos = uint_decode_from(buf, pos, n=7)
+            self._block_started = True
+            field = self._get(idx)
+
+            stats = self.stats
+            if stats is not None:
+                stats.fields += 1
+                if idx <= IndexTable.STATIC_LENGTH:
+                    stats.static_hits += 1
+                else:
+                    stats.dynamic_hits += 1
+
+            return field, pos
+
+        if b & 192 == 64:
+            # Literal with incremental indexing [RFC7541, section 6.2.1].
+            name, value, pos = self._decode_literal(buf, pos, 6, indexing=True)
+            if name is None or value is None:
+                # Skipped as too long, it wouldn't fit into the table either.
+                self.index_table.clear()
+                return None, pos
+
+            self.index_table.add(name, value)
+            return (name, value), pos
+
+        if b & 224 == 32:
+            # Dynamic table size update [RFC7541, section 6.3].
+            size, pos = uint_decode_from(buf, pos, n=5)
+            if self._block_started:
+                raise CompressionError('Table size update after a header field')
+            if size > self.max_table_size:
+                raise CompressionError('Table size update exceeds the limit')
+
+            self.index_table.resize(size)
+            self._update_required = False
+            return None, pos
+
+        # Literal without indexing or never indexed [RFC7541, sections 6.2.2
+        # and 6.2.3], both have a 4-bit prefix.
+        name, value, pos = self._decode_literal(buf, pos, 4)
+        if name is None or value is None:
+            return None, pos
+
+        return (name, value), pos
+
+    def _decode_literal(self, buf, pos, n, indexing=False):
+        """
+        Returns name, value and the offset past the field; name or value is
+        None if it was skipped as too long.
+        """
+        idx, pos = uint_decode_from(buf, pos, n=n)
+        name_start = pos
+        name = None
+        if not idx:
+            name, pos = self._decode_string(buf, pos, indexing)
+
+        value_start = pos
+        if self._skip:
+            # The name is being skipped and the value has to follow it.
+            self._skip_strings = 1
+            value = None
+        else:
+            value, pos = self._decode_string(buf, pos, indexing)
+
+        # Table lookup goes last: nothing may change until the field is
+        # known to be complete.
+        if idx:
+            name = self._get(idx)[0]
+
+        self._block_started = True
+
+        stats = self.stats
+        if stats is not None:
+            stats.fields += 1
+            stats.literals += 1
+            if not idx:
+                stats.string(buf[name_start] & 128, value_start - name_start)
+            if value_start < len(buf):
+                stats.string(buf[value_start] & 128, pos - value_start)
+
+        return name, value, pos
+
+    def _decode_string(self, buf, pos, indexing):
+        limit = self.max_string_length
+        if limit is None:
+            return bytestr_decode_from(buf, pos)
+
+        huffman = buf[pos] & 128
+        length, start = uint_decode_from(buf, pos, n=7)
+        end = start + length
+
+        # The declared length is checked before the string is complete.
+        if self._skips(length, huffman, indexing):
+            self._too_large = True
+            if end > len(buf):
+                # The rest is dropped from the next fragments.
+                self._skip = end - len(buf)
+                return None, len(buf)
+            return None, end
+
+        if end > len(buf):
+            raise IndexError('String literal is truncated')
+
+        value, end = bytestr_decode_from(buf, pos)
+        if len(value) > limit:
+            self._too_large = True
+            if not indexing or limit >= self.index_table.max_size:
+                return None, end
+
+        return value, end
+
+    def _skips(self, length, huffman, indexing):
+        """
+        True if a string of the declared length is skipped: it is over
+        max_string_length and doesn't need to enter the dynamic table. A
+        string which may enter it is decoded anyway to keep the table in
+        sync, one larger than the table would empty it. Huffman codes are
+        at most 30 bits long.
+        """
+        limit = self.max_string_length
+        if limit is None:
+            return False
+
+        shortest = length * 8 // 30 if huffman else length
+        return shortest > limit and (not indexing or shortest > self.index_table.max_size)
+
+    def _get(self, idx):
+        if 0 < idx <= IndexTable.STATIC_LENGTH:
+            return _static_table_bytes[idx - 1]
+
+        try:
+            return self.index_table.get(idx)
+        except IndexError:
+            raise CompressionError('Invalid header index {}'.format(idx))
+
+
+class CompressionContext(object):
+    """
+    HPACK state of a connection.
+
+    Both directions have their own dynamic table: encoder compresses the
+    header blocks we send, decoder decompresses the ones received. The same
+    context must be used for all streams of the connection and blocks must
+    be encoded in the order they are written to the wire, so repeated
+    fields (host, user-agent, tokens) are sent as table references after
+    their first occurrence.
+
+    :param encoder_table_size:
+        initial dynamic table size of the encoder.
+    :param decoder_table_size:
+        SETTINGS_HEADER_TABLE_SIZE advertised to the peer.
+    """
+    def __init__(self, encoder_table_size=DEFAULT_TABLE_SIZE,
+                 decoder_table_size=DEFAULT_TABLE_SIZE, huffman=None):
+        self.encoder = Encoder(encoder_table_size, huffman=huffman)
+        self.decoder = Decoder(decoder_table_size)
+
+    def encode(self, headers):
+        return self.encoder.encode_headers(headers)
 
     def decode(self, header_block):
-        pass
\ No newline at end of file
+        return self.decoder.decode(header_block)
@@ -0,0 +1,172 @@
+import asyncio
+from urllib.parse import urlsplit
+
+from .connection import connect
+from .errors import ConnectionClosedError
+
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+
+def split_url(url):
+    """
+    Splits url into an origin (scheme, host, port) tuple and a request path.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS:
+        raise ValueError('Unsupported URL scheme: {!r}'.format(parts.scheme))
+
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+
+    return (scheme, parts.hostname, parts.port or DEFAULT_PORTS[scheme]), path
+
+
+class ConnectionPool(object):
+    """
+    Client connections grouped by origin.
+
+    A request goes to the oldest connection of its origin which has a free
+    stream (below the peer SETTINGS_MAX_CONCURRENT_STREAMS), a new connection
+    is opened only when all of them are saturated. Connections which received
+    GOAWAY are no longer used and close once drained, idle ones are kept
+    open for idle_timeout seconds.
+
+    :param max_connections:
+        maximum number of connections per origin. When reached, requests
+        wait for a stream on the least loaded connection.
+    :param idle_timeout:
+        seconds an idle connection is kept open.
+    :param ssl:
+        SSLContext for https origins, by default one with h2 ALPN is created.
+    :param connect:
+        coroutine function opening a connection, called with host, port,
+        ssl and local_settings.
+    """
+    def __init__(self, max_connections=8, idle_timeout=60.0, ssl=None, local_settings=None,
+                 connect=connect):
+        self.max_connections = max_connections
+        self.idle_timeout = idle_timeout
+        self.ssl = ssl
+        self.local_settings = local_settings
+
+        self._connect = connect
+        self._connections = {}
+        self._connecting = {}
+        self._idle_handles = {}
+
+    def connections(self, origin):
+        """
+        Returns the connections of origin used for new requests.
+        """
+        connections = self._connections.get(origin, [])
+        connections[:] = [c for c in connections if self._usable(c)]
+        return list(connections)
+
+    async def request(self, method, url, headers=(), body=None, retries=1):
+        """
+        Sends a request on a pooled connection. Requests refused by the server
+        without processing (GOAWAY, REFUSED_STREAM) are retried on another
+        connection up to retries times.
+        """
+        origin, path = split_url(url)
+
+        while True:
+            connection = await self.acquire(origin)
+            try:
+                return await connection.request(method, path, headers=headers, body=body)
+            except ConnectionClosedError as e:
+                if not e.retryable or retries <= 0:
+                    raise
+
+                retries -= 1
+
+    async def acquire(self, origin):
+        """
+        Returns a connection to origin (scheme, host, port) to send a request on.
+        """
+        while True:
+            connections = self.connections(origin)
+            for connection in connections:
+                if connection.available_streams:
+                    self._cancel_idle(connection)
+                    return connection
+
+            pending = self._connecting.get(origin)
+            if pending is not None:
+                await asyncio.shield(pending)
+                continue
+
+            if connections and len(connections) >= self.max_connections:
+                connection = min(connections, key=lambda c: c.active_streams)
+                self._cancel_idle(connection)
+                return connection
+
+            await self._open(origin)
+
+    async def close(self):
+        for handle in self._idle_handles.values():
+            handle.cancel()
+        self._idle_handles.clear()
+
+        connections = [c for group in self._connections.values() for c in group]
+        self._connections.clear()
+
+        for connection in connections:
+            connection.close()
+        for connection in connections:
+            await connection.wait_closed()
+
+    async def _open(self, origin):
+        loop = asyncio.get_running_loop()
+        pending = self._connecting[origin] = loop.create_future()
+
+        scheme, host, port = origin
+        ssl = None
+        if scheme == 'https':
+            ssl = self.ssl if self.ssl is not None else True
+
+        try:
+            connection = await self._connect(host, port, ssl=ssl, local_settings=self.local_settings)
+        except BaseException as e:
+            pending.set_exception(e)
+            pending.exception()
+            raise
+        finally:
+            del self._connecting[origin]
+
+        connection.on_idle = lambda c: self._connection_idle(origin, c)
+        self._connections.setdefault(origin, []).append(connection)
+        pending.set_result(connection)
+
+        return connection
+
+    def _usable(self, connection):
+        return not connection.closed and connection.goaway_received is None and not connection.goaway_sent
+
+    def _connection_idle(self, origin, connection):
+        self._cancel_idle(connection)
+        if not self._usable(connection):
+            return
+
+        loop = asyncio.get_event_loop()
+        self._idle_handles[connection] = loop.call_later(
+            self.idle_timeout, self._close_idle, origin, connection)
+
+    def _cancel_idle(self, connection):
+        handle = self._idle_handles.pop(connection, None)
+        if handle is not None:
+            handle.cancel()
+
+    def _close_idle(self, origin, connection):
+        self._idle_handles.pop(connection, None)
+        if connection.streams:
+            return
+
+        connections = self._connections.get(origin, [])
+        if connection in connections:
+            connections.remove(connection)
+
+        connection.close()
@@ -0,0 +1,265 @@
+import heapq
+
+from .errors import ProtocolError
+
+
+DEFAULT_WEIGHT = 16
+MAX_WEIGHT = 256
+
+# Size of the first frame assumed for a newly scheduled stream, so streams
+# with data queued at the same time go in order of their weights.
+_QUANTUM = 16384
+
+
+class _Node(object):
+    __slots__ = (
+        'stream_id', 'parent', 'weight', 'children', 'active', 'cycle', 'last_cycle',
+        'queue', 'scheduled', 'scheduled_children', 'generation'
+    )
+
+    def __init__(self, stream_id, weight=DEFAULT_WEIGHT):
+        self.stream_id = stream_id
+        self.parent = None
+        self.weight = weight
+        # Ordered set of the child nodes.
+        self.children = {}
+
+        # The stream has data to send.
+        self.active = False
+
+        # Virtual time: cycle of the node in the queue of its parent,
+        # last_cycle is the cycle of the child picked last.
+        self.cycle = 0
+        self.last_cycle = 0
+
+        # Heap of (cycle, sequence, generation, child) of the children which
+        # have something to send. Entries of unscheduled or rescheduled
+        # children (older generation) are dropped lazily.
+        self.queue = []
+        self.scheduled = False
+        self.scheduled_children = 0
+        self.generation = 0
+
+    def __repr__(self):
+        return '<_Node {} weight={}>'.format(self.stream_id, self.weight)
+
+
+class PriorityTree(object):
+    """
+    Stream dependency tree [RFC7540, section 5.3] deciding which stream
+    sends the next DATA frame.
+
+    A stream with data to send goes before its dependents, siblings share
+    the bandwidth in proportion to their weights (weighted fair queuing).
+    Every node keeps a heap of its children which have something to send
+    below them, ordered by a virtual finish time advanced by octets sent
+    divided by the weight, so next() and sent() cost O(log n) per level of
+    the tree.
+    """
+    def __init__(self):
+        self._root = _Node(0)
+        self._nodes = {0: self._root}
+        self._sequence = 0
+
+    def __contains__(self, stream_id):
+        return stream_id != 0 and stream_id in self._nodes
+
+    def __len__(self):
+        return len(self._nodes) - 1
+
+    def insert(self, stream_id, depends_on=0, weight=DEFAULT_WEIGHT, exclusive=False):
+        """
+        Adds a stream to the tree.
+        """
+        if stream_id in self._nodes:
+            raise ValueError('Stream {} is already in the tree'.format(stream_id))
+        if depends_on == stream_id:
+            raise ProtocolError('Stream {} depends on itself'.format(stream_id))
+        self._check_weight(weight)
+
+        parent = self._nodes.get(depends_on)
+        if parent is None:
+            # Dependency on a stream which is not in the tree gives the
+            # default priority [RFC7540, section 5.3.1].
+            parent, weight, exclusive = self._root, DEFAULT_WEIGHT, False
+
+        node = self._nodes[stream_id] = _Node(stream_id, weight)
+        self._attach(node, parent, exclusive)
+
+    def reprioritize(self, stream_id, depends_on=0, weight=DEFAULT_WEIGHT, exclusive=False):
+        """
+        Moves a stream in the tree (PRIORITY frame), it is added if unknown.
+        """
+        if stream_id == 0:
+            raise ProtocolError('Stream 0 has no priority')
+
+        node = self._nodes.get(stream_id)
+        if node is None:
+            self.insert(stream_id, depends_on, weight, exclusive)
+            return
+
+        if depends_on == stream_id:
+            raise ProtocolError('Stream {} depends on itself'.format(stream_id))
+        self._check_weight(weight)
+
+        parent = self._nodes.get(depends_on)
+        if parent is None:
+            parent, weight, exclusive = self._root, DEFAULT_WEIGHT, False
+
+        # A stream made dependent on its own dependent: the latter is first
+        # moved to the former parent of the stream [RFC7540, section 5.3.3].
+        if self._is_descendant(parent, node):
+            former_parent = node.parent
+            self._detach(parent)
+            self._attach(parent, former_parent, False)
+
+        self._detach(node)
+        node.weight = weight
+        self._attach(node, parent, exclusive)
+
+    def remove(self, stream_id):
+        """
+        Removes a closed stream, its dependents move to its parent and share
+        its weight [RFC7540, section 5.3.4].
+        """
+        if stream_id == 0:
+            return
+
+        node = self._nodes.pop(stream_id, None)
+        if node is None:
+            return
+
+        parent = node.parent
+        self._detach(node)
+
+        children = list(node.children)
+        total = sum(child.weight for child in children)
+        for child in children:
+            self._detach(child)
+            child.weight = max(1, node.weight * child.weight // total)
+            self._attach(child, parent, False)
+
+    def activate(self, stream_id):
+        """
+        Marks the stream as having data to send.
+        """
+        node = self._nodes[stream_id]
+        node.active = True
+        self._schedule(node)
+
+    def deactivate(self, stream_id):
+        """
+        Marks the stream as having nothing to send (or being blocked).
+        """
+        node = self._nodes.get(stream_id)
+        if node is None or not node.active:
+            return
+
+        node.active = False
+        if not node.scheduled_children:
+            self._unschedule(node)
+
+    def next(self):
+        """
+        Returns id of the stream which sends next or None if no stream has
+        data to send.
+        """
+        node = self._root
+        while True:
+            node = self._top(node)
+            if node is None or node.active:
+                return node and node.stream_id
+
+    def sent(self, stream_id, size):
+        """
+        Accounts size octets sent by the stream returned by next().
+        """
+        node = self._nodes[stream_id]
+        while node is not self._root:
+            parent = node.parent
+            parent.last_cycle = node.cycle
+            node.cycle += max(size, 1) * MAX_WEIGHT / node.weight
+
+            if node.scheduled:
+                self._push(parent, node)
+
+            node = parent
+
+    def parent_of(self, stream_id):
+        return self._nodes[stream_id].parent.stream_id
+
+    def weight_of(self, stream_id):
+        return self._nodes[stream_id].weight
+
+    def children_of(self, stream_id):
+        return [child.stream_id for child in self._nodes[stream_id].children]
+
+    def _attach(self, node, parent, exclusive):
+        if exclusive:
+            for child in list(parent.children):
+                self._detach(child)
+                self._attach(child, node, False)
+
+        node.parent = parent
+        parent.children[node] = None
+
+        if node.active or node.scheduled_children:
+            self._schedule(node)
+
+    def _detach(self, node):
+        self._unschedule(node)
+        del node.parent.children[node]
+        node.parent = None
+
+    def _schedule(self, node):
+        while node is not self._root and not node.scheduled:
+            parent = node.parent
+            node.scheduled = True
+            node.cycle = parent.last_cycle + _QUANTUM * MAX_WEIGHT / node.weight
+            parent.scheduled_children += 1
+            self._push(parent, node)
+
+            node = parent
+
+    def _unschedule(self, node):
+        while node is not self._root and node.scheduled:
+            parent = node.parent
+            node.scheduled = False
+            parent.scheduled_children -= 1
+
+            if parent.scheduled_children:
+                break
+
+            parent.queue.clear()
+            if parent.active:
+                break
+
+            node = parent
+
+    def _push(self, parent, node):
+        node.generation += 1
+        self._sequence += 1
+        heapq.heappush(parent.queue, (node.cycle, self._sequence, node.generation, node))
+
+    def _top(self, node):
+        queue = node.queue
+        while queue:
+            _, _, generation, child = queue[0]
+            if child.scheduled and child.generation == generation and child.parent is node:
+                return child
+
+            heapq.heappop(queue)
+
+        return None
+
+    def _is_descendant(self, node, ancestor):
+        while node is not None:
+            if node is ancestor:
+                return True
+            node = node.parent
+
+        return False
+
+    def _check_weight(self, weight):
+        if not 1 <= weight <= MAX_WEIGHT:
+            raise ValueError('Weight must be in range 1..256')
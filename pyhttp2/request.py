@@ -0,0 +1,147 @@
+from .hpack import HeaderList
+from .errors import ProtocolError
+
+
+class Message(object):
+    """
+    Base of the messages received on a stream: headers are available right
+    away, the body is streamed. Iterate over the message to get body chunks
+    as they arrive or await read() for the whole body.
+
+    :param stream:
+        connection.Stream the message was received on.
+    :param headers:
+        decoded header block, hpack.HeaderList or list of (name, value)
+        tuples.
+    """
+    def __init__(self, stream, headers):
+        self.stream = stream
+        if not isinstance(headers, HeaderList):
+            headers = HeaderList(headers)
+
+        self._block = headers
+        # Regular fields share the block, values are decoded on access.
+        self.headers = headers.regular()
+
+    @property
+    def trailers(self):
+        return self.stream.trailers
+
+    def get(self, name, default=None):
+        """
+        Returns value of the first header named name, str or bytes in any
+        case.
+        """
+        return self.headers.get(name, default)
+
+    def get_str(self, name, default=None):
+        """
+        Returns value of the first header named name decoded as latin-1.
+        """
+        return self.headers.get_str(name, default)
+
+    async def read(self):
+        return b''.join([chunk async for chunk in self])
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        chunk = await self.stream.read_chunk()
+        if chunk is None:
+            raise StopAsyncIteration
+
+        return chunk
+
+
+class Response(Message):
+    """
+    Response received on a client stream.
+
+    :param stream:
+        connection.Stream the response was received on.
+    :param headers:
+        decoded response header block, hpack.HeaderList or list of
+        (name, value) tuples.
+
+    Raises errors.ProtocolError if :status is missing or isn't a 3-digit
+    code, the response is malformed [RFC7540, section 8.1.2.4].
+    """
+    def __init__(self, stream, headers):
+        super().__init__(stream, headers)
+        status = self._block.get(b':status')
+        if status is None or len(status) != 3 or not status.isdigit():
+            raise ProtocolError('Malformed response status {!r}'.format(status))
+
+        self.status = int(status)
+
+    def close(self):
+        """
+        Abandons the rest of the body, the stream is reset if not complete.
+        """
+        self.stream.cancel()
+
+    def __repr__(self):
+        return '<Response status={} stream_id={}>'.format(self.status, self.stream.stream_id)
+
+
+class Request(Message):
+    """
+    Request received on a server stream, answered with respond().
+
+    :param stream:
+        connection.Stream the request was received on.
+    :param headers:
+        decoded request header block, hpack.HeaderList or list of
+        (name, value) tuples.
+    :param pushed:
+        True for a request promised by the server with push().
+    """
+    def __init__(self, stream, headers, pushed=False):
+        super().__init__(stream, headers)
+        self.pushed = pushed
+        self.responded = False
+
+        block = self._block
+        self.method = block.get(b':method')
+        self.scheme = block.get(b':scheme')
+        self.authority = block.get(b':authority')
+        self.path = block.get(b':path')
+
+    async def respond(self, status, headers=(), body=None):
+        """
+        Sends the response and waits until its body is written.
+
+        :param headers:
+            sequence of (name, value) tuples, names must be lowercase.
+        :param body:
+            bytes-like object, file object, mmap, (async) iterable of bytes,
+            body.Body or None.
+        """
+        if self.responded:
+            raise RuntimeError('Response already sent')
+
+        self.responded = True
+        await self.stream.connection.respond(self.stream, status, headers, body)
+
+    def push(self, path, headers=(), method='GET'):
+        """
+        Pushes a resource associated with this request, see
+        server.ServerConnection.push(). Call it before respond() so that the
+        client learns about the promise before it could request the resource
+        itself.
+
+        :param headers:
+            request header fields of the promised request, (name, value)
+            tuples.
+        """
+        return self.stream.connection.push(self, path, headers, method)
+
+    def __repr__(self):
+        return '<Request {} {} stream_id={}>'.format(
+            _repr_field(self.method), _repr_field(self.path), self.stream.stream_id)
+
+
+def _repr_field(value):
+    # Pseudo-header fields are missing from malformed requests.
+    return '-' if value is None else value.decode('ascii', 'replace')
@@ -0,0 +1,639 @@
+import asyncio
+import base64
+import binascii
+import hashlib
+import os
+import signal
+import socket
+import sys
+import time
+import traceback
+
+from .frames import SettingsFrame, SettingsFrameView, RstStreamFrame, PushPromiseFrame
+from .connection import Connection, Stream, CONNECTION_PREFACE, DEFAULT_WINDOW_SIZE, _to_bytes
+from .hpack import HeaderList
+from .priority import DEFAULT_WEIGHT
+from .writer import FrameWriter
+from .request import Request
+from .errors import (
+    HTTP2Error, ProtocolError, NO_ERROR, PROTOCOL_ERROR, INTERNAL_ERROR, REFUSED_STREAM
+)
+
+
+DEFAULT_MAX_CONCURRENT_STREAMS = 100
+
+# Advertised SETTINGS_MAX_HEADER_LIST_SIZE, larger request header lists get
+# a 431 response.
+DEFAULT_MAX_HEADER_LIST_SIZE = 65536
+
+# Largest head of an HTTP/1.1 request upgrading to h2c.
+MAX_UPGRADE_HEAD_SIZE = 16384
+
+# Header fields of HTTP/1.1 which are not carried over to the HTTP/2 request
+# [RFC7540, section 8.1.2.2], Host becomes :authority.
+_HOP_BY_HOP = frozenset([
+    b'connection', b'upgrade', b'http2-settings', b'keep-alive', b'proxy-connection',
+    b'transfer-encoding', b'te', b'host',
+])
+
+_SWITCHING_PROTOCOLS = b'HTTP/1.1 101 Switching Protocols\r\nConnection: Upgrade\r\nUpgrade: h2c\r\n\r\n'
+
+# Seconds a prefork worker has to run before its exit counts as a crash
+# rather than a failure to start.
+_WORKER_STARTUP_TIME = 1.0
+
+
+# Methods of requests which may be pushed: safe and cacheable
+# [RFC7540, section 8.2].
+_PUSHABLE_METHODS = frozenset([b'GET', b'HEAD'])
+
+
+def _tokens(value):
+    return {token.strip().lower() for token in value.split(b',')}
+
+
+class PushDigest(object):
+    """
+    Digest of the resources pushed on a connection, so that none is pushed
+    twice. Like the cache digests of draft-ietf-httpbis-cache-digest, URLs
+    are kept as hashes truncated to bits bits: memory per entry stays small
+    and a false positive only costs a skipped push.
+    """
+    def __init__(self, bits=64):
+        if not 1 <= bits <= 256:
+            raise ValueError('Invalid digest size')
+
+        self.bits = bits
+        self._hashes = set()
+
+    def key(self, url):
+        digest = int.from_bytes(hashlib.sha256(url).digest(), 'big')
+        return digest >> (256 - self.bits)
+
+    def add(self, url):
+        """
+        Adds url (bytes), returns False if it was in the digest already.
+        """
+        key = self.key(url)
+        if key in self._hashes:
+            return False
+
+        self._hashes.add(key)
+        return True
+
+    def __contains__(self, url):
+        return self.key(url) in self._hashes
+
+    def __len__(self):
+        return len(self._hashes)
+
+
+class ServerConnection(Connection):
+    """
+    Server side of an HTTP/2 connection over cleartext (h2c).
+
+    The connection starts either with the client preface (prior knowledge)
+    or with an HTTP/1.1 request upgrading to h2c, which is answered on
+    stream 1 [RFC7540, section 3.2]. Every request stream is handed to the
+    handler in its own task, streams beyond SETTINGS_MAX_CONCURRENT_STREAMS
+    are refused.
+
+    Request header lists above SETTINGS_MAX_HEADER_LIST_SIZE (64 KiB by
+    default) are answered with 431 without calling the handler.
+
+    Handlers may push resources with Request.push() while the client allows
+    it (SETTINGS_ENABLE_PUSH), every resource at most once per connection.
+
+    :param handler:
+        coroutine function called with a request.Request, it answers with
+        Request.respond(). A request the handler didn't answer gets a 500
+        response, as does one the handler failed on. Promised requests are
+        handled the same way.
+    :param local_settings:
+        dict of settings (identifier: value) to advertise to the peer.
+    :param flow_control:
+        flow.FlowControl, by default batched updates with autotuning.
+    :param stats:
+        stats.ConnectionStats to count into, None disables counting.
+    """
+    first_stream_id = 2
+
+    def __init__(self, handler, local_settings=None, loop=None, flow_control=None, stats=None):
+        settings = {
+            SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS: DEFAULT_MAX_CONCURRENT_STREAMS,
+            SettingsFrame.SETTINGS_MAX_HEADER_LIST_SIZE: DEFAULT_MAX_HEADER_LIST_SIZE,
+        }
+        settings.update(local_settings or {})
+        super().__init__(local_settings=settings, loop=loop, flow_control=flow_control, stats=stats)
+
+        self.handler = handler
+
+        self._preface_received = False
+        self._upgraded = False
+        self._tasks = set()
+
+        self.push_digest = PushDigest()
+
+    async def respond(self, stream, status, headers=(), body=None):
+        """
+        Sends a response on a request stream, see Request.respond().
+        """
+        block = [(b':status', str(status).encode('ascii'))]
+        block.extend((_to_bytes(n), _to_bytes(v)) for n, v in headers)
+
+        await self._send_message(stream, block, body)
+
+    def push(self, request, path, headers=(), method=b'GET'):
+        """
+        Promises a resource with PUSH_PROMISE on the stream of request and
+        returns the promised request.Request, which is passed to the handler
+        as well [RFC7540, section 8.2]. Returns None if nothing is pushed:
+        the client disabled push, the resource was pushed on the connection
+        already, no stream is available or request can't carry promises.
+        """
+        method = _to_bytes(method)
+        if method not in _PUSHABLE_METHODS:
+            raise ValueError('Only GET and HEAD requests can be pushed')
+
+        stream = request.stream
+        # Promises go on open client-initiated streams only.
+        if (not self.remote_settings[SettingsFrame.SETTINGS_ENABLE_PUSH] or stream.local_closed or
+                stream.closed or stream.stream_id % 2 == self.first_stream_id % 2 or
+                not self.available_streams):
+            return None
+
+        path = _to_bytes(path)
+        scheme = request.scheme or b'http'
+        authority = request.authority or b''
+        if not self.push_digest.add(scheme + b'://' + authority + path):
+            return None
+
+        headers = [
+            (b':method', method),
+            (b':scheme', scheme),
+            (b':authority', authority),
+            (b':path', path),
+        ] + [(_to_bytes(n), _to_bytes(v)) for n, v in headers]
+
+        # The promised stream is reserved (local) and depends on the
+        # associated one [RFC7540, section 5.3.5].
+        promised = Stream(self, self._next_stream_id)
+        self._next_stream_id += 2
+        self._active_streams += 1
+        self.streams[promised.stream_id] = promised
+        self.priority.insert(promised.stream_id, stream.stream_id, DEFAULT_WEIGHT)
+
+        if self.stats is not None:
+            self.stats.streams_opened += 1
+
+        self.send_frame(PushPromiseFrame(
+            headers, promised.stream_id, encoder=self.encoder, end_headers=True,
+            max_frame_size=self.remote_settings[SettingsFrame.SETTINGS_MAX_FRAME_SIZE],
+            stream_id=stream.stream_id
+        ))
+
+        headers = HeaderList(headers)
+        promised._receive_headers(headers, end_stream=True)
+
+        pushed = Request(promised, headers, pushed=True)
+        self._start_handler(pushed)
+
+        return pushed
+
+    def shutdown(self):
+        """
+        Starts a graceful shutdown: GOAWAY tells the client that no new
+        streams are accepted, the connection closes once the open ones are
+        done.
+        """
+        if self.transport is None or self.transport.is_closing():
+            return
+
+        if not self._preface_received:
+            self._close_transport()
+            return
+        if not self.streams:
+            self.close()
+            return
+
+        self._send_goaway(NO_ERROR)
+        self.on_idle = lambda connection: connection.close()
+
+    # Protocol interface.
+
+    def connection_made(self, transport):
+        # The server preface is sent once the client preface is received.
+        self.transport = transport
+        self.writer = FrameWriter(transport, self.loop)
+
+    def buffer_updated(self, nbytes):
+        self.reader.buffer_updated(nbytes)
+        if self.transport.is_closing():
+            return
+
+        if not self._preface_received:
+            try:
+                if not self._receive_preface():
+                    return
+            except HTTP2Error as e:
+                self._send_goaway(e.error_code, str(e).encode('utf-8', 'replace'))
+                self._close_transport()
+                return
+
+        self._receive_frames()
+
+    def connection_lost(self, exc):
+        super().connection_lost(exc)
+
+        for task in self._tasks:
+            task.cancel()
+
+    # Preface.
+
+    def _receive_preface(self):
+        """
+        Consumes the client preface, or an HTTP/1.1 upgrade request followed
+        by it. Returns True once the frames start.
+        """
+        while not self._preface_received:
+            data = self.reader.pending()
+            n = min(len(data), len(CONNECTION_PREFACE))
+            if data[:n] == CONNECTION_PREFACE[:n]:
+                if n < len(CONNECTION_PREFACE):
+                    return False
+
+                self.reader.skip(n)
+                self._preface_received = True
+                if not self._upgraded:
+                    self._send_preface()
+                return True
+
+            if self._upgraded:
+                raise ProtocolError('Invalid connection preface')
+            if not self._receive_upgrade(data):
+                return False
+
+        return True
+
+    def _receive_upgrade(self, data):
+        """
+        Switches to HTTP/2 on an HTTP/1.1 request with "Upgrade: h2c"
+        [RFC7540, section 3.2]. Returns False if more bytes are needed or
+        the request was rejected.
+        """
+        end = bytes(data[:MAX_UPGRADE_HEAD_SIZE]).find(b'\r\n\r\n')
+        if end < 0:
+            if len(data) >= MAX_UPGRADE_HEAD_SIZE:
+                self._reject(431, 'Request Header Fields Too Large')
+            return False
+
+        lines = bytes(data[:end]).split(b'\r\n')
+        request_line = lines[0].split(b' ')
+        if len(request_line) != 3 or not request_line[2].startswith(b'HTTP/1.'):
+            self._reject(400, 'Bad Request')
+            return False
+
+        method, target, version = request_line
+        fields = []
+        for line in lines[1:]:
+            name, sep, value = line.partition(b':')
+            if not sep or not name or name != name.strip():
+                self._reject(400, 'Bad Request')
+                return False
+            fields.append((name.lower(), value.strip()))
+
+        values = {}
+        for name, value in fields:
+            values.setdefault(name, []).append(value)
+
+        connection = _tokens(b','.join(values.get(b'connection', [])))
+        settings = values.get(b'http2-settings', [])
+        if (version != b'HTTP/1.1' or b'h2c' not in _tokens(b','.join(values.get(b'upgrade', []))) or
+                len(settings) != 1 or not {b'upgrade', b'http2-settings'} <= connection):
+            self._reject(426, 'Upgrade Required', b'Upgrade: h2c\r\n', connection=b'Upgrade, close')
+            return False
+
+        if b'transfer-encoding' in values:
+            self._reject(411, 'Length Required')
+            return False
+
+        try:
+            length = int(values.get(b'content-length', [b'0'])[0])
+            # Padding of the base64url value is optional.
+            payload = base64.urlsafe_b64decode(settings[0] + b'=' * (-len(settings[0]) % 4))
+            remote_settings = SettingsFrameView(0x4, 0, 0, memoryview(payload)).settings
+        except (ValueError, binascii.Error, HTTP2Error):
+            self._reject(400, 'Bad Request')
+            return False
+
+        # The body counts against the initial connection window.
+        if not 0 <= length <= DEFAULT_WINDOW_SIZE:
+            self._reject(413, 'Content Too Large')
+            return False
+
+        if len(data) < end + 4 + length:
+            return False
+
+        body = bytes(data[end + 4:end + 4 + length])
+        self.reader.skip(end + 4 + length)
+
+        self.transport.write(_SWITCHING_PROTOCOLS)
+        self._upgraded = True
+        self._send_preface()
+
+        for identifier, value in remote_settings:
+            self._apply_remote_setting(identifier, value)
+
+        headers = [
+            (b':method', method),
+            (b':scheme', b'http'),
+            (b':authority', values.get(b'host', [b''])[0]),
+            (b':path', target),
+        ]
+        headers.extend((name, value) for name, value in fields if name not in _HOP_BY_HOP)
+
+        # The request is complete, stream 1 is half-closed (remote).
+        self.recv_window.receive(len(body))
+        stream = self._accept_stream(1, HeaderList(headers), end_stream=not body, priority=None)
+        if stream is not None and body:
+            stream._receive_data(memoryview(body), True)
+
+        return True
+
+    def _reject(self, status, reason, extra=b'', connection=b'close'):
+        self.transport.write(
+            'HTTP/1.1 {} {}\r\n'.format(status, reason).encode('ascii') + extra +
+            b'Connection: ' + connection + b'\r\nContent-Length: 0\r\n\r\n'
+        )
+        self.transport.close()
+
+    # Streams.
+
+    def _accept_stream(self, stream_id, headers, end_stream, priority):
+        # Requests need :method and :path, except CONNECT [RFC7540, section 8.1.2.3].
+        valid = b':method' in headers and b':path' in headers
+
+        stream = self._open_remote_stream(stream_id, priority, valid)
+        if stream is not None:
+            stream._receive_headers(headers, end_stream)
+            self._start_handler(Request(stream, headers))
+
+        return stream
+
+    def _on_header_list_too_large(self, stream_id, end_stream, priority, error):
+        if (stream_id in self.streams or not self._is_idle(stream_id) or
+                stream_id % 2 == self.first_stream_id % 2):
+            super()._on_header_list_too_large(stream_id, end_stream, priority, error)
+            return
+
+        stream = self._open_remote_stream(stream_id, priority)
+        if stream is not None:
+            stream._receive_headers([], end_stream)
+            self._start_handler(Request(stream, []), _header_fields_too_large)
+
+    def _open_remote_stream(self, stream_id, priority, valid=True):
+        """
+        Opens a stream initiated by the client, returns None if it was
+        refused or reset.
+        """
+        # Streams above the last one announced with GOAWAY are ignored.
+        if self.goaway_sent:
+            return None
+
+        self._last_remote_stream_id = stream_id
+
+        limit = self.local_settings[SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS]
+        if limit is not None and self._remote_streams >= limit:
+            self.send_frame(RstStreamFrame(REFUSED_STREAM, stream_id=stream_id))
+            return None
+
+        exclusive, depends_on, weight = priority or (False, 0, DEFAULT_WEIGHT)
+        if depends_on == stream_id or not valid:
+            self.send_frame(RstStreamFrame(PROTOCOL_ERROR, stream_id=stream_id))
+            return None
+
+        stream = Stream(self, stream_id)
+        self.streams[stream_id] = stream
+        self._remote_streams += 1
+        self.priority.insert(stream_id, depends_on, weight, exclusive)
+
+        if self.stats is not None:
+            self.stats.streams_opened += 1
+
+        return stream
+
+    def _start_handler(self, request, handler=None):
+        task = self.loop.create_task(self._handle(request, handler or self.handler))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _handle(self, request, handler):
+        stream = request.stream
+        try:
+            await handler(request)
+            if not request.responded and not stream.closed:
+                await request.respond(500)
+        except Exception as e:
+            if stream.error is not None and e is stream.error:
+                return
+
+            self.loop.call_exception_handler({
+                'message': 'Unhandled exception in request handler',
+                'exception': e,
+                'protocol': self,
+            })
+
+            if stream.closed:
+                return
+            if request.responded:
+                self.reset_stream(stream, INTERNAL_ERROR)
+                return
+
+            try:
+                await request.respond(500)
+            except HTTP2Error:
+                return
+
+        # The rest of the request body isn't needed [RFC7540, section 8.1].
+        if not stream.closed:
+            self.reset_stream(stream, NO_ERROR)
+
+
+async def _header_fields_too_large(request):
+    await request.respond(431)
+
+
+class Server(object):
+    """
+    Listening h2c server: a ServerConnection per accepted connection.
+
+    :param handler:
+        coroutine function called with every request.Request.
+    :param local_settings:
+        dict of settings advertised on every connection.
+    :param flow_control:
+        flow.FlowControl shared by the connections.
+    """
+    def __init__(self, handler, local_settings=None, flow_control=None):
+        self.handler = handler
+        self.local_settings = local_settings
+        self.flow_control = flow_control
+
+        self.connections = set()
+        self.server = None
+
+    async def start(self, host=None, port=8080, reuse_port=None, **kwargs):
+        """
+        Starts listening, other keyword arguments go to loop.create_server().
+
+        :param reuse_port:
+            bind with SO_REUSEPORT, so that several processes can listen on
+            the same port and the kernel balances connections between them.
+        """
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(
+            lambda: self._connection_factory(loop), host, port, reuse_port=reuse_port, **kwargs)
+
+    @property
+    def sockets(self):
+        return self.server.sockets if self.server is not None else ()
+
+    async def shutdown(self, timeout=None):
+        """
+        Stops listening and shuts the connections down gracefully, the ones
+        still open after timeout seconds are closed.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+
+        connections = list(self.connections)
+        for connection in connections:
+            connection.shutdown()
+
+        if connections:
+            _, pending = await asyncio.wait(
+                [asyncio.ensure_future(c.wait_closed()) for c in connections], timeout=timeout)
+            for future in pending:
+                future.cancel()
+
+        for connection in list(self.connections):
+            connection.close()
+
+    def _connection_factory(self, loop):
+        connection = ServerConnection(self.handler, local_settings=self.local_settings, loop=loop,
+                                      flow_control=self.flow_control)
+        self.connections.add(connection)
+        connection._closed.add_done_callback(lambda _: self.connections.discard(connection))
+
+        return connection
+
+
+async def serve(handler, host=None, port=8080, local_settings=None, flow_control=None,
+                reuse_port=None, **kwargs):
+    """
+    Starts an h2c Server and returns it.
+    """
+    server = Server(handler, local_settings=local_settings, flow_control=flow_control)
+    await server.start(host, port, reuse_port=reuse_port, **kwargs)
+
+    return server
+
+
+def run_prefork(handler, host=None, port=8080, workers=None, shutdown_timeout=30.0, **kwargs):
+    """
+    Serves h2c from several worker processes listening on the same port with
+    SO_REUSEPORT. Every worker runs its own event loop and connections (with
+    their HPACK contexts), nothing is shared between them.
+
+    The call blocks until SIGTERM or SIGINT, which shut the workers down
+    gracefully. A crashed worker is replaced; if one fails right after it
+    started (e.g. the port can't be bound) all are stopped and RuntimeError
+    is raised. Other keyword arguments go to Server.
+
+    :param workers:
+        number of worker processes, by default the number of CPUs.
+    :param shutdown_timeout:
+        seconds the workers wait for open streams on shutdown.
+    """
+    if not hasattr(socket, 'SO_REUSEPORT') or not hasattr(os, 'fork'):
+        raise RuntimeError('Prefork workers need os.fork() and SO_REUSEPORT')
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('Invalid number of workers')
+
+    children = {}
+    stopping = False
+    failed = False
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            status = 0
+            try:
+                _run_worker(handler, host, port, shutdown_timeout, kwargs)
+            except BaseException:
+                traceback.print_exc()
+                status = 1
+            finally:
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os._exit(status)
+
+        children[pid] = time.monotonic()
+
+    def stop(signum=None, frame=None):
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    previous = {signum: signal.signal(signum, stop) for signum in (signal.SIGTERM, signal.SIGINT)}
+    try:
+        for _ in range(workers):
+            spawn()
+
+        while children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+
+            started = children.pop(pid, None)
+            if started is None or stopping:
+                continue
+
+            if os.waitstatus_to_exitcode(status) and time.monotonic() - started < _WORKER_STARTUP_TIME:
+                failed = True
+                stop()
+            else:
+                spawn()
+    finally:
+        for signum, handler_ in previous.items():
+            signal.signal(signum, handler_)
+
+    if failed:
+        raise RuntimeError('Worker process failed to start')
+
+
+def _run_worker(handler, host, port, shutdown_timeout, kwargs):
+    # The parent's signal handlers are replaced by the event loop ones.
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, signal.SIG_DFL)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        stopped = loop.create_future()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, lambda: stopped.done() or stopped.set_result(None))
+
+        server = await serve(handler, host, port, reuse_port=True, **kwargs)
+        await stopped
+        await server.shutdown(timeout=shutdown_timeout)
+
+    asyncio.run(main())
@@ -0,0 +1,195 @@
+import bisect
+
+
+# Upper bounds of the stream duration buckets in seconds.
+DEFAULT_DURATION_BOUNDS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+# Upper bounds of the header block size buckets in octets.
+DEFAULT_BLOCK_BOUNDS = (16, 32, 64, 128, 256, 512, 1024, 2048, 4096, 8192, 16384)
+
+FRAME_NAMES = {
+    0x0: 'DATA',
+    0x1: 'HEADERS',
+    0x2: 'PRIORITY',
+    0x3: 'RST_STREAM',
+    0x4: 'SETTINGS',
+    0x5: 'PUSH_PROMISE',
+    0x6: 'PING',
+    0x7: 'GOAWAY',
+    0x8: 'WINDOW_UPDATE',
+    0x9: 'CONTINUATION',
+}
+
+
+class Histogram(object):
+    """
+    Histogram with fixed buckets.
+
+    :param bounds:
+        ascending upper bounds of the buckets, values above the last one
+        go to an overflow bucket.
+    """
+    __slots__ = ('bounds', 'counts', 'count', 'sum')
+
+    def __init__(self, bounds):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        """
+        Returns the histogram as a dict: count, sum and buckets, a list of
+        (upper bound, count) pairs where None is the overflow bucket.
+        """
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'buckets': list(zip(self.bounds + (None,), self.counts)),
+        }
+
+
+class HpackStats(object):
+    """
+    Counters of an HPACK Encoder or Decoder.
+
+    Fields are counted as static or dynamic table hits (indexed
+    representation) or literals. String octets are counted by their coding
+    as sent or received; literals pre-encoded by a HeaderTemplate are
+    counted as fields only. Blocks are counted with their plain size (names
+    and values) and encoded size.
+    """
+    __slots__ = (
+        'blocks', 'fields', 'static_hits', 'dynamic_hits', 'literals', 'huffman_bytes', 'raw_bytes',
+        'plain_bytes', 'encoded_bytes', 'block_sizes'
+    )
+
+    def __init__(self, block_bounds=DEFAULT_BLOCK_BOUNDS):
+        self.blocks = 0
+        self.fields = 0
+        self.static_hits = 0
+        self.dynamic_hits = 0
+        self.literals = 0
+
+        # Octets of Huffman and raw string literals.
+        self.huffman_bytes = 0
+        self.raw_bytes = 0
+
+        self.plain_bytes = 0
+        self.encoded_bytes = 0
+
+        # Encoded sizes of the header blocks.
+        self.block_sizes = Histogram(block_bounds)
+
+    def block(self, plain, encoded):
+        self.blocks += 1
+        self.plain_bytes += plain
+        self.encoded_bytes += encoded
+        self.block_sizes.observe(encoded)
+
+    def string(self, huffman, size):
+        if huffman:
+            self.huffman_bytes += size
+        else:
+            self.raw_bytes += size
+
+    def snapshot(self, index_table=None):
+        """
+        Returns the counters as a dict, with the occupancy of index_table
+        if given.
+        """
+        result = {
+            'blocks': self.blocks,
+            'fields': self.fields,
+            'static_hits': self.static_hits,
+            'dynamic_hits': self.dynamic_hits,
+            'literals': self.literals,
+            'huffman_bytes': self.huffman_bytes,
+            'raw_bytes': self.raw_bytes,
+            'plain_bytes': self.plain_bytes,
+            'encoded_bytes': self.encoded_bytes,
+            'compression_ratio': self.encoded_bytes / self.plain_bytes if self.plain_bytes else 1.0,
+            'block_sizes': self.block_sizes.snapshot(),
+        }
+
+        if index_table is not None:
+            result['table'] = table_snapshot(index_table)
+
+        return result
+
+
+class ConnectionStats(object):
+    """
+    Counters of a Connection: frames and octets sent and received per frame
+    type, flow-control stalls, stream durations (from opening to closing)
+    and the HPACK counters of both directions.
+
+    Passing an instance to a Connection enables the counting, a connection
+    without one only checks for None on its hot paths.
+    """
+    def __init__(self, duration_bounds=DEFAULT_DURATION_BOUNDS, block_bounds=DEFAULT_BLOCK_BOUNDS):
+        # Indexed by frame type.
+        self.frames_sent = [0] * 256
+        self.bytes_sent = [0] * 256
+        self.frames_received = [0] * 256
+        self.bytes_received = [0] * 256
+
+        # Times DATA couldn't be sent because the connection or stream send
+        # window was exhausted.
+        self.connection_stalls = 0
+        self.stream_stalls = 0
+
+        self.streams_opened = 0
+        self.streams_closed = 0
+        self.stream_durations = Histogram(duration_bounds)
+
+        self.encoder = HpackStats(block_bounds)
+        self.decoder = HpackStats(block_bounds)
+
+    def frame_sent(self, frame_type, size):
+        self.frames_sent[frame_type] += 1
+        self.bytes_sent[frame_type] += size
+
+    def frame_received(self, frame_type, size):
+        self.frames_received[frame_type] += 1
+        self.bytes_received[frame_type] += size
+
+    def snapshot(self):
+        return {
+            'frames_sent': _by_frame_type(self.frames_sent),
+            'bytes_sent': _by_frame_type(self.bytes_sent),
+            'frames_received': _by_frame_type(self.frames_received),
+            'bytes_received': _by_frame_type(self.bytes_received),
+            'connection_stalls': self.connection_stalls,
+            'stream_stalls': self.stream_stalls,
+            'streams_opened': self.streams_opened,
+            'streams_closed': self.streams_closed,
+            'stream_durations': self.stream_durations.snapshot(),
+        }
+
+
+def table_snapshot(index_table):
+    """
+    Returns the occupancy of an hpack.IndexTable as a dict.
+    """
+    return {
+        'entries': len(index_table) - index_table.STATIC_LENGTH,
+        'size': index_table.size,
+        'max_size': index_table.max_size,
+        'insertions': index_table.insertions,
+        'evictions': index_table.evictions,
+    }
+
+
+def _by_frame_type(counts):
+    return {
+        FRAME_NAMES.get(frame_type, '0x{:02x}'.format(frame_type)): count
+        for frame_type, count in enumerate(counts) if count
+    }
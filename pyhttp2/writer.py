@@ -0,0 +1,90 @@
+DEFAULT_WRITE_THRESHOLD = 65536
+
+
+class FrameWriter(object):
+    """
+    Coalesces frames written to a transport.
+
+    Frames are buffered (as the buffers of Frame.to_buffers, payloads are
+    not copied) and handed to the transport in one writelines() call at the
+    end of the event loop iteration, or as soon as threshold octets are
+    buffered. Control frames written with control=True go out before the
+    other buffered frames; the caller decides what may jump the queue
+    (frames of a stream must not overtake its HEADERS, a SETTINGS ACK must
+    not overtake frames produced under the previous settings).
+
+    :param transport:
+        asyncio transport the frames are written to.
+    :param threshold:
+        number of buffered octets which triggers an immediate write.
+    """
+    def __init__(self, transport, loop, threshold=DEFAULT_WRITE_THRESHOLD):
+        self.transport = transport
+        self.loop = loop
+        self.threshold = threshold
+
+        # Number of writelines() calls, i.e. flushes which wrote something.
+        self.writes = 0
+
+        self._control = []
+        self._buffers = []
+        self._size = 0
+        self._handle = None
+
+    @property
+    def buffered(self):
+        """
+        Number of octets waiting to be written.
+        """
+        return self._size
+
+    def write(self, frame, control=False):
+        """
+        Buffers a frame, returns its size in octets.
+        """
+        buffers = frame.to_buffers()
+        if control:
+            self._control.extend(buffers)
+        else:
+            self._buffers.extend(buffers)
+
+        size = sum(map(len, buffers))
+        self._size += size
+        if self._size >= self.threshold:
+            self.flush()
+        elif self._handle is None:
+            self._handle = self.loop.call_soon(self.flush)
+
+        return size
+
+    def flush(self):
+        """
+        Writes the buffered frames now.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        if not self._size:
+            return
+
+        buffers = self._control + self._buffers if self._control else self._buffers
+        self._control = []
+        self._buffers = []
+        self._size = 0
+
+        if not self.transport.is_closing():
+            self.writes += 1
+            self.transport.writelines(buffers)
+
+    def close(self):
+        """
+        Drops the buffered frames, e.g. when the transport is lost.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+        self._control = []
+        self._buffers = []
+        self._size = 0
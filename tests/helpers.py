@@ -0,0 +1,138 @@
+import asyncio
+
+from pyhttp2.frames import FrameReader, HeadersFrame, SettingsFrame
+from pyhttp2.hpack import Encoder, Decoder
+from pyhttp2.connection import CONNECTION_PREFACE
+
+
+class FakeTransport(object):
+    """
+    Transport which stores written bytes.
+    """
+    def __init__(self, protocol):
+        self.protocol = protocol
+        self.data = bytearray()
+        self.writes = 0
+        self.closing = False
+
+    def write(self, data):
+        self.writes += 1
+        self.data += data
+
+    def writelines(self, buffers):
+        self.writes += 1
+        for b in buffers:
+            self.data += b
+
+    def is_closing(self):
+        return self.closing
+
+    def close(self):
+        if not self.closing:
+            self.closing = True
+            self.protocol.connection_lost(None)
+
+    def get_extra_info(self, name, default=None):
+        return default
+
+
+class Peer(object):
+    """
+    Other side of a connection: feeds frames to the protocol and parses the
+    frames it writes.
+    """
+    def __init__(self, protocol, expect_preface=True):
+        self.protocol = protocol
+        self.transport = FakeTransport(protocol)
+        self.reader = FrameReader(max_frame_size=2**24 - 1)
+        self.encoder = Encoder()
+        self.decoder = Decoder()
+        self.header_blocks = []
+        self.promises = []
+        self._fragments = None
+        self._promised = None
+        self._preface = expect_preface
+
+        protocol.connection_made(self.transport)
+
+    def feed(self, data):
+        data = memoryview(data)
+        while data:
+            buf = self.protocol.get_buffer(len(data))
+            n = min(len(buf), len(data))
+            buf[:n] = data[:n]
+            self.protocol.buffer_updated(n)
+            data = data[n:]
+
+    def send(self, *frames):
+        self.feed(b''.join(f.to_bytes() for f in frames))
+
+    def send_headers(self, stream_id, headers, end_stream=False):
+        self.send(HeadersFrame(headers, encoder=self.encoder, end_stream=end_stream,
+                               end_headers=True, stream_id=stream_id))
+
+    def send_settings(self, **kwargs):
+        self.send(SettingsFrame(**kwargs))
+
+    def received(self):
+        """
+        Returns frames written by the protocol since the last call, frames
+        buffered for the current loop iteration are flushed first. Header
+        blocks are decoded and appended to header_blocks as (stream_id,
+        headers) tuples, those of PUSH_PROMISE to promises as (stream_id,
+        promised_stream_id, headers) tuples.
+        """
+        self.protocol.flush()
+
+        data = bytes(self.transport.data)
+        self.transport.data.clear()
+
+        if self._preface:
+            assert data.startswith(CONNECTION_PREFACE)
+            data = data[len(CONNECTION_PREFACE):]
+            self._preface = False
+
+        self.reader.feed(data)
+        frames = list(self.reader.frames())
+        for frame in frames:
+            if frame.frame_type == 0x1:
+                self._fragments = bytearray(frame.header_block)
+                self._promised = None
+            elif frame.frame_type == 0x5:
+                self._fragments = bytearray(frame.header_block)
+                self._promised = frame.promised_stream_id
+            elif frame.frame_type == 0x9:
+                self._fragments += frame.header_block
+            else:
+                continue
+
+            if frame.end_headers:
+                headers = self.decoder.decode(self._fragments)
+                if self._promised is None:
+                    self.header_blocks.append((frame.stream_id, headers))
+                else:
+                    self.promises.append((frame.stream_id, self._promised, headers))
+
+        return frames
+
+    def received_http1(self):
+        """
+        Returns the HTTP/1.1 response head written before the frames (e.g.
+        101 Switching Protocols), without the final empty line.
+        """
+        data = bytes(self.transport.data)
+        end = data.index(b'\r\n\r\n')
+        del self.transport.data[:end + 4]
+
+        return data[:end]
+
+    def received_types(self):
+        return [f.frame_type for f in self.received()]
+
+
+async def settle(iterations=10):
+    """
+    Lets scheduled callbacks and tasks run.
+    """
+    for _ in range(iterations):
+        await asyncio.sleep(0)
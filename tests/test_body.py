@@ -0,0 +1,93 @@
+import io
+import mmap
+import os
+import tempfile
+import unittest
+
+from pyhttp2.body import BufferBody, MmapBody, FileBody, IteratorBody, make_body
+
+
+async def read_all(body, size):
+    chunks = []
+    while not body.at_eof():
+        chunk = await body.read(size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+
+    return chunks
+
+
+class TestBody(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.file = tempfile.TemporaryFile()
+        self.file.write(os.urandom(100000))
+        self.file.seek(0)
+        self.content = self.file.read()
+        self.file.seek(0)
+
+    async def asyncTearDown(self):
+        self.file.close()
+
+    async def test_buffer(self):
+        data = bytearray(b'x' * 1000)
+        body = make_body(data)
+        self.assertIsInstance(body, BufferBody)
+        self.assertEqual(body.length, 1000)
+
+        chunks = await read_all(body, 300)
+        self.assertEqual([len(c) for c in chunks], [300, 300, 300, 100])
+        self.assertTrue(all(c.obj is data for c in chunks))
+
+    async def test_mmap(self):
+        body = make_body(self.file)
+        self.assertIsInstance(body, MmapBody)
+
+        chunks = await read_all(body, 16384)
+        self.assertEqual(b''.join(chunks), self.content)
+        self.assertTrue(all(isinstance(c.obj, mmap.mmap) for c in chunks))
+
+        del chunks
+        body.close()
+        self.assertTrue(body._map.closed)
+
+    async def test_given_mmap_is_not_closed(self):
+        mm = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        body = make_body(mm)
+        self.assertEqual(len(await body.read(100)), 100)
+
+        body.close()
+        self.assertFalse(mm.closed)
+        mm.close()
+
+    async def test_unmappable_file(self):
+        body = make_body(io.BytesIO(self.content))
+        self.assertIsInstance(body, FileBody)
+        self.assertEqual(b''.join(await read_all(body, 40000)), self.content)
+
+    async def test_iterator(self):
+        async def produce():
+            yield b'a' * 10
+            yield b''
+            yield memoryview(b'b' * 25)
+
+        for source in (produce(), [b'a' * 10, b'', b'b' * 25]):
+            body = make_body(source)
+            self.assertIsInstance(body, IteratorBody)
+            chunks = await read_all(body, 8)
+            self.assertEqual([bytes(c) for c in chunks], [b'a' * 8, b'aa', b'b' * 8, b'b' * 8, b'b' * 8, b'b'])
+
+    async def test_iterator_reusing_buffer(self):
+        def produce():
+            buf = bytearray(10)
+            for c in b'ABC':
+                buf[:] = bytes([c]) * 10
+                yield buf
+
+        # Chunks are kept (as by the frame writer) while the next is read.
+        chunks = await read_all(make_body(produce()), 10)
+        self.assertEqual(b''.join(chunks), b'A' * 10 + b'B' * 10 + b'C' * 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,504 @@
+import asyncio
+import unittest
+
+from pyhttp2.frames import (
+    DataFrame, HeadersFrame, ContinuationFrame, PriorityFrame, SettingsFrame, RstStreamFrame, PingFrame,
+    GoAwayFrame, WindowUpdateFrame
+)
+from pyhttp2.connection import ClientConnection
+from pyhttp2.stats import ConnectionStats
+from pyhttp2.errors import (
+    ProtocolError, StreamResetError, ConnectionClosedError, HeaderListTooLargeError, CANCEL,
+    COMPRESSION_ERROR
+)
+
+from .helpers import Peer, settle
+
+
+class TestClientConnection(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.connection = ClientConnection('example.com', 'https')
+        self.peer = Peer(self.connection)
+        self.peer.send_settings()
+
+    async def respond(self, stream_id, status=b'200', body=None, headers=()):
+        self.peer.send_headers(stream_id, [(b':status', status)] + list(headers),
+                               end_stream=body is None)
+        if body is not None:
+            self.peer.send(DataFrame(body, end_stream=True, stream_id=stream_id))
+
+    async def test_preface(self):
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x4, 0x4])
+        self.assertIn((2, 0), frames[0].settings)
+        self.assertTrue(frames[1].ack)
+
+        await self.connection.wait_ready()
+
+    async def test_request(self):
+        self.peer.received()
+
+        task = asyncio.ensure_future(self.connection.request(
+            'GET', '/index.html', headers=[('user-agent', 'pyhttp2')]))
+        await asyncio.sleep(0)
+
+        self.peer.received()
+        self.assertEqual(self.peer.header_blocks, [(1, [
+            (b':method', b'GET'), (b':scheme', b'https'), (b':authority', b'example.com'),
+            (b':path', b'/index.html'), (b'user-agent', b'pyhttp2'),
+        ])])
+
+        await self.respond(1, body=b'hello', headers=[(b'content-type', b'text/plain')])
+
+        response = await task
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.get(b'content-type'), b'text/plain')
+        self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(self.connection.streams, {})
+
+    async def test_malformed_status(self):
+        self.peer.received()
+
+        for status in (b'2x0', b'20'):
+            task = asyncio.ensure_future(self.connection.request('GET', '/'))
+            await asyncio.sleep(0)
+            stream_id = max(self.connection.streams)
+            self.peer.received()
+
+            self.peer.send_headers(stream_id, [(b':status', status)])
+            with self.assertRaises(ProtocolError):
+                await task
+
+            frames = self.peer.received()
+            self.assertEqual([(f.frame_type, f.stream_id, f.error_code) for f in frames],
+                             [(0x3, stream_id, 0x1)])
+            self.assertFalse(self.connection.closed)
+
+    async def test_shared_compression_context(self):
+        headers = [('user-agent', 'pyhttp2'), ('accept-language', 'en-US,en;q=0.9')]
+        tasks = [asyncio.ensure_future(self.connection.request('GET', '/', headers=headers))
+                 for _ in range(3)]
+        await asyncio.sleep(0)
+
+        blocks = [f.header_block for f in self.peer.received() if f.frame_type == 0x1]
+        self.assertEqual(len(blocks), 3)
+        self.assertLess(len(blocks[1]) * 4, len(blocks[0]))
+        self.assertEqual(self.peer.header_blocks[1][1], self.peer.header_blocks[2][1])
+
+        for stream_id in (1, 3, 5):
+            await self.respond(stream_id)
+        await asyncio.gather(*tasks)
+
+    async def test_multiplexing(self):
+        tasks = [asyncio.ensure_future(self.connection.request('GET', '/{}'.format(i)))
+                 for i in range(100)]
+        await asyncio.sleep(0)
+
+        self.peer.received()
+        self.assertEqual([sid for sid, _ in self.peer.header_blocks], list(range(1, 201, 2)))
+        self.assertEqual(self.connection.active_streams, 100)
+
+        for stream_id in reversed(range(1, 201, 2)):
+            await self.respond(stream_id, body=str(stream_id).encode('ascii'))
+
+        responses = await asyncio.gather(*tasks)
+        bodies = [await r.read() for r in responses]
+        self.assertEqual(bodies, [str(i).encode('ascii') for i in range(1, 201, 2)])
+
+    async def test_write_coalescing(self):
+        self.peer.received()
+        writes = self.peer.transport.writes
+
+        tasks = [asyncio.ensure_future(self.connection.request('POST', '/', body=b'body'))
+                 for _ in range(20)]
+        await asyncio.sleep(0)
+        self.assertEqual(self.peer.transport.writes, writes)
+
+        # HEADERS and DATA of all the requests in one write.
+        await asyncio.sleep(0)
+        self.assertEqual(self.peer.transport.writes, writes + 1)
+        self.assertEqual(self.peer.received_types(), [0x1, 0x0] * 20)
+
+        for stream_id in range(1, 41, 2):
+            await self.respond(stream_id)
+        await asyncio.gather(*tasks)
+
+    async def test_streaming_body(self):
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+
+        self.peer.send_headers(1, [(b':status', b'200')])
+        response = await task
+
+        self.peer.send(DataFrame(b'a' * 1000, stream_id=1))
+        self.assertEqual(await response.__anext__(), b'a' * 1000)
+        self.assertNotIn(0x8, self.peer.received_types())
+
+        # Read data is credited back to the server in one update once half
+        # of the window is consumed.
+        for _ in range(2):
+            self.peer.send(DataFrame(b'b' * 16000, stream_id=1))
+            self.assertEqual(len(await response.__anext__()), 16000)
+
+        updates = [f for f in self.peer.received() if f.frame_type == 0x8]
+        self.assertEqual(sorted((f.stream_id, f.increment) for f in updates), [(0, 33000), (1, 33000)])
+
+        self.peer.send(DataFrame(b'b', end_stream=True, stream_id=1))
+        self.assertEqual(await response.read(), b'b')
+
+    async def test_window_autotuning(self):
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+        self.peer.send_headers(1, [(b':status', b'200')])
+        response = await task
+        self.peer.received()
+
+        # The first DATA starts a round trip measurement.
+        self.peer.send(DataFrame(b'x' * 16384, stream_id=1))
+        ping, = self.peer.received()
+        self.assertEqual(ping.frame_type, 0x6)
+
+        for _ in range(3):
+            self.peer.send(DataFrame(b'x' * 16000, stream_id=1))
+        self.peer.send(PingFrame(ping.opaque_data, ack=True))
+
+        # The window was filled during the round trip, both windows double.
+        updates = [f for f in self.peer.received() if f.frame_type == 0x8]
+        size = 2 * (16384 + 3 * 16000)
+        self.assertEqual(sorted((f.stream_id, f.increment) for f in updates),
+                         [(0, size - 65535), (1, size - 65535)])
+        self.assertEqual(self.connection.stream_window_size, size)
+
+        # New streams get the larger window right after their headers.
+        second = asyncio.ensure_future(self.connection.request('GET', '/2'))
+        await asyncio.sleep(0)
+        update = self.peer.received()[-1]
+        self.assertEqual((update.frame_type, update.stream_id, update.increment), (0x8, 3, size - 65535))
+
+        response.close()
+        second.cancel()
+
+    async def test_max_concurrent_streams(self):
+        self.connection.remote_settings[SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS] = 1
+
+        first = asyncio.ensure_future(self.connection.request('GET', '/1'))
+        second = asyncio.ensure_future(self.connection.request('GET', '/2'))
+        await asyncio.sleep(0)
+
+        self.peer.received()
+        self.assertEqual([sid for sid, _ in self.peer.header_blocks], [1])
+
+        await self.respond(1)
+        await first
+        await asyncio.sleep(0)
+
+        self.peer.received()
+        self.assertEqual([sid for sid, _ in self.peer.header_blocks], [1, 3])
+        await self.respond(3)
+        self.assertEqual((await second).status, 200)
+
+    async def test_request_body_flow_control(self):
+        self.connection.send_window = 10
+
+        task = asyncio.ensure_future(self.connection.request('POST', '/', body=b'x' * 25))
+        await asyncio.sleep(0)
+
+        data = [f for f in self.peer.received() if f.frame_type == 0x0]
+        self.assertEqual([len(f.data) for f in data], [10])
+
+        self.peer.send(WindowUpdateFrame(20, stream_id=0))
+        await asyncio.sleep(0)
+
+        data = [f for f in self.peer.received() if f.frame_type == 0x0]
+        self.assertEqual([len(f.data) for f in data], [15])
+        self.assertTrue(data[0].end_stream)
+
+        await self.respond(1)
+        await task
+
+    async def test_priority_scheduling(self):
+        self.connection.pause_writing()
+
+        bulk = asyncio.ensure_future(self.connection.request(
+            'POST', '/upload', body=b'b' * 40000, weight=1))
+        css = asyncio.ensure_future(self.connection.request(
+            'POST', '/style', body=b'c' * 20000, weight=256))
+        await asyncio.sleep(0)
+
+        headers = [f for f in self.peer.received() if f.frame_type == 0x1]
+        self.assertEqual([f.priority for f in headers], [(False, 0, 1), (False, 0, 256)])
+
+        # Queued while the transport is paused, the heavier stream goes
+        # first when writing resumes.
+        self.connection.resume_writing()
+        data = [(f.stream_id, len(f.data)) for f in self.peer.received() if f.frame_type == 0x0]
+        self.assertEqual(data[:2], [(3, 16384), (3, 3616)])
+        self.assertEqual(sum(n for sid, n in data if sid == 1), 40000)
+
+        for stream_id in (1, 3):
+            await self.respond(stream_id)
+        await asyncio.gather(bulk, css)
+
+    async def test_reprioritize(self):
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+        self.peer.received()
+
+        stream = self.connection.streams[1]
+        self.connection.reprioritize(stream, weight=64)
+        frame, = self.peer.received()
+        self.assertEqual((frame.frame_type, frame.stream_id, frame.priority), (0x2, 1, (False, 0, 64)))
+        self.assertEqual(self.connection.priority.weight_of(1), 64)
+
+        # Self-dependency is a stream error [RFC7540, section 5.3.1].
+        self.peer.send(PriorityFrame(1, stream_id=1))
+        with self.assertRaises(StreamResetError):
+            await task
+
+    async def test_settings_applied_on_ack(self):
+        # Acknowledges the preface settings.
+        self.peer.send(SettingsFrame(ack=True))
+        self.peer.received()
+        reader = self.connection.reader
+        decoder = self.connection.decoder
+
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+        stream = self.connection.streams[1]
+
+        self.connection.update_settings({
+            SettingsFrame.SETTINGS_MAX_FRAME_SIZE: 65536,
+            SettingsFrame.SETTINGS_HEADER_TABLE_SIZE: 1024,
+            SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE: 1000,
+        })
+        settings, = [f for f in self.peer.received() if f.frame_type == 0x4]
+        self.assertEqual(settings.settings, [(1, 1024), (4, 1000), (5, 65536)])
+
+        # Larger limits apply right away, smaller ones after the ACK.
+        self.assertEqual(reader.max_frame_size, 65536)
+        self.assertEqual(decoder.max_table_size, 4096)
+        self.assertEqual(stream.recv_window.available, 65535)
+
+        self.peer.send(SettingsFrame(ack=True))
+        self.assertEqual(decoder.max_table_size, 1024)
+        self.assertEqual(stream.recv_window.available, 1000)
+        self.assertEqual(self.connection.local_settings[SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE], 1000)
+
+        # The peer signals the smaller table in its next block.
+        self.peer.encoder.update_table_size(1024)
+        self.peer.send_headers(1, [(b':status', b'200')])
+        response = await task
+        self.peer.send(DataFrame(b'x' * 1001, stream_id=1))
+        with self.assertRaises(StreamResetError):
+            await response.read()
+
+    async def test_settings_ack_after_buffered_frames(self):
+        self.peer.received()
+
+        task = asyncio.ensure_future(self.connection.request('GET', '/', headers=[('x-a', '1')]))
+        await asyncio.sleep(0)
+        self.peer.send_settings(header_table_size=0)
+
+        # The block was encoded for the old table, it goes out before the
+        # ACK; the next one starts with the size update.
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x1, 0x4])
+        self.assertTrue(frames[1].ack)
+        self.peer.decoder.max_table_size = 0
+
+        second = asyncio.ensure_future(self.connection.request('GET', '/', headers=[('x-a', '1')]))
+        await asyncio.sleep(0)
+        self.peer.received()
+        self.assertEqual([headers[-1] for _, headers in self.peer.header_blocks],
+                         [(b'x-a', b'1'), (b'x-a', b'1')])
+
+        for stream_id in (1, 3):
+            await self.respond(stream_id)
+        await task
+        await second
+
+    async def test_response_header_list_too_large(self):
+        self.connection.update_settings({SettingsFrame.SETTINGS_MAX_HEADER_LIST_SIZE: 1000})
+        self.peer.received()
+
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+        self.peer.received()
+
+        self.peer.send_headers(1, [(b':status', b'200'), (b'set-cookie', b'x' * 2000)])
+        with self.assertRaises(HeaderListTooLargeError):
+            await task
+
+        frames = self.peer.received()
+        self.assertEqual([(f.frame_type, f.stream_id) for f in frames], [(0x3, 1)])
+        self.assertEqual(frames[0].error_code, CANCEL)
+        self.assertFalse(self.connection.closed)
+
+    async def test_header_block_size_limit(self):
+        self.connection.update_settings({SettingsFrame.SETTINGS_MAX_HEADER_LIST_SIZE: 1000})
+        self.peer.received()
+
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+        self.peer.received()
+
+        # Indexed :status fields, each one is dropped once the list is too
+        # large but the block keeps growing.
+        self.peer.send(HeadersFrame([(b':status', b'200')], encoder=self.peer.encoder, stream_id=1))
+        for _ in range(3):
+            self.peer.send(ContinuationFrame(b'\x88' * 1000, stream_id=1))
+        self.assertFalse(self.connection.closed)
+
+        self.peer.send(ContinuationFrame(b'\x88' * 1000, stream_id=1))
+        frames = self.peer.received()
+        self.assertEqual(frames[-1].frame_type, 0x7)
+        self.assertEqual(frames[-1].error_code, COMPRESSION_ERROR)
+        self.assertTrue(self.connection.closed)
+        with self.assertRaises(ConnectionClosedError):
+            await task
+
+    async def test_initial_window_size_overflow(self):
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+        self.peer.received()
+
+        self.peer.send(WindowUpdateFrame(2**31 - 1 - 65535, stream_id=1))
+        self.assertFalse(self.connection.closed)
+
+        self.peer.send_settings(initial_window_size=65536)
+        frames = self.peer.received()
+        self.assertEqual(frames[-1].frame_type, 0x7)
+        self.assertEqual(frames[-1].error_code, 0x3)
+        self.assertTrue(self.connection.closed)
+        with self.assertRaises(ConnectionClosedError):
+            await task
+
+    async def test_unexpected_settings_ack(self):
+        self.peer.received()
+        self.peer.send(SettingsFrame(ack=True), SettingsFrame(ack=True))
+        self.assertEqual(self.peer.received_types(), [0x7])
+        self.assertTrue(self.connection.closed)
+
+    async def test_continuation(self):
+        self.peer.received()
+        headers = [('x-large-{}'.format(i), 'v' * 100) for i in range(300)]
+
+        task = asyncio.ensure_future(self.connection.request('GET', '/', headers=headers))
+        await asyncio.sleep(0)
+
+        types = self.peer.received_types()
+        self.assertEqual(types[0], 0x1)
+        self.assertEqual(set(types[1:]), {0x9})
+        self.assertEqual(self.peer.header_blocks[0][1][4:],
+                         [(n.encode('ascii'), v.encode('ascii')) for n, v in headers])
+
+        await self.respond(1)
+        await task
+
+    async def test_streamed_request_body(self):
+        self.peer.received()
+        produced = []
+
+        def produce():
+            for i in range(10):
+                produced.append(i)
+                yield bytes([i]) * 20000
+
+        task = asyncio.ensure_future(self.connection.request('POST', '/', body=produce()))
+        await settle()
+
+        # Reading stops at the flow-control window.
+        data = [f for f in self.peer.received() if f.frame_type == 0x0]
+        self.assertEqual(sum(len(f.data) for f in data), 65535)
+        self.assertTrue(all(len(f.data) <= 16384 for f in data))
+        self.assertEqual(len(produced), 4)
+
+        self.peer.send(WindowUpdateFrame(200000, stream_id=0), WindowUpdateFrame(200000, stream_id=1))
+        await settle()
+
+        data += [f for f in self.peer.received() if f.frame_type == 0x0]
+        self.assertEqual(b''.join(bytes(f.data) for f in data),
+                         b''.join(bytes([i]) * 20000 for i in range(10)))
+        self.assertTrue(data[-1].end_stream)
+
+        await self.respond(1)
+        await task
+
+    async def test_stats(self):
+        connection = ClientConnection('example.com', stats=ConnectionStats())
+        peer = Peer(connection)
+        peer.send_settings()
+        connection.send_window = 10
+
+        task = asyncio.ensure_future(connection.request('POST', '/', body=b'x' * 25))
+        await asyncio.sleep(0)
+        peer.received()
+
+        peer.send(WindowUpdateFrame(100, stream_id=0))
+        await asyncio.sleep(0)
+        peer.received()
+
+        peer.send_headers(1, [(b':status', b'200')], end_stream=True)
+        await task
+
+        snapshot = connection.snapshot()
+        self.assertEqual(snapshot['frames_sent']['DATA'], 2)
+        self.assertEqual(snapshot['bytes_sent']['DATA'], 25 + 2 * 9)
+        self.assertEqual(snapshot['frames_sent']['SETTINGS'], 2)
+        self.assertEqual(snapshot['frames_received'], {'SETTINGS': 1, 'WINDOW_UPDATE': 1, 'HEADERS': 1})
+        self.assertEqual(snapshot['connection_stalls'], 1)
+        self.assertEqual(snapshot['streams_opened'], 1)
+        self.assertEqual(snapshot['stream_durations']['count'], 1)
+        self.assertEqual(snapshot['encoder']['blocks'], 1)
+        self.assertEqual(snapshot['decoder']['blocks'], 1)
+        self.assertEqual(snapshot['streams'], 0)
+
+    async def test_snapshot_without_stats(self):
+        snapshot = self.connection.snapshot()
+
+        self.assertEqual(snapshot['streams'], 0)
+        self.assertNotIn('frames_sent', snapshot)
+        self.assertIn('table', snapshot['encoder'])
+
+    async def test_reset(self):
+        task = asyncio.ensure_future(self.connection.request('GET', '/'))
+        await asyncio.sleep(0)
+
+        self.peer.send(RstStreamFrame(CANCEL, stream_id=1))
+        with self.assertRaises(StreamResetError) as cm:
+            await task
+        self.assertEqual(cm.exception.error_code, CANCEL)
+
+    async def test_goaway(self):
+        tasks = [asyncio.ensure_future(self.connection.request('GET', '/')) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        self.peer.send(GoAwayFrame(1))
+        with self.assertRaises(ConnectionClosedError) as cm:
+            await tasks[1]
+        self.assertTrue(cm.exception.retryable)
+        self.assertEqual(self.connection.available_streams, 0)
+
+        await self.respond(1, body=b'done')
+        self.assertEqual(await (await tasks[0]).read(), b'done')
+        self.assertTrue(self.connection.closed)
+
+    async def test_ping(self):
+        self.peer.received()
+        self.peer.send(PingFrame(b'12345678'))
+
+        ping, = self.peer.received()
+        self.assertTrue(ping.ack)
+        self.assertEqual(ping.opaque_data, b'12345678')
+
+    async def test_protocol_error(self):
+        self.peer.send(DataFrame(b'data', stream_id=0))
+
+        frames = self.peer.received()
+        self.assertEqual(frames[-1].frame_type, 0x7)
+        self.assertEqual(frames[-1].error_code, 0x1)
+        self.assertTrue(self.connection.closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+
+from pyhttp2.flow import ReceiveWindow, BdpEstimator, FlowControl
+from pyhttp2.errors import FlowControlError
+
+
+class TestReceiveWindow(unittest.TestCase):
+    def test_batched_updates(self):
+        window = ReceiveWindow(100, update_ratio=0.5)
+
+        window.receive(60)
+        self.assertEqual(window.available, 40)
+        self.assertEqual(window.consume(30), 0)
+        self.assertEqual(window.consume(20), 50)
+        self.assertEqual(window.available, 90)
+        self.assertEqual(window.pending, 0)
+
+        with self.assertRaises(FlowControlError):
+            window.receive(91)
+
+    def test_resize(self):
+        window = ReceiveWindow(100)
+        window.receive(100)
+        window.consume(20)
+
+        # Growing credits the consumed octets and the difference at once.
+        self.assertEqual(window.resize(200), 120)
+        self.assertEqual(window.available, 120)
+
+        # Shrinking holds back credit.
+        self.assertEqual(window.resize(100), 0)
+        self.assertEqual(window.consume(100), 0)
+        self.assertEqual(window.consume(50), 50)
+
+    def test_invalid_ratio(self):
+        with self.assertRaises(ValueError):
+            ReceiveWindow(100, update_ratio=0)
+
+
+class TestBdpEstimator(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.estimator = BdpEstimator(65535, max_window=1000000, clock=lambda: self.now)
+
+    def sample(self, size, rtt=0.1):
+        self.assertTrue(self.estimator.received(1000))
+        self.estimator.received(size - 1000)
+        self.now += rtt
+        return self.estimator.ping_acked()
+
+    def test_window_growth(self):
+        self.assertEqual(self.sample(60000), 120000)
+        self.assertEqual(self.sample(100000), 200000)
+        self.assertAlmostEqual(self.estimator.rtt, 0.1)
+
+        # A sample well below the window doesn't change it.
+        self.assertIsNone(self.sample(50000))
+        self.assertEqual(self.estimator.window, 200000)
+
+    def test_max_window(self):
+        self.assertEqual(self.sample(60000), 120000)
+        self.assertEqual(self.sample(120000), 240000)
+        self.assertEqual(self.sample(240000), 480000)
+        self.assertEqual(self.sample(480000), 960000)
+        self.assertEqual(self.sample(960000), 1000000)
+
+        # Sampling stops at the limit.
+        self.assertFalse(self.estimator.received(1000))
+        self.assertIsNone(self.estimator.ping_acked())
+
+    def test_one_sample_at_a_time(self):
+        self.assertTrue(self.estimator.received(1000))
+        self.assertFalse(self.estimator.received(1000))
+        self.assertTrue(self.estimator.sampling)
+
+    def test_autotune_disabled(self):
+        self.assertIsNone(FlowControl(autotune=False).estimator(65535))
+
+
+if __name__ == '__main__':
+    unittest.main()
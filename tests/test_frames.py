@@ -0,0 +1,254 @@
+import struct
+import unittest
+
+from pyhttp2.utils import int_to_bytes
+from pyhttp2.frames import (
+    DataFrame, HeadersFrame, PushPromiseFrame, PriorityFrame, SettingsFrame, ContinuationFrame, FrameReader, FrameView, DataFrameView, HeadersFrameView, SettingsFrameView,
+    GoAwayFrameView, WindowUpdateFrameView
+)
+from pyhttp2.hpack import Encoder, Decoder
+from pyhttp2.errors import ProtocolError, FrameSizeError
+
+
+def raw_frame(frame_type, flags, stream_id, payload):
+    return int_to_bytes(len(payload), 3) + struct.pack('>BBL', frame_type, flags, stream_id) + payload
+
+
+class TestFrameSerialization(unittest.TestCase):
+    def test_data_frame(self):
+        frame = DataFrame(b'hello', end_stream=True, stream_id=1)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x0, 0x1, 1, b'hello'))
+
+    def test_data_frame_buffers(self):
+        data = bytearray(b'x' * 100000)
+        frame = DataFrame(data, stream_id=3)
+
+        header, payload = frame.to_buffers()
+        self.assertIs(payload, data)
+        self.assertEqual(header, b'\x01\x86\xa0\x00\x00\x00\x00\x00\x03')
+
+    def test_data_frame_reuse(self):
+        frame = DataFrame(b'', padding=2, stream_id=1)
+
+        self.assertIs(frame.reuse(7, b'hello', end_stream=True), frame)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x0, 0x1, 7, b'hello'))
+
+        frame.reuse(9, b'bye')
+        self.assertEqual(frame.to_bytes(), raw_frame(0x0, 0x0, 9, b'bye'))
+
+    def test_frame_fields(self):
+        frame = DataFrame(b'', end_stream=True, stream_id=b'\x80\x00\x00\x05')
+
+        # The reserved bit is dropped.
+        self.assertEqual(frame.stream_id, 5)
+        self.assertEqual(frame.flags, 0x1)
+        self.assertEqual(frame.frame_type, 0x0)
+
+        with self.assertRaises(AttributeError):
+            frame.extra = None
+
+    def test_padded_data_frame_buffers(self):
+        data = memoryview(b'hello')
+        frame = DataFrame(data, padding=4, stream_id=1)
+
+        buffers = frame.to_buffers()
+        self.assertEqual(len(buffers), 4)
+        self.assertEqual(buffers[1], b'\x04')
+        self.assertIs(buffers[2], data)
+        self.assertEqual(buffers[3], b'\x00' * 4)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x0, 0x8, 1, b'\x04hello\x00\x00\x00\x00'))
+
+        reader = FrameReader()
+        for b in buffers:
+            reader.feed(b)
+        self.assertEqual(reader.next_frame().data, b'hello')
+
+    def test_headers_frame(self):
+        frame = HeadersFrame(':method: GET', stream_id=1, end_headers=True,
+                             stream_dep=3, weight=16, exclusive=True)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x1, 0x24, 1, b'\x80\x00\x00\x03\x0f\x82'))
+
+    def test_priority_frame(self):
+        frame = PriorityFrame(1, weight=256, exclusive=True, stream_id=3)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x2, 0, 3, b'\x80\x00\x00\x01\xff'))
+
+        reader = FrameReader()
+        reader.feed(frame.to_bytes())
+        self.assertEqual(reader.next_frame().priority, (True, 1, 256))
+
+        # Weight alone sets the priority fields of HEADERS.
+        frame = HeadersFrame(':method: GET', stream_id=1, end_headers=True, weight=32)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x1, 0x24, 1, b'\x00\x00\x00\x00\x1f\x82'))
+
+    def test_settings_frame(self):
+        self.assertEqual(SettingsFrame(header_table_size=100, enable_push=False).to_bytes(),
+            raw_frame(0x4, 0, 0, b'\x00\x01\x00\x00\x00\x64\x00\x02\x00\x00\x00\x00'))
+        self.assertEqual(SettingsFrame(ack=True).to_bytes(), raw_frame(0x4, 0x1, 0, b''))
+
+        frame = SettingsFrame(max_frame_size=32768, settings={3: 100}, initial_window_size=2**20,
+                              max_header_list_size=8192)
+        reader = FrameReader()
+        reader.feed(frame.to_bytes())
+        self.assertEqual(reader.next_frame().settings, [(3, 100), (4, 2**20), (5, 32768), (6, 8192)])
+
+        with self.assertRaises(ValueError):
+            SettingsFrame(ack=True, enable_push=False)
+
+    def test_continuation_frames(self):
+        headers = [('x-header-{}'.format(i).encode('ascii'), b'v' * 50) for i in range(20)]
+        frame = HeadersFrame(headers, encoder=Encoder(huffman=False), end_stream=True,
+                             end_headers=True, weight=16, max_frame_size=500, stream_id=5)
+
+        reader = FrameReader()
+        reader.feed(frame.to_bytes())
+        frames = list(reader.frames())
+
+        # 5 octets of the first frame are taken by the priority fields.
+        size = len(frame.header_block) + 5
+        self.assertEqual(size // 500, 2)
+        self.assertEqual([f.frame_type for f in frames], [0x1, 0x9, 0x9])
+        self.assertEqual([len(f) for f in frames], [500, 500, size - 1000])
+        self.assertTrue(frames[0].end_stream)
+        self.assertEqual([f.end_headers for f in frames], [False, False, True])
+        self.assertEqual({f.stream_id for f in frames}, {5})
+
+        block = b''.join(bytes(f.header_block) for f in frames)
+        self.assertEqual(Decoder().decode(block), headers)
+
+    def test_push_promise_frame(self):
+        frame = PushPromiseFrame(':method: GET', 2, end_headers=True, stream_id=1)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x5, 0x4, 1, b'\x00\x00\x00\x02\x82'))
+
+        frame = PushPromiseFrame(':method: GET', 4, padding=2, stream_id=3)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x5, 0x8, 3, b'\x02\x00\x00\x00\x04\x82\x00\x00'))
+
+    def test_push_promise_continuation(self):
+        headers = [('x-header-{}'.format(i).encode('ascii'), b'v' * 50) for i in range(10)]
+        frame = PushPromiseFrame(headers, 6, encoder=Encoder(huffman=False), end_headers=True,
+                                 max_frame_size=500, stream_id=5)
+
+        reader = FrameReader()
+        reader.feed(frame.to_bytes())
+        frames = list(reader.frames())
+
+        self.assertEqual([f.frame_type for f in frames], [0x5, 0x9])
+        self.assertEqual(len(frames[0]), 500)
+        self.assertEqual(frames[0].promised_stream_id, 6)
+        self.assertEqual([f.end_headers for f in frames], [False, True])
+
+        block = b''.join(bytes(f.header_block) for f in frames)
+        self.assertEqual(Decoder().decode(block), headers)
+
+    def test_continuation_frame(self):
+        frame = ContinuationFrame(b'\x82', end_headers=True, stream_id=1)
+        self.assertEqual(frame.to_bytes(), raw_frame(0x9, 0x4, 1, b'\x82'))
+
+
+class TestFrameReader(unittest.TestCase):
+    def setUp(self):
+        self.reader = FrameReader()
+
+    def test_read_frame(self):
+        self.assertIsNone(self.reader.next_frame())
+
+        self.reader.feed(raw_frame(0x0, 0x1, 3, b'hello'))
+        frame = self.reader.next_frame()
+        self.assertIsInstance(frame, DataFrameView)
+        self.assertEqual(frame.stream_id, 3)
+        self.assertEqual(frame.flags, 0x1)
+        self.assertTrue(frame.end_stream)
+        self.assertEqual(frame.data, b'hello')
+        self.assertIsInstance(frame.payload, memoryview)
+
+        self.assertIsNone(self.reader.next_frame())
+
+    def test_read_several_frames(self):
+        data = b''.join(raw_frame(0x0, 0, i, b'x' * i) for i in range(1, 20))
+        self.reader.feed(data)
+
+        frames = list(self.reader.frames())
+        self.assertEqual([f.stream_id for f in frames], list(range(1, 20)))
+        self.assertEqual([bytes(f.data) for f in frames], [b'x' * i for i in range(1, 20)])
+
+    def test_partial_frames(self):
+        data = raw_frame(0x0, 0, 1, b'a' * 100) + raw_frame(0x0, 0, 3, b'b' * 50)
+
+        for split in range(len(data) + 1):
+            reader = FrameReader(buffer_size=64)
+            reader.feed(data[:split])
+            frames = list(reader.frames())
+            reader.feed(data[split:])
+            frames.extend(reader.frames())
+
+            self.assertEqual([bytes(f.data) for f in frames], [b'a' * 100, b'b' * 50])
+
+    def test_payload_is_not_copied(self):
+        buf = self.reader.get_buffer()
+        data = raw_frame(0x0, 0, 1, b'payload')
+        buf[:len(data)] = data
+        self.reader.buffer_updated(len(data))
+
+        frame = self.reader.next_frame()
+        self.assertIs(frame.payload.obj, buf.obj)
+
+        # The payload survives the switch to a new buffer.
+        self.reader.feed(raw_frame(0x0, 0, 1, b'z' * 16000) * 5)
+        self.assertEqual(frame.data, b'payload')
+        self.assertEqual([len(f.data) for f in self.reader.frames()], [16000] * 5)
+
+    def test_max_frame_size(self):
+        self.reader.feed(raw_frame(0x0, 0, 1, b'a' * 16385))
+        with self.assertRaises(FrameSizeError):
+            self.reader.next_frame()
+
+        reader = FrameReader(max_frame_size=20000)
+        reader.feed(raw_frame(0x0, 0, 1, b'a' * 16385))
+        self.assertEqual(len(reader.next_frame()), 16385)
+
+    def test_padded_data(self):
+        self.reader.feed(raw_frame(0x0, 0x8, 1, b'\x03data\x00\x00\x00'))
+        self.assertEqual(self.reader.next_frame().data, b'data')
+
+        self.reader.feed(raw_frame(0x0, 0x8, 1, b'\x05data'))
+        with self.assertRaises(ProtocolError):
+            self.reader.next_frame().data
+
+    def test_headers(self):
+        self.reader.feed(raw_frame(0x1, 0x4 | 0x20, 5, b'\x80\x00\x00\x03\x0f\x82\x86'))
+        frame = self.reader.next_frame()
+        self.assertIsInstance(frame, HeadersFrameView)
+        self.assertTrue(frame.end_headers)
+        self.assertFalse(frame.end_stream)
+        self.assertEqual(frame.priority, (True, 3, 16))
+        self.assertEqual(frame.header_block, b'\x82\x86')
+
+    def test_control_frames(self):
+        self.reader.feed(raw_frame(0x4, 0, 0, b'\x00\x01\x00\x00\x10\x00\x00\x03\x00\x00\x00\x64'))
+        self.reader.feed(raw_frame(0x8, 0, 0, b'\x80\x01\x00\x00'))
+        self.reader.feed(raw_frame(0x7, 0, 0, b'\x00\x00\x00\x07\x00\x00\x00\x02debug'))
+        self.reader.feed(raw_frame(0xfa, 0, 0, b'unknown'))
+
+        settings, window_update, goaway, unknown = self.reader.frames()
+
+        self.assertIsInstance(settings, SettingsFrameView)
+        self.assertFalse(settings.ack)
+        self.assertEqual(settings.settings, [(1, 4096), (3, 100)])
+
+        self.assertIsInstance(window_update, WindowUpdateFrameView)
+        self.assertEqual(window_update.increment, 65536)
+
+        self.assertIsInstance(goaway, GoAwayFrameView)
+        self.assertEqual((goaway.last_stream_id, goaway.error_code), (7, 2))
+        self.assertEqual(goaway.debug_data, b'debug')
+
+        self.assertIs(type(unknown), FrameView)
+        self.assertEqual(unknown.frame_type, 0xfa)
+
+    def test_invalid_settings_length(self):
+        self.reader.feed(raw_frame(0x4, 0, 0, b'\x00\x01\x00'))
+        with self.assertRaises(FrameSizeError):
+            self.reader.next_frame().settings
+
+
+if __name__ == '__main__':
+    unittest.main()
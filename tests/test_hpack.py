@@ -1,10 +1,15 @@
+import os
 import unittest
 
+import extract_tables
+from benchmarks.suite import fixtures, load_fixture
 from pyhttp2.utils import byterepr_to_bytes, int_to_byte
 from pyhttp2.hpack import (
-    uint_encode, uint_decode, bytestr_encode, IndexTable, Encoder,
-    Decoder
+    uint_encode, uint_decode, uint_decode_from, bytestr_encode, huffman_encode, huffman_encoded_length,
+    huffman_decode, IndexTable, Encoder, Decoder, CompressionContext, IndexingPolicy,
+    AdaptiveIndexingPolicy, HeaderTemplate, HeaderList, WITHOUT_INDEXING
 )
+from pyhttp2.errors import CompressionError, HeaderListTooLargeError
 
 
 class TestEncodeDecodeSimpleTypes(unittest.TestCase):
@@ -27,6 +32,14 @@ class TestEncodeDecodeSimpleTypes(unittest.TestCase):
         self.assertEqual(uint_decode(uint_encode(1126)), 1126)
         self.assertEqual(uint_decode(uint_encode(26)), 26)
         self.assertEqual(uint_decode(uint_encode(2000, n=2), n=2), 2000)
+
+    def test_uint_decode_from(self):
+        data = b'\xff' + uint_encode(1337, n=5) + b'\xfe'
+        self.assertEqual(uint_decode_from(data, 1, n=5), (1337, 4))
+        self.assertEqual(uint_decode_from(data, 4, n=7), (126, 5))
+
+        with self.assertRaises(IndexError):
+            uint_decode_from(data[:3], 1, n=5)
         
     def test_bytestr_encode(self):
         self.assertEqual(bytestr_encode(b'Hello, World'), b'\x0cHello, World')
@@ -46,7 +59,75 @@ class TestEncodeDecodeSimpleTypes(unittest.TestCase):
             uint_encode(len(long_hello.encode('utf-8')), n=7) + long_hello.encode('utf-8'))
 
     def test_bytestr_huffman_encode(self):
-        pass
+        # [RFC7541, Appendix C.4.1]
+        self.assertEqual(huffman_encode(b'www.example.com'),
+            bytes.fromhex('f1e3c2e5f23a6ba0ab90f4ff'))
+        self.assertEqual(bytestr_encode(b'www.example.com', huffman=True),
+            bytes.fromhex('8cf1e3c2e5f23a6ba0ab90f4ff'))
+
+        # [RFC7541, Appendix C.6.1]
+        self.assertEqual(huffman_encode(b'Mon, 21 Oct 2013 20:13:21 GMT'),
+            bytes.fromhex('d07abe941054d444a8200595040b8166e082a62d1bff'))
+        self.assertEqual(huffman_encode(b''), b'')
+
+    def test_huffman_encoded_length(self):
+        for s in (b'', b'a', b'www.example.com', bytes(range(256)), b'\xff' * 77):
+            self.assertEqual(huffman_encoded_length(s), len(huffman_encode(s)))
+
+    def test_huffman_decode(self):
+        self.assertEqual(huffman_decode(bytes.fromhex('f1e3c2e5f23a6ba0ab90f4ff')),
+            b'www.example.com')
+        self.assertEqual(huffman_decode(b''), b'')
+
+        for s in (b'a', b'no-cache', bytes(range(256)), b'\xfe\xff' * 50):
+            self.assertEqual(huffman_decode(huffman_encode(s)), s)
+
+    def test_huffman_decode_invalid(self):
+        # Padding longer than 7 bits.
+        with self.assertRaises(CompressionError):
+            huffman_decode(b'\xff')
+        with self.assertRaises(CompressionError):
+            huffman_decode(huffman_encode(b'a') + b'\xff')
+
+        # Padding which is not a prefix of EOS: 'a' (00011) followed by 110.
+        with self.assertRaises(CompressionError):
+            huffman_decode(byterepr_to_bytes('00011110'))
+
+        # EOS in the string.
+        with self.assertRaises(CompressionError):
+            huffman_decode(b'\xff\xff\xff\xff')
+
+    def test_bytestr_huffman_if_shorter(self):
+        self.assertEqual(bytestr_encode(b'no-cache', huffman=None),
+            bytes.fromhex('86a8eb10649cbf'))
+        self.assertEqual(bytestr_encode(b'\x00\x01', huffman=None), b'\x02\x00\x01')
+
+
+class TestGeneratedTables(unittest.TestCase):
+    def test_tables_up_to_date(self):
+        path = os.path.join(os.path.dirname(extract_tables.__file__), 'pyhttp2', '_tables.py')
+        with open(path, 'r') as f:
+            self.assertEqual(f.read(), extract_tables.generate_module(),
+                             'pyhttp2/_tables.py is stale, run extract_tables.py')
+
+
+class TestCorpora(unittest.TestCase):
+    def test_benchmark_fixtures_roundtrip(self):
+        for name in fixtures():
+            blocks = load_fixture(name)
+            self.assertTrue(blocks, name)
+
+            context = CompressionContext()
+            for fields in blocks:
+                decoded = context.decode(context.encode(fields))
+
+                # Cookies are sent as crumbs [RFC7540, section 8.1.2.5].
+                cookies = [v for n, v in decoded if n == b'cookie']
+                decoded = [(n, v) for n, v in decoded if n != b'cookie']
+                if cookies:
+                    decoded.append((b'cookie', b'; '.join(cookies)))
+
+                self.assertEqual(sorted(decoded), sorted(fields))
 
 
 class TestIndexTable(unittest.TestCase):
@@ -102,18 +183,574 @@ class TestIndexTable(unittest.TestCase):
         self.assertEqual(self.modif_table.find('somefield', 'somevalue'), IndexTable.STATIC_LENGTH + 1)
         self.assertEqual(self.modif_table.find('myfield', 'myvalue'), IndexTable.STATIC_LENGTH + 3)
 
+    def test_find_bytes(self):
+        self.assertEqual(self.table.find(b':scheme'), 6)
+        self.assertEqual(self.table.find(b':method', b'POST'), 3)
+
+    def test_size(self):
+        self.assertEqual(self.table.size, 0)
+        self.assertEqual(self.modif_table.size, 3 * 32 + 14 + 16 + 18)
+
+    def test_eviction(self):
+        tbl = IndexTable(max_size=100)
+        tbl.add('f1', 'v1')
+        tbl.add('f2', 'v2')
+        self.assertEqual(tbl.size, 72)
+
+        tbl.add('f3', 'v3')
+        self.assertEqual(len(tbl), IndexTable.STATIC_LENGTH + 2)
+        self.assertEqual(tbl.size, 72)
+        self.assertIsNone(tbl.find('f1'))
+        self.assertEqual(tbl.find('f2', 'v2'), IndexTable.STATIC_LENGTH + 2)
+        self.assertEqual(tbl[IndexTable.STATIC_LENGTH + 1], ('f3', 'v3'))
+
+        with self.assertRaises(IndexError):
+            tbl.get(IndexTable.STATIC_LENGTH + 3)
+
+        self.assertFalse(tbl.add('f4', 'v' * 100))
+        self.assertEqual(len(tbl), IndexTable.STATIC_LENGTH)
+        self.assertEqual(tbl.size, 0)
+
+    def test_eviction_keeps_newer_duplicate(self):
+        tbl = IndexTable(max_size=72)
+        tbl.add('f1', 'v1')
+        tbl.add('f1', 'v1')
+        tbl.add('f2', 'v2')
+        self.assertEqual(tbl.find('f1', 'v1'), IndexTable.STATIC_LENGTH + 2)
+        self.assertEqual(tbl.find('f1'), IndexTable.STATIC_LENGTH + 2)
+
+    def test_resize(self):
+        for i in range(10):
+            self.table.add('field{}'.format(i), 'value')
+
+        self.table.resize(100)
+        self.assertEqual(len(self.table), IndexTable.STATIC_LENGTH + 2)
+        self.assertEqual(self.table[IndexTable.STATIC_LENGTH + 1], ('field9', 'value'))
+        self.assertEqual(self.table[IndexTable.STATIC_LENGTH + 2], ('field8', 'value'))
+
+        self.table.resize(1000)
+        for i in range(10, 20):
+            self.table.add('field{}'.format(i), 'value')
+        self.assertEqual(self.table.find('field19'), IndexTable.STATIC_LENGTH + 1)
+        self.assertEqual(self.table.find('field10', 'value'), IndexTable.STATIC_LENGTH + 10)
+        self.assertEqual(self.table.find('field8'), IndexTable.STATIC_LENGTH + 12)
+
+        self.table.resize(0)
+        self.assertEqual(len(self.table), IndexTable.STATIC_LENGTH)
+
 
 class TestEncoder(unittest.TestCase):
     def test_encoder(self):
-        encoder = Encoder()
+        encoder = Encoder(huffman=False)
 
         self.assertEqual(encoder.encode_headers('custom-key: custom-header'),
             b'\x40\x0acustom-key\x0dcustom-header')
-        
+
+    def test_encoder_huffman(self):
+        encoder = Encoder()
+
+        # [RFC7541, Appendix C.4.3]
+        self.assertEqual(encoder.encode_headers('custom-key: custom-value'),
+            bytes.fromhex('4088 25a849e95ba97d7f 8925a849e95bb8e8b4bf'.replace(' ', '')))
+
+    def test_table_size_update(self):
+        encoder = Encoder()
+        encoder.update_table_size(0)
+        encoder.update_table_size(1024)
+
+        # 0 and 1024 (001 11111 + 11100001 00000111) prefixed to the block.
+        self.assertEqual(encoder.encode_headers(':method: GET')[:4], b'\x20\x3f\xe1\x07')
+        self.assertEqual(encoder.encode_headers(':method: GET')[:1], b'\x82')
+        self.assertEqual(encoder.index_table.max_size, 1024)
+
+    def test_text_headers(self):
+        text = ':method: GET\r\n:path: /a:b\r\n\r\nhost: example.com:8080\r\n'
+        fields = [(b':method', b'GET'), (b':path', b'/a:b'), (b'host', b'example.com:8080')]
+
+        self.assertEqual(Decoder().decode(Encoder().encode_headers(text)), fields)
+        self.assertEqual(Encoder().encode_headers(text), Encoder().encode_fields(fields))
+
+        with self.assertRaises(ValueError):
+            Encoder().encode_headers('no separator')
+
+    def test_encode_batch(self):
+        header_lists = [
+            [(b':method', b'GET'), (b':path', '/{}'.format(i).encode('ascii')),
+             (b'user-agent', b'pyhttp2')]
+            for i in range(5)
+        ]
+
+        encoder = Encoder()
+        buffer = bytearray()
+        blocks = encoder.encode_batch(header_lists, buffer=buffer)
+
+        self.assertEqual(len(blocks), 5)
+        self.assertTrue(all(b.obj is buffer for b in blocks))
+        self.assertEqual(sum(len(b) for b in blocks), len(buffer))
+        self.assertEqual(encoder.encoded_bytes, len(buffer))
+
+        decoder = Decoder()
+        self.assertEqual([decoder.decode(b) for b in blocks], header_lists)
+
+
+class TestIndexingPolicy(unittest.TestCase):
+    def test_sensitive_fields(self):
+        encoder = Encoder(huffman=False)
+        block = encoder.encode_headers([(b'authorization', b'secret')])
+
+        # Never indexed literal with static name 23 (0001 1111 + 8).
+        self.assertEqual(block, b'\x1f\x08\x06secret')
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH)
+
+    def test_high_churn_fields(self):
+        encoder = Encoder(huffman=False)
+        block = encoder.encode_headers([
+            (b'content-length', b'1234'), (b':path', b'/search?q=1'), (b':path', b'/about'),
+        ])
+
+        self.assertEqual(block[:7], b'\x0f\x0d\x041234')
+        self.assertEqual(block[7:20], b'\x04\x0b/search?q=1')
+        self.assertEqual(block[20:21], b'\x44')
+        self.assertEqual(encoder.index_table[IndexTable.STATIC_LENGTH + 1], (b':path', b'/about'))
+
+    def test_cookie_crumbling(self):
+        encoder = Encoder()
+        block = encoder.encode_headers([(b'cookie', b'a=1; b=2; c=3')])
+
+        self.assertEqual(Decoder().decode(block),
+            [(b'cookie', b'a=1'), (b'cookie', b'b=2'), (b'cookie', b'c=3')])
+
+    def test_reuse_estimate(self):
+        encoder = Encoder()
+        for i in range(10):
+            encoder.encode_headers([(b'x-trace', str(i).encode('ascii')), (b'x-client', b'app')])
+
+        policy = encoder.policy
+        self.assertLess(policy.reuse_rate(b'x-trace'), 0.5)
+        self.assertGreater(policy.reuse_rate(b'x-client'), 0.5)
+
+        # Only the first trace value got indexed, x-client is in the table.
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH + 2)
+        self.assertIsNotNone(encoder.index_table.find(b'x-client', b'app'))
+
+    def test_large_fields_are_not_indexed(self):
+        encoder = Encoder(max_table_size=256)
+        encoder.encode_headers([(b'x-blob', b'x' * 200)])
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH)
+
+    def test_adaptive_policy_options(self):
+        self.assertIsInstance(Encoder().policy, AdaptiveIndexingPolicy)
+
+        policy = AdaptiveIndexingPolicy(sensitive=[b'x-token'], high_churn=[b'x-span'], max_entry_share=1.0)
+        encoder = Encoder(max_table_size=256, huffman=False, policy=policy)
+        block = encoder.encode_headers([
+            (b'x-token', b'secret'), (b'x-span', b'1'), (b'authorization', b'a'), (b'x-blob', b'x' * 200),
+        ])
+
+        # Never indexed, then without indexing, both with a literal name.
+        self.assertEqual(block[:16], b'\x10\x07x-token\x06secret')
+        self.assertEqual(block[16:26], b'\x00\x06x-span\x011')
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH + 1)
+        self.assertIsNotNone(encoder.index_table.find(b'x-blob', b'x' * 200))
+
+    def test_index_all_policy(self):
+        encoder = Encoder(policy=IndexingPolicy())
+        encoder.encode_headers([(b'authorization', b'secret'), (b'date', b'today')])
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH + 2)
+
+    def test_compression_ratio(self):
+        encoder = Encoder()
+        self.assertEqual(encoder.compression_ratio, 1.0)
+
+        headers = [(b'user-agent', b'Mozilla/5.0 (X11; Linux x86_64)'), (b'accept', b'*/*')]
+        for _ in range(10):
+            encoder.encode_headers(headers)
+
+        self.assertEqual(encoder.raw_bytes, 10 * (10 + 31 + 6 + 3))
+        self.assertLess(encoder.compression_ratio, 0.2)
+
+
+class TestCompressionContext(unittest.TestCase):
+    def test_shared_encoder(self):
+        # [RFC7541, Appendix C.4]: the second and third requests reuse the
+        # entries added by the previous ones.
+        context = CompressionContext()
+        blocks = [context.encode(headers) for _, headers in TestDecoder.requests]
+        self.assertEqual([b.hex() for b in blocks], list(TestDecoder.huffman_requests))
+
+        peer = CompressionContext()
+        self.assertEqual([peer.decode(b) for b in blocks], [h for _, h in TestDecoder.requests])
+
+    def test_repeated_headers(self):
+        headers = [
+            (b':method', b'GET'), (b':scheme', b'https'), (b':path', b'/'),
+            (b':authority', b'api.example.com'),
+            (b'user-agent', b'Mozilla/5.0 (X11; Linux x86_64; rv:109.0) Gecko/20100101'),
+            (b'accept-language', b'en-US,en;q=0.9,de;q=0.7'),
+        ]
+
+        context = CompressionContext()
+        first = context.encode(headers)
+        second = context.encode(headers)
+
+        self.assertEqual(len(second), len(headers))
+        self.assertLess(len(second) * 10, len(first))
+
+
+class TestHeaderTemplate(unittest.TestCase):
+    headers = [
+        (b':method', b'GET'), (b':scheme', b'https'), (b':path', None),
+        (b':authority', b'api.example.com'), (b'user-agent', b'pyhttp2'),
+        (b'authorization', None), (b'date', b'Mon, 21 Oct 2013 20:13:21 GMT'),
+    ]
+
+    def fill(self, path, token):
+        return [(n, v if v is not None else {b':path': path, b'authorization': token}[n])
+                for n, v in self.headers]
+
+    def test_encode(self):
+        encoder = Encoder()
+        template = encoder.compile_template(self.headers)
+        self.assertIsInstance(template, HeaderTemplate)
+        self.assertEqual(template.slots, [b':path', b'authorization'])
+
+        # Compiling doesn't touch the table, nothing has been sent yet.
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH)
+
+        decoder = Decoder()
+        first = template.encode(b'/a', b'token')
+        second = template.encode(b'/b', b'token')
+        self.assertEqual(decoder.decode(first), self.fill(b'/a', b'token'))
+        self.assertEqual(decoder.decode(second), self.fill(b'/b', b'token'))
+
+        # :authority and user-agent are indexed by the first block.
+        self.assertEqual(len(encoder.index_table), IndexTable.STATIC_LENGTH + 2)
+        self.assertLess(len(second), len(first))
+
+        with self.assertRaises(ValueError):
+            template.encode(b'/c')
+
+    def test_mixed_with_encode_headers(self):
+        encoder = Encoder(max_table_size=256)
+        decoder = Decoder(max_table_size=256)
+        template = encoder.compile_template(self.headers)
+
+        for i in range(20):
+            path = '/{}'.format(i).encode('ascii')
+            self.assertEqual(decoder.decode(template.encode(path, b't')), self.fill(path, b't'))
+
+            # Evicts the template entries from time to time.
+            other = [(b'x-other', b'v' * (i * 10))]
+            self.assertEqual(decoder.decode(encoder.encode_headers(other)), other)
+
+    def test_table_size_update(self):
+        encoder = Encoder()
+        template = encoder.compile_template([(b':method', b'GET')])
+        encoder.update_table_size(0)
+        self.assertEqual(template.encode(), b'\x20\x82')
+
+    def test_cookies(self):
+        # Crumbled like encode_headers() does it, an empty cookie is kept.
+        for value in (b'', b'a=1', b'a=1; b=2'):
+            headers = [(b'cookie', value), (b'x-a', b'1')]
+            block = Encoder().compile_template(headers).encode()
+            self.assertEqual(block, Encoder().encode_headers(headers))
+
+        self.assertEqual(Decoder().decode(block)[1:], [(b'cookie', b'b=2'), (b'x-a', b'1')])
+
+    def test_statistics(self):
+        encoder = Encoder()
+        template = encoder.compile_template(self.headers)
+        block = template.encode(b'/', b'token')
+
+        raw = sum(len(n) + len(v) for n, v in self.fill(b'/', b'token'))
+        self.assertEqual((encoder.raw_bytes, encoder.encoded_bytes), (raw, len(block)))
 
 
 class TestDecoder(unittest.TestCase):
-    pass
+    # [RFC7541, Appendix C.3]
+    requests = (
+        ('828684410f7777772e6578616d706c652e636f6d', [
+            (b':method', b'GET'), (b':scheme', b'http'), (b':path', b'/'),
+            (b':authority', b'www.example.com'),
+        ]),
+        ('828684be58086e6f2d6361636865', [
+            (b':method', b'GET'), (b':scheme', b'http'), (b':path', b'/'),
+            (b':authority', b'www.example.com'), (b'cache-control', b'no-cache'),
+        ]),
+        ('828785bf400a637573746f6d2d6b65790c637573746f6d2d76616c7565', [
+            (b':method', b'GET'), (b':scheme', b'https'), (b':path', b'/index.html'),
+            (b':authority', b'www.example.com'), (b'custom-key', b'custom-value'),
+        ]),
+    )
+
+    # [RFC7541, Appendix C.4], same requests with Huffman encoding.
+    huffman_requests = (
+        '828684418cf1e3c2e5f23a6ba0ab90f4ff',
+        '828684be5886a8eb10649cbf',
+        '828785bf408825a849e95ba97d7f8925a849e95bb8e8b4bf',
+    )
+
+    def test_decode(self):
+        decoder = Decoder()
+        for block, headers in self.requests:
+            self.assertEqual(decoder.decode(bytes.fromhex(block)), headers)
+
+        self.assertEqual(decoder.index_table.size, 164)
+        self.assertEqual(decoder.index_table[62], (b'custom-key', b'custom-value'))
+
+    def test_decode_huffman(self):
+        decoder = Decoder()
+        for block, (_, headers) in zip(self.huffman_requests, self.requests):
+            self.assertEqual(decoder.decode(bytes.fromhex(block)), headers)
+
+    def test_decode_literals(self):
+        decoder = Decoder()
+
+        # Without indexing and never indexed [RFC7541, Appendix C.2.2, C.2.3].
+        self.assertEqual(decoder.decode(bytes.fromhex('040c2f73616d706c652f70617468')),
+            [(b':path', b'/sample/path')])
+        self.assertEqual(decoder.decode(bytes.fromhex('100870617373776f726406736563726574')),
+            [(b'password', b'secret')])
+        self.assertEqual(len(decoder.index_table), IndexTable.STATIC_LENGTH)
+
+    def test_feed_fragments(self):
+        block = b''.join(bytes.fromhex(b) for b in self.huffman_requests[:1])
+        for split in range(len(block) + 1):
+            decoder = Decoder()
+            headers = decoder.feed(block[:split])
+            headers += decoder.feed(memoryview(block)[split:], end=True)
+            self.assertEqual(headers, self.requests[0][1])
+
+        decoder = Decoder()
+        headers = []
+        for i in range(len(block)):
+            headers += decoder.feed(block[i:i + 1], end=i == len(block) - 1)
+        self.assertEqual(headers, self.requests[0][1])
+
+    def test_feed_long_field(self):
+        headers = [(b'x-long', b'v' * 1000), (b'x-short', b'v')]
+        block = Encoder(huffman=False).encode_headers(headers)
+
+        decoder = Decoder()
+        self.assertEqual(decoder.feed(block[:10]), [])
+        for i in range(10, 1000, 10):
+            self.assertEqual(decoder.feed(block[i:i + 10]), [])
+
+        # The chunks are kept apart until the field is complete.
+        self.assertEqual(len(decoder._tail), 100)
+        self.assertEqual(decoder._tail_end, 1011)
+        self.assertEqual(decoder.feed(block[1000:], end=True), headers)
+        self.assertEqual(decoder._tail, [])
+
+    def test_table_size_update(self):
+        decoder = Decoder()
+        decoder.decode(bytes.fromhex(self.requests[0][0]))
+
+        self.assertEqual(decoder.decode(b'\x20\x3f\xe1\x07\x82'), [(b':method', b'GET')])
+        self.assertEqual(decoder.index_table.max_size, 1024)
+        self.assertEqual(len(decoder.index_table), IndexTable.STATIC_LENGTH)
+
+        with self.assertRaises(CompressionError):
+            decoder.decode(b'\x82\x20')
+
+        with self.assertRaises(CompressionError):
+            Decoder(max_table_size=100).decode(b'\x3f\xe1\x07')
+
+    def test_decode_errors(self):
+        with self.assertRaises(CompressionError):
+            Decoder().decode(b'\x80')
+        with self.assertRaises(CompressionError):
+            Decoder().decode(b'\xbe')
+        with self.assertRaises(CompressionError):
+            Decoder().decode(b'\x82\x41\x05abc')
+
+
+class TestDecoderLimits(unittest.TestCase):
+    def test_header_list_bomb(self):
+        encoder = Encoder(policy=IndexingPolicy())
+        decoder = Decoder(max_header_list_size=16384)
+        field = (b'x-bomb', b'x' * 4000)
+        decoder.decode(encoder.encode_headers([field]))
+
+        # Indexed references to the table entry: 1000 octets decoding to
+        # 4 MB.
+        block = encoder.encode_headers([field] * 1000)
+        self.assertEqual(len(block), 1000)
+
+        # Fields beyond the limit are no longer returned.
+        self.assertEqual(len(decoder.feed(block[:500])), 4)
+        with self.assertRaises(HeaderListTooLargeError):
+            decoder.feed(block[500:], end=True)
+
+        # The context is still in sync and the limit applies per block.
+        self.assertEqual(decoder.decode(encoder.encode_headers([field])), [field])
+
+    def test_list_size_counts_overhead(self):
+        headers = [(b'a', b'b')] * 3
+        block = Encoder().encode_headers(headers)
+
+        self.assertEqual(Decoder(max_header_list_size=102).decode(block), headers)
+        with self.assertRaises(HeaderListTooLargeError):
+            Decoder(max_header_list_size=101).decode(block)
+
+    def test_max_string_length(self):
+        encoder = Encoder(huffman=False)
+        headers = [(b'x-long', b'v' * 100), (b'x-short', b'v')]
+
+        decoder = Decoder(max_string_length=50)
+        with self.assertRaises(HeaderListTooLargeError):
+            decoder.decode(encoder.encode_headers(headers))
+
+        # The long field didn't fit into the table, the short one is there.
+        self.assertEqual(decoder.decode(encoder.encode_headers(headers[1:])), headers[1:])
+
+        huffman = Encoder(huffman=True)
+        with self.assertRaises(HeaderListTooLargeError):
+            Decoder(max_string_length=50).decode(huffman.encode_headers(headers))
+
+    def test_long_string_skipped_while_streaming(self):
+        encoder = Encoder(huffman=False)
+        decoder = Decoder(max_string_length=1000)
+        for headers in ([(b'x-long', b'v' * 100000), (b'x-short', b'v')],
+                        [(b'x-' + b'n' * 100000, b'v' * 100000), (b'x-short', b'v')]):
+            block = encoder.encode_headers(headers)
+
+            # Nothing of the long string is buffered.
+            fragments = [block[i:i + 1000] for i in range(0, len(block), 1000)]
+            for fragment in fragments[:-1]:
+                decoder.feed(fragment)
+                self.assertLess(len(decoder._tail), 1000)
+
+            with self.assertRaises(HeaderListTooLargeError):
+                decoder.feed(fragments[-1], end=True)
+
+            self.assertEqual(decoder.decode(encoder.encode_headers(headers[1:])), headers[1:])
+
+    def test_skipped_string_truncated(self):
+        block = Encoder(huffman=False).encode_headers([(b'x-long', b'v' * 100)])
+
+        with self.assertRaises(CompressionError):
+            Decoder(max_string_length=10).decode(block[:50])
+
+    def test_long_string_kept_for_table(self):
+        # A string which fits into the table is decoded anyway to keep the
+        # context in sync, the field isn't returned.
+        encoder = Encoder(policy=IndexingPolicy())
+        decoder = Decoder(max_string_length=10)
+
+        with self.assertRaises(HeaderListTooLargeError):
+            decoder.decode(encoder.encode_headers([(b'x-long', b'v' * 100)]))
+        self.assertEqual(decoder.index_table[62], (b'x-long', b'v' * 100))
+
+    def test_table_size_update_required(self):
+        encoder = Encoder()
+        decoder = Decoder()
+        decoder.decode(encoder.encode_headers([(b'x-a', b'1')]))
+
+        decoder.max_table_size = 1024
+        with self.assertRaises(CompressionError):
+            decoder.decode(encoder.encode_headers([(b'x-a', b'1')]))
+
+        encoder = Encoder()
+        decoder = Decoder()
+        decoder.max_table_size = 1024
+        encoder.update_table_size(1024)
+        self.assertEqual(decoder.decode(encoder.encode_headers([(b'x-a', b'1')])), [(b'x-a', b'1')])
+        self.assertEqual(decoder.index_table.max_size, 1024)
+
+        # Raising the limit needs no update.
+        decoder.max_table_size = 4096
+        self.assertEqual(decoder.decode(encoder.encode_headers([(b'x-a', b'1')])), [(b'x-a', b'1')])
+
+
+class NoIndexingPolicy(IndexingPolicy):
+    def decide(self, name, value, index_table):
+        return WITHOUT_INDEXING
+
+
+class TestHeaderList(unittest.TestCase):
+    headers = [
+        (b':method', b'GET'),
+        (b':path', b'/index.html'),
+        (b'user-agent', b'pyhttp2'),
+        (b'x-trace', b'abc'),
+        (b'X-Trace', b'def'),
+    ]
+
+    def test_lazy_values(self):
+        for huffman in (False, True):
+            block = Encoder(huffman=huffman, policy=NoIndexingPolicy()).encode_headers(self.headers)
+            headers = Decoder().decode_lazy(block)
+
+            # Names are decoded, values of literals are not.
+            self.assertEqual(headers._names, [name for name, _ in self.headers])
+            self.assertIsInstance(headers._values[2], int)
+
+            self.assertEqual(headers.get(b'user-agent'), b'pyhttp2')
+            self.assertEqual(headers._values[2], b'pyhttp2')
+            self.assertIsInstance(headers._values[3], int)
+            self.assertEqual(headers, self.headers)
+
+    def test_indexed_fields(self):
+        encoder = Encoder(policy=IndexingPolicy())
+        decoder = Decoder()
+        decoder.decode(encoder.encode_headers(self.headers))
+
+        headers = decoder.decode_lazy(encoder.encode_headers(self.headers))
+        self.assertEqual(headers, self.headers)
+        self.assertEqual(decoder.decode(encoder.encode_headers(self.headers)), self.headers)
+
+    def test_lookup(self):
+        headers = Decoder().decode_lazy(Encoder(policy=NoIndexingPolicy()).encode_headers(self.headers))
+
+        self.assertEqual(headers.get('X-TRACE'), b'abc')
+        self.assertEqual(headers.get_all('x-trace'), [b'abc', b'def'])
+        self.assertEqual(headers.get_str(b'User-Agent'), 'pyhttp2')
+        self.assertIsNone(headers.get(b'accept'))
+        self.assertEqual(headers.get_str(b'accept', ''), '')
+        self.assertIn(':path', headers)
+        self.assertEqual(headers[-1], (b'X-Trace', b'def'))
+        with self.assertRaises(IndexError):
+            headers[5]
+
+    def test_regular(self):
+        headers = HeaderList(self.headers)
+        regular = headers.regular()
+
+        self.assertEqual(len(regular), 3)
+        self.assertEqual(regular, self.headers[2:])
+        self.assertNotIn(b':method', regular)
+        self.assertEqual(regular[0], (b'user-agent', b'pyhttp2'))
+        self.assertEqual(regular.get_all(b'x-trace'), [b'abc', b'def'])
+
+    def test_limits(self):
+        block = Encoder(huffman=False, policy=NoIndexingPolicy()).encode_headers([(b'x-long', b'v' * 100)])
+
+        with self.assertRaises(HeaderListTooLargeError):
+            Decoder(max_string_length=50).decode_lazy(block)
+        with self.assertRaises(HeaderListTooLargeError):
+            Decoder(max_header_list_size=100).decode_lazy(block)
+        self.assertEqual(len(Decoder(max_header_list_size=200).decode_lazy(block)), 1)
+
+    def test_huffman_limit(self):
+        # 100 octets in 63, the decoded length is checked.
+        block = Encoder(huffman=True, policy=NoIndexingPolicy()).encode_headers([(b'x-a', b'a' * 100)])
+
+        with self.assertRaises(HeaderListTooLargeError):
+            Decoder(max_string_length=80).decode_lazy(block)
+        self.assertEqual(Decoder(max_string_length=100).decode_lazy(block), [(b'x-a', b'a' * 100)])
+
+    def test_invalid_huffman(self):
+        # The padding of the value isn't a prefix of EOS.
+        with self.assertRaises(CompressionError):
+            Decoder().decode_lazy(b'\x00\x01a\x81\x00')
+
+    def test_truncated(self):
+        block = Encoder().encode_headers(self.headers)
+
+        with self.assertRaises(CompressionError):
+            Decoder().decode_lazy(block[:-1])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,122 @@
+import asyncio
+import unittest
+
+from pyhttp2.frames import GoAwayFrame, SettingsFrame
+from pyhttp2.connection import ClientConnection
+from pyhttp2.pool import ConnectionPool, split_url
+from pyhttp2.errors import ConnectionClosedError
+
+from .helpers import Peer, settle
+
+
+class TestSplitUrl(unittest.TestCase):
+    def test_split_url(self):
+        self.assertEqual(split_url('https://example.com/a/b?c=d'),
+            (('https', 'example.com', 443), '/a/b?c=d'))
+        self.assertEqual(split_url('http://Example.com:8080'),
+            (('http', 'example.com', 8080), '/'))
+
+        with self.assertRaises(ValueError):
+            split_url('ftp://example.com/')
+
+
+class TestConnectionPool(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.peers = []
+        self.max_streams = 2
+        self.pool = ConnectionPool(max_connections=2, idle_timeout=0.01, connect=self.connect)
+
+    async def connect(self, host, port, ssl=None, local_settings=None):
+        connection = ClientConnection('{}:{}'.format(host, port))
+        peer = Peer(connection)
+        peer.send_settings()
+        connection.remote_settings[SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS] = self.max_streams
+        self.peers.append(peer)
+
+        await asyncio.sleep(0)
+        return connection
+
+    def respond_all(self, peer):
+        peer.received()
+        for stream_id, _ in peer.header_blocks:
+            peer.send_headers(stream_id, [(b':status', b'200')], end_stream=True)
+        peer.header_blocks.clear()
+
+    async def test_reuse(self):
+        for _ in range(3):
+            task = asyncio.ensure_future(self.pool.request('GET', 'https://example.com/'))
+            await settle()
+            self.respond_all(self.peers[0])
+            await task
+
+        self.assertEqual(len(self.peers), 1)
+
+    async def test_open_when_saturated(self):
+        tasks = [asyncio.ensure_future(self.pool.request('GET', 'https://example.com/'))
+                 for _ in range(5)]
+        await settle()
+
+        # Two connections (the maximum) with two streams each, the fifth
+        # request waits for a stream.
+        self.assertEqual(len(self.peers), 2)
+        self.assertEqual([p.protocol.active_streams for p in self.peers], [2, 2])
+
+        for peer in self.peers:
+            self.respond_all(peer)
+        await settle()
+        for peer in self.peers:
+            self.respond_all(peer)
+
+        responses = await asyncio.gather(*tasks)
+        self.assertEqual([r.status for r in responses], [200] * 5)
+
+    async def test_origins(self):
+        tasks = [
+            asyncio.ensure_future(self.pool.request('GET', 'https://example.com/')),
+            asyncio.ensure_future(self.pool.request('GET', 'https://example.org/')),
+        ]
+        await settle()
+
+        self.assertEqual([p.protocol.authority for p in self.peers],
+            [b'example.com:443', b'example.org:443'])
+
+        for peer in self.peers:
+            self.respond_all(peer)
+        await asyncio.gather(*tasks)
+
+    async def test_goaway(self):
+        task = asyncio.ensure_future(self.pool.request('GET', 'https://example.com/'))
+        await settle()
+
+        # The stream is refused and retried on a new connection.
+        self.peers[0].send(GoAwayFrame(0))
+        await settle()
+        self.assertEqual(len(self.peers), 2)
+        self.assertTrue(self.peers[0].protocol.closed)
+
+        self.respond_all(self.peers[1])
+        self.assertEqual((await task).status, 200)
+
+    async def test_idle_timeout(self):
+        task = asyncio.ensure_future(self.pool.request('GET', 'https://example.com/'))
+        await settle()
+        self.respond_all(self.peers[0])
+        await task
+
+        connection = self.peers[0].protocol
+        self.assertFalse(connection.closed)
+        await asyncio.sleep(0.02)
+        self.assertTrue(connection.closed)
+        self.assertEqual(self.pool.connections(('https', 'example.com', 443)), [])
+
+    async def test_close(self):
+        task = asyncio.ensure_future(self.pool.request('GET', 'https://example.com/'))
+        await settle()
+
+        await self.pool.close()
+        with self.assertRaises(ConnectionClosedError):
+            await task
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,133 @@
+import collections
+import unittest
+
+from pyhttp2.priority import PriorityTree
+from pyhttp2.errors import ProtocolError
+
+
+class TestPriorityTree(unittest.TestCase):
+    def setUp(self):
+        self.tree = PriorityTree()
+
+    def schedule(self, frames, size=16384):
+        """
+        Returns how many frames of size every stream sent out of frames.
+        """
+        counts = collections.Counter()
+        for _ in range(frames):
+            stream_id = self.tree.next()
+            counts[stream_id] += 1
+            self.tree.sent(stream_id, size)
+
+        return counts
+
+    def test_weighted_fair_queuing(self):
+        self.tree.insert(1, weight=200)
+        self.tree.insert(3, weight=50)
+        self.tree.activate(1)
+        self.tree.activate(3)
+
+        self.assertEqual(self.schedule(100), {1: 80, 3: 20})
+
+    def test_parent_goes_first(self):
+        self.tree.insert(1)
+        self.tree.insert(3, depends_on=1)
+        self.tree.insert(5, depends_on=1)
+        for stream_id in (1, 3, 5):
+            self.tree.activate(stream_id)
+
+        self.assertEqual(self.schedule(10), {1: 10})
+
+        # Blocked or done, the parent's share goes to its dependents.
+        self.tree.deactivate(1)
+        self.assertEqual(self.schedule(10), {3: 5, 5: 5})
+
+        self.tree.deactivate(3)
+        self.tree.deactivate(5)
+        self.assertIsNone(self.tree.next())
+
+    def test_subtrees_share_by_weight(self):
+        self.tree.insert(1, weight=32)
+        self.tree.insert(3, weight=32)
+        self.tree.insert(5, depends_on=3, weight=1)
+        self.tree.insert(7, depends_on=3, weight=256)
+        self.tree.activate(1)
+        self.tree.activate(5)
+        self.tree.activate(7)
+
+        counts = self.schedule(200)
+        self.assertEqual(counts[1], 100)
+        self.assertEqual(counts[5] + counts[7], 100)
+        self.assertLessEqual(counts[5], 1)
+
+    def test_new_stream_does_not_catch_up(self):
+        self.tree.insert(1)
+        self.tree.activate(1)
+        self.schedule(50)
+
+        self.tree.insert(3)
+        self.tree.activate(3)
+        self.assertEqual(self.schedule(10), {1: 5, 3: 5})
+
+    def test_exclusive(self):
+        self.tree.insert(1)
+        self.tree.insert(3)
+        self.tree.insert(5, exclusive=True)
+
+        self.assertEqual(self.tree.children_of(0), [5])
+        self.assertEqual(self.tree.children_of(5), [1, 3])
+
+    def test_reprioritize_on_dependent(self):
+        # [RFC7540, section 5.3.3]: A becomes dependent on its dependent D.
+        self.tree.insert(1)
+        self.tree.insert(3, depends_on=1)
+        self.tree.insert(5, depends_on=1)
+        self.tree.insert(7, depends_on=5)
+        self.tree.insert(9, depends_on=5)
+        self.tree.insert(11, depends_on=7)
+
+        self.tree.reprioritize(1, depends_on=7, exclusive=True)
+
+        self.assertEqual(self.tree.children_of(0), [7])
+        self.assertEqual(self.tree.children_of(7), [1])
+        self.assertEqual(self.tree.children_of(1), [3, 5, 11])
+        self.assertEqual(self.tree.children_of(5), [9])
+
+    def test_reprioritize_active_stream(self):
+        self.tree.insert(1)
+        self.tree.insert(3)
+        self.tree.activate(1)
+        self.tree.activate(3)
+
+        self.tree.reprioritize(3, depends_on=1)
+        self.assertEqual(self.schedule(5), {1: 5})
+
+        self.tree.reprioritize(1, depends_on=3)
+        self.assertEqual(self.schedule(5), {3: 5})
+
+    def test_remove(self):
+        self.tree.insert(1, weight=16)
+        self.tree.insert(3, depends_on=1, weight=8)
+        self.tree.insert(5, depends_on=1, weight=24)
+        self.tree.activate(3)
+
+        self.tree.remove(1)
+        self.assertNotIn(1, self.tree)
+        self.assertEqual(self.tree.children_of(0), [3, 5])
+        self.assertEqual((self.tree.weight_of(3), self.tree.weight_of(5)), (4, 12))
+        self.assertEqual(self.tree.next(), 3)
+
+    def test_unknown_dependency(self):
+        self.tree.insert(3, depends_on=1, weight=100)
+        self.assertEqual(self.tree.parent_of(3), 0)
+        self.assertEqual(self.tree.weight_of(3), 16)
+
+    def test_invalid_priority(self):
+        with self.assertRaises(ProtocolError):
+            self.tree.insert(1, depends_on=1)
+        with self.assertRaises(ValueError):
+            self.tree.insert(1, weight=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
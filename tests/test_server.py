@@ -0,0 +1,492 @@
+import asyncio
+import base64
+import os
+import signal
+import socket
+import time
+import unittest
+
+from pyhttp2.frames import DataFrame, SettingsFrame, RstStreamFrame
+from pyhttp2.connection import CONNECTION_PREFACE, connect
+from pyhttp2.hpack import HeaderList
+from pyhttp2.request import Request
+from pyhttp2.server import ServerConnection, PushDigest, serve, run_prefork
+from pyhttp2.errors import NO_ERROR, INTERNAL_ERROR, REFUSED_STREAM, CANCEL
+
+from .helpers import Peer, settle
+
+
+async def hello(request):
+    await request.respond(200, [('content-type', 'text/plain')], b'hello')
+
+
+async def echo(request):
+    body = await request.read()
+    await request.respond(200, body=body)
+
+
+class TestServerConnection(unittest.IsolatedAsyncioTestCase):
+    def connect(self, handler, local_settings=None):
+        self.connection = ServerConnection(handler, local_settings=local_settings)
+        self.peer = Peer(self.connection, expect_preface=False)
+
+    def start(self, handler, local_settings=None):
+        self.connect(handler, local_settings)
+        self.peer.feed(CONNECTION_PREFACE)
+        self.peer.send_settings()
+        self.peer.received()
+
+    def request(self, stream_id, method=b'GET', path=b'/', end_stream=True):
+        self.peer.send_headers(stream_id, [
+            (b':method', method), (b':scheme', b'http'), (b':authority', b'example.com'),
+            (b':path', path),
+        ], end_stream=end_stream)
+
+    async def test_preface(self):
+        self.connect(hello)
+        self.assertEqual(self.peer.received(), [])
+
+        self.peer.feed(CONNECTION_PREFACE[:10])
+        self.peer.feed(CONNECTION_PREFACE[10:])
+        self.peer.send_settings()
+
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x4, 0x4])
+        self.assertIn((SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS, 100), frames[0].settings)
+        self.assertTrue(frames[1].ack)
+
+    async def test_request(self):
+        self.start(hello)
+
+        self.request(1, path=b'/index.html')
+        await settle()
+
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x1, 0x0])
+        self.assertTrue(frames[1].end_stream)
+        self.assertEqual(bytes(frames[1].data), b'hello')
+        self.assertEqual(self.peer.header_blocks, [
+            (1, [(b':status', b'200'), (b'content-type', b'text/plain')])
+        ])
+        self.assertEqual(self.connection.streams, {})
+
+    async def test_request_body(self):
+        self.start(echo)
+
+        self.request(1, method=b'POST', end_stream=False)
+        self.peer.send(DataFrame(b'abc', stream_id=1), DataFrame(b'def', end_stream=True, stream_id=1))
+        await settle()
+
+        frames = [f for f in self.peer.received() if f.frame_type == 0x0]
+        self.assertEqual(b''.join(bytes(f.data) for f in frames), b'abcdef')
+
+    async def test_request_fields(self):
+        requests = []
+
+        async def handler(request):
+            requests.append(request)
+            await request.respond(204)
+
+        self.start(handler)
+        self.peer.send_headers(1, [
+            (b':method', b'GET'), (b':scheme', b'https'), (b':authority', b'example.com'),
+            (b':path', b'/a?b=c'), (b'accept', b'*/*'),
+        ], end_stream=True)
+        await settle()
+
+        request = requests[0]
+        self.assertEqual((request.method, request.scheme, request.authority, request.path),
+                         (b'GET', b'https', b'example.com', b'/a?b=c'))
+        self.assertEqual(request.headers, [(b'accept', b'*/*')])
+        self.assertEqual(request.get(b'accept'), b'*/*')
+        self.assertEqual(request.get_str('Accept'), '*/*')
+        self.assertIsInstance(request.headers, HeaderList)
+
+        self.peer.received()
+        self.assertEqual(self.peer.header_blocks, [(1, [(b':status', b'204')])])
+
+        self.assertEqual(repr(request), '<Request GET /a?b=c stream_id=1>')
+
+        # Pseudo-header fields are missing from a malformed request.
+        self.assertEqual(repr(Request(request.stream, [(b':scheme', b'https')])), '<Request - - stream_id=1>')
+
+    async def test_upgrade(self):
+        requests = []
+
+        async def handler(request):
+            requests.append((request, await request.read()))
+            await request.respond(200, body=b'upgraded')
+
+        self.connect(handler)
+
+        settings = SettingsFrame(initial_window_size=1000).to_bytes()[9:]
+        self.peer.feed(
+            b'POST /upload HTTP/1.1\r\n'
+            b'Host: example.com\r\n'
+            b'Connection: Upgrade, HTTP2-Settings\r\n'
+            b'Upgrade: h2c\r\n'
+            b'HTTP2-Settings: ' + base64.urlsafe_b64encode(settings).rstrip(b'=') + b'\r\n'
+            b'Content-Length: 5\r\n'
+            b'X-Custom: yes\r\n'
+            b'\r\n'
+            b'hello'
+        )
+        await settle()
+
+        self.assertEqual(self.peer.received_http1(),
+                         b'HTTP/1.1 101 Switching Protocols\r\nConnection: Upgrade\r\nUpgrade: h2c')
+        self.assertEqual(self.connection.remote_settings[SettingsFrame.SETTINGS_INITIAL_WINDOW_SIZE],
+                         1000)
+
+        request, body = requests[0]
+        self.assertEqual((request.method, request.scheme, request.authority, request.path),
+                         (b'POST', b'http', b'example.com', b'/upload'))
+        self.assertEqual(request.headers, [(b'content-length', b'5'), (b'x-custom', b'yes')])
+        self.assertEqual(body, b'hello')
+
+        # The server preface and the response are sent before the client
+        # preface arrives.
+        self.peer.feed(CONNECTION_PREFACE)
+        self.peer.send_settings()
+        types = self.peer.received_types()
+        self.assertEqual(types[0], 0x4)
+        self.assertIn(0x1, types)
+        self.assertEqual(self.peer.header_blocks, [(1, [(b':status', b'200')])])
+
+        # Stream ids go on after the upgraded one.
+        self.request(3)
+        await settle()
+        self.assertEqual(self.peer.received_types(), [0x1, 0x0])
+
+    async def test_upgrade_required(self):
+        self.connect(hello)
+        self.peer.feed(b'GET / HTTP/1.1\r\nHost: example.com\r\n\r\n')
+
+        head = self.peer.received_http1()
+        self.assertTrue(head.startswith(b'HTTP/1.1 426 Upgrade Required\r\n'))
+        self.assertIn(b'Upgrade: h2c', head)
+        self.assertTrue(self.peer.transport.closing)
+
+    async def test_invalid_preface_after_upgrade(self):
+        self.connect(hello)
+        self.peer.feed(
+            b'GET / HTTP/1.1\r\nHost: example.com\r\nConnection: Upgrade, HTTP2-Settings\r\n'
+            b'Upgrade: h2c\r\nHTTP2-Settings: \r\n\r\n'
+        )
+        self.peer.received_http1()
+        self.peer.feed(b'GET / HTTP/1.1\r\n\r\n')
+
+        self.assertEqual(self.peer.received_types()[-1], 0x7)
+        self.assertTrue(self.peer.transport.closing)
+
+    async def test_refused_stream(self):
+        blocked = asyncio.get_running_loop().create_future()
+
+        async def handler(request):
+            await blocked
+            await request.respond(200)
+
+        self.start(handler, {SettingsFrame.SETTINGS_MAX_CONCURRENT_STREAMS: 1})
+
+        self.request(1)
+        self.request(3)
+        await settle()
+
+        frames = self.peer.received()
+        self.assertEqual([(f.frame_type, f.stream_id) for f in frames], [(0x3, 3)])
+        self.assertEqual(frames[0].error_code, REFUSED_STREAM)
+
+        blocked.set_result(None)
+        await settle()
+        self.request(5)
+        await settle()
+        self.assertEqual([f.stream_id for f in self.peer.received()], [1, 5])
+
+    async def test_handler_error(self):
+        errors = []
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: errors.append(context))
+
+        async def handler(request):
+            raise KeyError('boom')
+
+        self.start(handler)
+        self.request(1)
+        await settle()
+
+        self.peer.received()
+        self.assertEqual(self.peer.header_blocks, [(1, [(b':status', b'500')])])
+        self.assertIsInstance(errors[0]['exception'], KeyError)
+
+    async def test_handler_error_after_response(self):
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: None)
+
+        async def handler(request):
+            await request.respond(200, body=iter([b'partial']))
+            raise KeyError('boom')
+
+        self.start(handler)
+        self.request(1)
+        await settle()
+
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x1, 0x0, 0x0])
+
+        # The response went out completely, nothing to reset.
+        self.assertEqual(self.connection.streams, {})
+
+        async def failing(request):
+            request.responded = True
+            raise KeyError('boom')
+
+        self.connection.handler = failing
+        self.request(3)
+        await settle()
+
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x3])
+        self.assertEqual(frames[0].error_code, INTERNAL_ERROR)
+
+    async def test_no_response(self):
+        async def handler(request):
+            pass
+
+        self.start(handler)
+        self.request(1)
+        await settle()
+
+        self.peer.received()
+        self.assertEqual(self.peer.header_blocks, [(1, [(b':status', b'500')])])
+
+    async def test_unread_body_reset(self):
+        self.start(hello)
+
+        self.request(1, method=b'POST', end_stream=False)
+        await settle()
+
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x1, 0x0, 0x3])
+        self.assertEqual(frames[2].error_code, NO_ERROR)
+        self.assertEqual(self.connection.streams, {})
+
+    async def test_header_list_too_large(self):
+        self.start(hello, {SettingsFrame.SETTINGS_MAX_HEADER_LIST_SIZE: 1000})
+
+        self.peer.send_headers(1, [
+            (b':method', b'GET'), (b':scheme', b'http'), (b':authority', b'example.com'),
+            (b':path', b'/'), (b'cookie', b'x' * 2000),
+        ], end_stream=True)
+        await settle()
+
+        self.peer.received()
+        self.assertEqual(self.peer.header_blocks, [(1, [(b':status', b'431')])])
+
+        # The HPACK context is still usable.
+        self.request(3)
+        await settle()
+        self.peer.received()
+        self.assertEqual(self.peer.header_blocks[-1][1][0], (b':status', b'200'))
+
+    async def test_shutdown(self):
+        blocked = asyncio.get_running_loop().create_future()
+
+        async def handler(request):
+            await blocked
+            await request.respond(200)
+
+        self.start(handler)
+        self.request(1)
+        await settle()
+
+        self.connection.shutdown()
+        frames = self.peer.received()
+        self.assertEqual([f.frame_type for f in frames], [0x7])
+        self.assertEqual(frames[0].last_stream_id, 1)
+
+        # Streams after GOAWAY are ignored.
+        self.request(3)
+        await settle()
+        self.assertEqual(self.peer.received(), [])
+
+        blocked.set_result(None)
+        await settle()
+        self.assertEqual(self.peer.received_types(), [0x1])
+        self.assertTrue(self.peer.transport.closing)
+
+    async def test_connection_lost_cancels_handlers(self):
+        cancelled = []
+
+        async def handler(request):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(request.stream.stream_id)
+                raise
+
+        self.start(handler)
+        self.request(1)
+        await settle()
+
+        self.peer.transport.close()
+        await settle()
+        self.assertEqual(cancelled, [1])
+
+
+class TestServerPush(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pushed = []
+
+        async def handler(request):
+            if request.path == b'/':
+                self.pushed.append(request.push('/style.css', [('accept', 'text/css')]))
+                await request.respond(200, body=b'<html>')
+            else:
+                await request.respond(200, [('content-type', 'text/css')], body=b'body {}')
+
+        self.connection = ServerConnection(handler)
+        self.peer = Peer(self.connection, expect_preface=False)
+        self.peer.feed(CONNECTION_PREFACE)
+
+    def request(self, stream_id, path=b'/'):
+        self.peer.send_headers(stream_id, [
+            (b':method', b'GET'), (b':scheme', b'http'), (b':authority', b'example.com'),
+            (b':path', path),
+        ], end_stream=True)
+
+    async def test_push(self):
+        self.peer.send_settings()
+        self.peer.received()
+
+        self.request(1)
+        await settle()
+
+        frames = self.peer.received()
+        self.assertEqual([(f.frame_type, f.stream_id) for f in frames][:2], [(0x5, 1), (0x1, 1)])
+        self.assertEqual(sorted((f.frame_type, f.stream_id) for f in frames[2:]),
+                         [(0x0, 1), (0x0, 2), (0x1, 2)])
+        self.assertEqual(self.peer.promises, [(1, 2, [
+            (b':method', b'GET'), (b':scheme', b'http'), (b':authority', b'example.com'),
+            (b':path', b'/style.css'), (b'accept', b'text/css'),
+        ])])
+        self.assertIn((2, [(b':status', b'200'), (b'content-type', b'text/css')]),
+                      self.peer.header_blocks)
+
+        pushed = self.pushed[0]
+        self.assertTrue(pushed.pushed)
+        self.assertEqual(pushed.stream.stream_id, 2)
+        self.assertEqual(self.connection.streams, {})
+
+        # The resource is in the push digest of the connection now.
+        self.request(3)
+        await settle()
+        self.assertEqual(self.pushed[1], None)
+        self.assertNotIn(0x5, [f.frame_type for f in self.peer.received()])
+
+    async def test_push_disabled(self):
+        self.peer.send_settings(enable_push=0)
+        self.request(1)
+        await settle()
+
+        self.assertEqual(self.pushed, [None])
+        self.assertNotIn(0x5, self.peer.received_types())
+
+    async def test_push_limited_by_concurrent_streams(self):
+        self.peer.send_settings(max_concurrent_streams=0)
+        self.request(1)
+        await settle()
+
+        self.assertEqual(self.pushed, [None])
+
+    async def test_push_cancelled(self):
+        self.peer.send_settings(initial_window_size=0)
+        self.peer.received()
+
+        self.request(1)
+        await settle()
+        self.peer.send(RstStreamFrame(CANCEL, stream_id=2))
+        await settle()
+
+        self.assertNotIn(2, self.connection.streams)
+        self.assertEqual([f.stream_id for f in self.peer.received() if f.frame_type == 0x0], [])
+
+    async def test_unsafe_method(self):
+        with self.assertRaises(ValueError):
+            self.connection.push(None, '/', method='POST')
+
+
+class TestPushDigest(unittest.TestCase):
+    def test_add(self):
+        digest = PushDigest(bits=16)
+        self.assertTrue(digest.add(b'http://example.com/a.css'))
+        self.assertFalse(digest.add(b'http://example.com/a.css'))
+        self.assertIn(b'http://example.com/a.css', digest)
+        self.assertNotIn(b'http://example.com/b.css', digest)
+        self.assertEqual(len(digest), 1)
+        self.assertLess(digest.key(b'http://example.com/b.css'), 2**16)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            PushDigest(bits=0)
+
+
+class TestServe(unittest.IsolatedAsyncioTestCase):
+    async def test_serve(self):
+        server = await serve(echo, '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+
+        client = await connect('127.0.0.1', port)
+        responses = await asyncio.gather(*[
+            client.request('POST', '/', body=str(i).encode('ascii') * 1000) for i in range(5)
+        ])
+        bodies = [await response.read() for response in responses]
+        self.assertEqual(bodies, [str(i).encode('ascii') * 1000 for i in range(5)])
+
+        await server.shutdown(timeout=1)
+        await client.wait_closed()
+        self.assertEqual(server.connections, set())
+
+
+@unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT') and hasattr(os, 'fork'), 'needs SO_REUSEPORT')
+class TestPrefork(unittest.TestCase):
+    def test_workers(self):
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_prefork(hello, '127.0.0.1', port, workers=2, shutdown_timeout=1)
+            finally:
+                os._exit(0)
+
+        async def fetch():
+            deadline = time.monotonic() + 10
+            while True:
+                try:
+                    client = await connect('127.0.0.1', port)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+                    await asyncio.sleep(0.05)
+
+            response = await client.request('GET', '/')
+            body = await response.read()
+            client.close()
+            return body
+
+        try:
+            self.assertEqual(asyncio.run(fetch()), b'hello')
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            _, status = os.waitpid(pid, 0)
+
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+    def test_invalid_workers(self):
+        with self.assertRaises(ValueError):
+            run_prefork(hello, workers=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
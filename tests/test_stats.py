@@ -0,0 +1,98 @@
+import unittest
+
+from pyhttp2.hpack import Encoder, Decoder, IndexingPolicy
+from pyhttp2.stats import Histogram, HpackStats
+
+
+class TestHistogram(unittest.TestCase):
+    def test_observe(self):
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+        self.assertEqual(snapshot['count'], 4)
+        self.assertEqual(snapshot['sum'], 56.5)
+        self.assertEqual(snapshot['buckets'], [(1, 2), (10, 1), (None, 1)])
+
+
+class TestHpackStats(unittest.TestCase):
+    headers = [
+        (b':method', b'GET'),
+        (b':path', b'/'),
+        (b'user-agent', b'pyhttp2'),
+        (b'x-trace', b'abc'),
+    ]
+
+    def setUp(self):
+        self.encoder = Encoder(policy=IndexingPolicy(), stats=HpackStats())
+        self.decoder = Decoder(stats=HpackStats())
+
+    def test_encoder_counters(self):
+        first = self.encoder.encode_headers(self.headers)
+        second = self.encoder.encode_headers(self.headers)
+
+        snapshot = self.encoder.snapshot()
+        self.assertEqual(snapshot['blocks'], 2)
+        self.assertEqual(snapshot['fields'], 8)
+        self.assertEqual(snapshot['static_hits'], 4)
+        self.assertEqual(snapshot['dynamic_hits'], 2)
+        self.assertEqual(snapshot['literals'], 2)
+        self.assertEqual(snapshot['encoded_bytes'], len(first) + len(second))
+        self.assertEqual(snapshot['plain_bytes'], 2 * sum(len(n) + len(v) for n, v in self.headers))
+        self.assertEqual(snapshot['huffman_bytes'] + snapshot['raw_bytes'], len(first) - 2 - 2)
+        self.assertEqual(snapshot['block_sizes']['count'], 2)
+        self.assertEqual(snapshot['table']['entries'], 2)
+        self.assertEqual(snapshot['table']['insertions'], 2)
+
+    def test_decoder_counters(self):
+        blocks = [self.encoder.encode_headers(self.headers) for _ in range(2)]
+
+        self.decoder.feed(blocks[0][:5])
+        self.decoder.feed(blocks[0][5:], end=True)
+        self.decoder.decode(blocks[1])
+
+        encoder = self.encoder.snapshot()
+        decoder = self.decoder.snapshot()
+        for key in ('blocks', 'fields', 'static_hits', 'dynamic_hits', 'literals', 'huffman_bytes',
+                    'raw_bytes', 'plain_bytes', 'encoded_bytes', 'table'):
+            self.assertEqual(decoder[key], encoder[key], key)
+
+    def test_evictions(self):
+        encoder = Encoder(max_table_size=64, policy=IndexingPolicy(), stats=HpackStats())
+        encoder.encode_headers([(b'x-a', b'1'), (b'x-b', b'2')])
+
+        table = encoder.snapshot()['table']
+        self.assertEqual(table['evictions'], 1)
+        self.assertEqual(table['entries'], 1)
+        self.assertEqual(table['size'], 36)
+        self.assertEqual(table['max_size'], 64)
+
+    def test_template_counters(self):
+        template = self.encoder.compile_template([
+            (b':method', b'GET'), (b'user-agent', b'pyhttp2'), (b':path', None)
+        ])
+        self.assertEqual(self.encoder.stats.fields, 0)
+
+        block = template.encode(b'/a')
+        template.encode(b'/b')
+
+        stats = self.encoder.stats
+        self.assertEqual(stats.blocks, 2)
+        self.assertEqual(stats.fields, 6)
+        self.assertEqual(stats.static_hits, 2)
+        self.assertEqual(stats.dynamic_hits, 1)
+        self.assertEqual(stats.literals, 3)
+
+        self.decoder.decode(block)
+        self.assertEqual(self.decoder.stats.literals, 2)
+
+    def test_disabled(self):
+        encoder = Encoder()
+        encoder.encode_headers(self.headers)
+
+        self.assertEqual(set(encoder.snapshot()), {'table'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+import asyncio
+import unittest
+
+from pyhttp2.frames import DataFrame, PingFrame, WindowUpdateFrame
+from pyhttp2.writer import FrameWriter
+
+from .helpers import FakeTransport, settle
+
+
+class TestFrameWriter(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.transport = FakeTransport(None)
+        self.writer = FrameWriter(self.transport, asyncio.get_running_loop(), threshold=1000)
+
+    async def test_coalescing(self):
+        for i in range(10):
+            self.writer.write(WindowUpdateFrame(i + 1, stream_id=1))
+
+        self.assertEqual(self.transport.writes, 0)
+        self.assertEqual(self.writer.buffered, 130)
+
+        await settle(1)
+        self.assertEqual(self.transport.writes, 1)
+        self.assertEqual(len(self.transport.data), 130)
+        self.assertEqual(self.writer.buffered, 0)
+
+    async def test_threshold(self):
+        self.writer.write(DataFrame(b'x' * 600, stream_id=1))
+        self.assertEqual(self.transport.writes, 0)
+
+        self.writer.write(DataFrame(b'y' * 600, stream_id=1))
+        self.assertEqual(self.transport.writes, 1)
+
+        await settle()
+        self.assertEqual(self.transport.writes, 1)
+
+    async def test_control_frames_go_first(self):
+        data = DataFrame(b'data', stream_id=1)
+        ping = PingFrame(b'12345678', ack=True)
+        self.writer.write(data)
+        self.writer.write(ping, control=True)
+        self.writer.flush()
+
+        self.assertEqual(bytes(self.transport.data), ping.to_bytes() + data.to_bytes())
+
+    async def test_close(self):
+        self.writer.write(DataFrame(b'data', stream_id=1))
+        self.writer.close()
+
+        await settle()
+        self.assertEqual(self.transport.writes, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()